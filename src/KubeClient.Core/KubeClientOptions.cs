@@ -129,6 +129,19 @@ namespace KubeClient
         /// </summary>
         public bool LogPayloads { get; set; }
 
+        /// <summary>
+        ///     Request HTTP/2 (falling back to HTTP/1.1 if the server does not support it)?
+        /// </summary>
+        /// <remarks>
+        ///     Multiple concurrent requests can then share a single connection (when supported, requests are sent over a pooled <c>SocketsHttpHandler</c>).
+        /// </remarks>
+        public bool EnableHttp2 { get; set; }
+
+        /// <summary>
+        ///     An optional maximum number of concurrent connections to the API server (if not specified, the number of connections is unlimited).
+        /// </summary>
+        public int? MaxConnectionsPerServer { get; set; }
+
         /// <summary>
         ///     Additional assemblies (if any) that contain model types used by the client.
         /// </summary>
@@ -199,6 +212,8 @@ namespace KubeClient
             toOptions.LoggerFactory = LoggerFactory;
             toOptions.LogHeaders = LogHeaders;
             toOptions.LogPayloads = LogPayloads;
+            toOptions.EnableHttp2 = EnableHttp2;
+            toOptions.MaxConnectionsPerServer = MaxConnectionsPerServer;
             toOptions.EnvironmentVariables = EnvironmentVariables;
             toOptions.ModelTypeAssemblies.AddRange(ModelTypeAssemblies);
         }
@@ -220,6 +235,9 @@ namespace KubeClient
             if (String.IsNullOrWhiteSpace(KubeNamespace))
                 throw new KubeClientException("Invalid KubeClientOptions: must specify a valid default namespace.");
 
+            if (MaxConnectionsPerServer <= 0)
+                throw new KubeClientException("Invalid KubeClientOptions: maximum number of connections per server must be greater than 0.");
+
             return this;
         }
 
@@ -102,17 +102,25 @@ namespace KubeClient.ResourceClients
         /// <param name="labelSelector">
         ///     An optional Kubernetes label selector expression used to filter the CustomResourceDefinitions.
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        public IObservable<IResourceEventV1<CustomResourceDefinitionV1Beta1>> WatchAll(string? labelSelector = null)
+        public IObservable<IResourceEventV1<CustomResourceDefinitionV1Beta1>> WatchAll(string? labelSelector = null, string? resourceVersion = null, bool includeBookmarks = false)
         {
             return ObserveEvents<CustomResourceDefinitionV1Beta1>(
                 Requests.WatchCollection.WithTemplateParameters(new
                 {
                     LabelSelector = labelSelector
                 }),
-                operationDescription: $"watch all v1beta1/CustomResourceDefintions with label selector '{labelSelector ?? "<none>"}'"
+                operationDescription: $"watch all v1beta1/CustomResourceDefintions with label selector '{labelSelector ?? "<none>"}'",
+                resourceVersion: resourceVersion,
+                includeBookmarks: includeBookmarks
             );
         }
 
@@ -238,10 +246,16 @@ namespace KubeClient.ResourceClients
         /// <param name="labelSelector">
         ///     An optional Kubernetes label selector expression used to filter the CustomResourceDefinitions.
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        IObservable<IResourceEventV1<CustomResourceDefinitionV1Beta1>> WatchAll(string? labelSelector = null);
+        IObservable<IResourceEventV1<CustomResourceDefinitionV1Beta1>> WatchAll(string? labelSelector = null, string? resourceVersion = null, bool includeBookmarks = false);
 
         /// <summary>
         ///     Request creation of a <see cref="CustomResourceDefinitionV1Beta1"/>.
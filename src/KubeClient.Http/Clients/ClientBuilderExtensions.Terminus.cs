@@ -0,0 +1,313 @@
+using System;
+using System.Net;
+using System.Net.Http;
+using System.Net.Security;
+using System.Security.Cryptography.X509Certificates;
+
+namespace KubeClient.Http.Clients
+{
+    using MessageHandlers;
+
+    /// <summary>
+    ///		Extensions for configuring the message pipeline terminus (<see cref="HttpClientHandler"/> or, where available, a pooled SocketsHttpHandler) of <see cref="ClientBuilder"/> and <see cref="ClientBuilder{TContext}"/>.
+    /// </summary>
+    public static partial class ClientBuilderExtensions
+	{
+		/// <summary>
+		///		The default lifetime of a pooled connection (after which, it is replaced so that changes to the server's DNS records are picked up).
+		/// </summary>
+		public static readonly TimeSpan DefaultPooledConnectionLifetime = TimeSpan.FromMinutes(5);
+
+		/// <summary>
+		///		Create a copy of the <see cref="ClientBuilder"/>, but with the specified HTTP version for its requests.
+		/// </summary>
+		/// <param name="clientBuilder">
+		///		The HTTP client builder.
+		/// </param>
+		/// <param name="requestVersion">
+		///		The HTTP version to request (e.g. <see cref="HttpVersion.Version20"/>).
+		/// </param>
+		/// <param name="exactVersion">
+		///		Require exactly the requested version, rather than falling back to a lower version (e.g. for HTTP/2 without TLS, when the server is known to support it)?
+		/// </param>
+		/// <returns>
+		/// 	The configured <see cref="ClientBuilder"/>.
+		/// </returns>
+		/// <remarks>
+		///		Unless <paramref name="exactVersion"/> is <c>true</c>, requests may fall back to a lower version (e.g. HTTP/1.1 if the server does not negotiate HTTP/2 during the TLS handshake).
+		/// </remarks>
+		public static ClientBuilder WithRequestVersion(this ClientBuilder clientBuilder, Version requestVersion, bool exactVersion = false)
+		{
+			if (clientBuilder == null)
+				throw new ArgumentNullException(nameof(clientBuilder));
+
+			if (requestVersion == null)
+				throw new ArgumentNullException(nameof(requestVersion));
+
+			return clientBuilder.AddHandler(
+				() => new RequestVersionMessageHandler(requestVersion, exactVersion)
+			);
+		}
+
+		/// <summary>
+		///		Create a copy of the <see cref="ClientBuilder{TContext}"/>, but with the specified HTTP version for its requests.
+		/// </summary>
+		/// <typeparam name="TContext">
+		///		The type that contains contextual information used when creating the client.
+		/// </typeparam>
+		/// <param name="clientBuilder">
+		///		The HTTP client builder.
+		/// </param>
+		/// <param name="requestVersion">
+		///		The HTTP version to request (e.g. <see cref="HttpVersion.Version20"/>).
+		/// </param>
+		/// <param name="exactVersion">
+		///		Require exactly the requested version, rather than falling back to a lower version (e.g. for HTTP/2 without TLS, when the server is known to support it)?
+		/// </param>
+		/// <returns>
+		/// 	The configured <see cref="ClientBuilder{TContext}"/>.
+		/// </returns>
+		/// <remarks>
+		///		Unless <paramref name="exactVersion"/> is <c>true</c>, requests may fall back to a lower version (e.g. HTTP/1.1 if the server does not negotiate HTTP/2 during the TLS handshake).
+		/// </remarks>
+		public static ClientBuilder<TContext> WithRequestVersion<TContext>(this ClientBuilder<TContext> clientBuilder, Version requestVersion, bool exactVersion = false)
+		{
+			if (clientBuilder == null)
+				throw new ArgumentNullException(nameof(clientBuilder));
+
+			if (requestVersion == null)
+				throw new ArgumentNullException(nameof(requestVersion));
+
+			return clientBuilder.AddHandler(
+				context => new RequestVersionMessageHandler(requestVersion, exactVersion)
+			);
+		}
+
+#if !NETSTANDARD2_1
+		/// <summary>
+		///		Create a copy of the <see cref="ClientBuilder"/>, but using a <see cref="SocketsHttpHandler"/> (with tuned connection pooling) as its message pipeline terminus.
+		/// </summary>
+		/// <param name="clientBuilder">
+		///		The HTTP client builder.
+		/// </param>
+		/// <param name="maxConnectionsPerServer">
+		///		An optional maximum number of connections to each server (if not specified, the number of connections is unlimited).
+		/// </param>
+		/// <returns>
+		/// 	The configured <see cref="ClientBuilder"/>.
+		/// </returns>
+		/// <remarks>
+		///		Replaces any existing configuration for the message pipeline terminus, so call this before configuring certificates.
+		/// </remarks>
+		public static ClientBuilder WithSocketsHttpHandler(this ClientBuilder clientBuilder, int? maxConnectionsPerServer = null)
+		{
+			if (clientBuilder == null)
+				throw new ArgumentNullException(nameof(clientBuilder));
+
+			return clientBuilder.WithMessagePipelineTerminus(
+				() => CreateSocketsHttpHandler(maxConnectionsPerServer)
+			);
+		}
+
+		/// <summary>
+		///		Create a copy of the <see cref="ClientBuilder{TContext}"/>, but using a <see cref="SocketsHttpHandler"/> (with tuned connection pooling) as its message pipeline terminus.
+		/// </summary>
+		/// <typeparam name="TContext">
+		///		The type that contains contextual information used when creating the client.
+		/// </typeparam>
+		/// <param name="clientBuilder">
+		///		The HTTP client builder.
+		/// </param>
+		/// <param name="maxConnectionsPerServer">
+		///		An optional maximum number of connections to each server (if not specified, the number of connections is unlimited).
+		/// </param>
+		/// <returns>
+		/// 	The configured <see cref="ClientBuilder{TContext}"/>.
+		/// </returns>
+		/// <remarks>
+		///		Replaces any existing configuration for the message pipeline terminus, so call this before configuring certificates.
+		/// </remarks>
+		public static ClientBuilder<TContext> WithSocketsHttpHandler<TContext>(this ClientBuilder<TContext> clientBuilder, int? maxConnectionsPerServer = null)
+		{
+			if (clientBuilder == null)
+				throw new ArgumentNullException(nameof(clientBuilder));
+
+			return clientBuilder.WithMessagePipelineTerminus(
+				context => CreateSocketsHttpHandler(maxConnectionsPerServer)
+			);
+		}
+
+		/// <summary>
+		///		Create a new <see cref="SocketsHttpHandler"/> for use as a message pipeline terminus.
+		/// </summary>
+		/// <param name="maxConnectionsPerServer">
+		///		An optional maximum number of connections to each server.
+		/// </param>
+		/// <returns>
+		///		The new <see cref="SocketsHttpHandler"/>.
+		/// </returns>
+		static SocketsHttpHandler CreateSocketsHttpHandler(int? maxConnectionsPerServer)
+		{
+			if (maxConnectionsPerServer <= 0)
+				throw new ArgumentOutOfRangeException(nameof(maxConnectionsPerServer), maxConnectionsPerServer, "Maximum number of connections per server must be greater than 0.");
+
+			var socketsHandler = new SocketsHttpHandler
+			{
+				PooledConnectionLifetime = DefaultPooledConnectionLifetime,
+				AutomaticDecompression = DecompressionMethods.GZip | DecompressionMethods.Deflate,
+
+				// If a single HTTP/2 connection reaches the server's limit on concurrent streams, open another one rather than queuing requests.
+				EnableMultipleHttp2Connections = true
+			};
+			if (maxConnectionsPerServer.HasValue)
+				socketsHandler.MaxConnectionsPerServer = maxConnectionsPerServer.Value;
+
+			return socketsHandler;
+		}
+#endif // !NETSTANDARD2_1
+
+		/// <summary>
+		///		Add a client certificate to a message pipeline terminus.
+		/// </summary>
+		/// <param name="pipelineTerminus">
+		///		The message pipeline terminus.
+		/// </param>
+		/// <param name="clientCertificate">
+		///		The X.509 certificate to use for client authentication.
+		/// </param>
+		static void AddClientCertificate(HttpMessageHandler pipelineTerminus, X509Certificate2 clientCertificate)
+		{
+			switch (pipelineTerminus)
+			{
+				case HttpClientHandler clientHandler:
+				{
+					clientHandler.ClientCertificates.Add(clientCertificate);
+					clientHandler.ClientCertificateOptions = ClientCertificateOption.Manual;
+
+					break;
+				}
+#if !NETSTANDARD2_1
+				case SocketsHttpHandler socketsHandler:
+				{
+					if (socketsHandler.SslOptions.ClientCertificates == null)
+						socketsHandler.SslOptions.ClientCertificates = new X509CertificateCollection();
+
+					socketsHandler.SslOptions.ClientCertificates.Add(clientCertificate);
+
+					break;
+				}
+#endif // !NETSTANDARD2_1
+				default:
+				{
+					throw UnsupportedPipelineTerminus(pipelineTerminus);
+				}
+			}
+		}
+
+		/// <summary>
+		///		Set the callback used by a message pipeline terminus to validate the server's certificate.
+		/// </summary>
+		/// <param name="pipelineTerminus">
+		///		The message pipeline terminus.
+		/// </param>
+		/// <param name="validateServerCertificate">
+		///		A delegate that receives the server's certificate, its chain, and any policy errors, and returns <c>true</c> if the certificate is acceptable.
+		/// </param>
+		static void SetServerCertificateValidation(HttpMessageHandler pipelineTerminus, Func<X509Certificate2, X509Chain, SslPolicyErrors, bool> validateServerCertificate)
+		{
+			switch (pipelineTerminus)
+			{
+				case HttpClientHandler clientHandler:
+				{
+					clientHandler.ServerCertificateCustomValidationCallback = (request, certificate, chain, sslPolicyErrors) =>
+					{
+						return validateServerCertificate(certificate, chain, sslPolicyErrors);
+					};
+
+					break;
+				}
+#if !NETSTANDARD2_1
+				case SocketsHttpHandler socketsHandler:
+				{
+					socketsHandler.SslOptions.RemoteCertificateValidationCallback = (sender, certificate, chain, sslPolicyErrors) =>
+					{
+						if (certificate == null)
+							return false;
+
+						return validateServerCertificate(
+							certificate as X509Certificate2 ?? new X509Certificate2(certificate),
+							chain,
+							sslPolicyErrors
+						);
+					};
+
+					break;
+				}
+#endif // !NETSTANDARD2_1
+				default:
+				{
+					throw UnsupportedPipelineTerminus(pipelineTerminus);
+				}
+			}
+		}
+
+		/// <summary>
+		///		Determine whether a server certificate is the expected certificate (or, if the expected certificate is a CA certificate, was issued by it).
+		/// </summary>
+		/// <param name="expectServerCertificate">
+		///		The X.509 certificate to expect the server to use.
+		/// </param>
+		/// <param name="certificate">
+		///		The server's certificate.
+		/// </param>
+		/// <param name="sslPolicyErrors">
+		///		Any policy errors encountered while validating the server's certificate.
+		/// </param>
+		/// <param name="logError">
+		/// 	An optional delegate called if an unexpected error is encountered while validating the server certificate.
+		/// </param>
+		/// <returns>
+		///		<c>true</c>, if the certificate is acceptable; otherwise, <c>false</c>.
+		/// </returns>
+		static bool IsExpectedServerCertificate(X509Certificate2 expectServerCertificate, X509Certificate2 certificate, SslPolicyErrors sslPolicyErrors, Action<Exception> logError)
+		{
+			if (sslPolicyErrors != SslPolicyErrors.RemoteCertificateChainErrors)
+				return false;
+
+			try
+			{
+				using (X509Chain certificateChain = new X509Chain())
+				{
+					certificateChain.ChainPolicy.ExtraStore.Add(expectServerCertificate);
+					certificateChain.ChainPolicy.VerificationFlags = X509VerificationFlags.AllowUnknownCertificateAuthority;
+					certificateChain.ChainPolicy.RevocationMode = X509RevocationMode.NoCheck;
+
+					return certificateChain.Build(certificate);
+				}
+			}
+			catch (Exception chainException)
+			{
+				if (logError != null)
+					logError(chainException);
+
+				return false;
+			}
+		}
+
+		/// <summary>
+		///		Create an exception indicating that the message pipeline terminus does not support certificate configuration.
+		/// </summary>
+		/// <param name="pipelineTerminus">
+		///		The message pipeline terminus.
+		/// </param>
+		/// <returns>
+		///		The configured <see cref="InvalidOperationException"/>.
+		/// </returns>
+		static InvalidOperationException UnsupportedPipelineTerminus(HttpMessageHandler pipelineTerminus)
+		{
+			return new InvalidOperationException(
+				$"Cannot configure certificates for pipeline terminus (expected a handler of type '{typeof(HttpClientHandler).FullName}' or 'System.Net.Http.SocketsHttpHandler', but the previous factory function returned a handler of type '{pipelineTerminus.GetType().FullName}')."
+			);
+		}
+	}
+}
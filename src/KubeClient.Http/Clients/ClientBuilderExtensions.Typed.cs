@@ -1,7 +1,6 @@
 ﻿using System;
 using System.Net;
 using System.Net.Http;
-using System.Net.Security;
 using System.Security.Cryptography.X509Certificates;
 
 namespace KubeClient.Http.Clients
@@ -250,10 +249,9 @@ namespace KubeClient.Http.Clients
             if (!clientCertificate.HasPrivateKey)
                 throw new InvalidOperationException($"Cannot use certificate '{clientCertificate.Subject}' as a client certificate (no private key is not available for it).");
 
-            return clientBuilder.ConfigureHttpClientHandler((clientHandler, context) =>
+            return clientBuilder.ConfigureMessagePipelineTerminus<HttpMessageHandler, TContext>((pipelineTerminus, context) =>
 			{
-				clientHandler.ClientCertificates.Add(clientCertificate);
-				clientHandler.ClientCertificateOptions = ClientCertificateOption.Manual;
+				AddClientCertificate(pipelineTerminus, clientCertificate);
 			});
 		}
 
@@ -285,32 +283,12 @@ namespace KubeClient.Http.Clients
             if (expectServerCertificate == null)
                 throw new ArgumentNullException(nameof(expectServerCertificate));
 
-            return clientBuilder.ConfigureHttpClientHandler((clientHandler, context) =>
+            return clientBuilder.ConfigureMessagePipelineTerminus<HttpMessageHandler, TContext>((pipelineTerminus, context) =>
 			{
-				clientHandler.ServerCertificateCustomValidationCallback = (request, certificate, chain, sslPolicyErrors) =>
+				SetServerCertificateValidation(pipelineTerminus, (certificate, chain, sslPolicyErrors) =>
 				{
-					if (sslPolicyErrors != SslPolicyErrors.RemoteCertificateChainErrors)
-						return false;
-
-					try
-					{
-						using (X509Chain certificateChain = new X509Chain())
-						{
-							certificateChain.ChainPolicy.ExtraStore.Add(expectServerCertificate);
-							certificateChain.ChainPolicy.VerificationFlags = X509VerificationFlags.AllowUnknownCertificateAuthority;
-							certificateChain.ChainPolicy.RevocationMode = X509RevocationMode.NoCheck;
-							
-							return certificateChain.Build(certificate);
-						}
-					}
-					catch (Exception chainException)
-					{
-						if (logError != null)
-							logError(chainException);
-						
-						return false;
-					}
-				};
+					return IsExpectedServerCertificate(expectServerCertificate, certificate, sslPolicyErrors, logError);
+				});
 			});
 		}
 
@@ -331,12 +309,12 @@ namespace KubeClient.Http.Clients
 			if (clientBuilder == null)
                 throw new ArgumentNullException(nameof(clientBuilder));
             
-            return clientBuilder.ConfigureHttpClientHandler((clientHandler, context) =>
+            return clientBuilder.ConfigureMessagePipelineTerminus<HttpMessageHandler, TContext>((pipelineTerminus, context) =>
 			{
-				clientHandler.ServerCertificateCustomValidationCallback = (request, certificate, chain, sslPolicyErrors) =>
+				SetServerCertificateValidation(pipelineTerminus, (certificate, chain, sslPolicyErrors) =>
 				{
 					return true; // Verification disabled.
-				};
+				});
 			});
 		}
 	}
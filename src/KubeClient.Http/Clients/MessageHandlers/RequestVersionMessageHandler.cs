@@ -0,0 +1,79 @@
+using System;
+using System.Net;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace KubeClient.Http.Clients.MessageHandlers
+{
+    /// <summary>
+    ///		Client-side HTTP message handler that sets the HTTP version of outgoing requests.
+    /// </summary>
+    /// <remarks>
+    ///		<see cref="HttpClient.DefaultRequestVersion"/> only applies to requests created by <see cref="HttpClient"/> itself, so requests built from an <see cref="HttpRequest"/> need their version set here.
+    /// </remarks>
+    public class RequestVersionMessageHandler
+        : DelegatingHandler
+    {
+        /// <summary>
+        ///		Create a new <see cref="RequestVersionMessageHandler"/>.
+        /// </summary>
+        /// <param name="requestVersion">
+        ///		The HTTP version to request (e.g. <see cref="HttpVersion.Version20"/>).
+        /// </param>
+        /// <param name="exactVersion">
+        ///		Require exactly the requested version, rather than falling back to a lower version (e.g. for HTTP/2 without TLS, when the server is known to support it)?
+        /// </param>
+        public RequestVersionMessageHandler(Version requestVersion, bool exactVersion = false)
+        {
+            if (requestVersion == null)
+                throw new ArgumentNullException(nameof(requestVersion));
+
+            RequestVersion = requestVersion;
+            ExactVersion = exactVersion;
+        }
+
+        /// <summary>
+        ///		The HTTP version to request.
+        /// </summary>
+        public Version RequestVersion { get; }
+
+        /// <summary>
+        ///		Require exactly the requested version, rather than falling back to a lower version?
+        /// </summary>
+        /// <remarks>
+        ///		Only supported on .NET 5.0 and later (on other platforms, the runtime's default version policy is used).
+        /// </remarks>
+        public bool ExactVersion { get; }
+
+        /// <summary>
+        ///		Asynchronously process an outgoing HTTP request message and its incoming response message.
+        /// </summary>
+        /// <param name="request">
+        ///		The <see cref="HttpRequestMessage"/> representing the outgoing request.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///		A <see cref="CancellationToken"/> that can be used to cancel the asynchronous operation.
+        /// </param>
+        /// <returns>
+        ///		The incoming HTTP response message.
+        /// </returns>
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            if (request == null)
+                throw new ArgumentNullException(nameof(request));
+
+            // Don't override a version that was explicitly requested.
+            if (request.Version == HttpVersion.Version11)
+            {
+                request.Version = RequestVersion;
+#if !NETSTANDARD2_1
+                // Unless an exact version is required, fall back to a lower version if the server (or the connection's scheme) does not support the requested one.
+                request.VersionPolicy = ExactVersion ? HttpVersionPolicy.RequestVersionExact : HttpVersionPolicy.RequestVersionOrLower;
+#endif // !NETSTANDARD2_1
+            }
+
+            return base.SendAsync(request, cancellationToken);
+        }
+    }
+}
@@ -133,7 +133,9 @@ namespace KubeClient.Http
 					properties[nameof(request.RequestActions)] = request.RequestActions.Add((requestMessage, context) =>
 					{
 #pragma warning disable CS0618 // Type or member is obsolete (HttpRequestMessage.Properties is obsolete in net9.0, replaced by HttpRequestMessage.Options)
-                        requestMessage.Properties[MessageProperties.ContentFormatters] = new FormatterCollection(formatters.Values);
+                        // Use the formatters from the request being sent (formatters may have been added or removed since this action was registered).
+                        HttpRequest<TContext> outgoingRequest = (HttpRequest<TContext>)requestMessage.Properties[MessageProperties.Request];
+                        requestMessage.Properties[MessageProperties.ContentFormatters] = new FormatterCollection(outgoingRequest.GetFormatters().Values);
 #pragma warning restore CS0618 // Type or member is obsolete (HttpRequestMessage.Properties is obsolete in net9.0, replaced by HttpRequestMessage.Options)
                     });
 				}
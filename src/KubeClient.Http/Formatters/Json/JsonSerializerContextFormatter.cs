@@ -0,0 +1,205 @@
+#if NET8_0_OR_GREATER
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+using System.Threading.Tasks;
+
+namespace KubeClient.Http.Formatters.Json
+{
+    /// <summary>
+    ///		Content formatter for JSON using source-generated System.Text.Json metadata (from a <see cref="JsonSerializerContext"/>).
+    /// </summary>
+    /// <remarks>
+    ///		Data types that are not covered by the <see cref="JsonSerializerContext"/> are handled by the <see cref="FallbackFormatter"/> (if any).
+    ///
+    ///		Data is only written using the <see cref="JsonSerializerContext"/> if there is no <see cref="FallbackFormatter"/> that can write it (the fallback formatter may have serialisation semantics, such as omitting empty collections, that the source-generated metadata does not).
+    /// </remarks>
+    public class JsonSerializerContextFormatter
+        : IInputFormatter, IOutputFormatter
+    {
+        /// <summary>
+        ///		Create a new <see cref="JsonSerializerContextFormatter"/>.
+        /// </summary>
+        /// <param name="serializerContext">
+        ///		The <see cref="JsonSerializerContext"/> that provides serialisation metadata.
+        /// </param>
+        public JsonSerializerContextFormatter(JsonSerializerContext serializerContext)
+        {
+            if (serializerContext == null)
+                throw new ArgumentNullException(nameof(serializerContext));
+
+            SerializerContext = serializerContext;
+        }
+
+        /// <summary>
+        ///		The <see cref="JsonSerializerContext"/> that provides serialisation metadata.
+        /// </summary>
+        public JsonSerializerContext SerializerContext { get; }
+
+        /// <summary>
+        ///		An optional formatter used for data that cannot be handled using the <see cref="SerializerContext"/>.
+        /// </summary>
+        public IFormatter FallbackFormatter { get; set; }
+
+        /// <summary>
+        ///		Content types supported by the formatter.
+        /// </summary>
+        public ISet<string> SupportedMediaTypes { get; } = new HashSet<string> { WellKnownMediaTypes.Json };
+
+        /// <summary>
+        ///		Determine whether the formatter can deserialise the specified data.
+        /// </summary>
+        /// <param name="context">
+        ///		Contextual information about the data being deserialised.
+        /// </param>
+        /// <returns>
+        ///		<c>true</c>, if the formatter can deserialise the data; otherwise, <c>false</c>.
+        /// </returns>
+        public bool CanRead(InputFormatterContext context)
+        {
+            if (context == null)
+                throw new ArgumentNullException(nameof(context));
+
+            if (GetReadTypeInfo(context) != null)
+                return true;
+
+            return FallbackFormatter is IInputFormatter fallbackInputFormatter && fallbackInputFormatter.CanRead(context);
+        }
+
+        /// <summary>
+        ///		Determine whether the formatter can serialise the specified data.
+        /// </summary>
+        /// <param name="context">
+        ///		Contextual information about the data being serialised.
+        /// </param>
+        /// <returns>
+        ///		<c>true</c>, if the formatter can serialise the data; otherwise, <c>false</c>.
+        /// </returns>
+        public bool CanWrite(OutputFormatterContext context)
+        {
+            if (context == null)
+                throw new ArgumentNullException(nameof(context));
+
+            if (FallbackFormatter is IOutputFormatter fallbackOutputFormatter && fallbackOutputFormatter.CanWrite(context))
+                return true;
+
+            return GetWriteTypeInfo(context) != null;
+        }
+
+        /// <summary>
+        ///		Asynchronously deserialise data from an input stream.
+        /// </summary>
+        /// <param name="context">
+        ///		Contextual information about the data being deserialised.
+        /// </param>
+        /// <param name="stream">
+        ///		The input stream from which to read serialised data.
+        /// </param>
+        /// <returns>
+        ///		The deserialised object.
+        /// </returns>
+        public async Task<object> ReadAsync(InputFormatterContext context, Stream stream)
+        {
+            if (context == null)
+                throw new ArgumentNullException(nameof(context));
+
+            if (stream == null)
+                throw new ArgumentNullException(nameof(stream));
+
+            JsonTypeInfo typeInfo = GetReadTypeInfo(context);
+            if (typeInfo != null)
+                return await JsonSerializer.DeserializeAsync(stream, typeInfo, context.CancellationToken).ConfigureAwait(false);
+
+            if (FallbackFormatter is IInputFormatter fallbackInputFormatter)
+                return await fallbackInputFormatter.ReadAsync(context, stream).ConfigureAwait(false);
+
+            throw new NotSupportedException($"The {nameof(JsonSerializerContextFormatter)} cannot read content of type '{context.MediaType}' as '{context.DataType?.FullName}'.");
+        }
+
+        /// <summary>
+        ///		Asynchronously serialise data to an output stream.
+        /// </summary>
+        /// <param name="context">
+        ///		Contextual information about the data being deserialised.
+        /// </param>
+        /// <param name="stream">
+        ///		The output stream to which the serialised data will be written.
+        /// </param>
+        /// <returns>
+        ///		A <see cref="Task"/> representing the asynchronous operation.
+        /// </returns>
+        public async Task WriteAsync(OutputFormatterContext context, Stream stream)
+        {
+            if (context == null)
+                throw new ArgumentNullException(nameof(context));
+
+            if (stream == null)
+                throw new ArgumentNullException(nameof(stream));
+
+            if (FallbackFormatter is IOutputFormatter fallbackOutputFormatter && fallbackOutputFormatter.CanWrite(context))
+            {
+                await fallbackOutputFormatter.WriteAsync(context, stream).ConfigureAwait(false);
+
+                return;
+            }
+
+            JsonTypeInfo typeInfo = GetWriteTypeInfo(context);
+            if (typeInfo == null)
+                throw new NotSupportedException($"The {nameof(JsonSerializerContextFormatter)} cannot write content of type '{context.MediaType}' from '{context.DataType?.FullName}'.");
+
+            await JsonSerializer.SerializeAsync(stream, context.Data, typeInfo, context.CancellationToken).ConfigureAwait(false);
+        }
+
+        /// <summary>
+        ///		Get source-generated metadata for the type of data being deserialised.
+        /// </summary>
+        /// <param name="context">
+        ///		Contextual information about the data being deserialised.
+        /// </param>
+        /// <returns>
+        ///		The <see cref="JsonTypeInfo"/>, or <c>null</c> if the data cannot be deserialised using the <see cref="SerializerContext"/>.
+        /// </returns>
+        JsonTypeInfo GetReadTypeInfo(InputFormatterContext context)
+        {
+            if (!SupportedMediaTypes.Contains(context.MediaType) || !IsUtf8(context.Encoding) || context.DataType == null)
+                return null;
+
+            return SerializerContext.GetTypeInfo(context.DataType);
+        }
+
+        /// <summary>
+        ///		Get source-generated metadata for the type of data being serialised.
+        /// </summary>
+        /// <param name="context">
+        ///		Contextual information about the data being serialised.
+        /// </param>
+        /// <returns>
+        ///		The <see cref="JsonTypeInfo"/>, or <c>null</c> if the data cannot be serialised using the <see cref="SerializerContext"/>.
+        /// </returns>
+        JsonTypeInfo GetWriteTypeInfo(OutputFormatterContext context)
+        {
+            if (!SupportedMediaTypes.Contains(context.MediaType) || !IsUtf8(context.Encoding) || context.DataType == null)
+                return null;
+
+            return SerializerContext.GetTypeInfo(context.DataType);
+        }
+
+        /// <summary>
+        ///		Determine whether the specified content encoding is UTF-8 (the only encoding supported by System.Text.Json).
+        /// </summary>
+        /// <param name="encoding">
+        ///		The content encoding (<c>null</c> means the default encoding, i.e. UTF-8).
+        /// </param>
+        /// <returns>
+        ///		<c>true</c>, if the encoding is UTF-8; otherwise, <c>false</c>.
+        /// </returns>
+        static bool IsUtf8(Encoding encoding) => encoding == null || encoding.CodePage == Encoding.UTF8.CodePage;
+    }
+}
+
+#endif // NET8_0_OR_GREATER
@@ -0,0 +1,109 @@
+#if NET8_0_OR_GREATER
+
+using System;
+using System.Collections.Immutable;
+using System.Text.Json.Serialization;
+
+namespace KubeClient.Http
+{
+	using Formatters;
+	using Formatters.Json;
+
+	/// <summary>
+	///		<see cref="JsonSerializerContext"/>-related extension methods for <see cref="HttpRequest"/> / <see cref="HttpRequest{TContext}"/>.
+	/// </summary>
+	public static class JsonSerializerContextFormatterRequestExtensions
+	{
+		/// <summary>
+		///		Create a copy of the <see cref="HttpRequest"/>, configuring it to use source-generated System.Text.Json metadata for data types covered by the specified <see cref="JsonSerializerContext"/>.
+		/// </summary>
+		/// <param name="request">
+		///		The <see cref="HttpRequest"/>.
+		/// </param>
+		/// <param name="serializerContext">
+		///		The <see cref="JsonSerializerContext"/> that provides serialisation metadata.
+		/// </param>
+		/// <returns>
+		///		The new <see cref="HttpRequest"/>.
+		/// </returns>
+		/// <remarks>
+		///		The request's existing <see cref="NewtonsoftJsonFormatter"/> (if any) is retained as the fallback for data types that are not covered by the <see cref="JsonSerializerContext"/>.
+		/// </remarks>
+		public static HttpRequest UseJsonSerializerContext(this HttpRequest request, JsonSerializerContext serializerContext)
+		{
+			if (request == null)
+				throw new ArgumentNullException(nameof(request));
+
+			if (serializerContext == null)
+				throw new ArgumentNullException(nameof(serializerContext));
+
+			JsonSerializerContextFormatter formatter = CreateFormatter(serializerContext, request.GetFormatters());
+
+			return request
+				.WithoutFormatter(typeof(NewtonsoftJsonFormatter))
+				.WithFormatter(formatter);
+		}
+
+		/// <summary>
+		///		Create a copy of the <see cref="HttpRequest{TContext}"/>, configuring it to use source-generated System.Text.Json metadata for data types covered by the specified <see cref="JsonSerializerContext"/>.
+		/// </summary>
+		/// <typeparam name="TContext">
+		///		The type of object used as a context for resolving deferred parameters.
+		/// </typeparam>
+		/// <param name="request">
+		///		The <see cref="HttpRequest{TContext}"/>.
+		/// </param>
+		/// <param name="serializerContext">
+		///		The <see cref="JsonSerializerContext"/> that provides serialisation metadata.
+		/// </param>
+		/// <returns>
+		///		The new <see cref="HttpRequest{TContext}"/>.
+		/// </returns>
+		/// <remarks>
+		///		The request's existing <see cref="NewtonsoftJsonFormatter"/> (if any) is retained as the fallback for data types that are not covered by the <see cref="JsonSerializerContext"/>.
+		/// </remarks>
+		public static HttpRequest<TContext> UseJsonSerializerContext<TContext>(this HttpRequest<TContext> request, JsonSerializerContext serializerContext)
+		{
+			if (request == null)
+				throw new ArgumentNullException(nameof(request));
+
+			if (serializerContext == null)
+				throw new ArgumentNullException(nameof(serializerContext));
+
+			JsonSerializerContextFormatter formatter = CreateFormatter(serializerContext, request.GetFormatters());
+
+			return request
+				.WithoutFormatter(typeof(NewtonsoftJsonFormatter))
+				.WithFormatter(formatter);
+		}
+
+		/// <summary>
+		///		Create a <see cref="JsonSerializerContextFormatter"/> that falls back to the request's existing <see cref="NewtonsoftJsonFormatter"/> (if any).
+		/// </summary>
+		/// <param name="serializerContext">
+		///		The <see cref="JsonSerializerContext"/> that provides serialisation metadata.
+		/// </param>
+		/// <param name="formatters">
+		///		The request's existing formatters.
+		/// </param>
+		/// <returns>
+		///		The new <see cref="JsonSerializerContextFormatter"/>.
+		/// </returns>
+		static JsonSerializerContextFormatter CreateFormatter(JsonSerializerContext serializerContext, ImmutableDictionary<Type, IFormatter> formatters)
+		{
+			var formatter = new JsonSerializerContextFormatter(serializerContext);
+
+			if (formatters.TryGetValue(typeof(NewtonsoftJsonFormatter), out IFormatter fallbackFormatter))
+			{
+				formatter.FallbackFormatter = fallbackFormatter;
+
+				// Handle the same media types as the formatter being replaced (e.g. patch media types used by KubeClient).
+				formatter.SupportedMediaTypes.UnionWith(fallbackFormatter.SupportedMediaTypes);
+			}
+
+			return formatter;
+		}
+	}
+}
+
+#endif // NET8_0_OR_GREATER
@@ -22,6 +22,31 @@ namespace KubeClient.Http
         ///		The request URI.
         /// </param>
         static void SetUri(this IDictionary<string, object> requestProperties, Uri requestUri)
+        {
+            if (requestProperties == null)
+                throw new ArgumentNullException(nameof(requestProperties));
+
+            if (requestUri == null)
+                throw new ArgumentNullException(nameof(requestUri));
+
+            requestProperties.SetUri(requestUri,
+                isUriTemplate: UriTemplate.IsTemplate(requestUri)
+            );
+        }
+
+        /// <summary>
+        ///		Configure the request URI (and template status) in the request properties.
+        /// </summary>
+        /// <param name="requestProperties">
+        ///		The request properties to modify.
+        /// </param>
+        /// <param name="requestUri">
+        ///		The request URI.
+        /// </param>
+        /// <param name="isUriTemplate">
+        ///		Is the request URI a template?
+        /// </param>
+        static void SetUri(this IDictionary<string, object> requestProperties, Uri requestUri, bool isUriTemplate)
         {
             if (requestProperties == null)
                 throw new ArgumentNullException(nameof(requestProperties));
@@ -30,7 +55,7 @@ namespace KubeClient.Http
                 throw new ArgumentNullException(nameof(requestUri));
 
             requestProperties[nameof(IHttpRequest.Uri)] = requestUri;
-            requestProperties[nameof(IHttpRequest.IsUriTemplate)] = UriTemplate.IsTemplate(requestUri);
+            requestProperties[nameof(IHttpRequest.IsUriTemplate)] = isUriTemplate;
         }
 
         /// <summary>
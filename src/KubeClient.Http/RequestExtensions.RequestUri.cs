@@ -110,6 +110,37 @@ namespace KubeClient.Http
             });
         }
 
+        /// <summary>
+        ///		Create a copy of the request with the specified literal request URI.
+        /// </summary>
+        /// <param name="request">
+        ///		The request.
+        /// </param>
+        /// <param name="requestUri">
+        ///		The new request URI (already fully-populated and escaped).
+        /// </param>
+        /// <returns>
+        ///		The new <see cref="HttpRequest"/>.
+        /// </returns>
+        /// <remarks>
+        ///		Unlike <see cref="WithUri(HttpRequest, Uri)"/>, the URI is never treated as a template (it is not examined for template parameters, and is used as-is when the request message is built).
+        /// </remarks>
+        public static HttpRequest WithLiteralUri(this HttpRequest request, Uri requestUri)
+        {
+            if (request == null)
+                throw new ArgumentNullException(nameof(request));
+
+            if (requestUri == null)
+                throw new ArgumentNullException(nameof(requestUri));
+
+            return request.Clone(properties =>
+            {
+                properties.SetUri(requestUri,
+                    isUriTemplate: false
+                );
+            });
+        }
+
         /// <summary>
         ///		Create a copy of the request with the specified request URI appended to its existing URI.
         /// </summary>
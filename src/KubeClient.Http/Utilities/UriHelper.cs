@@ -17,7 +17,7 @@ namespace KubeClient.Http.Utilities
         ///		The URI.
         /// </param>
         /// <returns>
-        ///		A <see cref="NameValueCollection"/> containing key / value pairs representing the query parameters.
+        ///		A <see cref="NameValueCollection"/> containing key / value pairs representing the (unescaped) query parameters.
         /// </returns>
         public static NameValueCollection ParseQueryParameters(this Uri uri)
         {
@@ -42,8 +42,9 @@ namespace KubeClient.Http.Utilities
                     count: 2
                 );
 
-                string key = keyAndValue[0];
-                string value = keyAndValue.Length == 2 ? keyAndValue[1] : null;
+                // Unescape, so that the parameters are not escaped a second time when the query string is rebuilt (see WithQueryParameters).
+                string key = Uri.UnescapeDataString(keyAndValue[0]);
+                string value = keyAndValue.Length == 2 ? Uri.UnescapeDataString(keyAndValue[1]) : null;
 
                 queryParameters[key] = value;
             }
@@ -84,7 +85,7 @@ namespace KubeClient.Http.Utilities
         ///		The <see cref="UriBuilder"/> used to construct the URI
         /// </param>
         /// <param name="parameters">
-        ///		A <see cref="NameValueCollection"/> representing the query parameters.
+        ///		A <see cref="NameValueCollection"/> representing the (unescaped) query parameters.
         /// </param>
         /// <returns>
         ///		The <paramref name="uriBuilder">URI builder</paramref> (enables inline use).
@@ -107,19 +108,19 @@ namespace KubeClient.Http.Utilities
                 string parameterName = parameters.GetKey(parameterIndex);
                 string parameterValue = parameters.Get(parameterIndex);
 
-                builder.Append(parameterName);
+                builder.Append(
+                    Uri.EscapeDataString(parameterName)
+                );
 
                 // Support for /foo/bar?x=1&y&z=2
                 if (parameterValue != null)
                 {
                     builder.Append('=');
 
-                    // TODO: ensure we have tests for the existing baseline before we even * consider * changing the escape mechanism
-#pragma warning disable SYSLIB0013 // Type or member is obsolete
+                    // Values may contain reserved characters (e.g. "=" and "," in label selectors, or "+" and "/" in continuation tokens), so escape them in the same way as UriTemplate does.
                     builder.Append(
-                        Uri.EscapeUriString(parameterValue)
+                        Uri.EscapeDataString(parameterValue)
                     );
-#pragma warning restore SYSLIB0013 // Type or member is obsolete
                 }
             };
 
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Linq;
 using System.Reflection;
@@ -19,6 +20,14 @@ namespace KubeClient.ApiMetadata
         /// </summary>
         public static readonly IReadOnlyCollection<string> ApiGroupPrefixes = new string[] { "api", "apis" };
 
+        /// <summary>
+        ///     Cache keys for model types, keyed by model type.
+        /// </summary>
+        /// <remarks>
+        ///     A model type's cache key depends only on its kind and apiVersion, so these can be shared by all instances of the cache.
+        /// </remarks>
+        static readonly ConcurrentDictionary<Type, string> ModelTypeCacheKeys = new ConcurrentDictionary<Type, string>();
+
         /// <summary>
         ///     An object used to synchronise access to cache state.
         /// </summary>
@@ -81,11 +90,15 @@ namespace KubeClient.ApiMetadata
             if (modelType == null)
                 throw new ArgumentNullException(nameof(modelType));
 
-            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind(modelType);
-            if (String.IsNullOrWhiteSpace(kind))
-                throw new ArgumentException($"Model type {modelType.FullName} has not been decorated with KubeResourceAttribute or KubeResourceListAttribute.", nameof(modelType));
+            string cacheKey = GetCacheKey(modelType);
 
-            return Get(kind, apiVersion);
+            lock (_stateLock)
+            {
+                if (_metadata.TryGetValue(cacheKey, out KubeApiMetadata metadata))
+                    return metadata;
+            }
+
+            return null;
         }
 
         /// <summary>
@@ -186,11 +199,15 @@ namespace KubeClient.ApiMetadata
             if (modelType == null)
                 throw new ArgumentNullException(nameof(modelType));
 
-            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind(modelType);
-            if (String.IsNullOrWhiteSpace(kind))
-                throw new ArgumentException($"Model type {modelType.FullName} has not been decorated with KubeResourceAttribute or KubeResourceListAttribute.", nameof(modelType));
+            string cacheKey = GetCacheKey(modelType);
 
-            return GetPrimaryPath(kind, apiVersion);
+            lock (_stateLock)
+            {
+                if (!_metadata.TryGetValue(cacheKey, out KubeApiMetadata metadata))
+                    throw new KeyNotFoundException($"No API metadata found for '{cacheKey}'");
+
+                return metadata.PrimaryPath;
+            }
         }
 
         /// <summary>
@@ -254,6 +271,9 @@ namespace KubeClient.ApiMetadata
         /// <summary>
         ///     Populate the cache from model metadata.
         /// </summary>
+        /// <remarks>
+        ///     API paths for the well-known model types in the KubeClient assembly are loaded from <see cref="KnownModels"/> (rather than via reflection).
+        /// </remarks>
         /// <param name="assembly">
         ///     The assembly containing model types to process.
         /// </param>
@@ -266,7 +286,8 @@ namespace KubeClient.ApiMetadata
                 throw new ArgumentNullException(nameof(assembly));
 
             Dictionary<(string kind, string apiVersion), Type> modelMetadata = ModelMetadata.KubeObject.BuildKindToTypeLookup(assembly);
-            
+            bool isModelAssembly = KnownModels.IsModelAssembly(assembly);
+
             var loadedMetadata = new List<KubeApiMetadata>();
             foreach (var kindAndApiVersion in modelMetadata.Keys)
             {
@@ -279,41 +300,19 @@ namespace KubeClient.ApiMetadata
 
                 // TODO: Add SingularName and ShortNames to model metadata (as custom attributes), but where do we get them from? They appear to only be available at runtime (via the API).
 
-                Dictionary<string, List<KubeAction>> pathActions = new Dictionary<string, List<KubeAction>>();
-
-                KubeApiAttribute[] apiAttributes = modelType.GetTypeInfo().GetCustomAttributes<KubeApiAttribute>().ToArray();
-                foreach (KubeApiAttribute apiAttribute in apiAttributes)
-                {
-                    foreach (string path in apiAttribute.Paths)
-                    {
-                        List<KubeAction> actions;
-                        if (!pathActions.TryGetValue(path, out actions))
-                        {
-                            actions = new List<KubeAction>();
-                            pathActions.Add(path, actions);
-                        }
-
-                        actions.Add(apiAttribute.Action);
-                    }
-                }
-
-                var apiPaths = new List<KubeApiPathMetadata>();
-                foreach (string path in pathActions.Keys.OrderBy(path => path))
+                (KubeAction action, string path)[] modelApiPaths;
+                if (!isModelAssembly || !KnownModels.TryGetApiPaths(modelType, out modelApiPaths))
                 {
-                    bool isNamespaced = path.Contains("namespace");
-
-                    List<KubeAction> actions = pathActions[path];
-                    actions.Sort();
-
-                    string[] verbs = new string[actions.Count];
-                    for (int actionIndex = 0; actionIndex < actions.Count; actionIndex++)
-                        verbs[actionIndex] = actions[actionIndex].ToString().ToLower();
-
-                    apiPaths.Add(
-                        new KubeApiPathMetadata(path, isNamespaced, verbs)
-                    );
+                    modelApiPaths = modelType.GetTypeInfo().GetCustomAttributes<KubeApiAttribute>()
+                        .SelectMany(
+                            apiAttribute => apiAttribute.Paths.Select(
+                                path => (apiAttribute.Action, path)
+                            )
+                        )
+                        .ToArray();
                 }
 
+                List<KubeApiPathMetadata> apiPaths = BuildApiPathMetadata(modelApiPaths);
                 if (apiPaths.Count == 0)
                     continue;
 
@@ -592,6 +591,80 @@ namespace KubeClient.ApiMetadata
             }
         }
 
+        /// <summary>
+        ///     Build API path metadata from the API paths (and corresponding actions) declared by a model type.
+        /// </summary>
+        /// <param name="modelApiPaths">
+        ///     The model type's API paths and corresponding actions.
+        /// </param>
+        /// <returns>
+        ///     A list of <see cref="KubeApiPathMetadata"/> (one per distinct path), ordered by path.
+        /// </returns>
+        static List<KubeApiPathMetadata> BuildApiPathMetadata(IEnumerable<(KubeAction action, string path)> modelApiPaths)
+        {
+            if (modelApiPaths == null)
+                throw new ArgumentNullException(nameof(modelApiPaths));
+
+            Dictionary<string, List<KubeAction>> pathActions = new Dictionary<string, List<KubeAction>>();
+            foreach ((KubeAction action, string path) in modelApiPaths)
+            {
+                List<KubeAction> actions;
+                if (!pathActions.TryGetValue(path, out actions))
+                {
+                    actions = new List<KubeAction>();
+                    pathActions.Add(path, actions);
+                }
+
+                actions.Add(action);
+            }
+
+            var apiPaths = new List<KubeApiPathMetadata>();
+            foreach (string path in pathActions.Keys.OrderBy(path => path))
+            {
+                bool isNamespaced = path.Contains("namespace");
+
+                List<KubeAction> actions = pathActions[path];
+                actions.Sort();
+
+                string[] verbs = new string[actions.Count];
+                for (int actionIndex = 0; actionIndex < actions.Count; actionIndex++)
+                    verbs[actionIndex] = actions[actionIndex].ToString().ToLower();
+
+                apiPaths.Add(
+                    new KubeApiPathMetadata(path, isNamespaced, verbs)
+                );
+            }
+
+            return apiPaths;
+        }
+
+        /// <summary>
+        ///     Get the cache key for the specified model type.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The CLR <see cref="Type"/> of the model that represents the resource.
+        /// </param>
+        /// <returns>
+        ///     The cache key.
+        /// </returns>
+        static string GetCacheKey(Type modelType)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            if (ModelTypeCacheKeys.TryGetValue(modelType, out string cacheKey))
+                return cacheKey;
+
+            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind(modelType);
+            if (String.IsNullOrWhiteSpace(kind))
+                throw new ArgumentException($"Model type {modelType.FullName} has not been decorated with KubeResourceAttribute or KubeResourceListAttribute.", nameof(modelType));
+
+            cacheKey = CreateCacheKey(kind, apiGroup: null, apiVersion);
+            ModelTypeCacheKeys.TryAdd(modelType, cacheKey);
+
+            return cacheKey;
+        }
+
         /// <summary>
         ///     Create a cache key based on the specified resource kind and API group / version.
         /// </summary>
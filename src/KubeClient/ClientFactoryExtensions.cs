@@ -7,7 +7,7 @@ namespace KubeClient
     /// <summary>
     ///     Extension methods for creating Kubernetes resource clients for a <see cref="KubeApiClient"/>.
     /// </summary>
-    public static class ClientFactoryExtensions
+    public static partial class ClientFactoryExtensions
     {
         /// <summary>
         ///     Get the Kubernetes Namespaces (v1) resource client.
@@ -462,5 +462,24 @@ namespace KubeClient
                 client => new DynamicResourceClient(client)
             );
         }
+
+        /// <summary>
+        ///     Get a client for bulk operations on (heterogeneous) Kubernetes resources.
+        /// </summary>
+        /// <param name="kubeClient">
+        ///     The Kubernetes API client.
+        /// </param>
+        /// <returns>
+        ///     The resource client.
+        /// </returns>
+        public static IBulkResourceClient Bulk(this IKubeApiClient kubeClient)
+        {
+            if (kubeClient == null)
+                throw new ArgumentNullException(nameof(kubeClient));
+
+            return kubeClient.ResourceClient<IBulkResourceClient>(
+                client => new BulkResourceClient(client)
+            );
+        }
     }
 }
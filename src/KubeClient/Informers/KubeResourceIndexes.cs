@@ -0,0 +1,112 @@
+using System;
+using System.Collections.Generic;
+
+namespace KubeClient.Informers
+{
+    using Models;
+
+    /// <summary>
+    ///     Well-known indexes (and their index-key functions) for <see cref="KubeResourceStore{TResource}"/>.
+    /// </summary>
+    public static class KubeResourceIndexes
+    {
+        /// <summary>
+        ///     The name of the index of resources by namespace (cluster-scoped resources are not indexed).
+        /// </summary>
+        public const string Namespace = "namespace";
+
+        /// <summary>
+        ///     The name of the index of resources by label (index keys are "key=value").
+        /// </summary>
+        public const string Label = "label";
+
+        /// <summary>
+        ///     The name of the index of resources by the UIDs of their owners (from the resources' owner references).
+        /// </summary>
+        public const string OwnerUid = "ownerUid";
+
+        /// <summary>
+        ///     Get the key, in the <see cref="Label"/> index, for a label.
+        /// </summary>
+        /// <param name="key">
+        ///     The label key.
+        /// </param>
+        /// <param name="value">
+        ///     The label value.
+        /// </param>
+        /// <returns>
+        ///     The index key ("key=value").
+        /// </returns>
+        public static string GetLabelKey(string key, string value)
+        {
+            if (String.IsNullOrWhiteSpace(key))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'key'.", nameof(key));
+
+            return key + "=" + (value ?? String.Empty);
+        }
+
+        /// <summary>
+        ///     Get the keys, in the <see cref="Namespace"/> index, for a resource.
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource.
+        /// </param>
+        /// <returns>
+        ///     The index keys.
+        /// </returns>
+        public static IEnumerable<string> GetNamespaceKeys(KubeResourceV1 resource)
+        {
+            if (resource == null)
+                throw new ArgumentNullException(nameof(resource));
+
+            string kubeNamespace = resource.Metadata?.Namespace;
+            if (!String.IsNullOrWhiteSpace(kubeNamespace))
+                yield return kubeNamespace;
+        }
+
+        /// <summary>
+        ///     Get the keys, in the <see cref="Label"/> index, for a resource.
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource.
+        /// </param>
+        /// <returns>
+        ///     The index keys.
+        /// </returns>
+        public static IEnumerable<string> GetLabelKeys(KubeResourceV1 resource)
+        {
+            if (resource == null)
+                throw new ArgumentNullException(nameof(resource));
+
+            if (resource.Metadata == null)
+                yield break;
+
+            foreach (KeyValuePair<string, string> label in resource.Metadata.Labels)
+                yield return GetLabelKey(label.Key, label.Value);
+        }
+
+        /// <summary>
+        ///     Get the keys, in the <see cref="OwnerUid"/> index, for a resource.
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource.
+        /// </param>
+        /// <returns>
+        ///     The index keys.
+        /// </returns>
+        public static IEnumerable<string> GetOwnerUidKeys(KubeResourceV1 resource)
+        {
+            if (resource == null)
+                throw new ArgumentNullException(nameof(resource));
+
+            if (resource.Metadata == null)
+                yield break;
+
+            foreach (OwnerReferenceV1 ownerReference in resource.Metadata.OwnerReferences)
+            {
+                if (!String.IsNullOrWhiteSpace(ownerReference.Uid))
+                    yield return ownerReference.Uid;
+            }
+        }
+    }
+}
@@ -0,0 +1,360 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace KubeClient.Informers
+{
+    using Models;
+    using ResourceClients;
+
+    /// <summary>
+    ///     Keeps a <see cref="KubeResourceStore{TResource}"/> up-to-date by listing and then watching resources (optionally starting from a local snapshot).
+    /// </summary>
+    /// <typeparam name="TResource">
+    ///     The type of resource to cache.
+    /// </typeparam>
+    /// <remarks>
+    ///     If a snapshot file is specified and contains a valid snapshot (see <see cref="KubeResourceSnapshot"/>), the store is populated from the snapshot and the watch resumes from the snapshot's resource version; otherwise (or if the API server reports that the resource version is too old, i.e. "410 Gone"), resources are listed again.
+    ///
+    ///     When the watch ends (e.g. because the API server closed it), it is resumed from the store's current <see cref="KubeResourceStore{TResource}.ResourceVersion"/>, which is also the resource version saved in snapshots.
+    ///
+    ///     The store's resource version is only advanced by bookmark events if the watch publishes them, so that it does not fall behind for resources that rarely change; for example:
+    ///     <code>
+    ///     resourceVersion => client.PodsV1().WatchAll(resourceVersion: resourceVersion, includeBookmarks: true)
+    ///     </code>
+    ///
+    ///     Relists caused by expired resource versions are delayed by a randomised, exponentially-increasing back-off (see <see cref="RelistBackoff"/>), so that many informers do not all relist at once after an API server restart.
+    /// </remarks>
+    public sealed class KubeResourceInformer<TResource>
+        where TResource : KubeResourceV1
+    {
+        /// <summary>
+        ///     The default initial delay before relisting resources after a watch's resource version has expired.
+        /// </summary>
+        public static readonly TimeSpan DefaultRelistBackoff = TimeSpan.FromSeconds(1);
+
+        /// <summary>
+        ///     The default maximum delay before relisting resources after a watch's resource version has expired.
+        /// </summary>
+        public static readonly TimeSpan DefaultMaxRelistBackoff = TimeSpan.FromSeconds(30);
+
+        /// <summary>
+        ///     A delegate that lists resources.
+        /// </summary>
+        readonly Func<CancellationToken, Task<KubeResourceListV1<TResource>>> _listResources;
+
+        /// <summary>
+        ///     A delegate that watches resources, starting from the specified resource version.
+        /// </summary>
+        readonly Func<string, IObservable<IResourceEventV1<TResource>>> _watchResources;
+
+        /// <summary>
+        ///     The source of randomness for relist back-off delays.
+        /// </summary>
+        readonly Random _random = new Random();
+
+        /// <summary>
+        ///     Does the informer record the events it observes (bookmarks, resource versions, and expirations) in <see cref="Statistics"/>?
+        /// </summary>
+        /// <remarks>
+        ///     <c>false</c> if the statistics are shared with the resource client whose watches the informer uses (the client records those events itself).
+        /// </remarks>
+        readonly bool _recordWatchEvents;
+
+        /// <summary>
+        ///     The number of consecutive watches that have failed because their resource version had expired (without observing any events).
+        /// </summary>
+        int _consecutiveExpirations;
+
+        /// <summary>
+        ///     Create a new <see cref="KubeResourceInformer{TResource}"/>.
+        /// </summary>
+        /// <param name="store">
+        ///     The <see cref="KubeResourceStore{TResource}"/> to keep up-to-date.
+        /// </param>
+        /// <param name="listResources">
+        ///     A delegate that lists resources (the list's resource version is used to start watching them).
+        /// </param>
+        /// <param name="watchResources">
+        ///     A delegate that watches resources, starting from the specified resource version (and, ideally, including bookmark events).
+        /// </param>
+        /// <param name="snapshotFileName">
+        ///     An optional name for the file used to save (and load) snapshots of the store.
+        /// </param>
+        /// <param name="watchStatistics">
+        ///     Optional <see cref="KubeWatchStatistics"/> shared with the resource client whose watches are used (see <see cref="ResourceClientExtensions.GetWatchStatistics"/>).
+        ///
+        ///     The client records the reconnects, bookmarks, and expirations that it observes, and the informer adds its relists. If not specified, the informer records all counters in its own statistics.
+        /// </param>
+        public KubeResourceInformer(KubeResourceStore<TResource> store, Func<CancellationToken, Task<KubeResourceListV1<TResource>>> listResources, Func<string, IObservable<IResourceEventV1<TResource>>> watchResources, string snapshotFileName = null, KubeWatchStatistics watchStatistics = null)
+        {
+            if (store == null)
+                throw new ArgumentNullException(nameof(store));
+
+            if (listResources == null)
+                throw new ArgumentNullException(nameof(listResources));
+
+            if (watchResources == null)
+                throw new ArgumentNullException(nameof(watchResources));
+
+            Store = store;
+            SnapshotFileName = snapshotFileName;
+            Statistics = watchStatistics ?? new KubeWatchStatistics();
+
+            _recordWatchEvents = watchStatistics == null;
+
+            _listResources = listResources;
+            _watchResources = watchResources;
+        }
+
+        /// <summary>
+        ///     The <see cref="KubeResourceStore{TResource}"/> kept up-to-date by the informer.
+        /// </summary>
+        public KubeResourceStore<TResource> Store { get; }
+
+        /// <summary>
+        ///     The name of the file used to save (and load) snapshots of the store (if any).
+        /// </summary>
+        public string SnapshotFileName { get; }
+
+        /// <summary>
+        ///     Counters for the informer's watches (reconnects, relists, bookmarks, and expired resource versions).
+        /// </summary>
+        /// <remarks>
+        ///     If statistics were supplied when the informer was created, these are the statistics shared with the resource client.
+        /// </remarks>
+        public KubeWatchStatistics Statistics { get; }
+
+        /// <summary>
+        ///     The initial (maximum) delay before relisting resources after a watch's resource version has expired.
+        /// </summary>
+        /// <remarks>
+        ///     The delay doubles for each consecutive expiration (up to <see cref="MaxRelistBackoff"/>), and the actual delay is chosen at random between 0 and that value.
+        /// </remarks>
+        public TimeSpan RelistBackoff { get; set; } = DefaultRelistBackoff;
+
+        /// <summary>
+        ///     The maximum delay before relisting resources after a watch's resource version has expired.
+        /// </summary>
+        public TimeSpan MaxRelistBackoff { get; set; } = DefaultMaxRelistBackoff;
+
+        /// <summary>
+        ///     Populate the store, and then keep it up-to-date until cancelled.
+        /// </summary>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to stop the informer.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="Task"/> representing the informer's operation (which only completes when it is cancelled, or if listing or watching resources fails).
+        /// </returns>
+        public async Task RunAsync(CancellationToken cancellationToken)
+        {
+            bool loadedSnapshot = SnapshotFileName != null && KubeResourceSnapshot.TryLoad(Store, SnapshotFileName);
+            if (!loadedSnapshot || Store.ResourceVersion == null)
+                await ListAsync(cancellationToken).ConfigureAwait(false);
+
+            bool isResuming = loadedSnapshot;
+            while (true)
+            {
+                cancellationToken.ThrowIfCancellationRequested();
+
+                string resourceVersion = Store.ResourceVersion;
+                if (resourceVersion == null)
+                {
+                    await ListAsync(cancellationToken).ConfigureAwait(false);
+                    Statistics.RecordRelist();
+
+                    isResuming = false;
+
+                    continue;
+                }
+
+                if (isResuming)
+                    Statistics.RecordReconnect();
+
+                isResuming = true;
+
+                WatchObserver watchObserver = new WatchObserver(Store, _recordWatchEvents ? Statistics : null);
+                try
+                {
+                    await WatchAsync(resourceVersion, watchObserver, cancellationToken).ConfigureAwait(false);
+                }
+                catch (Exception watchFailed) when (WatchEventReader.IsResourceVersionExpired(watchFailed))
+                {
+                    if (_recordWatchEvents)
+                        Statistics.RecordExpiration();
+
+                    // Only back off further if nothing has been observed since the last relist.
+                    if (watchObserver.EventCount > 0)
+                        _consecutiveExpirations = 0;
+
+                    _consecutiveExpirations++;
+                    await Task.Delay(GetRelistDelay(_consecutiveExpirations), cancellationToken).ConfigureAwait(false);
+
+                    await ListAsync(cancellationToken).ConfigureAwait(false);
+                    Statistics.RecordRelist();
+
+                    isResuming = false;
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Save a snapshot of the store (to <see cref="SnapshotFileName"/>).
+        /// </summary>
+        /// <returns>
+        ///     The number of resources in the snapshot.
+        /// </returns>
+        /// <remarks>
+        ///     Call this periodically (and / or when the application is shutting down) so that the informer can resume from the snapshot when it is next started.
+        /// </remarks>
+        public int SaveSnapshot()
+        {
+            if (SnapshotFileName == null)
+                throw new InvalidOperationException("Cannot save a snapshot because the informer does not have a snapshot file name.");
+
+            return KubeResourceSnapshot.Save(Store, SnapshotFileName);
+        }
+
+        /// <summary>
+        ///     Get a randomised delay before relisting resources after a watch's resource version has expired.
+        /// </summary>
+        /// <param name="expirationCount">
+        ///     The number of consecutive expirations (including the current one).
+        /// </param>
+        /// <returns>
+        ///     The delay.
+        /// </returns>
+        TimeSpan GetRelistDelay(int expirationCount)
+        {
+            if (RelistBackoff <= TimeSpan.Zero)
+                return TimeSpan.Zero;
+
+            double maxDelayTicks = Math.Min(
+                RelistBackoff.Ticks * Math.Pow(2, Math.Min(expirationCount - 1, 30)),
+                Math.Max(MaxRelistBackoff.Ticks, RelistBackoff.Ticks)
+            );
+
+            return TimeSpan.FromTicks((long)(maxDelayTicks * _random.NextDouble()));
+        }
+
+        /// <summary>
+        ///     List resources, and replace the store's contents with them.
+        /// </summary>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to cancel the operation.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="Task"/> representing the operation.
+        /// </returns>
+        async Task ListAsync(CancellationToken cancellationToken)
+        {
+            KubeResourceListV1<TResource> resources = await _listResources(cancellationToken).ConfigureAwait(false);
+            if (resources == null)
+                throw new KubeClientException($"Failed to list resources of type '{typeof(TResource).FullName}' (the resource list was null).");
+
+            Store.Replace(resources.Items, resources.Metadata?.ResourceVersion);
+        }
+
+        /// <summary>
+        ///     Watch resources (applying their events to the store) until the watch ends.
+        /// </summary>
+        /// <param name="resourceVersion">
+        ///     The resource version to start watching from.
+        /// </param>
+        /// <param name="watchObserver">
+        ///     The <see cref="WatchObserver"/> that applies events to the store.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to stop watching.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="Task"/> that completes when the watch ends (or faults, if the watch fails).
+        /// </returns>
+        async Task WatchAsync(string resourceVersion, WatchObserver watchObserver, CancellationToken cancellationToken)
+        {
+            using (cancellationToken.Register(() => watchObserver.Completion.TrySetCanceled(cancellationToken)))
+            using (_watchResources(resourceVersion).Subscribe(watchObserver))
+            {
+                await watchObserver.Completion.Task.ConfigureAwait(false);
+            }
+        }
+
+        /// <summary>
+        ///     Applies resource events to the store, and signals when the watch ends.
+        /// </summary>
+        sealed class WatchObserver
+            : IObserver<IResourceEventV1<TResource>>
+        {
+            /// <summary>
+            ///     The store that events are applied to.
+            /// </summary>
+            readonly KubeResourceStore<TResource> _store;
+
+            /// <summary>
+            ///     The statistics that events are recorded in.
+            /// </summary>
+            readonly KubeWatchStatistics _statistics;
+
+            /// <summary>
+            ///     Create a new <see cref="WatchObserver"/>.
+            /// </summary>
+            /// <param name="store">
+            ///     The store that events are applied to.
+            /// </param>
+            /// <param name="statistics">
+            ///     The statistics that events are recorded in (or <c>null</c>, if events are recorded by the watch's source).
+            /// </param>
+            public WatchObserver(KubeResourceStore<TResource> store, KubeWatchStatistics statistics)
+            {
+                _store = store;
+                _statistics = statistics;
+            }
+
+            /// <summary>
+            ///     The completion source that is signalled when the watch ends.
+            /// </summary>
+            public TaskCompletionSource<bool> Completion { get; } = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+
+            /// <summary>
+            ///     The number of events observed.
+            /// </summary>
+            public int EventCount { get; private set; }
+
+            /// <summary>
+            ///     Called when the next resource event is available.
+            /// </summary>
+            /// <param name="resourceEvent">
+            ///     The <see cref="IResourceEventV1{TResource}"/>.
+            /// </param>
+            public void OnNext(IResourceEventV1<TResource> resourceEvent)
+            {
+                _store.Apply(resourceEvent);
+
+                if (_statistics != null)
+                {
+                    string resourceVersion = resourceEvent.Resource?.Metadata?.ResourceVersion;
+                    if (resourceEvent.EventType == ResourceEventType.Bookmark)
+                        _statistics.RecordBookmark(resourceVersion);
+                    else
+                        _statistics.RecordResourceVersion(resourceVersion);
+                }
+
+                EventCount++;
+            }
+
+            /// <summary>
+            ///     Called when the watch has failed.
+            /// </summary>
+            /// <param name="error">
+            ///     An <see cref="Exception"/> representing the error.
+            /// </param>
+            public void OnError(Exception error) => Completion.TrySetException(error);
+
+            /// <summary>
+            ///     Called when the watch has ended.
+            /// </summary>
+            public void OnCompleted() => Completion.TrySetResult(true);
+        }
+    }
+}
@@ -0,0 +1,192 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Text;
+
+namespace KubeClient.Informers
+{
+    using Models;
+    using Models.Converters;
+
+    /// <summary>
+    ///     Saves and loads local (binary) snapshots of the contents of a <see cref="KubeResourceStore{TResource}"/>.
+    /// </summary>
+    /// <remarks>
+    ///     A snapshot contains the store's resources, and the resource version that they correspond to (so that a watch can be resumed from where it left off, rather than listing all resources again).
+    ///
+    ///     Resources are written using their generated binary serialiser (see <see cref="KubeModelBinarySerializers"/>); snapshots written for a different version of the resource model (i.e. with a different <see cref="KubeModelBinarySerializer.SchemaHash"/>) are rejected when they are loaded.
+    /// </remarks>
+    public static class KubeResourceSnapshot
+    {
+        /// <summary>
+        ///     The signature that identifies a snapshot file.
+        /// </summary>
+        static readonly byte[] Signature = Encoding.ASCII.GetBytes("KUBESNAP");
+
+        /// <summary>
+        ///     The version of the snapshot file format (excluding the format of the resources themselves, which is covered by their model's schema hash).
+        /// </summary>
+        public const int FormatVersion = 1;
+
+        /// <summary>
+        ///     Save a snapshot of the contents of a <see cref="KubeResourceStore{TResource}"/>.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource in the store.
+        /// </typeparam>
+        /// <param name="store">
+        ///     The <see cref="KubeResourceStore{TResource}"/>.
+        /// </param>
+        /// <param name="fileName">
+        ///     The name of the snapshot file.
+        /// </param>
+        /// <returns>
+        ///     The number of resources in the snapshot.
+        /// </returns>
+        /// <remarks>
+        ///     The snapshot is written to a temporary file, which then replaces the snapshot file (so an existing snapshot is never left partially written).
+        /// </remarks>
+        /// <exception cref="NotSupportedException">
+        ///     <typeparamref name="TResource"/> does not have a generated binary serialiser.
+        /// </exception>
+        public static int Save<TResource>(KubeResourceStore<TResource> store, string fileName)
+            where TResource : KubeResourceV1
+        {
+            if (store == null)
+                throw new ArgumentNullException(nameof(store));
+
+            if (String.IsNullOrWhiteSpace(fileName))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'fileName'.", nameof(fileName));
+
+            KubeModelBinarySerializer serializer = GetSerializer(typeof(TResource));
+
+            (IReadOnlyList<TResource> resources, string resourceVersion) = store.GetSnapshot();
+
+            string temporaryFileName = fileName + ".tmp";
+            using (FileStream snapshotFile = new FileStream(temporaryFileName, FileMode.Create, FileAccess.Write, FileShare.None))
+            using (BinaryWriter writer = new BinaryWriter(snapshotFile, Encoding.UTF8))
+            {
+                writer.Write(Signature);
+                writer.Write(FormatVersion);
+                writer.Write(typeof(TResource).FullName);
+                writer.Write(serializer.SchemaHash);
+                writer.Write(resourceVersion ?? String.Empty);
+
+                writer.Write(resources.Count);
+                foreach (TResource resource in resources)
+                    serializer.WriteObject(writer, resource);
+            }
+
+            if (File.Exists(fileName))
+                File.Replace(temporaryFileName, fileName, destinationBackupFileName: null);
+            else
+                File.Move(temporaryFileName, fileName);
+
+            return resources.Count;
+        }
+
+        /// <summary>
+        ///     Attempt to load a snapshot into a <see cref="KubeResourceStore{TResource}"/> (replacing its contents).
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource in the store.
+        /// </typeparam>
+        /// <param name="store">
+        ///     The <see cref="KubeResourceStore{TResource}"/>.
+        /// </param>
+        /// <param name="fileName">
+        ///     The name of the snapshot file.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the snapshot was loaded; <c>false</c>, if the snapshot file does not exist, or the snapshot is not valid (e.g. it is for a different resource type, or was written for a different version of the resource model), in which case the store is not modified.
+        /// </returns>
+        /// <remarks>
+        ///     The snapshot file is memory-mapped (rather than read into a buffer) while it is being loaded.
+        /// </remarks>
+        /// <exception cref="NotSupportedException">
+        ///     <typeparamref name="TResource"/> does not have a generated binary serialiser.
+        /// </exception>
+        public static bool TryLoad<TResource>(KubeResourceStore<TResource> store, string fileName)
+            where TResource : KubeResourceV1
+        {
+            if (store == null)
+                throw new ArgumentNullException(nameof(store));
+
+            if (String.IsNullOrWhiteSpace(fileName))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'fileName'.", nameof(fileName));
+
+            KubeModelBinarySerializer serializer = GetSerializer(typeof(TResource));
+
+            FileInfo snapshotFile = new FileInfo(fileName);
+            if (!snapshotFile.Exists || snapshotFile.Length < Signature.Length)
+                return false;
+
+            TResource[] resources;
+            string resourceVersion;
+            try
+            {
+                using (MemoryMappedFile mappedFile = MemoryMappedFile.CreateFromFile(snapshotFile.FullName, FileMode.Open, mapName: null, capacity: 0, MemoryMappedFileAccess.Read))
+                using (MemoryMappedViewStream view = mappedFile.CreateViewStream(offset: 0, size: 0, MemoryMappedFileAccess.Read))
+                using (BinaryReader reader = new BinaryReader(view, Encoding.UTF8))
+                {
+                    byte[] signature = reader.ReadBytes(Signature.Length);
+                    for (int signatureIndex = 0; signatureIndex < Signature.Length; signatureIndex++)
+                    {
+                        if (signature[signatureIndex] != Signature[signatureIndex])
+                            return false;
+                    }
+
+                    if (reader.ReadInt32() != FormatVersion)
+                        return false;
+
+                    if (reader.ReadString() != typeof(TResource).FullName)
+                        return false;
+
+                    if (reader.ReadUInt64() != serializer.SchemaHash)
+                        return false;
+
+                    resourceVersion = reader.ReadString();
+                    if (resourceVersion.Length == 0)
+                        resourceVersion = null;
+
+                    int count = KubeModelBinarySerializer.ReadCount(reader);
+
+                    resources = new TResource[count];
+                    for (int resourceIndex = 0; resourceIndex < count; resourceIndex++)
+                        resources[resourceIndex] = (TResource)serializer.ReadObject(reader);
+                }
+            }
+            catch (EndOfStreamException)
+            {
+                return false; // Truncated.
+            }
+            catch (Exception invalidData) when (invalidData is InvalidDataException || invalidData is FormatException || invalidData is JsonException)
+            {
+                return false; // Corrupt.
+            }
+
+            store.Replace(resources, resourceVersion);
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Get the generated binary serialiser for a resource type.
+        /// </summary>
+        /// <param name="resourceType">
+        ///     The resource type.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="KubeModelBinarySerializer"/>.
+        /// </returns>
+        static KubeModelBinarySerializer GetSerializer(Type resourceType)
+        {
+            if (!KubeModelBinarySerializers.TryGetSerializer(resourceType, out KubeModelBinarySerializer serializer))
+                throw new NotSupportedException($"Resource type '{resourceType.FullName}' does not have a generated binary serializer, so it cannot be saved to (or loaded from) a snapshot.");
+
+            return serializer;
+        }
+    }
+}
@@ -0,0 +1,645 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace KubeClient.Informers
+{
+    using Models;
+
+    /// <summary>
+    ///     A thread-safe, indexed cache of Kubernetes resources, populated from a stream of resource events.
+    /// </summary>
+    /// <typeparam name="TResource">
+    ///     The type of resource to cache.
+    /// </typeparam>
+    /// <remarks>
+    ///     Subscribe the store to a resource-event stream (e.g. <c>podClient.WatchAll().Subscribe(store)</c>), after populating it from an initial list (via <see cref="Replace(IEnumerable{TResource}, string)"/>), or use a <see cref="KubeResourceInformer{TResource}"/> to do this (and to list resources again, or resume from a local snapshot, when required).
+    ///
+    ///     Resources are keyed by namespace and name (see <see cref="GetKey(string, string)"/>), and indexed by namespace, label, and owner UID (see <see cref="KubeResourceIndexes"/>), as well as by any additional indexes (see <see cref="AddIndex(string, Func{TResource, IEnumerable{string}})"/> and <see cref="AddFieldIndex(string)"/>). Index lookups do not scan the cache.
+    ///
+    ///     Cached resources are shared (rather than copied) and must not be modified.
+    /// </remarks>
+    public sealed class KubeResourceStore<TResource>
+        : IObserver<IResourceEventV1<TResource>>
+        where TResource : KubeResourceV1
+    {
+        /// <summary>
+        ///     An object used to synchronise access to store state.
+        /// </summary>
+        readonly object _stateLock = new object();
+
+        /// <summary>
+        ///     Cached resources, keyed by namespace and name.
+        /// </summary>
+        readonly Dictionary<string, TResource> _resources = new Dictionary<string, TResource>(StringComparer.Ordinal);
+
+        /// <summary>
+        ///     Indexes, keyed by name.
+        /// </summary>
+        readonly Dictionary<string, ResourceIndex> _indexes = new Dictionary<string, ResourceIndex>(StringComparer.Ordinal);
+
+        /// <summary>
+        ///     The resource version that the store's contents correspond to (if known).
+        /// </summary>
+        string _resourceVersion;
+
+        /// <summary>
+        ///     Create a new <see cref="KubeResourceStore{TResource}"/> with the standard (namespace, label, and owner UID) indexes.
+        /// </summary>
+        public KubeResourceStore()
+        {
+            AddIndex(KubeResourceIndexes.Namespace, KubeResourceIndexes.GetNamespaceKeys);
+            AddIndex(KubeResourceIndexes.Label, KubeResourceIndexes.GetLabelKeys);
+            AddIndex(KubeResourceIndexes.OwnerUid, KubeResourceIndexes.GetOwnerUidKeys);
+        }
+
+        /// <summary>
+        ///     The number of resources in the store.
+        /// </summary>
+        public int Count
+        {
+            get
+            {
+                lock (_stateLock)
+                {
+                    return _resources.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        ///     The resource version that the store's contents correspond to (if known).
+        /// </summary>
+        /// <remarks>
+        ///     Set when the store's contents are replaced (e.g. from the results of listing resources), and updated by each resource event (including bookmark events) that is applied to the store; watches can be resumed from this resource version.
+        /// </remarks>
+        public string ResourceVersion
+        {
+            get
+            {
+                lock (_stateLock)
+                {
+                    return _resourceVersion;
+                }
+            }
+        }
+
+        /// <summary>
+        ///     The names of the store's indexes.
+        /// </summary>
+        public IReadOnlyList<string> IndexNames
+        {
+            get
+            {
+                lock (_stateLock)
+                {
+                    return _indexes.Keys.ToArray();
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Add an index to the store.
+        /// </summary>
+        /// <param name="indexName">
+        ///     The index name.
+        /// </param>
+        /// <param name="getIndexKeys">
+        ///     A function that gets the index keys for a resource (a resource can have any number of keys, including none).
+        /// </param>
+        /// <remarks>
+        ///     Resources that are already in the store are indexed immediately.
+        ///
+        ///     The function must always return the same keys for the same resource (it is also used to remove resources from the index), and is called while the store is locked.
+        /// </remarks>
+        public void AddIndex(string indexName, Func<TResource, IEnumerable<string>> getIndexKeys)
+        {
+            if (String.IsNullOrWhiteSpace(indexName))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'indexName'.", nameof(indexName));
+
+            if (getIndexKeys == null)
+                throw new ArgumentNullException(nameof(getIndexKeys));
+
+            lock (_stateLock)
+            {
+                if (_indexes.ContainsKey(indexName))
+                    throw new ArgumentException($"The store already has an index named '{indexName}'.", nameof(indexName));
+
+                var index = new ResourceIndex(getIndexKeys);
+                foreach (KeyValuePair<string, TResource> resource in _resources)
+                    index.Add(resource.Key, resource.Value);
+
+                _indexes.Add(indexName, index);
+            }
+        }
+
+        /// <summary>
+        ///     Add an index, by the value of a model field, to the store.
+        /// </summary>
+        /// <param name="fieldPath">
+        ///     The path of the field to index (e.g. "spec.nodeName"); this is also the index name.
+        /// </param>
+        /// <remarks>
+        ///     The field must be one of the <see cref="IndexedFields"/> for <typeparamref name="TResource"/>. Resources whose field has no value are not indexed.
+        /// </remarks>
+        public void AddFieldIndex(string fieldPath)
+        {
+            if (String.IsNullOrWhiteSpace(fieldPath))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'fieldPath'.", nameof(fieldPath));
+
+            if (!IndexedFields.TryGetField(typeof(TResource), fieldPath, out Func<KubeResourceV1, string> getValue))
+                throw new ArgumentException($"Field '{fieldPath}' is not an indexed field of model type '{typeof(TResource).FullName}'.", nameof(fieldPath));
+
+            AddIndex(fieldPath, resource =>
+            {
+                string value = getValue(resource);
+
+                return value != null ? new string[] { value } : Array.Empty<string>();
+            });
+        }
+
+        /// <summary>
+        ///     Get a resource from the store.
+        /// </summary>
+        /// <param name="name">
+        ///     The name of the resource.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The namespace of the resource (<c>null</c> for cluster-scoped resources).
+        /// </param>
+        /// <returns>
+        ///     The resource, or <c>null</c> if the store does not contain a matching resource.
+        /// </returns>
+        public TResource Get(string name, string kubeNamespace = null)
+        {
+            if (String.IsNullOrWhiteSpace(name))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
+
+            string key = GetKey(name, kubeNamespace);
+
+            lock (_stateLock)
+            {
+                _resources.TryGetValue(key, out TResource resource);
+
+                return resource;
+            }
+        }
+
+        /// <summary>
+        ///     Get all resources in the store.
+        /// </summary>
+        /// <returns>
+        ///     A snapshot of the resources.
+        /// </returns>
+        public IReadOnlyList<TResource> List()
+        {
+            lock (_stateLock)
+            {
+                return _resources.Values.ToArray();
+            }
+        }
+
+        /// <summary>
+        ///     Get the resources that have the specified key in an index.
+        /// </summary>
+        /// <param name="indexName">
+        ///     The index name.
+        /// </param>
+        /// <param name="indexKey">
+        ///     The index key.
+        /// </param>
+        /// <returns>
+        ///     A snapshot of the matching resources.
+        /// </returns>
+        public IReadOnlyList<TResource> GetByIndex(string indexName, string indexKey)
+        {
+            if (indexKey == null)
+                throw new ArgumentNullException(nameof(indexKey));
+
+            lock (_stateLock)
+            {
+                ResourceIndex index = GetIndex(indexName);
+                if (!index.ResourceKeys.TryGetValue(indexKey, out HashSet<string> resourceKeys))
+                    return Array.Empty<TResource>();
+
+                TResource[] resources = new TResource[resourceKeys.Count];
+
+                int resourceIndex = 0;
+                foreach (string resourceKey in resourceKeys)
+                    resources[resourceIndex++] = _resources[resourceKey];
+
+                return resources;
+            }
+        }
+
+        /// <summary>
+        ///     Get the keys that are present in an index.
+        /// </summary>
+        /// <param name="indexName">
+        ///     The index name.
+        /// </param>
+        /// <returns>
+        ///     A snapshot of the index keys.
+        /// </returns>
+        public IReadOnlyList<string> GetIndexKeys(string indexName)
+        {
+            lock (_stateLock)
+            {
+                return GetIndex(indexName).ResourceKeys.Keys.ToArray();
+            }
+        }
+
+        /// <summary>
+        ///     Get the resources in the specified namespace.
+        /// </summary>
+        /// <param name="kubeNamespace">
+        ///     The namespace.
+        /// </param>
+        /// <returns>
+        ///     A snapshot of the matching resources.
+        /// </returns>
+        public IReadOnlyList<TResource> GetByNamespace(string kubeNamespace)
+        {
+            if (String.IsNullOrWhiteSpace(kubeNamespace))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'kubeNamespace'.", nameof(kubeNamespace));
+
+            return GetByIndex(KubeResourceIndexes.Namespace, kubeNamespace);
+        }
+
+        /// <summary>
+        ///     Get the resources that have the specified label.
+        /// </summary>
+        /// <param name="key">
+        ///     The label key.
+        /// </param>
+        /// <param name="value">
+        ///     The label value.
+        /// </param>
+        /// <returns>
+        ///     A snapshot of the matching resources.
+        /// </returns>
+        public IReadOnlyList<TResource> GetByLabel(string key, string value)
+        {
+            return GetByIndex(KubeResourceIndexes.Label,
+                KubeResourceIndexes.GetLabelKey(key, value)
+            );
+        }
+
+        /// <summary>
+        ///     Get the resources that are owned by the resource with the specified UID.
+        /// </summary>
+        /// <param name="ownerUid">
+        ///     The owner's UID.
+        /// </param>
+        /// <returns>
+        ///     A snapshot of the matching resources.
+        /// </returns>
+        public IReadOnlyList<TResource> GetByOwnerUid(string ownerUid)
+        {
+            if (String.IsNullOrWhiteSpace(ownerUid))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'ownerUid'.", nameof(ownerUid));
+
+            return GetByIndex(KubeResourceIndexes.OwnerUid, ownerUid);
+        }
+
+        /// <summary>
+        ///     Add a resource to the store (or update the existing resource with the same namespace and name).
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource.
+        /// </param>
+        public void AddOrUpdate(TResource resource)
+        {
+            if (resource == null)
+                throw new ArgumentNullException(nameof(resource));
+
+            string key = GetKey(resource);
+
+            lock (_stateLock)
+            {
+                if (_resources.TryGetValue(key, out TResource existingResource))
+                {
+                    foreach (ResourceIndex index in _indexes.Values)
+                        index.Remove(key, existingResource);
+                }
+
+                _resources[key] = resource;
+
+                foreach (ResourceIndex index in _indexes.Values)
+                    index.Add(key, resource);
+            }
+        }
+
+        /// <summary>
+        ///     Remove a resource from the store.
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource (only its namespace and name are used).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the resource was removed; <c>false</c>, if the store did not contain a matching resource.
+        /// </returns>
+        public bool Remove(TResource resource)
+        {
+            if (resource == null)
+                throw new ArgumentNullException(nameof(resource));
+
+            string key = GetKey(resource);
+
+            lock (_stateLock)
+            {
+                if (!_resources.TryGetValue(key, out TResource existingResource))
+                    return false;
+
+                foreach (ResourceIndex index in _indexes.Values)
+                    index.Remove(key, existingResource);
+
+                _resources.Remove(key);
+
+                return true;
+            }
+        }
+
+        /// <summary>
+        ///     Get a consistent snapshot of the store's contents, together with the resource version that they correspond to.
+        /// </summary>
+        /// <returns>
+        ///     The resources, and the resource version (if known).
+        /// </returns>
+        public (IReadOnlyList<TResource> resources, string resourceVersion) GetSnapshot()
+        {
+            lock (_stateLock)
+            {
+                return (_resources.Values.ToArray(), _resourceVersion);
+            }
+        }
+
+        /// <summary>
+        ///     Replace the contents of the store (e.g. with the results of listing resources before watching them).
+        /// </summary>
+        /// <param name="resources">
+        ///     The resources.
+        /// </param>
+        /// <remarks>
+        ///     The store's <see cref="ResourceVersion"/> is reset (since it is no longer known).
+        /// </remarks>
+        public void Replace(IEnumerable<TResource> resources) => Replace(resources, resourceVersion: null);
+
+        /// <summary>
+        ///     Replace the contents of the store (e.g. with the results of listing resources before watching them).
+        /// </summary>
+        /// <param name="resources">
+        ///     The resources.
+        /// </param>
+        /// <param name="resourceVersion">
+        ///     The resource version that the resources correspond to (e.g. that of the resource list), or <c>null</c> if it is not known.
+        /// </param>
+        public void Replace(IEnumerable<TResource> resources, string resourceVersion)
+        {
+            if (resources == null)
+                throw new ArgumentNullException(nameof(resources));
+
+            // Keys are computed outside the lock (and before any state is changed).
+            (string key, TResource resource)[] keyedResources = resources.Select(
+                resource => (GetKey(resource), resource)
+            ).ToArray();
+
+            lock (_stateLock)
+            {
+                _resources.Clear();
+                foreach (ResourceIndex index in _indexes.Values)
+                    index.ResourceKeys.Clear();
+
+                foreach ((string key, TResource resource) in keyedResources)
+                    _resources[key] = resource;
+
+                _resourceVersion = resourceVersion;
+
+                foreach (KeyValuePair<string, TResource> resource in _resources)
+                {
+                    foreach (ResourceIndex index in _indexes.Values)
+                        index.Add(resource.Key, resource.Value);
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Apply a resource event to the store.
+        /// </summary>
+        /// <param name="resourceEvent">
+        ///     The <see cref="IResourceEventV1{TResource}"/>.
+        /// </param>
+        /// <remarks>
+        ///     Bookmark events only update the store's <see cref="ResourceVersion"/>; error events (and events without a resource) are ignored.
+        /// </remarks>
+        public void Apply(IResourceEventV1<TResource> resourceEvent)
+        {
+            if (resourceEvent == null)
+                throw new ArgumentNullException(nameof(resourceEvent));
+
+            if (resourceEvent.Resource == null || resourceEvent.EventType == ResourceEventType.Error)
+                return;
+
+            switch (resourceEvent.EventType)
+            {
+                case ResourceEventType.Added:
+                case ResourceEventType.Modified:
+                {
+                    AddOrUpdate(resourceEvent.Resource);
+
+                    break;
+                }
+                case ResourceEventType.Deleted:
+                {
+                    Remove(resourceEvent.Resource);
+
+                    break;
+                }
+            }
+
+            string resourceVersion = resourceEvent.Resource.Metadata?.ResourceVersion;
+            if (!String.IsNullOrWhiteSpace(resourceVersion))
+            {
+                lock (_stateLock)
+                {
+                    _resourceVersion = resourceVersion;
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Called when the next resource event is available.
+        /// </summary>
+        /// <param name="resourceEvent">
+        ///     The <see cref="IResourceEventV1{TResource}"/>.
+        /// </param>
+        void IObserver<IResourceEventV1<TResource>>.OnNext(IResourceEventV1<TResource> resourceEvent) => Apply(resourceEvent);
+
+        /// <summary>
+        ///     Called when the resource-event stream has failed.
+        /// </summary>
+        /// <param name="error">
+        ///     An <see cref="Exception"/> representing the error.
+        /// </param>
+        /// <remarks>
+        ///     The store retains its contents (it is up to the caller to re-list and re-subscribe).
+        /// </remarks>
+        void IObserver<IResourceEventV1<TResource>>.OnError(Exception error)
+        {
+        }
+
+        /// <summary>
+        ///     Called when the resource-event stream is complete.
+        /// </summary>
+        /// <remarks>
+        ///     The store retains its contents (it is up to the caller to re-list and re-subscribe).
+        /// </remarks>
+        void IObserver<IResourceEventV1<TResource>>.OnCompleted()
+        {
+        }
+
+        /// <summary>
+        ///     Get the key for a resource in the store.
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource.
+        /// </param>
+        /// <returns>
+        ///     The resource key ("namespace/name" or, for cluster-scoped resources, "name").
+        /// </returns>
+        public static string GetKey(TResource resource)
+        {
+            if (resource == null)
+                throw new ArgumentNullException(nameof(resource));
+
+            if (resource.Metadata == null || String.IsNullOrWhiteSpace(resource.Metadata.Name))
+                throw new ArgumentException("Cannot cache a resource that does not have a name.", nameof(resource));
+
+            return GetKey(resource.Metadata.Name, resource.Metadata.Namespace);
+        }
+
+        /// <summary>
+        ///     Get the key for a resource in the store.
+        /// </summary>
+        /// <param name="name">
+        ///     The name of the resource.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The namespace of the resource (<c>null</c> for cluster-scoped resources).
+        /// </param>
+        /// <returns>
+        ///     The resource key ("namespace/name" or, for cluster-scoped resources, "name").
+        /// </returns>
+        public static string GetKey(string name, string kubeNamespace)
+        {
+            if (String.IsNullOrWhiteSpace(name))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
+
+            if (String.IsNullOrWhiteSpace(kubeNamespace))
+                return name;
+
+            return kubeNamespace + "/" + name;
+        }
+
+        /// <summary>
+        ///     Get an index by name.
+        /// </summary>
+        /// <param name="indexName">
+        ///     The index name.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="ResourceIndex"/>.
+        /// </returns>
+        /// <remarks>
+        ///     The caller must hold the state lock.
+        /// </remarks>
+        ResourceIndex GetIndex(string indexName)
+        {
+            if (String.IsNullOrWhiteSpace(indexName))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'indexName'.", nameof(indexName));
+
+            if (!_indexes.TryGetValue(indexName, out ResourceIndex index))
+                throw new ArgumentException($"The store does not have an index named '{indexName}'.", nameof(indexName));
+
+            return index;
+        }
+
+        /// <summary>
+        ///     An index of cached resources.
+        /// </summary>
+        sealed class ResourceIndex
+        {
+            /// <summary>
+            ///     Create a new <see cref="ResourceIndex"/>.
+            /// </summary>
+            /// <param name="getIndexKeys">
+            ///     A function that gets the index keys for a resource.
+            /// </param>
+            public ResourceIndex(Func<TResource, IEnumerable<string>> getIndexKeys)
+            {
+                GetIndexKeys = getIndexKeys;
+            }
+
+            /// <summary>
+            ///     A function that gets the index keys for a resource.
+            /// </summary>
+            public Func<TResource, IEnumerable<string>> GetIndexKeys { get; }
+
+            /// <summary>
+            ///     The keys of indexed resources, by index key.
+            /// </summary>
+            public Dictionary<string, HashSet<string>> ResourceKeys { get; } = new Dictionary<string, HashSet<string>>(StringComparer.Ordinal);
+
+            /// <summary>
+            ///     Add a resource to the index.
+            /// </summary>
+            /// <param name="resourceKey">
+            ///     The resource's key in the store.
+            /// </param>
+            /// <param name="resource">
+            ///     The resource.
+            /// </param>
+            public void Add(string resourceKey, TResource resource)
+            {
+                foreach (string indexKey in GetIndexKeys(resource) ?? Enumerable.Empty<string>())
+                {
+                    if (indexKey == null)
+                        continue;
+
+                    if (!ResourceKeys.TryGetValue(indexKey, out HashSet<string> resourceKeys))
+                    {
+                        resourceKeys = new HashSet<string>(StringComparer.Ordinal);
+                        ResourceKeys.Add(indexKey, resourceKeys);
+                    }
+
+                    resourceKeys.Add(resourceKey);
+                }
+            }
+
+            /// <summary>
+            ///     Remove a resource from the index.
+            /// </summary>
+            /// <param name="resourceKey">
+            ///     The resource's key in the store.
+            /// </param>
+            /// <param name="resource">
+            ///     The resource (as it was when it was added to the index).
+            /// </param>
+            public void Remove(string resourceKey, TResource resource)
+            {
+                foreach (string indexKey in GetIndexKeys(resource) ?? Enumerable.Empty<string>())
+                {
+                    if (indexKey == null)
+                        continue;
+
+                    if (!ResourceKeys.TryGetValue(indexKey, out HashSet<string> resourceKeys))
+                        continue;
+
+                    resourceKeys.Remove(resourceKey);
+                    if (resourceKeys.Count == 0)
+                        ResourceKeys.Remove(indexKey);
+                }
+            }
+        }
+    }
+}
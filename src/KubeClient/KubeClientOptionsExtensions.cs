@@ -1,5 +1,6 @@
 ﻿using KubeClient.MessageHandlers;
 using System;
+using System.Net;
 
 namespace KubeClient
 {
@@ -33,6 +34,22 @@ namespace KubeClient
 
             kubeClientOptions.EnsureValid();
 
+            if (!clientBuilder.HasCustomPipelineTerminus)
+            {
+#if NETSTANDARD2_1
+                if (kubeClientOptions.MaxConnectionsPerServer.HasValue)
+                    clientBuilder = clientBuilder.ConfigureHttpClientHandler(clientHandler =>
+                        clientHandler.MaxConnectionsPerServer = kubeClientOptions.MaxConnectionsPerServer.Value
+                    );
+#else
+                if (kubeClientOptions.EnableHttp2 || kubeClientOptions.MaxConnectionsPerServer.HasValue)
+                    clientBuilder = clientBuilder.WithSocketsHttpHandler(kubeClientOptions.MaxConnectionsPerServer);
+#endif // NETSTANDARD2_1
+            }
+
+            if (kubeClientOptions.EnableHttp2)
+                clientBuilder = clientBuilder.WithRequestVersion(HttpVersion.Version20);
+
             switch (kubeClientOptions.AuthStrategy)
             {
                 case KubeAuthStrategy.Basic:
@@ -138,6 +155,22 @@ namespace KubeClient
 
             kubeClientOptions.EnsureValid();
 
+            if (!clientBuilder.HasCustomPipelineTerminus)
+            {
+#if NETSTANDARD2_1
+                if (kubeClientOptions.MaxConnectionsPerServer.HasValue)
+                    clientBuilder = clientBuilder.ConfigureHttpClientHandler((clientHandler, context) =>
+                        clientHandler.MaxConnectionsPerServer = kubeClientOptions.MaxConnectionsPerServer.Value
+                    );
+#else
+                if (kubeClientOptions.EnableHttp2 || kubeClientOptions.MaxConnectionsPerServer.HasValue)
+                    clientBuilder = clientBuilder.WithSocketsHttpHandler(kubeClientOptions.MaxConnectionsPerServer);
+#endif // NETSTANDARD2_1
+            }
+
+            if (kubeClientOptions.EnableHttp2)
+                clientBuilder = clientBuilder.WithRequestVersion(HttpVersion.Version20);
+
             switch (kubeClientOptions.AuthStrategy)
             {
                 case KubeAuthStrategy.Basic:
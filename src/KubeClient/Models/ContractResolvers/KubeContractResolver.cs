@@ -1,15 +1,22 @@
-﻿using Newtonsoft.Json.Serialization;
+﻿using Newtonsoft.Json;
+using Newtonsoft.Json.Serialization;
 using System;
 using System.Collections.Generic;
 using System.Text;
 
 namespace KubeClient.Models.ContractResolvers
 {
+    using Converters;
+
     /// <summary>
     ///     JSON contract resolver for K8s models.
     /// </summary>
     /// <remarks>
     ///     Preserves casing of dictionary keys, but all other keys are converted to camelCase.
+    ///
+    ///     Model types that have a generated converter (see <see cref="KubeModelConverters"/>) are deserialised using that converter.
+    ///
+    ///     Strings in model properties listed in <see cref="InternedStringProperties"/> are interned when they are deserialised, if string interning has been enabled (see <see cref="KubeStringPool.Shared"/>).
     /// </remarks>
     public class KubeContractResolver
         : CamelCasePropertyNamesContractResolver
@@ -27,5 +34,182 @@ namespace KubeClient.Models.ContractResolvers
         /// <param name="dictionaryKey">The dictionary key.</param>
         /// <returns>The JSON property name.</returns>
         protected override string ResolveDictionaryKey(string dictionaryKey) => dictionaryKey;
+
+        /// <summary>
+        /// Resolve the contract converter (if any) for the specified type.
+        /// </summary>
+        /// <param name="objectType">The type to resolve a contract converter for.</param>
+        /// <returns>The contract converter, or <c>null</c> if the type has no contract converter.</returns>
+        protected override JsonConverter ResolveContractConverter(Type objectType)
+        {
+            JsonConverter contractConverter = base.ResolveContractConverter(objectType);
+            if (contractConverter == null)
+                KubeModelConverters.TryGetConverter(objectType, out contractConverter);
+
+            return contractConverter;
+        }
+
+        /// <summary>
+        /// Create a <see cref="JsonObjectContract"/> for the specified type.
+        /// </summary>
+        /// <param name="objectType">The type to create a contract for.</param>
+        /// <returns>The contract.</returns>
+        /// <remarks>
+        /// String properties whose values are interned get a value provider that interns them; collection properties whose values are interned get a converter that interns their items and keys as they are read (populating the existing collection, if any).
+        /// </remarks>
+        protected override JsonObjectContract CreateObjectContract(Type objectType)
+        {
+            JsonObjectContract contract = base.CreateObjectContract(objectType);
+
+            foreach (JsonProperty property in contract.Properties)
+            {
+                if (property.DeclaringType == null || property.UnderlyingName == null || property.Ignored)
+                    continue;
+
+                InternedStrings internedStrings = InternedStringProperties.GetInternedStrings(property.DeclaringType, property.UnderlyingName);
+                if (internedStrings == InternedStrings.None)
+                    continue;
+
+                if (property.PropertyType == typeof(string))
+                    property.ValueProvider = new InterningValueProvider(property.ValueProvider);
+                else if ((property.PropertyType == typeof(List<string>) || property.PropertyType == typeof(Dictionary<string, string>)) && property.Converter == null)
+                    property.Converter = new InterningCollectionConverter(internedStrings);
+            }
+
+            return contract;
+        }
+
+        /// <summary>
+        /// A value provider that interns string values as they are set.
+        /// </summary>
+        class InterningValueProvider
+            : IValueProvider
+        {
+            /// <summary>
+            /// The underlying value provider.
+            /// </summary>
+            readonly IValueProvider _innerValueProvider;
+
+            /// <summary>
+            /// Create a new <see cref="InterningValueProvider"/>.
+            /// </summary>
+            /// <param name="innerValueProvider">The underlying value provider.</param>
+            public InterningValueProvider(IValueProvider innerValueProvider)
+            {
+                if (innerValueProvider == null)
+                    throw new ArgumentNullException(nameof(innerValueProvider));
+
+                _innerValueProvider = innerValueProvider;
+            }
+
+            /// <summary>
+            /// Get the property's value.
+            /// </summary>
+            /// <param name="target">The target object.</param>
+            /// <returns>The value.</returns>
+            public object GetValue(object target) => _innerValueProvider.GetValue(target);
+
+            /// <summary>
+            /// Set the property's value (interning it, if it is a string).
+            /// </summary>
+            /// <param name="target">The target object.</param>
+            /// <param name="value">The value.</param>
+            public void SetValue(object target, object value)
+            {
+                if (value is string stringValue)
+                    value = KubeStringPool.InternShared(stringValue);
+
+                _innerValueProvider.SetValue(target, value);
+            }
+        }
+
+        /// <summary>
+        /// A JSON converter that interns the strings in a <see cref="List{T}"/> of strings, or a <see cref="Dictionary{TKey, TValue}"/> of strings, as they are read.
+        /// </summary>
+        /// <remarks>
+        /// Newtonsoft.Json populates existing collections in-place (without calling the value provider), so the items are interned as they are added rather than once the object has been deserialised.
+        /// </remarks>
+        class InterningCollectionConverter
+            : JsonConverter
+        {
+            /// <summary>
+            /// The parts of the collection whose strings are interned.
+            /// </summary>
+            readonly InternedStrings _internedStrings;
+
+            /// <summary>
+            /// Create a new <see cref="InterningCollectionConverter"/>.
+            /// </summary>
+            /// <param name="internedStrings">The parts of the collection whose strings are interned.</param>
+            public InterningCollectionConverter(InternedStrings internedStrings)
+            {
+                _internedStrings = internedStrings;
+            }
+
+            /// <summary>
+            /// Collections are written using the default serialisation.
+            /// </summary>
+            public override bool CanWrite => false;
+
+            /// <summary>
+            /// Determine whether the converter can convert the specified type.
+            /// </summary>
+            /// <param name="objectType">The type.</param>
+            /// <returns><c>true</c>, if the type is a list or dictionary of strings; otherwise, <c>false</c>.</returns>
+            public override bool CanConvert(Type objectType) => objectType == typeof(List<string>) || objectType == typeof(Dictionary<string, string>);
+
+            /// <summary>
+            /// Read a collection of strings from JSON, interning them.
+            /// </summary>
+            /// <param name="reader">The JSON reader.</param>
+            /// <param name="objectType">The collection type.</param>
+            /// <param name="existingValue">The existing collection (if any) to populate.</param>
+            /// <param name="serializer">The JSON serialiser.</param>
+            /// <returns>The collection (or <c>null</c>, if the JSON value is <c>null</c>).</returns>
+            public override object ReadJson(JsonReader reader, Type objectType, object existingValue, JsonSerializer serializer)
+            {
+                if (reader.TokenType == JsonToken.Null)
+                    return null;
+
+                KubeStringPool pool = KubeStringPool.Shared;
+                KubeStringPool valuePool = (_internedStrings & InternedStrings.Values) != 0 ? pool : null;
+
+                if (objectType == typeof(List<string>))
+                {
+                    if (reader.TokenType != JsonToken.StartArray)
+                        throw new JsonSerializationException($"Unexpected token '{reader.TokenType}' (expected '{JsonToken.StartArray}').");
+
+                    List<string> list = existingValue as List<string> ?? new List<string>();
+                    for (string item = reader.ReadAsString(); reader.TokenType != JsonToken.EndArray; item = reader.ReadAsString())
+                        list.Add(valuePool != null ? valuePool.Intern(item) : item);
+
+                    return list;
+                }
+
+                if (reader.TokenType != JsonToken.StartObject)
+                    throw new JsonSerializationException($"Unexpected token '{reader.TokenType}' (expected '{JsonToken.StartObject}').");
+
+                KubeStringPool keyPool = (_internedStrings & InternedStrings.DictionaryKeys) != 0 ? pool : null;
+
+                Dictionary<string, string> dictionary = existingValue as Dictionary<string, string> ?? new Dictionary<string, string>();
+                while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+                {
+                    string key = (string)reader.Value;
+                    string value = reader.ReadAsString();
+
+                    dictionary[keyPool != null ? keyPool.Intern(key) : key] = valuePool != null ? valuePool.Intern(value) : value;
+                }
+
+                return dictionary;
+            }
+
+            /// <summary>
+            /// Write a collection of strings to JSON (not supported; see <see cref="CanWrite"/>).
+            /// </summary>
+            /// <param name="writer">The JSON writer.</param>
+            /// <param name="value">The collection.</param>
+            /// <param name="serializer">The JSON serialiser.</param>
+            public override void WriteJson(JsonWriter writer, object value, JsonSerializer serializer) => throw new NotSupportedException();
+        }
     }
 }
@@ -0,0 +1,89 @@
+#if NET8_0_OR_GREATER
+
+using System;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     System.Text.Json converter for <see cref="Int32OrStringV1"/>.
+    /// </summary>
+    public class Int32OrStringV1JsonConverter
+        : JsonConverter<Int32OrStringV1>
+    {
+        /// <summary>
+        ///     Create a new <see cref="Int32OrStringV1JsonConverter"/>.
+        /// </summary>
+        public Int32OrStringV1JsonConverter()
+        {
+        }
+
+        /// <summary>
+        ///     Read (deserialise) an <see cref="Int32OrStringV1"/> from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="Utf8JsonReader"/> to read from.
+        /// </param>
+        /// <param name="typeToConvert">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options.
+        /// </param>
+        /// <returns>
+        ///     The deserialised <see cref="Int32OrStringV1"/>.
+        /// </returns>
+        public override Int32OrStringV1 Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {
+            switch (reader.TokenType)
+            {
+                case JsonTokenType.Null:
+                {
+                    return null;
+                }
+                case JsonTokenType.Number:
+                {
+                    return new Int32OrStringV1(reader.GetInt32());
+                }
+                case JsonTokenType.String:
+                {
+                    return new Int32OrStringV1(reader.GetString());
+                }
+                default:
+                {
+                    throw new JsonException($"Unexpected token type '{reader.TokenType}' for {nameof(Int32OrStringV1)} (expected one of [{JsonTokenType.Null}, {JsonTokenType.Number}, {JsonTokenType.String}]).");
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Write (serialise) an <see cref="Int32OrStringV1"/> to JSON.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="Utf8JsonWriter"/> used to write the JSON.
+        /// </param>
+        /// <param name="value">
+        ///     The value to serialise.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options.
+        /// </param>
+        public override void Write(Utf8JsonWriter writer, Int32OrStringV1 value, JsonSerializerOptions options)
+        {
+            if (writer == null)
+                throw new ArgumentNullException(nameof(writer));
+
+            if (value == null)
+                writer.WriteNullValue();
+            else if (value.IsInt32)
+                writer.WriteNumberValue((int)value);
+            else if (value.IsString)
+                writer.WriteStringValue((string)value);
+            else
+                writer.WriteNullValue();
+        }
+    }
+}
+
+#endif // NET8_0_OR_GREATER
@@ -0,0 +1,742 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.IO;
+
+namespace KubeClient.Models.Converters
+{
+    using ResourceClients;
+
+    /// <summary>
+    ///     The base class for generated binary serialisers (used to write and read local snapshots of Kubernetes resources).
+    /// </summary>
+    /// <remarks>
+    ///     The binary format is compact, but it is not self-describing; values can only be read by a serialiser whose <see cref="SchemaHash"/> matches that of the serialiser that wrote them.
+    /// </remarks>
+    public abstract class KubeModelBinarySerializer
+    {
+        /// <summary>
+        ///     The serialiser used for values that do not have a dedicated binary representation (these are written as JSON).
+        /// </summary>
+        static readonly JsonSerializer JsonSerializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+
+        /// <summary>
+        ///     Create a new <see cref="KubeModelBinarySerializer"/>.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type.
+        /// </param>
+        /// <param name="schemaHash">
+        ///     A hash of the model's schema (its properties and their types, and those of the models it references).
+        /// </param>
+        protected KubeModelBinarySerializer(Type modelType, ulong schemaHash)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            ModelType = modelType;
+            SchemaHash = schemaHash;
+        }
+
+        /// <summary>
+        ///     The model type.
+        /// </summary>
+        public Type ModelType { get; }
+
+        /// <summary>
+        ///     A hash of the model's schema (its properties and their types, and those of the models it references).
+        /// </summary>
+        /// <remarks>
+        ///     Computed by the model generator; if the model changes, so does its schema hash (so data written by a serialiser for an older version of the model can be detected and rejected).
+        /// </remarks>
+        public ulong SchemaHash { get; }
+
+        /// <summary>
+        ///     Write a model.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="model">
+        ///     The model (can be <c>null</c>).
+        /// </param>
+        public abstract void WriteObject(BinaryWriter writer, object model);
+
+        /// <summary>
+        ///     Read a model.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The model (or <c>null</c>, if a <c>null</c> model was written).
+        /// </returns>
+        public abstract object ReadObject(BinaryReader reader);
+
+        /// <summary>
+        ///     Write a <see cref="String"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        protected static void WriteString(BinaryWriter writer, string value)
+        {
+            writer.Write(value != null);
+            if (value != null)
+                writer.Write(value);
+        }
+
+        /// <summary>
+        ///     Read a <see cref="String"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static string ReadString(BinaryReader reader)
+        {
+            if (!reader.ReadBoolean())
+                return null;
+
+            return reader.ReadString();
+        }
+
+        /// <summary>
+        ///     Read a <see cref="String"/> value, and intern it (using <see cref="KubeStringPool.Shared"/>).
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static string ReadInternedString(BinaryReader reader) => KubeStringPool.InternShared(ReadString(reader));
+
+        /// <summary>
+        ///     Write an optional <see cref="Boolean"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        protected static void WriteBoolean(BinaryWriter writer, bool? value)
+        {
+            writer.Write(value.HasValue);
+            if (value.HasValue)
+                writer.Write(value.Value);
+        }
+
+        /// <summary>
+        ///     Read an optional <see cref="Boolean"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static bool? ReadBoolean(BinaryReader reader)
+        {
+            if (!reader.ReadBoolean())
+                return null;
+
+            return reader.ReadBoolean();
+        }
+
+        /// <summary>
+        ///     Write an optional <see cref="Int32"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        protected static void WriteInt32(BinaryWriter writer, int? value)
+        {
+            writer.Write(value.HasValue);
+            if (value.HasValue)
+                writer.Write(value.Value);
+        }
+
+        /// <summary>
+        ///     Read an optional <see cref="Int32"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static int? ReadInt32(BinaryReader reader)
+        {
+            if (!reader.ReadBoolean())
+                return null;
+
+            return reader.ReadInt32();
+        }
+
+        /// <summary>
+        ///     Write an optional <see cref="Int64"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        protected static void WriteInt64(BinaryWriter writer, long? value)
+        {
+            writer.Write(value.HasValue);
+            if (value.HasValue)
+                writer.Write(value.Value);
+        }
+
+        /// <summary>
+        ///     Read an optional <see cref="Int64"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static long? ReadInt64(BinaryReader reader)
+        {
+            if (!reader.ReadBoolean())
+                return null;
+
+            return reader.ReadInt64();
+        }
+
+        /// <summary>
+        ///     Write an optional <see cref="Double"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        protected static void WriteDouble(BinaryWriter writer, double? value)
+        {
+            writer.Write(value.HasValue);
+            if (value.HasValue)
+                writer.Write(value.Value);
+        }
+
+        /// <summary>
+        ///     Read an optional <see cref="Double"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static double? ReadDouble(BinaryReader reader)
+        {
+            if (!reader.ReadBoolean())
+                return null;
+
+            return reader.ReadDouble();
+        }
+
+        /// <summary>
+        ///     Write an optional <see cref="DateTime"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        /// <remarks>
+        ///     The value's <see cref="DateTime.Kind"/> is preserved.
+        /// </remarks>
+        protected static void WriteDateTime(BinaryWriter writer, DateTime? value)
+        {
+            writer.Write(value.HasValue);
+            if (value.HasValue)
+                writer.Write(value.Value.ToBinary());
+        }
+
+        /// <summary>
+        ///     Read an optional <see cref="DateTime"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static DateTime? ReadDateTime(BinaryReader reader)
+        {
+            if (!reader.ReadBoolean())
+                return null;
+
+            return DateTime.FromBinary(reader.ReadInt64());
+        }
+
+        /// <summary>
+        ///     Write an <see cref="Int32OrStringV1"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        protected static void WriteInt32OrString(BinaryWriter writer, Int32OrStringV1 value)
+        {
+            if (value == null)
+            {
+                writer.Write((byte)0);
+
+                return;
+            }
+
+            if (value.IsInt32)
+            {
+                writer.Write((byte)1);
+                writer.Write(value.Int32Value);
+            }
+            else
+            {
+                writer.Write((byte)2);
+                writer.Write(value.StringValue ?? String.Empty);
+            }
+        }
+
+        /// <summary>
+        ///     Read an <see cref="Int32OrStringV1"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static Int32OrStringV1 ReadInt32OrString(BinaryReader reader)
+        {
+            byte valueKind = reader.ReadByte();
+            switch (valueKind)
+            {
+                case 0:
+                {
+                    return null;
+                }
+                case 1:
+                {
+                    return new Int32OrStringV1(reader.ReadInt32());
+                }
+                case 2:
+                {
+                    return new Int32OrStringV1(reader.ReadString());
+                }
+                default:
+                {
+                    throw new InvalidDataException($"Unexpected value kind ({valueKind}) for {nameof(Int32OrStringV1)}.");
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Write an optional <see cref="QuantityResource"/> value.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        /// <remarks>
+        ///     Quantities are written in their canonical string representation (which is re-parsed when they are read).
+        /// </remarks>
+        protected static void WriteQuantity(BinaryWriter writer, QuantityResource? value)
+        {
+            writer.Write(value.HasValue);
+            if (value.HasValue)
+                writer.Write(value.Value.ToString());
+        }
+
+        /// <summary>
+        ///     Read an optional <see cref="QuantityResource"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value (or <c>null</c>).
+        /// </returns>
+        protected static QuantityResource? ReadQuantity(BinaryReader reader)
+        {
+            if (!reader.ReadBoolean())
+                return null;
+
+            return QuantityResource.Parse(reader.ReadString());
+        }
+
+        /// <summary>
+        ///     Write a value as JSON (for values that do not have a dedicated binary representation).
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The value type.
+        /// </typeparam>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="value">
+        ///     The value (can be <c>null</c>).
+        /// </param>
+        protected static void WriteJson<TValue>(BinaryWriter writer, TValue value)
+        {
+            using (StringWriter json = new StringWriter())
+            {
+                JsonSerializer.Serialize(json, value, typeof(TValue));
+
+                writer.Write(json.ToString());
+            }
+        }
+
+        /// <summary>
+        ///     Read a value that was written as JSON.
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The value type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The value.
+        /// </returns>
+        protected static TValue ReadJson<TValue>(BinaryReader reader)
+        {
+            using (JsonTextReader json = new JsonTextReader(new StringReader(reader.ReadString())))
+            {
+                return JsonSerializer.Deserialize<TValue>(json);
+            }
+        }
+
+        /// <summary>
+        ///     Read a value that was written as JSON into an existing object (e.g. a collection).
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <param name="target">
+        ///     The object to populate.
+        /// </param>
+        protected static void ReadJson(BinaryReader reader, object target)
+        {
+            using (JsonTextReader json = new JsonTextReader(new StringReader(reader.ReadString())))
+            {
+                JsonSerializer.Populate(json, target);
+            }
+        }
+
+        /// <summary>
+        ///     Write the items of a list.
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The item type.
+        /// </typeparam>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="list">
+        ///     The list.
+        /// </param>
+        /// <param name="writeItem">
+        ///     A delegate that writes each item.
+        /// </param>
+        protected static void WriteList<TItem>(BinaryWriter writer, List<TItem> list, Action<BinaryWriter, TItem> writeItem)
+        {
+            writer.Write(list.Count);
+            foreach (TItem item in list)
+                writeItem(writer, item);
+        }
+
+        /// <summary>
+        ///     Read items into a list.
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The item type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <param name="list">
+        ///     The list to populate.
+        /// </param>
+        /// <param name="readItem">
+        ///     A delegate that reads each item.
+        /// </param>
+        protected static void ReadList<TItem>(BinaryReader reader, List<TItem> list, Func<BinaryReader, TItem> readItem)
+        {
+            int count = ReadCount(reader);
+            if (list.Capacity < list.Count + count)
+                list.Capacity = list.Count + count;
+
+            for (int itemIndex = 0; itemIndex < count; itemIndex++)
+                list.Add(readItem(reader));
+        }
+
+        /// <summary>
+        ///     Read items into a list of strings.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <param name="list">
+        ///     The list to populate.
+        /// </param>
+        /// <param name="internedStrings">
+        ///     The parts of the list that are interned (using <see cref="KubeStringPool.Shared"/>).
+        /// </param>
+        protected static void ReadStringList(BinaryReader reader, List<string> list, InternedStrings internedStrings = InternedStrings.None)
+        {
+            KubeStringPool pool = (internedStrings & InternedStrings.Values) != 0 ? KubeStringPool.Shared : null;
+
+            int count = ReadCount(reader);
+            if (list.Capacity < list.Count + count)
+                list.Capacity = list.Count + count;
+
+            for (int itemIndex = 0; itemIndex < count; itemIndex++)
+            {
+                string item = ReadString(reader);
+                if (pool != null)
+                    item = pool.Intern(item);
+
+                list.Add(item);
+            }
+        }
+
+        /// <summary>
+        ///     Write the entries of a dictionary.
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The entry value type.
+        /// </typeparam>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="dictionary">
+        ///     The dictionary.
+        /// </param>
+        /// <param name="writeValue">
+        ///     A delegate that writes each entry value.
+        /// </param>
+        protected static void WriteDictionary<TValue>(BinaryWriter writer, Dictionary<string, TValue> dictionary, Action<BinaryWriter, TValue> writeValue)
+        {
+            writer.Write(dictionary.Count);
+            foreach (KeyValuePair<string, TValue> entry in dictionary)
+            {
+                writer.Write(entry.Key);
+                writeValue(writer, entry.Value);
+            }
+        }
+
+        /// <summary>
+        ///     Read entries into a dictionary.
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The entry value type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <param name="dictionary">
+        ///     The dictionary to populate.
+        /// </param>
+        /// <param name="readValue">
+        ///     A delegate that reads each entry value.
+        /// </param>
+        protected static void ReadDictionary<TValue>(BinaryReader reader, Dictionary<string, TValue> dictionary, Func<BinaryReader, TValue> readValue)
+        {
+            int count = ReadCount(reader);
+            for (int entryIndex = 0; entryIndex < count; entryIndex++)
+            {
+                string key = reader.ReadString();
+                dictionary[key] = readValue(reader);
+            }
+        }
+
+        /// <summary>
+        ///     Read entries into a dictionary of strings.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <param name="dictionary">
+        ///     The dictionary to populate.
+        /// </param>
+        /// <param name="internedStrings">
+        ///     The parts of the dictionary that are interned (using <see cref="KubeStringPool.Shared"/>).
+        /// </param>
+        protected static void ReadStringDictionary(BinaryReader reader, Dictionary<string, string> dictionary, InternedStrings internedStrings = InternedStrings.None)
+        {
+            KubeStringPool pool = KubeStringPool.Shared;
+            bool internKeys = pool != null && (internedStrings & InternedStrings.DictionaryKeys) != 0;
+            bool internValues = pool != null && (internedStrings & InternedStrings.Values) != 0;
+
+            int count = ReadCount(reader);
+            for (int entryIndex = 0; entryIndex < count; entryIndex++)
+            {
+                string key = reader.ReadString();
+                if (internKeys)
+                    key = pool.Intern(key);
+
+                string value = ReadString(reader);
+                if (internValues)
+                    value = pool.Intern(value);
+
+                dictionary[key] = value;
+            }
+        }
+
+        /// <summary>
+        ///     Read the number of items in a collection.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The item count.
+        /// </returns>
+        /// <remarks>
+        ///     Every item occupies at least 1 byte, so (if the underlying stream is seekable) a count greater than the number of bytes remaining in the stream is rejected before any storage is allocated for the items.
+        /// </remarks>
+        /// <exception cref="InvalidDataException">
+        ///     The count is negative, or greater than the number of bytes remaining in the stream.
+        /// </exception>
+        internal static int ReadCount(BinaryReader reader)
+        {
+            int count = reader.ReadInt32();
+            if (count < 0)
+                throw new InvalidDataException($"Invalid collection item count ({count}).");
+
+            Stream stream = reader.BaseStream;
+            if (stream.CanSeek && count > stream.Length - stream.Position)
+                throw new InvalidDataException($"Invalid collection item count ({count}); only {stream.Length - stream.Position} byte(s) remain.");
+
+            return count;
+        }
+    }
+
+    /// <summary>
+    ///     The base class for generated binary serialisers for a specific model type.
+    /// </summary>
+    /// <typeparam name="TModel">
+    ///     The model type.
+    /// </typeparam>
+    public abstract class KubeModelBinarySerializer<TModel>
+        : KubeModelBinarySerializer
+        where TModel : class, new()
+    {
+        /// <summary>
+        ///     Create a new <see cref="KubeModelBinarySerializer{TModel}"/>.
+        /// </summary>
+        /// <param name="schemaHash">
+        ///     A hash of the model's schema (its properties and their types, and those of the models it references).
+        /// </param>
+        protected KubeModelBinarySerializer(ulong schemaHash)
+            : base(typeof(TModel), schemaHash)
+        {
+        }
+
+        /// <summary>
+        ///     Write a model.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="model">
+        ///     The model (can be <c>null</c>).
+        /// </param>
+        public void Write(BinaryWriter writer, TModel model)
+        {
+            if (writer == null)
+                throw new ArgumentNullException(nameof(writer));
+
+            writer.Write(model != null);
+            if (model != null)
+                WriteProperties(writer, model);
+        }
+
+        /// <summary>
+        ///     Read a model.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The model (or <c>null</c>, if a <c>null</c> model was written).
+        /// </returns>
+        public TModel Read(BinaryReader reader)
+        {
+            if (reader == null)
+                throw new ArgumentNullException(nameof(reader));
+
+            if (!reader.ReadBoolean())
+                return null;
+
+            TModel model = new TModel();
+            ReadProperties(reader, model);
+
+            return model;
+        }
+
+        /// <summary>
+        ///     Write a model.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="model">
+        ///     The model (can be <c>null</c>).
+        /// </param>
+        public override void WriteObject(BinaryWriter writer, object model) => Write(writer, (TModel)model);
+
+        /// <summary>
+        ///     Read a model.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <returns>
+        ///     The model (or <c>null</c>, if a <c>null</c> model was written).
+        /// </returns>
+        public override object ReadObject(BinaryReader reader) => Read(reader);
+
+        /// <summary>
+        ///     Write the values of the model's properties.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="BinaryWriter"/> to write to.
+        /// </param>
+        /// <param name="model">
+        ///     The model.
+        /// </param>
+        protected abstract void WriteProperties(BinaryWriter writer, TModel model);
+
+        /// <summary>
+        ///     Read the values of the model's properties.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="BinaryReader"/> to read from.
+        /// </param>
+        /// <param name="model">
+        ///     The model being populated.
+        /// </param>
+        protected abstract void ReadProperties(BinaryReader reader, TModel model);
+    }
+}
@@ -0,0 +1,74 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     Generated binary serialisers for model types that are commonly watched (and cached in local snapshots).
+    /// </summary>
+    /// <remarks>
+    ///     Model types are selected by the model generator's allow-list (together with all model types they reference).
+    /// </remarks>
+    public static partial class KubeModelBinarySerializers
+    {
+        /// <summary>
+        ///     Build the serialiser lookup from the generated serialiser table.
+        /// </summary>
+        /// <remarks>
+        ///     Done in the static constructor (rather than field initialisers) because the order in which static fields are initialised across partial class declarations is undefined.
+        /// </remarks>
+        static KubeModelBinarySerializers()
+        {
+            Register(GeneratedSerializers);
+        }
+
+        /// <summary>
+        ///     Generated serialisers, keyed by model type.
+        /// </summary>
+        static readonly ConcurrentDictionary<Type, KubeModelBinarySerializer> Serializers = new ConcurrentDictionary<Type, KubeModelBinarySerializer>();
+
+        /// <summary>
+        ///     Model types that have a generated binary serialiser.
+        /// </summary>
+        public static IEnumerable<Type> ModelTypes => Serializers.Keys;
+
+        /// <summary>
+        ///     Get the generated binary serialiser (if any) for the specified model type.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type.
+        /// </param>
+        /// <param name="serializer">
+        ///     Receives the serialiser.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="modelType"/> has a generated binary serialiser; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool TryGetSerializer(Type modelType, out KubeModelBinarySerializer serializer)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            return Serializers.TryGetValue(modelType, out serializer);
+        }
+
+        /// <summary>
+        ///     Add serialisers to the serialiser lookup.
+        /// </summary>
+        /// <param name="serializers">
+        ///     The serialisers, with their model types.
+        /// </param>
+        /// <remarks>
+        ///     Used to add the serialisers from a <see cref="KubeModelPartition"/>, when it is registered.
+        /// </remarks>
+        internal static void Register(IEnumerable<(Type modelType, KubeModelBinarySerializer serializer)> serializers)
+        {
+            if (serializers == null)
+                throw new ArgumentNullException(nameof(serializers));
+
+            foreach ((Type modelType, KubeModelBinarySerializer serializer) in serializers)
+                Serializers[modelType] = serializer;
+        }
+    }
+}
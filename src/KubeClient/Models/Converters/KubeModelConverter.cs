@@ -0,0 +1,692 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     The base class for generated (streaming) JSON converters for model types.
+    /// </summary>
+    /// <typeparam name="TModel">
+    ///     The model type.
+    /// </typeparam>
+    /// <remarks>
+    ///     Derived converters read each property using a <c>switch</c> on the property name (rather than resolving a contract, and then a value provider, for each property).
+    ///
+    ///     Deserialisation semantics are equivalent to those of the contract-based path used by <see cref="ContractResolvers.KubeContractResolver"/>:
+    ///     existing collections are populated (<see cref="ObjectCreationHandling.Reuse"/>), null values for optional properties are ignored (<see cref="NullValueHandling.Ignore"/>), and property names are matched case-insensitively if there is no exact match.
+    /// </remarks>
+    public abstract class KubeModelConverter<TModel>
+        : JsonConverter
+        where TModel : class, new()
+    {
+        /// <summary>
+        ///     The CLR <see cref="Type"/> corresponding to <typeparamref name="TModel"/>.
+        /// </summary>
+        static readonly Type ModelType = typeof(TModel);
+
+        /// <summary>
+        ///     The JSON names of the model's properties, keyed case-insensitively.
+        /// </summary>
+        readonly Dictionary<string, string> _propertyNames = new Dictionary<string, string>(StringComparer.OrdinalIgnoreCase);
+
+        /// <summary>
+        ///     Create a new <see cref="KubeModelConverter{TModel}"/>.
+        /// </summary>
+        /// <param name="propertyNames">
+        ///     The JSON names of the model's properties.
+        /// </param>
+        protected KubeModelConverter(params string[] propertyNames)
+        {
+            if (propertyNames == null)
+                throw new ArgumentNullException(nameof(propertyNames));
+
+            foreach (string propertyName in propertyNames)
+            {
+                if (!_propertyNames.ContainsKey(propertyName))
+                    _propertyNames.Add(propertyName, propertyName);
+            }
+        }
+
+        /// <summary>
+        ///     Determine wither the converter can convert an object of the specified type to / from JSON.
+        /// </summary>
+        /// <param name="objectType">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the converter can convert an object of the specified type; otherwise, <c>false</c>.
+        /// </returns>
+        public override bool CanConvert(Type objectType) => objectType == ModelType;
+
+        /// <summary>
+        /// This converter only supports deserialisation (not serialisation).
+        /// </summary>
+        public override bool CanWrite => false;
+
+        /// <summary>
+        ///     Read (deserialise) an object from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> representing the JSON to read from.
+        /// </param>
+        /// <param name="objectType">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <param name="existingValue">
+        ///     The existing value (if any) to populate.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        /// <returns>
+        ///     The deserialised object.
+        /// </returns>
+        public override object ReadJson(JsonReader reader, Type objectType, object existingValue, JsonSerializer serializer)
+        {
+            if (reader == null)
+                throw new ArgumentNullException(nameof(reader));
+
+            if (objectType == null)
+                throw new ArgumentNullException(nameof(objectType));
+
+            if (serializer == null)
+                throw new ArgumentNullException(nameof(serializer));
+
+            if (objectType != ModelType)
+                throw new NotSupportedException($"{GetType().FullName} cannot deserialise a value of type '{objectType.FullName}'.");
+
+            return Read(reader, existingValue as TModel, serializer);
+        }
+
+        /// <summary>
+        ///     Write (serialise) an object to JSON.
+        /// </summary>
+        /// <param name="writer">
+        ///     A <see cref="JsonWriter"/> used to write the JSON.
+        /// </param>
+        /// <param name="value">
+        ///     The value to serialise.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested serialisation.
+        /// </param>
+        public override void WriteJson(JsonWriter writer, object value, JsonSerializer serializer)
+        {
+            if (writer == null)
+                throw new ArgumentNullException(nameof(writer));
+
+            if (serializer == null)
+                throw new ArgumentNullException(nameof(serializer));
+
+            throw new NotSupportedException("This converter only supports deserialisation (not serialisation).");
+        }
+
+        /// <summary>
+        ///     Read (deserialise) a model from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the model's first token.
+        /// </param>
+        /// <param name="existingValue">
+        ///     An optional existing model to populate.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        /// <returns>
+        ///     The model, or <c>null</c> if the JSON value is null.
+        /// </returns>
+        public TModel Read(JsonReader reader, TModel existingValue, JsonSerializer serializer)
+        {
+            if (reader == null)
+                throw new ArgumentNullException(nameof(reader));
+
+            if (serializer == null)
+                throw new ArgumentNullException(nameof(serializer));
+
+            if (reader.TokenType == JsonToken.Null)
+                return null;
+
+            if (reader.TokenType != JsonToken.StartObject)
+                throw new JsonSerializationException($"Unexpected token type '{reader.TokenType}' for {ModelType.Name} (expected one of [{JsonToken.Null}, {JsonToken.StartObject}]). Path '{reader.Path}'.");
+
+            TModel model = existingValue ?? new TModel();
+
+            while (reader.Read())
+            {
+                switch (reader.TokenType)
+                {
+                    case JsonToken.PropertyName:
+                    {
+                        string propertyName = (string)reader.Value;
+                        if (ReadProperty(model, propertyName, reader, serializer))
+                            break;
+
+                        // Fall back to case-insensitive matching (like the contract-based path).
+                        if (_propertyNames.TryGetValue(propertyName, out string jsonPropertyName) && ReadProperty(model, jsonPropertyName, reader, serializer))
+                            break;
+
+                        ReadUnknownProperty(model, propertyName, reader, serializer);
+
+                        break;
+                    }
+                    case JsonToken.Comment:
+                    {
+                        break;
+                    }
+                    case JsonToken.EndObject:
+                    {
+                        return model;
+                    }
+                    default:
+                    {
+                        throw new JsonSerializationException($"Unexpected token type '{reader.TokenType}' for {ModelType.Name} (expected one of [{JsonToken.PropertyName}, {JsonToken.EndObject}]). Path '{reader.Path}'.");
+                    }
+                }
+            }
+
+            throw new JsonSerializationException($"Unexpected end of JSON while reading {ModelType.Name}. Path '{reader.Path}'.");
+        }
+
+        /// <summary>
+        ///     Read the value of a model property.
+        /// </summary>
+        /// <param name="model">
+        ///     The model being populated.
+        /// </param>
+        /// <param name="propertyName">
+        ///     The property's JSON name.
+        /// </param>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the property was recognised (and its value has been read); otherwise, <c>false</c> (and the reader has not been advanced).
+        /// </returns>
+        protected abstract bool ReadProperty(TModel model, string propertyName, JsonReader reader, JsonSerializer serializer);
+
+        /// <summary>
+        ///     Read the value of a property that does not correspond to any property defined on the model.
+        /// </summary>
+        /// <param name="model">
+        ///     The model being populated.
+        /// </param>
+        /// <param name="propertyName">
+        ///     The property's JSON name.
+        /// </param>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        /// <remarks>
+        ///     By default, the value is skipped (unless the serialiser's <see cref="JsonSerializer.MissingMemberHandling"/> is <see cref="MissingMemberHandling.Error"/>).
+        /// </remarks>
+        protected virtual void ReadUnknownProperty(TModel model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            if (serializer.MissingMemberHandling == MissingMemberHandling.Error)
+                throw new JsonSerializationException($"Could not find member '{propertyName}' on object of type '{ModelType.Name}'. Path '{reader.Path}'.");
+
+            reader.Skip();
+        }
+
+        /// <summary>
+        ///     Read a nested model (using its generated converter).
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The nested model type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="converter">
+        ///     The converter for the nested model type.
+        /// </param>
+        /// <param name="existingValue">
+        ///     The property's existing value (if any) which, like <see cref="ObjectCreationHandling.Auto"/>, is populated rather than replaced.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        /// <returns>
+        ///     The model, or <c>null</c> if the JSON value is null.
+        /// </returns>
+        protected static TValue ReadModel<TValue>(JsonReader reader, KubeModelConverter<TValue> converter, TValue existingValue, JsonSerializer serializer)
+            where TValue : class, new()
+        {
+            ReadValueToken(reader);
+
+            return converter.Read(reader, existingValue, serializer);
+        }
+
+        /// <summary>
+        ///     Read a value (using the serialiser).
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The value type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> used to deserialise the value.
+        /// </param>
+        /// <returns>
+        ///     The value.
+        /// </returns>
+        protected static TValue ReadValue<TValue>(JsonReader reader, JsonSerializer serializer)
+        {
+            ReadValueToken(reader);
+
+            return serializer.Deserialize<TValue>(reader);
+        }
+
+        /// <summary>
+        ///     Read an <see cref="Int64"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> used to deserialise values that are not represented as integers.
+        /// </param>
+        /// <returns>
+        ///     The value, or <c>null</c> if the JSON value is null.
+        /// </returns>
+        protected static long? ReadAsInt64(JsonReader reader, JsonSerializer serializer)
+        {
+            ReadValueToken(reader);
+
+            switch (reader.TokenType)
+            {
+                case JsonToken.Null:
+                {
+                    return null;
+                }
+                case JsonToken.Integer when reader.Value is long value:
+                {
+                    return value;
+                }
+                default:
+                {
+                    return serializer.Deserialize<long?>(reader);
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Read a <see cref="QuantityResource"/> value (parsing it once, as it is read).
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> (unused, since quantities are always represented as strings or numbers).
+        /// </param>
+        /// <returns>
+        ///     The value, or <c>null</c> if the JSON value is null.
+        /// </returns>
+        protected static QuantityResource? ReadQuantity(JsonReader reader, JsonSerializer serializer)
+        {
+            ReadValueToken(reader);
+
+            if (reader.TokenType == JsonToken.Null)
+                return null;
+
+            return QuantityResourceConverter.ReadQuantity(reader);
+        }
+
+        /// <summary>
+        ///     Read an <see cref="Int32OrStringV1"/> value.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> used to deserialise values that are not represented as integers or strings.
+        /// </param>
+        /// <returns>
+        ///     The value, or <c>null</c> if the JSON value is null.
+        /// </returns>
+        protected static Int32OrStringV1 ReadInt32OrString(JsonReader reader, JsonSerializer serializer)
+        {
+            ReadValueToken(reader);
+
+            switch (reader.TokenType)
+            {
+                case JsonToken.Null:
+                {
+                    return null;
+                }
+                case JsonToken.Integer:
+                {
+                    return new Int32OrStringV1((int)(long)reader.Value);
+                }
+                case JsonToken.String:
+                {
+                    return new Int32OrStringV1((string)reader.Value);
+                }
+                default:
+                {
+                    return serializer.Deserialize<Int32OrStringV1>(reader);
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Read a <see cref="String"/> value, and intern it (see <see cref="KubeStringPool.Shared"/>).
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <returns>
+        ///     The (interned) value, or <c>null</c> if the JSON value is null.
+        /// </returns>
+        protected static string ReadAsInternedString(JsonReader reader) => KubeStringPool.InternShared(reader.ReadAsString());
+
+        /// <summary>
+        ///     Ensure that a value read for a required (non-nullable) property is not null.
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The property type.
+        /// </typeparam>
+        /// <param name="value">
+        ///     The value that was read.
+        /// </param>
+        /// <param name="reader">
+        ///     The <see cref="JsonReader"/> that the value was read from.
+        /// </param>
+        /// <returns>
+        ///     The value.
+        /// </returns>
+        protected static TValue RequiredValue<TValue>(TValue? value, JsonReader reader)
+            where TValue : struct
+        {
+            if (value == null)
+                throw new JsonSerializationException($"Error converting value {{null}} to type '{typeof(TValue).FullName}'. Path '{reader.Path}'.");
+
+            return value.Value;
+        }
+
+        /// <summary>
+        ///     Handle a (possibly null) value read for a property inherited from a model base class (whose null-value handling is determined by the serialiser).
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The property type.
+        /// </typeparam>
+        /// <param name="value">
+        ///     The value that was read.
+        /// </param>
+        /// <param name="existingValue">
+        ///     The property's existing value.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> whose <see cref="JsonSerializer.NullValueHandling"/> applies to the property.
+        /// </param>
+        /// <returns>
+        ///     The property's new value.
+        /// </returns>
+        protected static TValue InheritedValue<TValue>(TValue value, TValue existingValue, JsonSerializer serializer)
+            where TValue : class
+        {
+            if (value == null && serializer.NullValueHandling == NullValueHandling.Ignore)
+                return existingValue;
+
+            return value;
+        }
+
+        /// <summary>
+        ///     Read items into a list of strings.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="list">
+        ///     The list to populate.
+        /// </param>
+        /// <param name="internedStrings">
+        ///     The parts of the list (if any) whose strings are interned (see <see cref="KubeStringPool.Shared"/>).
+        /// </param>
+        protected static void ReadStringList(JsonReader reader, List<string> list, InternedStrings internedStrings = InternedStrings.None)
+        {
+            if (!ReadStartToken(reader, JsonToken.StartArray))
+                return;
+
+            KubeStringPool pool = (internedStrings & InternedStrings.Values) != 0 ? KubeStringPool.Shared : null;
+
+            while (true)
+            {
+                string item = reader.ReadAsString();
+                if (reader.TokenType == JsonToken.EndArray)
+                    return;
+
+                if (pool != null)
+                    item = pool.Intern(item);
+
+                list.Add(item);
+            }
+        }
+
+        /// <summary>
+        ///     Read items into a list of models (using their generated converter).
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The item model type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="itemConverter">
+        ///     The converter for the item model type.
+        /// </param>
+        /// <param name="list">
+        ///     The list to populate.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        protected static void ReadModelList<TItem>(JsonReader reader, KubeModelConverter<TItem> itemConverter, List<TItem> list, JsonSerializer serializer)
+            where TItem : class, new()
+        {
+            if (!ReadStartToken(reader, JsonToken.StartArray))
+                return;
+
+            while (ReadValueToken(reader) != JsonToken.EndArray)
+                list.Add(itemConverter.Read(reader, null, serializer));
+        }
+
+        /// <summary>
+        ///     Read items into a list (using the serialiser).
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The item type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="list">
+        ///     The list to populate.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> used to deserialise the items.
+        /// </param>
+        protected static void ReadList<TItem>(JsonReader reader, List<TItem> list, JsonSerializer serializer)
+        {
+            if (!ReadStartToken(reader, JsonToken.StartArray))
+                return;
+
+            while (ReadValueToken(reader) != JsonToken.EndArray)
+                list.Add(serializer.Deserialize<TItem>(reader));
+        }
+
+        /// <summary>
+        ///     Read entries into a dictionary of strings.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="dictionary">
+        ///     The dictionary to populate.
+        /// </param>
+        /// <param name="internedStrings">
+        ///     The parts of the dictionary (if any) whose strings are interned (see <see cref="KubeStringPool.Shared"/>).
+        /// </param>
+        protected static void ReadStringDictionary(JsonReader reader, Dictionary<string, string> dictionary, InternedStrings internedStrings = InternedStrings.None)
+        {
+            if (!ReadStartToken(reader, JsonToken.StartObject))
+                return;
+
+            KubeStringPool pool = KubeStringPool.Shared;
+            if (pool == null || internedStrings == InternedStrings.None)
+            {
+                string key;
+                while ((key = ReadDictionaryKey(reader)) != null)
+                    dictionary[key] = reader.ReadAsString();
+            }
+            else
+            {
+                bool internKeys = (internedStrings & InternedStrings.DictionaryKeys) != 0;
+                bool internValues = (internedStrings & InternedStrings.Values) != 0;
+
+                string key;
+                while ((key = ReadDictionaryKey(reader)) != null)
+                {
+                    if (internKeys)
+                        key = pool.Intern(key);
+
+                    string value = reader.ReadAsString();
+                    if (internValues)
+                        value = pool.Intern(value);
+
+                    dictionary[key] = value;
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Read entries into a dictionary of models (using their generated converter).
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The value model type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="valueConverter">
+        ///     The converter for the value model type.
+        /// </param>
+        /// <param name="dictionary">
+        ///     The dictionary to populate.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        protected static void ReadModelDictionary<TValue>(JsonReader reader, KubeModelConverter<TValue> valueConverter, Dictionary<string, TValue> dictionary, JsonSerializer serializer)
+            where TValue : class, new()
+        {
+            if (!ReadStartToken(reader, JsonToken.StartObject))
+                return;
+
+            string key;
+            while ((key = ReadDictionaryKey(reader)) != null)
+                dictionary[key] = ReadModel(reader, valueConverter, null, serializer);
+        }
+
+        /// <summary>
+        ///     Read entries into a dictionary (using the serialiser).
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The value type.
+        /// </typeparam>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="dictionary">
+        ///     The dictionary to populate.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> used to deserialise the values.
+        /// </param>
+        protected static void ReadDictionary<TValue>(JsonReader reader, Dictionary<string, TValue> dictionary, JsonSerializer serializer)
+        {
+            if (!ReadStartToken(reader, JsonToken.StartObject))
+                return;
+
+            string key;
+            while ((key = ReadDictionaryKey(reader)) != null)
+                dictionary[key] = ReadValue<TValue>(reader, serializer);
+        }
+
+        /// <summary>
+        ///     Advance the reader to the next value token (skipping comments).
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="JsonReader"/>.
+        /// </param>
+        /// <returns>
+        ///     The type of the token that the reader is now positioned on.
+        /// </returns>
+        static JsonToken ReadValueToken(JsonReader reader)
+        {
+            do
+            {
+                if (!reader.Read())
+                    throw new JsonSerializationException($"Unexpected end of JSON while reading {ModelType.Name}. Path '{reader.Path}'.");
+            }
+            while (reader.TokenType == JsonToken.Comment);
+
+            return reader.TokenType;
+        }
+
+        /// <summary>
+        ///     Advance the reader to the start of a collection value.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the property name.
+        /// </param>
+        /// <param name="startToken">
+        ///     The expected start token (<see cref="JsonToken.StartArray"/> or <see cref="JsonToken.StartObject"/>).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the reader is positioned on the expected start token; <c>false</c>, if the value is null (in which case the existing collection is left as-is).
+        /// </returns>
+        static bool ReadStartToken(JsonReader reader, JsonToken startToken)
+        {
+            JsonToken tokenType = ReadValueToken(reader);
+            if (tokenType == JsonToken.Null)
+                return false;
+
+            if (tokenType != startToken)
+                throw new JsonSerializationException($"Unexpected token type '{tokenType}' while reading {ModelType.Name} (expected one of [{JsonToken.Null}, {startToken}]). Path '{reader.Path}'.");
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Advance the reader to the next dictionary key.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the dictionary's start token (or its previous value).
+        /// </param>
+        /// <returns>
+        ///     The key, or <c>null</c> if the reader has reached the end of the dictionary.
+        /// </returns>
+        static string ReadDictionaryKey(JsonReader reader)
+        {
+            JsonToken tokenType = ReadValueToken(reader);
+            if (tokenType == JsonToken.EndObject)
+                return null;
+
+            if (tokenType != JsonToken.PropertyName)
+                throw new JsonSerializationException($"Unexpected token type '{tokenType}' while reading {ModelType.Name} (expected one of [{JsonToken.PropertyName}, {JsonToken.EndObject}]). Path '{reader.Path}'.");
+
+            return Convert.ToString(reader.Value, CultureInfo.InvariantCulture);
+        }
+    }
+}
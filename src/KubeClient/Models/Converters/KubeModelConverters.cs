@@ -0,0 +1,75 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     Generated (streaming) JSON converters for frequently-deserialised model types.
+    /// </summary>
+    /// <remarks>
+    ///     Model types are selected by the model generator's allow-list (together with all model types they reference).
+    /// </remarks>
+    public static partial class KubeModelConverters
+    {
+        /// <summary>
+        ///     Build the converter lookup from the generated converter table.
+        /// </summary>
+        /// <remarks>
+        ///     Done in the static constructor (rather than field initialisers) because the order in which static fields are initialised across partial class declarations is undefined.
+        /// </remarks>
+        static KubeModelConverters()
+        {
+            Register(GeneratedConverters);
+        }
+
+        /// <summary>
+        ///     Generated converters, keyed by model type.
+        /// </summary>
+        static readonly ConcurrentDictionary<Type, JsonConverter> Converters = new ConcurrentDictionary<Type, JsonConverter>();
+
+        /// <summary>
+        ///     Model types that have a generated converter.
+        /// </summary>
+        public static IEnumerable<Type> ModelTypes => Converters.Keys;
+
+        /// <summary>
+        ///     Get the generated converter (if any) for the specified model type.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type.
+        /// </param>
+        /// <param name="converter">
+        ///     Receives the converter.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="modelType"/> has a generated converter; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool TryGetConverter(Type modelType, out JsonConverter converter)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            return Converters.TryGetValue(modelType, out converter);
+        }
+
+        /// <summary>
+        ///     Add converters to the converter lookup.
+        /// </summary>
+        /// <param name="converters">
+        ///     The converters, with their model types.
+        /// </param>
+        /// <remarks>
+        ///     Used to add the converters from a <see cref="KubeModelPartition"/>, when it is registered.
+        /// </remarks>
+        internal static void Register(IEnumerable<(Type modelType, JsonConverter converter)> converters)
+        {
+            if (converters == null)
+                throw new ArgumentNullException(nameof(converters));
+
+            foreach ((Type modelType, JsonConverter converter) in converters)
+                Converters[modelType] = converter;
+        }
+    }
+}
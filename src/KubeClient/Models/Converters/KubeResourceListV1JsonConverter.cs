@@ -0,0 +1,190 @@
+#if NET8_0_OR_GREATER
+
+using System;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     System.Text.Json converter for resource lists (derived from <see cref="KubeResourceListV1{TResource}"/>).
+    /// </summary>
+    /// <typeparam name="TResourceList">
+    ///     The resource-list model type.
+    /// </typeparam>
+    /// <typeparam name="TResource">
+    ///     The resource model type.
+    /// </typeparam>
+    /// <remarks>
+    ///     Resource lists implement <see cref="System.Collections.Generic.IEnumerable{T}"/>, so System.Text.Json would otherwise treat them as JSON arrays (rather than objects).
+    /// </remarks>
+    public class KubeResourceListV1JsonConverter<TResourceList, TResource>
+        : JsonConverter<TResourceList>
+        where TResourceList : KubeResourceListV1<TResource>, new()
+        where TResource : KubeResourceV1
+    {
+        /// <summary>
+        ///     Create a new <see cref="KubeResourceListV1JsonConverter{TResourceList, TResource}"/>.
+        /// </summary>
+        public KubeResourceListV1JsonConverter()
+        {
+        }
+
+        /// <summary>
+        ///     Read (deserialise) a resource list from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="Utf8JsonReader"/> to read from.
+        /// </param>
+        /// <param name="typeToConvert">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options (used to resolve metadata for the list's metadata and items).
+        /// </param>
+        /// <returns>
+        ///     The deserialised resource list.
+        /// </returns>
+        public override TResourceList Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {
+            if (options == null)
+                throw new ArgumentNullException(nameof(options));
+
+            if (reader.TokenType != JsonTokenType.StartObject)
+                throw new JsonException($"Unexpected token type '{reader.TokenType}' for {typeof(TResourceList).Name} (expected {JsonTokenType.StartObject}).");
+
+            var resourceList = new TResourceList();
+
+            while (reader.Read())
+            {
+                if (reader.TokenType == JsonTokenType.EndObject)
+                    return resourceList;
+
+                if (reader.TokenType != JsonTokenType.PropertyName)
+                    throw new JsonException($"Unexpected token type '{reader.TokenType}' for {typeof(TResourceList).Name} (expected {JsonTokenType.PropertyName}).");
+
+                if (reader.ValueTextEquals("items"))
+                {
+                    reader.Read();
+                    ReadItems(ref reader, resourceList, GetTypeInfo<TResource>(options));
+                }
+                else if (reader.ValueTextEquals("metadata"))
+                {
+                    reader.Read();
+                    resourceList.Metadata = JsonSerializer.Deserialize(ref reader, GetTypeInfo<ListMetaV1>(options));
+                }
+                else if (reader.ValueTextEquals("kind"))
+                {
+                    reader.Read();
+                    resourceList.Kind = reader.GetString();
+                }
+                else if (reader.ValueTextEquals("apiVersion"))
+                {
+                    reader.Read();
+                    resourceList.ApiVersion = reader.GetString();
+                }
+                else
+                {
+                    reader.Read();
+                    reader.Skip();
+                }
+            }
+
+            throw new JsonException($"Unexpected end of JSON while reading {typeof(TResourceList).Name}.");
+        }
+
+        /// <summary>
+        ///     Write (serialise) a resource list to JSON.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="Utf8JsonWriter"/> used to write the JSON.
+        /// </param>
+        /// <param name="value">
+        ///     The resource list to serialise.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options (used to resolve metadata for the list's metadata and items).
+        /// </param>
+        public override void Write(Utf8JsonWriter writer, TResourceList value, JsonSerializerOptions options)
+        {
+            if (writer == null)
+                throw new ArgumentNullException(nameof(writer));
+
+            if (value == null)
+                throw new ArgumentNullException(nameof(value));
+
+            if (options == null)
+                throw new ArgumentNullException(nameof(options));
+
+            writer.WriteStartObject();
+
+            if (value.Kind != null)
+                writer.WriteString("kind", value.Kind);
+
+            if (value.ApiVersion != null)
+                writer.WriteString("apiVersion", value.ApiVersion);
+
+            if (value.Metadata != null)
+            {
+                writer.WritePropertyName("metadata");
+                JsonSerializer.Serialize(writer, value.Metadata, GetTypeInfo<ListMetaV1>(options));
+            }
+
+            writer.WritePropertyName("items");
+            writer.WriteStartArray();
+
+            JsonTypeInfo<TResource> itemTypeInfo = GetTypeInfo<TResource>(options);
+            foreach (TResource item in value.Items)
+                JsonSerializer.Serialize(writer, item, itemTypeInfo);
+
+            writer.WriteEndArray();
+
+            writer.WriteEndObject();
+        }
+
+        /// <summary>
+        ///     Read the list's items from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="Utf8JsonReader"/> (positioned on the value of the "items" property).
+        /// </param>
+        /// <param name="resourceList">
+        ///     The resource list to which items will be added.
+        /// </param>
+        /// <param name="itemTypeInfo">
+        ///     Serialisation metadata for the item type.
+        /// </param>
+        static void ReadItems(ref Utf8JsonReader reader, TResourceList resourceList, JsonTypeInfo<TResource> itemTypeInfo)
+        {
+            if (reader.TokenType == JsonTokenType.Null)
+                return;
+
+            if (reader.TokenType != JsonTokenType.StartArray)
+                throw new JsonException($"Unexpected token type '{reader.TokenType}' for {typeof(TResourceList).Name}.Items (expected one of [{JsonTokenType.Null}, {JsonTokenType.StartArray}]).");
+
+            while (reader.Read() && reader.TokenType != JsonTokenType.EndArray)
+            {
+                resourceList.Items.Add(
+                    JsonSerializer.Deserialize(ref reader, itemTypeInfo)
+                );
+            }
+        }
+
+        /// <summary>
+        ///     Get serialisation metadata for the specified type.
+        /// </summary>
+        /// <typeparam name="T">
+        ///     The target type.
+        /// </typeparam>
+        /// <param name="options">
+        ///     The serialiser options.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="JsonTypeInfo{T}"/>.
+        /// </returns>
+        static JsonTypeInfo<T> GetTypeInfo<T>(JsonSerializerOptions options) => (JsonTypeInfo<T>)options.GetTypeInfo(typeof(T));
+    }
+}
+
+#endif // NET8_0_OR_GREATER
@@ -0,0 +1,85 @@
+#if NET8_0_OR_GREATER
+
+using System;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     System.Text.Json converter for <see cref="MicroTimeV1"/>.
+    /// </summary>
+    public class MicroTimeV1JsonConverter
+        : JsonConverter<MicroTimeV1>
+    {
+        /// <summary>
+        ///     Create a new <see cref="MicroTimeV1JsonConverter"/>.
+        /// </summary>
+        public MicroTimeV1JsonConverter()
+        {
+        }
+
+        /// <summary>
+        ///     Read (deserialise) a <see cref="MicroTimeV1"/> from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="Utf8JsonReader"/> to read from.
+        /// </param>
+        /// <param name="typeToConvert">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options.
+        /// </param>
+        /// <returns>
+        ///     The deserialised <see cref="MicroTimeV1"/>.
+        /// </returns>
+        public override MicroTimeV1 Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {
+            switch (reader.TokenType)
+            {
+                case JsonTokenType.Null:
+                {
+                    return default(MicroTimeV1);
+                }
+                case JsonTokenType.String:
+                {
+                    if (reader.TryGetDateTime(out DateTime value))
+                        return new MicroTimeV1(value);
+
+                    return new MicroTimeV1(
+                        DateTime.Parse(
+                            reader.GetString()
+                        )
+                    );
+                }
+                default:
+                {
+                    throw new JsonException($"Unexpected token type '{reader.TokenType}' for {nameof(MicroTimeV1)} (expected one of [{JsonTokenType.Null}, {JsonTokenType.String}]).");
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Write (serialise) a <see cref="MicroTimeV1"/> to JSON.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="Utf8JsonWriter"/> used to write the JSON.
+        /// </param>
+        /// <param name="value">
+        ///     The value to serialise.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options.
+        /// </param>
+        public override void Write(Utf8JsonWriter writer, MicroTimeV1 value, JsonSerializerOptions options)
+        {
+            if (writer == null)
+                throw new ArgumentNullException(nameof(writer));
+
+            writer.WriteStringValue(value.Value);
+        }
+    }
+}
+
+#endif // NET8_0_OR_GREATER
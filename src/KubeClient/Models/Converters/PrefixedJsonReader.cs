@@ -0,0 +1,179 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     A <see cref="JsonReader"/> that replays a sequence of buffered tokens before continuing to read from an underlying <see cref="JsonReader"/>.
+    /// </summary>
+    /// <remarks>
+    ///     Used to deserialise an object whose leading properties have already been read (e.g. to determine its kind / apiVersion) without buffering the entire object.
+    /// </remarks>
+    sealed class PrefixedJsonReader
+        : JsonReader
+    {
+        /// <summary>
+        ///     The buffered tokens (and their values) to replay before reading from <see cref="_reader"/>.
+        /// </summary>
+        readonly List<(JsonToken token, object value)> _prefix;
+
+        /// <summary>
+        ///     The underlying <see cref="JsonReader"/>.
+        /// </summary>
+        readonly JsonReader _reader;
+
+        /// <summary>
+        ///     The index of the next token in <see cref="_prefix"/> to replay.
+        /// </summary>
+        int _prefixIndex;
+
+        /// <summary>
+        ///     Create a new <see cref="PrefixedJsonReader"/>.
+        /// </summary>
+        /// <param name="prefix">
+        ///     The buffered tokens (and their values) to replay before reading from <paramref name="reader"/>.
+        /// </param>
+        /// <param name="reader">
+        ///     The underlying <see cref="JsonReader"/> (not closed when the <see cref="PrefixedJsonReader"/> is closed).
+        /// </param>
+        public PrefixedJsonReader(List<(JsonToken token, object value)> prefix, JsonReader reader)
+        {
+            if (prefix == null)
+                throw new ArgumentNullException(nameof(prefix));
+
+            if (reader == null)
+                throw new ArgumentNullException(nameof(reader));
+
+            _prefix = prefix;
+            _reader = reader;
+
+            CloseInput = false;
+            Culture = reader.Culture;
+            DateFormatString = reader.DateFormatString;
+            DateParseHandling = reader.DateParseHandling;
+            DateTimeZoneHandling = reader.DateTimeZoneHandling;
+            FloatParseHandling = reader.FloatParseHandling;
+            MaxDepth = reader.MaxDepth;
+        }
+
+        /// <summary>
+        ///     Are there buffered tokens left to replay?
+        /// </summary>
+        bool IsReplaying => _prefixIndex < _prefix.Count;
+
+        /// <summary>
+        ///     Read the next token.
+        /// </summary>
+        /// <returns>
+        ///     <c>true</c>, if a token was read; otherwise, <c>false</c>.
+        /// </returns>
+        public override bool Read()
+        {
+            if (IsReplaying)
+            {
+                (JsonToken token, object value) = _prefix[_prefixIndex++];
+                SetToken(token, value);
+
+                return true;
+            }
+
+            if (!_reader.Read())
+            {
+                SetToken(JsonToken.None);
+
+                return false;
+            }
+
+            SetToken(_reader.TokenType, _reader.Value);
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Read the next token as a <see cref="String"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="String"/> (or <c>null</c>).
+        /// </returns>
+        public override string ReadAsString() => IsReplaying ? base.ReadAsString() : Forward(_reader.ReadAsString());
+
+        /// <summary>
+        ///     Read the next token as an <see cref="Int32"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="Int32"/> (or <c>null</c>).
+        /// </returns>
+        public override int? ReadAsInt32() => IsReplaying ? base.ReadAsInt32() : Forward(_reader.ReadAsInt32());
+
+        /// <summary>
+        ///     Read the next token as a <see cref="Boolean"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="Boolean"/> (or <c>null</c>).
+        /// </returns>
+        public override bool? ReadAsBoolean() => IsReplaying ? base.ReadAsBoolean() : Forward(_reader.ReadAsBoolean());
+
+        /// <summary>
+        ///     Read the next token as a <see cref="Double"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="Double"/> (or <c>null</c>).
+        /// </returns>
+        public override double? ReadAsDouble() => IsReplaying ? base.ReadAsDouble() : Forward(_reader.ReadAsDouble());
+
+        /// <summary>
+        ///     Read the next token as a <see cref="Decimal"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="Decimal"/> (or <c>null</c>).
+        /// </returns>
+        public override decimal? ReadAsDecimal() => IsReplaying ? base.ReadAsDecimal() : Forward(_reader.ReadAsDecimal());
+
+        /// <summary>
+        ///     Read the next token as a <see cref="DateTime"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="DateTime"/> (or <c>null</c>).
+        /// </returns>
+        public override DateTime? ReadAsDateTime() => IsReplaying ? base.ReadAsDateTime() : Forward(_reader.ReadAsDateTime());
+
+        /// <summary>
+        ///     Read the next token as a <see cref="DateTimeOffset"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="DateTimeOffset"/> (or <c>null</c>).
+        /// </returns>
+        public override DateTimeOffset? ReadAsDateTimeOffset() => IsReplaying ? base.ReadAsDateTimeOffset() : Forward(_reader.ReadAsDateTimeOffset());
+
+        /// <summary>
+        ///     Read the next token as a <see cref="Byte"/> array.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="Byte"/> array (or <c>null</c>).
+        /// </returns>
+        public override byte[] ReadAsBytes() => IsReplaying ? base.ReadAsBytes() : Forward(_reader.ReadAsBytes());
+
+        /// <summary>
+        ///     Update the current token from the underlying reader (after it has read a value).
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The type of value that was read.
+        /// </typeparam>
+        /// <param name="value">
+        ///     The value that was read.
+        /// </param>
+        /// <returns>
+        ///     The value.
+        /// </returns>
+        /// <remarks>
+        ///     The underlying reader's ReadAsXXX methods are used (rather than the base implementations, which call <see cref="Read"/>) so that its handling of values (e.g. strings that look like dates) is preserved.
+        /// </remarks>
+        TValue Forward<TValue>(TValue value)
+        {
+            SetToken(_reader.TokenType, _reader.Value);
+
+            return value;
+        }
+    }
+}
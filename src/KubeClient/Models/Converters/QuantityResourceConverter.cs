@@ -0,0 +1,149 @@
+using System;
+using System.Globalization;
+using Newtonsoft.Json;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     JSON converter for <see cref="QuantityResource"/>.
+    /// </summary>
+    public class QuantityResourceConverter
+        : JsonConverter
+    {
+        /// <summary>
+        ///     The CLR <see cref="Type"/> corresponding to <see cref="QuantityResource"/>.
+        /// </summary>
+        static readonly Type QuantityResourceType = typeof(QuantityResource);
+
+        /// <summary>
+        ///     The CLR <see cref="Type"/> corresponding to <see cref="Nullable{T}"/> <see cref="QuantityResource"/>.
+        /// </summary>
+        static readonly Type NullableQuantityResourceType = typeof(QuantityResource?);
+
+        /// <summary>
+        ///     Create a new <see cref="QuantityResourceConverter"/>.
+        /// </summary>
+        public QuantityResourceConverter()
+        {
+        }
+
+        /// <summary>
+        ///     Determine wither the converter can convert an object of the specified type to / from JSON.
+        /// </summary>
+        /// <param name="objectType">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the converter can convert an object of the specified type; otherwise, <c>false</c>.
+        /// </returns>
+        public override bool CanConvert(Type objectType) => objectType == QuantityResourceType || objectType == NullableQuantityResourceType;
+
+        /// <summary>
+        ///     Read (deserialise) an object from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> representing the JSON to read from.
+        /// </param>
+        /// <param name="objectType">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <param name="existingValue">
+        ///     The existing value (unused).
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested deserialisation.
+        /// </param>
+        /// <returns>
+        ///     The deserialised object.
+        /// </returns>
+        public override object ReadJson(JsonReader reader, Type objectType, object existingValue, JsonSerializer serializer)
+        {
+            if (reader == null)
+                throw new ArgumentNullException(nameof(reader));
+            
+            if (objectType == null)
+                throw new ArgumentNullException(nameof(objectType));
+            
+            if (objectType != QuantityResourceType && objectType != NullableQuantityResourceType)
+                throw new NotSupportedException($"{GetType().FullName} cannot deserialise a value of type '{objectType.FullName}'.");
+
+            if (reader.TokenType == JsonToken.Null)
+            {
+                if (objectType == NullableQuantityResourceType)
+                    return null;
+
+                return default(QuantityResource);
+            }
+
+            return ReadQuantity(reader);
+        }
+
+        /// <summary>
+        ///     Write (serialise) an object to JSON.
+        /// </summary>
+        /// <param name="writer">
+        ///     A <see cref="JsonWriter"/> used to write the JSON.
+        /// </param>
+        /// <param name="value">
+        ///     The value to serialise.
+        /// </param>
+        /// <param name="serializer">
+        ///     A <see cref="JsonSerializer"/> that can be used for nested serialisation.
+        /// </param>
+        public override void WriteJson(JsonWriter writer, object value, JsonSerializer serializer)
+        {
+            if (writer == null)
+                throw new ArgumentNullException(nameof(writer));
+            
+            if (serializer == null)
+                throw new ArgumentNullException(nameof(serializer));
+            
+            if (value != null)
+                writer.WriteValue(value.ToString());
+            else
+                writer.WriteNull();
+        }
+
+        /// <summary>
+        ///     Read a (non-null) <see cref="QuantityResource"/> from the current JSON token.
+        /// </summary>
+        /// <param name="reader">
+        ///     A <see cref="JsonReader"/> positioned on the value.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="QuantityResource"/>.
+        /// </returns>
+        internal static QuantityResource ReadQuantity(JsonReader reader)
+        {
+            if (reader == null)
+                throw new ArgumentNullException(nameof(reader));
+
+            string value;
+            switch (reader.TokenType)
+            {
+                case JsonToken.String:
+                {
+                    value = (string)reader.Value;
+
+                    break;
+                }
+                case JsonToken.Integer:
+                case JsonToken.Float:
+                {
+                    value = Convert.ToString(reader.Value, CultureInfo.InvariantCulture);
+
+                    break;
+                }
+                default:
+                {
+                    throw new JsonException($"Unexpected token type '{reader.TokenType}' for {nameof(QuantityResource)} (expected one of [{JsonToken.Null}, {JsonToken.String}, {JsonToken.Integer}, {JsonToken.Float}]).");
+                }
+            }
+
+            if (!QuantityResource.TryParse(value, out QuantityResource quantity))
+                throw new JsonException($"The value '{value}' is not a valid quantity (or cannot be represented as a {nameof(QuantityResource)}).");
+
+            return quantity;
+        }
+    }
+}
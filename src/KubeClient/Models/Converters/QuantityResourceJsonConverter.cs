@@ -0,0 +1,97 @@
+#if NET8_0_OR_GREATER
+
+using System;
+using System.Globalization;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     System.Text.Json converter for <see cref="QuantityResource"/>.
+    /// </summary>
+    public class QuantityResourceJsonConverter
+        : JsonConverter<QuantityResource>
+    {
+        /// <summary>
+        ///     Create a new <see cref="QuantityResourceJsonConverter"/>.
+        /// </summary>
+        public QuantityResourceJsonConverter()
+        {
+        }
+
+        /// <summary>
+        ///     Read (deserialise) a <see cref="QuantityResource"/> from JSON.
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="Utf8JsonReader"/> to read from.
+        /// </param>
+        /// <param name="typeToConvert">
+        ///     The target object <see cref="Type"/>.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options.
+        /// </param>
+        /// <returns>
+        ///     The deserialised <see cref="QuantityResource"/>.
+        /// </returns>
+        public override QuantityResource Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {
+            string value;
+            switch (reader.TokenType)
+            {
+                case JsonTokenType.Null:
+                {
+                    return default(QuantityResource);
+                }
+                case JsonTokenType.Number when reader.TryGetInt64(out long integerValue):
+                {
+                    return new QuantityResource(integerValue);
+                }
+                case JsonTokenType.Number:
+                {
+                    value = reader.GetDouble().ToString("R", CultureInfo.InvariantCulture);
+
+                    break;
+                }
+                case JsonTokenType.String:
+                {
+                    value = reader.GetString();
+
+                    break;
+                }
+                default:
+                {
+                    throw new JsonException($"Unexpected token type '{reader.TokenType}' for {nameof(QuantityResource)} (expected one of [{JsonTokenType.Null}, {JsonTokenType.Number}, {JsonTokenType.String}]).");
+                }
+            }
+
+            if (!QuantityResource.TryParse(value, out QuantityResource quantity))
+                throw new JsonException($"The value '{value}' is not a valid quantity (or cannot be represented as a {nameof(QuantityResource)}).");
+
+            return quantity;
+        }
+
+        /// <summary>
+        ///     Write (serialise) a <see cref="QuantityResource"/> to JSON.
+        /// </summary>
+        /// <param name="writer">
+        ///     The <see cref="Utf8JsonWriter"/> used to write the JSON.
+        /// </param>
+        /// <param name="value">
+        ///     The value to serialise.
+        /// </param>
+        /// <param name="options">
+        ///     The serialiser options.
+        /// </param>
+        public override void Write(Utf8JsonWriter writer, QuantityResource value, JsonSerializerOptions options)
+        {
+            if (writer == null)
+                throw new ArgumentNullException(nameof(writer));
+
+            writer.WriteStringValue(value.ToString());
+        }
+    }
+}
+
+#endif // NET8_0_OR_GREATER
@@ -1,5 +1,4 @@
 using Newtonsoft.Json;
-using Newtonsoft.Json.Linq;
 using System;
 using System.Collections.Generic;
 using System.Linq;
@@ -24,12 +23,12 @@ namespace KubeClient.Models.Converters
         static readonly TypeInfo KubeResourceV1Type = typeof(KubeResourceV1).GetTypeInfo();
 
         /// <summary>
-        /// Default assemblies always scanned for model types.
+        /// The K8s kind of <see cref="StatusV1"/> (the resource of an <see cref="ResourceEventType.Error"/> event).
         /// </summary>
-        static readonly IEnumerable<Assembly> DefaultModelAssemblies = new Assembly[] { KubeResourceV1Type.Assembly };
+        const string StatusKind = "Status";
 
         /// <summary>
-        /// Registered model types, keyed by K8s kind and apiVersion.
+        /// Registered model types from additional assemblies (which take precedence over <see cref="KnownModels"/>), keyed by K8s kind and apiVersion.
         /// </summary>
         readonly Dictionary<(string kind, string apiVersion), Type> _modelTypesByKubeKind;
 
@@ -51,8 +50,9 @@ namespace KubeClient.Models.Converters
             if (modelTypeAssemblies == null)
                 throw new ArgumentNullException(nameof(modelTypeAssemblies));
             
+            // Well-known model types are resolved via KnownModels.TryGetResourceType.
             _modelTypesByKubeKind = ModelMetadata.KubeObject.BuildKindToTypeLookup(
-                DefaultModelAssemblies.Concat(modelTypeAssemblies)
+                modelTypeAssemblies.Where(assembly => !KnownModels.IsModelAssembly(assembly))
             );
         }
 
@@ -101,12 +101,48 @@ namespace KubeClient.Models.Converters
             if (objectType != ResourceEventV1Type)
                 throw new NotSupportedException($"{GetType().Name} cannot deserialise a value of type '{objectType.FullName}' (only {typeof(ResourceEventV1<KubeResourceV1>).FullName} is supported).");
 
-            JObject eventJson = JObject.Load(reader);
+            if (reader.TokenType == JsonToken.None)
+                reader.Read();
+
+            if (reader.TokenType != JsonToken.StartObject)
+                throw new NotSupportedException($"{GetType().Name} cannot deserialise JSON because it does not represent a valid {nameof(ResourceEventV1<KubeResourceV1>)} (expected an object, but found '{reader.TokenType}').");
+
+            // Read forward-only (rather than loading the event into a JObject and then deserialising the resource from it).
+            bool hasEventType = false;
+            string rawEventType = null;
+            KubeResourceV1 resource = null;
+            while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+            {
+                switch ((string)reader.Value)
+                {
+                    case "type":
+                    {
+                        hasEventType = true;
+                        rawEventType = reader.ReadAsString();
+
+                        break;
+                    }
+                    case "object":
+                    {
+                        reader.Read();
+                        resource = DeserializeResource(reader, serializer);
+
+                        break;
+                    }
+                    default:
+                    {
+                        reader.Read();
+                        reader.Skip();
+
+                        break;
+                    }
+                }
+            }
 
             var resourceEvent = new ResourceEventV1<KubeResourceV1>
             {
-                EventType = DeserializeEventType(eventJson),
-                Resource = DeserializeResource(eventJson, serializer)
+                EventType = DeserializeEventType(hasEventType, rawEventType),
+                Resource = resource
             };
             
             return resourceEvent;
@@ -138,57 +174,27 @@ namespace KubeClient.Models.Converters
         /// <summary>
         /// Deserialise the event's type from JSON.
         /// </summary>
-        /// <param name="eventJson">The serialised event JSON.</param>
+        /// <param name="hasEventType">Does the serialised event JSON have a 'type' property?</param>
+        /// <param name="rawEventType">The value of the serialised event's 'type' property.</param>
         /// <returns>A <see cref="ResourceEventType"/> value representing the event type.</returns>
-        ResourceEventType DeserializeEventType(JObject eventJson)
+        ResourceEventType DeserializeEventType(bool hasEventType, string rawEventType)
         {
-            if (eventJson == null)
-                throw new ArgumentNullException(nameof(eventJson));
-
-            if (eventJson.Property("type") == null)
+            if (!hasEventType)
                 throw new NotSupportedException($"{GetType().Name} cannot deserialise JSON because it does not represent a valid {nameof(ResourceEventV1<KubeResourceV1>)} (missing 'type' property).");
 
             ResourceEventType eventType;
-            string rawEventType = eventJson.Value<string>("type");
             if (!Enum.TryParse(rawEventType, ignoreCase: true, out eventType))
                 throw new NotSupportedException($"{GetType().Name} cannot deserialise JSON because it does not represent a valid {nameof(ResourceEventV1<KubeResourceV1>)} ('type' property has invalid  value '{rawEventType}').");
 
             return eventType;
         }
 
-        /// <summary>
-        /// Get the event's serialised resource from JSON.
-        /// </summary>
-        /// <param name="eventJson">The serialised event JSON.</param>
-        /// <returns>A <see cref="JObject"/> containing the serialised resource JSON, the resource kind, and the resource API version.</returns>
-        (JObject resourceJson, string kind, string apiVersion) GetResourceJson(JObject eventJson)
-        {
-            if (eventJson == null)
-                throw new ArgumentNullException(nameof(eventJson));
-
-            // "object" property might not be present at all.
-
-            JObject resourceJson = eventJson.Value<JObject>("object");
-            if (resourceJson == null)
-                return (resourceJson: null, kind: null, apiVersion: null);
-
-            string kind = resourceJson.Value<string>("kind");
-            if (string.IsNullOrWhiteSpace(kind))
-                throw new KubeClientException($"{GetType().Name} cannot deserialise {nameof(KubeResourceV1)} from JSON because the 'kind' property is missing.");
-
-            string apiVersion = resourceJson.Value<string>("apiVersion");
-            if (string.IsNullOrWhiteSpace(apiVersion))
-                throw new KubeClientException($"{GetType().Name} cannot deserialise {nameof(KubeResourceV1)} from JSON because the 'apiVersion' property is missing.");
-
-            return (resourceJson, kind, apiVersion);
-        }
-
         /// <summary>
         /// Get the CLR type representing the model for the specified resource kind and API version.
         /// </summary>
         /// <param name="kind">The K8s resource kind.</param>
         /// <param name="apiVersion">The K8s API version.</param>
-        /// <returns>The model <see cref="Type"/>.</returns>
+        /// <returns>The model <see cref="Type"/>, or <c>null</c> if no model type has been registered for the specified kind and API version.</returns>
         Type GetModelType(string kind, string apiVersion)
         {
             if (String.IsNullOrWhiteSpace(kind))
@@ -198,8 +204,11 @@ namespace KubeClient.Models.Converters
                 throw new ArgumentException($"Argument cannot be null, empty, or entirely composed of whitespace: {nameof(apiVersion)}.", nameof(apiVersion));
 
             Type modelType;
-            if (!_modelTypesByKubeKind.TryGetValue((kind, apiVersion), out modelType))
-                throw new KubeClientException($"{GetType().Name} cannot deserialise {nameof(KubeResourceV1)} from JSON because no model type has been registered for '{apiVersion}/{kind}'.");
+            if (_modelTypesByKubeKind.Count == 0 || !_modelTypesByKubeKind.TryGetValue((kind, apiVersion), out modelType))
+            {
+                if (!KnownModels.TryGetResourceType(kind, apiVersion, out modelType))
+                    return null;
+            }
 
             // Ensure the registered model type is actually compatible with the model type being deserialised.
             if (!KubeResourceV1Type.IsAssignableFrom(modelType.GetTypeInfo()))
@@ -211,18 +220,116 @@ namespace KubeClient.Models.Converters
         /// <summary>
         /// Deserialise the event's resource from JSON.
         /// </summary>
-        /// <param name="eventJson">The serialised event JSON.</param>
+        /// <param name="reader">A <see cref="JsonReader"/> positioned at the value of the event's 'object' property.</param>
         /// <param name="serializer">The JSON serialiser used to deserialise the resource.</param>
         /// <returns>The deserialised resource.</returns>
-        KubeResourceV1 DeserializeResource(JObject eventJson, JsonSerializer serializer)
+        /// <remarks>
+        /// Only the resource's leading properties (up to, and including, 'kind' and 'apiVersion') are buffered; the rest of the resource is deserialised directly from <paramref name="reader"/>.
+        /// The API server always writes 'kind' and 'apiVersion' first, so usually nothing else is buffered.
+        /// </remarks>
+        KubeResourceV1 DeserializeResource(JsonReader reader, JsonSerializer serializer)
         {
-            (JObject resourceJson, string kind, string apiVersion) = GetResourceJson(eventJson);
-            if (resourceJson == null)
+            if (reader.TokenType == JsonToken.Null)
                 return null; // AF: I think it's possible for the event's resource to be null in some cases.
 
+            if (reader.TokenType != JsonToken.StartObject)
+                throw new NotSupportedException($"{GetType().Name} cannot deserialise JSON because it does not represent a valid {nameof(ResourceEventV1<KubeResourceV1>)} ('object' property is not an object).");
+
+            var resourcePrefix = new List<(JsonToken token, object value)>
+            {
+                (JsonToken.StartObject, null)
+            };
+
+            string kind = null;
+            string apiVersion = null;
+            while ((kind == null || apiVersion == null) && reader.Read() && reader.TokenType == JsonToken.PropertyName)
+            {
+                string propertyName = (string)reader.Value;
+                resourcePrefix.Add((JsonToken.PropertyName, propertyName));
+
+                switch (propertyName)
+                {
+                    case "kind":
+                    {
+                        kind = reader.ReadAsString();
+                        resourcePrefix.Add((reader.TokenType, reader.Value));
+
+                        break;
+                    }
+                    case "apiVersion":
+                    {
+                        apiVersion = reader.ReadAsString();
+                        resourcePrefix.Add((reader.TokenType, reader.Value));
+
+                        break;
+                    }
+                    default:
+                    {
+                        BufferValue(reader, resourcePrefix);
+
+                        break;
+                    }
+                }
+            }
+
+            if (string.IsNullOrWhiteSpace(kind))
+                throw new KubeClientException($"{GetType().Name} cannot deserialise {nameof(KubeResourceV1)} from JSON because the 'kind' property is missing.");
+
+            if (string.IsNullOrWhiteSpace(apiVersion))
+                throw new KubeClientException($"{GetType().Name} cannot deserialise {nameof(KubeResourceV1)} from JSON because the 'apiVersion' property is missing.");
+
             Type modelType = GetModelType(kind, apiVersion);
+            using (JsonReader resourceReader = new PrefixedJsonReader(resourcePrefix, reader))
+            {
+                if (modelType != null)
+                    return (KubeResourceV1)serializer.Deserialize(resourceReader, modelType);
+
+                // The resource for an error event is a StatusV1 describing the error.
+                if (kind == StatusKind)
+                {
+                    StatusV1 status = serializer.Deserialize<StatusV1>(resourceReader);
+
+                    throw new KubeApiException(status);
+                }
+            }
 
-            return (KubeResourceV1)serializer.Deserialize(resourceJson.CreateReader(), modelType);
+            throw new KubeClientException($"{GetType().Name} cannot deserialise {nameof(KubeResourceV1)} from JSON because no model type has been registered for '{apiVersion}/{kind}'.");
+        }
+
+        /// <summary>
+        /// Read and buffer the next value (and, if it is an object or array, all of its tokens).
+        /// </summary>
+        /// <param name="reader">A <see cref="JsonReader"/> positioned at the name of the property whose value is to be buffered.</param>
+        /// <param name="tokens">The list of buffered tokens (and their values) to append to.</param>
+        static void BufferValue(JsonReader reader, List<(JsonToken token, object value)> tokens)
+        {
+            // Buffer date-like strings as strings (they are converted to dates when replayed, if the target property is a date); otherwise, string properties would receive reformatted dates.
+            DateParseHandling dateParseHandling = reader.DateParseHandling;
+            reader.DateParseHandling = DateParseHandling.None;
+            try
+            {
+                if (!reader.Read())
+                    return;
+
+                int depth = reader.Depth;
+
+                tokens.Add((reader.TokenType, reader.Value));
+                if (reader.TokenType != JsonToken.StartObject && reader.TokenType != JsonToken.StartArray)
+                    return;
+
+                // The token that ends an object / array has the same depth as the one that starts it.
+                while (reader.Read())
+                {
+                    tokens.Add((reader.TokenType, reader.Value));
+
+                    if (reader.Depth == depth)
+                        break;
+                }
+            }
+            finally
+            {
+                reader.DateParseHandling = dateParseHandling;
+            }
         }
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,291 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using YamlDotNet.Core;
+using YamlDotNet.Core.Events;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     A <see cref="JsonReader"/> that reads JSON tokens directly from the events produced by a YAML <see cref="IParser"/>.
+    /// </summary>
+    /// <remarks>
+    ///     Only the first YAML document is read. Aliases are expanded (by replaying the events for the anchored node).
+    ///
+    ///     As when YAML is loaded without a schema, plain scalars that represent null ("", "~", and "null") are read as <see cref="JsonToken.Null"/>, and all other scalars are read as <see cref="JsonToken.String"/> (the ReadAsXXX methods convert them to the target type, as required).
+    /// </remarks>
+    sealed class YamlJsonReader
+        : JsonReader
+    {
+        /// <summary>
+        ///     The tag that explicitly identifies a null scalar.
+        /// </summary>
+        const string NullTag = "tag:yaml.org,2002:null";
+
+        /// <summary>
+        ///     The underlying YAML parser.
+        /// </summary>
+        readonly IParser _parser;
+
+        /// <summary>
+        ///     The events for anchored nodes that have been read, keyed by anchor name.
+        /// </summary>
+        readonly Dictionary<string, List<ParsingEvent>> _anchoredNodes = new Dictionary<string, List<ParsingEvent>>(StringComparer.Ordinal);
+
+        /// <summary>
+        ///     Anchored nodes whose events are currently being recorded (and the nesting depth within each node).
+        /// </summary>
+        readonly List<(string anchorName, List<ParsingEvent> events, int depth)> _recordings = new List<(string anchorName, List<ParsingEvent> events, int depth)>();
+
+        /// <summary>
+        ///     Events (for an aliased node) to replay before reading from the parser.
+        /// </summary>
+        readonly Queue<ParsingEvent> _replay = new Queue<ParsingEvent>();
+
+        /// <summary>
+        ///     For each open YAML mapping or sequence, whether it is a mapping and (if so) whether the next scalar is a key.
+        /// </summary>
+        readonly Stack<(bool isMapping, bool isKeyExpected)> _containers = new Stack<(bool isMapping, bool isKeyExpected)>();
+
+        /// <summary>
+        ///     Has the (first) document been completely read?
+        /// </summary>
+        bool _isComplete;
+
+        /// <summary>
+        ///     Create a new <see cref="YamlJsonReader"/>.
+        /// </summary>
+        /// <param name="parser">
+        ///     The underlying YAML parser.
+        /// </param>
+        public YamlJsonReader(IParser parser)
+        {
+            if (parser == null)
+                throw new ArgumentNullException(nameof(parser));
+
+            _parser = parser;
+        }
+
+        /// <summary>
+        ///     Read the next token.
+        /// </summary>
+        /// <returns>
+        ///     <c>true</c>, if a token was read; otherwise, <c>false</c>.
+        /// </returns>
+        public override bool Read()
+        {
+            while (!_isComplete)
+            {
+                ParsingEvent parsingEvent = NextEvent();
+                switch (parsingEvent)
+                {
+                    case null:
+                    case DocumentEnd _:
+                    case StreamEnd _:
+                    {
+                        // An empty (or missing) document represents null.
+                        _isComplete = true;
+                        SetToken(JsonToken.Null);
+
+                        return true;
+                    }
+                    case MappingStart _:
+                    {
+                        EnsureValueExpected(parsingEvent);
+
+                        _containers.Push((isMapping: true, isKeyExpected: true));
+                        SetToken(JsonToken.StartObject);
+
+                        return true;
+                    }
+                    case SequenceStart _:
+                    {
+                        EnsureValueExpected(parsingEvent);
+
+                        _containers.Push((isMapping: false, isKeyExpected: false));
+                        SetToken(JsonToken.StartArray);
+
+                        return true;
+                    }
+                    case MappingEnd _:
+                    {
+                        _containers.Pop();
+                        SetToken(JsonToken.EndObject);
+                        OnValueRead();
+
+                        return true;
+                    }
+                    case SequenceEnd _:
+                    {
+                        _containers.Pop();
+                        SetToken(JsonToken.EndArray);
+                        OnValueRead();
+
+                        return true;
+                    }
+                    case Scalar scalar:
+                    {
+                        if (_containers.Count > 0 && _containers.Peek().isKeyExpected)
+                        {
+                            _containers.Pop();
+                            _containers.Push((isMapping: true, isKeyExpected: false));
+                            SetToken(JsonToken.PropertyName, scalar.Value);
+
+                            return true;
+                        }
+
+                        if (IsNull(scalar))
+                            SetToken(JsonToken.Null);
+                        else
+                            SetToken(JsonToken.String, scalar.Value);
+
+                        OnValueRead();
+
+                        return true;
+                    }
+                    default:
+                    {
+                        // Stream / document start, comments, etc.
+
+                        continue;
+                    }
+                }
+            }
+
+            SetToken(JsonToken.None);
+
+            return false;
+        }
+
+        /// <summary>
+        ///     Get the next parsing event (expanding aliases, and recording the events for anchored nodes).
+        /// </summary>
+        /// <returns>
+        ///     The next <see cref="ParsingEvent"/>, or <c>null</c> if there are no more events.
+        /// </returns>
+        ParsingEvent NextEvent()
+        {
+            ParsingEvent parsingEvent;
+            if (_replay.Count > 0)
+                parsingEvent = _replay.Dequeue();
+            else if (_parser.MoveNext())
+                parsingEvent = _parser.Current;
+            else
+                return null;
+
+            if (parsingEvent is AnchorAlias alias)
+            {
+                if (!_anchoredNodes.TryGetValue(alias.Value.Value, out List<ParsingEvent> aliasedEvents))
+                    throw new JsonReaderException($"YAML alias '{alias.Value.Value}' refers to an anchor that has not been defined.");
+
+                foreach (ParsingEvent aliasedEvent in aliasedEvents)
+                    _replay.Enqueue(aliasedEvent);
+
+                return NextEvent();
+            }
+
+            RecordEvent(parsingEvent);
+
+            return parsingEvent;
+        }
+
+        /// <summary>
+        ///     Record a parsing event for any anchored nodes that are currently being read (and start recording, if the event starts a new anchored node).
+        /// </summary>
+        /// <param name="parsingEvent">
+        ///     The <see cref="ParsingEvent"/>.
+        /// </param>
+        void RecordEvent(ParsingEvent parsingEvent)
+        {
+            int depthChange = 0;
+            if (parsingEvent is MappingStart || parsingEvent is SequenceStart)
+                depthChange = 1;
+            else if (parsingEvent is MappingEnd || parsingEvent is SequenceEnd)
+                depthChange = -1;
+
+            if (parsingEvent is NodeEvent nodeEvent && !nodeEvent.Anchor.IsEmpty)
+                _recordings.Add((nodeEvent.Anchor.Value, new List<ParsingEvent>(), 0));
+
+            for (int recordingIndex = _recordings.Count - 1; recordingIndex >= 0; recordingIndex--)
+            {
+                (string anchorName, List<ParsingEvent> events, int depth) = _recordings[recordingIndex];
+
+                events.Add(parsingEvent);
+                depth += depthChange;
+
+                if (depth == 0)
+                {
+                    _anchoredNodes[anchorName] = events;
+                    _recordings.RemoveAt(recordingIndex);
+                }
+                else
+                    _recordings[recordingIndex] = (anchorName, events, depth);
+            }
+        }
+
+        /// <summary>
+        ///     Ensure that the reader is positioned where a value (rather than a property name) is expected.
+        /// </summary>
+        /// <param name="parsingEvent">
+        ///     The current <see cref="ParsingEvent"/> (used in error messages).
+        /// </param>
+        void EnsureValueExpected(ParsingEvent parsingEvent)
+        {
+            if (_containers.Count > 0 && _containers.Peek().isKeyExpected)
+                throw new JsonReaderException($"Unsupported YAML mapping key ({parsingEvent.GetType().Name}); only scalar keys can be represented in JSON.");
+        }
+
+        /// <summary>
+        ///     Update the reader's state after a complete value has been read.
+        /// </summary>
+        void OnValueRead()
+        {
+            if (_containers.Count == 0)
+            {
+                _isComplete = true;
+
+                return;
+            }
+
+            if (_containers.Peek().isMapping)
+            {
+                _containers.Pop();
+                _containers.Push((isMapping: true, isKeyExpected: true));
+            }
+        }
+
+        /// <summary>
+        ///     Determine whether a YAML scalar represents null.
+        /// </summary>
+        /// <param name="scalar">
+        ///     The <see cref="Scalar"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the scalar represents null; otherwise, <c>false</c>.
+        /// </returns>
+        static bool IsNull(Scalar scalar)
+        {
+            if (!scalar.Tag.IsEmpty)
+                return scalar.Tag.Value == NullTag;
+
+            if (scalar.Style != ScalarStyle.Plain)
+                return false;
+
+            switch (scalar.Value)
+            {
+                case "":
+                case "~":
+                case "null":
+                case "Null":
+                case "NULL":
+                {
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+}
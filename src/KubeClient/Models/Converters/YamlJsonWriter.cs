@@ -0,0 +1,516 @@
+using Newtonsoft.Json;
+using System;
+using System.Globalization;
+using System.Text.RegularExpressions;
+using YamlDotNet.Core;
+using YamlDotNet.Core.Events;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     A <see cref="JsonWriter"/> that writes JSON tokens directly to a YAML <see cref="IEmitter"/>.
+    /// </summary>
+    /// <remarks>
+    ///     Each top-level value is emitted as a single YAML document (in its own stream).
+    ///
+    ///     Strings that would otherwise be read back as a null, boolean, or number (e.g. "true" or "8080") are double-quoted; all other scalars are emitted in the emitter's preferred style.
+    /// </remarks>
+    sealed class YamlJsonWriter
+        : JsonWriter
+    {
+        /// <summary>
+        ///     Plain scalars that YAML (1.1 or 1.2) parsers may resolve to a type other than string.
+        /// </summary>
+        static readonly Regex NonStringPlainScalar = new Regex(
+            @"^(|~|null|Null|NULL|true|True|TRUE|false|False|FALSE|y|Y|yes|Yes|YES|n|N|no|No|NO|on|On|ON|off|Off|OFF" +
+            @"|[-+]?[0-9][0-9_]*|0o[0-7]+|0x[0-9a-fA-F]+" +
+            @"|[-+]?(\.[0-9]+|[0-9][0-9_]*(\.[0-9_]*)?)([eE][-+]?[0-9]+)?" +
+            @"|[-+]?\.(inf|Inf|INF)|\.(nan|NaN|NAN))$",
+            RegexOptions.CultureInvariant
+        );
+
+        /// <summary>
+        ///     The format used for <see cref="DateTime"/> values (unless <see cref="JsonWriter.DateFormatString"/> is specified).
+        /// </summary>
+        const string IsoDateTimeFormat = "yyyy'-'MM'-'dd'T'HH':'mm':'ss.FFFFFFFK";
+
+        /// <summary>
+        ///     The underlying YAML emitter.
+        /// </summary>
+        readonly IEmitter _emitter;
+
+        /// <summary>
+        ///     Is a YAML document currently being written?
+        /// </summary>
+        bool _isDocumentOpen;
+
+        /// <summary>
+        ///     Create a new <see cref="YamlJsonWriter"/>.
+        /// </summary>
+        /// <param name="emitter">
+        ///     The underlying YAML emitter.
+        /// </param>
+        public YamlJsonWriter(IEmitter emitter)
+        {
+            if (emitter == null)
+                throw new ArgumentNullException(nameof(emitter));
+
+            _emitter = emitter;
+        }
+
+        /// <summary>
+        ///     Flush the writer (has no effect, since YAML emitters may need to look ahead before writing).
+        /// </summary>
+        public override void Flush()
+        {
+        }
+
+        /// <summary>
+        ///     Write the start of a JSON object.
+        /// </summary>
+        public override void WriteStartObject()
+        {
+            base.WriteStartObject();
+
+            OpenDocument();
+            _emitter.Emit(
+                new MappingStart(AnchorName.Empty, TagName.Empty, isImplicit: true, MappingStyle.Any)
+            );
+        }
+
+        /// <summary>
+        ///     Write the start of a JSON array.
+        /// </summary>
+        public override void WriteStartArray()
+        {
+            base.WriteStartArray();
+
+            OpenDocument();
+            _emitter.Emit(
+                new SequenceStart(AnchorName.Empty, TagName.Empty, isImplicit: true, SequenceStyle.Any)
+            );
+        }
+
+        /// <summary>
+        ///     Write the start of a JavaScript constructor (not supported).
+        /// </summary>
+        /// <param name="name">
+        ///     The constructor name.
+        /// </param>
+        public override void WriteStartConstructor(string name)
+        {
+            throw new NotSupportedException("JavaScript constructors cannot be represented in YAML.");
+        }
+
+        /// <summary>
+        ///     Write the end token for a JSON object or array.
+        /// </summary>
+        /// <param name="token">
+        ///     The end token.
+        /// </param>
+        protected override void WriteEnd(JsonToken token)
+        {
+            switch (token)
+            {
+                case JsonToken.EndObject:
+                {
+                    _emitter.Emit(new MappingEnd());
+
+                    break;
+                }
+                case JsonToken.EndArray:
+                {
+                    _emitter.Emit(new SequenceEnd());
+
+                    break;
+                }
+                default:
+                {
+                    throw new NotSupportedException($"Unexpected end token '{token}'.");
+                }
+            }
+
+            CloseDocumentIfComplete();
+        }
+
+        /// <summary>
+        ///     Write a property name.
+        /// </summary>
+        /// <param name="name">
+        ///     The property name.
+        /// </param>
+        public override void WritePropertyName(string name)
+        {
+            base.WritePropertyName(name);
+
+            _emitter.Emit(
+                CreateStringScalar(name)
+            );
+        }
+
+        /// <summary>
+        ///     Write a null value.
+        /// </summary>
+        public override void WriteNull()
+        {
+            base.WriteNull();
+
+            EmitValue(
+                CreatePlainScalar("null")
+            );
+        }
+
+        /// <summary>
+        ///     Write an undefined value (represented as null).
+        /// </summary>
+        public override void WriteUndefined()
+        {
+            base.WriteUndefined();
+
+            EmitValue(
+                CreatePlainScalar("null")
+            );
+        }
+
+        /// <summary>
+        ///     Write a comment (ignored).
+        /// </summary>
+        /// <param name="text">
+        ///     The comment text.
+        /// </param>
+        public override void WriteComment(string text)
+        {
+        }
+
+        /// <summary>
+        ///     Write raw JSON (not supported).
+        /// </summary>
+        /// <param name="json">
+        ///     The raw JSON.
+        /// </param>
+        public override void WriteRaw(string json)
+        {
+            throw new NotSupportedException("Raw JSON cannot be written as YAML.");
+        }
+
+        /// <summary>
+        ///     Write a <see cref="String"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(string value)
+        {
+            if (value == null)
+            {
+                WriteNull();
+
+                return;
+            }
+
+            base.WriteValue(value);
+
+            EmitValue(
+                CreateStringScalar(value)
+            );
+        }
+
+        /// <summary>
+        ///     Write a <see cref="Boolean"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(bool value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreatePlainScalar(value ? "true" : "false")
+            );
+        }
+
+        /// <summary>
+        ///     Write an <see cref="Int32"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(int value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreatePlainScalar(value.ToString(CultureInfo.InvariantCulture))
+            );
+        }
+
+        /// <summary>
+        ///     Write a <see cref="UInt32"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(uint value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreatePlainScalar(value.ToString(CultureInfo.InvariantCulture))
+            );
+        }
+
+        /// <summary>
+        ///     Write an <see cref="Int64"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(long value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreatePlainScalar(value.ToString(CultureInfo.InvariantCulture))
+            );
+        }
+
+        /// <summary>
+        ///     Write a <see cref="UInt64"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(ulong value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreatePlainScalar(value.ToString(CultureInfo.InvariantCulture))
+            );
+        }
+
+        /// <summary>
+        ///     Write an <see cref="Int16"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(short value) => WriteValue((int)value);
+
+        /// <summary>
+        ///     Write a <see cref="UInt16"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(ushort value) => WriteValue((int)value);
+
+        /// <summary>
+        ///     Write a <see cref="Byte"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(byte value) => WriteValue((int)value);
+
+        /// <summary>
+        ///     Write an <see cref="SByte"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(sbyte value) => WriteValue((int)value);
+
+        /// <summary>
+        ///     Write a <see cref="Single"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(float value) => WriteValue((double)value);
+
+        /// <summary>
+        ///     Write a <see cref="Double"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(double value)
+        {
+            base.WriteValue(value);
+
+            string formattedValue;
+            if (Double.IsPositiveInfinity(value))
+                formattedValue = ".inf";
+            else if (Double.IsNegativeInfinity(value))
+                formattedValue = "-.inf";
+            else if (Double.IsNaN(value))
+                formattedValue = ".nan";
+            else
+            {
+                formattedValue = value.ToString("R", CultureInfo.InvariantCulture);
+                if (formattedValue.IndexOfAny(new[] { '.', 'E' }) == -1)
+                    formattedValue += ".0";
+            }
+
+            EmitValue(
+                CreatePlainScalar(formattedValue)
+            );
+        }
+
+        /// <summary>
+        ///     Write a <see cref="Decimal"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(decimal value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreatePlainScalar(value.ToString(CultureInfo.InvariantCulture))
+            );
+        }
+
+        /// <summary>
+        ///     Write a <see cref="Char"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(char value) => WriteValue(value.ToString());
+
+        /// <summary>
+        ///     Write a <see cref="DateTime"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(DateTime value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreateStringScalar(value.ToString(DateFormatString ?? IsoDateTimeFormat, Culture))
+            );
+        }
+
+        /// <summary>
+        ///     Write a <see cref="DateTimeOffset"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(DateTimeOffset value)
+        {
+            base.WriteValue(value);
+
+            EmitValue(
+                CreateStringScalar(value.ToString(DateFormatString ?? IsoDateTimeFormat, Culture))
+            );
+        }
+
+        /// <summary>
+        ///     Write a <see cref="Guid"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(Guid value) => WriteValue(value.ToString("D"));
+
+        /// <summary>
+        ///     Write a <see cref="TimeSpan"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(TimeSpan value) => WriteValue(value.ToString(null, CultureInfo.InvariantCulture));
+
+        /// <summary>
+        ///     Write a <see cref="Uri"/> value.
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(Uri value) => WriteValue(value?.OriginalString);
+
+        /// <summary>
+        ///     Write a <see cref="Byte"/> array (as Base64).
+        /// </summary>
+        /// <param name="value">
+        ///     The value to write.
+        /// </param>
+        public override void WriteValue(byte[] value) => WriteValue(value != null ? Convert.ToBase64String(value) : null);
+
+        /// <summary>
+        ///     Emit the YAML scalar for a value, and close the current document if the value is at the top level.
+        /// </summary>
+        /// <param name="scalar">
+        ///     The <see cref="Scalar"/> to emit.
+        /// </param>
+        void EmitValue(Scalar scalar)
+        {
+            OpenDocument();
+            _emitter.Emit(scalar);
+            CloseDocumentIfComplete();
+        }
+
+        /// <summary>
+        ///     Start a new YAML stream and document (if one is not already open).
+        /// </summary>
+        void OpenDocument()
+        {
+            if (_isDocumentOpen)
+                return;
+
+            _emitter.Emit(new StreamStart());
+            _emitter.Emit(new DocumentStart());
+            _isDocumentOpen = true;
+        }
+
+        /// <summary>
+        ///     End the current YAML document and stream (if the top-level value has been completely written).
+        /// </summary>
+        void CloseDocumentIfComplete()
+        {
+            if (!_isDocumentOpen || Top > 0)
+                return;
+
+            _emitter.Emit(new DocumentEnd(isImplicit: true));
+            _emitter.Emit(new StreamEnd());
+            _isDocumentOpen = false;
+        }
+
+        /// <summary>
+        ///     Create a YAML scalar that represents a string (quoted, if it would otherwise be read back as a value of another type).
+        /// </summary>
+        /// <param name="value">
+        ///     The string value.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="Scalar"/>.
+        /// </returns>
+        static Scalar CreateStringScalar(string value)
+        {
+            ScalarStyle style = NonStringPlainScalar.IsMatch(value) ? ScalarStyle.DoubleQuoted : ScalarStyle.Any;
+
+            return new Scalar(AnchorName.Empty, TagName.Empty, value, style, isPlainImplicit: true, isQuotedImplicit: true);
+        }
+
+        /// <summary>
+        ///     Create a plain YAML scalar (for a null, boolean, or numeric value).
+        /// </summary>
+        /// <param name="value">
+        ///     The formatted value.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="Scalar"/>.
+        /// </returns>
+        static Scalar CreatePlainScalar(string value)
+        {
+            return new Scalar(AnchorName.Empty, TagName.Empty, value, ScalarStyle.Plain, isPlainImplicit: true, isQuotedImplicit: false);
+        }
+    }
+}
@@ -9,7 +9,7 @@ namespace KubeClient.Models
     /// </summary>
     [KubeObject("DeleteOptions", "v1")]
     public class DeleteOptionsV1
-        : KubeObjectV1
+        : KubeObjectV1, IKubeModelEquatable<DeleteOptionsV1>
     {
         /// <summary>
         ///     The duration in seconds before the object should be deleted. Value must be non-negative integer. The value zero indicates delete immediately. If this value is nil, the default grace period for the specified type will be used. Defaults to a per object value if not specified. zero means delete immediately.
@@ -34,5 +34,81 @@ namespace KubeClient.Models
         /// </summary>
         [JsonProperty("propagationPolicy", NullValueHandling = NullValueHandling.Ignore)]
         public DeletePropagationPolicy? PropagationPolicy { get; set; }
+
+        /// <summary>
+        ///     Create a deep clone of the <see cref="DeleteOptionsV1"/>.
+        /// </summary>
+        /// <returns>
+        ///     The new <see cref="DeleteOptionsV1"/>.
+        /// </returns>
+        /// <remarks>
+        ///     This model is hand-crafted, so (unlike generated models) it does not rely on <see cref="PreconditionsV1"/> implementing <see cref="IKubeModelEquatable{TModel}"/>.
+        /// </remarks>
+        public DeleteOptionsV1 DeepClone()
+        {
+            return new DeleteOptionsV1
+            {
+                Kind = Kind,
+                ApiVersion = ApiVersion,
+                GracePeriodSeconds = GracePeriodSeconds,
+                OrphanDependents = OrphanDependents,
+                Preconditions = Preconditions != null ? new PreconditionsV1
+                {
+                    Uid = Preconditions.Uid,
+                    ResourceVersion = Preconditions.ResourceVersion
+                } : null,
+                PropagationPolicy = PropagationPolicy
+            };
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="DeleteOptionsV1"/> is equal to another <see cref="DeleteOptionsV1"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="DeleteOptionsV1"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="DeleteOptionsV1"/>s are equal; otherwise, <c>false</c>.
+        /// </returns>
+        /// <remarks>
+        ///     Implemented explicitly (and without overriding <see cref="object.Equals(object)"/> / <see cref="object.GetHashCode"/>), so existing code that compares or keys on <see cref="DeleteOptionsV1"/> instances still uses reference equality.
+        /// </remarks>
+        bool IEquatable<DeleteOptionsV1>.Equals(DeleteOptionsV1 other)
+        {
+            return IsSemanticallyEqual(other)
+                && Kind == other.Kind
+                && ApiVersion == other.ApiVersion;
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="DeleteOptionsV1"/> is semantically equal to another <see cref="DeleteOptionsV1"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="DeleteOptionsV1"/>.
+        /// </param>
+        /// <param name="ignoreStatus">
+        ///     Ignore differences in the status of resources (not applicable to <see cref="DeleteOptionsV1"/>).
+        /// </param>
+        /// <param name="ignoreManagedFields">
+        ///     Ignore differences in the managed-fields metadata of resources (not applicable to <see cref="DeleteOptionsV1"/>).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="DeleteOptionsV1"/>s are semantically equal; otherwise, <c>false</c>.
+        /// </returns>
+        public bool IsSemanticallyEqual(DeleteOptionsV1 other, bool ignoreStatus = false, bool ignoreManagedFields = false)
+        {
+            if (ReferenceEquals(other, null))
+                return false;
+
+            if (ReferenceEquals(other, this))
+                return true;
+
+            return GracePeriodSeconds == other.GracePeriodSeconds
+                && OrphanDependents == other.OrphanDependents
+                && PropagationPolicy == other.PropagationPolicy
+                && Preconditions?.Uid == other.Preconditions?.Uid
+                && Preconditions?.ResourceVersion == other.Preconditions?.ResourceVersion
+                && (Preconditions == null) == (other.Preconditions == null);
+        }
     }
 }
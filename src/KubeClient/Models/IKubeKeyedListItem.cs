@@ -0,0 +1,16 @@
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Represents a model that is an item in a list whose items are uniquely identified by one or more key properties (i.e. a list with "x-kubernetes-list-type: map").
+    /// </summary>
+    /// <typeparam name="TKey">
+    ///     The type of key that identifies the item (a tuple, if the list has more than one key property).
+    /// </typeparam>
+    public interface IKubeKeyedListItem<TKey>
+    {
+        /// <summary>
+        ///     The key that identifies the item within its list (composed of the values of the list's "x-kubernetes-list-map-keys" properties).
+        /// </summary>
+        TKey ListKey { get; }
+    }
+}
@@ -0,0 +1,47 @@
+using System;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Represents a model that supports deep-cloning and structural (property-by-property) equality.
+    /// </summary>
+    /// <typeparam name="TModel">
+    ///     The model type.
+    /// </typeparam>
+    /// <remarks>
+    ///     Collection properties that are <c>null</c> (e.g. not yet allocated) are considered equal to empty collections.
+    /// </remarks>
+    public interface IKubeModelEquatable<TModel>
+        : IEquatable<TModel>
+        where TModel : class
+    {
+        /// <summary>
+        ///     Create a deep clone of the model.
+        /// </summary>
+        /// <returns>
+        ///     The new model (which shares no mutable state with the original).
+        /// </returns>
+        TModel DeepClone();
+
+        /// <summary>
+        ///     Determine whether the model is semantically equal to another model (i.e. whether the difference between them is meaningful to a controller).
+        /// </summary>
+        /// <param name="other">
+        ///     The other model.
+        /// </param>
+        /// <param name="ignoreStatus">
+        ///     Ignore differences in the status of resources (and any resources they contain)?
+        /// </param>
+        /// <param name="ignoreManagedFields">
+        ///     Ignore differences in the managed-fields metadata (i.e. server-side apply bookkeeping) of resources?
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the models are semantically equal; otherwise, <c>false</c>.
+        /// </returns>
+        /// <remarks>
+        ///     Unlike <see cref="IEquatable{T}.Equals(T)"/>, this ignores type metadata ("kind" and "apiVersion"), since the API server omits it from the items in resource lists.
+        ///     It also ignores resource versions, since they change on every write (even when nothing else has changed).
+        /// </remarks>
+        bool IsSemanticallyEqual(TModel other, bool ignoreStatus = false, bool ignoreManagedFields = false);
+    }
+}
@@ -0,0 +1,117 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Model fields whose values can be used as index keys (e.g. by <see cref="Informers.KubeResourceStore{TResource}"/>), with functions that get their values without using reflection.
+    /// </summary>
+    /// <remarks>
+    ///     Generated fields are selected by the model generator (see <c>INDEXED_FIELDS</c> in generate_models.py); they are based on the fields that the API server supports in field selectors, and use the same field paths (e.g. "spec.nodeName").
+    /// </remarks>
+    public static partial class IndexedFields
+    {
+        /// <summary>
+        ///     Hand-coded model fields, with functions that get their values.
+        /// </summary>
+        static readonly (Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue)[] HandCodedFields =
+        {
+            (typeof(KubeResourceV1), "metadata.name", resource => resource.Metadata?.Name),
+            (typeof(KubeResourceV1), "metadata.namespace", resource => resource.Metadata?.Namespace),
+        };
+
+        /// <summary>
+        ///     Build the field lookup from the (generated and hand-coded) field tables.
+        /// </summary>
+        /// <remarks>
+        ///     Done in the static constructor (rather than field initialisers) because the order in which static fields are initialised across partial class declarations is undefined.
+        /// </remarks>
+        static IndexedFields()
+        {
+            Register(GeneratedFields);
+            Register(HandCodedFields);
+        }
+
+        /// <summary>
+        ///     Functions that get the value of each field, keyed by declaring model type and field path.
+        /// </summary>
+        static readonly ConcurrentDictionary<(Type modelType, string fieldPath), Func<KubeResourceV1, string>> Fields = new ConcurrentDictionary<(Type modelType, string fieldPath), Func<KubeResourceV1, string>>();
+
+        /// <summary>
+        ///     Add model fields to the field lookup.
+        /// </summary>
+        /// <param name="fields">
+        ///     The model fields, with functions that get their values.
+        /// </param>
+        /// <remarks>
+        ///     Used to add the fields from a <see cref="KubeModelPartition"/>, when it is registered.
+        /// </remarks>
+        internal static void Register(IEnumerable<(Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue)> fields)
+        {
+            if (fields == null)
+                throw new ArgumentNullException(nameof(fields));
+
+            foreach ((Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue) in fields)
+                Fields[(modelType, fieldPath)] = getValue;
+        }
+
+        /// <summary>
+        ///     Get the function that gets the value of an indexed model field.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type (fields declared by its base types are also considered).
+        /// </param>
+        /// <param name="fieldPath">
+        ///     The field path (e.g. "spec.nodeName").
+        /// </param>
+        /// <param name="getValue">
+        ///     Receives the function that gets the field's value (which returns <c>null</c> if the field, or any field along its path, has no value).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the field is indexed; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool TryGetField(Type modelType, string fieldPath, out Func<KubeResourceV1, string> getValue)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            if (String.IsNullOrWhiteSpace(fieldPath))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'fieldPath'.", nameof(fieldPath));
+
+            for (Type declaringType = modelType; declaringType != null; declaringType = declaringType.GetTypeInfo().BaseType)
+            {
+                if (Fields.TryGetValue((declaringType, fieldPath), out getValue))
+                    return true;
+            }
+
+            getValue = null;
+
+            return false;
+        }
+
+        /// <summary>
+        ///     Get the paths of the indexed fields for a model type.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type (fields declared by its base types are also included).
+        /// </param>
+        /// <returns>
+        ///     The field paths, in ordinal order.
+        /// </returns>
+        public static IEnumerable<string> GetFieldPaths(Type modelType)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            return Fields.Keys
+                .Where(field => field.modelType.GetTypeInfo().IsAssignableFrom(modelType.GetTypeInfo()))
+                .Select(field => field.fieldPath)
+                .Distinct()
+                .OrderBy(fieldPath => fieldPath, StringComparer.Ordinal)
+                .ToArray();
+        }
+    }
+}
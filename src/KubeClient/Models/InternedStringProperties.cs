@@ -0,0 +1,84 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Model properties whose (low-cardinality) string values are interned, via the <see cref="KubeStringPool.Shared"/> <see cref="KubeStringPool"/> (if any), when they are deserialised.
+    /// </summary>
+    /// <remarks>
+    ///     Generated properties are selected by the model generator (see <c>INTERNED_STRING_PROPERTIES</c> in generate_models.py).
+    /// </remarks>
+    public static partial class InternedStringProperties
+    {
+        /// <summary>
+        ///     Hand-coded model properties, with the parts of their values that are interned.
+        /// </summary>
+        static readonly (Type modelType, string propertyName, InternedStrings internedStrings)[] HandCodedProperties =
+        {
+            (typeof(KubeObjectV1), nameof(KubeObjectV1.Kind), InternedStrings.Values),
+            (typeof(KubeObjectV1), nameof(KubeObjectV1.ApiVersion), InternedStrings.Values),
+        };
+
+        /// <summary>
+        ///     Build the property lookup from the (generated and hand-coded) property tables.
+        /// </summary>
+        /// <remarks>
+        ///     Done in the static constructor (rather than field initialisers) because the order in which static fields are initialised across partial class declarations is undefined.
+        /// </remarks>
+        static InternedStringProperties()
+        {
+            Register(GeneratedProperties);
+            Register(HandCodedProperties);
+        }
+
+        /// <summary>
+        ///     The parts of each property's value that are interned, keyed by declaring model type and property name.
+        /// </summary>
+        static readonly ConcurrentDictionary<(Type modelType, string propertyName), InternedStrings> Properties = new ConcurrentDictionary<(Type modelType, string propertyName), InternedStrings>();
+
+        /// <summary>
+        ///     Add model properties to the property lookup.
+        /// </summary>
+        /// <param name="properties">
+        ///     The model properties, with the parts of their values that are interned.
+        /// </param>
+        /// <remarks>
+        ///     Used to add the properties from a <see cref="KubeModelPartition"/>, when it is registered.
+        /// </remarks>
+        internal static void Register(IEnumerable<(Type modelType, string propertyName, InternedStrings internedStrings)> properties)
+        {
+            if (properties == null)
+                throw new ArgumentNullException(nameof(properties));
+
+            foreach ((Type modelType, string propertyName, InternedStrings internedStrings) in properties)
+                Properties[(modelType, propertyName)] = internedStrings;
+        }
+
+        /// <summary>
+        ///     Determine which parts (if any) of a model property's value are interned when it is deserialised.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type that declares the property.
+        /// </param>
+        /// <param name="propertyName">
+        ///     The property's (CLR) name.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="InternedStrings"/> for the property (<see cref="InternedStrings.None"/>, if its value is not interned).
+        /// </returns>
+        public static InternedStrings GetInternedStrings(Type modelType, string propertyName)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            if (String.IsNullOrWhiteSpace(propertyName))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'propertyName'.", nameof(propertyName));
+
+            Properties.TryGetValue((modelType, propertyName), out InternedStrings internedStrings);
+
+            return internedStrings;
+        }
+    }
+}
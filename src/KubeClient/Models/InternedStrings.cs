@@ -0,0 +1,26 @@
+using System;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     The parts of a model property's value whose strings are interned (via <see cref="KubeStringPool"/>) when the model is deserialised.
+    /// </summary>
+    [Flags]
+    public enum InternedStrings
+    {
+        /// <summary>
+        ///     No strings are interned.
+        /// </summary>
+        None = 0,
+
+        /// <summary>
+        ///     The property's value (or, for a collection property, the values of its items) is interned.
+        /// </summary>
+        Values = 1,
+
+        /// <summary>
+        ///     The keys of a dictionary property are interned.
+        /// </summary>
+        DictionaryKeys = 2
+    }
+}
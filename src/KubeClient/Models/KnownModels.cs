@@ -0,0 +1,311 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Collections.ObjectModel;
+using System.Reflection;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Metadata for well-known model types.
+    /// </summary>
+    /// <remarks>
+    ///     Covers all resource and resource-list models in the KubeClient assembly, so that their metadata can be resolved without scanning the assembly via reflection.
+    ///
+    ///     If the models were generated in partitions (see <see cref="KubeModelPartition"/>), only the models in partitions that have been registered (e.g. via <c>KnownModels.Core.Register()</c>) are covered.
+    /// </remarks>
+    public static partial class KnownModels
+    {
+        /// <summary>
+        ///     Hand-coded resource model types (derived from <see cref="KubeResourceV1"/>), with their kinds and API versions.
+        /// </summary>
+        /// <remarks>
+        ///     Hand-coded models do not declare any APIs (so their API action ranges are always empty).
+        /// </remarks>
+        static readonly (Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount)[] HandCodedResourceTypes =
+        {
+            (typeof(ThirdPartyResourceV1Beta1), "ThirdPartyResource", "extensions/v1beta1", 0, 0),
+            (typeof(PartialObjectMetadataV1), "PartialObjectMetadata", "meta.k8s.io/v1", 0, 0),
+        };
+
+        /// <summary>
+        ///     Hand-coded resource-list model types (derived from <see cref="KubeResourceListV1"/>), with their kinds and API versions (and those of their items, if known).
+        /// </summary>
+        static readonly (Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion)[] HandCodedResourceListTypes =
+        {
+            (typeof(ThirdPartyResourceListV1Beta1), "ThirdPartyResourceList", "extensions/v1beta1", null, null),
+            (typeof(PartialObjectMetadataListV1), "PartialObjectMetadataList", "meta.k8s.io/v1", "PartialObjectMetadata", "meta.k8s.io/v1"),
+        };
+
+        /// <summary>
+        ///     Build lookups from the (generated and hand-coded) model tables.
+        /// </summary>
+        /// <remarks>
+        ///     Done in the static constructor (rather than field initialisers) because the order in which static fields are initialised across partial class declarations is undefined.
+        /// </remarks>
+        static KnownModels()
+        {
+            AddResourceTypes(GeneratedResourceTypes, GeneratedApiActions, GeneratedApiPathTemplates);
+            AddResourceTypes(HandCodedResourceTypes, GeneratedApiActions, GeneratedApiPathTemplates);
+
+            AddResourceListTypes(GeneratedResourceListTypes);
+            AddResourceListTypes(HandCodedResourceListTypes);
+
+            ResourceTypeToKind = new ReadOnlyDictionary<Type, (string kind, string apiVersion)>(ResourceTypeToKindLookup);
+            KindToResourceType = new ReadOnlyDictionary<(string kind, string apiVersion), Type>(KindToResourceTypeLookup);
+            ResourceListTypeToKind = new ReadOnlyDictionary<Type, (string kind, string apiVersion)>(ResourceListTypeToKindLookup);
+            ItemKindToResourceListType = new ReadOnlyDictionary<(string kind, string apiVersion), Type>(ItemKindToResourceListTypeLookup);
+        }
+
+        /// <summary>
+        ///     The API actions (and path templates) that describe the APIs for each well-known resource model type, keyed by model type.
+        /// </summary>
+        static readonly ConcurrentDictionary<Type, (IReadOnlyList<(KubeAction action, int pathTemplate)> apiActions, IReadOnlyList<string> apiPathTemplates, int firstApiAction, int apiActionCount)> ResourceTypeApiActions = new ConcurrentDictionary<Type, (IReadOnlyList<(KubeAction action, int pathTemplate)> apiActions, IReadOnlyList<string> apiPathTemplates, int firstApiAction, int apiActionCount)>();
+
+        /// <summary>
+        ///     Lookup for <see cref="ResourceTypeToKind"/>.
+        /// </summary>
+        static readonly ConcurrentDictionary<Type, (string kind, string apiVersion)> ResourceTypeToKindLookup = new ConcurrentDictionary<Type, (string kind, string apiVersion)>();
+
+        /// <summary>
+        ///     Lookup for <see cref="KindToResourceType"/>.
+        /// </summary>
+        static readonly ConcurrentDictionary<(string kind, string apiVersion), Type> KindToResourceTypeLookup = new ConcurrentDictionary<(string kind, string apiVersion), Type>();
+
+        /// <summary>
+        ///     Lookup for <see cref="ResourceListTypeToKind"/>.
+        /// </summary>
+        static readonly ConcurrentDictionary<Type, (string kind, string apiVersion)> ResourceListTypeToKindLookup = new ConcurrentDictionary<Type, (string kind, string apiVersion)>();
+
+        /// <summary>
+        ///     Lookup for <see cref="ItemKindToResourceListType"/>.
+        /// </summary>
+        static readonly ConcurrentDictionary<(string kind, string apiVersion), Type> ItemKindToResourceListTypeLookup = new ConcurrentDictionary<(string kind, string apiVersion), Type>();
+
+        /// <summary>
+        ///     The names of model partitions that have been registered.
+        /// </summary>
+        static readonly HashSet<string> RegisteredPartitionNames = new HashSet<string>(StringComparer.Ordinal);
+
+        /// <summary>
+        ///     The assembly containing the well-known model types.
+        /// </summary>
+        public static Assembly ModelAssembly { get; } = typeof(KnownModels).GetTypeInfo().Assembly;
+
+        /// <summary>
+        ///     Kind and apiVersion metadata for well-known resource model types (derived from <see cref="KubeResourceV1"/>), keyed by model type.
+        /// </summary>
+        public static IReadOnlyDictionary<Type, (string kind, string apiVersion)> ResourceTypeToKind { get; }
+
+        /// <summary>
+        ///     Well-known resource model types (derived from <see cref="KubeResourceV1"/>), keyed by kind / apiVersion.
+        /// </summary>
+        public static IReadOnlyDictionary<(string kind, string apiVersion), Type> KindToResourceType { get; }
+
+        /// <summary>
+        ///     Kind and apiVersion metadata for well-known resource-list model types (derived from <see cref="KubeResourceListV1"/>), keyed by model type.
+        /// </summary>
+        public static IReadOnlyDictionary<Type, (string kind, string apiVersion)> ResourceListTypeToKind { get; }
+
+        /// <summary>
+        ///     Well-known resource-list model types (derived from <see cref="KubeResourceListV1"/>), keyed by the kind / apiVersion of their items.
+        /// </summary>
+        public static IReadOnlyDictionary<(string kind, string apiVersion), Type> ItemKindToResourceListType { get; }
+
+        /// <summary>
+        ///     Determine whether the specified assembly is the one containing the well-known model types.
+        /// </summary>
+        /// <param name="assembly">
+        ///     The target assembly.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if metadata for the assembly's model types is available from <see cref="KnownModels"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool IsModelAssembly(Assembly assembly) => assembly == ModelAssembly;
+
+        /// <summary>
+        ///     Get kind and apiVersion metadata for a well-known resource or resource-list model type.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type.
+        /// </param>
+        /// <param name="kubeKind">
+        ///     Receives the model type's kind and apiVersion.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="modelType"/> is a well-known model type; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool TryGetKubeKind(Type modelType, out (string kind, string apiVersion) kubeKind)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            return ResourceTypeToKind.TryGetValue(modelType, out kubeKind) || ResourceListTypeToKind.TryGetValue(modelType, out kubeKind);
+        }
+
+        /// <summary>
+        ///     Get the well-known resource model type for the specified kind and API version.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="resourceType">
+        ///     Receives the resource model type (derived from <see cref="KubeResourceV1"/>).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if there is a well-known resource model type for the specified kind and API version; otherwise, <c>false</c>.
+        /// </returns>
+        /// <remarks>
+        ///     Equivalent to <see cref="KindToResourceType"/>, but generated model types are resolved using a generated switch statement (which is cheaper than a dictionary lookup on kind / apiVersion tuples).
+        /// </remarks>
+        public static bool TryGetResourceType(string kind, string apiVersion, out Type resourceType)
+        {
+            if (kind == null)
+                throw new ArgumentNullException(nameof(kind));
+
+            if (apiVersion == null)
+                throw new ArgumentNullException(nameof(apiVersion));
+
+            resourceType = GetGeneratedResourceType(kind, apiVersion);
+            if (resourceType != null)
+                return true;
+
+            return KindToResourceType.TryGetValue((kind, apiVersion), out resourceType);
+        }
+
+        /// <summary>
+        ///     Get the API paths (and corresponding actions) for a well-known resource model type.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type.
+        /// </param>
+        /// <param name="apiPaths">
+        ///     Receives the model type's API paths (equivalent to those declared by its <see cref="KubeApiAttribute"/>s).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="modelType"/> is a well-known resource model type that declares at least one API; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool TryGetApiPaths(Type modelType, out (KubeAction action, string path)[] apiPaths)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            if (!ResourceTypeApiActions.TryGetValue(modelType, out var apiActionRange))
+            {
+                apiPaths = null;
+
+                return false;
+            }
+
+            apiPaths = new (KubeAction action, string path)[apiActionRange.apiActionCount];
+            for (int apiPathIndex = 0; apiPathIndex < apiPaths.Length; apiPathIndex++)
+            {
+                (KubeAction action, int pathTemplate) = apiActionRange.apiActions[apiActionRange.firstApiAction + apiPathIndex];
+
+                apiPaths[apiPathIndex] = (action, apiActionRange.apiPathTemplates[pathTemplate]);
+            }
+
+            return true;
+        }
+        /// <summary>
+        ///     Register the models in a partition of the generated model types (i.e. add their metadata to <see cref="KnownModels"/>, <see cref="InternedStringProperties"/>, <see cref="StrategicMergePatch"/>, <see cref="IndexedFields"/>, <see cref="Converters.KubeModelConverters"/>, and <see cref="Converters.KubeModelBinarySerializers"/>).
+        /// </summary>
+        /// <param name="partition">
+        ///     The <see cref="KubeModelPartition"/> to register.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the partition was registered; <c>false</c>, if a partition with the same name has already been registered.
+        /// </returns>
+        /// <remarks>
+        ///     Generated partitions are normally registered via their entry points (e.g. <c>KnownModels.Apps.Register()</c>), which also register the partitions they depend on.
+        ///
+        ///     Partitions should be registered at startup (before models are serialised or deserialised), because serialisation contracts are cached when they are first used.
+        /// </remarks>
+        public static bool Register(KubeModelPartition partition)
+        {
+            if (partition == null)
+                throw new ArgumentNullException(nameof(partition));
+
+            lock (RegisteredPartitionNames)
+            {
+                if (!RegisteredPartitionNames.Add(partition.Name))
+                    return false;
+
+                AddResourceTypes(partition.ResourceTypes, partition.ApiActions, partition.ApiPathTemplates);
+                AddResourceListTypes(partition.ResourceListTypes);
+
+                InternedStringProperties.Register(partition.InternedStringProperties);
+                StrategicMergePatch.Register(partition.PatchProperties);
+                IndexedFields.Register(partition.IndexedFields);
+                Converters.KubeModelConverters.Register(partition.Converters);
+                Converters.KubeModelBinarySerializers.Register(partition.BinarySerializers);
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Determine whether a partition of the generated model types has been registered.
+        /// </summary>
+        /// <param name="partitionName">
+        ///     The partition name.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the partition has been registered; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool IsRegistered(string partitionName)
+        {
+            if (String.IsNullOrWhiteSpace(partitionName))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'partitionName'.", nameof(partitionName));
+
+            lock (RegisteredPartitionNames)
+            {
+                return RegisteredPartitionNames.Contains(partitionName);
+            }
+        }
+
+        /// <summary>
+        ///     Add resource model types to the lookups.
+        /// </summary>
+        /// <param name="resourceTypes">
+        ///     The resource model types (derived from <see cref="KubeResourceV1"/>), with their kinds and API versions (and the range of <paramref name="apiActions"/> that describes their APIs).
+        /// </param>
+        /// <param name="apiActions">
+        ///     API actions for the resource model types (each with an index into <paramref name="apiPathTemplates"/>).
+        /// </param>
+        /// <param name="apiPathTemplates">
+        ///     API path templates for the resource model types.
+        /// </param>
+        static void AddResourceTypes(IEnumerable<(Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount)> resourceTypes, IReadOnlyList<(KubeAction action, int pathTemplate)> apiActions, IReadOnlyList<string> apiPathTemplates)
+        {
+            foreach ((Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount) in resourceTypes)
+            {
+                ResourceTypeToKindLookup[modelType] = (kind, apiVersion);
+                KindToResourceTypeLookup[(kind, apiVersion)] = modelType;
+
+                if (apiActionCount > 0)
+                    ResourceTypeApiActions[modelType] = (apiActions, apiPathTemplates, firstApiAction, apiActionCount);
+            }
+        }
+
+        /// <summary>
+        ///     Add resource-list model types to the lookups.
+        /// </summary>
+        /// <param name="resourceListTypes">
+        ///     The resource-list model types (derived from <see cref="KubeResourceListV1"/>), with their kinds and API versions (and those of their items, if known).
+        /// </param>
+        static void AddResourceListTypes(IEnumerable<(Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion)> resourceListTypes)
+        {
+            foreach ((Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion) in resourceListTypes)
+            {
+                ResourceListTypeToKindLookup[modelType] = (kind, apiVersion);
+
+                if (itemKind != null)
+                    ItemKindToResourceListTypeLookup[(itemKind, itemApiVersion)] = modelType;
+            }
+        }
+    }
+}
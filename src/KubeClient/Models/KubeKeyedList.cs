@@ -0,0 +1,255 @@
+using System;
+using System.Collections.Generic;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     A list of models whose items are uniquely identified by one or more key properties (i.e. a list with "x-kubernetes-list-type: map").
+    /// </summary>
+    /// <typeparam name="TKey">
+    ///     The type of key that identifies each item (a tuple, if the list has more than one key property).
+    /// </typeparam>
+    /// <typeparam name="TItem">
+    ///     The item type.
+    /// </typeparam>
+    /// <remarks>
+    ///     The list is still serialised as a JSON array, but items can also be looked up by key without scanning the list.
+    ///
+    ///     The key index is built on first lookup, together with a snapshot of the list's version; it is rebuilt on the next lookup after the list has been modified (items added, removed, or replaced), so lookups for keys that are not present in the list do not need to scan the list.
+    ///     Each item found via the index is also verified to still have the requested key, and the index is rebuilt if it does not (i.e. an item's key properties have been modified in place).
+    ///     A lookup for a new key given to an item in place, without otherwise modifying the list, can therefore miss until the list is next modified or the item's old key is looked up.
+    /// </remarks>
+    public class KubeKeyedList<TKey, TItem>
+        : List<TItem>
+        where TItem : class, IKubeKeyedListItem<TKey>
+    {
+        /// <summary>
+        ///     The comparer used to compare item keys.
+        /// </summary>
+        static readonly IEqualityComparer<TKey> KeyComparer = EqualityComparer<TKey>.Default;
+
+        /// <summary>
+        ///     The index of each item in the list, keyed by item key (<c>null</c> until the first lookup).
+        /// </summary>
+        /// <remarks>
+        ///     Never modified once built (a new index is built instead), so concurrent lookups are safe as long as the list itself is not being modified.
+        /// </remarks>
+        KeyIndex _index;
+
+        /// <summary>
+        ///     Create a new, empty, <see cref="KubeKeyedList{TKey, TItem}"/>.
+        /// </summary>
+        public KubeKeyedList()
+        {
+        }
+
+        /// <summary>
+        ///     Create a new <see cref="KubeKeyedList{TKey, TItem}"/> containing the specified items.
+        /// </summary>
+        /// <param name="items">
+        ///     The items to add to the list.
+        /// </param>
+        public KubeKeyedList(IEnumerable<TItem> items)
+            : base(items)
+        {
+        }
+
+        /// <summary>
+        ///     Determine whether the list contains an item with the specified key.
+        /// </summary>
+        /// <param name="key">
+        ///     The item key.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the list contains an item with the specified key; otherwise, <c>false</c>.
+        /// </returns>
+        public bool ContainsKey(TKey key) => IndexOfKey(key) != -1;
+
+        /// <summary>
+        ///     Find the item with the specified key.
+        /// </summary>
+        /// <param name="key">
+        ///     The item key.
+        /// </param>
+        /// <returns>
+        ///     The item, or <c>null</c> if the list does not contain an item with the specified key.
+        /// </returns>
+        public TItem FindItem(TKey key)
+        {
+            int itemIndex = IndexOfKey(key);
+            if (itemIndex == -1)
+                return null;
+
+            return this[itemIndex];
+        }
+
+        /// <summary>
+        ///     Attempt to find the item with the specified key.
+        /// </summary>
+        /// <param name="key">
+        ///     The item key.
+        /// </param>
+        /// <param name="item">
+        ///     Receives the item (or <c>null</c> if the list does not contain an item with the specified key).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the list contains an item with the specified key; otherwise, <c>false</c>.
+        /// </returns>
+        public bool TryGetItem(TKey key, out TItem item)
+        {
+            item = FindItem(key);
+
+            return item != null;
+        }
+
+        /// <summary>
+        ///     Get the index of the item with the specified key.
+        /// </summary>
+        /// <param name="key">
+        ///     The item key.
+        /// </param>
+        /// <returns>
+        ///     The index of the first item with the specified key, or -1 if the list does not contain an item with the specified key.
+        /// </returns>
+        public int IndexOfKey(TKey key)
+        {
+            if (key == null)
+                throw new ArgumentNullException(nameof(key));
+
+            KeyIndex index = _index;
+            if (index == null || index.IsStale(this))
+                index = BuildIndex();
+
+            if (!index.ItemIndexes.TryGetValue(key, out int itemIndex))
+                return -1;
+
+            if (HasKey(itemIndex, key))
+                return itemIndex;
+
+            // The item's key has been modified in place (which does not change the list's version).
+            index = BuildIndex();
+            if (!index.ItemIndexes.TryGetValue(key, out itemIndex))
+                return -1;
+
+            return itemIndex;
+        }
+
+        /// <summary>
+        ///     Determine whether the item at the specified index has the specified key.
+        /// </summary>
+        /// <param name="itemIndex">
+        ///     The item index (may be out of range).
+        /// </param>
+        /// <param name="key">
+        ///     The item key.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if there is an item at the specified index, and it has the specified key; otherwise, <c>false</c>.
+        /// </returns>
+        bool HasKey(int itemIndex, TKey key)
+        {
+            if (itemIndex >= Count)
+                return false;
+
+            TItem item = this[itemIndex];
+
+            return item != null && KeyComparer.Equals(item.ListKey, key);
+        }
+
+        /// <summary>
+        ///     Build (or rebuild) the key index from the list's current items.
+        /// </summary>
+        /// <returns>
+        ///     The new index.
+        /// </returns>
+        /// <remarks>
+        ///     Items with <c>null</c> keys are not indexed; if more than one item has the same key, only the first is indexed.
+        /// </remarks>
+        KeyIndex BuildIndex()
+        {
+            // Capture the list's version before reading its items.
+            var index = new KeyIndex(this);
+            for (int itemIndex = 0; itemIndex < Count; itemIndex++)
+            {
+                TItem item = this[itemIndex];
+                if (item == null)
+                    continue;
+
+                TKey key = item.ListKey;
+                if (key == null)
+                    continue;
+
+                index.ItemIndexes.TryAdd(key, itemIndex);
+            }
+
+            _index = index;
+
+            return index;
+        }
+
+        /// <summary>
+        ///     An index of the items in a <see cref="KubeKeyedList{TKey, TItem}"/>, and the version of the list that it was built from.
+        /// </summary>
+        sealed class KeyIndex
+        {
+            /// <summary>
+            ///     An enumerator for the list, captured when the index was built.
+            /// </summary>
+            /// <remarks>
+            ///     <see cref="List{T}"/> does not expose its version, but its enumerator captures the version and refuses to advance once the list has been modified.
+            /// </remarks>
+            readonly Enumerator _version;
+
+            /// <summary>
+            ///     The number of items in the list when the index was built.
+            /// </summary>
+            readonly int _count;
+
+            /// <summary>
+            ///     Create a new (empty) <see cref="KeyIndex"/> for the current version of the specified list.
+            /// </summary>
+            /// <param name="list">
+            ///     The list.
+            /// </param>
+            public KeyIndex(KubeKeyedList<TKey, TItem> list)
+            {
+                _version = list.GetEnumerator();
+                _count = list.Count;
+                ItemIndexes = new Dictionary<TKey, int>(list.Count, KeyComparer);
+            }
+
+            /// <summary>
+            ///     The index of each item in the list, keyed by item key.
+            /// </summary>
+            public Dictionary<TKey, int> ItemIndexes { get; }
+
+            /// <summary>
+            ///     Determine whether the list has been modified since the index was built.
+            /// </summary>
+            /// <param name="list">
+            ///     The list.
+            /// </param>
+            /// <returns>
+            ///     <c>true</c>, if the list has been modified; otherwise, <c>false</c>.
+            /// </returns>
+            public bool IsStale(KubeKeyedList<TKey, TItem> list)
+            {
+                if (list.Count != _count)
+                    return true;
+
+                // Advance a copy of the captured enumerator (the captured one is shared between lookups, and must remain at its starting position).
+                Enumerator version = _version;
+                try
+                {
+                    version.MoveNext();
+                }
+                catch (InvalidOperationException)
+                {
+                    return true; // Modified without changing the item count (e.g. an item was replaced).
+                }
+
+                return false;
+            }
+        }
+    }
+}
@@ -0,0 +1,433 @@
+using Newtonsoft.Json.Linq;
+using System.Collections;
+using System.Collections.Generic;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Helper methods used by models to implement deep-cloning and structural equality (see <see cref="IKubeModelEquatable{TModel}"/>).
+    /// </summary>
+    /// <remarks>
+    ///     All methods treat <c>null</c> collections as empty, and none of them use reflection.
+    /// </remarks>
+    public static class KubeModelEquality
+    {
+        /// <summary>
+        ///     Determine whether 2 models (either of which may be <c>null</c>) are equal.
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="left">
+        ///     The first model.
+        /// </param>
+        /// <param name="right">
+        ///     The second model.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the models are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool AreEqual<TModel>(TModel left, TModel right)
+            where TModel : class, IKubeModelEquatable<TModel>
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            if (left == null || right == null)
+                return false;
+
+            return left.Equals(right);
+        }
+
+        /// <summary>
+        ///     Determine whether 2 models (either of which may be <c>null</c>) are semantically equal.
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="left">
+        ///     The first model.
+        /// </param>
+        /// <param name="right">
+        ///     The second model.
+        /// </param>
+        /// <param name="ignoreStatus">
+        ///     Ignore differences in the status of resources?
+        /// </param>
+        /// <param name="ignoreManagedFields">
+        ///     Ignore differences in the managed-fields metadata of resources?
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the models are semantically equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool AreSemanticallyEqual<TModel>(TModel left, TModel right, bool ignoreStatus, bool ignoreManagedFields)
+            where TModel : class, IKubeModelEquatable<TModel>
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            if (left == null || right == null)
+                return false;
+
+            return left.IsSemanticallyEqual(right, ignoreStatus, ignoreManagedFields);
+        }
+
+        /// <summary>
+        ///     Determine whether 2 lists contain equal items (in the same order).
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The list item type.
+        /// </typeparam>
+        /// <param name="left">
+        ///     The first list (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="right">
+        ///     The second list (<c>null</c> is treated as empty).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the lists are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool ListsEqual<TItem>(List<TItem> left, List<TItem> right)
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            int count = GetCount(left);
+            if (count != GetCount(right))
+                return false;
+
+            EqualityComparer<TItem> comparer = EqualityComparer<TItem>.Default;
+            for (int index = 0; index < count; index++)
+            {
+                if (!comparer.Equals(left[index], right[index]))
+                    return false;
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Determine whether 2 lists contain semantically-equal models (in the same order).
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="left">
+        ///     The first list (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="right">
+        ///     The second list (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="ignoreStatus">
+        ///     Ignore differences in the status of resources?
+        /// </param>
+        /// <param name="ignoreManagedFields">
+        ///     Ignore differences in the managed-fields metadata of resources?
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the lists are semantically equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool ListsSemanticallyEqual<TModel>(List<TModel> left, List<TModel> right, bool ignoreStatus, bool ignoreManagedFields)
+            where TModel : class, IKubeModelEquatable<TModel>
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            int count = GetCount(left);
+            if (count != GetCount(right))
+                return false;
+
+            for (int index = 0; index < count; index++)
+            {
+                if (!AreSemanticallyEqual(left[index], right[index], ignoreStatus, ignoreManagedFields))
+                    return false;
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Determine whether 2 dictionaries contain the same keys, with equal values.
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The dictionary value type.
+        /// </typeparam>
+        /// <param name="left">
+        ///     The first dictionary (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="right">
+        ///     The second dictionary (<c>null</c> is treated as empty).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the dictionaries are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool DictionariesEqual<TValue>(Dictionary<string, TValue> left, Dictionary<string, TValue> right)
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            if (GetCount(left) != GetCount(right))
+                return false;
+
+            if (GetCount(left) == 0)
+                return true;
+
+            EqualityComparer<TValue> comparer = EqualityComparer<TValue>.Default;
+            foreach (KeyValuePair<string, TValue> entry in left)
+            {
+                if (!right.TryGetValue(entry.Key, out TValue rightValue) || !comparer.Equals(entry.Value, rightValue))
+                    return false;
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Determine whether 2 dictionaries contain the same keys, with semantically-equal models.
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="left">
+        ///     The first dictionary (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="right">
+        ///     The second dictionary (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="ignoreStatus">
+        ///     Ignore differences in the status of resources?
+        /// </param>
+        /// <param name="ignoreManagedFields">
+        ///     Ignore differences in the managed-fields metadata of resources?
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the dictionaries are semantically equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool DictionariesSemanticallyEqual<TModel>(Dictionary<string, TModel> left, Dictionary<string, TModel> right, bool ignoreStatus, bool ignoreManagedFields)
+            where TModel : class, IKubeModelEquatable<TModel>
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            if (GetCount(left) != GetCount(right))
+                return false;
+
+            if (GetCount(left) == 0)
+                return true;
+
+            foreach (KeyValuePair<string, TModel> entry in left)
+            {
+                if (!right.TryGetValue(entry.Key, out TModel rightValue) || !AreSemanticallyEqual(entry.Value, rightValue, ignoreStatus, ignoreManagedFields))
+                    return false;
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Determine whether 2 dictionaries of lists contain the same keys, with equal lists.
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The list item type.
+        /// </typeparam>
+        /// <param name="left">
+        ///     The first dictionary (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="right">
+        ///     The second dictionary (<c>null</c> is treated as empty).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the dictionaries are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool DictionariesOfListsEqual<TItem>(Dictionary<string, List<TItem>> left, Dictionary<string, List<TItem>> right)
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            if (GetCount(left) != GetCount(right))
+                return false;
+
+            if (GetCount(left) == 0)
+                return true;
+
+            foreach (KeyValuePair<string, List<TItem>> entry in left)
+            {
+                if (!right.TryGetValue(entry.Key, out List<TItem> rightValue) || !ListsEqual(entry.Value, rightValue))
+                    return false;
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Determine whether 2 sets of JSON extension data (i.e. properties not defined on a model) are equal.
+        /// </summary>
+        /// <param name="left">
+        ///     The first set of extension data (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="right">
+        ///     The second set of extension data (<c>null</c> is treated as empty).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the extension data is equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool ExtensionDataEqual(Dictionary<string, JToken> left, Dictionary<string, JToken> right)
+        {
+            if (ReferenceEquals(left, right))
+                return true;
+
+            if (GetCount(left) != GetCount(right))
+                return false;
+
+            if (GetCount(left) == 0)
+                return true;
+
+            foreach (KeyValuePair<string, JToken> entry in left)
+            {
+                if (!right.TryGetValue(entry.Key, out JToken rightValue) || !JToken.DeepEquals(entry.Value, rightValue))
+                    return false;
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Copy (immutable) items from one list to another.
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The list item type.
+        /// </typeparam>
+        /// <param name="source">
+        ///     The list to copy from (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="target">
+        ///     The list to copy to.
+        /// </param>
+        public static void CopyValues<TItem>(List<TItem> source, List<TItem> target)
+        {
+            if (GetCount(source) == 0)
+                return;
+
+            target.AddRange(source);
+        }
+
+        /// <summary>
+        ///     Copy (immutable) values from one dictionary to another.
+        /// </summary>
+        /// <typeparam name="TValue">
+        ///     The dictionary value type.
+        /// </typeparam>
+        /// <param name="source">
+        ///     The dictionary to copy from (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="target">
+        ///     The dictionary to copy to.
+        /// </param>
+        public static void CopyValues<TValue>(Dictionary<string, TValue> source, Dictionary<string, TValue> target)
+        {
+            if (GetCount(source) == 0)
+                return;
+
+            foreach (KeyValuePair<string, TValue> entry in source)
+                target[entry.Key] = entry.Value;
+        }
+
+        /// <summary>
+        ///     Copy deep clones of the models in one list to another.
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="source">
+        ///     The list to copy from (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="target">
+        ///     The list to copy to.
+        /// </param>
+        public static void CopyModels<TModel>(List<TModel> source, List<TModel> target)
+            where TModel : class, IKubeModelEquatable<TModel>
+        {
+            int count = GetCount(source);
+            if (count == 0)
+                return;
+
+            if (target.Capacity < target.Count + count)
+                target.Capacity = target.Count + count;
+
+            for (int index = 0; index < count; index++)
+                target.Add(source[index]?.DeepClone());
+        }
+
+        /// <summary>
+        ///     Copy deep clones of the models in one dictionary to another.
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="source">
+        ///     The dictionary to copy from (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="target">
+        ///     The dictionary to copy to.
+        /// </param>
+        public static void CopyModels<TModel>(Dictionary<string, TModel> source, Dictionary<string, TModel> target)
+            where TModel : class, IKubeModelEquatable<TModel>
+        {
+            if (GetCount(source) == 0)
+                return;
+
+            foreach (KeyValuePair<string, TModel> entry in source)
+                target[entry.Key] = entry.Value?.DeepClone();
+        }
+
+        /// <summary>
+        ///     Copy clones of the lists in one dictionary to another.
+        /// </summary>
+        /// <typeparam name="TItem">
+        ///     The (immutable) list item type.
+        /// </typeparam>
+        /// <param name="source">
+        ///     The dictionary to copy from (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="target">
+        ///     The dictionary to copy to.
+        /// </param>
+        public static void CopyLists<TItem>(Dictionary<string, List<TItem>> source, Dictionary<string, List<TItem>> target)
+        {
+            if (GetCount(source) == 0)
+                return;
+
+            foreach (KeyValuePair<string, List<TItem>> entry in source)
+                target[entry.Key] = entry.Value != null ? new List<TItem>(entry.Value) : null;
+        }
+
+        /// <summary>
+        ///     Copy deep clones of JSON extension data (i.e. properties not defined on a model) from one model to another.
+        /// </summary>
+        /// <param name="source">
+        ///     The extension data to copy from (<c>null</c> is treated as empty).
+        /// </param>
+        /// <param name="target">
+        ///     The extension data to copy to.
+        /// </param>
+        public static void CopyExtensionData(Dictionary<string, JToken> source, Dictionary<string, JToken> target)
+        {
+            if (GetCount(source) == 0)
+                return;
+
+            foreach (KeyValuePair<string, JToken> entry in source)
+                target[entry.Key] = entry.Value?.DeepClone();
+        }
+
+        /// <summary>
+        ///     Get the number of items in a collection (used when computing hash codes).
+        /// </summary>
+        /// <param name="collection">
+        ///     The collection (<c>null</c> is treated as empty).
+        /// </param>
+        /// <returns>
+        ///     The number of items in the collection.
+        /// </returns>
+        public static int GetCount(ICollection collection) => collection?.Count ?? 0;
+    }
+}
@@ -0,0 +1,163 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+
+namespace KubeClient.Models
+{
+    using Converters;
+
+    /// <summary>
+    ///     Metadata for a partition of the generated model types.
+    /// </summary>
+    /// <remarks>
+    ///     When models are generated with <c>--partition-by-group</c> (see generate_models.py), each partition's model types are only referenced from its generated registration entry point (e.g. <c>KnownModels.Apps.Register()</c>), so unused partitions can be excluded from the build or removed by the trimmer.
+    ///
+    ///     Partitions contribute to <see cref="KnownModels"/>, <see cref="Models.InternedStringProperties"/>, <see cref="StrategicMergePatch"/>, <see cref="Models.IndexedFields"/>, <see cref="Models.Converters.KubeModelConverters"/>, and <see cref="Models.Converters.KubeModelBinarySerializers"/> once they have been registered (via <see cref="KnownModels.Register(KubeModelPartition)"/>).
+    /// </remarks>
+    public sealed class KubeModelPartition
+    {
+        /// <summary>
+        ///     Create new <see cref="KubeModelPartition"/> metadata.
+        /// </summary>
+        /// <param name="name">
+        ///     The partition name.
+        /// </param>
+        /// <param name="resourceTypes">
+        ///     Resource model types (derived from <see cref="KubeResourceV1"/>), with their kinds and API versions (and the range of <paramref name="apiActions"/> that describes their APIs).
+        /// </param>
+        /// <param name="apiActions">
+        ///     API actions for the partition's resource model types (each with an index into <paramref name="apiPathTemplates"/>).
+        /// </param>
+        /// <param name="apiPathTemplates">
+        ///     API path templates for the partition's resource model types.
+        /// </param>
+        /// <param name="resourceListTypes">
+        ///     Resource-list model types (derived from <see cref="KubeResourceListV1"/>), with their kinds and API versions (and those of their items, if known).
+        /// </param>
+        /// <param name="internedStringProperties">
+        ///     Model properties whose string values are interned, with the parts of their values that are interned.
+        /// </param>
+        /// <param name="patchProperties">
+        ///     Model properties that have a patch strategy (or whose values contain properties that do), with their patch strategies, merge keys, and model types.
+        /// </param>
+        /// <param name="indexedFields">
+        ///     Model fields whose values can be used as index keys, with functions that get their values.
+        /// </param>
+        /// <param name="converters">
+        ///     Generated (streaming) JSON converters, with their model types.
+        /// </param>
+        /// <param name="binarySerializers">
+        ///     Generated binary serialisers, with their model types.
+        /// </param>
+        public KubeModelPartition(string name,
+            (Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount)[] resourceTypes,
+            (KubeAction action, int pathTemplate)[] apiActions,
+            string[] apiPathTemplates,
+            (Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion)[] resourceListTypes,
+            (Type modelType, string propertyName, InternedStrings internedStrings)[] internedStringProperties,
+            (Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)[] patchProperties,
+            (Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue)[] indexedFields,
+            (Type modelType, JsonConverter converter)[] converters,
+            (Type modelType, KubeModelBinarySerializer serializer)[] binarySerializers)
+        {
+            if (String.IsNullOrWhiteSpace(name))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
+
+            if (resourceTypes == null)
+                throw new ArgumentNullException(nameof(resourceTypes));
+
+            if (apiActions == null)
+                throw new ArgumentNullException(nameof(apiActions));
+
+            if (apiPathTemplates == null)
+                throw new ArgumentNullException(nameof(apiPathTemplates));
+
+            if (resourceListTypes == null)
+                throw new ArgumentNullException(nameof(resourceListTypes));
+
+            if (internedStringProperties == null)
+                throw new ArgumentNullException(nameof(internedStringProperties));
+
+            if (patchProperties == null)
+                throw new ArgumentNullException(nameof(patchProperties));
+
+            if (indexedFields == null)
+                throw new ArgumentNullException(nameof(indexedFields));
+
+            if (converters == null)
+                throw new ArgumentNullException(nameof(converters));
+
+            if (binarySerializers == null)
+                throw new ArgumentNullException(nameof(binarySerializers));
+
+            Name = name;
+            ResourceTypes = resourceTypes;
+            ApiActions = apiActions;
+            ApiPathTemplates = apiPathTemplates;
+            ResourceListTypes = resourceListTypes;
+            InternedStringProperties = internedStringProperties;
+            PatchProperties = patchProperties;
+            IndexedFields = indexedFields;
+            Converters = converters;
+            BinarySerializers = binarySerializers;
+        }
+
+        /// <summary>
+        ///     The partition name.
+        /// </summary>
+        public string Name { get; }
+
+        /// <summary>
+        ///     Resource model types (derived from <see cref="KubeResourceV1"/>), with their kinds and API versions (and the range of <see cref="ApiActions"/> that describes their APIs).
+        /// </summary>
+        public IReadOnlyList<(Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount)> ResourceTypes { get; }
+
+        /// <summary>
+        ///     API actions for the partition's resource model types (each with an index into <see cref="ApiPathTemplates"/>).
+        /// </summary>
+        public IReadOnlyList<(KubeAction action, int pathTemplate)> ApiActions { get; }
+
+        /// <summary>
+        ///     API path templates for the partition's resource model types.
+        /// </summary>
+        public IReadOnlyList<string> ApiPathTemplates { get; }
+
+        /// <summary>
+        ///     Resource-list model types (derived from <see cref="KubeResourceListV1"/>), with their kinds and API versions (and those of their items, if known).
+        /// </summary>
+        public IReadOnlyList<(Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion)> ResourceListTypes { get; }
+
+        /// <summary>
+        ///     Model properties whose string values are interned, with the parts of their values that are interned.
+        /// </summary>
+        public IReadOnlyList<(Type modelType, string propertyName, InternedStrings internedStrings)> InternedStringProperties { get; }
+
+        /// <summary>
+        ///     Model properties that have a patch strategy (or whose values contain properties that do), with their patch strategies, merge keys, and model types.
+        /// </summary>
+        public IReadOnlyList<(Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)> PatchProperties { get; }
+
+        /// <summary>
+        ///     Model fields whose values can be used as index keys, with functions that get their values.
+        /// </summary>
+        public IReadOnlyList<(Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue)> IndexedFields { get; }
+
+        /// <summary>
+        ///     Generated (streaming) JSON converters, with their model types.
+        /// </summary>
+        public IReadOnlyList<(Type modelType, JsonConverter converter)> Converters { get; }
+
+        /// <summary>
+        ///     Generated binary serialisers, with their model types.
+        /// </summary>
+        public IReadOnlyList<(Type modelType, KubeModelBinarySerializer serializer)> BinarySerializers { get; }
+
+        /// <summary>
+        ///     Get a string representation of the partition.
+        /// </summary>
+        /// <returns>
+        ///     The partition name.
+        /// </returns>
+        public override string ToString() => Name;
+    }
+}
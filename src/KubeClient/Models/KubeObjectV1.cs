@@ -75,6 +75,11 @@ namespace KubeClient.Models
                 if (kubeObjectAttribute != null)
                     return (kubeObjectAttribute.Kind, kubeObjectAttribute.ApiVersion);
 
+                // Projections have the same kind as the model they project.
+                var kubeProjectionAttribute = modelType.GetTypeInfo().GetCustomAttribute<KubeProjectionAttribute>();
+                if (kubeProjectionAttribute != null && kubeProjectionAttribute.ModelType != modelType)
+                    return GetKubeKind(kubeProjectionAttribute.ModelType);
+
                 return (null, null);
             });
 
@@ -0,0 +1,34 @@
+using System;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Mark a model class as a projection (containing only selected fields) of a Kubernetes resource model.
+    /// </summary>
+    /// <remarks>
+    ///     Projections take their kind and apiVersion from the projected model (see <see cref="KubeObjectV1.GetKubeKind(Type)"/>), but (unlike models marked with <see cref="KubeObjectAttribute"/>) are never returned by kind / apiVersion lookups, since the projected model already represents that kind.
+    /// </remarks>
+    [AttributeUsage(AttributeTargets.Class, AllowMultiple = false, Inherited = false)]
+    public class KubeProjectionAttribute
+        : Attribute
+    {
+        /// <summary>
+        ///     Mark the model class as a projection of a Kubernetes resource model.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The projected model type.
+        /// </param>
+        public KubeProjectionAttribute(Type modelType)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            ModelType = modelType;
+        }
+
+        /// <summary>
+        ///     The projected model type.
+        /// </summary>
+        public Type ModelType { get; }
+    }
+}
@@ -0,0 +1,146 @@
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     A bounded, thread-safe pool of strings used to de-duplicate low-cardinality model property values (e.g. kind, apiVersion, namespace, label keys / values, container images) as models are deserialised.
+    /// </summary>
+    /// <remarks>
+    ///     Unlike <see cref="String.Intern(string)"/>, pooled strings can be released (see <see cref="Clear"/>), and the pool stops accepting new strings once it is full.
+    ///
+    ///     Model properties whose values are interned are listed in <see cref="InternedStringProperties"/>.
+    /// </remarks>
+    public sealed class KubeStringPool
+    {
+        /// <summary>
+        ///     The default maximum number of strings in a pool.
+        /// </summary>
+        public const int DefaultCapacity = 32768;
+
+        /// <summary>
+        ///     The default maximum length of a pooled string.
+        /// </summary>
+        public const int DefaultMaxLength = 256;
+
+        /// <summary>
+        ///     Pooled strings (keyed by value).
+        /// </summary>
+        readonly ConcurrentDictionary<string, string> _strings = new ConcurrentDictionary<string, string>(StringComparer.Ordinal);
+
+        /// <summary>
+        ///     The (approximate) number of pooled strings.
+        /// </summary>
+        /// <remarks>
+        ///     Tracked separately because <see cref="ConcurrentDictionary{TKey, TValue}.Count"/> acquires all of the dictionary's locks.
+        /// </remarks>
+        int _count;
+
+        /// <summary>
+        ///     Create a new <see cref="KubeStringPool"/>.
+        /// </summary>
+        /// <param name="capacity">
+        ///     The maximum number of strings in the pool.
+        /// </param>
+        /// <param name="maxLength">
+        ///     The maximum length of a pooled string (longer strings are never pooled).
+        /// </param>
+        public KubeStringPool(int capacity = DefaultCapacity, int maxLength = DefaultMaxLength)
+        {
+            if (capacity < 0)
+                throw new ArgumentOutOfRangeException(nameof(capacity), capacity, "Capacity cannot be less than 0.");
+
+            if (maxLength < 0)
+                throw new ArgumentOutOfRangeException(nameof(maxLength), maxLength, "Maximum length cannot be less than 0.");
+
+            Capacity = capacity;
+            MaxLength = maxLength;
+        }
+
+        /// <summary>
+        ///     The pool used when deserialising models (<c>null</c>, the default, disables string interning).
+        /// </summary>
+        /// <remarks>
+        ///     Used by both <see cref="ContractResolvers.KubeContractResolver"/> and generated model converters (see <see cref="Converters.KubeModelConverters"/>).
+        ///
+        ///     Interning is opt-in (e.g. <c>KubeStringPool.Shared = new KubeStringPool();</c>), since it only pays for itself when many models with the same property values are kept in memory (e.g. in an informer's store).
+        /// </remarks>
+        public static KubeStringPool Shared { get; set; }
+
+        /// <summary>
+        ///     The maximum number of strings in the pool.
+        /// </summary>
+        public int Capacity { get; }
+
+        /// <summary>
+        ///     The maximum length of a pooled string.
+        /// </summary>
+        public int MaxLength { get; }
+
+        /// <summary>
+        ///     The (approximate) number of strings in the pool.
+        /// </summary>
+        public int Count => Volatile.Read(ref _count);
+
+        /// <summary>
+        ///     Get the pooled equivalent of the specified string (adding it to the pool, if there is room).
+        /// </summary>
+        /// <param name="value">
+        ///     The string (can be <c>null</c>).
+        /// </param>
+        /// <returns>
+        ///     The pooled string, or <paramref name="value"/> if it is not (and cannot be) pooled.
+        /// </returns>
+        public string Intern(string value)
+        {
+            if (value == null || value.Length > MaxLength)
+                return value;
+
+            if (value.Length == 0)
+                return String.Empty;
+
+            if (_strings.TryGetValue(value, out string pooledValue))
+                return pooledValue;
+
+            if (Count >= Capacity)
+                return value;
+
+            pooledValue = _strings.GetOrAdd(value, value);
+            if (ReferenceEquals(pooledValue, value))
+                Interlocked.Increment(ref _count);
+
+            return pooledValue;
+        }
+
+        /// <summary>
+        ///     Remove all strings from the pool.
+        /// </summary>
+        /// <remarks>
+        ///     Strings that have already been interned are unaffected (they are simply no longer shared with strings interned in future).
+        /// </remarks>
+        public void Clear()
+        {
+            _strings.Clear();
+            Interlocked.Exchange(ref _count, 0);
+        }
+
+        /// <summary>
+        ///     Get the pooled equivalent of the specified string, using the <see cref="Shared"/> pool (if any).
+        /// </summary>
+        /// <param name="value">
+        ///     The string (can be <c>null</c>).
+        /// </param>
+        /// <returns>
+        ///     The pooled string, or <paramref name="value"/> if string interning is disabled (or it cannot be pooled).
+        /// </returns>
+        public static string InternShared(string value)
+        {
+            KubeStringPool pool = Shared;
+            if (pool == null)
+                return value;
+
+            return pool.Intern(value);
+        }
+    }
+}
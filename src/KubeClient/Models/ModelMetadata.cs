@@ -59,27 +59,39 @@ namespace KubeClient.Models
 
                 var lookup = new Dictionary<Type, (string kind, string apiVersion)>();
 
-                foreach (Type modelType in assemblies.SelectMany(assembly => assembly.GetTypes()))
+                foreach (Assembly assembly in assemblies)
                 {
-                    TypeInfo modelTypeInfo = modelType.GetTypeInfo();
-                    if (!modelTypeInfo.IsPublic)
-                        continue;
+                    // Metadata for the built-in model types is generated, so there's no need to scan for them.
+                    if (KnownModels.IsModelAssembly(assembly))
+                    {
+                        foreach (var knownModel in KnownModels.ResourceTypeToKind)
+                            lookup[knownModel.Key] = knownModel.Value;
 
-                    if (!modelTypeInfo.IsClass)
                         continue;
+                    }
 
-                    if (modelTypeInfo.IsAbstract)
-                        continue;
+                    foreach (Type modelType in assembly.GetTypes())
+                    {
+                        TypeInfo modelTypeInfo = modelType.GetTypeInfo();
+                        if (!modelTypeInfo.IsPublic)
+                            continue;
 
-                    if (!KubeResourceV1Type.IsAssignableFrom(modelType))
-                        continue;
+                        if (!modelTypeInfo.IsClass)
+                            continue;
 
-                    var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
-                    if (kubeObjectAttribute == null)
-                        continue;
+                        if (modelTypeInfo.IsAbstract)
+                            continue;
+
+                        if (!KubeResourceV1Type.IsAssignableFrom(modelType))
+                            continue;
+
+                        var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
+                        if (kubeObjectAttribute == null)
+                            continue;
 
-                    var kubeKind = (kind: kubeObjectAttribute.Kind, apiVersion: kubeObjectAttribute.ApiVersion);
-                    lookup[modelType] = kubeKind;
+                        var kubeKind = (kind: kubeObjectAttribute.Kind, apiVersion: kubeObjectAttribute.ApiVersion);
+                        lookup[modelType] = kubeKind;
+                    }
                 }
 
                 return lookup;
@@ -112,27 +124,39 @@ namespace KubeClient.Models
 
                 var lookup = new Dictionary<Type, (string kind, string apiVersion)>();
 
-                foreach (Type modelType in assemblies.SelectMany(assembly => assembly.GetTypes()))
+                foreach (Assembly assembly in assemblies)
                 {
-                    TypeInfo modelTypeInfo = modelType.GetTypeInfo();
-                    if (!modelTypeInfo.IsPublic)
-                        continue;
+                    // Metadata for the built-in model types is generated, so there's no need to scan for them.
+                    if (KnownModels.IsModelAssembly(assembly))
+                    {
+                        foreach (var knownModel in KnownModels.ResourceListTypeToKind)
+                            lookup[knownModel.Key] = knownModel.Value;
 
-                    if (!modelTypeInfo.IsClass)
                         continue;
+                    }
 
-                    if (modelTypeInfo.IsAbstract)
-                        continue;
+                    foreach (Type modelType in assembly.GetTypes())
+                    {
+                        TypeInfo modelTypeInfo = modelType.GetTypeInfo();
+                        if (!modelTypeInfo.IsPublic)
+                            continue;
 
-                    if (!KubeResourceListV1Type.IsAssignableFrom(modelType))
-                        continue;
+                        if (!modelTypeInfo.IsClass)
+                            continue;
 
-                    var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
-                    if (kubeObjectAttribute == null)
-                        continue;
+                        if (modelTypeInfo.IsAbstract)
+                            continue;
+
+                        if (!KubeResourceListV1Type.IsAssignableFrom(modelType))
+                            continue;
+
+                        var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
+                        if (kubeObjectAttribute == null)
+                            continue;
 
-                    var kubeKind = (kind: kubeObjectAttribute.Kind, apiVersion: kubeObjectAttribute.ApiVersion);
-                    lookup[modelType] = kubeKind;
+                        var kubeKind = (kind: kubeObjectAttribute.Kind, apiVersion: kubeObjectAttribute.ApiVersion);
+                        lookup[modelType] = kubeKind;
+                    }
                 }
 
                 return lookup;
@@ -165,27 +189,39 @@ namespace KubeClient.Models
 
                 var lookup = new Dictionary<(string kind, string apiVersion), Type>();
 
-                foreach (Type modelType in assemblies.SelectMany(assembly => assembly.GetTypes()))
+                foreach (Assembly assembly in assemblies)
                 {
-                    TypeInfo modelTypeInfo = modelType.GetTypeInfo();
-                    if (!modelTypeInfo.IsPublic)
-                        continue;
+                    // Metadata for the built-in model types is generated, so there's no need to scan for them.
+                    if (KnownModels.IsModelAssembly(assembly))
+                    {
+                        foreach (var knownModel in KnownModels.KindToResourceType)
+                            lookup[knownModel.Key] = knownModel.Value;
 
-                    if (!modelTypeInfo.IsClass)
                         continue;
+                    }
 
-                    if (modelTypeInfo.IsAbstract)
-                        continue;
+                    foreach (Type modelType in assembly.GetTypes())
+                    {
+                        TypeInfo modelTypeInfo = modelType.GetTypeInfo();
+                        if (!modelTypeInfo.IsPublic)
+                            continue;
 
-                    if (!KubeResourceV1Type.IsAssignableFrom(modelType))
-                        continue;
+                        if (!modelTypeInfo.IsClass)
+                            continue;
 
-                    var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
-                    if (kubeObjectAttribute == null)
-                        continue;
+                        if (modelTypeInfo.IsAbstract)
+                            continue;
+
+                        if (!KubeResourceV1Type.IsAssignableFrom(modelType))
+                            continue;
+
+                        var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
+                        if (kubeObjectAttribute == null)
+                            continue;
 
-                    var kubeKind = (kind: kubeObjectAttribute.Kind, apiVersion: kubeObjectAttribute.ApiVersion);
-                    lookup[kubeKind] = modelType;
+                        var kubeKind = (kind: kubeObjectAttribute.Kind, apiVersion: kubeObjectAttribute.ApiVersion);
+                        lookup[kubeKind] = modelType;
+                    }
                 }
 
                 return lookup;
@@ -218,31 +254,43 @@ namespace KubeClient.Models
 
                 var lookup = new Dictionary<(string kind, string apiVersion), Type>();
 
-                foreach (Type modelType in assemblies.SelectMany(assembly => assembly.GetTypes()))
+                foreach (Assembly assembly in assemblies)
                 {
-                    TypeInfo modelTypeInfo = modelType.GetTypeInfo();
-                    if (!modelTypeInfo.IsPublic)
-                        continue;
+                    // Metadata for the built-in model types is generated, so there's no need to scan for them.
+                    if (KnownModels.IsModelAssembly(assembly))
+                    {
+                        foreach (var knownModel in KnownModels.ItemKindToResourceListType)
+                            lookup[knownModel.Key] = knownModel.Value;
 
-                    if (!modelTypeInfo.IsClass)
                         continue;
+                    }
 
-                    if (modelTypeInfo.IsAbstract)
-                        continue;
+                    foreach (Type modelType in assembly.GetTypes())
+                    {
+                        TypeInfo modelTypeInfo = modelType.GetTypeInfo();
+                        if (!modelTypeInfo.IsPublic)
+                            continue;
 
-                    if (!KubeResourceListV1Type.IsAssignableFrom(modelType))
-                        continue;
+                        if (!modelTypeInfo.IsClass)
+                            continue;
 
-                    var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
-                    if (kubeObjectAttribute == null)
-                        continue;
+                        if (modelTypeInfo.IsAbstract)
+                            continue;
 
-                    var kubeListItemAttribute = modelTypeInfo.GetCustomAttribute<KubeListItemAttribute>();
-                    if (kubeListItemAttribute == null)
-                        continue;
+                        if (!KubeResourceListV1Type.IsAssignableFrom(modelType))
+                            continue;
+
+                        var kubeObjectAttribute = modelTypeInfo.GetCustomAttribute<KubeObjectAttribute>();
+                        if (kubeObjectAttribute == null)
+                            continue;
 
-                    var kubeKind = (kind: kubeListItemAttribute.Kind, apiVersion: kubeListItemAttribute.ApiVersion);
-                    lookup[kubeKind] = modelType;
+                        var kubeListItemAttribute = modelTypeInfo.GetCustomAttribute<KubeListItemAttribute>();
+                        if (kubeListItemAttribute == null)
+                            continue;
+
+                        var kubeKind = (kind: kubeListItemAttribute.Kind, apiVersion: kubeListItemAttribute.ApiVersion);
+                        lookup[kubeKind] = modelType;
+                    }
                 }
 
                 return lookup;
@@ -0,0 +1,23 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     PartialObjectMetadataList contains a list of objects containing only their metadata.
+    /// </summary>
+    /// <remarks>
+    ///     Returned by the API server (in place of the full resource list) when a request specifies "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1" in its "Accept" header.
+    /// </remarks>
+    [KubeListItem("PartialObjectMetadata", "meta.k8s.io/v1")]
+    [KubeObject("PartialObjectMetadataList", "meta.k8s.io/v1")]
+    public class PartialObjectMetadataListV1 : KubeResourceListV1<PartialObjectMetadataV1>
+    {
+        /// <summary>
+        ///     Items contains each of the included items.
+        /// </summary>
+        [JsonProperty("items", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+        public override List<PartialObjectMetadataV1> Items { get; } = new List<PartialObjectMetadataV1>();
+    }
+}
@@ -0,0 +1,17 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     PartialObjectMetadata is a generic representation of any object with ObjectMeta. It allows clients to get access to a particular ObjectMeta schema without knowing the details of the version.
+    /// </summary>
+    /// <remarks>
+    ///     Returned by the API server (in place of the full resource) when a request specifies "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1" in its "Accept" header.
+    /// </remarks>
+    [KubeObject("PartialObjectMetadata", "meta.k8s.io/v1")]
+    public class PartialObjectMetadataV1 : KubeResourceV1
+    {
+    }
+}
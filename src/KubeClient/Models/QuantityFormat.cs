@@ -0,0 +1,23 @@
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     The formats used to represent a <see cref="QuantityResource"/> as a string.
+    /// </summary>
+    public enum QuantityFormat
+    {
+        /// <summary>
+        ///     Decimal SI suffixes (e.g. "1500m", "2k", "3G").
+        /// </summary>
+        DecimalSI = 0,
+
+        /// <summary>
+        ///     Binary SI suffixes (e.g. "512Ki", "2Gi").
+        /// </summary>
+        BinarySI = 1,
+
+        /// <summary>
+        ///     Decimal exponents (e.g. "12e6", "1e-3").
+        /// </summary>
+        DecimalExponent = 2
+    }
+}
@@ -1,14 +1,938 @@
 using Newtonsoft.Json;
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 
 namespace KubeClient.Models
 {
+    using Converters;
+
     /// <summary>
-    ///     No description provided.
+    ///     A fixed-point representation of a number (e.g. "1500m", "2Gi", or "12e6"), used for resource requests, limits, and capacity.
     /// </summary>
-    [KubeObject("Quantity", "resource")]
-    public class QuantityResource
+    /// <remarks>
+    ///     The value is parsed once (when it is created) and stored as a 64-bit integer with a decimal scale, so arithmetic and comparison do not re-parse strings.
+    ///
+    ///     As with the Kubernetes API, precision finer than nano-units (1n) is rounded up, and the canonical string representation (which is cached for parsed values) uses the format of the original string.
+    ///     Values whose magnitude (in nano-units) cannot be represented as a 64-bit integer are not supported (operations that would produce them throw <see cref="OverflowException"/>).
+    /// </remarks>
+    [JsonConverter(typeof(QuantityResourceConverter))]
+    public readonly struct QuantityResource
+        : IEquatable<QuantityResource>, IComparable<QuantityResource>, IComparable
     {
+        /// <summary>
+        ///     The smallest supported scale (nano-units).
+        /// </summary>
+        const int MinScale = -9;
+
+        /// <summary>
+        ///     The largest scale that has a decimal SI suffix (exa-units).
+        /// </summary>
+        const int MaxSuffixScale = 18;
+
+        /// <summary>
+        ///     Powers of 10 that can be represented as an <see cref="Int64"/>, indexed by exponent.
+        /// </summary>
+        static readonly long[] PowersOf10 =
+        {
+            1L,
+            10L,
+            100L,
+            1000L,
+            10000L,
+            100000L,
+            1000000L,
+            10000000L,
+            100000000L,
+            1000000000L,
+            10000000000L,
+            100000000000L,
+            1000000000000L,
+            10000000000000L,
+            100000000000000L,
+            1000000000000000L,
+            10000000000000000L,
+            100000000000000000L,
+            1000000000000000000L
+        };
+
+        /// <summary>
+        ///     Binary SI suffixes, indexed by power of 1024.
+        /// </summary>
+        static readonly string[] BinarySuffixes = { "", "Ki", "Mi", "Gi", "Ti", "Pi", "Ei" };
+
+        /// <summary>
+        ///     The unscaled value.
+        /// </summary>
+        readonly long _value;
+
+        /// <summary>
+        ///     The power of 10 by which the unscaled value is multiplied.
+        /// </summary>
+        readonly int _scale;
+
+        /// <summary>
+        ///     The format used to represent the value as a string.
+        /// </summary>
+        readonly QuantityFormat _format;
+
+        /// <summary>
+        ///     The cached canonical string representation of the value (if known).
+        /// </summary>
+        readonly string _canonicalValue;
+
+        /// <summary>
+        ///     Create a new <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <param name="value">
+        ///     The unscaled value.
+        /// </param>
+        /// <param name="scale">
+        ///     The power of 10 by which the unscaled value is multiplied (e.g. -3 for milli-units); values finer than -9 (nano-units) are rounded up.
+        /// </param>
+        /// <param name="format">
+        ///     The format used to represent the value as a string.
+        /// </param>
+        public QuantityResource(long value, int scale = 0, QuantityFormat format = QuantityFormat.DecimalSI)
+            : this(value, scale, format, canonicalValue: null)
+        {
+            if (scale < MinScale && value != 0)
+            {
+                _value = Rescale(value, scale, MinScale);
+                _scale = MinScale;
+            }
+        }
+
+        /// <summary>
+        ///     Create a new <see cref="QuantityResource"/> (without validating the scale).
+        /// </summary>
+        /// <param name="value">
+        ///     The unscaled value.
+        /// </param>
+        /// <param name="scale">
+        ///     The power of 10 by which the unscaled value is multiplied.
+        /// </param>
+        /// <param name="format">
+        ///     The format used to represent the value as a string.
+        /// </param>
+        /// <param name="canonicalValue">
+        ///     The canonical string representation of the value (if known).
+        /// </param>
+        QuantityResource(long value, int scale, QuantityFormat format, string canonicalValue)
+        {
+            _value = value;
+            _scale = value != 0 ? scale : 0;
+            _format = format;
+            _canonicalValue = canonicalValue;
+        }
+
+        /// <summary>
+        ///     The format used to represent the value as a string.
+        /// </summary>
+        public QuantityFormat Format => _format;
+
+        /// <summary>
+        ///     Is the value zero?
+        /// </summary>
+        public bool IsZero => _value == 0;
+
+        /// <summary>
+        ///     The sign of the value (-1, 0, or 1).
+        /// </summary>
+        public int Sign => Math.Sign(_value);
+
+        /// <summary>
+        ///     The value, rounded up (away from zero) to the nearest whole unit.
+        /// </summary>
+        /// <exception cref="OverflowException">
+        ///     The value cannot be represented as an <see cref="Int64"/>.
+        /// </exception>
+        public long Value => ScaledValue(0);
+
+        /// <summary>
+        ///     The value in milli-units (e.g. milli-CPUs), rounded up (away from zero) to the nearest milli-unit.
+        /// </summary>
+        /// <exception cref="OverflowException">
+        ///     The value cannot be represented as an <see cref="Int64"/>.
+        /// </exception>
+        public long MilliValue => ScaledValue(-3);
+
+        /// <summary>
+        ///     Get the value at the specified scale, rounded up (away from zero).
+        /// </summary>
+        /// <param name="scale">
+        ///     The power of 10 that represents one unit of the result (e.g. -3 for milli-units, or 6 for mega-units).
+        /// </param>
+        /// <returns>
+        ///     The scaled value.
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The value cannot be represented as an <see cref="Int64"/> at the specified scale.
+        /// </exception>
+        public long ScaledValue(int scale) => Rescale(_value, _scale, scale);
+
+        /// <summary>
+        ///     Convert the value to a <see cref="Decimal"/>.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="Decimal"/> value.
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The value cannot be represented as a <see cref="Decimal"/>.
+        /// </exception>
+        public decimal ToDecimal()
+        {
+            decimal value = _value;
+
+            for (int scale = _scale; scale > 0; scale--)
+                value *= 10m;
+
+            for (int scale = _scale; scale < 0; scale++)
+                value /= 10m;
+
+            return value;
+        }
+
+        /// <summary>
+        ///     Convert the value to a <see cref="Double"/> (which may lose precision).
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="Double"/> value.
+        /// </returns>
+        public double ToDouble() => _value * Math.Pow(10, _scale);
+
+        /// <summary>
+        ///     Add another <see cref="QuantityResource"/> to the <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     The sum (using the format of the <see cref="QuantityResource"/>, or that of <paramref name="other"/> if the <see cref="QuantityResource"/> is zero).
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The sum cannot be represented.
+        /// </exception>
+        public QuantityResource Add(QuantityResource other)
+        {
+            if (other._value == 0)
+                return this;
+
+            if (_value == 0)
+                return other;
+
+            if (!TryAlign(this, other, out long value, out long otherValue, out int scale))
+                throw new OverflowException("The sum of the quantities cannot be represented.");
+
+            return new QuantityResource(
+                checked(value + otherValue), scale, _format, canonicalValue: null
+            );
+        }
+
+        /// <summary>
+        ///     Subtract another <see cref="QuantityResource"/> from the <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     The difference (using the format of the <see cref="QuantityResource"/>, or that of <paramref name="other"/> if the <see cref="QuantityResource"/> is zero).
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The difference cannot be represented.
+        /// </exception>
+        public QuantityResource Subtract(QuantityResource other) => Add(other.Negate());
+
+        /// <summary>
+        ///     Negate the <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <returns>
+        ///     The negated value (using the same format).
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The negated value cannot be represented.
+        /// </exception>
+        public QuantityResource Negate() => new QuantityResource(checked(-_value), _scale, _format, canonicalValue: null);
+
+        /// <summary>
+        ///     Multiply the <see cref="QuantityResource"/> by an integer.
+        /// </summary>
+        /// <param name="multiplier">
+        ///     The multiplier.
+        /// </param>
+        /// <returns>
+        ///     The product (using the same format).
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The product cannot be represented.
+        /// </exception>
+        public QuantityResource Multiply(long multiplier) => new QuantityResource(checked(_value * multiplier), _scale, _format, canonicalValue: null);
+
+        /// <summary>
+        ///     Compare the <see cref="QuantityResource"/> with another <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     A negative number, if the <see cref="QuantityResource"/> is less than the other <see cref="QuantityResource"/>; 0, if they are equal; otherwise, a positive number.
+        /// </returns>
+        public int CompareTo(QuantityResource other)
+        {
+            if (_scale == other._scale)
+                return _value.CompareTo(other._value);
+
+            if (TryAlign(this, other, out long value, out long otherValue, out _))
+                return value.CompareTo(otherValue);
+
+            // The value with the larger scale could not be rescaled, so its magnitude is greater than that of the other value.
+            if (_scale > other._scale)
+                return Math.Sign(_value);
+
+            return -Math.Sign(other._value);
+        }
+
+        /// <summary>
+        ///     Compare the <see cref="QuantityResource"/> with another object.
+        /// </summary>
+        /// <param name="other">
+        ///     The other object.
+        /// </param>
+        /// <returns>
+        ///     A negative number, if the <see cref="QuantityResource"/> is less than the other object; 0, if they are equal; otherwise, a positive number.
+        /// </returns>
+        /// <exception cref="ArgumentException">
+        ///     The other object is not a <see cref="QuantityResource"/>.
+        /// </exception>
+        int IComparable.CompareTo(object other)
+        {
+            if (other == null)
+                return 1;
+
+            if (other is QuantityResource otherQuantity)
+                return CompareTo(otherQuantity);
+
+            throw new ArgumentException($"Cannot compare a {nameof(QuantityResource)} with a value of type '{other.GetType().FullName}'.", nameof(other));
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="QuantityResource"/> is equal to another <see cref="QuantityResource"/> (regardless of their formats).
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="QuantityResource"/>s are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public bool Equals(QuantityResource other) => CompareTo(other) == 0;
+
+        /// <summary>
+        ///     Determine whether the <see cref="QuantityResource"/> is equal to another object.
+        /// </summary>
+        /// <param name="other">
+        ///     The other object.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the other object is a <see cref="QuantityResource"/> that is equal to the <see cref="QuantityResource"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public override bool Equals(object other) => other is QuantityResource otherQuantity && Equals(otherQuantity);
+
+        /// <summary>
+        ///     Get a hash code to represent the <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <returns>
+        ///     The hash code (equal values have the same hash code, regardless of their scales and formats).
+        /// </returns>
+        public override int GetHashCode()
+        {
+            (long value, int scale) = Normalize(_value, _scale);
+
+            return HashCode.Combine(value, scale);
+        }
+
+        /// <summary>
+        ///     Get the canonical string representation of the <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <returns>
+        ///     The canonical string representation (e.g. "1500m" or "2Gi").
+        /// </returns>
+        public override string ToString() => _canonicalValue ?? FormatValue(_value, _scale, _format);
+
+        /// <summary>
+        ///     Parse a <see cref="QuantityResource"/> from a string.
+        /// </summary>
+        /// <param name="value">
+        ///     The string to parse (e.g. "1500m", "2Gi", or "12e6").
+        /// </param>
+        /// <returns>
+        ///     The parsed <see cref="QuantityResource"/>.
+        /// </returns>
+        /// <exception cref="FormatException">
+        ///     The string is not a valid quantity (or its value cannot be represented).
+        /// </exception>
+        public static QuantityResource Parse(string value)
+        {
+            if (value == null)
+                throw new ArgumentNullException(nameof(value));
+
+            if (!TryParse(value, out QuantityResource quantity))
+                throw new FormatException($"The value '{value}' is not a valid quantity (or cannot be represented as a {nameof(QuantityResource)}).");
+
+            return quantity;
+        }
+
+        /// <summary>
+        ///     Attempt to parse a <see cref="QuantityResource"/> from a string.
+        /// </summary>
+        /// <param name="value">
+        ///     The string to parse (e.g. "1500m", "2Gi", or "12e6").
+        /// </param>
+        /// <param name="quantity">
+        ///     Receives the parsed <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the string was successfully parsed; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool TryParse(string value, out QuantityResource quantity)
+        {
+            quantity = default;
+
+            if (String.IsNullOrEmpty(value))
+                return false;
+
+            int position = 0;
+            bool isNegative = false;
+            if (value[0] == '+' || value[0] == '-')
+            {
+                isNegative = value[0] == '-';
+                position++;
+            }
+
+            long mantissa = 0;
+            int scale = 0;
+            int digitCount = 0;
+            bool isFraction = false;
+            for (; position < value.Length; position++)
+            {
+                char current = value[position];
+                if (current == '.' && !isFraction)
+                {
+                    isFraction = true;
+
+                    continue;
+                }
+
+                if (current < '0' || current > '9')
+                    break;
+
+                digitCount++;
+
+                int digit = current - '0';
+                if (mantissa <= (Int64.MaxValue - digit) / 10)
+                {
+                    mantissa = mantissa * 10 + digit;
+                    if (isFraction)
+                        scale--;
+                }
+                else if (digit != 0)
+                    return false; // Too many significant digits.
+                else if (!isFraction)
+                    scale++; // Trailing zeros in the whole part.
+            }
+
+            if (digitCount == 0)
+                return false;
+
+            if (!TryParseSuffix(value, position, out int suffixExponent, out int binaryPower, out QuantityFormat format))
+                return false;
+
+            long fullScale = (long)scale + suffixExponent;
+            if (fullScale < Int32.MinValue / 2 || fullScale > Int32.MaxValue / 2)
+                return false;
+
+            if (isNegative)
+                mantissa = -mantissa;
+
+            (mantissa, scale) = Normalize(mantissa, (int)fullScale);
+
+            try
+            {
+                if (binaryPower != 0)
+                {
+                    mantissa = checked(mantissa * (1L << (10 * binaryPower)));
+                    (mantissa, scale) = Normalize(mantissa, scale);
+                }
+
+                if (scale < MinScale)
+                {
+                    mantissa = Rescale(mantissa, scale, MinScale);
+                    (mantissa, scale) = Normalize(mantissa, MinScale);
+                }
+            }
+            catch (OverflowException)
+            {
+                return false;
+            }
+
+            string canonicalValue = FormatValue(mantissa, scale, format);
+            if (String.Equals(canonicalValue, value, StringComparison.Ordinal))
+                canonicalValue = value;
+
+            quantity = new QuantityResource(mantissa, scale, format, canonicalValue);
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Calculate the sum of a sequence of <see cref="QuantityResource"/>s.
+        /// </summary>
+        /// <param name="quantities">
+        ///     The <see cref="QuantityResource"/>s to add.
+        /// </param>
+        /// <returns>
+        ///     The sum (zero, if the sequence is empty).
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The sum cannot be represented.
+        /// </exception>
+        public static QuantityResource Sum(IEnumerable<QuantityResource> quantities)
+        {
+            if (quantities == null)
+                throw new ArgumentNullException(nameof(quantities));
+
+            QuantityResource sum = default;
+            foreach (QuantityResource quantity in quantities)
+                sum = sum.Add(quantity);
+
+            return sum;
+        }
+
+        /// <summary>
+        ///     Parse the suffix of a quantity.
+        /// </summary>
+        /// <param name="value">
+        ///     The quantity string.
+        /// </param>
+        /// <param name="position">
+        ///     The position of the suffix within the string.
+        /// </param>
+        /// <param name="exponent">
+        ///     Receives the power of 10 represented by the suffix.
+        /// </param>
+        /// <param name="binaryPower">
+        ///     Receives the power of 1024 represented by the suffix.
+        /// </param>
+        /// <param name="format">
+        ///     Receives the format indicated by the suffix.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the suffix is valid; otherwise, <c>false</c>.
+        /// </returns>
+        static bool TryParseSuffix(string value, int position, out int exponent, out int binaryPower, out QuantityFormat format)
+        {
+            exponent = 0;
+            binaryPower = 0;
+            format = QuantityFormat.DecimalSI;
+
+            int suffixLength = value.Length - position;
+            if (suffixLength == 0)
+                return true;
+
+            char first = value[position];
+            if (suffixLength == 1)
+            {
+                switch (first)
+                {
+                    case 'n': exponent = -9; return true;
+                    case 'u': exponent = -6; return true;
+                    case 'm': exponent = -3; return true;
+                    case 'k': exponent = 3; return true;
+                    case 'M': exponent = 6; return true;
+                    case 'G': exponent = 9; return true;
+                    case 'T': exponent = 12; return true;
+                    case 'P': exponent = 15; return true;
+                    case 'E': exponent = 18; return true;
+                    default: return false;
+                }
+            }
+
+            if (suffixLength == 2 && value[position + 1] == 'i')
+            {
+                format = QuantityFormat.BinarySI;
+                binaryPower = Array.IndexOf(BinarySuffixes, value.Substring(position));
+
+                return binaryPower > 0;
+            }
+
+            if (first == 'e' || first == 'E')
+            {
+                format = QuantityFormat.DecimalExponent;
+
+                string exponentValue = value.Substring(position + 1);
+                if (!Char.IsDigit(exponentValue[exponentValue.Length - 1]))
+                    return false;
+
+                return Int32.TryParse(exponentValue, NumberStyles.AllowLeadingSign, CultureInfo.InvariantCulture, out exponent);
+            }
+
+            return false;
+        }
+
+        /// <summary>
+        ///     Get the canonical string representation of a value.
+        /// </summary>
+        /// <param name="value">
+        ///     The unscaled value.
+        /// </param>
+        /// <param name="scale">
+        ///     The power of 10 by which the unscaled value is multiplied.
+        /// </param>
+        /// <param name="format">
+        ///     The format used to represent the value.
+        /// </param>
+        /// <returns>
+        ///     The canonical string representation.
+        /// </returns>
+        static string FormatValue(long value, int scale, QuantityFormat format)
+        {
+            if (value == 0)
+                return "0";
+
+            (value, scale) = Normalize(value, scale);
+
+            // Whole numbers of at least 1Ki use the largest binary suffix that represents them exactly; everything else falls back to decimal SI.
+            if (format == QuantityFormat.BinarySI && scale >= 0 && scale < PowersOf10.Length)
+            {
+                long wholeValue;
+                try
+                {
+                    wholeValue = checked(value * PowersOf10[scale]);
+                }
+                catch (OverflowException)
+                {
+                    wholeValue = 0;
+                }
+
+                if (wholeValue >= 1024 || wholeValue <= -1024)
+                {
+                    int binaryPower = 0;
+                    while (binaryPower < BinarySuffixes.Length - 1 && wholeValue % 1024 == 0)
+                    {
+                        wholeValue /= 1024;
+                        binaryPower++;
+                    }
+
+                    return wholeValue.ToString(CultureInfo.InvariantCulture) + BinarySuffixes[binaryPower];
+                }
+            }
+
+            // Exponents are always a multiple of 3.
+            int exponent = scale >= 0 ? scale / 3 * 3 : -((-scale + 2) / 3 * 3);
+            if (format != QuantityFormat.DecimalExponent && exponent > MaxSuffixScale)
+                exponent = MaxSuffixScale;
+
+            string digits = value.ToString(CultureInfo.InvariantCulture) + new string('0', scale - exponent);
+
+            if (format == QuantityFormat.DecimalExponent)
+                return exponent != 0 ? digits + "e" + exponent.ToString(CultureInfo.InvariantCulture) : digits;
+
+            switch (exponent)
+            {
+                case -9: return digits + "n";
+                case -6: return digits + "u";
+                case -3: return digits + "m";
+                case 3: return digits + "k";
+                case 6: return digits + "M";
+                case 9: return digits + "G";
+                case 12: return digits + "T";
+                case 15: return digits + "P";
+                case 18: return digits + "E";
+                default: return digits;
+            }
+        }
+
+        /// <summary>
+        ///     Remove trailing zeros from an unscaled value (adjusting its scale accordingly).
+        /// </summary>
+        /// <param name="value">
+        ///     The unscaled value.
+        /// </param>
+        /// <param name="scale">
+        ///     The power of 10 by which the unscaled value is multiplied.
+        /// </param>
+        /// <returns>
+        ///     The normalized value and scale (the scale of zero is always 0).
+        /// </returns>
+        static (long value, int scale) Normalize(long value, int scale)
+        {
+            if (value == 0)
+                return (0, 0);
+
+            while (value % 10 == 0)
+            {
+                value /= 10;
+                scale++;
+            }
+
+            return (value, scale);
+        }
+
+        /// <summary>
+        ///     Convert an unscaled value to a different scale, rounding up (away from zero) if precision is lost.
+        /// </summary>
+        /// <param name="value">
+        ///     The unscaled value.
+        /// </param>
+        /// <param name="scale">
+        ///     The current scale.
+        /// </param>
+        /// <param name="targetScale">
+        ///     The target scale.
+        /// </param>
+        /// <returns>
+        ///     The unscaled value at the target scale.
+        /// </returns>
+        /// <exception cref="OverflowException">
+        ///     The value cannot be represented as an <see cref="Int64"/> at the target scale.
+        /// </exception>
+        static long Rescale(long value, int scale, int targetScale)
+        {
+            if (value == 0 || scale == targetScale)
+                return value;
+
+            long difference = (long)scale - targetScale;
+            if (difference > 0)
+            {
+                if (difference >= PowersOf10.Length)
+                    throw new OverflowException($"The value cannot be represented as an {nameof(Int64)} at scale {targetScale}.");
+
+                return checked(value * PowersOf10[difference]);
+            }
+
+            if (-difference >= PowersOf10.Length)
+                return Math.Sign(value);
+
+            long divisor = PowersOf10[-difference];
+            long result = value / divisor;
+            if (value % divisor != 0)
+                result += Math.Sign(value);
+
+            return result;
+        }
+
+        /// <summary>
+        ///     Convert 2 values to the same (smaller) scale, without loss of precision.
+        /// </summary>
+        /// <param name="left">
+        ///     The first value.
+        /// </param>
+        /// <param name="right">
+        ///     The second value.
+        /// </param>
+        /// <param name="leftValue">
+        ///     Receives the first unscaled value at the common scale.
+        /// </param>
+        /// <param name="rightValue">
+        ///     Receives the second unscaled value at the common scale.
+        /// </param>
+        /// <param name="scale">
+        ///     Receives the common scale.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the values were converted; <c>false</c>, if the value with the larger scale cannot be represented as an <see cref="Int64"/> at the smaller scale.
+        /// </returns>
+        static bool TryAlign(in QuantityResource left, in QuantityResource right, out long leftValue, out long rightValue, out int scale)
+        {
+            leftValue = left._value;
+            rightValue = right._value;
+            scale = Math.Min(left._scale, right._scale);
+
+            try
+            {
+                if (left._scale > scale)
+                    leftValue = Rescale(leftValue, left._scale, scale);
+                else if (right._scale > scale)
+                    rightValue = Rescale(rightValue, right._scale, scale);
+            }
+            catch (OverflowException)
+            {
+                return false;
+            }
+
+            return true;
+        }
+
+        /// <summary>
+        ///     Add 2 <see cref="QuantityResource"/>s.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The second <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     The sum.
+        /// </returns>
+        public static QuantityResource operator +(QuantityResource left, QuantityResource right) => left.Add(right);
+
+        /// <summary>
+        ///     Subtract one <see cref="QuantityResource"/> from another.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The <see cref="QuantityResource"/> to subtract.
+        /// </param>
+        /// <returns>
+        ///     The difference.
+        /// </returns>
+        public static QuantityResource operator -(QuantityResource left, QuantityResource right) => left.Subtract(right);
+
+        /// <summary>
+        ///     Negate a <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <param name="value">
+        ///     The <see cref="QuantityResource"/> to negate.
+        /// </param>
+        /// <returns>
+        ///     The negated value.
+        /// </returns>
+        public static QuantityResource operator -(QuantityResource value) => value.Negate();
+
+        /// <summary>
+        ///     Multiply a <see cref="QuantityResource"/> by an integer.
+        /// </summary>
+        /// <param name="left">
+        ///     The <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The multiplier.
+        /// </param>
+        /// <returns>
+        ///     The product.
+        /// </returns>
+        public static QuantityResource operator *(QuantityResource left, long right) => left.Multiply(right);
+
+        /// <summary>
+        ///     Test if 2 <see cref="QuantityResource"/>s are equal.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The second <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="QuantityResource"/>s are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool operator ==(QuantityResource left, QuantityResource right) => left.Equals(right);
+
+        /// <summary>
+        ///     Test if 2 <see cref="QuantityResource"/>s are not equal.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The second <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="QuantityResource"/>s are not equal; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool operator !=(QuantityResource left, QuantityResource right) => !left.Equals(right);
+
+        /// <summary>
+        ///     Test if one <see cref="QuantityResource"/> is less than another.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The second <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="left"/> is less than <paramref name="right"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool operator <(QuantityResource left, QuantityResource right) => left.CompareTo(right) < 0;
+
+        /// <summary>
+        ///     Test if one <see cref="QuantityResource"/> is greater than another.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The second <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="left"/> is greater than <paramref name="right"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool operator >(QuantityResource left, QuantityResource right) => left.CompareTo(right) > 0;
+
+        /// <summary>
+        ///     Test if one <see cref="QuantityResource"/> is less than or equal to another.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The second <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="left"/> is less than or equal to <paramref name="right"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool operator <=(QuantityResource left, QuantityResource right) => left.CompareTo(right) <= 0;
+
+        /// <summary>
+        ///     Test if one <see cref="QuantityResource"/> is greater than or equal to another.
+        /// </summary>
+        /// <param name="left">
+        ///     The first <see cref="QuantityResource"/>.
+        /// </param>
+        /// <param name="right">
+        ///     The second <see cref="QuantityResource"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if <paramref name="left"/> is greater than or equal to <paramref name="right"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool operator >=(QuantityResource left, QuantityResource right) => left.CompareTo(right) >= 0;
+
+        /// <summary>
+        ///     Implicitly convert an <see cref="Int64"/> to a <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <param name="value">
+        ///     The <see cref="Int64"/> to convert.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="QuantityResource"/> (in decimal SI format).
+        /// </returns>
+        public static implicit operator QuantityResource(long value) => new QuantityResource(value);
+
+        /// <summary>
+        ///     Explicitly convert a <see cref="String"/> to a <see cref="QuantityResource"/>.
+        /// </summary>
+        /// <param name="value">
+        ///     The <see cref="String"/> to parse.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="QuantityResource"/>.
+        /// </returns>
+        /// <exception cref="FormatException">
+        ///     The string is not a valid quantity.
+        /// </exception>
+        public static explicit operator QuantityResource(string value) => Parse(value);
+
+        /// <summary>
+        ///     Explicitly convert a <see cref="QuantityResource"/> to its canonical <see cref="String"/> representation.
+        /// </summary>
+        /// <param name="value">
+        ///     The <see cref="QuantityResource"/> to convert.
+        /// </param>
+        /// <returns>
+        ///     The canonical <see cref="String"/> representation.
+        /// </returns>
+        public static explicit operator string(QuantityResource value) => value.ToString();
     }
 }
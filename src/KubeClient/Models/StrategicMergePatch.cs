@@ -0,0 +1,438 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace KubeClient.Models
+{
+    using KubeResourceClient = ResourceClients.KubeResourceClient;
+
+    /// <summary>
+    ///     Computes Kubernetes strategic-merge patches (that transform one version of a model into another).
+    /// </summary>
+    /// <remarks>
+    ///     Patch strategies and merge keys for generated models are taken from the Kubernetes API's "x-kubernetes-patch-strategy" and "x-kubernetes-patch-merge-key" metadata by the model generator (see <c>render_patch_properties</c> in generate_models.py), so no reflection is required.
+    ///
+    ///     Properties that are listed only because their values contain properties with patch metadata have no patch strategy flags (<c>default</c>); like any other property without patch metadata, their object values are merged field-by-field, and other values are replaced.
+    /// </remarks>
+    public static partial class StrategicMergePatch
+    {
+        /// <summary>
+        ///     The patch directive that specifies an operation (e.g. "delete") for a list item.
+        /// </summary>
+        const string PatchDirective = "$patch";
+
+        /// <summary>
+        ///     The patch directive that lists the fields to retain when merging an object (for properties with <see cref="PatchStrategies.RetainKeys"/>).
+        /// </summary>
+        const string RetainKeysDirective = "$retainKeys";
+
+        /// <summary>
+        ///     The prefix for the patch directive that specifies the order of items in a merged list.
+        /// </summary>
+        const string SetElementOrderDirectivePrefix = "$setElementOrder/";
+
+        /// <summary>
+        ///     The prefix for the patch directive that lists the values to delete from a merged list of primitive values.
+        /// </summary>
+        const string DeleteFromPrimitiveListDirectivePrefix = "$deleteFromPrimitiveList/";
+
+        /// <summary>
+        ///     The serialiser used to convert models to JSON.
+        /// </summary>
+        static readonly JsonSerializer Serializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+
+        /// <summary>
+        ///     The comparer used to match merge keys and primitive list values.
+        /// </summary>
+        static readonly JTokenEqualityComparer ValueComparer = new JTokenEqualityComparer();
+
+        /// <summary>
+        ///     Hand-coded model properties that have a patch strategy (or whose values contain properties that do), with their patch strategies, merge keys, and model types.
+        /// </summary>
+        static readonly (Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)[] HandCodedProperties =
+        {
+            (typeof(ThirdPartyResourceV1Beta1), "metadata", default, null, typeof(ObjectMetaV1)),
+        };
+
+        /// <summary>
+        ///     Build the property lookup from the (generated and hand-coded) property tables.
+        /// </summary>
+        /// <remarks>
+        ///     Done in the static constructor (rather than field initialisers) because the order in which static fields are initialised across partial class declarations is undefined.
+        /// </remarks>
+        static StrategicMergePatch()
+        {
+            Register(GeneratedProperties);
+            Register(HandCodedProperties);
+        }
+
+        /// <summary>
+        ///     Patch metadata for model properties, keyed by declaring model type and JSON property name.
+        /// </summary>
+        static readonly ConcurrentDictionary<(Type modelType, string jsonName), (PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)> Properties = new ConcurrentDictionary<(Type modelType, string jsonName), (PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)>();
+
+        /// <summary>
+        ///     Add model properties to the property lookup.
+        /// </summary>
+        /// <param name="properties">
+        ///     The model properties, with their patch strategies, merge keys, and model types.
+        /// </param>
+        /// <remarks>
+        ///     Used to add the properties from a <see cref="KubeModelPartition"/>, when it is registered.
+        /// </remarks>
+        internal static void Register(IEnumerable<(Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)> properties)
+        {
+            if (properties == null)
+                throw new ArgumentNullException(nameof(properties));
+
+            foreach ((Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType) in properties)
+                Properties[(modelType, jsonName)] = (patchStrategies, mergeKey, propertyModelType);
+        }
+
+        /// <summary>
+        ///     Get patch metadata for a model property.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type that declares the property.
+        /// </param>
+        /// <param name="jsonName">
+        ///     The property's JSON name.
+        /// </param>
+        /// <param name="patchProperty">
+        ///     Receives the property's patch strategies, merge key (if any), and the model type of its value or items (if it contains properties that have patch metadata).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the property has patch metadata; otherwise, <c>false</c> (its value is replaced or, for objects, merged field-by-field).
+        /// </returns>
+        public static bool TryGetPatchProperty(Type modelType, string jsonName, out (PatchStrategies patchStrategies, string mergeKey, Type propertyModelType) patchProperty)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            if (String.IsNullOrWhiteSpace(jsonName))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'jsonName'.", nameof(jsonName));
+
+            return Properties.TryGetValue((modelType, jsonName), out patchProperty);
+        }
+
+        /// <summary>
+        ///     Create a strategic-merge patch that transforms one version of a model into another.
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="original">
+        ///     The original version of the model (e.g. as last retrieved from the Kubernetes API).
+        /// </param>
+        /// <param name="modified">
+        ///     The modified version of the model.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="JObject"/> representing the patch (empty, if the versions are identical).
+        /// </returns>
+        public static JObject CreatePatch<TModel>(TModel original, TModel modified)
+            where TModel : class
+        {
+            if (original == null)
+                throw new ArgumentNullException(nameof(original));
+
+            if (modified == null)
+                throw new ArgumentNullException(nameof(modified));
+
+            return CreatePatch(modified.GetType(),
+                original: JObject.FromObject(original, Serializer),
+                modified: JObject.FromObject(modified, Serializer)
+            );
+        }
+
+        /// <summary>
+        ///     Create a strategic-merge patch that transforms one version of a model's JSON into another.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type (used to look up patch strategies and merge keys).
+        /// </param>
+        /// <param name="original">
+        ///     The JSON for the original version of the model.
+        /// </param>
+        /// <param name="modified">
+        ///     The JSON for the modified version of the model.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="JObject"/> representing the patch (empty, if the versions are identical).
+        /// </returns>
+        /// <remarks>
+        ///     Items in merged lists are matched by merge key in linear time.
+        /// </remarks>
+        public static JObject CreatePatch(Type modelType, JObject original, JObject modified)
+        {
+            if (modelType == null)
+                throw new ArgumentNullException(nameof(modelType));
+
+            if (original == null)
+                throw new ArgumentNullException(nameof(original));
+
+            if (modified == null)
+                throw new ArgumentNullException(nameof(modified));
+
+            return DiffObjects(modelType, original, modified, retainKeys: false);
+        }
+
+        /// <summary>
+        ///     Compute the patch between two versions of an object.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The object's model type (or <c>null</c>, if the object has no patch metadata).
+        /// </param>
+        /// <param name="original">
+        ///     The original version of the object.
+        /// </param>
+        /// <param name="modified">
+        ///     The modified version of the object.
+        /// </param>
+        /// <param name="retainKeys">
+        ///     Add a "$retainKeys" directive to the patch (if it is not empty)?
+        /// </param>
+        /// <returns>
+        ///     The patch (empty, if the versions are identical).
+        /// </returns>
+        static JObject DiffObjects(Type modelType, JObject original, JObject modified, bool retainKeys)
+        {
+            var patch = new JObject();
+
+            foreach (JProperty originalProperty in original.Properties())
+            {
+                if (!modified.ContainsKey(originalProperty.Name))
+                    patch.Add(originalProperty.Name, JValue.CreateNull());
+            }
+
+            foreach (JProperty modifiedProperty in modified.Properties())
+            {
+                string name = modifiedProperty.Name;
+                JToken modifiedValue = modifiedProperty.Value;
+
+                // Tokens that already have a parent are cloned when they are added to the patch.
+                if (!original.TryGetValue(name, out JToken originalValue))
+                {
+                    patch.Add(name, modifiedValue);
+
+                    continue;
+                }
+
+                (PatchStrategies patchStrategies, string mergeKey, Type propertyModelType) patchProperty = default;
+                if (modelType != null)
+                    Properties.TryGetValue((modelType, name), out patchProperty);
+
+                if (originalValue is JObject originalObject && modifiedValue is JObject modifiedObject)
+                {
+                    JObject propertyPatch = DiffObjects(patchProperty.propertyModelType, originalObject, modifiedObject,
+                        retainKeys: patchProperty.patchStrategies.HasFlag(PatchStrategies.RetainKeys)
+                    );
+                    if (propertyPatch.Count > 0)
+                        patch.Add(name, propertyPatch);
+                }
+                else if (originalValue is JArray originalArray && modifiedValue is JArray modifiedArray && patchProperty.patchStrategies.HasFlag(PatchStrategies.Merge))
+                {
+                    if (patchProperty.mergeKey != null)
+                        DiffMergedList(patch, name, patchProperty.mergeKey, patchProperty.propertyModelType, patchProperty.patchStrategies, originalArray, modifiedArray);
+                    else
+                        DiffMergedPrimitiveList(patch, name, originalArray, modifiedArray);
+                }
+                else if (!JToken.DeepEquals(originalValue, modifiedValue))
+                    patch.Add(name, modifiedValue);
+            }
+
+            if (retainKeys && patch.Count > 0)
+            {
+                patch.Add(RetainKeysDirective, new JArray(
+                    modified.Properties()
+                        .Where(property => property.Value.Type != JTokenType.Null)
+                        .Select(property => property.Name)
+                        .OrderBy(name => name, StringComparer.Ordinal)
+                ));
+            }
+
+            return patch;
+        }
+
+        /// <summary>
+        ///     Compute the patch between two versions of a list of objects that is merged by key.
+        /// </summary>
+        /// <param name="patch">
+        ///     The patch for the object that contains the list.
+        /// </param>
+        /// <param name="name">
+        ///     The list property's JSON name.
+        /// </param>
+        /// <param name="mergeKey">
+        ///     The JSON name of the property that identifies each item in the list.
+        /// </param>
+        /// <param name="itemModelType">
+        ///     The model type of the list's items (or <c>null</c>, if they have no patch metadata).
+        /// </param>
+        /// <param name="patchStrategies">
+        ///     The list property's patch strategies.
+        /// </param>
+        /// <param name="original">
+        ///     The original version of the list.
+        /// </param>
+        /// <param name="modified">
+        ///     The modified version of the list.
+        /// </param>
+        static void DiffMergedList(JObject patch, string name, string mergeKey, Type itemModelType, PatchStrategies patchStrategies, JArray original, JArray modified)
+        {
+            var originalItems = new Dictionary<JToken, JObject>(original.Count, ValueComparer);
+            var originalKeys = new List<JToken>(original.Count);
+            foreach (JToken originalItem in original)
+            {
+                if (!TryGetMergeKey(originalItem, mergeKey, out JToken key) || !originalItems.TryAdd(key, (JObject)originalItem))
+                {
+                    ReplaceMergedList(patch, name, modified);
+
+                    return;
+                }
+
+                originalKeys.Add(key);
+            }
+
+            var listPatch = new JArray();
+            var elementOrder = new JArray();
+            var modifiedKeys = new HashSet<JToken>(ValueComparer);
+            bool isReordered = original.Count != modified.Count;
+            foreach (JToken modifiedItem in modified)
+            {
+                if (!TryGetMergeKey(modifiedItem, mergeKey, out JToken key) || !modifiedKeys.Add(key))
+                {
+                    ReplaceMergedList(patch, name, modified);
+
+                    return;
+                }
+
+                if (!isReordered && !ValueComparer.Equals(originalKeys[elementOrder.Count], key))
+                    isReordered = true;
+
+                elementOrder.Add(new JObject(
+                    new JProperty(mergeKey, key)
+                ));
+
+                if (originalItems.TryGetValue(key, out JObject originalItem))
+                {
+                    JObject itemPatch = DiffObjects(itemModelType, originalItem, (JObject)modifiedItem,
+                        retainKeys: patchStrategies.HasFlag(PatchStrategies.RetainKeys)
+                    );
+                    if (itemPatch.Count > 0)
+                    {
+                        itemPatch.AddFirst(new JProperty(mergeKey, key));
+                        listPatch.Add(itemPatch);
+                    }
+                }
+                else
+                    listPatch.Add(modifiedItem);
+            }
+
+            foreach (JToken originalKey in originalKeys)
+            {
+                if (modifiedKeys.Contains(originalKey))
+                    continue;
+
+                listPatch.Add(new JObject(
+                    new JProperty(mergeKey, originalKey),
+                    new JProperty(PatchDirective, "delete")
+                ));
+            }
+
+            if (listPatch.Count > 0)
+                patch.Add(name, listPatch);
+
+            if (listPatch.Count > 0 || isReordered)
+                patch.Add(SetElementOrderDirectivePrefix + name, elementOrder);
+        }
+
+        /// <summary>
+        ///     Compute the patch between two versions of a list of primitive values that is merged (i.e. treated as a set).
+        /// </summary>
+        /// <param name="patch">
+        ///     The patch for the object that contains the list.
+        /// </param>
+        /// <param name="name">
+        ///     The list property's JSON name.
+        /// </param>
+        /// <param name="original">
+        ///     The original version of the list.
+        /// </param>
+        /// <param name="modified">
+        ///     The modified version of the list.
+        /// </param>
+        static void DiffMergedPrimitiveList(JObject patch, string name, JArray original, JArray modified)
+        {
+            if (JToken.DeepEquals(original, modified))
+                return;
+
+            var originalValues = new HashSet<JToken>(original, ValueComparer);
+            var modifiedValues = new HashSet<JToken>(modified, ValueComparer);
+
+            var addedValues = new JArray(
+                modified.Where(value => !originalValues.Contains(value))
+            );
+            if (addedValues.Count > 0)
+                patch.Add(name, addedValues);
+
+            var deletedValues = new JArray(
+                original.Where(value => !modifiedValues.Contains(value))
+            );
+            if (deletedValues.Count > 0)
+                patch.Add(DeleteFromPrimitiveListDirectivePrefix + name, deletedValues);
+
+            patch.Add(SetElementOrderDirectivePrefix + name, modified);
+        }
+
+        /// <summary>
+        ///     Replace (rather than merge) a list of objects that is normally merged by key.
+        /// </summary>
+        /// <param name="patch">
+        ///     The patch for the object that contains the list.
+        /// </param>
+        /// <param name="name">
+        ///     The list property's JSON name.
+        /// </param>
+        /// <param name="modified">
+        ///     The modified version of the list.
+        /// </param>
+        /// <remarks>
+        ///     Used when the list's items cannot be matched by key (i.e. an item is missing its merge key, or more than one item has the same key).
+        /// </remarks>
+        static void ReplaceMergedList(JObject patch, string name, JArray modified)
+        {
+            var listPatch = new JArray(modified);
+            listPatch.Add(new JObject(
+                new JProperty(PatchDirective, "replace")
+            ));
+
+            patch.Add(name, listPatch);
+        }
+
+        /// <summary>
+        ///     Get the merge key of a list item.
+        /// </summary>
+        /// <param name="item">
+        ///     The list item.
+        /// </param>
+        /// <param name="mergeKey">
+        ///     The JSON name of the property that identifies each item in the list.
+        /// </param>
+        /// <param name="key">
+        ///     Receives the item's key.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the item is an object with a (non-null) key; otherwise, <c>false</c>.
+        /// </returns>
+        static bool TryGetMergeKey(JToken item, string mergeKey, out JToken key)
+        {
+            key = (item as JObject)?[mergeKey];
+
+            return key != null && key.Type != JTokenType.Null;
+        }
+    }
+}
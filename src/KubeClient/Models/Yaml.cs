@@ -2,38 +2,24 @@ using Newtonsoft.Json;
 using Newtonsoft.Json.Linq;
 using System;
 using System.IO;
-using System.Text;
-using YamlDotNet.Serialization;
+using YamlDotNet.Core;
 
 using KubeResourceClient = KubeClient.ResourceClients.KubeResourceClient;
 
 namespace KubeClient.Models
 {
+    using Converters;
+
     /// <summary>
     ///     Helper methods for YAML serialisation / deserialisation of models.
     /// </summary>
+    /// <remarks>
+    ///     YAML is read / written as a stream of parser / emitter events that are translated directly to / from JSON tokens (so models are always bound using their JSON contracts and converters).
+    ///
+    ///     No intermediate object graph or JSON text is created, and YamlDotNet's (reflection-based) object serialisation is not used.
+    /// </remarks>
     public static class Yaml
     {
-        /// <summary>
-        ///     The buffer size used when reading from / writing to streams.
-        /// </summary>
-        const int StreamBufferSize = 1024;
-
-        /// <summary>
-        ///     The singleton YAML <see cref="Deserializer"/> used by static methods on <see cref="Yaml"/>.
-        /// </summary>
-        static readonly IDeserializer YamlDeserialiser = new DeserializerBuilder().IgnoreUnmatchedProperties().Build();
-
-        /// <summary>
-        ///     The singleton YAML <see cref="Serializer"/> used by static methods on <see cref="Yaml"/>.
-        /// </summary>
-        static readonly ISerializer YamlSerialiser = new SerializerBuilder().Build();
-
-        /// <summary>
-        ///     The singleton (JSON-compatible) YAML <see cref="Serializer"/> used by static methods on <see cref="Yaml"/>.
-        /// </summary>
-        static readonly ISerializer YamlJsonSerialiser = new SerializerBuilder().JsonCompatible().Build();
-
         /// <summary>
         ///     The singleton <see cref="JsonSerializer"/> used by static methods on <see cref="Yaml"/>.
         /// </summary>
@@ -53,22 +39,9 @@ namespace KubeClient.Models
             if (yaml == null)
                 throw new ArgumentNullException(nameof(yaml));
 
-            object deserialisedYaml = YamlDeserialiser.Deserialize(yaml);
-
-            using (MemoryStream buffer = new MemoryStream())
+            using (JsonReader jsonReader = CreateJsonReader(yaml))
             {
-                using (TextWriter jsonWriter = CreateTextWriter(buffer))
-                {
-                    YamlJsonSerialiser.Serialize(jsonWriter, deserialisedYaml);
-                    jsonWriter.Flush();
-                }
-
-                buffer.Seek(0, SeekOrigin.Begin);
-
-                using (JsonReader jsonReader = CreateJsonReader(buffer))
-                {
-                    return JToken.Load(jsonReader);
-                }
+                return JToken.Load(jsonReader);
             }
         }
 
@@ -89,25 +62,7 @@ namespace KubeClient.Models
             if (yaml == null)
                 throw new ArgumentNullException(nameof(yaml));
 
-            object deserialisedYaml = YamlDeserialiser.Deserialize(
-                new StringReader(yaml)
-            );
-
-            using (MemoryStream buffer = new MemoryStream())
-            {
-                using (TextWriter jsonWriter = CreateTextWriter(buffer))
-                {
-                    YamlJsonSerialiser.Serialize(jsonWriter, deserialisedYaml);
-                    jsonWriter.Flush();
-                }
-
-                buffer.Seek(0, SeekOrigin.Begin);
-
-                using (JsonReader jsonReader = CreateJsonReader(buffer))
-                {
-                    return JToken.Load(jsonReader).ToString(formatting);
-                }
-            }
+            return ToJson(new StringReader(yaml)).ToString(formatting);
         }
 
         /// <summary>
@@ -123,31 +78,16 @@ namespace KubeClient.Models
         ///     The deserialised <typeparamref name="TModel"/>.
         /// </returns>
         /// <remarks>
-        ///     Delegates the actual deserialisation to JSON.NET, after converting the YAML to JSON.
-        ///
-        ///     Not particularly efficient, but safe and reliable.
+        ///     Delegates the actual deserialisation to JSON.NET, reading JSON tokens directly from the YAML.
         /// </remarks>
         public static TModel Deserialize<TModel>(TextReader yaml)
         {
             if (yaml == null)
                 throw new ArgumentNullException(nameof(yaml));
 
-            object deserialisedYaml = YamlDeserialiser.Deserialize(yaml);
-
-            using (MemoryStream buffer = new MemoryStream())
+            using (JsonReader jsonReader = CreateJsonReader(yaml))
             {
-                using (JsonWriter jsonWriter = CreateJsonWriter(buffer))
-                {
-                    JsonSerializer.Serialize(jsonWriter, deserialisedYaml);
-                    jsonWriter.Flush();
-                }
-
-                buffer.Seek(0, SeekOrigin.Begin);
-
-                using (JsonReader jsonReader = CreateJsonReader(buffer))
-                {
-                    return JsonSerializer.Deserialize<TModel>(jsonReader);
-                }
+                return JsonSerializer.Deserialize<TModel>(jsonReader);
             }
         }
 
@@ -161,9 +101,7 @@ namespace KubeClient.Models
         ///     A <see cref="TextWriter"/> that will receive the serialised YAML.
         /// </param>
         /// <remarks>
-        ///     Delegates the actual deserialisation to JSON.NET, before converting the JSON to YAML.
-        ///
-        ///     Not particularly efficient, but safe and reliable.
+        ///     Delegates the actual serialisation to JSON.NET, writing JSON tokens directly as YAML.
         /// </remarks>
         public static void Serialize(object model, TextWriter writer)
         {
@@ -173,127 +111,29 @@ namespace KubeClient.Models
             if (writer == null)
                 throw new ArgumentNullException(nameof(writer));
 
-            object serializableModel;
-
-            using (MemoryStream buffer = new MemoryStream())
+            using (JsonWriter jsonWriter = new YamlJsonWriter(new Emitter(writer)))
             {
-                using (JsonWriter jsonWriter = CreateJsonWriter(buffer))
-                {
-                    JsonSerializer.Serialize(jsonWriter, model);
-                    jsonWriter.Flush();
-                }
-
-                buffer.Seek(0, SeekOrigin.Begin);
-
-                using (TextReader yamlReader = CreateTextReader(buffer))
-                {
-                    serializableModel = YamlDeserialiser.Deserialize(yamlReader);
-                }
+                JsonSerializer.Serialize(jsonWriter, model);
             }
-
-            YamlSerialiser.Serialize(writer, serializableModel);
         }
 
         /// <summary>
-        ///     Create a <see cref="JsonReader"/> that reads from the specified stream.
+        ///     Create a <see cref="JsonReader"/> that reads from the specified YAML.
         /// </summary>
-        /// <param name="stream">
-        ///     The target stream.
+        /// <param name="yaml">
+        ///     A <see cref="TextReader"/> containing the YAML.
         /// </param>
         /// <returns>
         ///     The new <see cref="JsonReader"/>.
         /// </returns>
-        static JsonReader CreateJsonReader(Stream stream)
+        static JsonReader CreateJsonReader(TextReader yaml)
         {
-            if (stream == null)
-                throw new ArgumentNullException(nameof(stream));
-
-            TextReader textReader = null;
-            JsonReader jsonReader = null;
-
-            try
-            {
-                textReader = CreateTextReader(stream);
-                jsonReader = new JsonTextReader(textReader);
-            }
-            catch (Exception)
-            {
-                using (jsonReader)
-                using (textReader)
-                {
-                    throw;
-                }
-            }
-
-            return jsonReader;
-        }
-
-        /// <summary>
-        ///     Create a <see cref="JsonWriter"/> that writes to the specified stream.
-        /// </summary>
-        /// <param name="stream">
-        ///     The target stream.
-        /// </param>
-        /// <returns>
-        ///     The new <see cref="JsonWriter"/>.
-        /// </returns>
-        static JsonWriter CreateJsonWriter(Stream stream)
-        {
-            if (stream == null)
-                throw new ArgumentNullException(nameof(stream));
-
-            TextWriter textWriter = null;
-            JsonWriter jsonWriter = null;
-
-            try
-            {
-                textWriter = CreateTextWriter(stream);
-                jsonWriter = new JsonTextWriter(textWriter);
-            }
-            catch (Exception)
-            {
-                using (jsonWriter)
-                using (textWriter)
-                {
-                    throw;
-                }
-            }
-
-            return jsonWriter;
-        }
-
-        /// <summary>
-        ///     Create a <see cref="TextReader"/> that reads from the specified stream.
-        /// </summary>
-        /// <param name="stream">
-        ///     The target stream.
-        /// </param>
-        /// <returns>
-        ///     The new <see cref="TextReader"/>.
-        /// </returns>
-        static TextReader CreateTextReader(Stream stream)
-        {
-            if (stream == null)
-                throw new ArgumentNullException(nameof(stream));
-
-            return new StreamReader(stream, Encoding.UTF8, detectEncodingFromByteOrderMarks: false, bufferSize: StreamBufferSize, leaveOpen: true);
-        }
-
-        /// <summary>
-        ///     Create a <see cref="TextWriter"/> that writes to the specified stream.
-        /// </summary>
-        /// <param name="stream">
-        ///     The target stream.
-        /// </param>
-        /// <returns>
-        ///     The new <see cref="TextWriter"/>.
-        /// </returns>
-        static TextWriter CreateTextWriter(Stream stream)
-        {
-            if (stream == null)
-                throw new ArgumentNullException(nameof(stream));
+            if (yaml == null)
+                throw new ArgumentNullException(nameof(yaml));
 
-            return new StreamWriter(stream, Encoding.UTF8, bufferSize: StreamBufferSize, leaveOpen: true);
+            return new YamlJsonReader(
+                new Parser(yaml)
+            );
         }
     }
-}
\ No newline at end of file
+}
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     APIServiceCondition describes the state of an APIService at a particular point
     /// </summary>
-    public partial class APIServiceConditionV1
+    public partial class APIServiceConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Last time the condition transitioned from one status to another.
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
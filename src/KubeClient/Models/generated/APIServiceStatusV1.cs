@@ -16,7 +16,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<APIServiceConditionV1> Conditions { get; } = new List<APIServiceConditionV1>();
+        public KubeKeyedList<string, APIServiceConditionV1> Conditions { get; } = new KubeKeyedList<string, APIServiceConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     CSINodeDriver holds information about the specification of one CSI driver installed on a node
     /// </summary>
-    public partial class CSINodeDriverV1
+    public partial class CSINodeDriverV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     nodeID of the node from the driver point of view. This field enables Kubernetes to communicate with storage systems that do not share the same nomenclature for nodes. For example, Kubernetes may refer to a given node as "node1", but the storage system may refer to the same node as "nodeA". When Kubernetes issues a command to the storage system to attach a volume to a specific node, it can use this field to refer to the node name using the ID that the storage system will understand, e.g. "nodeA" instead of "node1". This field is required.
@@ -42,5 +42,10 @@ namespace KubeClient.Models
         ///     Determine whether the <see cref="TopologyKeys"/> property should be serialised.
         /// </summary>
         public bool ShouldSerializeTopologyKeys() => TopologyKeys.Count > 0;
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -16,6 +16,6 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "drivers")]
         [JsonProperty("drivers", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<CSINodeDriverV1> Drivers { get; } = new List<CSINodeDriverV1>();
+        public KubeKeyedList<string, CSINodeDriverV1> Drivers { get; } = new KubeKeyedList<string, CSINodeDriverV1>();
     }
 }
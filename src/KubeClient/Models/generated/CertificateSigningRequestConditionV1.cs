@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     CertificateSigningRequestCondition describes a condition of a CertificateSigningRequest object
     /// </summary>
-    public partial class CertificateSigningRequestConditionV1
+    public partial class CertificateSigningRequestConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     lastTransitionTime is the time the condition last transitioned from one status to another. If unset, when a new condition type is added or an existing condition's status is changed, the server defaults this to the current time.
@@ -61,5 +61,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
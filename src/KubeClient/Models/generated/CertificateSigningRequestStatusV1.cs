@@ -43,7 +43,7 @@ namespace KubeClient.Models
         /// </summary>
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<CertificateSigningRequestConditionV1> Conditions { get; } = new List<CertificateSigningRequestConditionV1>();
+        public KubeKeyedList<string, CertificateSigningRequestConditionV1> Conditions { get; } = new KubeKeyedList<string, CertificateSigningRequestConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
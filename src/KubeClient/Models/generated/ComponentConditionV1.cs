@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     Information about the condition of a component.
     /// </summary>
-    public partial class ComponentConditionV1
+    public partial class ComponentConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Message about the condition for a component. For example, information about a health check.
@@ -37,5 +37,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
@@ -19,7 +19,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ComponentConditionV1> Conditions { get; } = new List<ComponentConditionV1>();
+        public KubeKeyedList<string, ComponentConditionV1> Conditions { get; } = new KubeKeyedList<string, ComponentConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     Condition contains details for one aspect of the current state of this API Resource.
     /// </summary>
-    public partial class ConditionV1
+    public partial class ConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     lastTransitionTime is the last time the condition transitioned from one status to another. This should be when the underlying condition changed.  If that is not known, then using the time when the API field changed is acceptable.
@@ -51,5 +51,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ContainerPort represents a network port in a single container.
     /// </summary>
-    public partial class ContainerPortV1
+    public partial class ContainerPortV1 : IKubeKeyedListItem<(int containerPort, string protocol)>
     {
         /// <summary>
         ///     What host IP to bind the external port to.
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "hostPort")]
         [JsonProperty("hostPort", NullValueHandling = NullValueHandling.Ignore)]
         public int? HostPort { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("containerPort", "protocol").
+        /// </summary>
+        (int containerPort, string protocol) IKubeKeyedListItem<(int containerPort, string protocol)>.ListKey => (ContainerPort, Protocol);
     }
 }
@@ -84,7 +84,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "allocatedResourcesStatus")]
         [JsonProperty("allocatedResourcesStatus", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ResourceStatusV1> AllocatedResourcesStatus { get; } = new List<ResourceStatusV1>();
+        public KubeKeyedList<string, ResourceStatusV1> AllocatedResourcesStatus { get; } = new KubeKeyedList<string, ResourceStatusV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="AllocatedResourcesStatus"/> property should be serialised.
@@ -104,7 +104,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "mountPath")]
         [YamlMember(Alias = "volumeMounts")]
         [JsonProperty("volumeMounts", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<VolumeMountStatusV1> VolumeMounts { get; } = new List<VolumeMountStatusV1>();
+        public KubeKeyedList<string, VolumeMountStatusV1> VolumeMounts { get; } = new KubeKeyedList<string, VolumeMountStatusV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="VolumeMounts"/> property should be serialised.
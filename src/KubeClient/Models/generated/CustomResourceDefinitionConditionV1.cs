@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     CustomResourceDefinitionCondition contains details for the current condition of this pod.
     /// </summary>
-    public partial class CustomResourceDefinitionConditionV1
+    public partial class CustomResourceDefinitionConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     lastTransitionTime last time the condition transitioned from one status to another.
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
@@ -22,7 +22,7 @@ namespace KubeClient.Models
         /// </summary>
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<CustomResourceDefinitionConditionV1> Conditions { get; } = new List<CustomResourceDefinitionConditionV1>();
+        public KubeKeyedList<string, CustomResourceDefinitionConditionV1> Conditions { get; } = new KubeKeyedList<string, CustomResourceDefinitionConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
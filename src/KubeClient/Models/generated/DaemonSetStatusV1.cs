@@ -65,7 +65,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<DaemonSetConditionV1> Conditions { get; } = new List<DaemonSetConditionV1>();
+        public KubeKeyedList<string, DaemonSetConditionV1> Conditions { get; } = new KubeKeyedList<string, DaemonSetConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     DeploymentCondition describes the state of a deployment at a certain point.
     /// </summary>
-    public partial class DeploymentConditionV1
+    public partial class DeploymentConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Last time the condition transitioned from one status to another.
@@ -51,5 +51,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
@@ -30,7 +30,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<DeploymentConditionV1> Conditions { get; } = new List<DeploymentConditionV1>();
+        public KubeKeyedList<string, DeploymentConditionV1> Conditions { get; } = new KubeKeyedList<string, DeploymentConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     EnvVar represents an environment variable present in a Container.
     /// </summary>
-    public partial class EnvVarV1
+    public partial class EnvVarV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name of the environment variable. Must be a C_IDENTIFIER.
@@ -30,5 +30,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "valueFrom")]
         [JsonProperty("valueFrom", NullValueHandling = NullValueHandling.Ignore)]
         public EnvVarSourceV1 ValueFrom { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -10,7 +10,7 @@ namespace KubeClient.Models
     ///     
     ///     To add an ephemeral container, use the ephemeralcontainers subresource of an existing Pod. Ephemeral containers may not be removed or restarted.
     /// </summary>
-    public partial class EphemeralContainerV1
+    public partial class EphemeralContainerV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Entrypoint array. Not executed within a shell. The image's ENTRYPOINT is used if this is not provided. Variable references $(VAR_NAME) are expanded using the container's environment. If a variable cannot be resolved, the reference in the input string will be unchanged. Double $$ are reduced to a single $, which allows for escaping the $(VAR_NAME) syntax: i.e. "$$(VAR_NAME)" will produce the string literal "$(VAR_NAME)". Escaped references will never be expanded, regardless of whether the variable exists or not. Cannot be updated. More info: https://kubernetes.io/docs/tasks/inject-data-application/define-command-argument-container/#running-a-command-in-a-shell
@@ -133,7 +133,7 @@ namespace KubeClient.Models
         [YamlMember(Alias = "ports")]
         [MergeStrategy(Key = "containerPort")]
         [JsonProperty("ports", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ContainerPortV1> Ports { get; } = new List<ContainerPortV1>();
+        public KubeKeyedList<(int containerPort, string protocol), ContainerPortV1> Ports { get; } = new KubeKeyedList<(int containerPort, string protocol), ContainerPortV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Ports"/> property should be serialised.
@@ -153,7 +153,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "devicePath")]
         [YamlMember(Alias = "volumeDevices")]
         [JsonProperty("volumeDevices", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<VolumeDeviceV1> VolumeDevices { get; } = new List<VolumeDeviceV1>();
+        public KubeKeyedList<string, VolumeDeviceV1> VolumeDevices { get; } = new KubeKeyedList<string, VolumeDeviceV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="VolumeDevices"/> property should be serialised.
@@ -166,7 +166,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "mountPath")]
         [YamlMember(Alias = "volumeMounts")]
         [JsonProperty("volumeMounts", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<VolumeMountV1> VolumeMounts { get; } = new List<VolumeMountV1>();
+        public KubeKeyedList<string, VolumeMountV1> VolumeMounts { get; } = new KubeKeyedList<string, VolumeMountV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="VolumeMounts"/> property should be serialised.
@@ -186,7 +186,7 @@ namespace KubeClient.Models
         [YamlMember(Alias = "env")]
         [MergeStrategy(Key = "name")]
         [JsonProperty("env", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<EnvVarV1> Env { get; } = new List<EnvVarV1>();
+        public KubeKeyedList<string, EnvVarV1> Env { get; } = new KubeKeyedList<string, EnvVarV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Env"/> property should be serialised.
@@ -232,5 +232,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "tty")]
         [JsonProperty("tty", NullValueHandling = NullValueHandling.Ignore)]
         public bool? Tty { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -16,7 +16,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<FlowSchemaConditionV1> Conditions { get; } = new List<FlowSchemaConditionV1>();
+        public KubeKeyedList<string, FlowSchemaConditionV1> Conditions { get; } = new KubeKeyedList<string, FlowSchemaConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -16,7 +16,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<FlowSchemaConditionV1Beta3> Conditions { get; } = new List<FlowSchemaConditionV1Beta3>();
+        public KubeKeyedList<string, FlowSchemaConditionV1Beta3> Conditions { get; } = new KubeKeyedList<string, FlowSchemaConditionV1Beta3>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -30,7 +30,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<HorizontalPodAutoscalerConditionV2> Conditions { get; } = new List<HorizontalPodAutoscalerConditionV2>();
+        public KubeKeyedList<string, HorizontalPodAutoscalerConditionV2> Conditions { get; } = new KubeKeyedList<string, HorizontalPodAutoscalerConditionV2>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     HostAlias holds the mapping between IP and hostnames that will be injected as an entry in the pod's hosts file.
     /// </summary>
-    public partial class HostAliasV1
+    public partial class HostAliasV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     IP address of the host file entry.
@@ -28,5 +28,10 @@ namespace KubeClient.Models
         ///     Determine whether the <see cref="Hostnames"/> property should be serialised.
         /// </summary>
         public bool ShouldSerializeHostnames() => Hostnames.Count > 0;
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("ip").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Ip;
     }
 }
@@ -0,0 +1,49 @@
+using System;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Model fields whose values can be used as index keys.
+    /// </summary>
+    public static partial class IndexedFields
+    {
+        /// <summary>
+        ///     Generated model fields, with functions that get their values.
+        /// </summary>
+        static readonly (Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue)[] GeneratedFields =
+        {
+            (typeof(CertificateSigningRequestV1), "spec.signerName", resource => ((CertificateSigningRequestV1)resource).Spec?.SignerName),
+            (typeof(EventV1), "involvedObject.apiVersion", resource => ((EventV1)resource).InvolvedObject?.ApiVersion),
+            (typeof(EventV1), "involvedObject.fieldPath", resource => ((EventV1)resource).InvolvedObject?.FieldPath),
+            (typeof(EventV1), "involvedObject.kind", resource => ((EventV1)resource).InvolvedObject?.Kind),
+            (typeof(EventV1), "involvedObject.name", resource => ((EventV1)resource).InvolvedObject?.Name),
+            (typeof(EventV1), "involvedObject.namespace", resource => ((EventV1)resource).InvolvedObject?.Namespace),
+            (typeof(EventV1), "involvedObject.resourceVersion", resource => ((EventV1)resource).InvolvedObject?.ResourceVersion),
+            (typeof(EventV1), "involvedObject.uid", resource => ((EventV1)resource).InvolvedObject?.Uid),
+            (typeof(EventV1), "reason", resource => ((EventV1)resource).Reason),
+            (typeof(EventV1), "reportingComponent", resource => ((EventV1)resource).ReportingComponent),
+            (typeof(EventV1), "source.component", resource => ((EventV1)resource).Source?.Component),
+            (typeof(EventV1), "source.host", resource => ((EventV1)resource).Source?.Host),
+            (typeof(EventV1), "type", resource => ((EventV1)resource).Type),
+            (typeof(LeaseV1), "spec.holderIdentity", resource => ((LeaseV1)resource).Spec?.HolderIdentity),
+            (typeof(NamespaceV1), "status.phase", resource => ((NamespaceV1)resource).Status?.Phase),
+            (typeof(PersistentVolumeClaimV1), "spec.storageClassName", resource => ((PersistentVolumeClaimV1)resource).Spec?.StorageClassName),
+            (typeof(PersistentVolumeClaimV1), "spec.volumeName", resource => ((PersistentVolumeClaimV1)resource).Spec?.VolumeName),
+            (typeof(PersistentVolumeV1), "spec.claimRef.name", resource => ((PersistentVolumeV1)resource).Spec?.ClaimRef?.Name),
+            (typeof(PersistentVolumeV1), "spec.claimRef.namespace", resource => ((PersistentVolumeV1)resource).Spec?.ClaimRef?.Namespace),
+            (typeof(PersistentVolumeV1), "spec.claimRef.uid", resource => ((PersistentVolumeV1)resource).Spec?.ClaimRef?.Uid),
+            (typeof(PersistentVolumeV1), "spec.storageClassName", resource => ((PersistentVolumeV1)resource).Spec?.StorageClassName),
+            (typeof(PodV1), "spec.nodeName", resource => ((PodV1)resource).Spec?.NodeName),
+            (typeof(PodV1), "spec.restartPolicy", resource => ((PodV1)resource).Spec?.RestartPolicy),
+            (typeof(PodV1), "spec.schedulerName", resource => ((PodV1)resource).Spec?.SchedulerName),
+            (typeof(PodV1), "spec.serviceAccountName", resource => ((PodV1)resource).Spec?.ServiceAccountName),
+            (typeof(PodV1), "status.hostIP", resource => ((PodV1)resource).Status?.HostIP),
+            (typeof(PodV1), "status.nominatedNodeName", resource => ((PodV1)resource).Status?.NominatedNodeName),
+            (typeof(PodV1), "status.phase", resource => ((PodV1)resource).Status?.Phase),
+            (typeof(PodV1), "status.podIP", resource => ((PodV1)resource).Status?.PodIP),
+            (typeof(SecretV1), "type", resource => ((SecretV1)resource).Type),
+            (typeof(ServiceV1), "spec.clusterIP", resource => ((ServiceV1)resource).Spec?.ClusterIP),
+            (typeof(ServiceV1), "spec.type", resource => ((ServiceV1)resource).Spec?.Type),
+        };
+    }
+}
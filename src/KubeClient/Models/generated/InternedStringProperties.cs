@@ -0,0 +1,283 @@
+using System;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Model properties whose string values are interned when they are deserialised.
+    /// </summary>
+    public static partial class InternedStringProperties
+    {
+        /// <summary>
+        ///     Generated model properties, with the parts of their values that are interned.
+        /// </summary>
+        static readonly (Type modelType, string propertyName, InternedStrings internedStrings)[] GeneratedProperties =
+        {
+            (typeof(APIResourceV1), nameof(APIResourceV1.Kind), InternedStrings.Values),
+            (typeof(APIServiceConditionV1), nameof(APIServiceConditionV1.Type), InternedStrings.Values),
+            (typeof(APIServiceConditionV1), nameof(APIServiceConditionV1.Reason), InternedStrings.Values),
+            (typeof(APIServiceConditionV1), nameof(APIServiceConditionV1.Status), InternedStrings.Values),
+            (typeof(AppArmorProfileV1), nameof(AppArmorProfileV1.Type), InternedStrings.Values),
+            (typeof(AzureDiskVolumeSourceV1), nameof(AzureDiskVolumeSourceV1.Kind), InternedStrings.Values),
+            (typeof(BasicDeviceV1Alpha3), nameof(BasicDeviceV1Alpha3.Capacity), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(CSIDriverSpecV1), nameof(CSIDriverSpecV1.FsGroupPolicy), InternedStrings.Values),
+            (typeof(CSIStorageCapacityV1), nameof(CSIStorageCapacityV1.StorageClassName), InternedStrings.Values),
+            (typeof(CSIStorageCapacityV1), nameof(CSIStorageCapacityV1.Capacity), InternedStrings.Values),
+            (typeof(CertificateSigningRequestConditionV1), nameof(CertificateSigningRequestConditionV1.Type), InternedStrings.Values),
+            (typeof(CertificateSigningRequestConditionV1), nameof(CertificateSigningRequestConditionV1.Reason), InternedStrings.Values),
+            (typeof(CertificateSigningRequestConditionV1), nameof(CertificateSigningRequestConditionV1.Status), InternedStrings.Values),
+            (typeof(ComponentConditionV1), nameof(ComponentConditionV1.Type), InternedStrings.Values),
+            (typeof(ComponentConditionV1), nameof(ComponentConditionV1.Status), InternedStrings.Values),
+            (typeof(ConditionV1), nameof(ConditionV1.Type), InternedStrings.Values),
+            (typeof(ConditionV1), nameof(ConditionV1.Reason), InternedStrings.Values),
+            (typeof(ConditionV1), nameof(ConditionV1.Status), InternedStrings.Values),
+            (typeof(ConfigMapNodeConfigSourceV1), nameof(ConfigMapNodeConfigSourceV1.Namespace), InternedStrings.Values),
+            (typeof(ContainerPortV1), nameof(ContainerPortV1.HostIP), InternedStrings.Values),
+            (typeof(ContainerPortV1), nameof(ContainerPortV1.Protocol), InternedStrings.Values),
+            (typeof(ContainerResizePolicyV1), nameof(ContainerResizePolicyV1.RestartPolicy), InternedStrings.Values),
+            (typeof(ContainerStateTerminatedV1), nameof(ContainerStateTerminatedV1.Reason), InternedStrings.Values),
+            (typeof(ContainerStateWaitingV1), nameof(ContainerStateWaitingV1.Reason), InternedStrings.Values),
+            (typeof(ContainerStatusV1), nameof(ContainerStatusV1.Image), InternedStrings.Values),
+            (typeof(ContainerV1), nameof(ContainerV1.Command), InternedStrings.Values),
+            (typeof(ContainerV1), nameof(ContainerV1.Image), InternedStrings.Values),
+            (typeof(ContainerV1), nameof(ContainerV1.TerminationMessagePath), InternedStrings.Values),
+            (typeof(ContainerV1), nameof(ContainerV1.Args), InternedStrings.Values),
+            (typeof(ContainerV1), nameof(ContainerV1.ImagePullPolicy), InternedStrings.Values),
+            (typeof(ContainerV1), nameof(ContainerV1.RestartPolicy), InternedStrings.Values),
+            (typeof(ContainerV1), nameof(ContainerV1.TerminationMessagePolicy), InternedStrings.Values),
+            (typeof(CronJobSpecV1), nameof(CronJobSpecV1.ConcurrencyPolicy), InternedStrings.Values),
+            (typeof(CustomResourceColumnDefinitionV1), nameof(CustomResourceColumnDefinitionV1.Type), InternedStrings.Values),
+            (typeof(CustomResourceDefinitionConditionV1), nameof(CustomResourceDefinitionConditionV1.Type), InternedStrings.Values),
+            (typeof(CustomResourceDefinitionConditionV1), nameof(CustomResourceDefinitionConditionV1.Reason), InternedStrings.Values),
+            (typeof(CustomResourceDefinitionConditionV1), nameof(CustomResourceDefinitionConditionV1.Status), InternedStrings.Values),
+            (typeof(CustomResourceDefinitionNamesV1), nameof(CustomResourceDefinitionNamesV1.Kind), InternedStrings.Values),
+            (typeof(DaemonSetConditionV1), nameof(DaemonSetConditionV1.Type), InternedStrings.Values),
+            (typeof(DaemonSetConditionV1), nameof(DaemonSetConditionV1.Reason), InternedStrings.Values),
+            (typeof(DaemonSetConditionV1), nameof(DaemonSetConditionV1.Status), InternedStrings.Values),
+            (typeof(DaemonSetUpdateStrategyV1), nameof(DaemonSetUpdateStrategyV1.Type), InternedStrings.Values),
+            (typeof(DeploymentConditionV1), nameof(DeploymentConditionV1.Type), InternedStrings.Values),
+            (typeof(DeploymentConditionV1), nameof(DeploymentConditionV1.Reason), InternedStrings.Values),
+            (typeof(DeploymentConditionV1), nameof(DeploymentConditionV1.Status), InternedStrings.Values),
+            (typeof(DeploymentStrategyV1), nameof(DeploymentStrategyV1.Type), InternedStrings.Values),
+            (typeof(DeviceAllocationConfigurationV1Alpha3), nameof(DeviceAllocationConfigurationV1Alpha3.Requests), InternedStrings.Values),
+            (typeof(DeviceClaimConfigurationV1Alpha3), nameof(DeviceClaimConfigurationV1Alpha3.Requests), InternedStrings.Values),
+            (typeof(DeviceConstraintV1Alpha3), nameof(DeviceConstraintV1Alpha3.Requests), InternedStrings.Values),
+            (typeof(DeviceRequestV1Alpha3), nameof(DeviceRequestV1Alpha3.DeviceClassName), InternedStrings.Values),
+            (typeof(EndpointAddressV1), nameof(EndpointAddressV1.NodeName), InternedStrings.Values),
+            (typeof(EndpointPortV1), nameof(EndpointPortV1.Protocol), InternedStrings.Values),
+            (typeof(EndpointV1), nameof(EndpointV1.NodeName), InternedStrings.Values),
+            (typeof(EphemeralContainerV1), nameof(EphemeralContainerV1.Command), InternedStrings.Values),
+            (typeof(EphemeralContainerV1), nameof(EphemeralContainerV1.Image), InternedStrings.Values),
+            (typeof(EphemeralContainerV1), nameof(EphemeralContainerV1.TerminationMessagePath), InternedStrings.Values),
+            (typeof(EphemeralContainerV1), nameof(EphemeralContainerV1.Args), InternedStrings.Values),
+            (typeof(EphemeralContainerV1), nameof(EphemeralContainerV1.ImagePullPolicy), InternedStrings.Values),
+            (typeof(EphemeralContainerV1), nameof(EphemeralContainerV1.RestartPolicy), InternedStrings.Values),
+            (typeof(EphemeralContainerV1), nameof(EphemeralContainerV1.TerminationMessagePolicy), InternedStrings.Values),
+            (typeof(EventV1), nameof(EventV1.Type), InternedStrings.Values),
+            (typeof(EventV1), nameof(EventV1.Reason), InternedStrings.Values),
+            (typeof(ExecActionV1), nameof(ExecActionV1.Command), InternedStrings.Values),
+            (typeof(FieldSelectorRequirementV1), nameof(FieldSelectorRequirementV1.Operator), InternedStrings.Values),
+            (typeof(FlowDistinguisherMethodV1), nameof(FlowDistinguisherMethodV1.Type), InternedStrings.Values),
+            (typeof(FlowDistinguisherMethodV1Beta3), nameof(FlowDistinguisherMethodV1Beta3.Type), InternedStrings.Values),
+            (typeof(FlowSchemaConditionV1), nameof(FlowSchemaConditionV1.Type), InternedStrings.Values),
+            (typeof(FlowSchemaConditionV1), nameof(FlowSchemaConditionV1.Reason), InternedStrings.Values),
+            (typeof(FlowSchemaConditionV1), nameof(FlowSchemaConditionV1.Status), InternedStrings.Values),
+            (typeof(FlowSchemaConditionV1Beta3), nameof(FlowSchemaConditionV1Beta3.Type), InternedStrings.Values),
+            (typeof(FlowSchemaConditionV1Beta3), nameof(FlowSchemaConditionV1Beta3.Reason), InternedStrings.Values),
+            (typeof(FlowSchemaConditionV1Beta3), nameof(FlowSchemaConditionV1Beta3.Status), InternedStrings.Values),
+            (typeof(GroupVersionResourceV1Alpha1), nameof(GroupVersionResourceV1Alpha1.Resource), InternedStrings.Values),
+            (typeof(HPAScalingPolicyV2), nameof(HPAScalingPolicyV2.Type), InternedStrings.Values),
+            (typeof(HPAScalingRulesV2), nameof(HPAScalingRulesV2.SelectPolicy), InternedStrings.Values),
+            (typeof(HTTPGetActionV1), nameof(HTTPGetActionV1.Scheme), InternedStrings.Values),
+            (typeof(HorizontalPodAutoscalerConditionV2), nameof(HorizontalPodAutoscalerConditionV2.Type), InternedStrings.Values),
+            (typeof(HorizontalPodAutoscalerConditionV2), nameof(HorizontalPodAutoscalerConditionV2.Reason), InternedStrings.Values),
+            (typeof(HorizontalPodAutoscalerConditionV2), nameof(HorizontalPodAutoscalerConditionV2.Status), InternedStrings.Values),
+            (typeof(HostPathVolumeSourceV1), nameof(HostPathVolumeSourceV1.Type), InternedStrings.Values),
+            (typeof(ImageVolumeSourceV1), nameof(ImageVolumeSourceV1.PullPolicy), InternedStrings.Values),
+            (typeof(IngressClassParametersReferenceV1), nameof(IngressClassParametersReferenceV1.Kind), InternedStrings.Values),
+            (typeof(IngressClassParametersReferenceV1), nameof(IngressClassParametersReferenceV1.Namespace), InternedStrings.Values),
+            (typeof(IngressClassParametersReferenceV1), nameof(IngressClassParametersReferenceV1.ApiGroup), InternedStrings.Values),
+            (typeof(IngressPortStatusV1), nameof(IngressPortStatusV1.Protocol), InternedStrings.Values),
+            (typeof(IngressSpecV1), nameof(IngressSpecV1.IngressClassName), InternedStrings.Values),
+            (typeof(JSONSchemaPropsV1), nameof(JSONSchemaPropsV1.Type), InternedStrings.Values),
+            (typeof(JobConditionV1), nameof(JobConditionV1.Type), InternedStrings.Values),
+            (typeof(JobConditionV1), nameof(JobConditionV1.Reason), InternedStrings.Values),
+            (typeof(JobConditionV1), nameof(JobConditionV1.Status), InternedStrings.Values),
+            (typeof(JobSpecV1), nameof(JobSpecV1.PodReplacementPolicy), InternedStrings.Values),
+            (typeof(LabelSelectorRequirementV1), nameof(LabelSelectorRequirementV1.Operator), InternedStrings.Values),
+            (typeof(LabelSelectorV1), nameof(LabelSelectorV1.MatchLabels), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(LimitRangeItemV1), nameof(LimitRangeItemV1.Type), InternedStrings.Values),
+            (typeof(LimitResponseV1), nameof(LimitResponseV1.Type), InternedStrings.Values),
+            (typeof(LimitResponseV1Beta3), nameof(LimitResponseV1Beta3.Type), InternedStrings.Values),
+            (typeof(ManagedFieldsEntryV1), nameof(ManagedFieldsEntryV1.FieldsType), InternedStrings.Values),
+            (typeof(ManagedFieldsEntryV1), nameof(ManagedFieldsEntryV1.ApiVersion), InternedStrings.Values),
+            (typeof(ManagedFieldsEntryV1), nameof(ManagedFieldsEntryV1.Operation), InternedStrings.Values),
+            (typeof(ManagedFieldsEntryV1), nameof(ManagedFieldsEntryV1.Manager), InternedStrings.Values),
+            (typeof(MatchResourcesV1), nameof(MatchResourcesV1.MatchPolicy), InternedStrings.Values),
+            (typeof(MatchResourcesV1Alpha1), nameof(MatchResourcesV1Alpha1.MatchPolicy), InternedStrings.Values),
+            (typeof(MatchResourcesV1Beta1), nameof(MatchResourcesV1Beta1.MatchPolicy), InternedStrings.Values),
+            (typeof(MetricSpecV2), nameof(MetricSpecV2.Type), InternedStrings.Values),
+            (typeof(MetricStatusV2), nameof(MetricStatusV2.Type), InternedStrings.Values),
+            (typeof(MetricTargetV2), nameof(MetricTargetV2.Type), InternedStrings.Values),
+            (typeof(MigrationConditionV1Alpha1), nameof(MigrationConditionV1Alpha1.Type), InternedStrings.Values),
+            (typeof(MigrationConditionV1Alpha1), nameof(MigrationConditionV1Alpha1.Reason), InternedStrings.Values),
+            (typeof(MigrationConditionV1Alpha1), nameof(MigrationConditionV1Alpha1.Status), InternedStrings.Values),
+            (typeof(ModifyVolumeStatusV1), nameof(ModifyVolumeStatusV1.TargetVolumeAttributesClassName), InternedStrings.Values),
+            (typeof(ModifyVolumeStatusV1), nameof(ModifyVolumeStatusV1.Status), InternedStrings.Values),
+            (typeof(MutatingWebhookV1), nameof(MutatingWebhookV1.FailurePolicy), InternedStrings.Values),
+            (typeof(MutatingWebhookV1), nameof(MutatingWebhookV1.MatchPolicy), InternedStrings.Values),
+            (typeof(MutatingWebhookV1), nameof(MutatingWebhookV1.ReinvocationPolicy), InternedStrings.Values),
+            (typeof(NamespaceConditionV1), nameof(NamespaceConditionV1.Type), InternedStrings.Values),
+            (typeof(NamespaceConditionV1), nameof(NamespaceConditionV1.Reason), InternedStrings.Values),
+            (typeof(NamespaceConditionV1), nameof(NamespaceConditionV1.Status), InternedStrings.Values),
+            (typeof(NamespaceSpecV1), nameof(NamespaceSpecV1.Finalizers), InternedStrings.Values),
+            (typeof(NamespaceStatusV1), nameof(NamespaceStatusV1.Phase), InternedStrings.Values),
+            (typeof(NetworkPolicyPortV1), nameof(NetworkPolicyPortV1.Protocol), InternedStrings.Values),
+            (typeof(NodeAddressV1), nameof(NodeAddressV1.Type), InternedStrings.Values),
+            (typeof(NodeConditionV1), nameof(NodeConditionV1.Type), InternedStrings.Values),
+            (typeof(NodeConditionV1), nameof(NodeConditionV1.Reason), InternedStrings.Values),
+            (typeof(NodeConditionV1), nameof(NodeConditionV1.Status), InternedStrings.Values),
+            (typeof(NodeSelectorRequirementV1), nameof(NodeSelectorRequirementV1.Operator), InternedStrings.Values),
+            (typeof(NodeStatusV1), nameof(NodeStatusV1.Allocatable), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(NodeStatusV1), nameof(NodeStatusV1.Phase), InternedStrings.Values),
+            (typeof(NodeStatusV1), nameof(NodeStatusV1.Capacity), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(ObjectFieldSelectorV1), nameof(ObjectFieldSelectorV1.ApiVersion), InternedStrings.Values),
+            (typeof(ObjectMetaV1), nameof(ObjectMetaV1.GenerateName), InternedStrings.Values),
+            (typeof(ObjectMetaV1), nameof(ObjectMetaV1.Namespace), InternedStrings.Values),
+            (typeof(ObjectMetaV1), nameof(ObjectMetaV1.Annotations), InternedStrings.DictionaryKeys),
+            (typeof(ObjectMetaV1), nameof(ObjectMetaV1.Finalizers), InternedStrings.Values),
+            (typeof(ObjectMetaV1), nameof(ObjectMetaV1.Labels), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(ObjectReferenceV1), nameof(ObjectReferenceV1.Namespace), InternedStrings.Values),
+            (typeof(ParamRefV1), nameof(ParamRefV1.Namespace), InternedStrings.Values),
+            (typeof(ParamRefV1Alpha1), nameof(ParamRefV1Alpha1.Namespace), InternedStrings.Values),
+            (typeof(ParamRefV1Beta1), nameof(ParamRefV1Beta1.Namespace), InternedStrings.Values),
+            (typeof(ParentReferenceV1Beta1), nameof(ParentReferenceV1Beta1.Namespace), InternedStrings.Values),
+            (typeof(ParentReferenceV1Beta1), nameof(ParentReferenceV1Beta1.Resource), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimConditionV1), nameof(PersistentVolumeClaimConditionV1.Type), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimConditionV1), nameof(PersistentVolumeClaimConditionV1.Reason), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimConditionV1), nameof(PersistentVolumeClaimConditionV1.Status), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimSpecV1), nameof(PersistentVolumeClaimSpecV1.StorageClassName), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimSpecV1), nameof(PersistentVolumeClaimSpecV1.VolumeAttributesClassName), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimStatusV1), nameof(PersistentVolumeClaimStatusV1.CurrentVolumeAttributesClassName), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimStatusV1), nameof(PersistentVolumeClaimStatusV1.Phase), InternedStrings.Values),
+            (typeof(PersistentVolumeClaimStatusV1), nameof(PersistentVolumeClaimStatusV1.Capacity), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(PersistentVolumeSpecV1), nameof(PersistentVolumeSpecV1.StorageClassName), InternedStrings.Values),
+            (typeof(PersistentVolumeSpecV1), nameof(PersistentVolumeSpecV1.VolumeAttributesClassName), InternedStrings.Values),
+            (typeof(PersistentVolumeSpecV1), nameof(PersistentVolumeSpecV1.Capacity), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(PersistentVolumeSpecV1), nameof(PersistentVolumeSpecV1.PersistentVolumeReclaimPolicy), InternedStrings.Values),
+            (typeof(PersistentVolumeStatusV1), nameof(PersistentVolumeStatusV1.Phase), InternedStrings.Values),
+            (typeof(PersistentVolumeStatusV1), nameof(PersistentVolumeStatusV1.Reason), InternedStrings.Values),
+            (typeof(PodConditionV1), nameof(PodConditionV1.Type), InternedStrings.Values),
+            (typeof(PodConditionV1), nameof(PodConditionV1.Reason), InternedStrings.Values),
+            (typeof(PodConditionV1), nameof(PodConditionV1.Status), InternedStrings.Values),
+            (typeof(PodDisruptionBudgetSpecV1), nameof(PodDisruptionBudgetSpecV1.UnhealthyPodEvictionPolicy), InternedStrings.Values),
+            (typeof(PodFailurePolicyOnExitCodesRequirementV1), nameof(PodFailurePolicyOnExitCodesRequirementV1.Operator), InternedStrings.Values),
+            (typeof(PodFailurePolicyOnPodConditionsPatternV1), nameof(PodFailurePolicyOnPodConditionsPatternV1.Type), InternedStrings.Values),
+            (typeof(PodFailurePolicyOnPodConditionsPatternV1), nameof(PodFailurePolicyOnPodConditionsPatternV1.Status), InternedStrings.Values),
+            (typeof(PodSecurityContextV1), nameof(PodSecurityContextV1.FsGroupChangePolicy), InternedStrings.Values),
+            (typeof(PodSecurityContextV1), nameof(PodSecurityContextV1.SupplementalGroupsPolicy), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.NodeName), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.PriorityClassName), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.RuntimeClassName), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.SchedulerName), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.ServiceAccountName), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.NodeSelector), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.ServiceAccount), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.DnsPolicy), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.PreemptionPolicy), InternedStrings.Values),
+            (typeof(PodSpecV1), nameof(PodSpecV1.RestartPolicy), InternedStrings.Values),
+            (typeof(PodStatusV1), nameof(PodStatusV1.HostIP), InternedStrings.Values),
+            (typeof(PodStatusV1), nameof(PodStatusV1.Phase), InternedStrings.Values),
+            (typeof(PodStatusV1), nameof(PodStatusV1.Reason), InternedStrings.Values),
+            (typeof(PodStatusV1), nameof(PodStatusV1.QosClass), InternedStrings.Values),
+            (typeof(PortStatusV1), nameof(PortStatusV1.Protocol), InternedStrings.Values),
+            (typeof(PriorityClassV1), nameof(PriorityClassV1.PreemptionPolicy), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationConditionV1), nameof(PriorityLevelConfigurationConditionV1.Type), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationConditionV1), nameof(PriorityLevelConfigurationConditionV1.Reason), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationConditionV1), nameof(PriorityLevelConfigurationConditionV1.Status), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationConditionV1Beta3), nameof(PriorityLevelConfigurationConditionV1Beta3.Type), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationConditionV1Beta3), nameof(PriorityLevelConfigurationConditionV1Beta3.Reason), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationConditionV1Beta3), nameof(PriorityLevelConfigurationConditionV1Beta3.Status), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationSpecV1), nameof(PriorityLevelConfigurationSpecV1.Type), InternedStrings.Values),
+            (typeof(PriorityLevelConfigurationSpecV1Beta3), nameof(PriorityLevelConfigurationSpecV1Beta3.Type), InternedStrings.Values),
+            (typeof(RBDPersistentVolumeSourceV1), nameof(RBDPersistentVolumeSourceV1.Image), InternedStrings.Values),
+            (typeof(RBDVolumeSourceV1), nameof(RBDVolumeSourceV1.Image), InternedStrings.Values),
+            (typeof(ReplicaSetConditionV1), nameof(ReplicaSetConditionV1.Type), InternedStrings.Values),
+            (typeof(ReplicaSetConditionV1), nameof(ReplicaSetConditionV1.Reason), InternedStrings.Values),
+            (typeof(ReplicaSetConditionV1), nameof(ReplicaSetConditionV1.Status), InternedStrings.Values),
+            (typeof(ReplicationControllerConditionV1), nameof(ReplicationControllerConditionV1.Type), InternedStrings.Values),
+            (typeof(ReplicationControllerConditionV1), nameof(ReplicationControllerConditionV1.Reason), InternedStrings.Values),
+            (typeof(ReplicationControllerConditionV1), nameof(ReplicationControllerConditionV1.Status), InternedStrings.Values),
+            (typeof(ReplicationControllerSpecV1), nameof(ReplicationControllerSpecV1.Selector), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(ResourceAttributesV1), nameof(ResourceAttributesV1.Namespace), InternedStrings.Values),
+            (typeof(ResourceAttributesV1), nameof(ResourceAttributesV1.Resource), InternedStrings.Values),
+            (typeof(ResourceClaimConsumerReferenceV1Alpha3), nameof(ResourceClaimConsumerReferenceV1Alpha3.Resource), InternedStrings.Values),
+            (typeof(ResourceClaimConsumerReferenceV1Alpha3), nameof(ResourceClaimConsumerReferenceV1Alpha3.ApiGroup), InternedStrings.Values),
+            (typeof(ResourceFieldSelectorV1), nameof(ResourceFieldSelectorV1.Resource), InternedStrings.Values),
+            (typeof(ResourceRequirementsV1), nameof(ResourceRequirementsV1.Limits), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(ResourceRequirementsV1), nameof(ResourceRequirementsV1.Requests), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(ResourceSliceSpecV1Alpha3), nameof(ResourceSliceSpecV1Alpha3.NodeName), InternedStrings.Values),
+            (typeof(RoleRefV1), nameof(RoleRefV1.Kind), InternedStrings.Values),
+            (typeof(RoleRefV1), nameof(RoleRefV1.ApiGroup), InternedStrings.Values),
+            (typeof(SELinuxOptionsV1), nameof(SELinuxOptionsV1.Type), InternedStrings.Values),
+            (typeof(ScaleStatusV1), nameof(ScaleStatusV1.Selector), InternedStrings.Values),
+            (typeof(SchedulingV1), nameof(SchedulingV1.NodeSelector), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(ScopedResourceSelectorRequirementV1), nameof(ScopedResourceSelectorRequirementV1.Operator), InternedStrings.Values),
+            (typeof(SeccompProfileV1), nameof(SeccompProfileV1.Type), InternedStrings.Values),
+            (typeof(SecretReferenceV1), nameof(SecretReferenceV1.Namespace), InternedStrings.Values),
+            (typeof(SecretV1), nameof(SecretV1.Type), InternedStrings.Values),
+            (typeof(SelfSubjectRulesReviewSpecV1), nameof(SelfSubjectRulesReviewSpecV1.Namespace), InternedStrings.Values),
+            (typeof(ServiceAccountSubjectV1), nameof(ServiceAccountSubjectV1.Namespace), InternedStrings.Values),
+            (typeof(ServiceAccountSubjectV1Beta3), nameof(ServiceAccountSubjectV1Beta3.Namespace), InternedStrings.Values),
+            (typeof(ServicePortV1), nameof(ServicePortV1.Protocol), InternedStrings.Values),
+            (typeof(ServiceReferenceV1), nameof(ServiceReferenceV1.Namespace), InternedStrings.Values),
+            (typeof(ServiceSpecV1), nameof(ServiceSpecV1.Type), InternedStrings.Values),
+            (typeof(ServiceSpecV1), nameof(ServiceSpecV1.Selector), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(ServiceSpecV1), nameof(ServiceSpecV1.ExternalTrafficPolicy), InternedStrings.Values),
+            (typeof(ServiceSpecV1), nameof(ServiceSpecV1.InternalTrafficPolicy), InternedStrings.Values),
+            (typeof(ServiceSpecV1), nameof(ServiceSpecV1.IpFamilyPolicy), InternedStrings.Values),
+            (typeof(StatefulSetConditionV1), nameof(StatefulSetConditionV1.Type), InternedStrings.Values),
+            (typeof(StatefulSetConditionV1), nameof(StatefulSetConditionV1.Reason), InternedStrings.Values),
+            (typeof(StatefulSetConditionV1), nameof(StatefulSetConditionV1.Status), InternedStrings.Values),
+            (typeof(StatefulSetSpecV1), nameof(StatefulSetSpecV1.PodManagementPolicy), InternedStrings.Values),
+            (typeof(StatefulSetUpdateStrategyV1), nameof(StatefulSetUpdateStrategyV1.Type), InternedStrings.Values),
+            (typeof(StatusCauseV1), nameof(StatusCauseV1.Reason), InternedStrings.Values),
+            (typeof(StatusDetailsV1), nameof(StatusDetailsV1.Kind), InternedStrings.Values),
+            (typeof(StatusV1), nameof(StatusV1.Reason), InternedStrings.Values),
+            (typeof(StatusV1), nameof(StatusV1.Status), InternedStrings.Values),
+            (typeof(StorageClassV1), nameof(StorageClassV1.ReclaimPolicy), InternedStrings.Values),
+            (typeof(StorageVersionConditionV1Alpha1), nameof(StorageVersionConditionV1Alpha1.Type), InternedStrings.Values),
+            (typeof(StorageVersionConditionV1Alpha1), nameof(StorageVersionConditionV1Alpha1.Reason), InternedStrings.Values),
+            (typeof(StorageVersionConditionV1Alpha1), nameof(StorageVersionConditionV1Alpha1.Status), InternedStrings.Values),
+            (typeof(SubjectAccessReviewStatusV1), nameof(SubjectAccessReviewStatusV1.Reason), InternedStrings.Values),
+            (typeof(SubjectV1), nameof(SubjectV1.Kind), InternedStrings.Values),
+            (typeof(SubjectV1), nameof(SubjectV1.Namespace), InternedStrings.Values),
+            (typeof(SubjectV1), nameof(SubjectV1.ApiGroup), InternedStrings.Values),
+            (typeof(SubjectV1Beta3), nameof(SubjectV1Beta3.Kind), InternedStrings.Values),
+            (typeof(TaintV1), nameof(TaintV1.Effect), InternedStrings.Values),
+            (typeof(TolerationV1), nameof(TolerationV1.Operator), InternedStrings.Values),
+            (typeof(TolerationV1), nameof(TolerationV1.Effect), InternedStrings.Values),
+            (typeof(TopologySpreadConstraintV1), nameof(TopologySpreadConstraintV1.NodeAffinityPolicy), InternedStrings.Values),
+            (typeof(TopologySpreadConstraintV1), nameof(TopologySpreadConstraintV1.NodeTaintsPolicy), InternedStrings.Values),
+            (typeof(TypedLocalObjectReferenceV1), nameof(TypedLocalObjectReferenceV1.Kind), InternedStrings.Values),
+            (typeof(TypedLocalObjectReferenceV1), nameof(TypedLocalObjectReferenceV1.ApiGroup), InternedStrings.Values),
+            (typeof(TypedObjectReferenceV1), nameof(TypedObjectReferenceV1.Kind), InternedStrings.Values),
+            (typeof(TypedObjectReferenceV1), nameof(TypedObjectReferenceV1.Namespace), InternedStrings.Values),
+            (typeof(TypedObjectReferenceV1), nameof(TypedObjectReferenceV1.ApiGroup), InternedStrings.Values),
+            (typeof(ValidatingAdmissionPolicySpecV1), nameof(ValidatingAdmissionPolicySpecV1.FailurePolicy), InternedStrings.Values),
+            (typeof(ValidatingAdmissionPolicySpecV1Alpha1), nameof(ValidatingAdmissionPolicySpecV1Alpha1.FailurePolicy), InternedStrings.Values),
+            (typeof(ValidatingAdmissionPolicySpecV1Beta1), nameof(ValidatingAdmissionPolicySpecV1Beta1.FailurePolicy), InternedStrings.Values),
+            (typeof(ValidatingWebhookV1), nameof(ValidatingWebhookV1.FailurePolicy), InternedStrings.Values),
+            (typeof(ValidatingWebhookV1), nameof(ValidatingWebhookV1.MatchPolicy), InternedStrings.Values),
+            (typeof(ValidationRuleV1), nameof(ValidationRuleV1.Reason), InternedStrings.Values),
+            (typeof(ValidationV1), nameof(ValidationV1.Reason), InternedStrings.Values),
+            (typeof(ValidationV1Alpha1), nameof(ValidationV1Alpha1.Reason), InternedStrings.Values),
+            (typeof(ValidationV1Beta1), nameof(ValidationV1Beta1.Reason), InternedStrings.Values),
+            (typeof(VolumeAttachmentSpecV1), nameof(VolumeAttachmentSpecV1.NodeName), InternedStrings.Values),
+            (typeof(VolumeMountStatusV1), nameof(VolumeMountStatusV1.MountPath), InternedStrings.Values),
+            (typeof(VolumeMountV1), nameof(VolumeMountV1.MountPath), InternedStrings.Values),
+            (typeof(VolumeResourceRequirementsV1), nameof(VolumeResourceRequirementsV1.Limits), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(VolumeResourceRequirementsV1), nameof(VolumeResourceRequirementsV1.Requests), InternedStrings.DictionaryKeys | InternedStrings.Values),
+            (typeof(WatchEventV1), nameof(WatchEventV1.Type), InternedStrings.Values),
+        };
+    }
+}
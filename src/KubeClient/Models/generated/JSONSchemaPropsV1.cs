@@ -380,7 +380,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "rule")]
         [YamlMember(Alias = "x-kubernetes-validations")]
         [JsonProperty("x-kubernetes-validations", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ValidationRuleV1> KubernetesValidations { get; } = new List<ValidationRuleV1>();
+        public KubeKeyedList<string, ValidationRuleV1> KubernetesValidations { get; } = new KubeKeyedList<string, ValidationRuleV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="KubernetesValidations"/> property should be serialised.
@@ -0,0 +1,2867 @@
+using System;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Metadata for well-known model types.
+    /// </summary>
+    public static partial class KnownModels
+    {
+        /// <summary>
+        ///     Generated resource model types (derived from <see cref="KubeResourceV1"/>), with their kinds and API versions (and the range of <see cref="GeneratedApiActions"/> that describes their APIs).
+        /// </summary>
+        static readonly (Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount)[] GeneratedResourceTypes =
+        {
+            (typeof(APIServiceV1), "APIService", "apiregistration.k8s.io/v1", 0, 12),
+            (typeof(APIServiceV1Beta1), "APIService", "apiregistration.k8s.io/v1beta1", 12, 12),
+            (typeof(BindingV1), "Binding", "v1", 24, 2),
+            (typeof(CSIDriverV1), "CSIDriver", "storage.k8s.io/v1", 26, 9),
+            (typeof(CSINodeV1), "CSINode", "storage.k8s.io/v1", 35, 9),
+            (typeof(CSIStorageCapacityV1), "CSIStorageCapacity", "storage.k8s.io/v1", 44, 11),
+            (typeof(CertificateSigningRequestV1), "CertificateSigningRequest", "certificates.k8s.io/v1", 55, 15),
+            (typeof(CertificateSigningRequestV1Beta1), "CertificateSigningRequest", "certificates.k8s.io/v1beta1", 70, 13),
+            (typeof(ClusterRoleBindingV1), "ClusterRoleBinding", "rbac.authorization.k8s.io/v1", 83, 9),
+            (typeof(ClusterRoleBindingV1Alpha1), "ClusterRoleBinding", "rbac.authorization.k8s.io/v1alpha1", 92, 9),
+            (typeof(ClusterRoleBindingV1Beta1), "ClusterRoleBinding", "rbac.authorization.k8s.io/v1beta1", 101, 9),
+            (typeof(ClusterRoleV1), "ClusterRole", "rbac.authorization.k8s.io/v1", 110, 9),
+            (typeof(ClusterRoleV1Alpha1), "ClusterRole", "rbac.authorization.k8s.io/v1alpha1", 119, 9),
+            (typeof(ClusterRoleV1Beta1), "ClusterRole", "rbac.authorization.k8s.io/v1beta1", 128, 9),
+            (typeof(ClusterTrustBundleV1Alpha1), "ClusterTrustBundle", "certificates.k8s.io/v1alpha1", 137, 9),
+            (typeof(ComponentStatusV1), "ComponentStatus", "v1", 146, 2),
+            (typeof(ConfigMapV1), "ConfigMap", "v1", 148, 11),
+            (typeof(ControllerRevisionV1), "ControllerRevision", "apps/v1", 159, 11),
+            (typeof(ControllerRevisionV1Beta1), "ControllerRevision", "apps/v1beta1", 170, 11),
+            (typeof(ControllerRevisionV1Beta2), "ControllerRevision", "apps/v1beta2", 181, 11),
+            (typeof(CronJobV1), "CronJob", "batch/v1", 192, 14),
+            (typeof(CronJobV1Beta1), "CronJob", "batch/v1beta1", 206, 14),
+            (typeof(CronJobV2Alpha1), "CronJob", "batch/v2alpha1", 220, 14),
+            (typeof(CustomResourceDefinitionV1), "CustomResourceDefinition", "apiextensions.k8s.io/v1", 234, 12),
+            (typeof(CustomResourceDefinitionV1Beta1), "CustomResourceDefinition", "apiextensions.k8s.io/v1beta1", 246, 12),
+            (typeof(DaemonSetV1), "DaemonSet", "apps/v1", 258, 14),
+            (typeof(DaemonSetV1Beta1), "DaemonSet", "extensions/v1beta1", 272, 14),
+            (typeof(DaemonSetV1Beta2), "DaemonSet", "apps/v1beta2", 286, 14),
+            (typeof(DeploymentV1), "Deployment", "apps/v1", 300, 14),
+            (typeof(DeploymentV1Beta1), "Deployment", "apps/v1beta1", 314, 14),
+            (typeof(DeploymentV1Beta2), "Deployment", "apps/v1beta2", 328, 14),
+            (typeof(DeviceClassV1Alpha3), "DeviceClass", "resource.k8s.io/v1alpha3", 342, 9),
+            (typeof(EndpointSliceV1), "EndpointSlice", "discovery.k8s.io/v1", 351, 11),
+            (typeof(EndpointsV1), "Endpoints", "v1", 362, 11),
+            (typeof(EventV1), "Event", "v1", 373, 11),
+            (typeof(EventV1Beta1), "Event", "events.k8s.io/v1beta1", 384, 11),
+            (typeof(EvictionV1), "Eviction", "policy/v1", 395, 1),
+            (typeof(EvictionV1Beta1), "Eviction", "policy/v1beta1", 396, 1),
+            (typeof(FlowSchemaV1), "FlowSchema", "flowcontrol.apiserver.k8s.io/v1", 397, 12),
+            (typeof(FlowSchemaV1Beta3), "FlowSchema", "flowcontrol.apiserver.k8s.io/v1beta3", 409, 12),
+            (typeof(HorizontalPodAutoscalerV1), "HorizontalPodAutoscaler", "autoscaling/v1", 421, 14),
+            (typeof(HorizontalPodAutoscalerV2), "HorizontalPodAutoscaler", "autoscaling/v2", 435, 14),
+            (typeof(HorizontalPodAutoscalerV2Beta1), "HorizontalPodAutoscaler", "autoscaling/v2beta1", 449, 14),
+            (typeof(IPAddressV1Beta1), "IPAddress", "networking.k8s.io/v1beta1", 463, 9),
+            (typeof(IngressClassV1), "IngressClass", "networking.k8s.io/v1", 472, 9),
+            (typeof(IngressV1), "Ingress", "networking.k8s.io/v1", 481, 14),
+            (typeof(IngressV1Beta1), "Ingress", "extensions/v1beta1", 495, 14),
+            (typeof(InitializerConfigurationV1Alpha1), "InitializerConfiguration", "admissionregistration.k8s.io/v1alpha1", 509, 9),
+            (typeof(JobV1), "Job", "batch/v1", 518, 14),
+            (typeof(LeaseCandidateV1Alpha1), "LeaseCandidate", "coordination.k8s.io/v1alpha1", 532, 11),
+            (typeof(LeaseV1), "Lease", "coordination.k8s.io/v1", 543, 11),
+            (typeof(LimitRangeV1), "LimitRange", "v1", 554, 11),
+            (typeof(LocalSubjectAccessReviewV1), "LocalSubjectAccessReview", "authorization.k8s.io/v1", 565, 1),
+            (typeof(LocalSubjectAccessReviewV1Beta1), "LocalSubjectAccessReview", "authorization.k8s.io/v1beta1", 566, 1),
+            (typeof(MutatingWebhookConfigurationV1), "MutatingWebhookConfiguration", "admissionregistration.k8s.io/v1", 567, 9),
+            (typeof(MutatingWebhookConfigurationV1Beta1), "MutatingWebhookConfiguration", "admissionregistration.k8s.io/v1beta1", 576, 9),
+            (typeof(NamespaceV1), "Namespace", "v1", 585, 12),
+            (typeof(NetworkPolicyV1), "NetworkPolicy", "networking.k8s.io/v1", 597, 11),
+            (typeof(NodeV1), "Node", "v1", 608, 12),
+            (typeof(PersistentVolumeClaimV1), "PersistentVolumeClaim", "v1", 620, 14),
+            (typeof(PersistentVolumeV1), "PersistentVolume", "v1", 634, 12),
+            (typeof(PodDisruptionBudgetV1), "PodDisruptionBudget", "policy/v1", 646, 14),
+            (typeof(PodDisruptionBudgetV1Beta1), "PodDisruptionBudget", "policy/v1beta1", 660, 14),
+            (typeof(PodPresetV1Alpha1), "PodPreset", "settings.k8s.io/v1alpha1", 674, 11),
+            (typeof(PodSchedulingContextV1Alpha3), "PodSchedulingContext", "resource.k8s.io/v1alpha3", 685, 14),
+            (typeof(PodSecurityPolicyV1Beta1), "PodSecurityPolicy", "policy/v1beta1", 699, 9),
+            (typeof(PodTemplateV1), "PodTemplate", "v1", 708, 11),
+            (typeof(PodV1), "Pod", "v1", 719, 18),
+            (typeof(PriorityClassV1), "PriorityClass", "scheduling.k8s.io/v1", 737, 9),
+            (typeof(PriorityClassV1Alpha1), "PriorityClass", "scheduling.k8s.io/v1alpha1", 746, 9),
+            (typeof(PriorityClassV1Beta1), "PriorityClass", "scheduling.k8s.io/v1beta1", 755, 9),
+            (typeof(PriorityLevelConfigurationV1), "PriorityLevelConfiguration", "flowcontrol.apiserver.k8s.io/v1", 764, 12),
+            (typeof(PriorityLevelConfigurationV1Beta3), "PriorityLevelConfiguration", "flowcontrol.apiserver.k8s.io/v1beta3", 776, 12),
+            (typeof(ReplicaSetV1), "ReplicaSet", "apps/v1", 788, 14),
+            (typeof(ReplicaSetV1Beta2), "ReplicaSet", "apps/v1beta2", 802, 14),
+            (typeof(ReplicationControllerV1), "ReplicationController", "v1", 816, 14),
+            (typeof(ResourceClaimTemplateV1Alpha3), "ResourceClaimTemplate", "resource.k8s.io/v1alpha3", 830, 11),
+            (typeof(ResourceClaimV1Alpha3), "ResourceClaim", "resource.k8s.io/v1alpha3", 841, 14),
+            (typeof(ResourceQuotaV1), "ResourceQuota", "v1", 855, 14),
+            (typeof(ResourceSliceV1Alpha3), "ResourceSlice", "resource.k8s.io/v1alpha3", 869, 9),
+            (typeof(RoleBindingV1), "RoleBinding", "rbac.authorization.k8s.io/v1", 878, 11),
+            (typeof(RoleBindingV1Alpha1), "RoleBinding", "rbac.authorization.k8s.io/v1alpha1", 889, 11),
+            (typeof(RoleBindingV1Beta1), "RoleBinding", "rbac.authorization.k8s.io/v1beta1", 900, 11),
+            (typeof(RoleV1), "Role", "rbac.authorization.k8s.io/v1", 911, 11),
+            (typeof(RoleV1Alpha1), "Role", "rbac.authorization.k8s.io/v1alpha1", 922, 11),
+            (typeof(RoleV1Beta1), "Role", "rbac.authorization.k8s.io/v1beta1", 933, 11),
+            (typeof(RuntimeClassV1), "RuntimeClass", "node.k8s.io/v1", 944, 9),
+            (typeof(ScaleV1), "Scale", "autoscaling/v1", 953, 12),
+            (typeof(ScaleV1Beta1), "Scale", "apps/v1beta1", 965, 6),
+            (typeof(ScaleV1Beta2), "Scale", "apps/v1beta2", 971, 9),
+            (typeof(SecretV1), "Secret", "v1", 980, 11),
+            (typeof(SelfSubjectAccessReviewV1), "SelfSubjectAccessReview", "authorization.k8s.io/v1", 991, 1),
+            (typeof(SelfSubjectAccessReviewV1Beta1), "SelfSubjectAccessReview", "authorization.k8s.io/v1beta1", 992, 1),
+            (typeof(SelfSubjectReviewV1), "SelfSubjectReview", "authentication.k8s.io/v1", 993, 1),
+            (typeof(SelfSubjectReviewV1Alpha1), "SelfSubjectReview", "authentication.k8s.io/v1alpha1", 994, 1),
+            (typeof(SelfSubjectReviewV1Beta1), "SelfSubjectReview", "authentication.k8s.io/v1beta1", 995, 1),
+            (typeof(SelfSubjectRulesReviewV1), "SelfSubjectRulesReview", "authorization.k8s.io/v1", 996, 1),
+            (typeof(SelfSubjectRulesReviewV1Beta1), "SelfSubjectRulesReview", "authorization.k8s.io/v1beta1", 997, 1),
+            (typeof(ServiceAccountV1), "ServiceAccount", "v1", 998, 11),
+            (typeof(ServiceCIDRV1Beta1), "ServiceCIDR", "networking.k8s.io/v1beta1", 1009, 12),
+            (typeof(ServiceV1), "Service", "v1", 1021, 14),
+            (typeof(StatefulSetV1), "StatefulSet", "apps/v1", 1035, 14),
+            (typeof(StatefulSetV1Beta1), "StatefulSet", "apps/v1beta1", 1049, 14),
+            (typeof(StatefulSetV1Beta2), "StatefulSet", "apps/v1beta2", 1063, 14),
+            (typeof(StorageClassV1), "StorageClass", "storage.k8s.io/v1", 1077, 9),
+            (typeof(StorageClassV1Beta1), "StorageClass", "storage.k8s.io/v1beta1", 1086, 9),
+            (typeof(StorageVersionMigrationV1Alpha1), "StorageVersionMigration", "storagemigration.k8s.io/v1alpha1", 1095, 12),
+            (typeof(StorageVersionV1Alpha1), "StorageVersion", "internal.apiserver.k8s.io/v1alpha1", 1107, 12),
+            (typeof(SubjectAccessReviewV1), "SubjectAccessReview", "authorization.k8s.io/v1", 1119, 1),
+            (typeof(SubjectAccessReviewV1Beta1), "SubjectAccessReview", "authorization.k8s.io/v1beta1", 1120, 1),
+            (typeof(TokenReviewV1), "TokenReview", "authentication.k8s.io/v1", 1121, 1),
+            (typeof(TokenReviewV1Beta1), "TokenReview", "authentication.k8s.io/v1beta1", 1122, 1),
+            (typeof(ValidatingAdmissionPolicyBindingV1), "ValidatingAdmissionPolicyBinding", "admissionregistration.k8s.io/v1", 1123, 9),
+            (typeof(ValidatingAdmissionPolicyBindingV1Alpha1), "ValidatingAdmissionPolicyBinding", "admissionregistration.k8s.io/v1alpha1", 1132, 9),
+            (typeof(ValidatingAdmissionPolicyBindingV1Beta1), "ValidatingAdmissionPolicyBinding", "admissionregistration.k8s.io/v1beta1", 1141, 9),
+            (typeof(ValidatingAdmissionPolicyV1), "ValidatingAdmissionPolicy", "admissionregistration.k8s.io/v1", 1150, 12),
+            (typeof(ValidatingAdmissionPolicyV1Alpha1), "ValidatingAdmissionPolicy", "admissionregistration.k8s.io/v1alpha1", 1162, 12),
+            (typeof(ValidatingAdmissionPolicyV1Beta1), "ValidatingAdmissionPolicy", "admissionregistration.k8s.io/v1beta1", 1174, 12),
+            (typeof(ValidatingWebhookConfigurationV1), "ValidatingWebhookConfiguration", "admissionregistration.k8s.io/v1", 1186, 9),
+            (typeof(ValidatingWebhookConfigurationV1Beta1), "ValidatingWebhookConfiguration", "admissionregistration.k8s.io/v1beta1", 1195, 9),
+            (typeof(VolumeAttachmentV1), "VolumeAttachment", "storage.k8s.io/v1", 1204, 12),
+            (typeof(VolumeAttachmentV1Alpha1), "VolumeAttachment", "storage.k8s.io/v1alpha1", 1216, 9),
+            (typeof(VolumeAttachmentV1Beta1), "VolumeAttachment", "storage.k8s.io/v1beta1", 1225, 9),
+            (typeof(VolumeAttributesClassV1Alpha1), "VolumeAttributesClass", "storage.k8s.io/v1alpha1", 1234, 9),
+            (typeof(VolumeAttributesClassV1Beta1), "VolumeAttributesClass", "storage.k8s.io/v1beta1", 1243, 9),
+        };
+
+        /// <summary>
+        ///     API actions for generated resource model types (each with an index into <see cref="GeneratedApiPathTemplates"/>).
+        /// </summary>
+        static readonly (KubeAction action, int pathTemplate)[] GeneratedApiActions =
+        {
+            (KubeAction.Create, 158),
+            (KubeAction.Delete, 159),
+            (KubeAction.DeleteCollection, 158),
+            (KubeAction.Get, 159),
+            (KubeAction.Get, 160),
+            (KubeAction.List, 158),
+            (KubeAction.Patch, 159),
+            (KubeAction.Patch, 160),
+            (KubeAction.Update, 159),
+            (KubeAction.Update, 160),
+            (KubeAction.Watch, 162),
+            (KubeAction.WatchList, 161),
+            (KubeAction.List, 163),
+            (KubeAction.Create, 163),
+            (KubeAction.Get, 164),
+            (KubeAction.Patch, 164),
+            (KubeAction.Delete, 164),
+            (KubeAction.Update, 164),
+            (KubeAction.WatchList, 166),
+            (KubeAction.DeleteCollection, 163),
+            (KubeAction.Get, 165),
+            (KubeAction.Watch, 167),
+            (KubeAction.Patch, 165),
+            (KubeAction.Update, 165),
+            (KubeAction.Create, 7),
+            (KubeAction.Create, 21),
+            (KubeAction.Create, 559),
+            (KubeAction.Delete, 560),
+            (KubeAction.DeleteCollection, 559),
+            (KubeAction.Get, 560),
+            (KubeAction.List, 559),
+            (KubeAction.Patch, 560),
+            (KubeAction.Update, 560),
+            (KubeAction.Watch, 572),
+            (KubeAction.WatchList, 571),
+            (KubeAction.Create, 561),
+            (KubeAction.Delete, 562),
+            (KubeAction.DeleteCollection, 561),
+            (KubeAction.Get, 562),
+            (KubeAction.List, 561),
+            (KubeAction.Patch, 562),
+            (KubeAction.Update, 562),
+            (KubeAction.Watch, 574),
+            (KubeAction.WatchList, 573),
+            (KubeAction.Create, 564),
+            (KubeAction.Delete, 565),
+            (KubeAction.DeleteCollection, 564),
+            (KubeAction.Get, 565),
+            (KubeAction.List, 563),
+            (KubeAction.List, 564),
+            (KubeAction.Patch, 565),
+            (KubeAction.Update, 565),
+            (KubeAction.Watch, 577),
+            (KubeAction.WatchList, 575),
+            (KubeAction.WatchList, 576),
+            (KubeAction.Create, 326),
+            (KubeAction.Delete, 327),
+            (KubeAction.DeleteCollection, 326),
+            (KubeAction.Get, 327),
+            (KubeAction.Get, 328),
+            (KubeAction.Get, 329),
+            (KubeAction.List, 326),
+            (KubeAction.Patch, 327),
+            (KubeAction.Patch, 328),
+            (KubeAction.Patch, 329),
+            (KubeAction.Update, 327),
+            (KubeAction.Update, 328),
+            (KubeAction.Update, 329),
+            (KubeAction.Watch, 331),
+            (KubeAction.WatchList, 330),
+            (KubeAction.List, 336),
+            (KubeAction.Create, 336),
+            (KubeAction.Get, 337),
+            (KubeAction.Patch, 337),
+            (KubeAction.Delete, 337),
+            (KubeAction.Update, 337),
+            (KubeAction.WatchList, 340),
+            (KubeAction.DeleteCollection, 336),
+            (KubeAction.Get, 339),
+            (KubeAction.Watch, 341),
+            (KubeAction.Patch, 339),
+            (KubeAction.Update, 339),
+            (KubeAction.Update, 338),
+            (KubeAction.Create, 453),
+            (KubeAction.Delete, 454),
+            (KubeAction.DeleteCollection, 453),
+            (KubeAction.Get, 454),
+            (KubeAction.List, 453),
+            (KubeAction.Patch, 454),
+            (KubeAction.Update, 454),
+            (KubeAction.Watch, 464),
+            (KubeAction.WatchList, 463),
+            (KubeAction.List, 473),
+            (KubeAction.Create, 473),
+            (KubeAction.Get, 474),
+            (KubeAction.Patch, 474),
+            (KubeAction.Delete, 474),
+            (KubeAction.Update, 474),
+            (KubeAction.WatchList, 483),
+            (KubeAction.DeleteCollection, 473),
+            (KubeAction.Watch, 484),
+            (KubeAction.List, 493),
+            (KubeAction.Create, 493),
+            (KubeAction.Get, 494),
+            (KubeAction.Patch, 494),
+            (KubeAction.Delete, 494),
+            (KubeAction.Update, 494),
+            (KubeAction.WatchList, 503),
+            (KubeAction.DeleteCollection, 493),
+            (KubeAction.Watch, 504),
+            (KubeAction.Create, 455),
+            (KubeAction.Delete, 456),
+            (KubeAction.DeleteCollection, 455),
+            (KubeAction.Get, 456),
+            (KubeAction.List, 455),
+            (KubeAction.Patch, 456),
+            (KubeAction.Update, 456),
+            (KubeAction.Watch, 466),
+            (KubeAction.WatchList, 465),
+            (KubeAction.List, 475),
+            (KubeAction.Create, 475),
+            (KubeAction.Get, 476),
+            (KubeAction.Patch, 476),
+            (KubeAction.Delete, 476),
+            (KubeAction.Update, 476),
+            (KubeAction.WatchList, 485),
+            (KubeAction.DeleteCollection, 475),
+            (KubeAction.Watch, 486),
+            (KubeAction.List, 495),
+            (KubeAction.Create, 495),
+            (KubeAction.Get, 496),
+            (KubeAction.Patch, 496),
+            (KubeAction.Delete, 496),
+            (KubeAction.Update, 496),
+            (KubeAction.WatchList, 505),
+            (KubeAction.DeleteCollection, 495),
+            (KubeAction.Watch, 506),
+            (KubeAction.Create, 332),
+            (KubeAction.Delete, 333),
+            (KubeAction.DeleteCollection, 332),
+            (KubeAction.Get, 333),
+            (KubeAction.List, 332),
+            (KubeAction.Patch, 333),
+            (KubeAction.Update, 333),
+            (KubeAction.Watch, 335),
+            (KubeAction.WatchList, 334),
+            (KubeAction.Get, 1),
+            (KubeAction.List, 0),
+            (KubeAction.Create, 8),
+            (KubeAction.Delete, 9),
+            (KubeAction.DeleteCollection, 8),
+            (KubeAction.Get, 9),
+            (KubeAction.List, 2),
+            (KubeAction.List, 8),
+            (KubeAction.Patch, 9),
+            (KubeAction.Update, 9),
+            (KubeAction.Watch, 65),
+            (KubeAction.WatchList, 59),
+            (KubeAction.WatchList, 64),
+            (KubeAction.Create, 171),
+            (KubeAction.Delete, 172),
+            (KubeAction.DeleteCollection, 171),
+            (KubeAction.Get, 172),
+            (KubeAction.List, 168),
+            (KubeAction.List, 171),
+            (KubeAction.Patch, 172),
+            (KubeAction.Update, 172),
+            (KubeAction.Watch, 194),
+            (KubeAction.WatchList, 190),
+            (KubeAction.WatchList, 193),
+            (KubeAction.List, 205),
+            (KubeAction.WatchList, 218),
+            (KubeAction.List, 207),
+            (KubeAction.Create, 207),
+            (KubeAction.Get, 208),
+            (KubeAction.Patch, 208),
+            (KubeAction.Delete, 208),
+            (KubeAction.Update, 208),
+            (KubeAction.WatchList, 220),
+            (KubeAction.DeleteCollection, 207),
+            (KubeAction.Watch, 221),
+            (KubeAction.List, 227),
+            (KubeAction.WatchList, 249),
+            (KubeAction.List, 230),
+            (KubeAction.Create, 230),
+            (KubeAction.Get, 231),
+            (KubeAction.Patch, 231),
+            (KubeAction.Delete, 231),
+            (KubeAction.Update, 231),
+            (KubeAction.WatchList, 252),
+            (KubeAction.DeleteCollection, 230),
+            (KubeAction.Watch, 253),
+            (KubeAction.Create, 300),
+            (KubeAction.Delete, 301),
+            (KubeAction.DeleteCollection, 300),
+            (KubeAction.Get, 301),
+            (KubeAction.Get, 302),
+            (KubeAction.List, 298),
+            (KubeAction.List, 300),
+            (KubeAction.Patch, 301),
+            (KubeAction.Patch, 302),
+            (KubeAction.Update, 301),
+            (KubeAction.Update, 302),
+            (KubeAction.Watch, 309),
+            (KubeAction.WatchList, 306),
+            (KubeAction.WatchList, 308),
+            (KubeAction.List, 312),
+            (KubeAction.WatchList, 316),
+            (KubeAction.List, 313),
+            (KubeAction.Create, 313),
+            (KubeAction.Get, 314),
+            (KubeAction.Patch, 314),
+            (KubeAction.Delete, 314),
+            (KubeAction.Update, 314),
+            (KubeAction.WatchList, 317),
+            (KubeAction.DeleteCollection, 313),
+            (KubeAction.Get, 315),
+            (KubeAction.Watch, 318),
+            (KubeAction.Patch, 315),
+            (KubeAction.Update, 315),
+            (KubeAction.List, 319),
+            (KubeAction.WatchList, 323),
+            (KubeAction.List, 320),
+            (KubeAction.Create, 320),
+            (KubeAction.Get, 321),
+            (KubeAction.Patch, 321),
+            (KubeAction.Delete, 321),
+            (KubeAction.Update, 321),
+            (KubeAction.WatchList, 324),
+            (KubeAction.DeleteCollection, 320),
+            (KubeAction.Get, 322),
+            (KubeAction.Watch, 325),
+            (KubeAction.Patch, 322),
+            (KubeAction.Update, 322),
+            (KubeAction.Create, 148),
+            (KubeAction.Delete, 149),
+            (KubeAction.DeleteCollection, 148),
+            (KubeAction.Get, 149),
+            (KubeAction.Get, 150),
+            (KubeAction.List, 148),
+            (KubeAction.Patch, 149),
+            (KubeAction.Patch, 150),
+            (KubeAction.Update, 149),
+            (KubeAction.Update, 150),
+            (KubeAction.Watch, 152),
+            (KubeAction.WatchList, 151),
+            (KubeAction.List, 153),
+            (KubeAction.Create, 153),
+            (KubeAction.Get, 154),
+            (KubeAction.Patch, 154),
+            (KubeAction.Delete, 154),
+            (KubeAction.Update, 154),
+            (KubeAction.WatchList, 156),
+            (KubeAction.DeleteCollection, 153),
+            (KubeAction.Get, 155),
+            (KubeAction.Watch, 157),
+            (KubeAction.Patch, 155),
+            (KubeAction.Update, 155),
+            (KubeAction.Create, 173),
+            (KubeAction.Delete, 174),
+            (KubeAction.DeleteCollection, 173),
+            (KubeAction.Get, 174),
+            (KubeAction.Get, 175),
+            (KubeAction.List, 169),
+            (KubeAction.List, 173),
+            (KubeAction.Patch, 174),
+            (KubeAction.Patch, 175),
+            (KubeAction.Update, 174),
+            (KubeAction.Update, 175),
+            (KubeAction.Watch, 196),
+            (KubeAction.WatchList, 191),
+            (KubeAction.WatchList, 195),
+            (KubeAction.List, 366),
+            (KubeAction.WatchList, 374),
+            (KubeAction.List, 368),
+            (KubeAction.Create, 368),
+            (KubeAction.Get, 369),
+            (KubeAction.Patch, 369),
+            (KubeAction.Delete, 369),
+            (KubeAction.Update, 369),
+            (KubeAction.WatchList, 376),
+            (KubeAction.DeleteCollection, 368),
+            (KubeAction.Get, 370),
+            (KubeAction.Watch, 377),
+            (KubeAction.Patch, 370),
+            (KubeAction.Update, 370),
+            (KubeAction.List, 228),
+            (KubeAction.WatchList, 250),
+            (KubeAction.List, 232),
+            (KubeAction.Create, 232),
+            (KubeAction.Get, 233),
+            (KubeAction.Patch, 233),
+            (KubeAction.Delete, 233),
+            (KubeAction.Update, 233),
+            (KubeAction.WatchList, 254),
+            (KubeAction.DeleteCollection, 232),
+            (KubeAction.Get, 234),
+            (KubeAction.Watch, 255),
+            (KubeAction.Patch, 234),
+            (KubeAction.Update, 234),
+            (KubeAction.Create, 176),
+            (KubeAction.Delete, 177),
+            (KubeAction.DeleteCollection, 176),
+            (KubeAction.Get, 177),
+            (KubeAction.Get, 179),
+            (KubeAction.List, 170),
+            (KubeAction.List, 176),
+            (KubeAction.Patch, 177),
+            (KubeAction.Patch, 179),
+            (KubeAction.Update, 177),
+            (KubeAction.Update, 179),
+            (KubeAction.Watch, 198),
+            (KubeAction.WatchList, 192),
+            (KubeAction.WatchList, 197),
+            (KubeAction.List, 206),
+            (KubeAction.WatchList, 219),
+            (KubeAction.List, 209),
+            (KubeAction.Create, 209),
+            (KubeAction.Get, 210),
+            (KubeAction.Patch, 210),
+            (KubeAction.Delete, 210),
+            (KubeAction.Update, 210),
+            (KubeAction.WatchList, 222),
+            (KubeAction.DeleteCollection, 209),
+            (KubeAction.Get, 212),
+            (KubeAction.Watch, 223),
+            (KubeAction.Patch, 212),
+            (KubeAction.Update, 212),
+            (KubeAction.List, 229),
+            (KubeAction.WatchList, 251),
+            (KubeAction.List, 235),
+            (KubeAction.Create, 235),
+            (KubeAction.Get, 236),
+            (KubeAction.Patch, 236),
+            (KubeAction.Delete, 236),
+            (KubeAction.Update, 236),
+            (KubeAction.WatchList, 256),
+            (KubeAction.DeleteCollection, 235),
+            (KubeAction.Get, 238),
+            (KubeAction.Watch, 257),
+            (KubeAction.Patch, 238),
+            (KubeAction.Update, 238),
+            (KubeAction.Create, 513),
+            (KubeAction.Delete, 514),
+            (KubeAction.DeleteCollection, 513),
+            (KubeAction.Get, 514),
+            (KubeAction.List, 513),
+            (KubeAction.Patch, 514),
+            (KubeAction.Update, 514),
+            (KubeAction.Watch, 529),
+            (KubeAction.WatchList, 528),
+            (KubeAction.Create, 355),
+            (KubeAction.Delete, 356),
+            (KubeAction.DeleteCollection, 355),
+            (KubeAction.Get, 356),
+            (KubeAction.List, 354),
+            (KubeAction.List, 355),
+            (KubeAction.Patch, 356),
+            (KubeAction.Update, 356),
+            (KubeAction.Watch, 359),
+            (KubeAction.WatchList, 357),
+            (KubeAction.WatchList, 358),
+            (KubeAction.Create, 10),
+            (KubeAction.Delete, 11),
+            (KubeAction.DeleteCollection, 10),
+            (KubeAction.Get, 11),
+            (KubeAction.List, 3),
+            (KubeAction.List, 10),
+            (KubeAction.Patch, 11),
+            (KubeAction.Update, 11),
+            (KubeAction.Watch, 67),
+            (KubeAction.WatchList, 60),
+            (KubeAction.WatchList, 66),
+            (KubeAction.Create, 12),
+            (KubeAction.Delete, 13),
+            (KubeAction.DeleteCollection, 12),
+            (KubeAction.Get, 13),
+            (KubeAction.List, 4),
+            (KubeAction.List, 12),
+            (KubeAction.Patch, 13),
+            (KubeAction.Update, 13),
+            (KubeAction.Watch, 69),
+            (KubeAction.WatchList, 61),
+            (KubeAction.WatchList, 68),
+            (KubeAction.List, 360),
+            (KubeAction.WatchList, 363),
+            (KubeAction.List, 361),
+            (KubeAction.Create, 361),
+            (KubeAction.Get, 362),
+            (KubeAction.Patch, 362),
+            (KubeAction.Delete, 362),
+            (KubeAction.Update, 362),
+            (KubeAction.WatchList, 364),
+            (KubeAction.DeleteCollection, 361),
+            (KubeAction.Watch, 365),
+            (KubeAction.Create, 23),
+            (KubeAction.Create, 23),
+            (KubeAction.Create, 380),
+            (KubeAction.Delete, 381),
+            (KubeAction.DeleteCollection, 380),
+            (KubeAction.Get, 381),
+            (KubeAction.Get, 382),
+            (KubeAction.List, 380),
+            (KubeAction.Patch, 381),
+            (KubeAction.Patch, 382),
+            (KubeAction.Update, 381),
+            (KubeAction.Update, 382),
+            (KubeAction.Watch, 387),
+            (KubeAction.WatchList, 386),
+            (KubeAction.Create, 390),
+            (KubeAction.Delete, 391),
+            (KubeAction.DeleteCollection, 390),
+            (KubeAction.Get, 391),
+            (KubeAction.Get, 392),
+            (KubeAction.List, 390),
+            (KubeAction.Patch, 391),
+            (KubeAction.Patch, 392),
+            (KubeAction.Update, 391),
+            (KubeAction.Update, 392),
+            (KubeAction.Watch, 397),
+            (KubeAction.WatchList, 396),
+            (KubeAction.Create, 278),
+            (KubeAction.Delete, 279),
+            (KubeAction.DeleteCollection, 278),
+            (KubeAction.Get, 279),
+            (KubeAction.Get, 280),
+            (KubeAction.List, 277),
+            (KubeAction.List, 278),
+            (KubeAction.Patch, 279),
+            (KubeAction.Patch, 280),
+            (KubeAction.Update, 279),
+            (KubeAction.Update, 280),
+            (KubeAction.Watch, 283),
+            (KubeAction.WatchList, 281),
+            (KubeAction.WatchList, 282),
+            (KubeAction.Create, 285),
+            (KubeAction.Delete, 286),
+            (KubeAction.DeleteCollection, 285),
+            (KubeAction.Get, 286),
+            (KubeAction.Get, 287),
+            (KubeAction.List, 284),
+            (KubeAction.List, 285),
+            (KubeAction.Patch, 286),
+            (KubeAction.Patch, 287),
+            (KubeAction.Update, 286),
+            (KubeAction.Update, 287),
+            (KubeAction.Watch, 290),
+            (KubeAction.WatchList, 288),
+            (KubeAction.WatchList, 289),
+            (KubeAction.List, 291),
+            (KubeAction.WatchList, 295),
+            (KubeAction.List, 292),
+            (KubeAction.Create, 292),
+            (KubeAction.Get, 293),
+            (KubeAction.Patch, 293),
+            (KubeAction.Delete, 293),
+            (KubeAction.Update, 293),
+            (KubeAction.WatchList, 296),
+            (KubeAction.DeleteCollection, 292),
+            (KubeAction.Get, 294),
+            (KubeAction.Watch, 297),
+            (KubeAction.Patch, 294),
+            (KubeAction.Update, 294),
+            (KubeAction.Create, 422),
+            (KubeAction.Delete, 423),
+            (KubeAction.DeleteCollection, 422),
+            (KubeAction.Get, 423),
+            (KubeAction.List, 422),
+            (KubeAction.Patch, 423),
+            (KubeAction.Update, 423),
+            (KubeAction.Watch, 428),
+            (KubeAction.WatchList, 427),
+            (KubeAction.Create, 405),
+            (KubeAction.Delete, 406),
+            (KubeAction.DeleteCollection, 405),
+            (KubeAction.Get, 406),
+            (KubeAction.List, 405),
+            (KubeAction.Patch, 406),
+            (KubeAction.Update, 406),
+            (KubeAction.Watch, 415),
+            (KubeAction.WatchList, 414),
+            (KubeAction.Create, 408),
+            (KubeAction.Delete, 409),
+            (KubeAction.DeleteCollection, 408),
+            (KubeAction.Get, 409),
+            (KubeAction.Get, 410),
+            (KubeAction.List, 407),
+            (KubeAction.List, 408),
+            (KubeAction.Patch, 409),
+            (KubeAction.Patch, 410),
+            (KubeAction.Update, 409),
+            (KubeAction.Update, 410),
+            (KubeAction.Watch, 418),
+            (KubeAction.WatchList, 416),
+            (KubeAction.WatchList, 417),
+            (KubeAction.List, 367),
+            (KubeAction.WatchList, 375),
+            (KubeAction.List, 371),
+            (KubeAction.Create, 371),
+            (KubeAction.Get, 372),
+            (KubeAction.Patch, 372),
+            (KubeAction.Delete, 372),
+            (KubeAction.Update, 372),
+            (KubeAction.WatchList, 378),
+            (KubeAction.DeleteCollection, 371),
+            (KubeAction.Get, 373),
+            (KubeAction.Watch, 379),
+            (KubeAction.Patch, 373),
+            (KubeAction.Update, 373),
+            (KubeAction.List, 118),
+            (KubeAction.Create, 118),
+            (KubeAction.Get, 119),
+            (KubeAction.Patch, 119),
+            (KubeAction.Delete, 119),
+            (KubeAction.Update, 119),
+            (KubeAction.WatchList, 125),
+            (KubeAction.DeleteCollection, 118),
+            (KubeAction.Watch, 126),
+            (KubeAction.Create, 303),
+            (KubeAction.Delete, 304),
+            (KubeAction.DeleteCollection, 303),
+            (KubeAction.Get, 304),
+            (KubeAction.Get, 305),
+            (KubeAction.List, 299),
+            (KubeAction.List, 303),
+            (KubeAction.Patch, 304),
+            (KubeAction.Patch, 305),
+            (KubeAction.Update, 304),
+            (KubeAction.Update, 305),
+            (KubeAction.Watch, 311),
+            (KubeAction.WatchList, 307),
+            (KubeAction.WatchList, 310),
+            (KubeAction.Create, 349),
+            (KubeAction.Delete, 350),
+            (KubeAction.DeleteCollection, 349),
+            (KubeAction.Get, 350),
+            (KubeAction.List, 348),
+            (KubeAction.List, 349),
+            (KubeAction.Patch, 350),
+            (KubeAction.Update, 350),
+            (KubeAction.Watch, 353),
+            (KubeAction.WatchList, 351),
+            (KubeAction.WatchList, 352),
+            (KubeAction.Create, 343),
+            (KubeAction.Delete, 344),
+            (KubeAction.DeleteCollection, 343),
+            (KubeAction.Get, 344),
+            (KubeAction.List, 342),
+            (KubeAction.List, 343),
+            (KubeAction.Patch, 344),
+            (KubeAction.Update, 344),
+            (KubeAction.Watch, 347),
+            (KubeAction.WatchList, 345),
+            (KubeAction.WatchList, 346),
+            (KubeAction.Create, 14),
+            (KubeAction.Delete, 15),
+            (KubeAction.DeleteCollection, 14),
+            (KubeAction.Get, 15),
+            (KubeAction.List, 5),
+            (KubeAction.List, 14),
+            (KubeAction.Patch, 15),
+            (KubeAction.Update, 15),
+            (KubeAction.Watch, 71),
+            (KubeAction.WatchList, 62),
+            (KubeAction.WatchList, 70),
+            (KubeAction.Create, 269),
+            (KubeAction.Create, 273),
+            (KubeAction.Create, 101),
+            (KubeAction.Delete, 102),
+            (KubeAction.DeleteCollection, 101),
+            (KubeAction.Get, 102),
+            (KubeAction.List, 101),
+            (KubeAction.Patch, 102),
+            (KubeAction.Update, 102),
+            (KubeAction.Watch, 111),
+            (KubeAction.WatchList, 110),
+            (KubeAction.List, 131),
+            (KubeAction.Create, 131),
+            (KubeAction.Get, 132),
+            (KubeAction.Patch, 132),
+            (KubeAction.Delete, 132),
+            (KubeAction.Update, 132),
+            (KubeAction.WatchList, 140),
+            (KubeAction.DeleteCollection, 131),
+            (KubeAction.Watch, 141),
+            (KubeAction.Create, 6),
+            (KubeAction.Delete, 42),
+            (KubeAction.Get, 42),
+            (KubeAction.Get, 44),
+            (KubeAction.List, 6),
+            (KubeAction.Patch, 42),
+            (KubeAction.Patch, 44),
+            (KubeAction.Update, 42),
+            (KubeAction.Update, 43),
+            (KubeAction.Update, 44),
+            (KubeAction.Watch, 88),
+            (KubeAction.WatchList, 63),
+            (KubeAction.Create, 411),
+            (KubeAction.Delete, 412),
+            (KubeAction.DeleteCollection, 411),
+            (KubeAction.Get, 412),
+            (KubeAction.List, 411),
+            (KubeAction.List, 413),
+            (KubeAction.Patch, 412),
+            (KubeAction.Update, 412),
+            (KubeAction.Watch, 420),
+            (KubeAction.WatchList, 419),
+            (KubeAction.WatchList, 421),
+            (KubeAction.Create, 45),
+            (KubeAction.Delete, 46),
+            (KubeAction.DeleteCollection, 45),
+            (KubeAction.Get, 46),
+            (KubeAction.Get, 47),
+            (KubeAction.List, 45),
+            (KubeAction.Patch, 46),
+            (KubeAction.Patch, 47),
+            (KubeAction.Update, 46),
+            (KubeAction.Update, 47),
+            (KubeAction.Watch, 90),
+            (KubeAction.WatchList, 89),
+            (KubeAction.Create, 16),
+            (KubeAction.Delete, 17),
+            (KubeAction.DeleteCollection, 16),
+            (KubeAction.Get, 17),
+            (KubeAction.Get, 18),
+            (KubeAction.List, 16),
+            (KubeAction.List, 48),
+            (KubeAction.Patch, 17),
+            (KubeAction.Patch, 18),
+            (KubeAction.Update, 17),
+            (KubeAction.Update, 18),
+            (KubeAction.Watch, 73),
+            (KubeAction.WatchList, 72),
+            (KubeAction.WatchList, 91),
+            (KubeAction.Create, 49),
+            (KubeAction.Delete, 50),
+            (KubeAction.DeleteCollection, 49),
+            (KubeAction.Get, 50),
+            (KubeAction.Get, 51),
+            (KubeAction.List, 49),
+            (KubeAction.Patch, 50),
+            (KubeAction.Patch, 51),
+            (KubeAction.Update, 50),
+            (KubeAction.Update, 51),
+            (KubeAction.Watch, 93),
+            (KubeAction.WatchList, 92),
+            (KubeAction.Create, 435),
+            (KubeAction.Delete, 436),
+            (KubeAction.DeleteCollection, 435),
+            (KubeAction.Get, 436),
+            (KubeAction.Get, 437),
+            (KubeAction.List, 435),
+            (KubeAction.List, 438),
+            (KubeAction.Patch, 436),
+            (KubeAction.Patch, 437),
+            (KubeAction.Update, 436),
+            (KubeAction.Update, 437),
+            (KubeAction.Watch, 440),
+            (KubeAction.WatchList, 439),
+            (KubeAction.WatchList, 441),
+            (KubeAction.List, 445),
+            (KubeAction.WatchList, 450),
+            (KubeAction.List, 442),
+            (KubeAction.Create, 442),
+            (KubeAction.Get, 443),
+            (KubeAction.Patch, 443),
+            (KubeAction.Delete, 443),
+            (KubeAction.Update, 443),
+            (KubeAction.WatchList, 448),
+            (KubeAction.DeleteCollection, 442),
+            (KubeAction.Get, 444),
+            (KubeAction.Watch, 449),
+            (KubeAction.Patch, 444),
+            (KubeAction.Update, 444),
+            (KubeAction.List, 555),
+            (KubeAction.WatchList, 558),
+            (KubeAction.List, 553),
+            (KubeAction.Create, 553),
+            (KubeAction.Get, 554),
+            (KubeAction.Patch, 554),
+            (KubeAction.Delete, 554),
+            (KubeAction.Update, 554),
+            (KubeAction.WatchList, 556),
+            (KubeAction.DeleteCollection, 553),
+            (KubeAction.Watch, 557),
+            (KubeAction.Create, 515),
+            (KubeAction.Delete, 516),
+            (KubeAction.DeleteCollection, 515),
+            (KubeAction.Get, 516),
+            (KubeAction.Get, 517),
+            (KubeAction.List, 515),
+            (KubeAction.List, 523),
+            (KubeAction.Patch, 516),
+            (KubeAction.Patch, 517),
+            (KubeAction.Update, 516),
+            (KubeAction.Update, 517),
+            (KubeAction.Watch, 531),
+            (KubeAction.WatchList, 530),
+            (KubeAction.WatchList, 536),
+            (KubeAction.List, 446),
+            (KubeAction.Create, 446),
+            (KubeAction.Get, 447),
+            (KubeAction.Patch, 447),
+            (KubeAction.Delete, 447),
+            (KubeAction.Update, 447),
+            (KubeAction.WatchList, 451),
+            (KubeAction.DeleteCollection, 446),
+            (KubeAction.Watch, 452),
+            (KubeAction.Create, 26),
+            (KubeAction.Delete, 27),
+            (KubeAction.DeleteCollection, 26),
+            (KubeAction.Get, 27),
+            (KubeAction.List, 26),
+            (KubeAction.List, 53),
+            (KubeAction.Patch, 27),
+            (KubeAction.Update, 27),
+            (KubeAction.Watch, 77),
+            (KubeAction.WatchList, 76),
+            (KubeAction.WatchList, 95),
+            (KubeAction.Create, 19),
+            (KubeAction.Delete, 20),
+            (KubeAction.DeleteCollection, 19),
+            (KubeAction.Get, 20),
+            (KubeAction.Get, 22),
+            (KubeAction.Get, 24),
+            (KubeAction.Get, 25),
+            (KubeAction.List, 19),
+            (KubeAction.List, 52),
+            (KubeAction.Patch, 20),
+            (KubeAction.Patch, 22),
+            (KubeAction.Patch, 25),
+            (KubeAction.Update, 20),
+            (KubeAction.Update, 22),
+            (KubeAction.Update, 25),
+            (KubeAction.Watch, 75),
+            (KubeAction.WatchList, 74),
+            (KubeAction.WatchList, 94),
+            (KubeAction.Create, 541),
+            (KubeAction.Delete, 542),
+            (KubeAction.DeleteCollection, 541),
+            (KubeAction.Get, 542),
+            (KubeAction.List, 541),
+            (KubeAction.Patch, 542),
+            (KubeAction.Update, 542),
+            (KubeAction.Watch, 544),
+            (KubeAction.WatchList, 543),
+            (KubeAction.List, 545),
+            (KubeAction.Create, 545),
+            (KubeAction.Get, 546),
+            (KubeAction.Patch, 546),
+            (KubeAction.Delete, 546),
+            (KubeAction.Update, 546),
+            (KubeAction.WatchList, 547),
+            (KubeAction.DeleteCollection, 545),
+            (KubeAction.Watch, 548),
+            (KubeAction.List, 549),
+            (KubeAction.Create, 549),
+            (KubeAction.Get, 550),
+            (KubeAction.Patch, 550),
+            (KubeAction.Delete, 550),
+            (KubeAction.Update, 550),
+            (KubeAction.WatchList, 551),
+            (KubeAction.DeleteCollection, 549),
+            (KubeAction.Watch, 552),
+            (KubeAction.Create, 383),
+            (KubeAction.Delete, 384),
+            (KubeAction.DeleteCollection, 383),
+            (KubeAction.Get, 384),
+            (KubeAction.Get, 385),
+            (KubeAction.List, 383),
+            (KubeAction.Patch, 384),
+            (KubeAction.Patch, 385),
+            (KubeAction.Update, 384),
+            (KubeAction.Update, 385),
+            (KubeAction.Watch, 389),
+            (KubeAction.WatchList, 388),
+            (KubeAction.Create, 393),
+            (KubeAction.Delete, 394),
+            (KubeAction.DeleteCollection, 393),
+            (KubeAction.Get, 394),
+            (KubeAction.Get, 395),
+            (KubeAction.List, 393),
+            (KubeAction.Patch, 394),
+            (KubeAction.Patch, 395),
+            (KubeAction.Update, 394),
+            (KubeAction.Update, 395),
+            (KubeAction.Watch, 399),
+            (KubeAction.WatchList, 398),
+            (KubeAction.Create, 180),
+            (KubeAction.Delete, 181),
+            (KubeAction.DeleteCollection, 180),
+            (KubeAction.Get, 181),
+            (KubeAction.Get, 183),
+            (KubeAction.List, 180),
+            (KubeAction.List, 188),
+            (KubeAction.Patch, 181),
+            (KubeAction.Patch, 183),
+            (KubeAction.Update, 181),
+            (KubeAction.Update, 183),
+            (KubeAction.Watch, 200),
+            (KubeAction.WatchList, 199),
+            (KubeAction.WatchList, 203),
+            (KubeAction.List, 247),
+            (KubeAction.WatchList, 262),
+            (KubeAction.List, 239),
+            (KubeAction.Create, 239),
+            (KubeAction.Get, 240),
+            (KubeAction.Patch, 240),
+            (KubeAction.Delete, 240),
+            (KubeAction.Update, 240),
+            (KubeAction.WatchList, 258),
+            (KubeAction.DeleteCollection, 239),
+            (KubeAction.Get, 242),
+            (KubeAction.Watch, 259),
+            (KubeAction.Patch, 242),
+            (KubeAction.Update, 242),
+            (KubeAction.Create, 28),
+            (KubeAction.Delete, 29),
+            (KubeAction.DeleteCollection, 28),
+            (KubeAction.Get, 29),
+            (KubeAction.Get, 31),
+            (KubeAction.List, 28),
+            (KubeAction.List, 54),
+            (KubeAction.Patch, 29),
+            (KubeAction.Patch, 31),
+            (KubeAction.Update, 29),
+            (KubeAction.Update, 31),
+            (KubeAction.Watch, 79),
+            (KubeAction.WatchList, 78),
+            (KubeAction.WatchList, 96),
+            (KubeAction.Create, 521),
+            (KubeAction.Delete, 522),
+            (KubeAction.DeleteCollection, 521),
+            (KubeAction.Get, 522),
+            (KubeAction.List, 521),
+            (KubeAction.List, 525),
+            (KubeAction.Patch, 522),
+            (KubeAction.Update, 522),
+            (KubeAction.Watch, 535),
+            (KubeAction.WatchList, 534),
+            (KubeAction.WatchList, 538),
+            (KubeAction.Create, 518),
+            (KubeAction.Delete, 519),
+            (KubeAction.DeleteCollection, 518),
+            (KubeAction.Get, 519),
+            (KubeAction.Get, 520),
+            (KubeAction.List, 518),
+            (KubeAction.List, 524),
+            (KubeAction.Patch, 519),
+            (KubeAction.Patch, 520),
+            (KubeAction.Update, 519),
+            (KubeAction.Update, 520),
+            (KubeAction.Watch, 533),
+            (KubeAction.WatchList, 532),
+            (KubeAction.WatchList, 537),
+            (KubeAction.Create, 32),
+            (KubeAction.Delete, 33),
+            (KubeAction.DeleteCollection, 32),
+            (KubeAction.Get, 33),
+            (KubeAction.Get, 34),
+            (KubeAction.List, 32),
+            (KubeAction.List, 55),
+            (KubeAction.Patch, 33),
+            (KubeAction.Patch, 34),
+            (KubeAction.Update, 33),
+            (KubeAction.Update, 34),
+            (KubeAction.Watch, 81),
+            (KubeAction.WatchList, 80),
+            (KubeAction.WatchList, 97),
+            (KubeAction.Create, 526),
+            (KubeAction.Delete, 527),
+            (KubeAction.DeleteCollection, 526),
+            (KubeAction.Get, 527),
+            (KubeAction.List, 526),
+            (KubeAction.Patch, 527),
+            (KubeAction.Update, 527),
+            (KubeAction.Watch, 540),
+            (KubeAction.WatchList, 539),
+            (KubeAction.Create, 457),
+            (KubeAction.Delete, 458),
+            (KubeAction.DeleteCollection, 457),
+            (KubeAction.Get, 458),
+            (KubeAction.List, 457),
+            (KubeAction.List, 461),
+            (KubeAction.Patch, 458),
+            (KubeAction.Update, 458),
+            (KubeAction.Watch, 468),
+            (KubeAction.WatchList, 467),
+            (KubeAction.WatchList, 471),
+            (KubeAction.List, 481),
+            (KubeAction.WatchList, 491),
+            (KubeAction.List, 477),
+            (KubeAction.Create, 477),
+            (KubeAction.Get, 478),
+            (KubeAction.Patch, 478),
+            (KubeAction.Delete, 478),
+            (KubeAction.Update, 478),
+            (KubeAction.WatchList, 487),
+            (KubeAction.DeleteCollection, 477),
+            (KubeAction.Watch, 488),
+            (KubeAction.List, 501),
+            (KubeAction.WatchList, 511),
+            (KubeAction.List, 497),
+            (KubeAction.Create, 497),
+            (KubeAction.Get, 498),
+            (KubeAction.Patch, 498),
+            (KubeAction.Delete, 498),
+            (KubeAction.Update, 498),
+            (KubeAction.WatchList, 507),
+            (KubeAction.DeleteCollection, 497),
+            (KubeAction.Watch, 508),
+            (KubeAction.Create, 459),
+            (KubeAction.Delete, 460),
+            (KubeAction.DeleteCollection, 459),
+            (KubeAction.Get, 460),
+            (KubeAction.List, 459),
+            (KubeAction.List, 462),
+            (KubeAction.Patch, 460),
+            (KubeAction.Update, 460),
+            (KubeAction.Watch, 470),
+            (KubeAction.WatchList, 469),
+            (KubeAction.WatchList, 472),
+            (KubeAction.List, 482),
+            (KubeAction.WatchList, 492),
+            (KubeAction.List, 479),
+            (KubeAction.Create, 479),
+            (KubeAction.Get, 480),
+            (KubeAction.Patch, 480),
+            (KubeAction.Delete, 480),
+            (KubeAction.Update, 480),
+            (KubeAction.WatchList, 489),
+            (KubeAction.DeleteCollection, 479),
+            (KubeAction.Watch, 490),
+            (KubeAction.List, 502),
+            (KubeAction.WatchList, 512),
+            (KubeAction.List, 499),
+            (KubeAction.Create, 499),
+            (KubeAction.Get, 500),
+            (KubeAction.Patch, 500),
+            (KubeAction.Delete, 500),
+            (KubeAction.Update, 500),
+            (KubeAction.WatchList, 509),
+            (KubeAction.DeleteCollection, 499),
+            (KubeAction.Watch, 510),
+            (KubeAction.Create, 431),
+            (KubeAction.Delete, 432),
+            (KubeAction.DeleteCollection, 431),
+            (KubeAction.Get, 432),
+            (KubeAction.List, 431),
+            (KubeAction.Patch, 432),
+            (KubeAction.Update, 432),
+            (KubeAction.Watch, 434),
+            (KubeAction.WatchList, 433),
+            (KubeAction.Get, 30),
+            (KubeAction.Get, 178),
+            (KubeAction.Get, 182),
+            (KubeAction.Get, 186),
+            (KubeAction.Patch, 30),
+            (KubeAction.Patch, 178),
+            (KubeAction.Patch, 182),
+            (KubeAction.Patch, 186),
+            (KubeAction.Update, 30),
+            (KubeAction.Update, 178),
+            (KubeAction.Update, 182),
+            (KubeAction.Update, 186),
+            (KubeAction.Get, 211),
+            (KubeAction.Get, 215),
+            (KubeAction.Patch, 211),
+            (KubeAction.Patch, 215),
+            (KubeAction.Update, 211),
+            (KubeAction.Update, 215),
+            (KubeAction.Get, 237),
+            (KubeAction.Get, 241),
+            (KubeAction.Get, 245),
+            (KubeAction.Patch, 237),
+            (KubeAction.Patch, 241),
+            (KubeAction.Patch, 245),
+            (KubeAction.Update, 237),
+            (KubeAction.Update, 241),
+            (KubeAction.Update, 245),
+            (KubeAction.Create, 35),
+            (KubeAction.Delete, 36),
+            (KubeAction.DeleteCollection, 35),
+            (KubeAction.Get, 36),
+            (KubeAction.List, 35),
+            (KubeAction.List, 56),
+            (KubeAction.Patch, 36),
+            (KubeAction.Update, 36),
+            (KubeAction.Watch, 83),
+            (KubeAction.WatchList, 82),
+            (KubeAction.WatchList, 98),
+            (KubeAction.Create, 270),
+            (KubeAction.Create, 274),
+            (KubeAction.Create, 264),
+            (KubeAction.Create, 266),
+            (KubeAction.Create, 267),
+            (KubeAction.Create, 271),
+            (KubeAction.Create, 275),
+            (KubeAction.Create, 37),
+            (KubeAction.Delete, 38),
+            (KubeAction.DeleteCollection, 37),
+            (KubeAction.Get, 38),
+            (KubeAction.List, 37),
+            (KubeAction.List, 57),
+            (KubeAction.Patch, 38),
+            (KubeAction.Update, 38),
+            (KubeAction.Watch, 85),
+            (KubeAction.WatchList, 84),
+            (KubeAction.WatchList, 99),
+            (KubeAction.Create, 424),
+            (KubeAction.Delete, 425),
+            (KubeAction.DeleteCollection, 424),
+            (KubeAction.Get, 425),
+            (KubeAction.Get, 426),
+            (KubeAction.List, 424),
+            (KubeAction.Patch, 425),
+            (KubeAction.Patch, 426),
+            (KubeAction.Update, 425),
+            (KubeAction.Update, 426),
+            (KubeAction.Watch, 430),
+            (KubeAction.WatchList, 429),
+            (KubeAction.Create, 39),
+            (KubeAction.Delete, 40),
+            (KubeAction.DeleteCollection, 39),
+            (KubeAction.Get, 40),
+            (KubeAction.Get, 41),
+            (KubeAction.List, 39),
+            (KubeAction.List, 58),
+            (KubeAction.Patch, 40),
+            (KubeAction.Patch, 41),
+            (KubeAction.Update, 40),
+            (KubeAction.Update, 41),
+            (KubeAction.Watch, 87),
+            (KubeAction.WatchList, 86),
+            (KubeAction.WatchList, 100),
+            (KubeAction.Create, 184),
+            (KubeAction.Delete, 185),
+            (KubeAction.DeleteCollection, 184),
+            (KubeAction.Get, 185),
+            (KubeAction.Get, 187),
+            (KubeAction.List, 184),
+            (KubeAction.List, 189),
+            (KubeAction.Patch, 185),
+            (KubeAction.Patch, 187),
+            (KubeAction.Update, 185),
+            (KubeAction.Update, 187),
+            (KubeAction.Watch, 202),
+            (KubeAction.WatchList, 201),
+            (KubeAction.WatchList, 204),
+            (KubeAction.List, 217),
+            (KubeAction.WatchList, 226),
+            (KubeAction.List, 213),
+            (KubeAction.Create, 213),
+            (KubeAction.Get, 214),
+            (KubeAction.Patch, 214),
+            (KubeAction.Delete, 214),
+            (KubeAction.Update, 214),
+            (KubeAction.WatchList, 224),
+            (KubeAction.DeleteCollection, 213),
+            (KubeAction.Get, 216),
+            (KubeAction.Watch, 225),
+            (KubeAction.Patch, 216),
+            (KubeAction.Update, 216),
+            (KubeAction.List, 248),
+            (KubeAction.WatchList, 263),
+            (KubeAction.List, 243),
+            (KubeAction.Create, 243),
+            (KubeAction.Get, 244),
+            (KubeAction.Patch, 244),
+            (KubeAction.Delete, 244),
+            (KubeAction.Update, 244),
+            (KubeAction.WatchList, 260),
+            (KubeAction.DeleteCollection, 243),
+            (KubeAction.Get, 246),
+            (KubeAction.Watch, 261),
+            (KubeAction.Patch, 246),
+            (KubeAction.Update, 246),
+            (KubeAction.Create, 566),
+            (KubeAction.Delete, 567),
+            (KubeAction.DeleteCollection, 566),
+            (KubeAction.Get, 567),
+            (KubeAction.List, 566),
+            (KubeAction.Patch, 567),
+            (KubeAction.Update, 567),
+            (KubeAction.Watch, 579),
+            (KubeAction.WatchList, 578),
+            (KubeAction.List, 590),
+            (KubeAction.Create, 590),
+            (KubeAction.Get, 591),
+            (KubeAction.Patch, 591),
+            (KubeAction.Delete, 591),
+            (KubeAction.Update, 591),
+            (KubeAction.WatchList, 596),
+            (KubeAction.DeleteCollection, 590),
+            (KubeAction.Watch, 597),
+            (KubeAction.Create, 602),
+            (KubeAction.Delete, 603),
+            (KubeAction.DeleteCollection, 602),
+            (KubeAction.Get, 603),
+            (KubeAction.Get, 604),
+            (KubeAction.List, 602),
+            (KubeAction.Patch, 603),
+            (KubeAction.Patch, 604),
+            (KubeAction.Update, 603),
+            (KubeAction.Update, 604),
+            (KubeAction.Watch, 606),
+            (KubeAction.WatchList, 605),
+            (KubeAction.Create, 400),
+            (KubeAction.Delete, 401),
+            (KubeAction.DeleteCollection, 400),
+            (KubeAction.Get, 401),
+            (KubeAction.Get, 402),
+            (KubeAction.List, 400),
+            (KubeAction.Patch, 401),
+            (KubeAction.Patch, 402),
+            (KubeAction.Update, 401),
+            (KubeAction.Update, 402),
+            (KubeAction.Watch, 404),
+            (KubeAction.WatchList, 403),
+            (KubeAction.Create, 272),
+            (KubeAction.Create, 276),
+            (KubeAction.Create, 265),
+            (KubeAction.Create, 268),
+            (KubeAction.Create, 106),
+            (KubeAction.Delete, 107),
+            (KubeAction.DeleteCollection, 106),
+            (KubeAction.Get, 107),
+            (KubeAction.List, 106),
+            (KubeAction.Patch, 107),
+            (KubeAction.Update, 107),
+            (KubeAction.Watch, 115),
+            (KubeAction.WatchList, 114),
+            (KubeAction.Create, 123),
+            (KubeAction.Delete, 124),
+            (KubeAction.DeleteCollection, 123),
+            (KubeAction.Get, 124),
+            (KubeAction.List, 123),
+            (KubeAction.Patch, 124),
+            (KubeAction.Update, 124),
+            (KubeAction.Watch, 130),
+            (KubeAction.WatchList, 129),
+            (KubeAction.Create, 136),
+            (KubeAction.Delete, 137),
+            (KubeAction.DeleteCollection, 136),
+            (KubeAction.Get, 137),
+            (KubeAction.List, 136),
+            (KubeAction.Patch, 137),
+            (KubeAction.Update, 137),
+            (KubeAction.Watch, 145),
+            (KubeAction.WatchList, 144),
+            (KubeAction.Create, 103),
+            (KubeAction.Delete, 104),
+            (KubeAction.DeleteCollection, 103),
+            (KubeAction.Get, 104),
+            (KubeAction.Get, 105),
+            (KubeAction.List, 103),
+            (KubeAction.Patch, 104),
+            (KubeAction.Patch, 105),
+            (KubeAction.Update, 104),
+            (KubeAction.Update, 105),
+            (KubeAction.Watch, 113),
+            (KubeAction.WatchList, 112),
+            (KubeAction.Create, 120),
+            (KubeAction.Delete, 121),
+            (KubeAction.DeleteCollection, 120),
+            (KubeAction.Get, 121),
+            (KubeAction.Get, 122),
+            (KubeAction.List, 120),
+            (KubeAction.Patch, 121),
+            (KubeAction.Patch, 122),
+            (KubeAction.Update, 121),
+            (KubeAction.Update, 122),
+            (KubeAction.Watch, 128),
+            (KubeAction.WatchList, 127),
+            (KubeAction.Create, 133),
+            (KubeAction.Delete, 134),
+            (KubeAction.DeleteCollection, 133),
+            (KubeAction.Get, 134),
+            (KubeAction.Get, 135),
+            (KubeAction.List, 133),
+            (KubeAction.Patch, 134),
+            (KubeAction.Patch, 135),
+            (KubeAction.Update, 134),
+            (KubeAction.Update, 135),
+            (KubeAction.Watch, 143),
+            (KubeAction.WatchList, 142),
+            (KubeAction.Create, 108),
+            (KubeAction.Delete, 109),
+            (KubeAction.DeleteCollection, 108),
+            (KubeAction.Get, 109),
+            (KubeAction.List, 108),
+            (KubeAction.Patch, 109),
+            (KubeAction.Update, 109),
+            (KubeAction.Watch, 117),
+            (KubeAction.WatchList, 116),
+            (KubeAction.List, 138),
+            (KubeAction.Create, 138),
+            (KubeAction.Get, 139),
+            (KubeAction.Patch, 139),
+            (KubeAction.Delete, 139),
+            (KubeAction.Update, 139),
+            (KubeAction.WatchList, 146),
+            (KubeAction.DeleteCollection, 138),
+            (KubeAction.Watch, 147),
+            (KubeAction.Create, 568),
+            (KubeAction.Delete, 569),
+            (KubeAction.DeleteCollection, 568),
+            (KubeAction.Get, 569),
+            (KubeAction.Get, 570),
+            (KubeAction.List, 568),
+            (KubeAction.Patch, 569),
+            (KubeAction.Patch, 570),
+            (KubeAction.Update, 569),
+            (KubeAction.Update, 570),
+            (KubeAction.Watch, 581),
+            (KubeAction.WatchList, 580),
+            (KubeAction.List, 582),
+            (KubeAction.Create, 582),
+            (KubeAction.Get, 583),
+            (KubeAction.Patch, 583),
+            (KubeAction.Delete, 583),
+            (KubeAction.Update, 583),
+            (KubeAction.WatchList, 586),
+            (KubeAction.DeleteCollection, 582),
+            (KubeAction.Watch, 587),
+            (KubeAction.List, 592),
+            (KubeAction.Create, 592),
+            (KubeAction.Get, 593),
+            (KubeAction.Patch, 593),
+            (KubeAction.Delete, 593),
+            (KubeAction.Update, 593),
+            (KubeAction.WatchList, 598),
+            (KubeAction.DeleteCollection, 592),
+            (KubeAction.Watch, 599),
+            (KubeAction.Create, 584),
+            (KubeAction.Delete, 585),
+            (KubeAction.DeleteCollection, 584),
+            (KubeAction.Get, 585),
+            (KubeAction.List, 584),
+            (KubeAction.Patch, 585),
+            (KubeAction.Update, 585),
+            (KubeAction.Watch, 589),
+            (KubeAction.WatchList, 588),
+            (KubeAction.Create, 594),
+            (KubeAction.Delete, 595),
+            (KubeAction.DeleteCollection, 594),
+            (KubeAction.Get, 595),
+            (KubeAction.List, 594),
+            (KubeAction.Patch, 595),
+            (KubeAction.Update, 595),
+            (KubeAction.Watch, 601),
+            (KubeAction.WatchList, 600),
+        };
+
+        /// <summary>
+        ///     API path templates for generated resource model types.
+        /// </summary>
+        static readonly string[] GeneratedApiPathTemplates =
+        {
+            "api/v1/componentstatuses",
+            "api/v1/componentstatuses/{name}",
+            "api/v1/configmaps",
+            "api/v1/endpoints",
+            "api/v1/events",
+            "api/v1/limitranges",
+            "api/v1/namespaces",
+            "api/v1/namespaces/{namespace}/bindings",
+            "api/v1/namespaces/{namespace}/configmaps",
+            "api/v1/namespaces/{namespace}/configmaps/{name}",
+            "api/v1/namespaces/{namespace}/endpoints",
+            "api/v1/namespaces/{namespace}/endpoints/{name}",
+            "api/v1/namespaces/{namespace}/events",
+            "api/v1/namespaces/{namespace}/events/{name}",
+            "api/v1/namespaces/{namespace}/limitranges",
+            "api/v1/namespaces/{namespace}/limitranges/{name}",
+            "api/v1/namespaces/{namespace}/persistentvolumeclaims",
+            "api/v1/namespaces/{namespace}/persistentvolumeclaims/{name}",
+            "api/v1/namespaces/{namespace}/persistentvolumeclaims/{name}/status",
+            "api/v1/namespaces/{namespace}/pods",
+            "api/v1/namespaces/{namespace}/pods/{name}",
+            "api/v1/namespaces/{namespace}/pods/{name}/binding",
+            "api/v1/namespaces/{namespace}/pods/{name}/ephemeralcontainers",
+            "api/v1/namespaces/{namespace}/pods/{name}/eviction",
+            "api/v1/namespaces/{namespace}/pods/{name}/log",
+            "api/v1/namespaces/{namespace}/pods/{name}/status",
+            "api/v1/namespaces/{namespace}/podtemplates",
+            "api/v1/namespaces/{namespace}/podtemplates/{name}",
+            "api/v1/namespaces/{namespace}/replicationcontrollers",
+            "api/v1/namespaces/{namespace}/replicationcontrollers/{name}",
+            "api/v1/namespaces/{namespace}/replicationcontrollers/{name}/scale",
+            "api/v1/namespaces/{namespace}/replicationcontrollers/{name}/status",
+            "api/v1/namespaces/{namespace}/resourcequotas",
+            "api/v1/namespaces/{namespace}/resourcequotas/{name}",
+            "api/v1/namespaces/{namespace}/resourcequotas/{name}/status",
+            "api/v1/namespaces/{namespace}/secrets",
+            "api/v1/namespaces/{namespace}/secrets/{name}",
+            "api/v1/namespaces/{namespace}/serviceaccounts",
+            "api/v1/namespaces/{namespace}/serviceaccounts/{name}",
+            "api/v1/namespaces/{namespace}/services",
+            "api/v1/namespaces/{namespace}/services/{name}",
+            "api/v1/namespaces/{namespace}/services/{name}/status",
+            "api/v1/namespaces/{name}",
+            "api/v1/namespaces/{name}/finalize",
+            "api/v1/namespaces/{name}/status",
+            "api/v1/nodes",
+            "api/v1/nodes/{name}",
+            "api/v1/nodes/{name}/status",
+            "api/v1/persistentvolumeclaims",
+            "api/v1/persistentvolumes",
+            "api/v1/persistentvolumes/{name}",
+            "api/v1/persistentvolumes/{name}/status",
+            "api/v1/pods",
+            "api/v1/podtemplates",
+            "api/v1/replicationcontrollers",
+            "api/v1/resourcequotas",
+            "api/v1/secrets",
+            "api/v1/serviceaccounts",
+            "api/v1/services",
+            "api/v1/watch/configmaps",
+            "api/v1/watch/endpoints",
+            "api/v1/watch/events",
+            "api/v1/watch/limitranges",
+            "api/v1/watch/namespaces",
+            "api/v1/watch/namespaces/{namespace}/configmaps",
+            "api/v1/watch/namespaces/{namespace}/configmaps/{name}",
+            "api/v1/watch/namespaces/{namespace}/endpoints",
+            "api/v1/watch/namespaces/{namespace}/endpoints/{name}",
+            "api/v1/watch/namespaces/{namespace}/events",
+            "api/v1/watch/namespaces/{namespace}/events/{name}",
+            "api/v1/watch/namespaces/{namespace}/limitranges",
+            "api/v1/watch/namespaces/{namespace}/limitranges/{name}",
+            "api/v1/watch/namespaces/{namespace}/persistentvolumeclaims",
+            "api/v1/watch/namespaces/{namespace}/persistentvolumeclaims/{name}",
+            "api/v1/watch/namespaces/{namespace}/pods",
+            "api/v1/watch/namespaces/{namespace}/pods/{name}",
+            "api/v1/watch/namespaces/{namespace}/podtemplates",
+            "api/v1/watch/namespaces/{namespace}/podtemplates/{name}",
+            "api/v1/watch/namespaces/{namespace}/replicationcontrollers",
+            "api/v1/watch/namespaces/{namespace}/replicationcontrollers/{name}",
+            "api/v1/watch/namespaces/{namespace}/resourcequotas",
+            "api/v1/watch/namespaces/{namespace}/resourcequotas/{name}",
+            "api/v1/watch/namespaces/{namespace}/secrets",
+            "api/v1/watch/namespaces/{namespace}/secrets/{name}",
+            "api/v1/watch/namespaces/{namespace}/serviceaccounts",
+            "api/v1/watch/namespaces/{namespace}/serviceaccounts/{name}",
+            "api/v1/watch/namespaces/{namespace}/services",
+            "api/v1/watch/namespaces/{namespace}/services/{name}",
+            "api/v1/watch/namespaces/{name}",
+            "api/v1/watch/nodes",
+            "api/v1/watch/nodes/{name}",
+            "api/v1/watch/persistentvolumeclaims",
+            "api/v1/watch/persistentvolumes",
+            "api/v1/watch/persistentvolumes/{name}",
+            "api/v1/watch/pods",
+            "api/v1/watch/podtemplates",
+            "api/v1/watch/replicationcontrollers",
+            "api/v1/watch/resourcequotas",
+            "api/v1/watch/secrets",
+            "api/v1/watch/serviceaccounts",
+            "api/v1/watch/services",
+            "apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1/validatingadmissionpolicies",
+            "apis/admissionregistration.k8s.io/v1/validatingadmissionpolicies/{name}",
+            "apis/admissionregistration.k8s.io/v1/validatingadmissionpolicies/{name}/status",
+            "apis/admissionregistration.k8s.io/v1/validatingadmissionpolicybindings",
+            "apis/admissionregistration.k8s.io/v1/validatingadmissionpolicybindings/{name}",
+            "apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1/watch/mutatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1/watch/mutatingwebhookconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1/watch/validatingadmissionpolicies",
+            "apis/admissionregistration.k8s.io/v1/watch/validatingadmissionpolicies/{name}",
+            "apis/admissionregistration.k8s.io/v1/watch/validatingadmissionpolicybindings",
+            "apis/admissionregistration.k8s.io/v1/watch/validatingadmissionpolicybindings/{name}",
+            "apis/admissionregistration.k8s.io/v1/watch/validatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1/watch/validatingwebhookconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations",
+            "apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1alpha1/validatingadmissionpolicies",
+            "apis/admissionregistration.k8s.io/v1alpha1/validatingadmissionpolicies/{name}",
+            "apis/admissionregistration.k8s.io/v1alpha1/validatingadmissionpolicies/{name}/status",
+            "apis/admissionregistration.k8s.io/v1alpha1/validatingadmissionpolicybindings",
+            "apis/admissionregistration.k8s.io/v1alpha1/validatingadmissionpolicybindings/{name}",
+            "apis/admissionregistration.k8s.io/v1alpha1/watch/initializerconfigurations",
+            "apis/admissionregistration.k8s.io/v1alpha1/watch/initializerconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1alpha1/watch/validatingadmissionpolicies",
+            "apis/admissionregistration.k8s.io/v1alpha1/watch/validatingadmissionpolicies/{name}",
+            "apis/admissionregistration.k8s.io/v1alpha1/watch/validatingadmissionpolicybindings",
+            "apis/admissionregistration.k8s.io/v1alpha1/watch/validatingadmissionpolicybindings/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1beta1/mutatingwebhookconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/validatingadmissionpolicies",
+            "apis/admissionregistration.k8s.io/v1beta1/validatingadmissionpolicies/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/validatingadmissionpolicies/{name}/status",
+            "apis/admissionregistration.k8s.io/v1beta1/validatingadmissionpolicybindings",
+            "apis/admissionregistration.k8s.io/v1beta1/validatingadmissionpolicybindings/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1beta1/validatingwebhookconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/mutatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/mutatingwebhookconfigurations/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/validatingadmissionpolicies",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/validatingadmissionpolicies/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/validatingadmissionpolicybindings",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/validatingadmissionpolicybindings/{name}",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/validatingwebhookconfigurations",
+            "apis/admissionregistration.k8s.io/v1beta1/watch/validatingwebhookconfigurations/{name}",
+            "apis/apiextensions.k8s.io/v1/customresourcedefinitions",
+            "apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}",
+            "apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}/status",
+            "apis/apiextensions.k8s.io/v1/watch/customresourcedefinitions",
+            "apis/apiextensions.k8s.io/v1/watch/customresourcedefinitions/{name}",
+            "apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions",
+            "apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}",
+            "apis/apiextensions.k8s.io/v1beta1/customresourcedefinitions/{name}/status",
+            "apis/apiextensions.k8s.io/v1beta1/watch/customresourcedefinitions",
+            "apis/apiextensions.k8s.io/v1beta1/watch/customresourcedefinitions/{name}",
+            "apis/apiregistration.k8s.io/v1/apiservices",
+            "apis/apiregistration.k8s.io/v1/apiservices/{name}",
+            "apis/apiregistration.k8s.io/v1/apiservices/{name}/status",
+            "apis/apiregistration.k8s.io/v1/watch/apiservices",
+            "apis/apiregistration.k8s.io/v1/watch/apiservices/{name}",
+            "apis/apiregistration.k8s.io/v1beta1/apiservices",
+            "apis/apiregistration.k8s.io/v1beta1/apiservices/{name}",
+            "apis/apiregistration.k8s.io/v1beta1/apiservices/{name}/status",
+            "apis/apiregistration.k8s.io/v1beta1/watch/apiservices",
+            "apis/apiregistration.k8s.io/v1beta1/watch/apiservices/{name}",
+            "apis/apps/v1/controllerrevisions",
+            "apis/apps/v1/daemonsets",
+            "apis/apps/v1/deployments",
+            "apis/apps/v1/namespaces/{namespace}/controllerrevisions",
+            "apis/apps/v1/namespaces/{namespace}/controllerrevisions/{name}",
+            "apis/apps/v1/namespaces/{namespace}/daemonsets",
+            "apis/apps/v1/namespaces/{namespace}/daemonsets/{name}",
+            "apis/apps/v1/namespaces/{namespace}/daemonsets/{name}/status",
+            "apis/apps/v1/namespaces/{namespace}/deployments",
+            "apis/apps/v1/namespaces/{namespace}/deployments/{name}",
+            "apis/apps/v1/namespaces/{namespace}/deployments/{name}/scale",
+            "apis/apps/v1/namespaces/{namespace}/deployments/{name}/status",
+            "apis/apps/v1/namespaces/{namespace}/replicasets",
+            "apis/apps/v1/namespaces/{namespace}/replicasets/{name}",
+            "apis/apps/v1/namespaces/{namespace}/replicasets/{name}/scale",
+            "apis/apps/v1/namespaces/{namespace}/replicasets/{name}/status",
+            "apis/apps/v1/namespaces/{namespace}/statefulsets",
+            "apis/apps/v1/namespaces/{namespace}/statefulsets/{name}",
+            "apis/apps/v1/namespaces/{namespace}/statefulsets/{name}/scale",
+            "apis/apps/v1/namespaces/{namespace}/statefulsets/{name}/status",
+            "apis/apps/v1/replicasets",
+            "apis/apps/v1/statefulsets",
+            "apis/apps/v1/watch/controllerrevisions",
+            "apis/apps/v1/watch/daemonsets",
+            "apis/apps/v1/watch/deployments",
+            "apis/apps/v1/watch/namespaces/{namespace}/controllerrevisions",
+            "apis/apps/v1/watch/namespaces/{namespace}/controllerrevisions/{name}",
+            "apis/apps/v1/watch/namespaces/{namespace}/daemonsets",
+            "apis/apps/v1/watch/namespaces/{namespace}/daemonsets/{name}",
+            "apis/apps/v1/watch/namespaces/{namespace}/deployments",
+            "apis/apps/v1/watch/namespaces/{namespace}/deployments/{name}",
+            "apis/apps/v1/watch/namespaces/{namespace}/replicasets",
+            "apis/apps/v1/watch/namespaces/{namespace}/replicasets/{name}",
+            "apis/apps/v1/watch/namespaces/{namespace}/statefulsets",
+            "apis/apps/v1/watch/namespaces/{namespace}/statefulsets/{name}",
+            "apis/apps/v1/watch/replicasets",
+            "apis/apps/v1/watch/statefulsets",
+            "apis/apps/v1beta1/controllerrevisions",
+            "apis/apps/v1beta1/deployments",
+            "apis/apps/v1beta1/namespaces/{namespace}/controllerrevisions",
+            "apis/apps/v1beta1/namespaces/{namespace}/controllerrevisions/{name}",
+            "apis/apps/v1beta1/namespaces/{namespace}/deployments",
+            "apis/apps/v1beta1/namespaces/{namespace}/deployments/{name}",
+            "apis/apps/v1beta1/namespaces/{namespace}/deployments/{name}/scale",
+            "apis/apps/v1beta1/namespaces/{namespace}/deployments/{name}/status",
+            "apis/apps/v1beta1/namespaces/{namespace}/statefulsets",
+            "apis/apps/v1beta1/namespaces/{namespace}/statefulsets/{name}",
+            "apis/apps/v1beta1/namespaces/{namespace}/statefulsets/{name}/scale",
+            "apis/apps/v1beta1/namespaces/{namespace}/statefulsets/{name}/status",
+            "apis/apps/v1beta1/statefulsets",
+            "apis/apps/v1beta1/watch/controllerrevisions",
+            "apis/apps/v1beta1/watch/deployments",
+            "apis/apps/v1beta1/watch/namespaces/{namespace}/controllerrevisions",
+            "apis/apps/v1beta1/watch/namespaces/{namespace}/controllerrevisions/{name}",
+            "apis/apps/v1beta1/watch/namespaces/{namespace}/deployments",
+            "apis/apps/v1beta1/watch/namespaces/{namespace}/deployments/{name}",
+            "apis/apps/v1beta1/watch/namespaces/{namespace}/statefulsets",
+            "apis/apps/v1beta1/watch/namespaces/{namespace}/statefulsets/{name}",
+            "apis/apps/v1beta1/watch/statefulsets",
+            "apis/apps/v1beta2/controllerrevisions",
+            "apis/apps/v1beta2/daemonsets",
+            "apis/apps/v1beta2/deployments",
+            "apis/apps/v1beta2/namespaces/{namespace}/controllerrevisions",
+            "apis/apps/v1beta2/namespaces/{namespace}/controllerrevisions/{name}",
+            "apis/apps/v1beta2/namespaces/{namespace}/daemonsets",
+            "apis/apps/v1beta2/namespaces/{namespace}/daemonsets/{name}",
+            "apis/apps/v1beta2/namespaces/{namespace}/daemonsets/{name}/status",
+            "apis/apps/v1beta2/namespaces/{namespace}/deployments",
+            "apis/apps/v1beta2/namespaces/{namespace}/deployments/{name}",
+            "apis/apps/v1beta2/namespaces/{namespace}/deployments/{name}/scale",
+            "apis/apps/v1beta2/namespaces/{namespace}/deployments/{name}/status",
+            "apis/apps/v1beta2/namespaces/{namespace}/replicasets",
+            "apis/apps/v1beta2/namespaces/{namespace}/replicasets/{name}",
+            "apis/apps/v1beta2/namespaces/{namespace}/replicasets/{name}/scale",
+            "apis/apps/v1beta2/namespaces/{namespace}/replicasets/{name}/status",
+            "apis/apps/v1beta2/namespaces/{namespace}/statefulsets",
+            "apis/apps/v1beta2/namespaces/{namespace}/statefulsets/{name}",
+            "apis/apps/v1beta2/namespaces/{namespace}/statefulsets/{name}/scale",
+            "apis/apps/v1beta2/namespaces/{namespace}/statefulsets/{name}/status",
+            "apis/apps/v1beta2/replicasets",
+            "apis/apps/v1beta2/statefulsets",
+            "apis/apps/v1beta2/watch/controllerrevisions",
+            "apis/apps/v1beta2/watch/daemonsets",
+            "apis/apps/v1beta2/watch/deployments",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/controllerrevisions",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/controllerrevisions/{name}",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/daemonsets",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/daemonsets/{name}",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/deployments",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/deployments/{name}",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/replicasets",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/replicasets/{name}",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/statefulsets",
+            "apis/apps/v1beta2/watch/namespaces/{namespace}/statefulsets/{name}",
+            "apis/apps/v1beta2/watch/replicasets",
+            "apis/apps/v1beta2/watch/statefulsets",
+            "apis/authentication.k8s.io/v1/selfsubjectreviews",
+            "apis/authentication.k8s.io/v1/tokenreviews",
+            "apis/authentication.k8s.io/v1alpha1/selfsubjectreviews",
+            "apis/authentication.k8s.io/v1beta1/selfsubjectreviews",
+            "apis/authentication.k8s.io/v1beta1/tokenreviews",
+            "apis/authorization.k8s.io/v1/namespaces/{namespace}/localsubjectaccessreviews",
+            "apis/authorization.k8s.io/v1/selfsubjectaccessreviews",
+            "apis/authorization.k8s.io/v1/selfsubjectrulesreviews",
+            "apis/authorization.k8s.io/v1/subjectaccessreviews",
+            "apis/authorization.k8s.io/v1beta1/namespaces/{namespace}/localsubjectaccessreviews",
+            "apis/authorization.k8s.io/v1beta1/selfsubjectaccessreviews",
+            "apis/authorization.k8s.io/v1beta1/selfsubjectrulesreviews",
+            "apis/authorization.k8s.io/v1beta1/subjectaccessreviews",
+            "apis/autoscaling/v1/horizontalpodautoscalers",
+            "apis/autoscaling/v1/namespaces/{namespace}/horizontalpodautoscalers",
+            "apis/autoscaling/v1/namespaces/{namespace}/horizontalpodautoscalers/{name}",
+            "apis/autoscaling/v1/namespaces/{namespace}/horizontalpodautoscalers/{name}/status",
+            "apis/autoscaling/v1/watch/horizontalpodautoscalers",
+            "apis/autoscaling/v1/watch/namespaces/{namespace}/horizontalpodautoscalers",
+            "apis/autoscaling/v1/watch/namespaces/{namespace}/horizontalpodautoscalers/{name}",
+            "apis/autoscaling/v2/horizontalpodautoscalers",
+            "apis/autoscaling/v2/namespaces/{namespace}/horizontalpodautoscalers",
+            "apis/autoscaling/v2/namespaces/{namespace}/horizontalpodautoscalers/{name}",
+            "apis/autoscaling/v2/namespaces/{namespace}/horizontalpodautoscalers/{name}/status",
+            "apis/autoscaling/v2/watch/horizontalpodautoscalers",
+            "apis/autoscaling/v2/watch/namespaces/{namespace}/horizontalpodautoscalers",
+            "apis/autoscaling/v2/watch/namespaces/{namespace}/horizontalpodautoscalers/{name}",
+            "apis/autoscaling/v2beta1/horizontalpodautoscalers",
+            "apis/autoscaling/v2beta1/namespaces/{namespace}/horizontalpodautoscalers",
+            "apis/autoscaling/v2beta1/namespaces/{namespace}/horizontalpodautoscalers/{name}",
+            "apis/autoscaling/v2beta1/namespaces/{namespace}/horizontalpodautoscalers/{name}/status",
+            "apis/autoscaling/v2beta1/watch/horizontalpodautoscalers",
+            "apis/autoscaling/v2beta1/watch/namespaces/{namespace}/horizontalpodautoscalers",
+            "apis/autoscaling/v2beta1/watch/namespaces/{namespace}/horizontalpodautoscalers/{name}",
+            "apis/batch/v1/cronjobs",
+            "apis/batch/v1/jobs",
+            "apis/batch/v1/namespaces/{namespace}/cronjobs",
+            "apis/batch/v1/namespaces/{namespace}/cronjobs/{name}",
+            "apis/batch/v1/namespaces/{namespace}/cronjobs/{name}/status",
+            "apis/batch/v1/namespaces/{namespace}/jobs",
+            "apis/batch/v1/namespaces/{namespace}/jobs/{name}",
+            "apis/batch/v1/namespaces/{namespace}/jobs/{name}/status",
+            "apis/batch/v1/watch/cronjobs",
+            "apis/batch/v1/watch/jobs",
+            "apis/batch/v1/watch/namespaces/{namespace}/cronjobs",
+            "apis/batch/v1/watch/namespaces/{namespace}/cronjobs/{name}",
+            "apis/batch/v1/watch/namespaces/{namespace}/jobs",
+            "apis/batch/v1/watch/namespaces/{namespace}/jobs/{name}",
+            "apis/batch/v1beta1/cronjobs",
+            "apis/batch/v1beta1/namespaces/{namespace}/cronjobs",
+            "apis/batch/v1beta1/namespaces/{namespace}/cronjobs/{name}",
+            "apis/batch/v1beta1/namespaces/{namespace}/cronjobs/{name}/status",
+            "apis/batch/v1beta1/watch/cronjobs",
+            "apis/batch/v1beta1/watch/namespaces/{namespace}/cronjobs",
+            "apis/batch/v1beta1/watch/namespaces/{namespace}/cronjobs/{name}",
+            "apis/batch/v2alpha1/cronjobs",
+            "apis/batch/v2alpha1/namespaces/{namespace}/cronjobs",
+            "apis/batch/v2alpha1/namespaces/{namespace}/cronjobs/{name}",
+            "apis/batch/v2alpha1/namespaces/{namespace}/cronjobs/{name}/status",
+            "apis/batch/v2alpha1/watch/cronjobs",
+            "apis/batch/v2alpha1/watch/namespaces/{namespace}/cronjobs",
+            "apis/batch/v2alpha1/watch/namespaces/{namespace}/cronjobs/{name}",
+            "apis/certificates.k8s.io/v1/certificatesigningrequests",
+            "apis/certificates.k8s.io/v1/certificatesigningrequests/{name}",
+            "apis/certificates.k8s.io/v1/certificatesigningrequests/{name}/approval",
+            "apis/certificates.k8s.io/v1/certificatesigningrequests/{name}/status",
+            "apis/certificates.k8s.io/v1/watch/certificatesigningrequests",
+            "apis/certificates.k8s.io/v1/watch/certificatesigningrequests/{name}",
+            "apis/certificates.k8s.io/v1alpha1/clustertrustbundles",
+            "apis/certificates.k8s.io/v1alpha1/clustertrustbundles/{name}",
+            "apis/certificates.k8s.io/v1alpha1/watch/clustertrustbundles",
+            "apis/certificates.k8s.io/v1alpha1/watch/clustertrustbundles/{name}",
+            "apis/certificates.k8s.io/v1beta1/certificatesigningrequests",
+            "apis/certificates.k8s.io/v1beta1/certificatesigningrequests/{name}",
+            "apis/certificates.k8s.io/v1beta1/certificatesigningrequests/{name}/approval",
+            "apis/certificates.k8s.io/v1beta1/certificatesigningrequests/{name}/status",
+            "apis/certificates.k8s.io/v1beta1/watch/certificatesigningrequests",
+            "apis/certificates.k8s.io/v1beta1/watch/certificatesigningrequests/{name}",
+            "apis/coordination.k8s.io/v1/leases",
+            "apis/coordination.k8s.io/v1/namespaces/{namespace}/leases",
+            "apis/coordination.k8s.io/v1/namespaces/{namespace}/leases/{name}",
+            "apis/coordination.k8s.io/v1/watch/leases",
+            "apis/coordination.k8s.io/v1/watch/namespaces/{namespace}/leases",
+            "apis/coordination.k8s.io/v1/watch/namespaces/{namespace}/leases/{name}",
+            "apis/coordination.k8s.io/v1alpha1/leasecandidates",
+            "apis/coordination.k8s.io/v1alpha1/namespaces/{namespace}/leasecandidates",
+            "apis/coordination.k8s.io/v1alpha1/namespaces/{namespace}/leasecandidates/{name}",
+            "apis/coordination.k8s.io/v1alpha1/watch/leasecandidates",
+            "apis/coordination.k8s.io/v1alpha1/watch/namespaces/{namespace}/leasecandidates",
+            "apis/coordination.k8s.io/v1alpha1/watch/namespaces/{namespace}/leasecandidates/{name}",
+            "apis/discovery.k8s.io/v1/endpointslices",
+            "apis/discovery.k8s.io/v1/namespaces/{namespace}/endpointslices",
+            "apis/discovery.k8s.io/v1/namespaces/{namespace}/endpointslices/{name}",
+            "apis/discovery.k8s.io/v1/watch/endpointslices",
+            "apis/discovery.k8s.io/v1/watch/namespaces/{namespace}/endpointslices",
+            "apis/discovery.k8s.io/v1/watch/namespaces/{namespace}/endpointslices/{name}",
+            "apis/events.k8s.io/v1beta1/events",
+            "apis/events.k8s.io/v1beta1/namespaces/{namespace}/events",
+            "apis/events.k8s.io/v1beta1/namespaces/{namespace}/events/{name}",
+            "apis/events.k8s.io/v1beta1/watch/events",
+            "apis/events.k8s.io/v1beta1/watch/namespaces/{namespace}/events",
+            "apis/events.k8s.io/v1beta1/watch/namespaces/{namespace}/events/{name}",
+            "apis/extensions/v1beta1/daemonsets",
+            "apis/extensions/v1beta1/ingresses",
+            "apis/extensions/v1beta1/namespaces/{namespace}/daemonsets",
+            "apis/extensions/v1beta1/namespaces/{namespace}/daemonsets/{name}",
+            "apis/extensions/v1beta1/namespaces/{namespace}/daemonsets/{name}/status",
+            "apis/extensions/v1beta1/namespaces/{namespace}/ingresses",
+            "apis/extensions/v1beta1/namespaces/{namespace}/ingresses/{name}",
+            "apis/extensions/v1beta1/namespaces/{namespace}/ingresses/{name}/status",
+            "apis/extensions/v1beta1/watch/daemonsets",
+            "apis/extensions/v1beta1/watch/ingresses",
+            "apis/extensions/v1beta1/watch/namespaces/{namespace}/daemonsets",
+            "apis/extensions/v1beta1/watch/namespaces/{namespace}/daemonsets/{name}",
+            "apis/extensions/v1beta1/watch/namespaces/{namespace}/ingresses",
+            "apis/extensions/v1beta1/watch/namespaces/{namespace}/ingresses/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1/flowschemas",
+            "apis/flowcontrol.apiserver.k8s.io/v1/flowschemas/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1/flowschemas/{name}/status",
+            "apis/flowcontrol.apiserver.k8s.io/v1/prioritylevelconfigurations",
+            "apis/flowcontrol.apiserver.k8s.io/v1/prioritylevelconfigurations/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1/prioritylevelconfigurations/{name}/status",
+            "apis/flowcontrol.apiserver.k8s.io/v1/watch/flowschemas",
+            "apis/flowcontrol.apiserver.k8s.io/v1/watch/flowschemas/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1/watch/prioritylevelconfigurations",
+            "apis/flowcontrol.apiserver.k8s.io/v1/watch/prioritylevelconfigurations/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/flowschemas",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/flowschemas/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/flowschemas/{name}/status",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/prioritylevelconfigurations",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/prioritylevelconfigurations/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/prioritylevelconfigurations/{name}/status",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/watch/flowschemas",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/watch/flowschemas/{name}",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/watch/prioritylevelconfigurations",
+            "apis/flowcontrol.apiserver.k8s.io/v1beta3/watch/prioritylevelconfigurations/{name}",
+            "apis/internal.apiserver.k8s.io/v1alpha1/storageversions",
+            "apis/internal.apiserver.k8s.io/v1alpha1/storageversions/{name}",
+            "apis/internal.apiserver.k8s.io/v1alpha1/storageversions/{name}/status",
+            "apis/internal.apiserver.k8s.io/v1alpha1/watch/storageversions",
+            "apis/internal.apiserver.k8s.io/v1alpha1/watch/storageversions/{name}",
+            "apis/networking.k8s.io/v1/ingressclasses",
+            "apis/networking.k8s.io/v1/ingressclasses/{name}",
+            "apis/networking.k8s.io/v1/ingresses",
+            "apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses",
+            "apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses/{name}",
+            "apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses/{name}/status",
+            "apis/networking.k8s.io/v1/namespaces/{namespace}/networkpolicies",
+            "apis/networking.k8s.io/v1/namespaces/{namespace}/networkpolicies/{name}",
+            "apis/networking.k8s.io/v1/networkpolicies",
+            "apis/networking.k8s.io/v1/watch/ingressclasses",
+            "apis/networking.k8s.io/v1/watch/ingressclasses/{name}",
+            "apis/networking.k8s.io/v1/watch/ingresses",
+            "apis/networking.k8s.io/v1/watch/namespaces/{namespace}/ingresses",
+            "apis/networking.k8s.io/v1/watch/namespaces/{namespace}/ingresses/{name}",
+            "apis/networking.k8s.io/v1/watch/namespaces/{namespace}/networkpolicies",
+            "apis/networking.k8s.io/v1/watch/namespaces/{namespace}/networkpolicies/{name}",
+            "apis/networking.k8s.io/v1/watch/networkpolicies",
+            "apis/networking.k8s.io/v1beta1/ipaddresses",
+            "apis/networking.k8s.io/v1beta1/ipaddresses/{name}",
+            "apis/networking.k8s.io/v1beta1/servicecidrs",
+            "apis/networking.k8s.io/v1beta1/servicecidrs/{name}",
+            "apis/networking.k8s.io/v1beta1/servicecidrs/{name}/status",
+            "apis/networking.k8s.io/v1beta1/watch/ipaddresses",
+            "apis/networking.k8s.io/v1beta1/watch/ipaddresses/{name}",
+            "apis/networking.k8s.io/v1beta1/watch/servicecidrs",
+            "apis/networking.k8s.io/v1beta1/watch/servicecidrs/{name}",
+            "apis/node.k8s.io/v1/runtimeclasses",
+            "apis/node.k8s.io/v1/runtimeclasses/{name}",
+            "apis/node.k8s.io/v1/watch/runtimeclasses",
+            "apis/node.k8s.io/v1/watch/runtimeclasses/{name}",
+            "apis/policy/v1/namespaces/{namespace}/poddisruptionbudgets",
+            "apis/policy/v1/namespaces/{namespace}/poddisruptionbudgets/{name}",
+            "apis/policy/v1/namespaces/{namespace}/poddisruptionbudgets/{name}/status",
+            "apis/policy/v1/poddisruptionbudgets",
+            "apis/policy/v1/watch/namespaces/{namespace}/poddisruptionbudgets",
+            "apis/policy/v1/watch/namespaces/{namespace}/poddisruptionbudgets/{name}",
+            "apis/policy/v1/watch/poddisruptionbudgets",
+            "apis/policy/v1beta1/namespaces/{namespace}/poddisruptionbudgets",
+            "apis/policy/v1beta1/namespaces/{namespace}/poddisruptionbudgets/{name}",
+            "apis/policy/v1beta1/namespaces/{namespace}/poddisruptionbudgets/{name}/status",
+            "apis/policy/v1beta1/poddisruptionbudgets",
+            "apis/policy/v1beta1/podsecuritypolicies",
+            "apis/policy/v1beta1/podsecuritypolicies/{name}",
+            "apis/policy/v1beta1/watch/namespaces/{namespace}/poddisruptionbudgets",
+            "apis/policy/v1beta1/watch/namespaces/{namespace}/poddisruptionbudgets/{name}",
+            "apis/policy/v1beta1/watch/poddisruptionbudgets",
+            "apis/policy/v1beta1/watch/podsecuritypolicies",
+            "apis/policy/v1beta1/watch/podsecuritypolicies/{name}",
+            "apis/rbac.authorization.k8s.io/v1/clusterrolebindings",
+            "apis/rbac.authorization.k8s.io/v1/clusterrolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1/clusterroles",
+            "apis/rbac.authorization.k8s.io/v1/clusterroles/{name}",
+            "apis/rbac.authorization.k8s.io/v1/namespaces/{namespace}/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1/namespaces/{namespace}/rolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1/namespaces/{namespace}/roles",
+            "apis/rbac.authorization.k8s.io/v1/namespaces/{namespace}/roles/{name}",
+            "apis/rbac.authorization.k8s.io/v1/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1/roles",
+            "apis/rbac.authorization.k8s.io/v1/watch/clusterrolebindings",
+            "apis/rbac.authorization.k8s.io/v1/watch/clusterrolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1/watch/clusterroles",
+            "apis/rbac.authorization.k8s.io/v1/watch/clusterroles/{name}",
+            "apis/rbac.authorization.k8s.io/v1/watch/namespaces/{namespace}/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1/watch/namespaces/{namespace}/rolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1/watch/namespaces/{namespace}/roles",
+            "apis/rbac.authorization.k8s.io/v1/watch/namespaces/{namespace}/roles/{name}",
+            "apis/rbac.authorization.k8s.io/v1/watch/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1/watch/roles",
+            "apis/rbac.authorization.k8s.io/v1alpha1/clusterrolebindings",
+            "apis/rbac.authorization.k8s.io/v1alpha1/clusterrolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/clusterroles",
+            "apis/rbac.authorization.k8s.io/v1alpha1/clusterroles/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/namespaces/{namespace}/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1alpha1/namespaces/{namespace}/rolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/namespaces/{namespace}/roles",
+            "apis/rbac.authorization.k8s.io/v1alpha1/namespaces/{namespace}/roles/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1alpha1/roles",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/clusterrolebindings",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/clusterrolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/clusterroles",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/clusterroles/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/namespaces/{namespace}/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/namespaces/{namespace}/rolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/namespaces/{namespace}/roles",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/namespaces/{namespace}/roles/{name}",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1alpha1/watch/roles",
+            "apis/rbac.authorization.k8s.io/v1beta1/clusterrolebindings",
+            "apis/rbac.authorization.k8s.io/v1beta1/clusterrolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/clusterroles",
+            "apis/rbac.authorization.k8s.io/v1beta1/clusterroles/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/namespaces/{namespace}/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1beta1/namespaces/{namespace}/rolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/namespaces/{namespace}/roles",
+            "apis/rbac.authorization.k8s.io/v1beta1/namespaces/{namespace}/roles/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1beta1/roles",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/clusterrolebindings",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/clusterrolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/clusterroles",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/clusterroles/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/namespaces/{namespace}/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/namespaces/{namespace}/rolebindings/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/namespaces/{namespace}/roles",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/namespaces/{namespace}/roles/{name}",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/rolebindings",
+            "apis/rbac.authorization.k8s.io/v1beta1/watch/roles",
+            "apis/resource.k8s.io/v1alpha3/deviceclasses",
+            "apis/resource.k8s.io/v1alpha3/deviceclasses/{name}",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/podschedulingcontexts",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/podschedulingcontexts/{name}",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/podschedulingcontexts/{name}/status",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/resourceclaims",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/resourceclaims/{name}",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/resourceclaims/{name}/status",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/resourceclaimtemplates",
+            "apis/resource.k8s.io/v1alpha3/namespaces/{namespace}/resourceclaimtemplates/{name}",
+            "apis/resource.k8s.io/v1alpha3/podschedulingcontexts",
+            "apis/resource.k8s.io/v1alpha3/resourceclaims",
+            "apis/resource.k8s.io/v1alpha3/resourceclaimtemplates",
+            "apis/resource.k8s.io/v1alpha3/resourceslices",
+            "apis/resource.k8s.io/v1alpha3/resourceslices/{name}",
+            "apis/resource.k8s.io/v1alpha3/watch/deviceclasses",
+            "apis/resource.k8s.io/v1alpha3/watch/deviceclasses/{name}",
+            "apis/resource.k8s.io/v1alpha3/watch/namespaces/{namespace}/podschedulingcontexts",
+            "apis/resource.k8s.io/v1alpha3/watch/namespaces/{namespace}/podschedulingcontexts/{name}",
+            "apis/resource.k8s.io/v1alpha3/watch/namespaces/{namespace}/resourceclaims",
+            "apis/resource.k8s.io/v1alpha3/watch/namespaces/{namespace}/resourceclaims/{name}",
+            "apis/resource.k8s.io/v1alpha3/watch/namespaces/{namespace}/resourceclaimtemplates",
+            "apis/resource.k8s.io/v1alpha3/watch/namespaces/{namespace}/resourceclaimtemplates/{name}",
+            "apis/resource.k8s.io/v1alpha3/watch/podschedulingcontexts",
+            "apis/resource.k8s.io/v1alpha3/watch/resourceclaims",
+            "apis/resource.k8s.io/v1alpha3/watch/resourceclaimtemplates",
+            "apis/resource.k8s.io/v1alpha3/watch/resourceslices",
+            "apis/resource.k8s.io/v1alpha3/watch/resourceslices/{name}",
+            "apis/scheduling.k8s.io/v1/priorityclasses",
+            "apis/scheduling.k8s.io/v1/priorityclasses/{name}",
+            "apis/scheduling.k8s.io/v1/watch/priorityclasses",
+            "apis/scheduling.k8s.io/v1/watch/priorityclasses/{name}",
+            "apis/scheduling.k8s.io/v1alpha1/priorityclasses",
+            "apis/scheduling.k8s.io/v1alpha1/priorityclasses/{name}",
+            "apis/scheduling.k8s.io/v1alpha1/watch/priorityclasses",
+            "apis/scheduling.k8s.io/v1alpha1/watch/priorityclasses/{name}",
+            "apis/scheduling.k8s.io/v1beta1/priorityclasses",
+            "apis/scheduling.k8s.io/v1beta1/priorityclasses/{name}",
+            "apis/scheduling.k8s.io/v1beta1/watch/priorityclasses",
+            "apis/scheduling.k8s.io/v1beta1/watch/priorityclasses/{name}",
+            "apis/settings.k8s.io/v1alpha1/namespaces/{namespace}/podpresets",
+            "apis/settings.k8s.io/v1alpha1/namespaces/{namespace}/podpresets/{name}",
+            "apis/settings.k8s.io/v1alpha1/podpresets",
+            "apis/settings.k8s.io/v1alpha1/watch/namespaces/{namespace}/podpresets",
+            "apis/settings.k8s.io/v1alpha1/watch/namespaces/{namespace}/podpresets/{name}",
+            "apis/settings.k8s.io/v1alpha1/watch/podpresets",
+            "apis/storage.k8s.io/v1/csidrivers",
+            "apis/storage.k8s.io/v1/csidrivers/{name}",
+            "apis/storage.k8s.io/v1/csinodes",
+            "apis/storage.k8s.io/v1/csinodes/{name}",
+            "apis/storage.k8s.io/v1/csistoragecapacities",
+            "apis/storage.k8s.io/v1/namespaces/{namespace}/csistoragecapacities",
+            "apis/storage.k8s.io/v1/namespaces/{namespace}/csistoragecapacities/{name}",
+            "apis/storage.k8s.io/v1/storageclasses",
+            "apis/storage.k8s.io/v1/storageclasses/{name}",
+            "apis/storage.k8s.io/v1/volumeattachments",
+            "apis/storage.k8s.io/v1/volumeattachments/{name}",
+            "apis/storage.k8s.io/v1/volumeattachments/{name}/status",
+            "apis/storage.k8s.io/v1/watch/csidrivers",
+            "apis/storage.k8s.io/v1/watch/csidrivers/{name}",
+            "apis/storage.k8s.io/v1/watch/csinodes",
+            "apis/storage.k8s.io/v1/watch/csinodes/{name}",
+            "apis/storage.k8s.io/v1/watch/csistoragecapacities",
+            "apis/storage.k8s.io/v1/watch/namespaces/{namespace}/csistoragecapacities",
+            "apis/storage.k8s.io/v1/watch/namespaces/{namespace}/csistoragecapacities/{name}",
+            "apis/storage.k8s.io/v1/watch/storageclasses",
+            "apis/storage.k8s.io/v1/watch/storageclasses/{name}",
+            "apis/storage.k8s.io/v1/watch/volumeattachments",
+            "apis/storage.k8s.io/v1/watch/volumeattachments/{name}",
+            "apis/storage.k8s.io/v1alpha1/volumeattachments",
+            "apis/storage.k8s.io/v1alpha1/volumeattachments/{name}",
+            "apis/storage.k8s.io/v1alpha1/volumeattributesclasses",
+            "apis/storage.k8s.io/v1alpha1/volumeattributesclasses/{name}",
+            "apis/storage.k8s.io/v1alpha1/watch/volumeattachments",
+            "apis/storage.k8s.io/v1alpha1/watch/volumeattachments/{name}",
+            "apis/storage.k8s.io/v1alpha1/watch/volumeattributesclasses",
+            "apis/storage.k8s.io/v1alpha1/watch/volumeattributesclasses/{name}",
+            "apis/storage.k8s.io/v1beta1/storageclasses",
+            "apis/storage.k8s.io/v1beta1/storageclasses/{name}",
+            "apis/storage.k8s.io/v1beta1/volumeattachments",
+            "apis/storage.k8s.io/v1beta1/volumeattachments/{name}",
+            "apis/storage.k8s.io/v1beta1/volumeattributesclasses",
+            "apis/storage.k8s.io/v1beta1/volumeattributesclasses/{name}",
+            "apis/storage.k8s.io/v1beta1/watch/storageclasses",
+            "apis/storage.k8s.io/v1beta1/watch/storageclasses/{name}",
+            "apis/storage.k8s.io/v1beta1/watch/volumeattachments",
+            "apis/storage.k8s.io/v1beta1/watch/volumeattachments/{name}",
+            "apis/storage.k8s.io/v1beta1/watch/volumeattributesclasses",
+            "apis/storage.k8s.io/v1beta1/watch/volumeattributesclasses/{name}",
+            "apis/storagemigration.k8s.io/v1alpha1/storageversionmigrations",
+            "apis/storagemigration.k8s.io/v1alpha1/storageversionmigrations/{name}",
+            "apis/storagemigration.k8s.io/v1alpha1/storageversionmigrations/{name}/status",
+            "apis/storagemigration.k8s.io/v1alpha1/watch/storageversionmigrations",
+            "apis/storagemigration.k8s.io/v1alpha1/watch/storageversionmigrations/{name}",
+        };
+
+        /// <summary>
+        ///     Generated resource-list model types (derived from <see cref="KubeResourceListV1"/>), with their kinds and API versions (and those of their items, if known).
+        /// </summary>
+        static readonly (Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion)[] GeneratedResourceListTypes =
+        {
+            (typeof(APIServiceListV1), "APIServiceList", "apiregistration.k8s.io/v1", "APIService", "apiregistration.k8s.io/v1"),
+            (typeof(APIServiceListV1Beta1), "APIServiceList", "apiregistration.k8s.io/v1beta1", "APIService", "apiregistration.k8s.io/v1beta1"),
+            (typeof(CSIDriverListV1), "CSIDriverList", "storage.k8s.io/v1", "CSIDriver", "storage.k8s.io/v1"),
+            (typeof(CSINodeListV1), "CSINodeList", "storage.k8s.io/v1", "CSINode", "storage.k8s.io/v1"),
+            (typeof(CSIStorageCapacityListV1), "CSIStorageCapacityList", "storage.k8s.io/v1", "CSIStorageCapacity", "storage.k8s.io/v1"),
+            (typeof(CertificateSigningRequestListV1), "CertificateSigningRequestList", "certificates.k8s.io/v1", "CertificateSigningRequest", "certificates.k8s.io/v1"),
+            (typeof(CertificateSigningRequestListV1Beta1), "CertificateSigningRequestList", "certificates.k8s.io/v1beta1", "CertificateSigningRequest", "certificates.k8s.io/v1beta1"),
+            (typeof(ClusterRoleBindingListV1), "ClusterRoleBindingList", "rbac.authorization.k8s.io/v1", "ClusterRoleBinding", "rbac.authorization.k8s.io/v1"),
+            (typeof(ClusterRoleBindingListV1Alpha1), "ClusterRoleBindingList", "rbac.authorization.k8s.io/v1alpha1", "ClusterRoleBinding", "rbac.authorization.k8s.io/v1alpha1"),
+            (typeof(ClusterRoleBindingListV1Beta1), "ClusterRoleBindingList", "rbac.authorization.k8s.io/v1beta1", "ClusterRoleBinding", "rbac.authorization.k8s.io/v1beta1"),
+            (typeof(ClusterRoleListV1), "ClusterRoleList", "rbac.authorization.k8s.io/v1", "ClusterRole", "rbac.authorization.k8s.io/v1"),
+            (typeof(ClusterRoleListV1Alpha1), "ClusterRoleList", "rbac.authorization.k8s.io/v1alpha1", "ClusterRole", "rbac.authorization.k8s.io/v1alpha1"),
+            (typeof(ClusterRoleListV1Beta1), "ClusterRoleList", "rbac.authorization.k8s.io/v1beta1", "ClusterRole", "rbac.authorization.k8s.io/v1beta1"),
+            (typeof(ClusterTrustBundleListV1Alpha1), "ClusterTrustBundleList", "certificates.k8s.io/v1alpha1", "ClusterTrustBundle", "certificates.k8s.io/v1alpha1"),
+            (typeof(ComponentStatusListV1), "ComponentStatusList", "v1", "ComponentStatus", "v1"),
+            (typeof(ConfigMapListV1), "ConfigMapList", "v1", "ConfigMap", "v1"),
+            (typeof(ControllerRevisionListV1), "ControllerRevisionList", "apps/v1", "ControllerRevision", "apps/v1"),
+            (typeof(ControllerRevisionListV1Beta1), "ControllerRevisionList", "apps/v1beta1", "ControllerRevision", "apps/v1beta1"),
+            (typeof(ControllerRevisionListV1Beta2), "ControllerRevisionList", "apps/v1beta2", "ControllerRevision", "apps/v1beta2"),
+            (typeof(CronJobListV1), "CronJobList", "batch/v1", "CronJob", "batch/v1"),
+            (typeof(CronJobListV1Beta1), "CronJobList", "batch/v1beta1", "CronJob", "batch/v1beta1"),
+            (typeof(CronJobListV2Alpha1), "CronJobList", "batch/v2alpha1", "CronJob", "batch/v2alpha1"),
+            (typeof(CustomResourceDefinitionListV1), "CustomResourceDefinitionList", "apiextensions.k8s.io/v1", "CustomResourceDefinition", "apiextensions.k8s.io/v1"),
+            (typeof(CustomResourceDefinitionListV1Beta1), "CustomResourceDefinitionList", "apiextensions.k8s.io/v1beta1", "CustomResourceDefinition", "apiextensions.k8s.io/v1beta1"),
+            (typeof(DaemonSetListV1), "DaemonSetList", "apps/v1", "DaemonSet", "apps/v1"),
+            (typeof(DaemonSetListV1Beta1), "DaemonSetList", "extensions/v1beta1", "DaemonSet", "extensions/v1beta1"),
+            (typeof(DaemonSetListV1Beta2), "DaemonSetList", "apps/v1beta2", "DaemonSet", "apps/v1beta2"),
+            (typeof(DeploymentListV1), "DeploymentList", "apps/v1", "Deployment", "apps/v1"),
+            (typeof(DeploymentListV1Beta1), "DeploymentList", "apps/v1beta1", "Deployment", "apps/v1beta1"),
+            (typeof(DeploymentListV1Beta2), "DeploymentList", "apps/v1beta2", "Deployment", "apps/v1beta2"),
+            (typeof(DeviceClassListV1Alpha3), "DeviceClassList", "resource.k8s.io/v1alpha3", "DeviceClass", "resource.k8s.io/v1alpha3"),
+            (typeof(EndpointSliceListV1), "EndpointSliceList", "discovery.k8s.io/v1", "EndpointSlice", "discovery.k8s.io/v1"),
+            (typeof(EndpointsListV1), "EndpointsList", "v1", "Endpoints", "v1"),
+            (typeof(EventListV1), "EventList", "v1", "Event", "v1"),
+            (typeof(EventListV1Beta1), "EventList", "events.k8s.io/v1beta1", "Event", "events.k8s.io/v1beta1"),
+            (typeof(FlowSchemaListV1), "FlowSchemaList", "flowcontrol.apiserver.k8s.io/v1", "FlowSchema", "flowcontrol.apiserver.k8s.io/v1"),
+            (typeof(FlowSchemaListV1Beta3), "FlowSchemaList", "flowcontrol.apiserver.k8s.io/v1beta3", "FlowSchema", "flowcontrol.apiserver.k8s.io/v1beta3"),
+            (typeof(HorizontalPodAutoscalerListV1), "HorizontalPodAutoscalerList", "autoscaling/v1", "HorizontalPodAutoscaler", "autoscaling/v1"),
+            (typeof(HorizontalPodAutoscalerListV2), "HorizontalPodAutoscalerList", "autoscaling/v2", "HorizontalPodAutoscaler", "autoscaling/v2"),
+            (typeof(HorizontalPodAutoscalerListV2Beta1), "HorizontalPodAutoscalerList", "autoscaling/v2beta1", "HorizontalPodAutoscaler", "autoscaling/v2beta1"),
+            (typeof(IPAddressListV1Beta1), "IPAddressList", "networking.k8s.io/v1beta1", "IPAddress", "networking.k8s.io/v1beta1"),
+            (typeof(IngressClassListV1), "IngressClassList", "networking.k8s.io/v1", "IngressClass", "networking.k8s.io/v1"),
+            (typeof(IngressListV1), "IngressList", "networking.k8s.io/v1", "Ingress", "networking.k8s.io/v1"),
+            (typeof(IngressListV1Beta1), "IngressList", "extensions/v1beta1", "Ingress", "extensions/v1beta1"),
+            (typeof(InitializerConfigurationListV1Alpha1), "InitializerConfigurationList", "admissionregistration.k8s.io/v1alpha1", "InitializerConfiguration", "admissionregistration.k8s.io/v1alpha1"),
+            (typeof(JobListV1), "JobList", "batch/v1", "Job", "batch/v1"),
+            (typeof(LeaseCandidateListV1Alpha1), "LeaseCandidateList", "coordination.k8s.io/v1alpha1", "LeaseCandidate", "coordination.k8s.io/v1alpha1"),
+            (typeof(LeaseListV1), "LeaseList", "coordination.k8s.io/v1", "Lease", "coordination.k8s.io/v1"),
+            (typeof(LimitRangeListV1), "LimitRangeList", "v1", "LimitRange", "v1"),
+            (typeof(MutatingWebhookConfigurationListV1), "MutatingWebhookConfigurationList", "admissionregistration.k8s.io/v1", "MutatingWebhookConfiguration", "admissionregistration.k8s.io/v1"),
+            (typeof(MutatingWebhookConfigurationListV1Beta1), "MutatingWebhookConfigurationList", "admissionregistration.k8s.io/v1beta1", "MutatingWebhookConfiguration", "admissionregistration.k8s.io/v1beta1"),
+            (typeof(NamespaceListV1), "NamespaceList", "v1", "Namespace", "v1"),
+            (typeof(NetworkPolicyListV1), "NetworkPolicyList", "networking.k8s.io/v1", "NetworkPolicy", "networking.k8s.io/v1"),
+            (typeof(NodeListV1), "NodeList", "v1", "Node", "v1"),
+            (typeof(PersistentVolumeClaimListV1), "PersistentVolumeClaimList", "v1", "PersistentVolumeClaim", "v1"),
+            (typeof(PersistentVolumeListV1), "PersistentVolumeList", "v1", "PersistentVolume", "v1"),
+            (typeof(PodDisruptionBudgetListV1), "PodDisruptionBudgetList", "policy/v1", "PodDisruptionBudget", "policy/v1"),
+            (typeof(PodDisruptionBudgetListV1Beta1), "PodDisruptionBudgetList", "policy/v1beta1", "PodDisruptionBudget", "policy/v1beta1"),
+            (typeof(PodListV1), "PodList", "v1", "Pod", "v1"),
+            (typeof(PodPresetListV1Alpha1), "PodPresetList", "settings.k8s.io/v1alpha1", "PodPreset", "settings.k8s.io/v1alpha1"),
+            (typeof(PodSchedulingContextListV1Alpha3), "PodSchedulingContextList", "resource.k8s.io/v1alpha3", "PodSchedulingContext", "resource.k8s.io/v1alpha3"),
+            (typeof(PodSecurityPolicyListV1Beta1), "PodSecurityPolicyList", "policy/v1beta1", "PodSecurityPolicy", "policy/v1beta1"),
+            (typeof(PodTemplateListV1), "PodTemplateList", "v1", "PodTemplate", "v1"),
+            (typeof(PriorityClassListV1), "PriorityClassList", "scheduling.k8s.io/v1", "PriorityClass", "scheduling.k8s.io/v1"),
+            (typeof(PriorityClassListV1Alpha1), "PriorityClassList", "scheduling.k8s.io/v1alpha1", "PriorityClass", "scheduling.k8s.io/v1alpha1"),
+            (typeof(PriorityClassListV1Beta1), "PriorityClassList", "scheduling.k8s.io/v1beta1", "PriorityClass", "scheduling.k8s.io/v1beta1"),
+            (typeof(PriorityLevelConfigurationListV1), "PriorityLevelConfigurationList", "flowcontrol.apiserver.k8s.io/v1", "PriorityLevelConfiguration", "flowcontrol.apiserver.k8s.io/v1"),
+            (typeof(PriorityLevelConfigurationListV1Beta3), "PriorityLevelConfigurationList", "flowcontrol.apiserver.k8s.io/v1beta3", "PriorityLevelConfiguration", "flowcontrol.apiserver.k8s.io/v1beta3"),
+            (typeof(ReplicaSetListV1), "ReplicaSetList", "apps/v1", "ReplicaSet", "apps/v1"),
+            (typeof(ReplicaSetListV1Beta2), "ReplicaSetList", "apps/v1beta2", "ReplicaSet", "apps/v1beta2"),
+            (typeof(ReplicationControllerListV1), "ReplicationControllerList", "v1", "ReplicationController", "v1"),
+            (typeof(ResourceClaimListV1Alpha3), "ResourceClaimList", "resource.k8s.io/v1alpha3", "ResourceClaim", "resource.k8s.io/v1alpha3"),
+            (typeof(ResourceClaimTemplateListV1Alpha3), "ResourceClaimTemplateList", "resource.k8s.io/v1alpha3", "ResourceClaimTemplate", "resource.k8s.io/v1alpha3"),
+            (typeof(ResourceQuotaListV1), "ResourceQuotaList", "v1", "ResourceQuota", "v1"),
+            (typeof(ResourceSliceListV1Alpha3), "ResourceSliceList", "resource.k8s.io/v1alpha3", "ResourceSlice", "resource.k8s.io/v1alpha3"),
+            (typeof(RoleBindingListV1), "RoleBindingList", "rbac.authorization.k8s.io/v1", "RoleBinding", "rbac.authorization.k8s.io/v1"),
+            (typeof(RoleBindingListV1Alpha1), "RoleBindingList", "rbac.authorization.k8s.io/v1alpha1", "RoleBinding", "rbac.authorization.k8s.io/v1alpha1"),
+            (typeof(RoleBindingListV1Beta1), "RoleBindingList", "rbac.authorization.k8s.io/v1beta1", "RoleBinding", "rbac.authorization.k8s.io/v1beta1"),
+            (typeof(RoleListV1), "RoleList", "rbac.authorization.k8s.io/v1", "Role", "rbac.authorization.k8s.io/v1"),
+            (typeof(RoleListV1Alpha1), "RoleList", "rbac.authorization.k8s.io/v1alpha1", "Role", "rbac.authorization.k8s.io/v1alpha1"),
+            (typeof(RoleListV1Beta1), "RoleList", "rbac.authorization.k8s.io/v1beta1", "Role", "rbac.authorization.k8s.io/v1beta1"),
+            (typeof(RuntimeClassListV1), "RuntimeClassList", "node.k8s.io/v1", "RuntimeClass", "node.k8s.io/v1"),
+            (typeof(SecretListV1), "SecretList", "v1", "Secret", "v1"),
+            (typeof(ServiceAccountListV1), "ServiceAccountList", "v1", "ServiceAccount", "v1"),
+            (typeof(ServiceCIDRListV1Beta1), "ServiceCIDRList", "networking.k8s.io/v1beta1", "ServiceCIDR", "networking.k8s.io/v1beta1"),
+            (typeof(ServiceListV1), "ServiceList", "v1", "Service", "v1"),
+            (typeof(StatefulSetListV1), "StatefulSetList", "apps/v1", "StatefulSet", "apps/v1"),
+            (typeof(StatefulSetListV1Beta1), "StatefulSetList", "apps/v1beta1", "StatefulSet", "apps/v1beta1"),
+            (typeof(StatefulSetListV1Beta2), "StatefulSetList", "apps/v1beta2", "StatefulSet", "apps/v1beta2"),
+            (typeof(StatusV1), "Status", "v1", null, null),
+            (typeof(StorageClassListV1), "StorageClassList", "storage.k8s.io/v1", "StorageClass", "storage.k8s.io/v1"),
+            (typeof(StorageClassListV1Beta1), "StorageClassList", "storage.k8s.io/v1beta1", "StorageClass", "storage.k8s.io/v1beta1"),
+            (typeof(StorageVersionListV1Alpha1), "StorageVersionList", "internal.apiserver.k8s.io/v1alpha1", "StorageVersion", "internal.apiserver.k8s.io/v1alpha1"),
+            (typeof(StorageVersionMigrationListV1Alpha1), "StorageVersionMigrationList", "storagemigration.k8s.io/v1alpha1", "StorageVersionMigration", "storagemigration.k8s.io/v1alpha1"),
+            (typeof(ValidatingAdmissionPolicyBindingListV1), "ValidatingAdmissionPolicyBindingList", "admissionregistration.k8s.io/v1", "ValidatingAdmissionPolicyBinding", "admissionregistration.k8s.io/v1"),
+            (typeof(ValidatingAdmissionPolicyBindingListV1Alpha1), "ValidatingAdmissionPolicyBindingList", "admissionregistration.k8s.io/v1alpha1", "ValidatingAdmissionPolicyBinding", "admissionregistration.k8s.io/v1alpha1"),
+            (typeof(ValidatingAdmissionPolicyBindingListV1Beta1), "ValidatingAdmissionPolicyBindingList", "admissionregistration.k8s.io/v1beta1", "ValidatingAdmissionPolicyBinding", "admissionregistration.k8s.io/v1beta1"),
+            (typeof(ValidatingAdmissionPolicyListV1), "ValidatingAdmissionPolicyList", "admissionregistration.k8s.io/v1", "ValidatingAdmissionPolicy", "admissionregistration.k8s.io/v1"),
+            (typeof(ValidatingAdmissionPolicyListV1Alpha1), "ValidatingAdmissionPolicyList", "admissionregistration.k8s.io/v1alpha1", "ValidatingAdmissionPolicy", "admissionregistration.k8s.io/v1alpha1"),
+            (typeof(ValidatingAdmissionPolicyListV1Beta1), "ValidatingAdmissionPolicyList", "admissionregistration.k8s.io/v1beta1", "ValidatingAdmissionPolicy", "admissionregistration.k8s.io/v1beta1"),
+            (typeof(ValidatingWebhookConfigurationListV1), "ValidatingWebhookConfigurationList", "admissionregistration.k8s.io/v1", "ValidatingWebhookConfiguration", "admissionregistration.k8s.io/v1"),
+            (typeof(ValidatingWebhookConfigurationListV1Beta1), "ValidatingWebhookConfigurationList", "admissionregistration.k8s.io/v1beta1", "ValidatingWebhookConfiguration", "admissionregistration.k8s.io/v1beta1"),
+            (typeof(VolumeAttachmentListV1), "VolumeAttachmentList", "storage.k8s.io/v1", "VolumeAttachment", "storage.k8s.io/v1"),
+            (typeof(VolumeAttachmentListV1Alpha1), "VolumeAttachmentList", "storage.k8s.io/v1alpha1", "VolumeAttachment", "storage.k8s.io/v1alpha1"),
+            (typeof(VolumeAttachmentListV1Beta1), "VolumeAttachmentList", "storage.k8s.io/v1beta1", "VolumeAttachment", "storage.k8s.io/v1beta1"),
+            (typeof(VolumeAttributesClassListV1Alpha1), "VolumeAttributesClassList", "storage.k8s.io/v1alpha1", "VolumeAttributesClass", "storage.k8s.io/v1alpha1"),
+            (typeof(VolumeAttributesClassListV1Beta1), "VolumeAttributesClassList", "storage.k8s.io/v1beta1", "VolumeAttributesClass", "storage.k8s.io/v1beta1"),
+        };
+
+        /// <summary>
+        ///     Get the generated resource model type (derived from <see cref="KubeResourceV1"/>) for the specified kind and API version.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <returns>
+        ///     The model type, or <c>null</c> if there is no generated model type for the specified kind and API version.
+        /// </returns>
+        static Type GetGeneratedResourceType(string kind, string apiVersion)
+        {
+            switch (kind)
+            {
+                case "APIService":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apiregistration.k8s.io/v1": return typeof(APIServiceV1);
+                        case "apiregistration.k8s.io/v1beta1": return typeof(APIServiceV1Beta1);
+                    }
+
+                    break;
+                }
+                case "Binding":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(BindingV1);
+                    }
+
+                    break;
+                }
+                case "CSIDriver":
+                {
+                    switch (apiVersion)
+                    {
+                        case "storage.k8s.io/v1": return typeof(CSIDriverV1);
+                    }
+
+                    break;
+                }
+                case "CSINode":
+                {
+                    switch (apiVersion)
+                    {
+                        case "storage.k8s.io/v1": return typeof(CSINodeV1);
+                    }
+
+                    break;
+                }
+                case "CSIStorageCapacity":
+                {
+                    switch (apiVersion)
+                    {
+                        case "storage.k8s.io/v1": return typeof(CSIStorageCapacityV1);
+                    }
+
+                    break;
+                }
+                case "CertificateSigningRequest":
+                {
+                    switch (apiVersion)
+                    {
+                        case "certificates.k8s.io/v1": return typeof(CertificateSigningRequestV1);
+                        case "certificates.k8s.io/v1beta1": return typeof(CertificateSigningRequestV1Beta1);
+                    }
+
+                    break;
+                }
+                case "ClusterRole":
+                {
+                    switch (apiVersion)
+                    {
+                        case "rbac.authorization.k8s.io/v1": return typeof(ClusterRoleV1);
+                        case "rbac.authorization.k8s.io/v1alpha1": return typeof(ClusterRoleV1Alpha1);
+                        case "rbac.authorization.k8s.io/v1beta1": return typeof(ClusterRoleV1Beta1);
+                    }
+
+                    break;
+                }
+                case "ClusterRoleBinding":
+                {
+                    switch (apiVersion)
+                    {
+                        case "rbac.authorization.k8s.io/v1": return typeof(ClusterRoleBindingV1);
+                        case "rbac.authorization.k8s.io/v1alpha1": return typeof(ClusterRoleBindingV1Alpha1);
+                        case "rbac.authorization.k8s.io/v1beta1": return typeof(ClusterRoleBindingV1Beta1);
+                    }
+
+                    break;
+                }
+                case "ClusterTrustBundle":
+                {
+                    switch (apiVersion)
+                    {
+                        case "certificates.k8s.io/v1alpha1": return typeof(ClusterTrustBundleV1Alpha1);
+                    }
+
+                    break;
+                }
+                case "ComponentStatus":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(ComponentStatusV1);
+                    }
+
+                    break;
+                }
+                case "ConfigMap":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(ConfigMapV1);
+                    }
+
+                    break;
+                }
+                case "ControllerRevision":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apps/v1": return typeof(ControllerRevisionV1);
+                        case "apps/v1beta1": return typeof(ControllerRevisionV1Beta1);
+                        case "apps/v1beta2": return typeof(ControllerRevisionV1Beta2);
+                    }
+
+                    break;
+                }
+                case "CronJob":
+                {
+                    switch (apiVersion)
+                    {
+                        case "batch/v1": return typeof(CronJobV1);
+                        case "batch/v1beta1": return typeof(CronJobV1Beta1);
+                        case "batch/v2alpha1": return typeof(CronJobV2Alpha1);
+                    }
+
+                    break;
+                }
+                case "CustomResourceDefinition":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apiextensions.k8s.io/v1": return typeof(CustomResourceDefinitionV1);
+                        case "apiextensions.k8s.io/v1beta1": return typeof(CustomResourceDefinitionV1Beta1);
+                    }
+
+                    break;
+                }
+                case "DaemonSet":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apps/v1": return typeof(DaemonSetV1);
+                        case "apps/v1beta2": return typeof(DaemonSetV1Beta2);
+                        case "extensions/v1beta1": return typeof(DaemonSetV1Beta1);
+                    }
+
+                    break;
+                }
+                case "Deployment":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apps/v1": return typeof(DeploymentV1);
+                        case "apps/v1beta1": return typeof(DeploymentV1Beta1);
+                        case "apps/v1beta2": return typeof(DeploymentV1Beta2);
+                    }
+
+                    break;
+                }
+                case "DeviceClass":
+                {
+                    switch (apiVersion)
+                    {
+                        case "resource.k8s.io/v1alpha3": return typeof(DeviceClassV1Alpha3);
+                    }
+
+                    break;
+                }
+                case "EndpointSlice":
+                {
+                    switch (apiVersion)
+                    {
+                        case "discovery.k8s.io/v1": return typeof(EndpointSliceV1);
+                    }
+
+                    break;
+                }
+                case "Endpoints":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(EndpointsV1);
+                    }
+
+                    break;
+                }
+                case "Event":
+                {
+                    switch (apiVersion)
+                    {
+                        case "events.k8s.io/v1beta1": return typeof(EventV1Beta1);
+                        case "v1": return typeof(EventV1);
+                    }
+
+                    break;
+                }
+                case "Eviction":
+                {
+                    switch (apiVersion)
+                    {
+                        case "policy/v1": return typeof(EvictionV1);
+                        case "policy/v1beta1": return typeof(EvictionV1Beta1);
+                    }
+
+                    break;
+                }
+                case "FlowSchema":
+                {
+                    switch (apiVersion)
+                    {
+                        case "flowcontrol.apiserver.k8s.io/v1": return typeof(FlowSchemaV1);
+                        case "flowcontrol.apiserver.k8s.io/v1beta3": return typeof(FlowSchemaV1Beta3);
+                    }
+
+                    break;
+                }
+                case "HorizontalPodAutoscaler":
+                {
+                    switch (apiVersion)
+                    {
+                        case "autoscaling/v1": return typeof(HorizontalPodAutoscalerV1);
+                        case "autoscaling/v2": return typeof(HorizontalPodAutoscalerV2);
+                        case "autoscaling/v2beta1": return typeof(HorizontalPodAutoscalerV2Beta1);
+                    }
+
+                    break;
+                }
+                case "IPAddress":
+                {
+                    switch (apiVersion)
+                    {
+                        case "networking.k8s.io/v1beta1": return typeof(IPAddressV1Beta1);
+                    }
+
+                    break;
+                }
+                case "Ingress":
+                {
+                    switch (apiVersion)
+                    {
+                        case "extensions/v1beta1": return typeof(IngressV1Beta1);
+                        case "networking.k8s.io/v1": return typeof(IngressV1);
+                    }
+
+                    break;
+                }
+                case "IngressClass":
+                {
+                    switch (apiVersion)
+                    {
+                        case "networking.k8s.io/v1": return typeof(IngressClassV1);
+                    }
+
+                    break;
+                }
+                case "InitializerConfiguration":
+                {
+                    switch (apiVersion)
+                    {
+                        case "admissionregistration.k8s.io/v1alpha1": return typeof(InitializerConfigurationV1Alpha1);
+                    }
+
+                    break;
+                }
+                case "Job":
+                {
+                    switch (apiVersion)
+                    {
+                        case "batch/v1": return typeof(JobV1);
+                    }
+
+                    break;
+                }
+                case "Lease":
+                {
+                    switch (apiVersion)
+                    {
+                        case "coordination.k8s.io/v1": return typeof(LeaseV1);
+                    }
+
+                    break;
+                }
+                case "LeaseCandidate":
+                {
+                    switch (apiVersion)
+                    {
+                        case "coordination.k8s.io/v1alpha1": return typeof(LeaseCandidateV1Alpha1);
+                    }
+
+                    break;
+                }
+                case "LimitRange":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(LimitRangeV1);
+                    }
+
+                    break;
+                }
+                case "LocalSubjectAccessReview":
+                {
+                    switch (apiVersion)
+                    {
+                        case "authorization.k8s.io/v1": return typeof(LocalSubjectAccessReviewV1);
+                        case "authorization.k8s.io/v1beta1": return typeof(LocalSubjectAccessReviewV1Beta1);
+                    }
+
+                    break;
+                }
+                case "MutatingWebhookConfiguration":
+                {
+                    switch (apiVersion)
+                    {
+                        case "admissionregistration.k8s.io/v1": return typeof(MutatingWebhookConfigurationV1);
+                        case "admissionregistration.k8s.io/v1beta1": return typeof(MutatingWebhookConfigurationV1Beta1);
+                    }
+
+                    break;
+                }
+                case "Namespace":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(NamespaceV1);
+                    }
+
+                    break;
+                }
+                case "NetworkPolicy":
+                {
+                    switch (apiVersion)
+                    {
+                        case "networking.k8s.io/v1": return typeof(NetworkPolicyV1);
+                    }
+
+                    break;
+                }
+                case "Node":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(NodeV1);
+                    }
+
+                    break;
+                }
+                case "PersistentVolume":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(PersistentVolumeV1);
+                    }
+
+                    break;
+                }
+                case "PersistentVolumeClaim":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(PersistentVolumeClaimV1);
+                    }
+
+                    break;
+                }
+                case "Pod":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(PodV1);
+                    }
+
+                    break;
+                }
+                case "PodDisruptionBudget":
+                {
+                    switch (apiVersion)
+                    {
+                        case "policy/v1": return typeof(PodDisruptionBudgetV1);
+                        case "policy/v1beta1": return typeof(PodDisruptionBudgetV1Beta1);
+                    }
+
+                    break;
+                }
+                case "PodPreset":
+                {
+                    switch (apiVersion)
+                    {
+                        case "settings.k8s.io/v1alpha1": return typeof(PodPresetV1Alpha1);
+                    }
+
+                    break;
+                }
+                case "PodSchedulingContext":
+                {
+                    switch (apiVersion)
+                    {
+                        case "resource.k8s.io/v1alpha3": return typeof(PodSchedulingContextV1Alpha3);
+                    }
+
+                    break;
+                }
+                case "PodSecurityPolicy":
+                {
+                    switch (apiVersion)
+                    {
+                        case "policy/v1beta1": return typeof(PodSecurityPolicyV1Beta1);
+                    }
+
+                    break;
+                }
+                case "PodTemplate":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(PodTemplateV1);
+                    }
+
+                    break;
+                }
+                case "PriorityClass":
+                {
+                    switch (apiVersion)
+                    {
+                        case "scheduling.k8s.io/v1": return typeof(PriorityClassV1);
+                        case "scheduling.k8s.io/v1alpha1": return typeof(PriorityClassV1Alpha1);
+                        case "scheduling.k8s.io/v1beta1": return typeof(PriorityClassV1Beta1);
+                    }
+
+                    break;
+                }
+                case "PriorityLevelConfiguration":
+                {
+                    switch (apiVersion)
+                    {
+                        case "flowcontrol.apiserver.k8s.io/v1": return typeof(PriorityLevelConfigurationV1);
+                        case "flowcontrol.apiserver.k8s.io/v1beta3": return typeof(PriorityLevelConfigurationV1Beta3);
+                    }
+
+                    break;
+                }
+                case "ReplicaSet":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apps/v1": return typeof(ReplicaSetV1);
+                        case "apps/v1beta2": return typeof(ReplicaSetV1Beta2);
+                    }
+
+                    break;
+                }
+                case "ReplicationController":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(ReplicationControllerV1);
+                    }
+
+                    break;
+                }
+                case "ResourceClaim":
+                {
+                    switch (apiVersion)
+                    {
+                        case "resource.k8s.io/v1alpha3": return typeof(ResourceClaimV1Alpha3);
+                    }
+
+                    break;
+                }
+                case "ResourceClaimTemplate":
+                {
+                    switch (apiVersion)
+                    {
+                        case "resource.k8s.io/v1alpha3": return typeof(ResourceClaimTemplateV1Alpha3);
+                    }
+
+                    break;
+                }
+                case "ResourceQuota":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(ResourceQuotaV1);
+                    }
+
+                    break;
+                }
+                case "ResourceSlice":
+                {
+                    switch (apiVersion)
+                    {
+                        case "resource.k8s.io/v1alpha3": return typeof(ResourceSliceV1Alpha3);
+                    }
+
+                    break;
+                }
+                case "Role":
+                {
+                    switch (apiVersion)
+                    {
+                        case "rbac.authorization.k8s.io/v1": return typeof(RoleV1);
+                        case "rbac.authorization.k8s.io/v1alpha1": return typeof(RoleV1Alpha1);
+                        case "rbac.authorization.k8s.io/v1beta1": return typeof(RoleV1Beta1);
+                    }
+
+                    break;
+                }
+                case "RoleBinding":
+                {
+                    switch (apiVersion)
+                    {
+                        case "rbac.authorization.k8s.io/v1": return typeof(RoleBindingV1);
+                        case "rbac.authorization.k8s.io/v1alpha1": return typeof(RoleBindingV1Alpha1);
+                        case "rbac.authorization.k8s.io/v1beta1": return typeof(RoleBindingV1Beta1);
+                    }
+
+                    break;
+                }
+                case "RuntimeClass":
+                {
+                    switch (apiVersion)
+                    {
+                        case "node.k8s.io/v1": return typeof(RuntimeClassV1);
+                    }
+
+                    break;
+                }
+                case "Scale":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apps/v1beta1": return typeof(ScaleV1Beta1);
+                        case "apps/v1beta2": return typeof(ScaleV1Beta2);
+                        case "autoscaling/v1": return typeof(ScaleV1);
+                    }
+
+                    break;
+                }
+                case "Secret":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(SecretV1);
+                    }
+
+                    break;
+                }
+                case "SelfSubjectAccessReview":
+                {
+                    switch (apiVersion)
+                    {
+                        case "authorization.k8s.io/v1": return typeof(SelfSubjectAccessReviewV1);
+                        case "authorization.k8s.io/v1beta1": return typeof(SelfSubjectAccessReviewV1Beta1);
+                    }
+
+                    break;
+                }
+                case "SelfSubjectReview":
+                {
+                    switch (apiVersion)
+                    {
+                        case "authentication.k8s.io/v1": return typeof(SelfSubjectReviewV1);
+                        case "authentication.k8s.io/v1alpha1": return typeof(SelfSubjectReviewV1Alpha1);
+                        case "authentication.k8s.io/v1beta1": return typeof(SelfSubjectReviewV1Beta1);
+                    }
+
+                    break;
+                }
+                case "SelfSubjectRulesReview":
+                {
+                    switch (apiVersion)
+                    {
+                        case "authorization.k8s.io/v1": return typeof(SelfSubjectRulesReviewV1);
+                        case "authorization.k8s.io/v1beta1": return typeof(SelfSubjectRulesReviewV1Beta1);
+                    }
+
+                    break;
+                }
+                case "Service":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(ServiceV1);
+                    }
+
+                    break;
+                }
+                case "ServiceAccount":
+                {
+                    switch (apiVersion)
+                    {
+                        case "v1": return typeof(ServiceAccountV1);
+                    }
+
+                    break;
+                }
+                case "ServiceCIDR":
+                {
+                    switch (apiVersion)
+                    {
+                        case "networking.k8s.io/v1beta1": return typeof(ServiceCIDRV1Beta1);
+                    }
+
+                    break;
+                }
+                case "StatefulSet":
+                {
+                    switch (apiVersion)
+                    {
+                        case "apps/v1": return typeof(StatefulSetV1);
+                        case "apps/v1beta1": return typeof(StatefulSetV1Beta1);
+                        case "apps/v1beta2": return typeof(StatefulSetV1Beta2);
+                    }
+
+                    break;
+                }
+                case "StorageClass":
+                {
+                    switch (apiVersion)
+                    {
+                        case "storage.k8s.io/v1": return typeof(StorageClassV1);
+                        case "storage.k8s.io/v1beta1": return typeof(StorageClassV1Beta1);
+                    }
+
+                    break;
+                }
+                case "StorageVersion":
+                {
+                    switch (apiVersion)
+                    {
+                        case "internal.apiserver.k8s.io/v1alpha1": return typeof(StorageVersionV1Alpha1);
+                    }
+
+                    break;
+                }
+                case "StorageVersionMigration":
+                {
+                    switch (apiVersion)
+                    {
+                        case "storagemigration.k8s.io/v1alpha1": return typeof(StorageVersionMigrationV1Alpha1);
+                    }
+
+                    break;
+                }
+                case "SubjectAccessReview":
+                {
+                    switch (apiVersion)
+                    {
+                        case "authorization.k8s.io/v1": return typeof(SubjectAccessReviewV1);
+                        case "authorization.k8s.io/v1beta1": return typeof(SubjectAccessReviewV1Beta1);
+                    }
+
+                    break;
+                }
+                case "TokenReview":
+                {
+                    switch (apiVersion)
+                    {
+                        case "authentication.k8s.io/v1": return typeof(TokenReviewV1);
+                        case "authentication.k8s.io/v1beta1": return typeof(TokenReviewV1Beta1);
+                    }
+
+                    break;
+                }
+                case "ValidatingAdmissionPolicy":
+                {
+                    switch (apiVersion)
+                    {
+                        case "admissionregistration.k8s.io/v1": return typeof(ValidatingAdmissionPolicyV1);
+                        case "admissionregistration.k8s.io/v1alpha1": return typeof(ValidatingAdmissionPolicyV1Alpha1);
+                        case "admissionregistration.k8s.io/v1beta1": return typeof(ValidatingAdmissionPolicyV1Beta1);
+                    }
+
+                    break;
+                }
+                case "ValidatingAdmissionPolicyBinding":
+                {
+                    switch (apiVersion)
+                    {
+                        case "admissionregistration.k8s.io/v1": return typeof(ValidatingAdmissionPolicyBindingV1);
+                        case "admissionregistration.k8s.io/v1alpha1": return typeof(ValidatingAdmissionPolicyBindingV1Alpha1);
+                        case "admissionregistration.k8s.io/v1beta1": return typeof(ValidatingAdmissionPolicyBindingV1Beta1);
+                    }
+
+                    break;
+                }
+                case "ValidatingWebhookConfiguration":
+                {
+                    switch (apiVersion)
+                    {
+                        case "admissionregistration.k8s.io/v1": return typeof(ValidatingWebhookConfigurationV1);
+                        case "admissionregistration.k8s.io/v1beta1": return typeof(ValidatingWebhookConfigurationV1Beta1);
+                    }
+
+                    break;
+                }
+                case "VolumeAttachment":
+                {
+                    switch (apiVersion)
+                    {
+                        case "storage.k8s.io/v1": return typeof(VolumeAttachmentV1);
+                        case "storage.k8s.io/v1alpha1": return typeof(VolumeAttachmentV1Alpha1);
+                        case "storage.k8s.io/v1beta1": return typeof(VolumeAttachmentV1Beta1);
+                    }
+
+                    break;
+                }
+                case "VolumeAttributesClass":
+                {
+                    switch (apiVersion)
+                    {
+                        case "storage.k8s.io/v1alpha1": return typeof(VolumeAttributesClassV1Alpha1);
+                        case "storage.k8s.io/v1beta1": return typeof(VolumeAttributesClassV1Beta1);
+                    }
+
+                    break;
+                }
+            }
+
+            return null;
+        }
+    }
+}
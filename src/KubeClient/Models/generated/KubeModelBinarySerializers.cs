@@ -0,0 +1,10795 @@
+using System;
+using System.IO;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     Generated binary serialisers for model types that are commonly watched (and cached in local snapshots).
+    /// </summary>
+    public static partial class KubeModelBinarySerializers
+    {
+        /// <summary>
+        ///     Generated binary serialisers, with their model types.
+        /// </summary>
+        static readonly (Type modelType, KubeModelBinarySerializer serializer)[] GeneratedSerializers =
+        {
+            (typeof(AWSElasticBlockStoreVolumeSourceV1), AWSElasticBlockStoreVolumeSourceV1BinarySerializer.Instance),
+            (typeof(AffinityV1), AffinityV1BinarySerializer.Instance),
+            (typeof(AppArmorProfileV1), AppArmorProfileV1BinarySerializer.Instance),
+            (typeof(AttachedVolumeV1), AttachedVolumeV1BinarySerializer.Instance),
+            (typeof(AzureDiskVolumeSourceV1), AzureDiskVolumeSourceV1BinarySerializer.Instance),
+            (typeof(AzureFilePersistentVolumeSourceV1), AzureFilePersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(AzureFileVolumeSourceV1), AzureFileVolumeSourceV1BinarySerializer.Instance),
+            (typeof(CSIPersistentVolumeSourceV1), CSIPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(CSIVolumeSourceV1), CSIVolumeSourceV1BinarySerializer.Instance),
+            (typeof(CapabilitiesV1), CapabilitiesV1BinarySerializer.Instance),
+            (typeof(CephFSPersistentVolumeSourceV1), CephFSPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(CephFSVolumeSourceV1), CephFSVolumeSourceV1BinarySerializer.Instance),
+            (typeof(CinderPersistentVolumeSourceV1), CinderPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(CinderVolumeSourceV1), CinderVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ClientIPConfigV1), ClientIPConfigV1BinarySerializer.Instance),
+            (typeof(ClusterTrustBundleProjectionV1), ClusterTrustBundleProjectionV1BinarySerializer.Instance),
+            (typeof(ConditionV1), ConditionV1BinarySerializer.Instance),
+            (typeof(ConfigMapEnvSourceV1), ConfigMapEnvSourceV1BinarySerializer.Instance),
+            (typeof(ConfigMapKeySelectorV1), ConfigMapKeySelectorV1BinarySerializer.Instance),
+            (typeof(ConfigMapNodeConfigSourceV1), ConfigMapNodeConfigSourceV1BinarySerializer.Instance),
+            (typeof(ConfigMapProjectionV1), ConfigMapProjectionV1BinarySerializer.Instance),
+            (typeof(ConfigMapV1), ConfigMapV1BinarySerializer.Instance),
+            (typeof(ConfigMapVolumeSourceV1), ConfigMapVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ContainerImageV1), ContainerImageV1BinarySerializer.Instance),
+            (typeof(ContainerPortV1), ContainerPortV1BinarySerializer.Instance),
+            (typeof(ContainerResizePolicyV1), ContainerResizePolicyV1BinarySerializer.Instance),
+            (typeof(ContainerStateRunningV1), ContainerStateRunningV1BinarySerializer.Instance),
+            (typeof(ContainerStateTerminatedV1), ContainerStateTerminatedV1BinarySerializer.Instance),
+            (typeof(ContainerStateV1), ContainerStateV1BinarySerializer.Instance),
+            (typeof(ContainerStateWaitingV1), ContainerStateWaitingV1BinarySerializer.Instance),
+            (typeof(ContainerStatusV1), ContainerStatusV1BinarySerializer.Instance),
+            (typeof(ContainerUserV1), ContainerUserV1BinarySerializer.Instance),
+            (typeof(ContainerV1), ContainerV1BinarySerializer.Instance),
+            (typeof(CronJobSpecV1), CronJobSpecV1BinarySerializer.Instance),
+            (typeof(CronJobStatusV1), CronJobStatusV1BinarySerializer.Instance),
+            (typeof(CronJobV1), CronJobV1BinarySerializer.Instance),
+            (typeof(DaemonEndpointV1), DaemonEndpointV1BinarySerializer.Instance),
+            (typeof(DaemonSetConditionV1), DaemonSetConditionV1BinarySerializer.Instance),
+            (typeof(DaemonSetSpecV1), DaemonSetSpecV1BinarySerializer.Instance),
+            (typeof(DaemonSetStatusV1), DaemonSetStatusV1BinarySerializer.Instance),
+            (typeof(DaemonSetUpdateStrategyV1), DaemonSetUpdateStrategyV1BinarySerializer.Instance),
+            (typeof(DaemonSetV1), DaemonSetV1BinarySerializer.Instance),
+            (typeof(DeploymentConditionV1), DeploymentConditionV1BinarySerializer.Instance),
+            (typeof(DeploymentSpecV1), DeploymentSpecV1BinarySerializer.Instance),
+            (typeof(DeploymentStatusV1), DeploymentStatusV1BinarySerializer.Instance),
+            (typeof(DeploymentStrategyV1), DeploymentStrategyV1BinarySerializer.Instance),
+            (typeof(DeploymentV1), DeploymentV1BinarySerializer.Instance),
+            (typeof(DownwardAPIProjectionV1), DownwardAPIProjectionV1BinarySerializer.Instance),
+            (typeof(DownwardAPIVolumeFileV1), DownwardAPIVolumeFileV1BinarySerializer.Instance),
+            (typeof(DownwardAPIVolumeSourceV1), DownwardAPIVolumeSourceV1BinarySerializer.Instance),
+            (typeof(EmptyDirVolumeSourceV1), EmptyDirVolumeSourceV1BinarySerializer.Instance),
+            (typeof(EndpointAddressV1), EndpointAddressV1BinarySerializer.Instance),
+            (typeof(EndpointConditionsV1), EndpointConditionsV1BinarySerializer.Instance),
+            (typeof(EndpointHintsV1), EndpointHintsV1BinarySerializer.Instance),
+            (typeof(EndpointPortV1), EndpointPortV1BinarySerializer.Instance),
+            (typeof(EndpointSliceV1), EndpointSliceV1BinarySerializer.Instance),
+            (typeof(EndpointSubsetV1), EndpointSubsetV1BinarySerializer.Instance),
+            (typeof(EndpointV1), EndpointV1BinarySerializer.Instance),
+            (typeof(EndpointsV1), EndpointsV1BinarySerializer.Instance),
+            (typeof(EnvFromSourceV1), EnvFromSourceV1BinarySerializer.Instance),
+            (typeof(EnvVarSourceV1), EnvVarSourceV1BinarySerializer.Instance),
+            (typeof(EnvVarV1), EnvVarV1BinarySerializer.Instance),
+            (typeof(EphemeralContainerV1), EphemeralContainerV1BinarySerializer.Instance),
+            (typeof(EphemeralVolumeSourceV1), EphemeralVolumeSourceV1BinarySerializer.Instance),
+            (typeof(EventSeriesV1), EventSeriesV1BinarySerializer.Instance),
+            (typeof(EventSourceV1), EventSourceV1BinarySerializer.Instance),
+            (typeof(EventV1), EventV1BinarySerializer.Instance),
+            (typeof(ExecActionV1), ExecActionV1BinarySerializer.Instance),
+            (typeof(FCVolumeSourceV1), FCVolumeSourceV1BinarySerializer.Instance),
+            (typeof(FieldsV1), FieldsV1BinarySerializer.Instance),
+            (typeof(FlexPersistentVolumeSourceV1), FlexPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(FlexVolumeSourceV1), FlexVolumeSourceV1BinarySerializer.Instance),
+            (typeof(FlockerVolumeSourceV1), FlockerVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ForZoneV1), ForZoneV1BinarySerializer.Instance),
+            (typeof(GCEPersistentDiskVolumeSourceV1), GCEPersistentDiskVolumeSourceV1BinarySerializer.Instance),
+            (typeof(GRPCActionV1), GRPCActionV1BinarySerializer.Instance),
+            (typeof(GitRepoVolumeSourceV1), GitRepoVolumeSourceV1BinarySerializer.Instance),
+            (typeof(GlusterfsPersistentVolumeSourceV1), GlusterfsPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(GlusterfsVolumeSourceV1), GlusterfsVolumeSourceV1BinarySerializer.Instance),
+            (typeof(HTTPGetActionV1), HTTPGetActionV1BinarySerializer.Instance),
+            (typeof(HTTPHeaderV1), HTTPHeaderV1BinarySerializer.Instance),
+            (typeof(HTTPIngressPathV1), HTTPIngressPathV1BinarySerializer.Instance),
+            (typeof(HTTPIngressRuleValueV1), HTTPIngressRuleValueV1BinarySerializer.Instance),
+            (typeof(HostAliasV1), HostAliasV1BinarySerializer.Instance),
+            (typeof(HostIPV1), HostIPV1BinarySerializer.Instance),
+            (typeof(HostPathVolumeSourceV1), HostPathVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ISCSIPersistentVolumeSourceV1), ISCSIPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ISCSIVolumeSourceV1), ISCSIVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ImageVolumeSourceV1), ImageVolumeSourceV1BinarySerializer.Instance),
+            (typeof(IngressBackendV1), IngressBackendV1BinarySerializer.Instance),
+            (typeof(IngressLoadBalancerIngressV1), IngressLoadBalancerIngressV1BinarySerializer.Instance),
+            (typeof(IngressLoadBalancerStatusV1), IngressLoadBalancerStatusV1BinarySerializer.Instance),
+            (typeof(IngressPortStatusV1), IngressPortStatusV1BinarySerializer.Instance),
+            (typeof(IngressRuleV1), IngressRuleV1BinarySerializer.Instance),
+            (typeof(IngressServiceBackendV1), IngressServiceBackendV1BinarySerializer.Instance),
+            (typeof(IngressSpecV1), IngressSpecV1BinarySerializer.Instance),
+            (typeof(IngressStatusV1), IngressStatusV1BinarySerializer.Instance),
+            (typeof(IngressTLSV1), IngressTLSV1BinarySerializer.Instance),
+            (typeof(IngressV1), IngressV1BinarySerializer.Instance),
+            (typeof(JobConditionV1), JobConditionV1BinarySerializer.Instance),
+            (typeof(JobSpecV1), JobSpecV1BinarySerializer.Instance),
+            (typeof(JobStatusV1), JobStatusV1BinarySerializer.Instance),
+            (typeof(JobTemplateSpecV1), JobTemplateSpecV1BinarySerializer.Instance),
+            (typeof(JobV1), JobV1BinarySerializer.Instance),
+            (typeof(KeyToPathV1), KeyToPathV1BinarySerializer.Instance),
+            (typeof(LabelSelectorRequirementV1), LabelSelectorRequirementV1BinarySerializer.Instance),
+            (typeof(LabelSelectorV1), LabelSelectorV1BinarySerializer.Instance),
+            (typeof(LeaseSpecV1), LeaseSpecV1BinarySerializer.Instance),
+            (typeof(LeaseV1), LeaseV1BinarySerializer.Instance),
+            (typeof(LifecycleHandlerV1), LifecycleHandlerV1BinarySerializer.Instance),
+            (typeof(LifecycleV1), LifecycleV1BinarySerializer.Instance),
+            (typeof(LinuxContainerUserV1), LinuxContainerUserV1BinarySerializer.Instance),
+            (typeof(LoadBalancerIngressV1), LoadBalancerIngressV1BinarySerializer.Instance),
+            (typeof(LoadBalancerStatusV1), LoadBalancerStatusV1BinarySerializer.Instance),
+            (typeof(LocalObjectReferenceV1), LocalObjectReferenceV1BinarySerializer.Instance),
+            (typeof(LocalVolumeSourceV1), LocalVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ManagedFieldsEntryV1), ManagedFieldsEntryV1BinarySerializer.Instance),
+            (typeof(ModifyVolumeStatusV1), ModifyVolumeStatusV1BinarySerializer.Instance),
+            (typeof(NFSVolumeSourceV1), NFSVolumeSourceV1BinarySerializer.Instance),
+            (typeof(NamespaceConditionV1), NamespaceConditionV1BinarySerializer.Instance),
+            (typeof(NamespaceSpecV1), NamespaceSpecV1BinarySerializer.Instance),
+            (typeof(NamespaceStatusV1), NamespaceStatusV1BinarySerializer.Instance),
+            (typeof(NamespaceV1), NamespaceV1BinarySerializer.Instance),
+            (typeof(NodeAddressV1), NodeAddressV1BinarySerializer.Instance),
+            (typeof(NodeAffinityV1), NodeAffinityV1BinarySerializer.Instance),
+            (typeof(NodeConditionV1), NodeConditionV1BinarySerializer.Instance),
+            (typeof(NodeConfigSourceV1), NodeConfigSourceV1BinarySerializer.Instance),
+            (typeof(NodeConfigStatusV1), NodeConfigStatusV1BinarySerializer.Instance),
+            (typeof(NodeDaemonEndpointsV1), NodeDaemonEndpointsV1BinarySerializer.Instance),
+            (typeof(NodeFeaturesV1), NodeFeaturesV1BinarySerializer.Instance),
+            (typeof(NodeRuntimeHandlerFeaturesV1), NodeRuntimeHandlerFeaturesV1BinarySerializer.Instance),
+            (typeof(NodeRuntimeHandlerV1), NodeRuntimeHandlerV1BinarySerializer.Instance),
+            (typeof(NodeSelectorRequirementV1), NodeSelectorRequirementV1BinarySerializer.Instance),
+            (typeof(NodeSelectorTermV1), NodeSelectorTermV1BinarySerializer.Instance),
+            (typeof(NodeSelectorV1), NodeSelectorV1BinarySerializer.Instance),
+            (typeof(NodeSpecV1), NodeSpecV1BinarySerializer.Instance),
+            (typeof(NodeStatusV1), NodeStatusV1BinarySerializer.Instance),
+            (typeof(NodeSystemInfoV1), NodeSystemInfoV1BinarySerializer.Instance),
+            (typeof(NodeV1), NodeV1BinarySerializer.Instance),
+            (typeof(ObjectFieldSelectorV1), ObjectFieldSelectorV1BinarySerializer.Instance),
+            (typeof(ObjectMetaV1), ObjectMetaV1BinarySerializer.Instance),
+            (typeof(ObjectReferenceV1), ObjectReferenceV1BinarySerializer.Instance),
+            (typeof(OwnerReferenceV1), OwnerReferenceV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeClaimConditionV1), PersistentVolumeClaimConditionV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeClaimSpecV1), PersistentVolumeClaimSpecV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeClaimStatusV1), PersistentVolumeClaimStatusV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeClaimTemplateV1), PersistentVolumeClaimTemplateV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeClaimV1), PersistentVolumeClaimV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeClaimVolumeSourceV1), PersistentVolumeClaimVolumeSourceV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeSpecV1), PersistentVolumeSpecV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeStatusV1), PersistentVolumeStatusV1BinarySerializer.Instance),
+            (typeof(PersistentVolumeV1), PersistentVolumeV1BinarySerializer.Instance),
+            (typeof(PhotonPersistentDiskVolumeSourceV1), PhotonPersistentDiskVolumeSourceV1BinarySerializer.Instance),
+            (typeof(PodAffinityTermV1), PodAffinityTermV1BinarySerializer.Instance),
+            (typeof(PodAffinityV1), PodAffinityV1BinarySerializer.Instance),
+            (typeof(PodAntiAffinityV1), PodAntiAffinityV1BinarySerializer.Instance),
+            (typeof(PodConditionV1), PodConditionV1BinarySerializer.Instance),
+            (typeof(PodDNSConfigOptionV1), PodDNSConfigOptionV1BinarySerializer.Instance),
+            (typeof(PodDNSConfigV1), PodDNSConfigV1BinarySerializer.Instance),
+            (typeof(PodFailurePolicyOnExitCodesRequirementV1), PodFailurePolicyOnExitCodesRequirementV1BinarySerializer.Instance),
+            (typeof(PodFailurePolicyOnPodConditionsPatternV1), PodFailurePolicyOnPodConditionsPatternV1BinarySerializer.Instance),
+            (typeof(PodFailurePolicyRuleV1), PodFailurePolicyRuleV1BinarySerializer.Instance),
+            (typeof(PodFailurePolicyV1), PodFailurePolicyV1BinarySerializer.Instance),
+            (typeof(PodIPV1), PodIPV1BinarySerializer.Instance),
+            (typeof(PodOSV1), PodOSV1BinarySerializer.Instance),
+            (typeof(PodReadinessGateV1), PodReadinessGateV1BinarySerializer.Instance),
+            (typeof(PodResourceClaimStatusV1), PodResourceClaimStatusV1BinarySerializer.Instance),
+            (typeof(PodResourceClaimV1), PodResourceClaimV1BinarySerializer.Instance),
+            (typeof(PodSchedulingGateV1), PodSchedulingGateV1BinarySerializer.Instance),
+            (typeof(PodSecurityContextV1), PodSecurityContextV1BinarySerializer.Instance),
+            (typeof(PodSpecV1), PodSpecV1BinarySerializer.Instance),
+            (typeof(PodStatusV1), PodStatusV1BinarySerializer.Instance),
+            (typeof(PodTemplateSpecV1), PodTemplateSpecV1BinarySerializer.Instance),
+            (typeof(PodV1), PodV1BinarySerializer.Instance),
+            (typeof(PortStatusV1), PortStatusV1BinarySerializer.Instance),
+            (typeof(PortworxVolumeSourceV1), PortworxVolumeSourceV1BinarySerializer.Instance),
+            (typeof(PreferredSchedulingTermV1), PreferredSchedulingTermV1BinarySerializer.Instance),
+            (typeof(ProbeV1), ProbeV1BinarySerializer.Instance),
+            (typeof(ProjectedVolumeSourceV1), ProjectedVolumeSourceV1BinarySerializer.Instance),
+            (typeof(QuobyteVolumeSourceV1), QuobyteVolumeSourceV1BinarySerializer.Instance),
+            (typeof(RBDPersistentVolumeSourceV1), RBDPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(RBDVolumeSourceV1), RBDVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ReplicaSetConditionV1), ReplicaSetConditionV1BinarySerializer.Instance),
+            (typeof(ReplicaSetSpecV1), ReplicaSetSpecV1BinarySerializer.Instance),
+            (typeof(ReplicaSetStatusV1), ReplicaSetStatusV1BinarySerializer.Instance),
+            (typeof(ReplicaSetV1), ReplicaSetV1BinarySerializer.Instance),
+            (typeof(ResourceClaimV1), ResourceClaimV1BinarySerializer.Instance),
+            (typeof(ResourceFieldSelectorV1), ResourceFieldSelectorV1BinarySerializer.Instance),
+            (typeof(ResourceHealthV1), ResourceHealthV1BinarySerializer.Instance),
+            (typeof(ResourceRequirementsV1), ResourceRequirementsV1BinarySerializer.Instance),
+            (typeof(ResourceStatusV1), ResourceStatusV1BinarySerializer.Instance),
+            (typeof(RollingUpdateDaemonSetV1), RollingUpdateDaemonSetV1BinarySerializer.Instance),
+            (typeof(RollingUpdateDeploymentV1), RollingUpdateDeploymentV1BinarySerializer.Instance),
+            (typeof(RollingUpdateStatefulSetStrategyV1), RollingUpdateStatefulSetStrategyV1BinarySerializer.Instance),
+            (typeof(SELinuxOptionsV1), SELinuxOptionsV1BinarySerializer.Instance),
+            (typeof(ScaleIOPersistentVolumeSourceV1), ScaleIOPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(ScaleIOVolumeSourceV1), ScaleIOVolumeSourceV1BinarySerializer.Instance),
+            (typeof(SeccompProfileV1), SeccompProfileV1BinarySerializer.Instance),
+            (typeof(SecretEnvSourceV1), SecretEnvSourceV1BinarySerializer.Instance),
+            (typeof(SecretKeySelectorV1), SecretKeySelectorV1BinarySerializer.Instance),
+            (typeof(SecretProjectionV1), SecretProjectionV1BinarySerializer.Instance),
+            (typeof(SecretReferenceV1), SecretReferenceV1BinarySerializer.Instance),
+            (typeof(SecretV1), SecretV1BinarySerializer.Instance),
+            (typeof(SecretVolumeSourceV1), SecretVolumeSourceV1BinarySerializer.Instance),
+            (typeof(SecurityContextV1), SecurityContextV1BinarySerializer.Instance),
+            (typeof(ServiceAccountTokenProjectionV1), ServiceAccountTokenProjectionV1BinarySerializer.Instance),
+            (typeof(ServiceAccountV1), ServiceAccountV1BinarySerializer.Instance),
+            (typeof(ServiceBackendPortV1), ServiceBackendPortV1BinarySerializer.Instance),
+            (typeof(ServicePortV1), ServicePortV1BinarySerializer.Instance),
+            (typeof(ServiceSpecV1), ServiceSpecV1BinarySerializer.Instance),
+            (typeof(ServiceStatusV1), ServiceStatusV1BinarySerializer.Instance),
+            (typeof(ServiceV1), ServiceV1BinarySerializer.Instance),
+            (typeof(SessionAffinityConfigV1), SessionAffinityConfigV1BinarySerializer.Instance),
+            (typeof(SleepActionV1), SleepActionV1BinarySerializer.Instance),
+            (typeof(StatefulSetConditionV1), StatefulSetConditionV1BinarySerializer.Instance),
+            (typeof(StatefulSetOrdinalsV1), StatefulSetOrdinalsV1BinarySerializer.Instance),
+            (typeof(StatefulSetPersistentVolumeClaimRetentionPolicyV1), StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer.Instance),
+            (typeof(StatefulSetSpecV1), StatefulSetSpecV1BinarySerializer.Instance),
+            (typeof(StatefulSetStatusV1), StatefulSetStatusV1BinarySerializer.Instance),
+            (typeof(StatefulSetUpdateStrategyV1), StatefulSetUpdateStrategyV1BinarySerializer.Instance),
+            (typeof(StatefulSetV1), StatefulSetV1BinarySerializer.Instance),
+            (typeof(StorageOSPersistentVolumeSourceV1), StorageOSPersistentVolumeSourceV1BinarySerializer.Instance),
+            (typeof(StorageOSVolumeSourceV1), StorageOSVolumeSourceV1BinarySerializer.Instance),
+            (typeof(SuccessPolicyRuleV1), SuccessPolicyRuleV1BinarySerializer.Instance),
+            (typeof(SuccessPolicyV1), SuccessPolicyV1BinarySerializer.Instance),
+            (typeof(SysctlV1), SysctlV1BinarySerializer.Instance),
+            (typeof(TCPSocketActionV1), TCPSocketActionV1BinarySerializer.Instance),
+            (typeof(TaintV1), TaintV1BinarySerializer.Instance),
+            (typeof(TolerationV1), TolerationV1BinarySerializer.Instance),
+            (typeof(TopologySpreadConstraintV1), TopologySpreadConstraintV1BinarySerializer.Instance),
+            (typeof(TypedLocalObjectReferenceV1), TypedLocalObjectReferenceV1BinarySerializer.Instance),
+            (typeof(TypedObjectReferenceV1), TypedObjectReferenceV1BinarySerializer.Instance),
+            (typeof(UncountedTerminatedPodsV1), UncountedTerminatedPodsV1BinarySerializer.Instance),
+            (typeof(VolumeDeviceV1), VolumeDeviceV1BinarySerializer.Instance),
+            (typeof(VolumeMountStatusV1), VolumeMountStatusV1BinarySerializer.Instance),
+            (typeof(VolumeMountV1), VolumeMountV1BinarySerializer.Instance),
+            (typeof(VolumeNodeAffinityV1), VolumeNodeAffinityV1BinarySerializer.Instance),
+            (typeof(VolumeProjectionV1), VolumeProjectionV1BinarySerializer.Instance),
+            (typeof(VolumeResourceRequirementsV1), VolumeResourceRequirementsV1BinarySerializer.Instance),
+            (typeof(VolumeV1), VolumeV1BinarySerializer.Instance),
+            (typeof(VsphereVirtualDiskVolumeSourceV1), VsphereVirtualDiskVolumeSourceV1BinarySerializer.Instance),
+            (typeof(WeightedPodAffinityTermV1), WeightedPodAffinityTermV1BinarySerializer.Instance),
+            (typeof(WindowsSecurityContextOptionsV1), WindowsSecurityContextOptionsV1BinarySerializer.Instance),
+        };
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="AWSElasticBlockStoreVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class AWSElasticBlockStoreVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<AWSElasticBlockStoreVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AWSElasticBlockStoreVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static AWSElasticBlockStoreVolumeSourceV1BinarySerializer Instance { get; } = new AWSElasticBlockStoreVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="AWSElasticBlockStoreVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public AWSElasticBlockStoreVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xF08BAF85AD40DA02UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="AWSElasticBlockStoreVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, AWSElasticBlockStoreVolumeSourceV1 model)
+        {
+            WriteString(writer, model.VolumeID);
+            WriteString(writer, model.FsType);
+            WriteInt32(writer, model.Partition);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="AWSElasticBlockStoreVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, AWSElasticBlockStoreVolumeSourceV1 model)
+        {
+            model.VolumeID = ReadString(reader);
+            model.FsType = ReadString(reader);
+            model.Partition = ReadInt32(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="AffinityV1"/>.
+    /// </summary>
+    public sealed class AffinityV1BinarySerializer
+        : KubeModelBinarySerializer<AffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AffinityV1BinarySerializer"/>.
+        /// </summary>
+        public static AffinityV1BinarySerializer Instance { get; } = new AffinityV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="AffinityV1BinarySerializer"/>.
+        /// </summary>
+        public AffinityV1BinarySerializer()
+            : base(schemaHash: 0xFDD9181B9D6D27CCUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="AffinityV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, AffinityV1 model)
+        {
+            NodeAffinityV1BinarySerializer.Instance.Write(writer, model.NodeAffinity);
+            PodAffinityV1BinarySerializer.Instance.Write(writer, model.PodAffinity);
+            PodAntiAffinityV1BinarySerializer.Instance.Write(writer, model.PodAntiAffinity);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="AffinityV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, AffinityV1 model)
+        {
+            model.NodeAffinity = NodeAffinityV1BinarySerializer.Instance.Read(reader);
+            model.PodAffinity = PodAffinityV1BinarySerializer.Instance.Read(reader);
+            model.PodAntiAffinity = PodAntiAffinityV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="AppArmorProfileV1"/>.
+    /// </summary>
+    public sealed class AppArmorProfileV1BinarySerializer
+        : KubeModelBinarySerializer<AppArmorProfileV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AppArmorProfileV1BinarySerializer"/>.
+        /// </summary>
+        public static AppArmorProfileV1BinarySerializer Instance { get; } = new AppArmorProfileV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="AppArmorProfileV1BinarySerializer"/>.
+        /// </summary>
+        public AppArmorProfileV1BinarySerializer()
+            : base(schemaHash: 0xDC3F71B561CDEC01UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="AppArmorProfileV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, AppArmorProfileV1 model)
+        {
+            WriteString(writer, model.LocalhostProfile);
+            WriteString(writer, model.Type);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="AppArmorProfileV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, AppArmorProfileV1 model)
+        {
+            model.LocalhostProfile = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="AttachedVolumeV1"/>.
+    /// </summary>
+    public sealed class AttachedVolumeV1BinarySerializer
+        : KubeModelBinarySerializer<AttachedVolumeV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AttachedVolumeV1BinarySerializer"/>.
+        /// </summary>
+        public static AttachedVolumeV1BinarySerializer Instance { get; } = new AttachedVolumeV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="AttachedVolumeV1BinarySerializer"/>.
+        /// </summary>
+        public AttachedVolumeV1BinarySerializer()
+            : base(schemaHash: 0xE3DACE5671E8C27FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="AttachedVolumeV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, AttachedVolumeV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.DevicePath);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="AttachedVolumeV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, AttachedVolumeV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.DevicePath = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="AzureDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class AzureDiskVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<AzureDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AzureDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static AzureDiskVolumeSourceV1BinarySerializer Instance { get; } = new AzureDiskVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="AzureDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public AzureDiskVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x9DB6966552FB4A9CUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="AzureDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, AzureDiskVolumeSourceV1 model)
+        {
+            WriteString(writer, model.DiskURI);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.CachingMode);
+            WriteString(writer, model.DiskName);
+            WriteString(writer, model.FsType);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="AzureDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, AzureDiskVolumeSourceV1 model)
+        {
+            model.DiskURI = ReadString(reader);
+            model.Kind = ReadInternedString(reader);
+            model.CachingMode = ReadString(reader);
+            model.DiskName = ReadString(reader);
+            model.FsType = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="AzureFilePersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class AzureFilePersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<AzureFilePersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AzureFilePersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static AzureFilePersistentVolumeSourceV1BinarySerializer Instance { get; } = new AzureFilePersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="AzureFilePersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public AzureFilePersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x479A012C2AD67BB2UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="AzureFilePersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, AzureFilePersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.SecretName);
+            WriteString(writer, model.SecretNamespace);
+            WriteString(writer, model.ShareName);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="AzureFilePersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, AzureFilePersistentVolumeSourceV1 model)
+        {
+            model.SecretName = ReadString(reader);
+            model.SecretNamespace = ReadString(reader);
+            model.ShareName = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="AzureFileVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class AzureFileVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<AzureFileVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AzureFileVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static AzureFileVolumeSourceV1BinarySerializer Instance { get; } = new AzureFileVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="AzureFileVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public AzureFileVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x70D7A3CC7B881B50UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="AzureFileVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, AzureFileVolumeSourceV1 model)
+        {
+            WriteString(writer, model.SecretName);
+            WriteString(writer, model.ShareName);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="AzureFileVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, AzureFileVolumeSourceV1 model)
+        {
+            model.SecretName = ReadString(reader);
+            model.ShareName = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CSIPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CSIPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<CSIPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CSIPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static CSIPersistentVolumeSourceV1BinarySerializer Instance { get; } = new CSIPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CSIPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public CSIPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x839C566C83F2305FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CSIPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CSIPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.VolumeHandle);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.ControllerExpandSecretRef);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.ControllerPublishSecretRef);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.NodeExpandSecretRef);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.NodePublishSecretRef);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.NodeStageSecretRef);
+            WriteString(writer, model.Driver);
+            WriteDictionary(writer, model.VolumeAttributes, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CSIPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CSIPersistentVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.VolumeHandle = ReadString(reader);
+            model.ControllerExpandSecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.ControllerPublishSecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.NodeExpandSecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.NodePublishSecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.NodeStageSecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Driver = ReadString(reader);
+            ReadStringDictionary(reader, model.VolumeAttributes);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CSIVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CSIVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<CSIVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CSIVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static CSIVolumeSourceV1BinarySerializer Instance { get; } = new CSIVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CSIVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public CSIVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x80F2F4B0BE77B77EUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CSIVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CSIVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.NodePublishSecretRef);
+            WriteString(writer, model.Driver);
+            WriteDictionary(writer, model.VolumeAttributes, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CSIVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CSIVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.NodePublishSecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Driver = ReadString(reader);
+            ReadStringDictionary(reader, model.VolumeAttributes);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CapabilitiesV1"/>.
+    /// </summary>
+    public sealed class CapabilitiesV1BinarySerializer
+        : KubeModelBinarySerializer<CapabilitiesV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CapabilitiesV1BinarySerializer"/>.
+        /// </summary>
+        public static CapabilitiesV1BinarySerializer Instance { get; } = new CapabilitiesV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CapabilitiesV1BinarySerializer"/>.
+        /// </summary>
+        public CapabilitiesV1BinarySerializer()
+            : base(schemaHash: 0x48CA25546C0ED0ABUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CapabilitiesV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CapabilitiesV1 model)
+        {
+            WriteList(writer, model.Add, WriteString);
+            WriteList(writer, model.Drop, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CapabilitiesV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CapabilitiesV1 model)
+        {
+            ReadStringList(reader, model.Add);
+            ReadStringList(reader, model.Drop);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CephFSPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CephFSPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<CephFSPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CephFSPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static CephFSPersistentVolumeSourceV1BinarySerializer Instance { get; } = new CephFSPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CephFSPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public CephFSPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x73AACCFEAFD759DBUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CephFSPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CephFSPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.SecretFile);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.Path);
+            WriteString(writer, model.User);
+            WriteList(writer, model.Monitors, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CephFSPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CephFSPersistentVolumeSourceV1 model)
+        {
+            model.SecretFile = ReadString(reader);
+            model.SecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Path = ReadString(reader);
+            model.User = ReadString(reader);
+            ReadStringList(reader, model.Monitors);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CephFSVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CephFSVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<CephFSVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CephFSVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static CephFSVolumeSourceV1BinarySerializer Instance { get; } = new CephFSVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CephFSVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public CephFSVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x1AFB726EDFCF90F4UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CephFSVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CephFSVolumeSourceV1 model)
+        {
+            WriteString(writer, model.SecretFile);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.Path);
+            WriteString(writer, model.User);
+            WriteList(writer, model.Monitors, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CephFSVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CephFSVolumeSourceV1 model)
+        {
+            model.SecretFile = ReadString(reader);
+            model.SecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Path = ReadString(reader);
+            model.User = ReadString(reader);
+            ReadStringList(reader, model.Monitors);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CinderPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CinderPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<CinderPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CinderPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static CinderPersistentVolumeSourceV1BinarySerializer Instance { get; } = new CinderPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CinderPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public CinderPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x3173C51A222764CCUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CinderPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CinderPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.VolumeID);
+            WriteString(writer, model.FsType);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CinderPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CinderPersistentVolumeSourceV1 model)
+        {
+            model.VolumeID = ReadString(reader);
+            model.FsType = ReadString(reader);
+            model.SecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CinderVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CinderVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<CinderVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CinderVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static CinderVolumeSourceV1BinarySerializer Instance { get; } = new CinderVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CinderVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public CinderVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x72084C07E264FBE9UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CinderVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CinderVolumeSourceV1 model)
+        {
+            WriteString(writer, model.VolumeID);
+            WriteString(writer, model.FsType);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CinderVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CinderVolumeSourceV1 model)
+        {
+            model.VolumeID = ReadString(reader);
+            model.FsType = ReadString(reader);
+            model.SecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ClientIPConfigV1"/>.
+    /// </summary>
+    public sealed class ClientIPConfigV1BinarySerializer
+        : KubeModelBinarySerializer<ClientIPConfigV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ClientIPConfigV1BinarySerializer"/>.
+        /// </summary>
+        public static ClientIPConfigV1BinarySerializer Instance { get; } = new ClientIPConfigV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ClientIPConfigV1BinarySerializer"/>.
+        /// </summary>
+        public ClientIPConfigV1BinarySerializer()
+            : base(schemaHash: 0x9F765E8E59A47275UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ClientIPConfigV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ClientIPConfigV1 model)
+        {
+            WriteInt32(writer, model.TimeoutSeconds);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ClientIPConfigV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ClientIPConfigV1 model)
+        {
+            model.TimeoutSeconds = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ClusterTrustBundleProjectionV1"/>.
+    /// </summary>
+    public sealed class ClusterTrustBundleProjectionV1BinarySerializer
+        : KubeModelBinarySerializer<ClusterTrustBundleProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ClusterTrustBundleProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public static ClusterTrustBundleProjectionV1BinarySerializer Instance { get; } = new ClusterTrustBundleProjectionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ClusterTrustBundleProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public ClusterTrustBundleProjectionV1BinarySerializer()
+            : base(schemaHash: 0x4902B57CBBCD9CCEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ClusterTrustBundleProjectionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ClusterTrustBundleProjectionV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.SignerName);
+            WriteString(writer, model.Path);
+            WriteBoolean(writer, model.Optional);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.LabelSelector);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ClusterTrustBundleProjectionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ClusterTrustBundleProjectionV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.SignerName = ReadString(reader);
+            model.Path = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+            model.LabelSelector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ConditionV1"/>.
+    /// </summary>
+    public sealed class ConditionV1BinarySerializer
+        : KubeModelBinarySerializer<ConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static ConditionV1BinarySerializer Instance { get; } = new ConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ConditionV1BinarySerializer"/>.
+        /// </summary>
+        public ConditionV1BinarySerializer()
+            : base(schemaHash: 0x391FC9745FE77E64UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteInt64(writer, model.ObservedGeneration);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ConditionV1 model)
+        {
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.ObservedGeneration = ReadInt64(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ConfigMapEnvSourceV1"/>.
+    /// </summary>
+    public sealed class ConfigMapEnvSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ConfigMapEnvSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapEnvSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ConfigMapEnvSourceV1BinarySerializer Instance { get; } = new ConfigMapEnvSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapEnvSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ConfigMapEnvSourceV1BinarySerializer()
+            : base(schemaHash: 0x1B61C52294742259UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ConfigMapEnvSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ConfigMapEnvSourceV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteBoolean(writer, model.Optional);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ConfigMapEnvSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ConfigMapEnvSourceV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ConfigMapKeySelectorV1"/>.
+    /// </summary>
+    public sealed class ConfigMapKeySelectorV1BinarySerializer
+        : KubeModelBinarySerializer<ConfigMapKeySelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapKeySelectorV1BinarySerializer"/>.
+        /// </summary>
+        public static ConfigMapKeySelectorV1BinarySerializer Instance { get; } = new ConfigMapKeySelectorV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapKeySelectorV1BinarySerializer"/>.
+        /// </summary>
+        public ConfigMapKeySelectorV1BinarySerializer()
+            : base(schemaHash: 0xC66BF9C23F0E6395UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ConfigMapKeySelectorV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ConfigMapKeySelectorV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteBoolean(writer, model.Optional);
+            WriteString(writer, model.Key);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ConfigMapKeySelectorV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ConfigMapKeySelectorV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+            model.Key = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ConfigMapNodeConfigSourceV1"/>.
+    /// </summary>
+    public sealed class ConfigMapNodeConfigSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ConfigMapNodeConfigSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapNodeConfigSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ConfigMapNodeConfigSourceV1BinarySerializer Instance { get; } = new ConfigMapNodeConfigSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapNodeConfigSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ConfigMapNodeConfigSourceV1BinarySerializer()
+            : base(schemaHash: 0x25F3978CA730CF0AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ConfigMapNodeConfigSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ConfigMapNodeConfigSourceV1 model)
+        {
+            WriteString(writer, model.Uid);
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Namespace);
+            WriteString(writer, model.ResourceVersion);
+            WriteString(writer, model.KubeletConfigKey);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ConfigMapNodeConfigSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ConfigMapNodeConfigSourceV1 model)
+        {
+            model.Uid = ReadString(reader);
+            model.Name = ReadString(reader);
+            model.Namespace = ReadInternedString(reader);
+            model.ResourceVersion = ReadString(reader);
+            model.KubeletConfigKey = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ConfigMapProjectionV1"/>.
+    /// </summary>
+    public sealed class ConfigMapProjectionV1BinarySerializer
+        : KubeModelBinarySerializer<ConfigMapProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public static ConfigMapProjectionV1BinarySerializer Instance { get; } = new ConfigMapProjectionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public ConfigMapProjectionV1BinarySerializer()
+            : base(schemaHash: 0xA166FCFABA2CC0BEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ConfigMapProjectionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ConfigMapProjectionV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteBoolean(writer, model.Optional);
+            WriteList(writer, model.Items, KeyToPathV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ConfigMapProjectionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ConfigMapProjectionV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+            ReadList(reader, model.Items, KeyToPathV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ConfigMapV1"/>.
+    /// </summary>
+    public sealed class ConfigMapV1BinarySerializer
+        : KubeModelBinarySerializer<ConfigMapV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapV1BinarySerializer"/>.
+        /// </summary>
+        public static ConfigMapV1BinarySerializer Instance { get; } = new ConfigMapV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapV1BinarySerializer"/>.
+        /// </summary>
+        public ConfigMapV1BinarySerializer()
+            : base(schemaHash: 0x2C8E620CEABF215FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ConfigMapV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ConfigMapV1 model)
+        {
+            WriteDictionary(writer, model.BinaryData, WriteString);
+            WriteDictionary(writer, model.Data, WriteString);
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            WriteString(writer, model.Kind);
+            WriteBoolean(writer, model.Immutable);
+            WriteString(writer, model.ApiVersion);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ConfigMapV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ConfigMapV1 model)
+        {
+            ReadStringDictionary(reader, model.BinaryData);
+            ReadStringDictionary(reader, model.Data);
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.Immutable = ReadBoolean(reader);
+            model.ApiVersion = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ConfigMapVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ConfigMapVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ConfigMapVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ConfigMapVolumeSourceV1BinarySerializer Instance { get; } = new ConfigMapVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ConfigMapVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x76D0CE013D81839AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ConfigMapVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ConfigMapVolumeSourceV1 model)
+        {
+            WriteInt32(writer, model.DefaultMode);
+            WriteString(writer, model.Name);
+            WriteBoolean(writer, model.Optional);
+            WriteList(writer, model.Items, KeyToPathV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ConfigMapVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ConfigMapVolumeSourceV1 model)
+        {
+            model.DefaultMode = ReadInt32(reader);
+            model.Name = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+            ReadList(reader, model.Items, KeyToPathV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerImageV1"/>.
+    /// </summary>
+    public sealed class ContainerImageV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerImageV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerImageV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerImageV1BinarySerializer Instance { get; } = new ContainerImageV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerImageV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerImageV1BinarySerializer()
+            : base(schemaHash: 0x498C9A13798D2B69UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerImageV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerImageV1 model)
+        {
+            WriteList(writer, model.Names, WriteString);
+            WriteInt64(writer, model.SizeBytes);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerImageV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerImageV1 model)
+        {
+            ReadStringList(reader, model.Names);
+            model.SizeBytes = ReadInt64(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerPortV1"/>.
+    /// </summary>
+    public sealed class ContainerPortV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerPortV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerPortV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerPortV1BinarySerializer Instance { get; } = new ContainerPortV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerPortV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerPortV1BinarySerializer()
+            : base(schemaHash: 0x45667CC09FCEF6AEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerPortV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerPortV1 model)
+        {
+            WriteString(writer, model.HostIP);
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Protocol);
+            WriteInt32(writer, model.ContainerPort);
+            WriteInt32(writer, model.HostPort);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerPortV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerPortV1 model)
+        {
+            model.HostIP = ReadInternedString(reader);
+            model.Name = ReadString(reader);
+            model.Protocol = ReadInternedString(reader);
+            model.ContainerPort = ReadInt32(reader).GetValueOrDefault();
+            model.HostPort = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerResizePolicyV1"/>.
+    /// </summary>
+    public sealed class ContainerResizePolicyV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerResizePolicyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerResizePolicyV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerResizePolicyV1BinarySerializer Instance { get; } = new ContainerResizePolicyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerResizePolicyV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerResizePolicyV1BinarySerializer()
+            : base(schemaHash: 0x0C221F6A8951B9A7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerResizePolicyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerResizePolicyV1 model)
+        {
+            WriteString(writer, model.ResourceName);
+            WriteString(writer, model.RestartPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerResizePolicyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerResizePolicyV1 model)
+        {
+            model.ResourceName = ReadString(reader);
+            model.RestartPolicy = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerStateRunningV1"/>.
+    /// </summary>
+    public sealed class ContainerStateRunningV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerStateRunningV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateRunningV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerStateRunningV1BinarySerializer Instance { get; } = new ContainerStateRunningV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateRunningV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerStateRunningV1BinarySerializer()
+            : base(schemaHash: 0x19F46DF452E60D2AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerStateRunningV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerStateRunningV1 model)
+        {
+            WriteDateTime(writer, model.StartedAt);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerStateRunningV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerStateRunningV1 model)
+        {
+            model.StartedAt = ReadDateTime(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerStateTerminatedV1"/>.
+    /// </summary>
+    public sealed class ContainerStateTerminatedV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerStateTerminatedV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateTerminatedV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerStateTerminatedV1BinarySerializer Instance { get; } = new ContainerStateTerminatedV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateTerminatedV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerStateTerminatedV1BinarySerializer()
+            : base(schemaHash: 0x08A09B59BFBFD333UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerStateTerminatedV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerStateTerminatedV1 model)
+        {
+            WriteString(writer, model.ContainerID);
+            WriteInt32(writer, model.ExitCode);
+            WriteString(writer, model.Message);
+            WriteInt32(writer, model.Signal);
+            WriteString(writer, model.Reason);
+            WriteDateTime(writer, model.FinishedAt);
+            WriteDateTime(writer, model.StartedAt);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerStateTerminatedV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerStateTerminatedV1 model)
+        {
+            model.ContainerID = ReadString(reader);
+            model.ExitCode = ReadInt32(reader).GetValueOrDefault();
+            model.Message = ReadString(reader);
+            model.Signal = ReadInt32(reader);
+            model.Reason = ReadInternedString(reader);
+            model.FinishedAt = ReadDateTime(reader);
+            model.StartedAt = ReadDateTime(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerStateV1"/>.
+    /// </summary>
+    public sealed class ContainerStateV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerStateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerStateV1BinarySerializer Instance { get; } = new ContainerStateV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerStateV1BinarySerializer()
+            : base(schemaHash: 0xA769F20808D90429UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerStateV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerStateV1 model)
+        {
+            ContainerStateTerminatedV1BinarySerializer.Instance.Write(writer, model.Terminated);
+            ContainerStateRunningV1BinarySerializer.Instance.Write(writer, model.Running);
+            ContainerStateWaitingV1BinarySerializer.Instance.Write(writer, model.Waiting);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerStateV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerStateV1 model)
+        {
+            model.Terminated = ContainerStateTerminatedV1BinarySerializer.Instance.Read(reader);
+            model.Running = ContainerStateRunningV1BinarySerializer.Instance.Read(reader);
+            model.Waiting = ContainerStateWaitingV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerStateWaitingV1"/>.
+    /// </summary>
+    public sealed class ContainerStateWaitingV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerStateWaitingV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateWaitingV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerStateWaitingV1BinarySerializer Instance { get; } = new ContainerStateWaitingV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateWaitingV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerStateWaitingV1BinarySerializer()
+            : base(schemaHash: 0x6EB1A627D52AB40FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerStateWaitingV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerStateWaitingV1 model)
+        {
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Reason);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerStateWaitingV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerStateWaitingV1 model)
+        {
+            model.Message = ReadString(reader);
+            model.Reason = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerStatusV1"/>.
+    /// </summary>
+    public sealed class ContainerStatusV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerStatusV1BinarySerializer Instance { get; } = new ContainerStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStatusV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerStatusV1BinarySerializer()
+            : base(schemaHash: 0x7760EC6CB9843C0CUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerStatusV1 model)
+        {
+            WriteString(writer, model.ContainerID);
+            WriteString(writer, model.ImageID);
+            WriteBoolean(writer, model.Started);
+            WriteString(writer, model.Image);
+            ContainerStateV1BinarySerializer.Instance.Write(writer, model.LastState);
+            WriteString(writer, model.Name);
+            ContainerStateV1BinarySerializer.Instance.Write(writer, model.State);
+            ContainerUserV1BinarySerializer.Instance.Write(writer, model.User);
+            WriteDictionary(writer, model.AllocatedResources, WriteString);
+            WriteList(writer, model.AllocatedResourcesStatus, ResourceStatusV1BinarySerializer.Instance.Write);
+            ResourceRequirementsV1BinarySerializer.Instance.Write(writer, model.Resources);
+            WriteList(writer, model.VolumeMounts, VolumeMountStatusV1BinarySerializer.Instance.Write);
+            WriteInt32(writer, model.RestartCount);
+            WriteBoolean(writer, model.Ready);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerStatusV1 model)
+        {
+            model.ContainerID = ReadString(reader);
+            model.ImageID = ReadString(reader);
+            model.Started = ReadBoolean(reader);
+            model.Image = ReadInternedString(reader);
+            model.LastState = ContainerStateV1BinarySerializer.Instance.Read(reader);
+            model.Name = ReadString(reader);
+            model.State = ContainerStateV1BinarySerializer.Instance.Read(reader);
+            model.User = ContainerUserV1BinarySerializer.Instance.Read(reader);
+            ReadStringDictionary(reader, model.AllocatedResources);
+            ReadList(reader, model.AllocatedResourcesStatus, ResourceStatusV1BinarySerializer.Instance.Read);
+            model.Resources = ResourceRequirementsV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.VolumeMounts, VolumeMountStatusV1BinarySerializer.Instance.Read);
+            model.RestartCount = ReadInt32(reader).GetValueOrDefault();
+            model.Ready = ReadBoolean(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerUserV1"/>.
+    /// </summary>
+    public sealed class ContainerUserV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerUserV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerUserV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerUserV1BinarySerializer Instance { get; } = new ContainerUserV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerUserV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerUserV1BinarySerializer()
+            : base(schemaHash: 0x0E16BF4243CDF71FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerUserV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerUserV1 model)
+        {
+            LinuxContainerUserV1BinarySerializer.Instance.Write(writer, model.Linux);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerUserV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerUserV1 model)
+        {
+            model.Linux = LinuxContainerUserV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ContainerV1"/>.
+    /// </summary>
+    public sealed class ContainerV1BinarySerializer
+        : KubeModelBinarySerializer<ContainerV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerV1BinarySerializer"/>.
+        /// </summary>
+        public static ContainerV1BinarySerializer Instance { get; } = new ContainerV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerV1BinarySerializer"/>.
+        /// </summary>
+        public ContainerV1BinarySerializer()
+            : base(schemaHash: 0xFB2E46D731E8D1CBUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ContainerV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ContainerV1 model)
+        {
+            WriteList(writer, model.Command, WriteString);
+            WriteString(writer, model.Image);
+            LifecycleV1BinarySerializer.Instance.Write(writer, model.Lifecycle);
+            ProbeV1BinarySerializer.Instance.Write(writer, model.LivenessProbe);
+            WriteString(writer, model.Name);
+            ProbeV1BinarySerializer.Instance.Write(writer, model.ReadinessProbe);
+            ProbeV1BinarySerializer.Instance.Write(writer, model.StartupProbe);
+            WriteBoolean(writer, model.StdinOnce);
+            WriteString(writer, model.TerminationMessagePath);
+            WriteList(writer, model.EnvFrom, EnvFromSourceV1BinarySerializer.Instance.Write);
+            WriteBoolean(writer, model.Stdin);
+            WriteString(writer, model.WorkingDir);
+            WriteList(writer, model.Args, WriteString);
+            WriteList(writer, model.Ports, ContainerPortV1BinarySerializer.Instance.Write);
+            ResourceRequirementsV1BinarySerializer.Instance.Write(writer, model.Resources);
+            WriteList(writer, model.VolumeDevices, VolumeDeviceV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.VolumeMounts, VolumeMountV1BinarySerializer.Instance.Write);
+            SecurityContextV1BinarySerializer.Instance.Write(writer, model.SecurityContext);
+            WriteList(writer, model.Env, EnvVarV1BinarySerializer.Instance.Write);
+            WriteString(writer, model.ImagePullPolicy);
+            WriteList(writer, model.ResizePolicy, ContainerResizePolicyV1BinarySerializer.Instance.Write);
+            WriteString(writer, model.RestartPolicy);
+            WriteString(writer, model.TerminationMessagePolicy);
+            WriteBoolean(writer, model.Tty);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ContainerV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ContainerV1 model)
+        {
+            ReadStringList(reader, model.Command, InternedStrings.Values);
+            model.Image = ReadInternedString(reader);
+            model.Lifecycle = LifecycleV1BinarySerializer.Instance.Read(reader);
+            model.LivenessProbe = ProbeV1BinarySerializer.Instance.Read(reader);
+            model.Name = ReadString(reader);
+            model.ReadinessProbe = ProbeV1BinarySerializer.Instance.Read(reader);
+            model.StartupProbe = ProbeV1BinarySerializer.Instance.Read(reader);
+            model.StdinOnce = ReadBoolean(reader);
+            model.TerminationMessagePath = ReadInternedString(reader);
+            ReadList(reader, model.EnvFrom, EnvFromSourceV1BinarySerializer.Instance.Read);
+            model.Stdin = ReadBoolean(reader);
+            model.WorkingDir = ReadString(reader);
+            ReadStringList(reader, model.Args, InternedStrings.Values);
+            ReadList(reader, model.Ports, ContainerPortV1BinarySerializer.Instance.Read);
+            model.Resources = ResourceRequirementsV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.VolumeDevices, VolumeDeviceV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.VolumeMounts, VolumeMountV1BinarySerializer.Instance.Read);
+            model.SecurityContext = SecurityContextV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.Env, EnvVarV1BinarySerializer.Instance.Read);
+            model.ImagePullPolicy = ReadInternedString(reader);
+            ReadList(reader, model.ResizePolicy, ContainerResizePolicyV1BinarySerializer.Instance.Read);
+            model.RestartPolicy = ReadInternedString(reader);
+            model.TerminationMessagePolicy = ReadInternedString(reader);
+            model.Tty = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CronJobSpecV1"/>.
+    /// </summary>
+    public sealed class CronJobSpecV1BinarySerializer
+        : KubeModelBinarySerializer<CronJobSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CronJobSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static CronJobSpecV1BinarySerializer Instance { get; } = new CronJobSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CronJobSpecV1BinarySerializer"/>.
+        /// </summary>
+        public CronJobSpecV1BinarySerializer()
+            : base(schemaHash: 0x8A1D800C5F88F8D8UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CronJobSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CronJobSpecV1 model)
+        {
+            WriteBoolean(writer, model.Suspend);
+            JobTemplateSpecV1BinarySerializer.Instance.Write(writer, model.JobTemplate);
+            WriteString(writer, model.Schedule);
+            WriteString(writer, model.TimeZone);
+            WriteInt64(writer, model.StartingDeadlineSeconds);
+            WriteInt32(writer, model.FailedJobsHistoryLimit);
+            WriteInt32(writer, model.SuccessfulJobsHistoryLimit);
+            WriteString(writer, model.ConcurrencyPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CronJobSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CronJobSpecV1 model)
+        {
+            model.Suspend = ReadBoolean(reader);
+            model.JobTemplate = JobTemplateSpecV1BinarySerializer.Instance.Read(reader);
+            model.Schedule = ReadString(reader);
+            model.TimeZone = ReadString(reader);
+            model.StartingDeadlineSeconds = ReadInt64(reader);
+            model.FailedJobsHistoryLimit = ReadInt32(reader);
+            model.SuccessfulJobsHistoryLimit = ReadInt32(reader);
+            model.ConcurrencyPolicy = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CronJobStatusV1"/>.
+    /// </summary>
+    public sealed class CronJobStatusV1BinarySerializer
+        : KubeModelBinarySerializer<CronJobStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CronJobStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static CronJobStatusV1BinarySerializer Instance { get; } = new CronJobStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CronJobStatusV1BinarySerializer"/>.
+        /// </summary>
+        public CronJobStatusV1BinarySerializer()
+            : base(schemaHash: 0xA5F3EFC850CC08C1UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CronJobStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CronJobStatusV1 model)
+        {
+            WriteList(writer, model.Active, ObjectReferenceV1BinarySerializer.Instance.Write);
+            WriteDateTime(writer, model.LastScheduleTime);
+            WriteDateTime(writer, model.LastSuccessfulTime);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CronJobStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CronJobStatusV1 model)
+        {
+            ReadList(reader, model.Active, ObjectReferenceV1BinarySerializer.Instance.Read);
+            model.LastScheduleTime = ReadDateTime(reader);
+            model.LastSuccessfulTime = ReadDateTime(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="CronJobV1"/>.
+    /// </summary>
+    public sealed class CronJobV1BinarySerializer
+        : KubeModelBinarySerializer<CronJobV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CronJobV1BinarySerializer"/>.
+        /// </summary>
+        public static CronJobV1BinarySerializer Instance { get; } = new CronJobV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="CronJobV1BinarySerializer"/>.
+        /// </summary>
+        public CronJobV1BinarySerializer()
+            : base(schemaHash: 0x8D98E0729B5766BEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="CronJobV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, CronJobV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            CronJobSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            CronJobStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="CronJobV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, CronJobV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = CronJobSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = CronJobStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DaemonEndpointV1"/>.
+    /// </summary>
+    public sealed class DaemonEndpointV1BinarySerializer
+        : KubeModelBinarySerializer<DaemonEndpointV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DaemonEndpointV1BinarySerializer"/>.
+        /// </summary>
+        public static DaemonEndpointV1BinarySerializer Instance { get; } = new DaemonEndpointV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DaemonEndpointV1BinarySerializer"/>.
+        /// </summary>
+        public DaemonEndpointV1BinarySerializer()
+            : base(schemaHash: 0x6050B57D2CD60C22UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DaemonEndpointV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DaemonEndpointV1 model)
+        {
+            WriteInt32(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DaemonEndpointV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DaemonEndpointV1 model)
+        {
+            model.Port = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DaemonSetConditionV1"/>.
+    /// </summary>
+    public sealed class DaemonSetConditionV1BinarySerializer
+        : KubeModelBinarySerializer<DaemonSetConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DaemonSetConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static DaemonSetConditionV1BinarySerializer Instance { get; } = new DaemonSetConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DaemonSetConditionV1BinarySerializer"/>.
+        /// </summary>
+        public DaemonSetConditionV1BinarySerializer()
+            : base(schemaHash: 0x69C3CF0D08527472UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DaemonSetConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DaemonSetConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DaemonSetConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DaemonSetConditionV1 model)
+        {
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DaemonSetSpecV1"/>.
+    /// </summary>
+    public sealed class DaemonSetSpecV1BinarySerializer
+        : KubeModelBinarySerializer<DaemonSetSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DaemonSetSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static DaemonSetSpecV1BinarySerializer Instance { get; } = new DaemonSetSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DaemonSetSpecV1BinarySerializer"/>.
+        /// </summary>
+        public DaemonSetSpecV1BinarySerializer()
+            : base(schemaHash: 0x155AA7F33981B9B5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DaemonSetSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DaemonSetSpecV1 model)
+        {
+            PodTemplateSpecV1BinarySerializer.Instance.Write(writer, model.Template);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.Selector);
+            WriteInt32(writer, model.MinReadySeconds);
+            WriteInt32(writer, model.RevisionHistoryLimit);
+            DaemonSetUpdateStrategyV1BinarySerializer.Instance.Write(writer, model.UpdateStrategy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DaemonSetSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DaemonSetSpecV1 model)
+        {
+            model.Template = PodTemplateSpecV1BinarySerializer.Instance.Read(reader);
+            model.Selector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            model.MinReadySeconds = ReadInt32(reader);
+            model.RevisionHistoryLimit = ReadInt32(reader);
+            model.UpdateStrategy = DaemonSetUpdateStrategyV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DaemonSetStatusV1"/>.
+    /// </summary>
+    public sealed class DaemonSetStatusV1BinarySerializer
+        : KubeModelBinarySerializer<DaemonSetStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DaemonSetStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static DaemonSetStatusV1BinarySerializer Instance { get; } = new DaemonSetStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DaemonSetStatusV1BinarySerializer"/>.
+        /// </summary>
+        public DaemonSetStatusV1BinarySerializer()
+            : base(schemaHash: 0x1CE0ADB71CDF9F03UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DaemonSetStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DaemonSetStatusV1 model)
+        {
+            WriteInt32(writer, model.CurrentNumberScheduled);
+            WriteInt32(writer, model.DesiredNumberScheduled);
+            WriteInt32(writer, model.NumberMisscheduled);
+            WriteInt32(writer, model.UpdatedNumberScheduled);
+            WriteInt32(writer, model.NumberAvailable);
+            WriteInt32(writer, model.NumberUnavailable);
+            WriteInt64(writer, model.ObservedGeneration);
+            WriteList(writer, model.Conditions, DaemonSetConditionV1BinarySerializer.Instance.Write);
+            WriteInt32(writer, model.CollisionCount);
+            WriteInt32(writer, model.NumberReady);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DaemonSetStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DaemonSetStatusV1 model)
+        {
+            model.CurrentNumberScheduled = ReadInt32(reader).GetValueOrDefault();
+            model.DesiredNumberScheduled = ReadInt32(reader).GetValueOrDefault();
+            model.NumberMisscheduled = ReadInt32(reader).GetValueOrDefault();
+            model.UpdatedNumberScheduled = ReadInt32(reader);
+            model.NumberAvailable = ReadInt32(reader);
+            model.NumberUnavailable = ReadInt32(reader);
+            model.ObservedGeneration = ReadInt64(reader);
+            ReadList(reader, model.Conditions, DaemonSetConditionV1BinarySerializer.Instance.Read);
+            model.CollisionCount = ReadInt32(reader);
+            model.NumberReady = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DaemonSetUpdateStrategyV1"/>.
+    /// </summary>
+    public sealed class DaemonSetUpdateStrategyV1BinarySerializer
+        : KubeModelBinarySerializer<DaemonSetUpdateStrategyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DaemonSetUpdateStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public static DaemonSetUpdateStrategyV1BinarySerializer Instance { get; } = new DaemonSetUpdateStrategyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DaemonSetUpdateStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public DaemonSetUpdateStrategyV1BinarySerializer()
+            : base(schemaHash: 0x5CB1F13A320B80BEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DaemonSetUpdateStrategyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DaemonSetUpdateStrategyV1 model)
+        {
+            RollingUpdateDaemonSetV1BinarySerializer.Instance.Write(writer, model.RollingUpdate);
+            WriteString(writer, model.Type);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DaemonSetUpdateStrategyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DaemonSetUpdateStrategyV1 model)
+        {
+            model.RollingUpdate = RollingUpdateDaemonSetV1BinarySerializer.Instance.Read(reader);
+            model.Type = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DaemonSetV1"/>.
+    /// </summary>
+    public sealed class DaemonSetV1BinarySerializer
+        : KubeModelBinarySerializer<DaemonSetV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DaemonSetV1BinarySerializer"/>.
+        /// </summary>
+        public static DaemonSetV1BinarySerializer Instance { get; } = new DaemonSetV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DaemonSetV1BinarySerializer"/>.
+        /// </summary>
+        public DaemonSetV1BinarySerializer()
+            : base(schemaHash: 0x745FF7AAC8E21489UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DaemonSetV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DaemonSetV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            DaemonSetSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            DaemonSetStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DaemonSetV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DaemonSetV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = DaemonSetSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = DaemonSetStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DeploymentConditionV1"/>.
+    /// </summary>
+    public sealed class DeploymentConditionV1BinarySerializer
+        : KubeModelBinarySerializer<DeploymentConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DeploymentConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static DeploymentConditionV1BinarySerializer Instance { get; } = new DeploymentConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DeploymentConditionV1BinarySerializer"/>.
+        /// </summary>
+        public DeploymentConditionV1BinarySerializer()
+            : base(schemaHash: 0x6439A76C7E935CC3UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DeploymentConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DeploymentConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteDateTime(writer, model.LastUpdateTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DeploymentConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DeploymentConditionV1 model)
+        {
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.LastUpdateTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DeploymentSpecV1"/>.
+    /// </summary>
+    public sealed class DeploymentSpecV1BinarySerializer
+        : KubeModelBinarySerializer<DeploymentSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DeploymentSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static DeploymentSpecV1BinarySerializer Instance { get; } = new DeploymentSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DeploymentSpecV1BinarySerializer"/>.
+        /// </summary>
+        public DeploymentSpecV1BinarySerializer()
+            : base(schemaHash: 0x0A81358606A5E0D2UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DeploymentSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DeploymentSpecV1 model)
+        {
+            WriteBoolean(writer, model.Paused);
+            PodTemplateSpecV1BinarySerializer.Instance.Write(writer, model.Template);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.Selector);
+            WriteInt32(writer, model.MinReadySeconds);
+            WriteInt32(writer, model.ProgressDeadlineSeconds);
+            WriteInt32(writer, model.Replicas);
+            WriteInt32(writer, model.RevisionHistoryLimit);
+            DeploymentStrategyV1BinarySerializer.Instance.Write(writer, model.Strategy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DeploymentSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DeploymentSpecV1 model)
+        {
+            model.Paused = ReadBoolean(reader);
+            model.Template = PodTemplateSpecV1BinarySerializer.Instance.Read(reader);
+            model.Selector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            model.MinReadySeconds = ReadInt32(reader);
+            model.ProgressDeadlineSeconds = ReadInt32(reader);
+            model.Replicas = ReadInt32(reader);
+            model.RevisionHistoryLimit = ReadInt32(reader);
+            model.Strategy = DeploymentStrategyV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DeploymentStatusV1"/>.
+    /// </summary>
+    public sealed class DeploymentStatusV1BinarySerializer
+        : KubeModelBinarySerializer<DeploymentStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DeploymentStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static DeploymentStatusV1BinarySerializer Instance { get; } = new DeploymentStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DeploymentStatusV1BinarySerializer"/>.
+        /// </summary>
+        public DeploymentStatusV1BinarySerializer()
+            : base(schemaHash: 0x0E41DADEED3C4E38UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DeploymentStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DeploymentStatusV1 model)
+        {
+            WriteInt64(writer, model.ObservedGeneration);
+            WriteInt32(writer, model.AvailableReplicas);
+            WriteList(writer, model.Conditions, DeploymentConditionV1BinarySerializer.Instance.Write);
+            WriteInt32(writer, model.ReadyReplicas);
+            WriteInt32(writer, model.Replicas);
+            WriteInt32(writer, model.UnavailableReplicas);
+            WriteInt32(writer, model.UpdatedReplicas);
+            WriteInt32(writer, model.CollisionCount);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DeploymentStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DeploymentStatusV1 model)
+        {
+            model.ObservedGeneration = ReadInt64(reader);
+            model.AvailableReplicas = ReadInt32(reader);
+            ReadList(reader, model.Conditions, DeploymentConditionV1BinarySerializer.Instance.Read);
+            model.ReadyReplicas = ReadInt32(reader);
+            model.Replicas = ReadInt32(reader);
+            model.UnavailableReplicas = ReadInt32(reader);
+            model.UpdatedReplicas = ReadInt32(reader);
+            model.CollisionCount = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DeploymentStrategyV1"/>.
+    /// </summary>
+    public sealed class DeploymentStrategyV1BinarySerializer
+        : KubeModelBinarySerializer<DeploymentStrategyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DeploymentStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public static DeploymentStrategyV1BinarySerializer Instance { get; } = new DeploymentStrategyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DeploymentStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public DeploymentStrategyV1BinarySerializer()
+            : base(schemaHash: 0x3AA6D5CA08A8807AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DeploymentStrategyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DeploymentStrategyV1 model)
+        {
+            RollingUpdateDeploymentV1BinarySerializer.Instance.Write(writer, model.RollingUpdate);
+            WriteString(writer, model.Type);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DeploymentStrategyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DeploymentStrategyV1 model)
+        {
+            model.RollingUpdate = RollingUpdateDeploymentV1BinarySerializer.Instance.Read(reader);
+            model.Type = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DeploymentV1"/>.
+    /// </summary>
+    public sealed class DeploymentV1BinarySerializer
+        : KubeModelBinarySerializer<DeploymentV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DeploymentV1BinarySerializer"/>.
+        /// </summary>
+        public static DeploymentV1BinarySerializer Instance { get; } = new DeploymentV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DeploymentV1BinarySerializer"/>.
+        /// </summary>
+        public DeploymentV1BinarySerializer()
+            : base(schemaHash: 0x4434DBA8E0B84388UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DeploymentV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DeploymentV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            DeploymentSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            DeploymentStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DeploymentV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DeploymentV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = DeploymentSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = DeploymentStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DownwardAPIProjectionV1"/>.
+    /// </summary>
+    public sealed class DownwardAPIProjectionV1BinarySerializer
+        : KubeModelBinarySerializer<DownwardAPIProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DownwardAPIProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public static DownwardAPIProjectionV1BinarySerializer Instance { get; } = new DownwardAPIProjectionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DownwardAPIProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public DownwardAPIProjectionV1BinarySerializer()
+            : base(schemaHash: 0xEA6900B9A3631951UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DownwardAPIProjectionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DownwardAPIProjectionV1 model)
+        {
+            WriteList(writer, model.Items, DownwardAPIVolumeFileV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DownwardAPIProjectionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DownwardAPIProjectionV1 model)
+        {
+            ReadList(reader, model.Items, DownwardAPIVolumeFileV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DownwardAPIVolumeFileV1"/>.
+    /// </summary>
+    public sealed class DownwardAPIVolumeFileV1BinarySerializer
+        : KubeModelBinarySerializer<DownwardAPIVolumeFileV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DownwardAPIVolumeFileV1BinarySerializer"/>.
+        /// </summary>
+        public static DownwardAPIVolumeFileV1BinarySerializer Instance { get; } = new DownwardAPIVolumeFileV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DownwardAPIVolumeFileV1BinarySerializer"/>.
+        /// </summary>
+        public DownwardAPIVolumeFileV1BinarySerializer()
+            : base(schemaHash: 0xD875D9803C7D86FBUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DownwardAPIVolumeFileV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DownwardAPIVolumeFileV1 model)
+        {
+            WriteInt32(writer, model.Mode);
+            ObjectFieldSelectorV1BinarySerializer.Instance.Write(writer, model.FieldRef);
+            ResourceFieldSelectorV1BinarySerializer.Instance.Write(writer, model.ResourceFieldRef);
+            WriteString(writer, model.Path);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DownwardAPIVolumeFileV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DownwardAPIVolumeFileV1 model)
+        {
+            model.Mode = ReadInt32(reader);
+            model.FieldRef = ObjectFieldSelectorV1BinarySerializer.Instance.Read(reader);
+            model.ResourceFieldRef = ResourceFieldSelectorV1BinarySerializer.Instance.Read(reader);
+            model.Path = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="DownwardAPIVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class DownwardAPIVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<DownwardAPIVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DownwardAPIVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static DownwardAPIVolumeSourceV1BinarySerializer Instance { get; } = new DownwardAPIVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="DownwardAPIVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public DownwardAPIVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xB3EA9A2BC7BA1ACDUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="DownwardAPIVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, DownwardAPIVolumeSourceV1 model)
+        {
+            WriteInt32(writer, model.DefaultMode);
+            WriteList(writer, model.Items, DownwardAPIVolumeFileV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="DownwardAPIVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, DownwardAPIVolumeSourceV1 model)
+        {
+            model.DefaultMode = ReadInt32(reader);
+            ReadList(reader, model.Items, DownwardAPIVolumeFileV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EmptyDirVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class EmptyDirVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<EmptyDirVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EmptyDirVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static EmptyDirVolumeSourceV1BinarySerializer Instance { get; } = new EmptyDirVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EmptyDirVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public EmptyDirVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x558162509F04020CUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EmptyDirVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EmptyDirVolumeSourceV1 model)
+        {
+            WriteString(writer, model.Medium);
+            WriteString(writer, model.SizeLimit);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EmptyDirVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EmptyDirVolumeSourceV1 model)
+        {
+            model.Medium = ReadString(reader);
+            model.SizeLimit = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointAddressV1"/>.
+    /// </summary>
+    public sealed class EndpointAddressV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointAddressV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointAddressV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointAddressV1BinarySerializer Instance { get; } = new EndpointAddressV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointAddressV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointAddressV1BinarySerializer()
+            : base(schemaHash: 0x1921104E092E1216UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointAddressV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointAddressV1 model)
+        {
+            WriteString(writer, model.Hostname);
+            WriteString(writer, model.NodeName);
+            ObjectReferenceV1BinarySerializer.Instance.Write(writer, model.TargetRef);
+            WriteString(writer, model.Ip);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointAddressV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointAddressV1 model)
+        {
+            model.Hostname = ReadString(reader);
+            model.NodeName = ReadInternedString(reader);
+            model.TargetRef = ObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Ip = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointConditionsV1"/>.
+    /// </summary>
+    public sealed class EndpointConditionsV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointConditionsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointConditionsV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointConditionsV1BinarySerializer Instance { get; } = new EndpointConditionsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointConditionsV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointConditionsV1BinarySerializer()
+            : base(schemaHash: 0x451BD8617877FF54UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointConditionsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointConditionsV1 model)
+        {
+            WriteBoolean(writer, model.Serving);
+            WriteBoolean(writer, model.Terminating);
+            WriteBoolean(writer, model.Ready);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointConditionsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointConditionsV1 model)
+        {
+            model.Serving = ReadBoolean(reader);
+            model.Terminating = ReadBoolean(reader);
+            model.Ready = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointHintsV1"/>.
+    /// </summary>
+    public sealed class EndpointHintsV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointHintsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointHintsV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointHintsV1BinarySerializer Instance { get; } = new EndpointHintsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointHintsV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointHintsV1BinarySerializer()
+            : base(schemaHash: 0x900B2351276EEF16UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointHintsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointHintsV1 model)
+        {
+            WriteList(writer, model.ForZones, ForZoneV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointHintsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointHintsV1 model)
+        {
+            ReadList(reader, model.ForZones, ForZoneV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointPortV1"/>.
+    /// </summary>
+    public sealed class EndpointPortV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointPortV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointPortV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointPortV1BinarySerializer Instance { get; } = new EndpointPortV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointPortV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointPortV1BinarySerializer()
+            : base(schemaHash: 0x96F3F2A99105DCACUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointPortV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointPortV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.AppProtocol);
+            WriteString(writer, model.Protocol);
+            WriteInt32(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointPortV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointPortV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.AppProtocol = ReadString(reader);
+            model.Protocol = ReadInternedString(reader);
+            model.Port = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointSliceV1"/>.
+    /// </summary>
+    public sealed class EndpointSliceV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointSliceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointSliceV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointSliceV1BinarySerializer Instance { get; } = new EndpointSliceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointSliceV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointSliceV1BinarySerializer()
+            : base(schemaHash: 0x59C2379A25DFE607UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointSliceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointSliceV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.AddressType);
+            WriteString(writer, model.ApiVersion);
+            WriteList(writer, model.Endpoints, EndpointV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.Ports, EndpointPortV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointSliceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointSliceV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.AddressType = ReadString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            ReadList(reader, model.Endpoints, EndpointV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.Ports, EndpointPortV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointSubsetV1"/>.
+    /// </summary>
+    public sealed class EndpointSubsetV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointSubsetV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointSubsetV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointSubsetV1BinarySerializer Instance { get; } = new EndpointSubsetV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointSubsetV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointSubsetV1BinarySerializer()
+            : base(schemaHash: 0x6857D9DB9107FE54UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointSubsetV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointSubsetV1 model)
+        {
+            WriteList(writer, model.Addresses, EndpointAddressV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.NotReadyAddresses, EndpointAddressV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.Ports, EndpointPortV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointSubsetV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointSubsetV1 model)
+        {
+            ReadList(reader, model.Addresses, EndpointAddressV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.NotReadyAddresses, EndpointAddressV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.Ports, EndpointPortV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointV1"/>.
+    /// </summary>
+    public sealed class EndpointV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointV1BinarySerializer Instance { get; } = new EndpointV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointV1BinarySerializer()
+            : base(schemaHash: 0x8B2B2408D57FF272UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointV1 model)
+        {
+            WriteString(writer, model.Hostname);
+            WriteString(writer, model.NodeName);
+            WriteString(writer, model.Zone);
+            ObjectReferenceV1BinarySerializer.Instance.Write(writer, model.TargetRef);
+            WriteList(writer, model.Addresses, WriteString);
+            EndpointConditionsV1BinarySerializer.Instance.Write(writer, model.Conditions);
+            EndpointHintsV1BinarySerializer.Instance.Write(writer, model.Hints);
+            WriteDictionary(writer, model.DeprecatedTopology, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointV1 model)
+        {
+            model.Hostname = ReadString(reader);
+            model.NodeName = ReadInternedString(reader);
+            model.Zone = ReadString(reader);
+            model.TargetRef = ObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            ReadStringList(reader, model.Addresses);
+            model.Conditions = EndpointConditionsV1BinarySerializer.Instance.Read(reader);
+            model.Hints = EndpointHintsV1BinarySerializer.Instance.Read(reader);
+            ReadStringDictionary(reader, model.DeprecatedTopology);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EndpointsV1"/>.
+    /// </summary>
+    public sealed class EndpointsV1BinarySerializer
+        : KubeModelBinarySerializer<EndpointsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointsV1BinarySerializer"/>.
+        /// </summary>
+        public static EndpointsV1BinarySerializer Instance { get; } = new EndpointsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointsV1BinarySerializer"/>.
+        /// </summary>
+        public EndpointsV1BinarySerializer()
+            : base(schemaHash: 0xDB99459C4D8E3B5FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EndpointsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EndpointsV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            WriteList(writer, model.Subsets, EndpointSubsetV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EndpointsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EndpointsV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            ReadList(reader, model.Subsets, EndpointSubsetV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EnvFromSourceV1"/>.
+    /// </summary>
+    public sealed class EnvFromSourceV1BinarySerializer
+        : KubeModelBinarySerializer<EnvFromSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EnvFromSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static EnvFromSourceV1BinarySerializer Instance { get; } = new EnvFromSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EnvFromSourceV1BinarySerializer"/>.
+        /// </summary>
+        public EnvFromSourceV1BinarySerializer()
+            : base(schemaHash: 0xD1C7A930D7276759UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EnvFromSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EnvFromSourceV1 model)
+        {
+            ConfigMapEnvSourceV1BinarySerializer.Instance.Write(writer, model.ConfigMapRef);
+            SecretEnvSourceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.Prefix);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EnvFromSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EnvFromSourceV1 model)
+        {
+            model.ConfigMapRef = ConfigMapEnvSourceV1BinarySerializer.Instance.Read(reader);
+            model.SecretRef = SecretEnvSourceV1BinarySerializer.Instance.Read(reader);
+            model.Prefix = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EnvVarSourceV1"/>.
+    /// </summary>
+    public sealed class EnvVarSourceV1BinarySerializer
+        : KubeModelBinarySerializer<EnvVarSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EnvVarSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static EnvVarSourceV1BinarySerializer Instance { get; } = new EnvVarSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EnvVarSourceV1BinarySerializer"/>.
+        /// </summary>
+        public EnvVarSourceV1BinarySerializer()
+            : base(schemaHash: 0x1DD4D1D2F8D23F8EUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EnvVarSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EnvVarSourceV1 model)
+        {
+            ConfigMapKeySelectorV1BinarySerializer.Instance.Write(writer, model.ConfigMapKeyRef);
+            ObjectFieldSelectorV1BinarySerializer.Instance.Write(writer, model.FieldRef);
+            ResourceFieldSelectorV1BinarySerializer.Instance.Write(writer, model.ResourceFieldRef);
+            SecretKeySelectorV1BinarySerializer.Instance.Write(writer, model.SecretKeyRef);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EnvVarSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EnvVarSourceV1 model)
+        {
+            model.ConfigMapKeyRef = ConfigMapKeySelectorV1BinarySerializer.Instance.Read(reader);
+            model.FieldRef = ObjectFieldSelectorV1BinarySerializer.Instance.Read(reader);
+            model.ResourceFieldRef = ResourceFieldSelectorV1BinarySerializer.Instance.Read(reader);
+            model.SecretKeyRef = SecretKeySelectorV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EnvVarV1"/>.
+    /// </summary>
+    public sealed class EnvVarV1BinarySerializer
+        : KubeModelBinarySerializer<EnvVarV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EnvVarV1BinarySerializer"/>.
+        /// </summary>
+        public static EnvVarV1BinarySerializer Instance { get; } = new EnvVarV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EnvVarV1BinarySerializer"/>.
+        /// </summary>
+        public EnvVarV1BinarySerializer()
+            : base(schemaHash: 0xB51BC650EF155BC3UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EnvVarV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EnvVarV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Value);
+            EnvVarSourceV1BinarySerializer.Instance.Write(writer, model.ValueFrom);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EnvVarV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EnvVarV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Value = ReadString(reader);
+            model.ValueFrom = EnvVarSourceV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EphemeralContainerV1"/>.
+    /// </summary>
+    public sealed class EphemeralContainerV1BinarySerializer
+        : KubeModelBinarySerializer<EphemeralContainerV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EphemeralContainerV1BinarySerializer"/>.
+        /// </summary>
+        public static EphemeralContainerV1BinarySerializer Instance { get; } = new EphemeralContainerV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EphemeralContainerV1BinarySerializer"/>.
+        /// </summary>
+        public EphemeralContainerV1BinarySerializer()
+            : base(schemaHash: 0x0FD691C0EF7EA996UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EphemeralContainerV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EphemeralContainerV1 model)
+        {
+            WriteList(writer, model.Command, WriteString);
+            WriteString(writer, model.Image);
+            LifecycleV1BinarySerializer.Instance.Write(writer, model.Lifecycle);
+            ProbeV1BinarySerializer.Instance.Write(writer, model.LivenessProbe);
+            WriteString(writer, model.Name);
+            ProbeV1BinarySerializer.Instance.Write(writer, model.ReadinessProbe);
+            ProbeV1BinarySerializer.Instance.Write(writer, model.StartupProbe);
+            WriteBoolean(writer, model.StdinOnce);
+            WriteString(writer, model.TargetContainerName);
+            WriteString(writer, model.TerminationMessagePath);
+            WriteList(writer, model.EnvFrom, EnvFromSourceV1BinarySerializer.Instance.Write);
+            WriteBoolean(writer, model.Stdin);
+            WriteString(writer, model.WorkingDir);
+            WriteList(writer, model.Args, WriteString);
+            WriteList(writer, model.Ports, ContainerPortV1BinarySerializer.Instance.Write);
+            ResourceRequirementsV1BinarySerializer.Instance.Write(writer, model.Resources);
+            WriteList(writer, model.VolumeDevices, VolumeDeviceV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.VolumeMounts, VolumeMountV1BinarySerializer.Instance.Write);
+            SecurityContextV1BinarySerializer.Instance.Write(writer, model.SecurityContext);
+            WriteList(writer, model.Env, EnvVarV1BinarySerializer.Instance.Write);
+            WriteString(writer, model.ImagePullPolicy);
+            WriteList(writer, model.ResizePolicy, ContainerResizePolicyV1BinarySerializer.Instance.Write);
+            WriteString(writer, model.RestartPolicy);
+            WriteString(writer, model.TerminationMessagePolicy);
+            WriteBoolean(writer, model.Tty);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EphemeralContainerV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EphemeralContainerV1 model)
+        {
+            ReadStringList(reader, model.Command, InternedStrings.Values);
+            model.Image = ReadInternedString(reader);
+            model.Lifecycle = LifecycleV1BinarySerializer.Instance.Read(reader);
+            model.LivenessProbe = ProbeV1BinarySerializer.Instance.Read(reader);
+            model.Name = ReadString(reader);
+            model.ReadinessProbe = ProbeV1BinarySerializer.Instance.Read(reader);
+            model.StartupProbe = ProbeV1BinarySerializer.Instance.Read(reader);
+            model.StdinOnce = ReadBoolean(reader);
+            model.TargetContainerName = ReadString(reader);
+            model.TerminationMessagePath = ReadInternedString(reader);
+            ReadList(reader, model.EnvFrom, EnvFromSourceV1BinarySerializer.Instance.Read);
+            model.Stdin = ReadBoolean(reader);
+            model.WorkingDir = ReadString(reader);
+            ReadStringList(reader, model.Args, InternedStrings.Values);
+            ReadList(reader, model.Ports, ContainerPortV1BinarySerializer.Instance.Read);
+            model.Resources = ResourceRequirementsV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.VolumeDevices, VolumeDeviceV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.VolumeMounts, VolumeMountV1BinarySerializer.Instance.Read);
+            model.SecurityContext = SecurityContextV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.Env, EnvVarV1BinarySerializer.Instance.Read);
+            model.ImagePullPolicy = ReadInternedString(reader);
+            ReadList(reader, model.ResizePolicy, ContainerResizePolicyV1BinarySerializer.Instance.Read);
+            model.RestartPolicy = ReadInternedString(reader);
+            model.TerminationMessagePolicy = ReadInternedString(reader);
+            model.Tty = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EphemeralVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class EphemeralVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<EphemeralVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EphemeralVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static EphemeralVolumeSourceV1BinarySerializer Instance { get; } = new EphemeralVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EphemeralVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public EphemeralVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xD2F9F596299C4121UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EphemeralVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EphemeralVolumeSourceV1 model)
+        {
+            PersistentVolumeClaimTemplateV1BinarySerializer.Instance.Write(writer, model.VolumeClaimTemplate);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EphemeralVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EphemeralVolumeSourceV1 model)
+        {
+            model.VolumeClaimTemplate = PersistentVolumeClaimTemplateV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EventSeriesV1"/>.
+    /// </summary>
+    public sealed class EventSeriesV1BinarySerializer
+        : KubeModelBinarySerializer<EventSeriesV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EventSeriesV1BinarySerializer"/>.
+        /// </summary>
+        public static EventSeriesV1BinarySerializer Instance { get; } = new EventSeriesV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EventSeriesV1BinarySerializer"/>.
+        /// </summary>
+        public EventSeriesV1BinarySerializer()
+            : base(schemaHash: 0xFD62E6930CDB4FBEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EventSeriesV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EventSeriesV1 model)
+        {
+            WriteDateTime(writer, model.LastObservedTime);
+            WriteInt32(writer, model.Count);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EventSeriesV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EventSeriesV1 model)
+        {
+            model.LastObservedTime = ReadDateTime(reader);
+            model.Count = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EventSourceV1"/>.
+    /// </summary>
+    public sealed class EventSourceV1BinarySerializer
+        : KubeModelBinarySerializer<EventSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EventSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static EventSourceV1BinarySerializer Instance { get; } = new EventSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EventSourceV1BinarySerializer"/>.
+        /// </summary>
+        public EventSourceV1BinarySerializer()
+            : base(schemaHash: 0x7EFC349378570769UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EventSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EventSourceV1 model)
+        {
+            WriteString(writer, model.Component);
+            WriteString(writer, model.Host);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EventSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EventSourceV1 model)
+        {
+            model.Component = ReadString(reader);
+            model.Host = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="EventV1"/>.
+    /// </summary>
+    public sealed class EventV1BinarySerializer
+        : KubeModelBinarySerializer<EventV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EventV1BinarySerializer"/>.
+        /// </summary>
+        public static EventV1BinarySerializer Instance { get; } = new EventV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="EventV1BinarySerializer"/>.
+        /// </summary>
+        public EventV1BinarySerializer()
+            : base(schemaHash: 0x1E88A800CFE2F52FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="EventV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, EventV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            WriteString(writer, model.Kind);
+            ObjectReferenceV1BinarySerializer.Instance.Write(writer, model.Related);
+            WriteDateTime(writer, model.EventTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.ReportingInstance);
+            EventSourceV1BinarySerializer.Instance.Write(writer, model.Source);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Action);
+            WriteString(writer, model.ApiVersion);
+            WriteString(writer, model.Reason);
+            WriteDateTime(writer, model.FirstTimestamp);
+            WriteDateTime(writer, model.LastTimestamp);
+            EventSeriesV1BinarySerializer.Instance.Write(writer, model.Series);
+            WriteInt32(writer, model.Count);
+            ObjectReferenceV1BinarySerializer.Instance.Write(writer, model.InvolvedObject);
+            WriteString(writer, model.ReportingComponent);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="EventV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, EventV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.Related = ObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.EventTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.ReportingInstance = ReadString(reader);
+            model.Source = EventSourceV1BinarySerializer.Instance.Read(reader);
+            model.Type = ReadInternedString(reader);
+            model.Action = ReadString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.FirstTimestamp = ReadDateTime(reader);
+            model.LastTimestamp = ReadDateTime(reader);
+            model.Series = EventSeriesV1BinarySerializer.Instance.Read(reader);
+            model.Count = ReadInt32(reader);
+            model.InvolvedObject = ObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.ReportingComponent = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ExecActionV1"/>.
+    /// </summary>
+    public sealed class ExecActionV1BinarySerializer
+        : KubeModelBinarySerializer<ExecActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ExecActionV1BinarySerializer"/>.
+        /// </summary>
+        public static ExecActionV1BinarySerializer Instance { get; } = new ExecActionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ExecActionV1BinarySerializer"/>.
+        /// </summary>
+        public ExecActionV1BinarySerializer()
+            : base(schemaHash: 0x29CB341051F8D401UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ExecActionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ExecActionV1 model)
+        {
+            WriteList(writer, model.Command, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ExecActionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ExecActionV1 model)
+        {
+            ReadStringList(reader, model.Command, InternedStrings.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="FCVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class FCVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<FCVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FCVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static FCVolumeSourceV1BinarySerializer Instance { get; } = new FCVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="FCVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public FCVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x4A3F4B2FD846D301UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="FCVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, FCVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteInt32(writer, model.Lun);
+            WriteList(writer, model.TargetWWNs, WriteString);
+            WriteList(writer, model.Wwids, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="FCVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, FCVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.Lun = ReadInt32(reader);
+            ReadStringList(reader, model.TargetWWNs);
+            ReadStringList(reader, model.Wwids);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="FieldsV1"/>.
+    /// </summary>
+    public sealed class FieldsV1BinarySerializer
+        : KubeModelBinarySerializer<FieldsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FieldsV1BinarySerializer"/>.
+        /// </summary>
+        public static FieldsV1BinarySerializer Instance { get; } = new FieldsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="FieldsV1BinarySerializer"/>.
+        /// </summary>
+        public FieldsV1BinarySerializer()
+            : base(schemaHash: 0x135D88E1361E7276UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="FieldsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, FieldsV1 model)
+        {
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="FieldsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, FieldsV1 model)
+        {
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="FlexPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class FlexPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<FlexPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FlexPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static FlexPersistentVolumeSourceV1BinarySerializer Instance { get; } = new FlexPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="FlexPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public FlexPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x82EEA6704EE9CB68UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="FlexPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, FlexPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.Driver);
+            WriteDictionary(writer, model.Options, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="FlexPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, FlexPersistentVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.SecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Driver = ReadString(reader);
+            ReadStringDictionary(reader, model.Options);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="FlexVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class FlexVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<FlexVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FlexVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static FlexVolumeSourceV1BinarySerializer Instance { get; } = new FlexVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="FlexVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public FlexVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x9FD3A7C11FC7DFE1UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="FlexVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, FlexVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.Driver);
+            WriteDictionary(writer, model.Options, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="FlexVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, FlexVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.SecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Driver = ReadString(reader);
+            ReadStringDictionary(reader, model.Options);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="FlockerVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class FlockerVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<FlockerVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FlockerVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static FlockerVolumeSourceV1BinarySerializer Instance { get; } = new FlockerVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="FlockerVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public FlockerVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xCB05E3164B4176EDUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="FlockerVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, FlockerVolumeSourceV1 model)
+        {
+            WriteString(writer, model.DatasetUUID);
+            WriteString(writer, model.DatasetName);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="FlockerVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, FlockerVolumeSourceV1 model)
+        {
+            model.DatasetUUID = ReadString(reader);
+            model.DatasetName = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ForZoneV1"/>.
+    /// </summary>
+    public sealed class ForZoneV1BinarySerializer
+        : KubeModelBinarySerializer<ForZoneV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ForZoneV1BinarySerializer"/>.
+        /// </summary>
+        public static ForZoneV1BinarySerializer Instance { get; } = new ForZoneV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ForZoneV1BinarySerializer"/>.
+        /// </summary>
+        public ForZoneV1BinarySerializer()
+            : base(schemaHash: 0x621BB235B63F19CBUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ForZoneV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ForZoneV1 model)
+        {
+            WriteString(writer, model.Name);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ForZoneV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ForZoneV1 model)
+        {
+            model.Name = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="GCEPersistentDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class GCEPersistentDiskVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<GCEPersistentDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GCEPersistentDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static GCEPersistentDiskVolumeSourceV1BinarySerializer Instance { get; } = new GCEPersistentDiskVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="GCEPersistentDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public GCEPersistentDiskVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x1A0541577AB031CBUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="GCEPersistentDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, GCEPersistentDiskVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.PdName);
+            WriteInt32(writer, model.Partition);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="GCEPersistentDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, GCEPersistentDiskVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.PdName = ReadString(reader);
+            model.Partition = ReadInt32(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="GRPCActionV1"/>.
+    /// </summary>
+    public sealed class GRPCActionV1BinarySerializer
+        : KubeModelBinarySerializer<GRPCActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GRPCActionV1BinarySerializer"/>.
+        /// </summary>
+        public static GRPCActionV1BinarySerializer Instance { get; } = new GRPCActionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="GRPCActionV1BinarySerializer"/>.
+        /// </summary>
+        public GRPCActionV1BinarySerializer()
+            : base(schemaHash: 0x45C23D91A39A4F1DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="GRPCActionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, GRPCActionV1 model)
+        {
+            WriteString(writer, model.Service);
+            WriteInt32(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="GRPCActionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, GRPCActionV1 model)
+        {
+            model.Service = ReadString(reader);
+            model.Port = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="GitRepoVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class GitRepoVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<GitRepoVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GitRepoVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static GitRepoVolumeSourceV1BinarySerializer Instance { get; } = new GitRepoVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="GitRepoVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public GitRepoVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xB76F991A69AFA6BCUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="GitRepoVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, GitRepoVolumeSourceV1 model)
+        {
+            WriteString(writer, model.Revision);
+            WriteString(writer, model.Directory);
+            WriteString(writer, model.Repository);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="GitRepoVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, GitRepoVolumeSourceV1 model)
+        {
+            model.Revision = ReadString(reader);
+            model.Directory = ReadString(reader);
+            model.Repository = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="GlusterfsPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class GlusterfsPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<GlusterfsPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GlusterfsPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static GlusterfsPersistentVolumeSourceV1BinarySerializer Instance { get; } = new GlusterfsPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="GlusterfsPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public GlusterfsPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xDB7248AEA22ECD51UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="GlusterfsPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, GlusterfsPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.EndpointsNamespace);
+            WriteString(writer, model.Path);
+            WriteString(writer, model.Endpoints);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="GlusterfsPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, GlusterfsPersistentVolumeSourceV1 model)
+        {
+            model.EndpointsNamespace = ReadString(reader);
+            model.Path = ReadString(reader);
+            model.Endpoints = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="GlusterfsVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class GlusterfsVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<GlusterfsVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GlusterfsVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static GlusterfsVolumeSourceV1BinarySerializer Instance { get; } = new GlusterfsVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="GlusterfsVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public GlusterfsVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x3CF148D5DF61E058UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="GlusterfsVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, GlusterfsVolumeSourceV1 model)
+        {
+            WriteString(writer, model.Path);
+            WriteString(writer, model.Endpoints);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="GlusterfsVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, GlusterfsVolumeSourceV1 model)
+        {
+            model.Path = ReadString(reader);
+            model.Endpoints = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="HTTPGetActionV1"/>.
+    /// </summary>
+    public sealed class HTTPGetActionV1BinarySerializer
+        : KubeModelBinarySerializer<HTTPGetActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HTTPGetActionV1BinarySerializer"/>.
+        /// </summary>
+        public static HTTPGetActionV1BinarySerializer Instance { get; } = new HTTPGetActionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="HTTPGetActionV1BinarySerializer"/>.
+        /// </summary>
+        public HTTPGetActionV1BinarySerializer()
+            : base(schemaHash: 0xEC659D3C870468E6UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="HTTPGetActionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, HTTPGetActionV1 model)
+        {
+            WriteString(writer, model.Scheme);
+            WriteString(writer, model.Path);
+            WriteList(writer, model.HttpHeaders, HTTPHeaderV1BinarySerializer.Instance.Write);
+            WriteString(writer, model.Host);
+            WriteInt32OrString(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="HTTPGetActionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, HTTPGetActionV1 model)
+        {
+            model.Scheme = ReadInternedString(reader);
+            model.Path = ReadString(reader);
+            ReadList(reader, model.HttpHeaders, HTTPHeaderV1BinarySerializer.Instance.Read);
+            model.Host = ReadString(reader);
+            model.Port = ReadInt32OrString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="HTTPHeaderV1"/>.
+    /// </summary>
+    public sealed class HTTPHeaderV1BinarySerializer
+        : KubeModelBinarySerializer<HTTPHeaderV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HTTPHeaderV1BinarySerializer"/>.
+        /// </summary>
+        public static HTTPHeaderV1BinarySerializer Instance { get; } = new HTTPHeaderV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="HTTPHeaderV1BinarySerializer"/>.
+        /// </summary>
+        public HTTPHeaderV1BinarySerializer()
+            : base(schemaHash: 0xC723C5935DC9495AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="HTTPHeaderV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, HTTPHeaderV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Value);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="HTTPHeaderV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, HTTPHeaderV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Value = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="HTTPIngressPathV1"/>.
+    /// </summary>
+    public sealed class HTTPIngressPathV1BinarySerializer
+        : KubeModelBinarySerializer<HTTPIngressPathV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HTTPIngressPathV1BinarySerializer"/>.
+        /// </summary>
+        public static HTTPIngressPathV1BinarySerializer Instance { get; } = new HTTPIngressPathV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="HTTPIngressPathV1BinarySerializer"/>.
+        /// </summary>
+        public HTTPIngressPathV1BinarySerializer()
+            : base(schemaHash: 0xA543759CB3950015UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="HTTPIngressPathV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, HTTPIngressPathV1 model)
+        {
+            IngressBackendV1BinarySerializer.Instance.Write(writer, model.Backend);
+            WriteString(writer, model.PathType);
+            WriteString(writer, model.Path);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="HTTPIngressPathV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, HTTPIngressPathV1 model)
+        {
+            model.Backend = IngressBackendV1BinarySerializer.Instance.Read(reader);
+            model.PathType = ReadString(reader);
+            model.Path = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="HTTPIngressRuleValueV1"/>.
+    /// </summary>
+    public sealed class HTTPIngressRuleValueV1BinarySerializer
+        : KubeModelBinarySerializer<HTTPIngressRuleValueV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HTTPIngressRuleValueV1BinarySerializer"/>.
+        /// </summary>
+        public static HTTPIngressRuleValueV1BinarySerializer Instance { get; } = new HTTPIngressRuleValueV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="HTTPIngressRuleValueV1BinarySerializer"/>.
+        /// </summary>
+        public HTTPIngressRuleValueV1BinarySerializer()
+            : base(schemaHash: 0x23E6AEC7447BD33CUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="HTTPIngressRuleValueV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, HTTPIngressRuleValueV1 model)
+        {
+            WriteList(writer, model.Paths, HTTPIngressPathV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="HTTPIngressRuleValueV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, HTTPIngressRuleValueV1 model)
+        {
+            ReadList(reader, model.Paths, HTTPIngressPathV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="HostAliasV1"/>.
+    /// </summary>
+    public sealed class HostAliasV1BinarySerializer
+        : KubeModelBinarySerializer<HostAliasV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HostAliasV1BinarySerializer"/>.
+        /// </summary>
+        public static HostAliasV1BinarySerializer Instance { get; } = new HostAliasV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="HostAliasV1BinarySerializer"/>.
+        /// </summary>
+        public HostAliasV1BinarySerializer()
+            : base(schemaHash: 0xF13A3FE109204E82UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="HostAliasV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, HostAliasV1 model)
+        {
+            WriteString(writer, model.Ip);
+            WriteList(writer, model.Hostnames, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="HostAliasV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, HostAliasV1 model)
+        {
+            model.Ip = ReadString(reader);
+            ReadStringList(reader, model.Hostnames);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="HostIPV1"/>.
+    /// </summary>
+    public sealed class HostIPV1BinarySerializer
+        : KubeModelBinarySerializer<HostIPV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HostIPV1BinarySerializer"/>.
+        /// </summary>
+        public static HostIPV1BinarySerializer Instance { get; } = new HostIPV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="HostIPV1BinarySerializer"/>.
+        /// </summary>
+        public HostIPV1BinarySerializer()
+            : base(schemaHash: 0x9C4F2B90FEFD0AADUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="HostIPV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, HostIPV1 model)
+        {
+            WriteString(writer, model.Ip);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="HostIPV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, HostIPV1 model)
+        {
+            model.Ip = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="HostPathVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class HostPathVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<HostPathVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HostPathVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static HostPathVolumeSourceV1BinarySerializer Instance { get; } = new HostPathVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="HostPathVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public HostPathVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x7EEE303A8FC1E98EUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="HostPathVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, HostPathVolumeSourceV1 model)
+        {
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Path);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="HostPathVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, HostPathVolumeSourceV1 model)
+        {
+            model.Type = ReadInternedString(reader);
+            model.Path = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ISCSIPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ISCSIPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ISCSIPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ISCSIPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ISCSIPersistentVolumeSourceV1BinarySerializer Instance { get; } = new ISCSIPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ISCSIPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ISCSIPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xD160F032F8E1290DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ISCSIPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ISCSIPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.InitiatorName);
+            WriteString(writer, model.IscsiInterface);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.TargetPortal);
+            WriteBoolean(writer, model.ChapAuthSession);
+            WriteString(writer, model.Iqn);
+            WriteInt32(writer, model.Lun);
+            WriteList(writer, model.Portals, WriteString);
+            WriteBoolean(writer, model.ChapAuthDiscovery);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ISCSIPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ISCSIPersistentVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.InitiatorName = ReadString(reader);
+            model.IscsiInterface = ReadString(reader);
+            model.SecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.TargetPortal = ReadString(reader);
+            model.ChapAuthSession = ReadBoolean(reader);
+            model.Iqn = ReadString(reader);
+            model.Lun = ReadInt32(reader).GetValueOrDefault();
+            ReadStringList(reader, model.Portals);
+            model.ChapAuthDiscovery = ReadBoolean(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ISCSIVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ISCSIVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ISCSIVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ISCSIVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ISCSIVolumeSourceV1BinarySerializer Instance { get; } = new ISCSIVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ISCSIVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ISCSIVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xFF663988E3E72DB1UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ISCSIVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ISCSIVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.InitiatorName);
+            WriteString(writer, model.IscsiInterface);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.TargetPortal);
+            WriteBoolean(writer, model.ChapAuthSession);
+            WriteString(writer, model.Iqn);
+            WriteInt32(writer, model.Lun);
+            WriteList(writer, model.Portals, WriteString);
+            WriteBoolean(writer, model.ChapAuthDiscovery);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ISCSIVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ISCSIVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.InitiatorName = ReadString(reader);
+            model.IscsiInterface = ReadString(reader);
+            model.SecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.TargetPortal = ReadString(reader);
+            model.ChapAuthSession = ReadBoolean(reader);
+            model.Iqn = ReadString(reader);
+            model.Lun = ReadInt32(reader).GetValueOrDefault();
+            ReadStringList(reader, model.Portals);
+            model.ChapAuthDiscovery = ReadBoolean(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ImageVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ImageVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ImageVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ImageVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ImageVolumeSourceV1BinarySerializer Instance { get; } = new ImageVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ImageVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ImageVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x0BF4083E1DA8125DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ImageVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ImageVolumeSourceV1 model)
+        {
+            WriteString(writer, model.Reference);
+            WriteString(writer, model.PullPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ImageVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ImageVolumeSourceV1 model)
+        {
+            model.Reference = ReadString(reader);
+            model.PullPolicy = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressBackendV1"/>.
+    /// </summary>
+    public sealed class IngressBackendV1BinarySerializer
+        : KubeModelBinarySerializer<IngressBackendV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressBackendV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressBackendV1BinarySerializer Instance { get; } = new IngressBackendV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressBackendV1BinarySerializer"/>.
+        /// </summary>
+        public IngressBackendV1BinarySerializer()
+            : base(schemaHash: 0x95A26C8A80A374BFUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressBackendV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressBackendV1 model)
+        {
+            TypedLocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.Resource);
+            IngressServiceBackendV1BinarySerializer.Instance.Write(writer, model.Service);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressBackendV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressBackendV1 model)
+        {
+            model.Resource = TypedLocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Service = IngressServiceBackendV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressLoadBalancerIngressV1"/>.
+    /// </summary>
+    public sealed class IngressLoadBalancerIngressV1BinarySerializer
+        : KubeModelBinarySerializer<IngressLoadBalancerIngressV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressLoadBalancerIngressV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressLoadBalancerIngressV1BinarySerializer Instance { get; } = new IngressLoadBalancerIngressV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressLoadBalancerIngressV1BinarySerializer"/>.
+        /// </summary>
+        public IngressLoadBalancerIngressV1BinarySerializer()
+            : base(schemaHash: 0xBA5BC5FC9AED4CEEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressLoadBalancerIngressV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressLoadBalancerIngressV1 model)
+        {
+            WriteString(writer, model.Hostname);
+            WriteString(writer, model.Ip);
+            WriteList(writer, model.Ports, IngressPortStatusV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressLoadBalancerIngressV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressLoadBalancerIngressV1 model)
+        {
+            model.Hostname = ReadString(reader);
+            model.Ip = ReadString(reader);
+            ReadList(reader, model.Ports, IngressPortStatusV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressLoadBalancerStatusV1"/>.
+    /// </summary>
+    public sealed class IngressLoadBalancerStatusV1BinarySerializer
+        : KubeModelBinarySerializer<IngressLoadBalancerStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressLoadBalancerStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressLoadBalancerStatusV1BinarySerializer Instance { get; } = new IngressLoadBalancerStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressLoadBalancerStatusV1BinarySerializer"/>.
+        /// </summary>
+        public IngressLoadBalancerStatusV1BinarySerializer()
+            : base(schemaHash: 0x169637B7A67418CCUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressLoadBalancerStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressLoadBalancerStatusV1 model)
+        {
+            WriteList(writer, model.Ingress, IngressLoadBalancerIngressV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressLoadBalancerStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressLoadBalancerStatusV1 model)
+        {
+            ReadList(reader, model.Ingress, IngressLoadBalancerIngressV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressPortStatusV1"/>.
+    /// </summary>
+    public sealed class IngressPortStatusV1BinarySerializer
+        : KubeModelBinarySerializer<IngressPortStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressPortStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressPortStatusV1BinarySerializer Instance { get; } = new IngressPortStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressPortStatusV1BinarySerializer"/>.
+        /// </summary>
+        public IngressPortStatusV1BinarySerializer()
+            : base(schemaHash: 0xCF4A79639DF1FD75UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressPortStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressPortStatusV1 model)
+        {
+            WriteString(writer, model.Protocol);
+            WriteString(writer, model.Error);
+            WriteInt32(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressPortStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressPortStatusV1 model)
+        {
+            model.Protocol = ReadInternedString(reader);
+            model.Error = ReadString(reader);
+            model.Port = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressRuleV1"/>.
+    /// </summary>
+    public sealed class IngressRuleV1BinarySerializer
+        : KubeModelBinarySerializer<IngressRuleV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressRuleV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressRuleV1BinarySerializer Instance { get; } = new IngressRuleV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressRuleV1BinarySerializer"/>.
+        /// </summary>
+        public IngressRuleV1BinarySerializer()
+            : base(schemaHash: 0x4E25FC3ABB86A564UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressRuleV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressRuleV1 model)
+        {
+            HTTPIngressRuleValueV1BinarySerializer.Instance.Write(writer, model.Http);
+            WriteString(writer, model.Host);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressRuleV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressRuleV1 model)
+        {
+            model.Http = HTTPIngressRuleValueV1BinarySerializer.Instance.Read(reader);
+            model.Host = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressServiceBackendV1"/>.
+    /// </summary>
+    public sealed class IngressServiceBackendV1BinarySerializer
+        : KubeModelBinarySerializer<IngressServiceBackendV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressServiceBackendV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressServiceBackendV1BinarySerializer Instance { get; } = new IngressServiceBackendV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressServiceBackendV1BinarySerializer"/>.
+        /// </summary>
+        public IngressServiceBackendV1BinarySerializer()
+            : base(schemaHash: 0x9E8A8A48EF42639DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressServiceBackendV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressServiceBackendV1 model)
+        {
+            WriteString(writer, model.Name);
+            ServiceBackendPortV1BinarySerializer.Instance.Write(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressServiceBackendV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressServiceBackendV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Port = ServiceBackendPortV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressSpecV1"/>.
+    /// </summary>
+    public sealed class IngressSpecV1BinarySerializer
+        : KubeModelBinarySerializer<IngressSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressSpecV1BinarySerializer Instance { get; } = new IngressSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressSpecV1BinarySerializer"/>.
+        /// </summary>
+        public IngressSpecV1BinarySerializer()
+            : base(schemaHash: 0x8161C2756820E0E3UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressSpecV1 model)
+        {
+            IngressBackendV1BinarySerializer.Instance.Write(writer, model.DefaultBackend);
+            WriteString(writer, model.IngressClassName);
+            WriteList(writer, model.Rules, IngressRuleV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.Tls, IngressTLSV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressSpecV1 model)
+        {
+            model.DefaultBackend = IngressBackendV1BinarySerializer.Instance.Read(reader);
+            model.IngressClassName = ReadInternedString(reader);
+            ReadList(reader, model.Rules, IngressRuleV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.Tls, IngressTLSV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressStatusV1"/>.
+    /// </summary>
+    public sealed class IngressStatusV1BinarySerializer
+        : KubeModelBinarySerializer<IngressStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressStatusV1BinarySerializer Instance { get; } = new IngressStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressStatusV1BinarySerializer"/>.
+        /// </summary>
+        public IngressStatusV1BinarySerializer()
+            : base(schemaHash: 0x433ADE82416957EEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressStatusV1 model)
+        {
+            IngressLoadBalancerStatusV1BinarySerializer.Instance.Write(writer, model.LoadBalancer);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressStatusV1 model)
+        {
+            model.LoadBalancer = IngressLoadBalancerStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressTLSV1"/>.
+    /// </summary>
+    public sealed class IngressTLSV1BinarySerializer
+        : KubeModelBinarySerializer<IngressTLSV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressTLSV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressTLSV1BinarySerializer Instance { get; } = new IngressTLSV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressTLSV1BinarySerializer"/>.
+        /// </summary>
+        public IngressTLSV1BinarySerializer()
+            : base(schemaHash: 0x6FDDDD1E1E5BB6DEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressTLSV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressTLSV1 model)
+        {
+            WriteString(writer, model.SecretName);
+            WriteList(writer, model.Hosts, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressTLSV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressTLSV1 model)
+        {
+            model.SecretName = ReadString(reader);
+            ReadStringList(reader, model.Hosts);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="IngressV1"/>.
+    /// </summary>
+    public sealed class IngressV1BinarySerializer
+        : KubeModelBinarySerializer<IngressV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="IngressV1BinarySerializer"/>.
+        /// </summary>
+        public static IngressV1BinarySerializer Instance { get; } = new IngressV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="IngressV1BinarySerializer"/>.
+        /// </summary>
+        public IngressV1BinarySerializer()
+            : base(schemaHash: 0xEC26766919B83377UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="IngressV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, IngressV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            IngressSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            IngressStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="IngressV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, IngressV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = IngressSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = IngressStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="JobConditionV1"/>.
+    /// </summary>
+    public sealed class JobConditionV1BinarySerializer
+        : KubeModelBinarySerializer<JobConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="JobConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static JobConditionV1BinarySerializer Instance { get; } = new JobConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="JobConditionV1BinarySerializer"/>.
+        /// </summary>
+        public JobConditionV1BinarySerializer()
+            : base(schemaHash: 0xC06917211A411164UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="JobConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, JobConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastProbeTime);
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="JobConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, JobConditionV1 model)
+        {
+            model.LastProbeTime = ReadDateTime(reader);
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="JobSpecV1"/>.
+    /// </summary>
+    public sealed class JobSpecV1BinarySerializer
+        : KubeModelBinarySerializer<JobSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="JobSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static JobSpecV1BinarySerializer Instance { get; } = new JobSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="JobSpecV1BinarySerializer"/>.
+        /// </summary>
+        public JobSpecV1BinarySerializer()
+            : base(schemaHash: 0x6A425EB21AE57BF0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="JobSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, JobSpecV1 model)
+        {
+            WriteBoolean(writer, model.Suspend);
+            WriteInt32(writer, model.TtlSecondsAfterFinished);
+            WriteString(writer, model.CompletionMode);
+            PodTemplateSpecV1BinarySerializer.Instance.Write(writer, model.Template);
+            WriteInt32(writer, model.Parallelism);
+            WriteBoolean(writer, model.ManualSelector);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.Selector);
+            WriteInt64(writer, model.ActiveDeadlineSeconds);
+            WriteInt32(writer, model.Completions);
+            WriteInt32(writer, model.MaxFailedIndexes);
+            WriteInt32(writer, model.BackoffLimit);
+            WriteInt32(writer, model.BackoffLimitPerIndex);
+            WriteString(writer, model.ManagedBy);
+            PodFailurePolicyV1BinarySerializer.Instance.Write(writer, model.PodFailurePolicy);
+            WriteString(writer, model.PodReplacementPolicy);
+            SuccessPolicyV1BinarySerializer.Instance.Write(writer, model.SuccessPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="JobSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, JobSpecV1 model)
+        {
+            model.Suspend = ReadBoolean(reader);
+            model.TtlSecondsAfterFinished = ReadInt32(reader);
+            model.CompletionMode = ReadString(reader);
+            model.Template = PodTemplateSpecV1BinarySerializer.Instance.Read(reader);
+            model.Parallelism = ReadInt32(reader);
+            model.ManualSelector = ReadBoolean(reader);
+            model.Selector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            model.ActiveDeadlineSeconds = ReadInt64(reader);
+            model.Completions = ReadInt32(reader);
+            model.MaxFailedIndexes = ReadInt32(reader);
+            model.BackoffLimit = ReadInt32(reader);
+            model.BackoffLimitPerIndex = ReadInt32(reader);
+            model.ManagedBy = ReadString(reader);
+            model.PodFailurePolicy = PodFailurePolicyV1BinarySerializer.Instance.Read(reader);
+            model.PodReplacementPolicy = ReadInternedString(reader);
+            model.SuccessPolicy = SuccessPolicyV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="JobStatusV1"/>.
+    /// </summary>
+    public sealed class JobStatusV1BinarySerializer
+        : KubeModelBinarySerializer<JobStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="JobStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static JobStatusV1BinarySerializer Instance { get; } = new JobStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="JobStatusV1BinarySerializer"/>.
+        /// </summary>
+        public JobStatusV1BinarySerializer()
+            : base(schemaHash: 0xC1CBE8E5C26BFF0AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="JobStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, JobStatusV1 model)
+        {
+            WriteInt32(writer, model.Failed);
+            WriteInt32(writer, model.Succeeded);
+            WriteInt32(writer, model.Active);
+            WriteDateTime(writer, model.CompletionTime);
+            WriteDateTime(writer, model.StartTime);
+            WriteInt32(writer, model.Terminating);
+            WriteString(writer, model.CompletedIndexes);
+            WriteList(writer, model.Conditions, JobConditionV1BinarySerializer.Instance.Write);
+            WriteString(writer, model.FailedIndexes);
+            UncountedTerminatedPodsV1BinarySerializer.Instance.Write(writer, model.UncountedTerminatedPods);
+            WriteInt32(writer, model.Ready);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="JobStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, JobStatusV1 model)
+        {
+            model.Failed = ReadInt32(reader);
+            model.Succeeded = ReadInt32(reader);
+            model.Active = ReadInt32(reader);
+            model.CompletionTime = ReadDateTime(reader);
+            model.StartTime = ReadDateTime(reader);
+            model.Terminating = ReadInt32(reader);
+            model.CompletedIndexes = ReadString(reader);
+            ReadList(reader, model.Conditions, JobConditionV1BinarySerializer.Instance.Read);
+            model.FailedIndexes = ReadString(reader);
+            model.UncountedTerminatedPods = UncountedTerminatedPodsV1BinarySerializer.Instance.Read(reader);
+            model.Ready = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="JobTemplateSpecV1"/>.
+    /// </summary>
+    public sealed class JobTemplateSpecV1BinarySerializer
+        : KubeModelBinarySerializer<JobTemplateSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="JobTemplateSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static JobTemplateSpecV1BinarySerializer Instance { get; } = new JobTemplateSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="JobTemplateSpecV1BinarySerializer"/>.
+        /// </summary>
+        public JobTemplateSpecV1BinarySerializer()
+            : base(schemaHash: 0x90021C8191D7C62FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="JobTemplateSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, JobTemplateSpecV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            JobSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="JobTemplateSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, JobTemplateSpecV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = JobSpecV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="JobV1"/>.
+    /// </summary>
+    public sealed class JobV1BinarySerializer
+        : KubeModelBinarySerializer<JobV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="JobV1BinarySerializer"/>.
+        /// </summary>
+        public static JobV1BinarySerializer Instance { get; } = new JobV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="JobV1BinarySerializer"/>.
+        /// </summary>
+        public JobV1BinarySerializer()
+            : base(schemaHash: 0xF70C9DE40814B66DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="JobV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, JobV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            JobSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            JobStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="JobV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, JobV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = JobSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = JobStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="KeyToPathV1"/>.
+    /// </summary>
+    public sealed class KeyToPathV1BinarySerializer
+        : KubeModelBinarySerializer<KeyToPathV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="KeyToPathV1BinarySerializer"/>.
+        /// </summary>
+        public static KeyToPathV1BinarySerializer Instance { get; } = new KeyToPathV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="KeyToPathV1BinarySerializer"/>.
+        /// </summary>
+        public KeyToPathV1BinarySerializer()
+            : base(schemaHash: 0x9A8407A15B50AED9UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="KeyToPathV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, KeyToPathV1 model)
+        {
+            WriteInt32(writer, model.Mode);
+            WriteString(writer, model.Path);
+            WriteString(writer, model.Key);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="KeyToPathV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, KeyToPathV1 model)
+        {
+            model.Mode = ReadInt32(reader);
+            model.Path = ReadString(reader);
+            model.Key = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LabelSelectorRequirementV1"/>.
+    /// </summary>
+    public sealed class LabelSelectorRequirementV1BinarySerializer
+        : KubeModelBinarySerializer<LabelSelectorRequirementV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LabelSelectorRequirementV1BinarySerializer"/>.
+        /// </summary>
+        public static LabelSelectorRequirementV1BinarySerializer Instance { get; } = new LabelSelectorRequirementV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LabelSelectorRequirementV1BinarySerializer"/>.
+        /// </summary>
+        public LabelSelectorRequirementV1BinarySerializer()
+            : base(schemaHash: 0x05F0EBC4AF020F92UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LabelSelectorRequirementV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LabelSelectorRequirementV1 model)
+        {
+            WriteString(writer, model.Operator);
+            WriteList(writer, model.Values, WriteString);
+            WriteString(writer, model.Key);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LabelSelectorRequirementV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LabelSelectorRequirementV1 model)
+        {
+            model.Operator = ReadInternedString(reader);
+            ReadStringList(reader, model.Values);
+            model.Key = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LabelSelectorV1"/>.
+    /// </summary>
+    public sealed class LabelSelectorV1BinarySerializer
+        : KubeModelBinarySerializer<LabelSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LabelSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public static LabelSelectorV1BinarySerializer Instance { get; } = new LabelSelectorV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LabelSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public LabelSelectorV1BinarySerializer()
+            : base(schemaHash: 0x5A98FF2D1EA87CDAUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LabelSelectorV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LabelSelectorV1 model)
+        {
+            WriteList(writer, model.MatchExpressions, LabelSelectorRequirementV1BinarySerializer.Instance.Write);
+            WriteDictionary(writer, model.MatchLabels, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LabelSelectorV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LabelSelectorV1 model)
+        {
+            ReadList(reader, model.MatchExpressions, LabelSelectorRequirementV1BinarySerializer.Instance.Read);
+            ReadStringDictionary(reader, model.MatchLabels, InternedStrings.DictionaryKeys | InternedStrings.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LeaseSpecV1"/>.
+    /// </summary>
+    public sealed class LeaseSpecV1BinarySerializer
+        : KubeModelBinarySerializer<LeaseSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LeaseSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static LeaseSpecV1BinarySerializer Instance { get; } = new LeaseSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LeaseSpecV1BinarySerializer"/>.
+        /// </summary>
+        public LeaseSpecV1BinarySerializer()
+            : base(schemaHash: 0x00220D749ADDB3FAUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LeaseSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LeaseSpecV1 model)
+        {
+            WriteDateTime(writer, model.AcquireTime);
+            WriteDateTime(writer, model.RenewTime);
+            WriteString(writer, model.PreferredHolder);
+            WriteInt32(writer, model.LeaseDurationSeconds);
+            WriteInt32(writer, model.LeaseTransitions);
+            WriteString(writer, model.HolderIdentity);
+            WriteString(writer, model.Strategy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LeaseSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LeaseSpecV1 model)
+        {
+            model.AcquireTime = ReadDateTime(reader);
+            model.RenewTime = ReadDateTime(reader);
+            model.PreferredHolder = ReadString(reader);
+            model.LeaseDurationSeconds = ReadInt32(reader);
+            model.LeaseTransitions = ReadInt32(reader);
+            model.HolderIdentity = ReadString(reader);
+            model.Strategy = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LeaseV1"/>.
+    /// </summary>
+    public sealed class LeaseV1BinarySerializer
+        : KubeModelBinarySerializer<LeaseV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LeaseV1BinarySerializer"/>.
+        /// </summary>
+        public static LeaseV1BinarySerializer Instance { get; } = new LeaseV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LeaseV1BinarySerializer"/>.
+        /// </summary>
+        public LeaseV1BinarySerializer()
+            : base(schemaHash: 0xDA63CAC442FAEAF8UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LeaseV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LeaseV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            LeaseSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LeaseV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LeaseV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = LeaseSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LifecycleHandlerV1"/>.
+    /// </summary>
+    public sealed class LifecycleHandlerV1BinarySerializer
+        : KubeModelBinarySerializer<LifecycleHandlerV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LifecycleHandlerV1BinarySerializer"/>.
+        /// </summary>
+        public static LifecycleHandlerV1BinarySerializer Instance { get; } = new LifecycleHandlerV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LifecycleHandlerV1BinarySerializer"/>.
+        /// </summary>
+        public LifecycleHandlerV1BinarySerializer()
+            : base(schemaHash: 0x0DAE25E00CF62208UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LifecycleHandlerV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LifecycleHandlerV1 model)
+        {
+            ExecActionV1BinarySerializer.Instance.Write(writer, model.Exec);
+            SleepActionV1BinarySerializer.Instance.Write(writer, model.Sleep);
+            HTTPGetActionV1BinarySerializer.Instance.Write(writer, model.HttpGet);
+            TCPSocketActionV1BinarySerializer.Instance.Write(writer, model.TcpSocket);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LifecycleHandlerV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LifecycleHandlerV1 model)
+        {
+            model.Exec = ExecActionV1BinarySerializer.Instance.Read(reader);
+            model.Sleep = SleepActionV1BinarySerializer.Instance.Read(reader);
+            model.HttpGet = HTTPGetActionV1BinarySerializer.Instance.Read(reader);
+            model.TcpSocket = TCPSocketActionV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LifecycleV1"/>.
+    /// </summary>
+    public sealed class LifecycleV1BinarySerializer
+        : KubeModelBinarySerializer<LifecycleV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LifecycleV1BinarySerializer"/>.
+        /// </summary>
+        public static LifecycleV1BinarySerializer Instance { get; } = new LifecycleV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LifecycleV1BinarySerializer"/>.
+        /// </summary>
+        public LifecycleV1BinarySerializer()
+            : base(schemaHash: 0x117120BA598F5C61UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LifecycleV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LifecycleV1 model)
+        {
+            LifecycleHandlerV1BinarySerializer.Instance.Write(writer, model.PreStop);
+            LifecycleHandlerV1BinarySerializer.Instance.Write(writer, model.PostStart);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LifecycleV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LifecycleV1 model)
+        {
+            model.PreStop = LifecycleHandlerV1BinarySerializer.Instance.Read(reader);
+            model.PostStart = LifecycleHandlerV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LinuxContainerUserV1"/>.
+    /// </summary>
+    public sealed class LinuxContainerUserV1BinarySerializer
+        : KubeModelBinarySerializer<LinuxContainerUserV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LinuxContainerUserV1BinarySerializer"/>.
+        /// </summary>
+        public static LinuxContainerUserV1BinarySerializer Instance { get; } = new LinuxContainerUserV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LinuxContainerUserV1BinarySerializer"/>.
+        /// </summary>
+        public LinuxContainerUserV1BinarySerializer()
+            : base(schemaHash: 0x4B82DE77C672BB3CUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LinuxContainerUserV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LinuxContainerUserV1 model)
+        {
+            WriteInt64(writer, model.Gid);
+            WriteInt64(writer, model.Uid);
+            WriteJson(writer, model.SupplementalGroups);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LinuxContainerUserV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LinuxContainerUserV1 model)
+        {
+            model.Gid = ReadInt64(reader).GetValueOrDefault();
+            model.Uid = ReadInt64(reader).GetValueOrDefault();
+            ReadJson(reader, model.SupplementalGroups);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LoadBalancerIngressV1"/>.
+    /// </summary>
+    public sealed class LoadBalancerIngressV1BinarySerializer
+        : KubeModelBinarySerializer<LoadBalancerIngressV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LoadBalancerIngressV1BinarySerializer"/>.
+        /// </summary>
+        public static LoadBalancerIngressV1BinarySerializer Instance { get; } = new LoadBalancerIngressV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LoadBalancerIngressV1BinarySerializer"/>.
+        /// </summary>
+        public LoadBalancerIngressV1BinarySerializer()
+            : base(schemaHash: 0x45AF360A597C80EEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LoadBalancerIngressV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LoadBalancerIngressV1 model)
+        {
+            WriteString(writer, model.Hostname);
+            WriteString(writer, model.IpMode);
+            WriteString(writer, model.Ip);
+            WriteList(writer, model.Ports, PortStatusV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LoadBalancerIngressV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LoadBalancerIngressV1 model)
+        {
+            model.Hostname = ReadString(reader);
+            model.IpMode = ReadString(reader);
+            model.Ip = ReadString(reader);
+            ReadList(reader, model.Ports, PortStatusV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LoadBalancerStatusV1"/>.
+    /// </summary>
+    public sealed class LoadBalancerStatusV1BinarySerializer
+        : KubeModelBinarySerializer<LoadBalancerStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LoadBalancerStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static LoadBalancerStatusV1BinarySerializer Instance { get; } = new LoadBalancerStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LoadBalancerStatusV1BinarySerializer"/>.
+        /// </summary>
+        public LoadBalancerStatusV1BinarySerializer()
+            : base(schemaHash: 0x61FF37B5ADF3FAF4UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LoadBalancerStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LoadBalancerStatusV1 model)
+        {
+            WriteList(writer, model.Ingress, LoadBalancerIngressV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LoadBalancerStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LoadBalancerStatusV1 model)
+        {
+            ReadList(reader, model.Ingress, LoadBalancerIngressV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LocalObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class LocalObjectReferenceV1BinarySerializer
+        : KubeModelBinarySerializer<LocalObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LocalObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public static LocalObjectReferenceV1BinarySerializer Instance { get; } = new LocalObjectReferenceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LocalObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public LocalObjectReferenceV1BinarySerializer()
+            : base(schemaHash: 0x577B549CE6C31616UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LocalObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LocalObjectReferenceV1 model)
+        {
+            WriteString(writer, model.Name);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LocalObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LocalObjectReferenceV1 model)
+        {
+            model.Name = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="LocalVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class LocalVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<LocalVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LocalVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static LocalVolumeSourceV1BinarySerializer Instance { get; } = new LocalVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="LocalVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public LocalVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xCF4E55D4EE571587UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="LocalVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, LocalVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.Path);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="LocalVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, LocalVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.Path = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ManagedFieldsEntryV1"/>.
+    /// </summary>
+    public sealed class ManagedFieldsEntryV1BinarySerializer
+        : KubeModelBinarySerializer<ManagedFieldsEntryV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ManagedFieldsEntryV1BinarySerializer"/>.
+        /// </summary>
+        public static ManagedFieldsEntryV1BinarySerializer Instance { get; } = new ManagedFieldsEntryV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ManagedFieldsEntryV1BinarySerializer"/>.
+        /// </summary>
+        public ManagedFieldsEntryV1BinarySerializer()
+            : base(schemaHash: 0x2E176F1ABD387AB3UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ManagedFieldsEntryV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ManagedFieldsEntryV1 model)
+        {
+            FieldsV1BinarySerializer.Instance.Write(writer, model.FieldsV1);
+            WriteString(writer, model.FieldsType);
+            WriteString(writer, model.Subresource);
+            WriteDateTime(writer, model.Time);
+            WriteString(writer, model.ApiVersion);
+            WriteString(writer, model.Operation);
+            WriteString(writer, model.Manager);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ManagedFieldsEntryV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ManagedFieldsEntryV1 model)
+        {
+            model.FieldsV1 = FieldsV1BinarySerializer.Instance.Read(reader);
+            model.FieldsType = ReadInternedString(reader);
+            model.Subresource = ReadString(reader);
+            model.Time = ReadDateTime(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Operation = ReadInternedString(reader);
+            model.Manager = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ModifyVolumeStatusV1"/>.
+    /// </summary>
+    public sealed class ModifyVolumeStatusV1BinarySerializer
+        : KubeModelBinarySerializer<ModifyVolumeStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ModifyVolumeStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static ModifyVolumeStatusV1BinarySerializer Instance { get; } = new ModifyVolumeStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ModifyVolumeStatusV1BinarySerializer"/>.
+        /// </summary>
+        public ModifyVolumeStatusV1BinarySerializer()
+            : base(schemaHash: 0xE3ECC40C5F78226BUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ModifyVolumeStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ModifyVolumeStatusV1 model)
+        {
+            WriteString(writer, model.TargetVolumeAttributesClassName);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ModifyVolumeStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ModifyVolumeStatusV1 model)
+        {
+            model.TargetVolumeAttributesClassName = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NFSVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class NFSVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<NFSVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NFSVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static NFSVolumeSourceV1BinarySerializer Instance { get; } = new NFSVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NFSVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public NFSVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xB2E3688841106469UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NFSVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NFSVolumeSourceV1 model)
+        {
+            WriteString(writer, model.Path);
+            WriteString(writer, model.Server);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NFSVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NFSVolumeSourceV1 model)
+        {
+            model.Path = ReadString(reader);
+            model.Server = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NamespaceConditionV1"/>.
+    /// </summary>
+    public sealed class NamespaceConditionV1BinarySerializer
+        : KubeModelBinarySerializer<NamespaceConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NamespaceConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static NamespaceConditionV1BinarySerializer Instance { get; } = new NamespaceConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NamespaceConditionV1BinarySerializer"/>.
+        /// </summary>
+        public NamespaceConditionV1BinarySerializer()
+            : base(schemaHash: 0xDD53B60977C20DB9UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NamespaceConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NamespaceConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NamespaceConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NamespaceConditionV1 model)
+        {
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NamespaceSpecV1"/>.
+    /// </summary>
+    public sealed class NamespaceSpecV1BinarySerializer
+        : KubeModelBinarySerializer<NamespaceSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NamespaceSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static NamespaceSpecV1BinarySerializer Instance { get; } = new NamespaceSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NamespaceSpecV1BinarySerializer"/>.
+        /// </summary>
+        public NamespaceSpecV1BinarySerializer()
+            : base(schemaHash: 0x25ABEF8A47EADF1DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NamespaceSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NamespaceSpecV1 model)
+        {
+            WriteList(writer, model.Finalizers, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NamespaceSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NamespaceSpecV1 model)
+        {
+            ReadStringList(reader, model.Finalizers, InternedStrings.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NamespaceStatusV1"/>.
+    /// </summary>
+    public sealed class NamespaceStatusV1BinarySerializer
+        : KubeModelBinarySerializer<NamespaceStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NamespaceStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static NamespaceStatusV1BinarySerializer Instance { get; } = new NamespaceStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NamespaceStatusV1BinarySerializer"/>.
+        /// </summary>
+        public NamespaceStatusV1BinarySerializer()
+            : base(schemaHash: 0xC891373B58B7E76DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NamespaceStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NamespaceStatusV1 model)
+        {
+            WriteString(writer, model.Phase);
+            WriteList(writer, model.Conditions, NamespaceConditionV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NamespaceStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NamespaceStatusV1 model)
+        {
+            model.Phase = ReadInternedString(reader);
+            ReadList(reader, model.Conditions, NamespaceConditionV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NamespaceV1"/>.
+    /// </summary>
+    public sealed class NamespaceV1BinarySerializer
+        : KubeModelBinarySerializer<NamespaceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NamespaceV1BinarySerializer"/>.
+        /// </summary>
+        public static NamespaceV1BinarySerializer Instance { get; } = new NamespaceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NamespaceV1BinarySerializer"/>.
+        /// </summary>
+        public NamespaceV1BinarySerializer()
+            : base(schemaHash: 0xDC2FAFC5C04254F0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NamespaceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NamespaceV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            NamespaceSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            NamespaceStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NamespaceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NamespaceV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = NamespaceSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = NamespaceStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeAddressV1"/>.
+    /// </summary>
+    public sealed class NodeAddressV1BinarySerializer
+        : KubeModelBinarySerializer<NodeAddressV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeAddressV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeAddressV1BinarySerializer Instance { get; } = new NodeAddressV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeAddressV1BinarySerializer"/>.
+        /// </summary>
+        public NodeAddressV1BinarySerializer()
+            : base(schemaHash: 0x212E28E17DE7FA88UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeAddressV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeAddressV1 model)
+        {
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Address);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeAddressV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeAddressV1 model)
+        {
+            model.Type = ReadInternedString(reader);
+            model.Address = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeAffinityV1"/>.
+    /// </summary>
+    public sealed class NodeAffinityV1BinarySerializer
+        : KubeModelBinarySerializer<NodeAffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeAffinityV1BinarySerializer Instance { get; } = new NodeAffinityV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public NodeAffinityV1BinarySerializer()
+            : base(schemaHash: 0x99E5766C2DA0B1D9UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeAffinityV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeAffinityV1 model)
+        {
+            WriteList(writer, model.PreferredDuringSchedulingIgnoredDuringExecution, PreferredSchedulingTermV1BinarySerializer.Instance.Write);
+            NodeSelectorV1BinarySerializer.Instance.Write(writer, model.RequiredDuringSchedulingIgnoredDuringExecution);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeAffinityV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeAffinityV1 model)
+        {
+            ReadList(reader, model.PreferredDuringSchedulingIgnoredDuringExecution, PreferredSchedulingTermV1BinarySerializer.Instance.Read);
+            model.RequiredDuringSchedulingIgnoredDuringExecution = NodeSelectorV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeConditionV1"/>.
+    /// </summary>
+    public sealed class NodeConditionV1BinarySerializer
+        : KubeModelBinarySerializer<NodeConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeConditionV1BinarySerializer Instance { get; } = new NodeConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeConditionV1BinarySerializer"/>.
+        /// </summary>
+        public NodeConditionV1BinarySerializer()
+            : base(schemaHash: 0x7A4AE418B5DECE34UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastHeartbeatTime);
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeConditionV1 model)
+        {
+            model.LastHeartbeatTime = ReadDateTime(reader);
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeConfigSourceV1"/>.
+    /// </summary>
+    public sealed class NodeConfigSourceV1BinarySerializer
+        : KubeModelBinarySerializer<NodeConfigSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeConfigSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeConfigSourceV1BinarySerializer Instance { get; } = new NodeConfigSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeConfigSourceV1BinarySerializer"/>.
+        /// </summary>
+        public NodeConfigSourceV1BinarySerializer()
+            : base(schemaHash: 0x60045D6F831E956AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeConfigSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeConfigSourceV1 model)
+        {
+            ConfigMapNodeConfigSourceV1BinarySerializer.Instance.Write(writer, model.ConfigMap);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeConfigSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeConfigSourceV1 model)
+        {
+            model.ConfigMap = ConfigMapNodeConfigSourceV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeConfigStatusV1"/>.
+    /// </summary>
+    public sealed class NodeConfigStatusV1BinarySerializer
+        : KubeModelBinarySerializer<NodeConfigStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeConfigStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeConfigStatusV1BinarySerializer Instance { get; } = new NodeConfigStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeConfigStatusV1BinarySerializer"/>.
+        /// </summary>
+        public NodeConfigStatusV1BinarySerializer()
+            : base(schemaHash: 0x0150FC2F018605FDUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeConfigStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeConfigStatusV1 model)
+        {
+            NodeConfigSourceV1BinarySerializer.Instance.Write(writer, model.Assigned);
+            NodeConfigSourceV1BinarySerializer.Instance.Write(writer, model.LastKnownGood);
+            NodeConfigSourceV1BinarySerializer.Instance.Write(writer, model.Active);
+            WriteString(writer, model.Error);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeConfigStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeConfigStatusV1 model)
+        {
+            model.Assigned = NodeConfigSourceV1BinarySerializer.Instance.Read(reader);
+            model.LastKnownGood = NodeConfigSourceV1BinarySerializer.Instance.Read(reader);
+            model.Active = NodeConfigSourceV1BinarySerializer.Instance.Read(reader);
+            model.Error = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeDaemonEndpointsV1"/>.
+    /// </summary>
+    public sealed class NodeDaemonEndpointsV1BinarySerializer
+        : KubeModelBinarySerializer<NodeDaemonEndpointsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeDaemonEndpointsV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeDaemonEndpointsV1BinarySerializer Instance { get; } = new NodeDaemonEndpointsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeDaemonEndpointsV1BinarySerializer"/>.
+        /// </summary>
+        public NodeDaemonEndpointsV1BinarySerializer()
+            : base(schemaHash: 0x9AB5365F08B99888UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeDaemonEndpointsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeDaemonEndpointsV1 model)
+        {
+            DaemonEndpointV1BinarySerializer.Instance.Write(writer, model.KubeletEndpoint);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeDaemonEndpointsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeDaemonEndpointsV1 model)
+        {
+            model.KubeletEndpoint = DaemonEndpointV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeFeaturesV1"/>.
+    /// </summary>
+    public sealed class NodeFeaturesV1BinarySerializer
+        : KubeModelBinarySerializer<NodeFeaturesV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeFeaturesV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeFeaturesV1BinarySerializer Instance { get; } = new NodeFeaturesV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeFeaturesV1BinarySerializer"/>.
+        /// </summary>
+        public NodeFeaturesV1BinarySerializer()
+            : base(schemaHash: 0x240DE4B7A30C7083UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeFeaturesV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeFeaturesV1 model)
+        {
+            WriteBoolean(writer, model.SupplementalGroupsPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeFeaturesV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeFeaturesV1 model)
+        {
+            model.SupplementalGroupsPolicy = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeRuntimeHandlerFeaturesV1"/>.
+    /// </summary>
+    public sealed class NodeRuntimeHandlerFeaturesV1BinarySerializer
+        : KubeModelBinarySerializer<NodeRuntimeHandlerFeaturesV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeRuntimeHandlerFeaturesV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeRuntimeHandlerFeaturesV1BinarySerializer Instance { get; } = new NodeRuntimeHandlerFeaturesV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeRuntimeHandlerFeaturesV1BinarySerializer"/>.
+        /// </summary>
+        public NodeRuntimeHandlerFeaturesV1BinarySerializer()
+            : base(schemaHash: 0x43AB2E64BADE3A57UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeRuntimeHandlerFeaturesV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeRuntimeHandlerFeaturesV1 model)
+        {
+            WriteBoolean(writer, model.RecursiveReadOnlyMounts);
+            WriteBoolean(writer, model.UserNamespaces);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeRuntimeHandlerFeaturesV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeRuntimeHandlerFeaturesV1 model)
+        {
+            model.RecursiveReadOnlyMounts = ReadBoolean(reader);
+            model.UserNamespaces = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeRuntimeHandlerV1"/>.
+    /// </summary>
+    public sealed class NodeRuntimeHandlerV1BinarySerializer
+        : KubeModelBinarySerializer<NodeRuntimeHandlerV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeRuntimeHandlerV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeRuntimeHandlerV1BinarySerializer Instance { get; } = new NodeRuntimeHandlerV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeRuntimeHandlerV1BinarySerializer"/>.
+        /// </summary>
+        public NodeRuntimeHandlerV1BinarySerializer()
+            : base(schemaHash: 0x38393408E4F9BC0AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeRuntimeHandlerV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeRuntimeHandlerV1 model)
+        {
+            WriteString(writer, model.Name);
+            NodeRuntimeHandlerFeaturesV1BinarySerializer.Instance.Write(writer, model.Features);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeRuntimeHandlerV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeRuntimeHandlerV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Features = NodeRuntimeHandlerFeaturesV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeSelectorRequirementV1"/>.
+    /// </summary>
+    public sealed class NodeSelectorRequirementV1BinarySerializer
+        : KubeModelBinarySerializer<NodeSelectorRequirementV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSelectorRequirementV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeSelectorRequirementV1BinarySerializer Instance { get; } = new NodeSelectorRequirementV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSelectorRequirementV1BinarySerializer"/>.
+        /// </summary>
+        public NodeSelectorRequirementV1BinarySerializer()
+            : base(schemaHash: 0xB60C81B7049956D7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeSelectorRequirementV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeSelectorRequirementV1 model)
+        {
+            WriteString(writer, model.Operator);
+            WriteList(writer, model.Values, WriteString);
+            WriteString(writer, model.Key);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeSelectorRequirementV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeSelectorRequirementV1 model)
+        {
+            model.Operator = ReadInternedString(reader);
+            ReadStringList(reader, model.Values);
+            model.Key = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeSelectorTermV1"/>.
+    /// </summary>
+    public sealed class NodeSelectorTermV1BinarySerializer
+        : KubeModelBinarySerializer<NodeSelectorTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSelectorTermV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeSelectorTermV1BinarySerializer Instance { get; } = new NodeSelectorTermV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSelectorTermV1BinarySerializer"/>.
+        /// </summary>
+        public NodeSelectorTermV1BinarySerializer()
+            : base(schemaHash: 0x3F13C9367059D9F5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeSelectorTermV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeSelectorTermV1 model)
+        {
+            WriteList(writer, model.MatchExpressions, NodeSelectorRequirementV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.MatchFields, NodeSelectorRequirementV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeSelectorTermV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeSelectorTermV1 model)
+        {
+            ReadList(reader, model.MatchExpressions, NodeSelectorRequirementV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.MatchFields, NodeSelectorRequirementV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeSelectorV1"/>.
+    /// </summary>
+    public sealed class NodeSelectorV1BinarySerializer
+        : KubeModelBinarySerializer<NodeSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeSelectorV1BinarySerializer Instance { get; } = new NodeSelectorV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public NodeSelectorV1BinarySerializer()
+            : base(schemaHash: 0xDE02192D15FCD2B5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeSelectorV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeSelectorV1 model)
+        {
+            WriteList(writer, model.NodeSelectorTerms, NodeSelectorTermV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeSelectorV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeSelectorV1 model)
+        {
+            ReadList(reader, model.NodeSelectorTerms, NodeSelectorTermV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeSpecV1"/>.
+    /// </summary>
+    public sealed class NodeSpecV1BinarySerializer
+        : KubeModelBinarySerializer<NodeSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeSpecV1BinarySerializer Instance { get; } = new NodeSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSpecV1BinarySerializer"/>.
+        /// </summary>
+        public NodeSpecV1BinarySerializer()
+            : base(schemaHash: 0xBE4BFE1CC695F4E0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeSpecV1 model)
+        {
+            WriteString(writer, model.ExternalID);
+            WriteString(writer, model.ProviderID);
+            WriteString(writer, model.PodCIDR);
+            NodeConfigSourceV1BinarySerializer.Instance.Write(writer, model.ConfigSource);
+            WriteBoolean(writer, model.Unschedulable);
+            WriteList(writer, model.PodCIDRs, WriteString);
+            WriteList(writer, model.Taints, TaintV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeSpecV1 model)
+        {
+            model.ExternalID = ReadString(reader);
+            model.ProviderID = ReadString(reader);
+            model.PodCIDR = ReadString(reader);
+            model.ConfigSource = NodeConfigSourceV1BinarySerializer.Instance.Read(reader);
+            model.Unschedulable = ReadBoolean(reader);
+            ReadStringList(reader, model.PodCIDRs);
+            ReadList(reader, model.Taints, TaintV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeStatusV1"/>.
+    /// </summary>
+    public sealed class NodeStatusV1BinarySerializer
+        : KubeModelBinarySerializer<NodeStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeStatusV1BinarySerializer Instance { get; } = new NodeStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeStatusV1BinarySerializer"/>.
+        /// </summary>
+        public NodeStatusV1BinarySerializer()
+            : base(schemaHash: 0x538F0B73AD0F4958UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeStatusV1 model)
+        {
+            WriteList(writer, model.VolumesAttached, AttachedVolumeV1BinarySerializer.Instance.Write);
+            WriteDictionary(writer, model.Allocatable, WriteString);
+            WriteString(writer, model.Phase);
+            WriteList(writer, model.VolumesInUse, WriteString);
+            NodeConfigStatusV1BinarySerializer.Instance.Write(writer, model.Config);
+            NodeSystemInfoV1BinarySerializer.Instance.Write(writer, model.NodeInfo);
+            WriteList(writer, model.Addresses, NodeAddressV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.Conditions, NodeConditionV1BinarySerializer.Instance.Write);
+            NodeDaemonEndpointsV1BinarySerializer.Instance.Write(writer, model.DaemonEndpoints);
+            NodeFeaturesV1BinarySerializer.Instance.Write(writer, model.Features);
+            WriteList(writer, model.Images, ContainerImageV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.RuntimeHandlers, NodeRuntimeHandlerV1BinarySerializer.Instance.Write);
+            WriteDictionary(writer, model.Capacity, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeStatusV1 model)
+        {
+            ReadList(reader, model.VolumesAttached, AttachedVolumeV1BinarySerializer.Instance.Read);
+            ReadStringDictionary(reader, model.Allocatable, InternedStrings.DictionaryKeys | InternedStrings.Values);
+            model.Phase = ReadInternedString(reader);
+            ReadStringList(reader, model.VolumesInUse);
+            model.Config = NodeConfigStatusV1BinarySerializer.Instance.Read(reader);
+            model.NodeInfo = NodeSystemInfoV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.Addresses, NodeAddressV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.Conditions, NodeConditionV1BinarySerializer.Instance.Read);
+            model.DaemonEndpoints = NodeDaemonEndpointsV1BinarySerializer.Instance.Read(reader);
+            model.Features = NodeFeaturesV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.Images, ContainerImageV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.RuntimeHandlers, NodeRuntimeHandlerV1BinarySerializer.Instance.Read);
+            ReadStringDictionary(reader, model.Capacity, InternedStrings.DictionaryKeys | InternedStrings.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeSystemInfoV1"/>.
+    /// </summary>
+    public sealed class NodeSystemInfoV1BinarySerializer
+        : KubeModelBinarySerializer<NodeSystemInfoV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSystemInfoV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeSystemInfoV1BinarySerializer Instance { get; } = new NodeSystemInfoV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSystemInfoV1BinarySerializer"/>.
+        /// </summary>
+        public NodeSystemInfoV1BinarySerializer()
+            : base(schemaHash: 0x1431663D91A712A6UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeSystemInfoV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeSystemInfoV1 model)
+        {
+            WriteString(writer, model.BootID);
+            WriteString(writer, model.MachineID);
+            WriteString(writer, model.SystemUUID);
+            WriteString(writer, model.Architecture);
+            WriteString(writer, model.OsImage);
+            WriteString(writer, model.OperatingSystem);
+            WriteString(writer, model.ContainerRuntimeVersion);
+            WriteString(writer, model.KernelVersion);
+            WriteString(writer, model.KubeProxyVersion);
+            WriteString(writer, model.KubeletVersion);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeSystemInfoV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeSystemInfoV1 model)
+        {
+            model.BootID = ReadString(reader);
+            model.MachineID = ReadString(reader);
+            model.SystemUUID = ReadString(reader);
+            model.Architecture = ReadString(reader);
+            model.OsImage = ReadString(reader);
+            model.OperatingSystem = ReadString(reader);
+            model.ContainerRuntimeVersion = ReadString(reader);
+            model.KernelVersion = ReadString(reader);
+            model.KubeProxyVersion = ReadString(reader);
+            model.KubeletVersion = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="NodeV1"/>.
+    /// </summary>
+    public sealed class NodeV1BinarySerializer
+        : KubeModelBinarySerializer<NodeV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeV1BinarySerializer"/>.
+        /// </summary>
+        public static NodeV1BinarySerializer Instance { get; } = new NodeV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeV1BinarySerializer"/>.
+        /// </summary>
+        public NodeV1BinarySerializer()
+            : base(schemaHash: 0x556F81AAEEE7BAACUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="NodeV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, NodeV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            NodeSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            NodeStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="NodeV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, NodeV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = NodeSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = NodeStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ObjectFieldSelectorV1"/>.
+    /// </summary>
+    public sealed class ObjectFieldSelectorV1BinarySerializer
+        : KubeModelBinarySerializer<ObjectFieldSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ObjectFieldSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public static ObjectFieldSelectorV1BinarySerializer Instance { get; } = new ObjectFieldSelectorV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ObjectFieldSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public ObjectFieldSelectorV1BinarySerializer()
+            : base(schemaHash: 0x6604D71F1D99EB16UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ObjectFieldSelectorV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ObjectFieldSelectorV1 model)
+        {
+            WriteString(writer, model.FieldPath);
+            WriteString(writer, model.ApiVersion);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ObjectFieldSelectorV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ObjectFieldSelectorV1 model)
+        {
+            model.FieldPath = ReadString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ObjectMetaV1"/>.
+    /// </summary>
+    public sealed class ObjectMetaV1BinarySerializer
+        : KubeModelBinarySerializer<ObjectMetaV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ObjectMetaV1BinarySerializer"/>.
+        /// </summary>
+        public static ObjectMetaV1BinarySerializer Instance { get; } = new ObjectMetaV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ObjectMetaV1BinarySerializer"/>.
+        /// </summary>
+        public ObjectMetaV1BinarySerializer()
+            : base(schemaHash: 0xA3CAAFE171C98571UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ObjectMetaV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ObjectMetaV1 model)
+        {
+            WriteString(writer, model.Uid);
+            WriteString(writer, model.GenerateName);
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Namespace);
+            WriteString(writer, model.SelfLink);
+            WriteInt64(writer, model.Generation);
+            WriteString(writer, model.ResourceVersion);
+            WriteDateTime(writer, model.CreationTimestamp);
+            WriteDateTime(writer, model.DeletionTimestamp);
+            WriteDictionary(writer, model.Annotations, WriteString);
+            WriteInt64(writer, model.DeletionGracePeriodSeconds);
+            WriteList(writer, model.Finalizers, WriteString);
+            WriteDictionary(writer, model.Labels, WriteString);
+            WriteList(writer, model.ManagedFields, ManagedFieldsEntryV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.OwnerReferences, OwnerReferenceV1BinarySerializer.Instance.Write);
+            WriteJson(writer, model.ExtensionData);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ObjectMetaV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ObjectMetaV1 model)
+        {
+            model.Uid = ReadString(reader);
+            model.GenerateName = ReadInternedString(reader);
+            model.Name = ReadString(reader);
+            model.Namespace = ReadInternedString(reader);
+            model.SelfLink = ReadString(reader);
+            model.Generation = ReadInt64(reader);
+            model.ResourceVersion = ReadString(reader);
+            model.CreationTimestamp = ReadDateTime(reader);
+            model.DeletionTimestamp = ReadDateTime(reader);
+            ReadStringDictionary(reader, model.Annotations, InternedStrings.DictionaryKeys);
+            model.DeletionGracePeriodSeconds = ReadInt64(reader);
+            ReadStringList(reader, model.Finalizers, InternedStrings.Values);
+            ReadStringDictionary(reader, model.Labels, InternedStrings.DictionaryKeys | InternedStrings.Values);
+            ReadList(reader, model.ManagedFields, ManagedFieldsEntryV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.OwnerReferences, OwnerReferenceV1BinarySerializer.Instance.Read);
+            ReadJson(reader, model.ExtensionData);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class ObjectReferenceV1BinarySerializer
+        : KubeModelBinarySerializer<ObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public static ObjectReferenceV1BinarySerializer Instance { get; } = new ObjectReferenceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public ObjectReferenceV1BinarySerializer()
+            : base(schemaHash: 0x877599AE7085DA23UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ObjectReferenceV1 model)
+        {
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.Uid);
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Namespace);
+            WriteString(writer, model.FieldPath);
+            WriteString(writer, model.ApiVersion);
+            WriteString(writer, model.ResourceVersion);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ObjectReferenceV1 model)
+        {
+            model.Kind = ReadInternedString(reader);
+            model.Uid = ReadString(reader);
+            model.Name = ReadString(reader);
+            model.Namespace = ReadInternedString(reader);
+            model.FieldPath = ReadString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.ResourceVersion = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="OwnerReferenceV1"/>.
+    /// </summary>
+    public sealed class OwnerReferenceV1BinarySerializer
+        : KubeModelBinarySerializer<OwnerReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="OwnerReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public static OwnerReferenceV1BinarySerializer Instance { get; } = new OwnerReferenceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="OwnerReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public OwnerReferenceV1BinarySerializer()
+            : base(schemaHash: 0x88EAD01DA0EF0A68UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="OwnerReferenceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, OwnerReferenceV1 model)
+        {
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.Uid);
+            WriteString(writer, model.Name);
+            WriteString(writer, model.ApiVersion);
+            WriteBoolean(writer, model.BlockOwnerDeletion);
+            WriteBoolean(writer, model.Controller);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="OwnerReferenceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, OwnerReferenceV1 model)
+        {
+            model.Kind = ReadInternedString(reader);
+            model.Uid = ReadString(reader);
+            model.Name = ReadString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.BlockOwnerDeletion = ReadBoolean(reader);
+            model.Controller = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeClaimConditionV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimConditionV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeClaimConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeClaimConditionV1BinarySerializer Instance { get; } = new PersistentVolumeClaimConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimConditionV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeClaimConditionV1BinarySerializer()
+            : base(schemaHash: 0xB0B46483CB3398F1UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeClaimConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeClaimConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastProbeTime);
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeClaimConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeClaimConditionV1 model)
+        {
+            model.LastProbeTime = ReadDateTime(reader);
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeClaimSpecV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimSpecV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeClaimSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeClaimSpecV1BinarySerializer Instance { get; } = new PersistentVolumeClaimSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimSpecV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeClaimSpecV1BinarySerializer()
+            : base(schemaHash: 0x3412B8716010D1F0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeClaimSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeClaimSpecV1 model)
+        {
+            TypedLocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.DataSource);
+            WriteString(writer, model.StorageClassName);
+            WriteString(writer, model.VolumeAttributesClassName);
+            WriteString(writer, model.VolumeMode);
+            WriteString(writer, model.VolumeName);
+            TypedObjectReferenceV1BinarySerializer.Instance.Write(writer, model.DataSourceRef);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.Selector);
+            WriteList(writer, model.AccessModes, WriteString);
+            VolumeResourceRequirementsV1BinarySerializer.Instance.Write(writer, model.Resources);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeClaimSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeClaimSpecV1 model)
+        {
+            model.DataSource = TypedLocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.StorageClassName = ReadInternedString(reader);
+            model.VolumeAttributesClassName = ReadInternedString(reader);
+            model.VolumeMode = ReadString(reader);
+            model.VolumeName = ReadString(reader);
+            model.DataSourceRef = TypedObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Selector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            ReadStringList(reader, model.AccessModes);
+            model.Resources = VolumeResourceRequirementsV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeClaimStatusV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimStatusV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeClaimStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeClaimStatusV1BinarySerializer Instance { get; } = new PersistentVolumeClaimStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimStatusV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeClaimStatusV1BinarySerializer()
+            : base(schemaHash: 0xB3FE6ADB547B2E40UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeClaimStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeClaimStatusV1 model)
+        {
+            WriteString(writer, model.CurrentVolumeAttributesClassName);
+            WriteString(writer, model.Phase);
+            WriteList(writer, model.AccessModes, WriteString);
+            WriteDictionary(writer, model.AllocatedResourceStatuses, WriteString);
+            WriteDictionary(writer, model.AllocatedResources, WriteString);
+            WriteList(writer, model.Conditions, PersistentVolumeClaimConditionV1BinarySerializer.Instance.Write);
+            ModifyVolumeStatusV1BinarySerializer.Instance.Write(writer, model.ModifyVolumeStatus);
+            WriteDictionary(writer, model.Capacity, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeClaimStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeClaimStatusV1 model)
+        {
+            model.CurrentVolumeAttributesClassName = ReadInternedString(reader);
+            model.Phase = ReadInternedString(reader);
+            ReadStringList(reader, model.AccessModes);
+            ReadStringDictionary(reader, model.AllocatedResourceStatuses);
+            ReadStringDictionary(reader, model.AllocatedResources);
+            ReadList(reader, model.Conditions, PersistentVolumeClaimConditionV1BinarySerializer.Instance.Read);
+            model.ModifyVolumeStatus = ModifyVolumeStatusV1BinarySerializer.Instance.Read(reader);
+            ReadStringDictionary(reader, model.Capacity, InternedStrings.DictionaryKeys | InternedStrings.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeClaimTemplateV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimTemplateV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeClaimTemplateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimTemplateV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeClaimTemplateV1BinarySerializer Instance { get; } = new PersistentVolumeClaimTemplateV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimTemplateV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeClaimTemplateV1BinarySerializer()
+            : base(schemaHash: 0xD63DBE195CEAAFB1UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeClaimTemplateV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeClaimTemplateV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            PersistentVolumeClaimSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeClaimTemplateV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeClaimTemplateV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = PersistentVolumeClaimSpecV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeClaimV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeClaimV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeClaimV1BinarySerializer Instance { get; } = new PersistentVolumeClaimV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeClaimV1BinarySerializer()
+            : base(schemaHash: 0xE5490346FEED33C5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeClaimV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeClaimV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            PersistentVolumeClaimSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            PersistentVolumeClaimStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeClaimV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeClaimV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = PersistentVolumeClaimSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = PersistentVolumeClaimStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeClaimVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeClaimVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeClaimVolumeSourceV1BinarySerializer Instance { get; } = new PersistentVolumeClaimVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeClaimVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x7D048BB048F83973UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeClaimVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeClaimVolumeSourceV1 model)
+        {
+            WriteString(writer, model.ClaimName);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeClaimVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeClaimVolumeSourceV1 model)
+        {
+            model.ClaimName = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeSpecV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeSpecV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeSpecV1BinarySerializer Instance { get; } = new PersistentVolumeSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeSpecV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeSpecV1BinarySerializer()
+            : base(schemaHash: 0xE219CD8BCB3095E5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeSpecV1 model)
+        {
+            ScaleIOPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.ScaleIO);
+            FCVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Fc);
+            RBDPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Rbd);
+            AWSElasticBlockStoreVolumeSourceV1BinarySerializer.Instance.Write(writer, model.AwsElasticBlockStore);
+            AzureFilePersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.AzureFile);
+            FlexPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.FlexVolume);
+            PortworxVolumeSourceV1BinarySerializer.Instance.Write(writer, model.PortworxVolume);
+            QuobyteVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Quobyte);
+            WriteString(writer, model.StorageClassName);
+            WriteString(writer, model.VolumeAttributesClassName);
+            WriteString(writer, model.VolumeMode);
+            VsphereVirtualDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.VsphereVolume);
+            ObjectReferenceV1BinarySerializer.Instance.Write(writer, model.ClaimRef);
+            HostPathVolumeSourceV1BinarySerializer.Instance.Write(writer, model.HostPath);
+            CSIPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Csi);
+            ISCSIPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Iscsi);
+            AzureDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.AzureDisk);
+            GCEPersistentDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.GcePersistentDisk);
+            PhotonPersistentDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.PhotonPersistentDisk);
+            LocalVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Local);
+            CinderPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Cinder);
+            FlockerVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Flocker);
+            WriteList(writer, model.AccessModes, WriteString);
+            CephFSPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Cephfs);
+            GlusterfsPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Glusterfs);
+            WriteList(writer, model.MountOptions, WriteString);
+            NFSVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Nfs);
+            StorageOSPersistentVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Storageos);
+            WriteDictionary(writer, model.Capacity, WriteString);
+            VolumeNodeAffinityV1BinarySerializer.Instance.Write(writer, model.NodeAffinity);
+            WriteString(writer, model.PersistentVolumeReclaimPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeSpecV1 model)
+        {
+            model.ScaleIO = ScaleIOPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Fc = FCVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Rbd = RBDPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.AwsElasticBlockStore = AWSElasticBlockStoreVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.AzureFile = AzureFilePersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.FlexVolume = FlexPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.PortworxVolume = PortworxVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Quobyte = QuobyteVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.StorageClassName = ReadInternedString(reader);
+            model.VolumeAttributesClassName = ReadInternedString(reader);
+            model.VolumeMode = ReadString(reader);
+            model.VsphereVolume = VsphereVirtualDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.ClaimRef = ObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.HostPath = HostPathVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Csi = CSIPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Iscsi = ISCSIPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.AzureDisk = AzureDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.GcePersistentDisk = GCEPersistentDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.PhotonPersistentDisk = PhotonPersistentDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Local = LocalVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Cinder = CinderPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Flocker = FlockerVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            ReadStringList(reader, model.AccessModes);
+            model.Cephfs = CephFSPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Glusterfs = GlusterfsPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            ReadStringList(reader, model.MountOptions);
+            model.Nfs = NFSVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Storageos = StorageOSPersistentVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            ReadStringDictionary(reader, model.Capacity, InternedStrings.DictionaryKeys | InternedStrings.Values);
+            model.NodeAffinity = VolumeNodeAffinityV1BinarySerializer.Instance.Read(reader);
+            model.PersistentVolumeReclaimPolicy = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeStatusV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeStatusV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeStatusV1BinarySerializer Instance { get; } = new PersistentVolumeStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeStatusV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeStatusV1BinarySerializer()
+            : base(schemaHash: 0x27B9C9E62CB20D12UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeStatusV1 model)
+        {
+            WriteDateTime(writer, model.LastPhaseTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Phase);
+            WriteString(writer, model.Reason);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeStatusV1 model)
+        {
+            model.LastPhaseTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Phase = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PersistentVolumeV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeV1BinarySerializer
+        : KubeModelBinarySerializer<PersistentVolumeV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeV1BinarySerializer"/>.
+        /// </summary>
+        public static PersistentVolumeV1BinarySerializer Instance { get; } = new PersistentVolumeV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeV1BinarySerializer"/>.
+        /// </summary>
+        public PersistentVolumeV1BinarySerializer()
+            : base(schemaHash: 0xE9EECABEE9886114UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PersistentVolumeV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PersistentVolumeV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            PersistentVolumeSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            PersistentVolumeStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PersistentVolumeV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PersistentVolumeV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = PersistentVolumeSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = PersistentVolumeStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PhotonPersistentDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class PhotonPersistentDiskVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<PhotonPersistentDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PhotonPersistentDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static PhotonPersistentDiskVolumeSourceV1BinarySerializer Instance { get; } = new PhotonPersistentDiskVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PhotonPersistentDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public PhotonPersistentDiskVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xD3750FBD7E342FC9UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PhotonPersistentDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PhotonPersistentDiskVolumeSourceV1 model)
+        {
+            WriteString(writer, model.PdID);
+            WriteString(writer, model.FsType);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PhotonPersistentDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PhotonPersistentDiskVolumeSourceV1 model)
+        {
+            model.PdID = ReadString(reader);
+            model.FsType = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodAffinityTermV1"/>.
+    /// </summary>
+    public sealed class PodAffinityTermV1BinarySerializer
+        : KubeModelBinarySerializer<PodAffinityTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodAffinityTermV1BinarySerializer"/>.
+        /// </summary>
+        public static PodAffinityTermV1BinarySerializer Instance { get; } = new PodAffinityTermV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodAffinityTermV1BinarySerializer"/>.
+        /// </summary>
+        public PodAffinityTermV1BinarySerializer()
+            : base(schemaHash: 0xF6121319FD2061F7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodAffinityTermV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodAffinityTermV1 model)
+        {
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.LabelSelector);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.NamespaceSelector);
+            WriteList(writer, model.MatchLabelKeys, WriteString);
+            WriteList(writer, model.MismatchLabelKeys, WriteString);
+            WriteList(writer, model.Namespaces, WriteString);
+            WriteString(writer, model.TopologyKey);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodAffinityTermV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodAffinityTermV1 model)
+        {
+            model.LabelSelector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            model.NamespaceSelector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            ReadStringList(reader, model.MatchLabelKeys);
+            ReadStringList(reader, model.MismatchLabelKeys);
+            ReadStringList(reader, model.Namespaces);
+            model.TopologyKey = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodAffinityV1"/>.
+    /// </summary>
+    public sealed class PodAffinityV1BinarySerializer
+        : KubeModelBinarySerializer<PodAffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public static PodAffinityV1BinarySerializer Instance { get; } = new PodAffinityV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public PodAffinityV1BinarySerializer()
+            : base(schemaHash: 0x668F3E4EB8A1AA82UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodAffinityV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodAffinityV1 model)
+        {
+            WriteList(writer, model.PreferredDuringSchedulingIgnoredDuringExecution, WeightedPodAffinityTermV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.RequiredDuringSchedulingIgnoredDuringExecution, PodAffinityTermV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodAffinityV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodAffinityV1 model)
+        {
+            ReadList(reader, model.PreferredDuringSchedulingIgnoredDuringExecution, WeightedPodAffinityTermV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.RequiredDuringSchedulingIgnoredDuringExecution, PodAffinityTermV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodAntiAffinityV1"/>.
+    /// </summary>
+    public sealed class PodAntiAffinityV1BinarySerializer
+        : KubeModelBinarySerializer<PodAntiAffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodAntiAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public static PodAntiAffinityV1BinarySerializer Instance { get; } = new PodAntiAffinityV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodAntiAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public PodAntiAffinityV1BinarySerializer()
+            : base(schemaHash: 0x05E038CB05D73A02UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodAntiAffinityV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodAntiAffinityV1 model)
+        {
+            WriteList(writer, model.PreferredDuringSchedulingIgnoredDuringExecution, WeightedPodAffinityTermV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.RequiredDuringSchedulingIgnoredDuringExecution, PodAffinityTermV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodAntiAffinityV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodAntiAffinityV1 model)
+        {
+            ReadList(reader, model.PreferredDuringSchedulingIgnoredDuringExecution, WeightedPodAffinityTermV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.RequiredDuringSchedulingIgnoredDuringExecution, PodAffinityTermV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodConditionV1"/>.
+    /// </summary>
+    public sealed class PodConditionV1BinarySerializer
+        : KubeModelBinarySerializer<PodConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static PodConditionV1BinarySerializer Instance { get; } = new PodConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodConditionV1BinarySerializer"/>.
+        /// </summary>
+        public PodConditionV1BinarySerializer()
+            : base(schemaHash: 0x19CBA8D6CD55ED10UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastProbeTime);
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodConditionV1 model)
+        {
+            model.LastProbeTime = ReadDateTime(reader);
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodDNSConfigOptionV1"/>.
+    /// </summary>
+    public sealed class PodDNSConfigOptionV1BinarySerializer
+        : KubeModelBinarySerializer<PodDNSConfigOptionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodDNSConfigOptionV1BinarySerializer"/>.
+        /// </summary>
+        public static PodDNSConfigOptionV1BinarySerializer Instance { get; } = new PodDNSConfigOptionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodDNSConfigOptionV1BinarySerializer"/>.
+        /// </summary>
+        public PodDNSConfigOptionV1BinarySerializer()
+            : base(schemaHash: 0xAAE2D57397814FA3UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodDNSConfigOptionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodDNSConfigOptionV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Value);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodDNSConfigOptionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodDNSConfigOptionV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Value = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodDNSConfigV1"/>.
+    /// </summary>
+    public sealed class PodDNSConfigV1BinarySerializer
+        : KubeModelBinarySerializer<PodDNSConfigV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodDNSConfigV1BinarySerializer"/>.
+        /// </summary>
+        public static PodDNSConfigV1BinarySerializer Instance { get; } = new PodDNSConfigV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodDNSConfigV1BinarySerializer"/>.
+        /// </summary>
+        public PodDNSConfigV1BinarySerializer()
+            : base(schemaHash: 0x9B31B046C87EAEE5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodDNSConfigV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodDNSConfigV1 model)
+        {
+            WriteList(writer, model.Nameservers, WriteString);
+            WriteList(writer, model.Options, PodDNSConfigOptionV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.Searches, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodDNSConfigV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodDNSConfigV1 model)
+        {
+            ReadStringList(reader, model.Nameservers);
+            ReadList(reader, model.Options, PodDNSConfigOptionV1BinarySerializer.Instance.Read);
+            ReadStringList(reader, model.Searches);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodFailurePolicyOnExitCodesRequirementV1"/>.
+    /// </summary>
+    public sealed class PodFailurePolicyOnExitCodesRequirementV1BinarySerializer
+        : KubeModelBinarySerializer<PodFailurePolicyOnExitCodesRequirementV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodFailurePolicyOnExitCodesRequirementV1BinarySerializer"/>.
+        /// </summary>
+        public static PodFailurePolicyOnExitCodesRequirementV1BinarySerializer Instance { get; } = new PodFailurePolicyOnExitCodesRequirementV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodFailurePolicyOnExitCodesRequirementV1BinarySerializer"/>.
+        /// </summary>
+        public PodFailurePolicyOnExitCodesRequirementV1BinarySerializer()
+            : base(schemaHash: 0x5D1BFBFB196FFFD6UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodFailurePolicyOnExitCodesRequirementV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodFailurePolicyOnExitCodesRequirementV1 model)
+        {
+            WriteString(writer, model.ContainerName);
+            WriteString(writer, model.Operator);
+            WriteJson(writer, model.Values);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodFailurePolicyOnExitCodesRequirementV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodFailurePolicyOnExitCodesRequirementV1 model)
+        {
+            model.ContainerName = ReadString(reader);
+            model.Operator = ReadInternedString(reader);
+            ReadJson(reader, model.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodFailurePolicyOnPodConditionsPatternV1"/>.
+    /// </summary>
+    public sealed class PodFailurePolicyOnPodConditionsPatternV1BinarySerializer
+        : KubeModelBinarySerializer<PodFailurePolicyOnPodConditionsPatternV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodFailurePolicyOnPodConditionsPatternV1BinarySerializer"/>.
+        /// </summary>
+        public static PodFailurePolicyOnPodConditionsPatternV1BinarySerializer Instance { get; } = new PodFailurePolicyOnPodConditionsPatternV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodFailurePolicyOnPodConditionsPatternV1BinarySerializer"/>.
+        /// </summary>
+        public PodFailurePolicyOnPodConditionsPatternV1BinarySerializer()
+            : base(schemaHash: 0xA3865C67385F116EUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodFailurePolicyOnPodConditionsPatternV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodFailurePolicyOnPodConditionsPatternV1 model)
+        {
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodFailurePolicyOnPodConditionsPatternV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodFailurePolicyOnPodConditionsPatternV1 model)
+        {
+            model.Type = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodFailurePolicyRuleV1"/>.
+    /// </summary>
+    public sealed class PodFailurePolicyRuleV1BinarySerializer
+        : KubeModelBinarySerializer<PodFailurePolicyRuleV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodFailurePolicyRuleV1BinarySerializer"/>.
+        /// </summary>
+        public static PodFailurePolicyRuleV1BinarySerializer Instance { get; } = new PodFailurePolicyRuleV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodFailurePolicyRuleV1BinarySerializer"/>.
+        /// </summary>
+        public PodFailurePolicyRuleV1BinarySerializer()
+            : base(schemaHash: 0xDC8117A164C178E0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodFailurePolicyRuleV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodFailurePolicyRuleV1 model)
+        {
+            WriteString(writer, model.Action);
+            PodFailurePolicyOnExitCodesRequirementV1BinarySerializer.Instance.Write(writer, model.OnExitCodes);
+            WriteList(writer, model.OnPodConditions, PodFailurePolicyOnPodConditionsPatternV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodFailurePolicyRuleV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodFailurePolicyRuleV1 model)
+        {
+            model.Action = ReadString(reader);
+            model.OnExitCodes = PodFailurePolicyOnExitCodesRequirementV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.OnPodConditions, PodFailurePolicyOnPodConditionsPatternV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodFailurePolicyV1"/>.
+    /// </summary>
+    public sealed class PodFailurePolicyV1BinarySerializer
+        : KubeModelBinarySerializer<PodFailurePolicyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodFailurePolicyV1BinarySerializer"/>.
+        /// </summary>
+        public static PodFailurePolicyV1BinarySerializer Instance { get; } = new PodFailurePolicyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodFailurePolicyV1BinarySerializer"/>.
+        /// </summary>
+        public PodFailurePolicyV1BinarySerializer()
+            : base(schemaHash: 0xBF7A63F993209303UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodFailurePolicyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodFailurePolicyV1 model)
+        {
+            WriteList(writer, model.Rules, PodFailurePolicyRuleV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodFailurePolicyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodFailurePolicyV1 model)
+        {
+            ReadList(reader, model.Rules, PodFailurePolicyRuleV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodIPV1"/>.
+    /// </summary>
+    public sealed class PodIPV1BinarySerializer
+        : KubeModelBinarySerializer<PodIPV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodIPV1BinarySerializer"/>.
+        /// </summary>
+        public static PodIPV1BinarySerializer Instance { get; } = new PodIPV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodIPV1BinarySerializer"/>.
+        /// </summary>
+        public PodIPV1BinarySerializer()
+            : base(schemaHash: 0x4469F8C27527EBD0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodIPV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodIPV1 model)
+        {
+            WriteString(writer, model.Ip);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodIPV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodIPV1 model)
+        {
+            model.Ip = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodOSV1"/>.
+    /// </summary>
+    public sealed class PodOSV1BinarySerializer
+        : KubeModelBinarySerializer<PodOSV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodOSV1BinarySerializer"/>.
+        /// </summary>
+        public static PodOSV1BinarySerializer Instance { get; } = new PodOSV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodOSV1BinarySerializer"/>.
+        /// </summary>
+        public PodOSV1BinarySerializer()
+            : base(schemaHash: 0xE96AEFE3416A7743UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodOSV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodOSV1 model)
+        {
+            WriteString(writer, model.Name);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodOSV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodOSV1 model)
+        {
+            model.Name = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodReadinessGateV1"/>.
+    /// </summary>
+    public sealed class PodReadinessGateV1BinarySerializer
+        : KubeModelBinarySerializer<PodReadinessGateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodReadinessGateV1BinarySerializer"/>.
+        /// </summary>
+        public static PodReadinessGateV1BinarySerializer Instance { get; } = new PodReadinessGateV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodReadinessGateV1BinarySerializer"/>.
+        /// </summary>
+        public PodReadinessGateV1BinarySerializer()
+            : base(schemaHash: 0x0D0E5FA37169E7D7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodReadinessGateV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodReadinessGateV1 model)
+        {
+            WriteString(writer, model.ConditionType);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodReadinessGateV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodReadinessGateV1 model)
+        {
+            model.ConditionType = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodResourceClaimStatusV1"/>.
+    /// </summary>
+    public sealed class PodResourceClaimStatusV1BinarySerializer
+        : KubeModelBinarySerializer<PodResourceClaimStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodResourceClaimStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static PodResourceClaimStatusV1BinarySerializer Instance { get; } = new PodResourceClaimStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodResourceClaimStatusV1BinarySerializer"/>.
+        /// </summary>
+        public PodResourceClaimStatusV1BinarySerializer()
+            : base(schemaHash: 0xDCE4A4393E0CBAFEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodResourceClaimStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodResourceClaimStatusV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.ResourceClaimName);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodResourceClaimStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodResourceClaimStatusV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.ResourceClaimName = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodResourceClaimV1"/>.
+    /// </summary>
+    public sealed class PodResourceClaimV1BinarySerializer
+        : KubeModelBinarySerializer<PodResourceClaimV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodResourceClaimV1BinarySerializer"/>.
+        /// </summary>
+        public static PodResourceClaimV1BinarySerializer Instance { get; } = new PodResourceClaimV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodResourceClaimV1BinarySerializer"/>.
+        /// </summary>
+        public PodResourceClaimV1BinarySerializer()
+            : base(schemaHash: 0x1235894B78606A61UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodResourceClaimV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodResourceClaimV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.ResourceClaimName);
+            WriteString(writer, model.ResourceClaimTemplateName);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodResourceClaimV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodResourceClaimV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.ResourceClaimName = ReadString(reader);
+            model.ResourceClaimTemplateName = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodSchedulingGateV1"/>.
+    /// </summary>
+    public sealed class PodSchedulingGateV1BinarySerializer
+        : KubeModelBinarySerializer<PodSchedulingGateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodSchedulingGateV1BinarySerializer"/>.
+        /// </summary>
+        public static PodSchedulingGateV1BinarySerializer Instance { get; } = new PodSchedulingGateV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodSchedulingGateV1BinarySerializer"/>.
+        /// </summary>
+        public PodSchedulingGateV1BinarySerializer()
+            : base(schemaHash: 0x75AB0C64A5DA5F05UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodSchedulingGateV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodSchedulingGateV1 model)
+        {
+            WriteString(writer, model.Name);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodSchedulingGateV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodSchedulingGateV1 model)
+        {
+            model.Name = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodSecurityContextV1"/>.
+    /// </summary>
+    public sealed class PodSecurityContextV1BinarySerializer
+        : KubeModelBinarySerializer<PodSecurityContextV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodSecurityContextV1BinarySerializer"/>.
+        /// </summary>
+        public static PodSecurityContextV1BinarySerializer Instance { get; } = new PodSecurityContextV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodSecurityContextV1BinarySerializer"/>.
+        /// </summary>
+        public PodSecurityContextV1BinarySerializer()
+            : base(schemaHash: 0xA9B15BB11CEB92BEUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodSecurityContextV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodSecurityContextV1 model)
+        {
+            AppArmorProfileV1BinarySerializer.Instance.Write(writer, model.AppArmorProfile);
+            SeccompProfileV1BinarySerializer.Instance.Write(writer, model.SeccompProfile);
+            WriteInt64(writer, model.FsGroup);
+            WriteInt64(writer, model.RunAsGroup);
+            WriteInt64(writer, model.RunAsUser);
+            SELinuxOptionsV1BinarySerializer.Instance.Write(writer, model.SeLinuxOptions);
+            WriteJson(writer, model.SupplementalGroups);
+            WriteList(writer, model.Sysctls, SysctlV1BinarySerializer.Instance.Write);
+            WindowsSecurityContextOptionsV1BinarySerializer.Instance.Write(writer, model.WindowsOptions);
+            WriteBoolean(writer, model.RunAsNonRoot);
+            WriteString(writer, model.FsGroupChangePolicy);
+            WriteString(writer, model.SupplementalGroupsPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodSecurityContextV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodSecurityContextV1 model)
+        {
+            model.AppArmorProfile = AppArmorProfileV1BinarySerializer.Instance.Read(reader);
+            model.SeccompProfile = SeccompProfileV1BinarySerializer.Instance.Read(reader);
+            model.FsGroup = ReadInt64(reader);
+            model.RunAsGroup = ReadInt64(reader);
+            model.RunAsUser = ReadInt64(reader);
+            model.SeLinuxOptions = SELinuxOptionsV1BinarySerializer.Instance.Read(reader);
+            ReadJson(reader, model.SupplementalGroups);
+            ReadList(reader, model.Sysctls, SysctlV1BinarySerializer.Instance.Read);
+            model.WindowsOptions = WindowsSecurityContextOptionsV1BinarySerializer.Instance.Read(reader);
+            model.RunAsNonRoot = ReadBoolean(reader);
+            model.FsGroupChangePolicy = ReadInternedString(reader);
+            model.SupplementalGroupsPolicy = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodSpecV1"/>.
+    /// </summary>
+    public sealed class PodSpecV1BinarySerializer
+        : KubeModelBinarySerializer<PodSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static PodSpecV1BinarySerializer Instance { get; } = new PodSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodSpecV1BinarySerializer"/>.
+        /// </summary>
+        public PodSpecV1BinarySerializer()
+            : base(schemaHash: 0x7E61DA0D7095612DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodSpecV1 model)
+        {
+            WriteBoolean(writer, model.HostIPC);
+            WriteBoolean(writer, model.HostPID);
+            WriteBoolean(writer, model.SetHostnameAsFQDN);
+            WriteDictionary(writer, model.Overhead, WriteString);
+            WriteString(writer, model.Hostname);
+            WriteString(writer, model.NodeName);
+            WriteString(writer, model.PriorityClassName);
+            WriteString(writer, model.RuntimeClassName);
+            WriteString(writer, model.SchedulerName);
+            WriteString(writer, model.ServiceAccountName);
+            WriteBoolean(writer, model.ShareProcessNamespace);
+            PodDNSConfigV1BinarySerializer.Instance.Write(writer, model.DnsConfig);
+            WriteBoolean(writer, model.HostNetwork);
+            WriteBoolean(writer, model.AutomountServiceAccountToken);
+            WriteString(writer, model.Subdomain);
+            WriteDictionary(writer, model.NodeSelector, WriteString);
+            WriteInt64(writer, model.ActiveDeadlineSeconds);
+            WriteList(writer, model.Containers, ContainerV1BinarySerializer.Instance.Write);
+            WriteBoolean(writer, model.EnableServiceLinks);
+            WriteList(writer, model.EphemeralContainers, EphemeralContainerV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.HostAliases, HostAliasV1BinarySerializer.Instance.Write);
+            WriteBoolean(writer, model.HostUsers);
+            WriteList(writer, model.ImagePullSecrets, LocalObjectReferenceV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.InitContainers, ContainerV1BinarySerializer.Instance.Write);
+            PodOSV1BinarySerializer.Instance.Write(writer, model.Os);
+            WriteList(writer, model.ReadinessGates, PodReadinessGateV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.ResourceClaims, PodResourceClaimV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.SchedulingGates, PodSchedulingGateV1BinarySerializer.Instance.Write);
+            WriteInt64(writer, model.TerminationGracePeriodSeconds);
+            WriteList(writer, model.Tolerations, TolerationV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.TopologySpreadConstraints, TopologySpreadConstraintV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.Volumes, VolumeV1BinarySerializer.Instance.Write);
+            PodSecurityContextV1BinarySerializer.Instance.Write(writer, model.SecurityContext);
+            WriteString(writer, model.ServiceAccount);
+            AffinityV1BinarySerializer.Instance.Write(writer, model.Affinity);
+            WriteString(writer, model.DnsPolicy);
+            WriteString(writer, model.PreemptionPolicy);
+            WriteInt32(writer, model.Priority);
+            WriteString(writer, model.RestartPolicy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodSpecV1 model)
+        {
+            model.HostIPC = ReadBoolean(reader);
+            model.HostPID = ReadBoolean(reader);
+            model.SetHostnameAsFQDN = ReadBoolean(reader);
+            ReadStringDictionary(reader, model.Overhead);
+            model.Hostname = ReadString(reader);
+            model.NodeName = ReadInternedString(reader);
+            model.PriorityClassName = ReadInternedString(reader);
+            model.RuntimeClassName = ReadInternedString(reader);
+            model.SchedulerName = ReadInternedString(reader);
+            model.ServiceAccountName = ReadInternedString(reader);
+            model.ShareProcessNamespace = ReadBoolean(reader);
+            model.DnsConfig = PodDNSConfigV1BinarySerializer.Instance.Read(reader);
+            model.HostNetwork = ReadBoolean(reader);
+            model.AutomountServiceAccountToken = ReadBoolean(reader);
+            model.Subdomain = ReadString(reader);
+            ReadStringDictionary(reader, model.NodeSelector, InternedStrings.DictionaryKeys | InternedStrings.Values);
+            model.ActiveDeadlineSeconds = ReadInt64(reader);
+            ReadList(reader, model.Containers, ContainerV1BinarySerializer.Instance.Read);
+            model.EnableServiceLinks = ReadBoolean(reader);
+            ReadList(reader, model.EphemeralContainers, EphemeralContainerV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.HostAliases, HostAliasV1BinarySerializer.Instance.Read);
+            model.HostUsers = ReadBoolean(reader);
+            ReadList(reader, model.ImagePullSecrets, LocalObjectReferenceV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.InitContainers, ContainerV1BinarySerializer.Instance.Read);
+            model.Os = PodOSV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.ReadinessGates, PodReadinessGateV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.ResourceClaims, PodResourceClaimV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.SchedulingGates, PodSchedulingGateV1BinarySerializer.Instance.Read);
+            model.TerminationGracePeriodSeconds = ReadInt64(reader);
+            ReadList(reader, model.Tolerations, TolerationV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.TopologySpreadConstraints, TopologySpreadConstraintV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.Volumes, VolumeV1BinarySerializer.Instance.Read);
+            model.SecurityContext = PodSecurityContextV1BinarySerializer.Instance.Read(reader);
+            model.ServiceAccount = ReadInternedString(reader);
+            model.Affinity = AffinityV1BinarySerializer.Instance.Read(reader);
+            model.DnsPolicy = ReadInternedString(reader);
+            model.PreemptionPolicy = ReadInternedString(reader);
+            model.Priority = ReadInt32(reader);
+            model.RestartPolicy = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodStatusV1"/>.
+    /// </summary>
+    public sealed class PodStatusV1BinarySerializer
+        : KubeModelBinarySerializer<PodStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static PodStatusV1BinarySerializer Instance { get; } = new PodStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodStatusV1BinarySerializer"/>.
+        /// </summary>
+        public PodStatusV1BinarySerializer()
+            : base(schemaHash: 0x55869D7B759FFEE7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodStatusV1 model)
+        {
+            WriteString(writer, model.HostIP);
+            WriteString(writer, model.PodIP);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.NominatedNodeName);
+            WriteString(writer, model.Phase);
+            WriteString(writer, model.Resize);
+            WriteDateTime(writer, model.StartTime);
+            WriteString(writer, model.Reason);
+            WriteList(writer, model.Conditions, PodConditionV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.ContainerStatuses, ContainerStatusV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.EphemeralContainerStatuses, ContainerStatusV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.HostIPs, HostIPV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.InitContainerStatuses, ContainerStatusV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.PodIPs, PodIPV1BinarySerializer.Instance.Write);
+            WriteString(writer, model.QosClass);
+            WriteList(writer, model.ResourceClaimStatuses, PodResourceClaimStatusV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodStatusV1 model)
+        {
+            model.HostIP = ReadInternedString(reader);
+            model.PodIP = ReadString(reader);
+            model.Message = ReadString(reader);
+            model.NominatedNodeName = ReadString(reader);
+            model.Phase = ReadInternedString(reader);
+            model.Resize = ReadString(reader);
+            model.StartTime = ReadDateTime(reader);
+            model.Reason = ReadInternedString(reader);
+            ReadList(reader, model.Conditions, PodConditionV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.ContainerStatuses, ContainerStatusV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.EphemeralContainerStatuses, ContainerStatusV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.HostIPs, HostIPV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.InitContainerStatuses, ContainerStatusV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.PodIPs, PodIPV1BinarySerializer.Instance.Read);
+            model.QosClass = ReadInternedString(reader);
+            ReadList(reader, model.ResourceClaimStatuses, PodResourceClaimStatusV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodTemplateSpecV1"/>.
+    /// </summary>
+    public sealed class PodTemplateSpecV1BinarySerializer
+        : KubeModelBinarySerializer<PodTemplateSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodTemplateSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static PodTemplateSpecV1BinarySerializer Instance { get; } = new PodTemplateSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodTemplateSpecV1BinarySerializer"/>.
+        /// </summary>
+        public PodTemplateSpecV1BinarySerializer()
+            : base(schemaHash: 0x912800A8CC042BFFUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodTemplateSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodTemplateSpecV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            PodSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodTemplateSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodTemplateSpecV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = PodSpecV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PodV1"/>.
+    /// </summary>
+    public sealed class PodV1BinarySerializer
+        : KubeModelBinarySerializer<PodV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodV1BinarySerializer"/>.
+        /// </summary>
+        public static PodV1BinarySerializer Instance { get; } = new PodV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PodV1BinarySerializer"/>.
+        /// </summary>
+        public PodV1BinarySerializer()
+            : base(schemaHash: 0xB6A59567456427B5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PodV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PodV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            PodSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            PodStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PodV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PodV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = PodSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = PodStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PortStatusV1"/>.
+    /// </summary>
+    public sealed class PortStatusV1BinarySerializer
+        : KubeModelBinarySerializer<PortStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PortStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static PortStatusV1BinarySerializer Instance { get; } = new PortStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PortStatusV1BinarySerializer"/>.
+        /// </summary>
+        public PortStatusV1BinarySerializer()
+            : base(schemaHash: 0x187373E45127720FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PortStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PortStatusV1 model)
+        {
+            WriteString(writer, model.Protocol);
+            WriteString(writer, model.Error);
+            WriteInt32(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PortStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PortStatusV1 model)
+        {
+            model.Protocol = ReadInternedString(reader);
+            model.Error = ReadString(reader);
+            model.Port = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PortworxVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class PortworxVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<PortworxVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PortworxVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static PortworxVolumeSourceV1BinarySerializer Instance { get; } = new PortworxVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PortworxVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public PortworxVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xA552CE0F01CD28E7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PortworxVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PortworxVolumeSourceV1 model)
+        {
+            WriteString(writer, model.VolumeID);
+            WriteString(writer, model.FsType);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PortworxVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PortworxVolumeSourceV1 model)
+        {
+            model.VolumeID = ReadString(reader);
+            model.FsType = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="PreferredSchedulingTermV1"/>.
+    /// </summary>
+    public sealed class PreferredSchedulingTermV1BinarySerializer
+        : KubeModelBinarySerializer<PreferredSchedulingTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PreferredSchedulingTermV1BinarySerializer"/>.
+        /// </summary>
+        public static PreferredSchedulingTermV1BinarySerializer Instance { get; } = new PreferredSchedulingTermV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="PreferredSchedulingTermV1BinarySerializer"/>.
+        /// </summary>
+        public PreferredSchedulingTermV1BinarySerializer()
+            : base(schemaHash: 0x1632266DA2612D56UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="PreferredSchedulingTermV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, PreferredSchedulingTermV1 model)
+        {
+            NodeSelectorTermV1BinarySerializer.Instance.Write(writer, model.Preference);
+            WriteInt32(writer, model.Weight);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="PreferredSchedulingTermV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, PreferredSchedulingTermV1 model)
+        {
+            model.Preference = NodeSelectorTermV1BinarySerializer.Instance.Read(reader);
+            model.Weight = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ProbeV1"/>.
+    /// </summary>
+    public sealed class ProbeV1BinarySerializer
+        : KubeModelBinarySerializer<ProbeV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ProbeV1BinarySerializer"/>.
+        /// </summary>
+        public static ProbeV1BinarySerializer Instance { get; } = new ProbeV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ProbeV1BinarySerializer"/>.
+        /// </summary>
+        public ProbeV1BinarySerializer()
+            : base(schemaHash: 0xC5A64FA04F62F064UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ProbeV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ProbeV1 model)
+        {
+            ExecActionV1BinarySerializer.Instance.Write(writer, model.Exec);
+            GRPCActionV1BinarySerializer.Instance.Write(writer, model.Grpc);
+            WriteInt32(writer, model.FailureThreshold);
+            WriteInt32(writer, model.SuccessThreshold);
+            WriteInt32(writer, model.InitialDelaySeconds);
+            WriteInt32(writer, model.PeriodSeconds);
+            WriteInt64(writer, model.TerminationGracePeriodSeconds);
+            WriteInt32(writer, model.TimeoutSeconds);
+            HTTPGetActionV1BinarySerializer.Instance.Write(writer, model.HttpGet);
+            TCPSocketActionV1BinarySerializer.Instance.Write(writer, model.TcpSocket);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ProbeV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ProbeV1 model)
+        {
+            model.Exec = ExecActionV1BinarySerializer.Instance.Read(reader);
+            model.Grpc = GRPCActionV1BinarySerializer.Instance.Read(reader);
+            model.FailureThreshold = ReadInt32(reader);
+            model.SuccessThreshold = ReadInt32(reader);
+            model.InitialDelaySeconds = ReadInt32(reader);
+            model.PeriodSeconds = ReadInt32(reader);
+            model.TerminationGracePeriodSeconds = ReadInt64(reader);
+            model.TimeoutSeconds = ReadInt32(reader);
+            model.HttpGet = HTTPGetActionV1BinarySerializer.Instance.Read(reader);
+            model.TcpSocket = TCPSocketActionV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ProjectedVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ProjectedVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ProjectedVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ProjectedVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ProjectedVolumeSourceV1BinarySerializer Instance { get; } = new ProjectedVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ProjectedVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ProjectedVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0xC8613E7C0C934898UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ProjectedVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ProjectedVolumeSourceV1 model)
+        {
+            WriteInt32(writer, model.DefaultMode);
+            WriteList(writer, model.Sources, VolumeProjectionV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ProjectedVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ProjectedVolumeSourceV1 model)
+        {
+            model.DefaultMode = ReadInt32(reader);
+            ReadList(reader, model.Sources, VolumeProjectionV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="QuobyteVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class QuobyteVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<QuobyteVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="QuobyteVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static QuobyteVolumeSourceV1BinarySerializer Instance { get; } = new QuobyteVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="QuobyteVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public QuobyteVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x1DA11368BC2E7420UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="QuobyteVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, QuobyteVolumeSourceV1 model)
+        {
+            WriteString(writer, model.Volume);
+            WriteString(writer, model.Group);
+            WriteString(writer, model.User);
+            WriteString(writer, model.Tenant);
+            WriteBoolean(writer, model.ReadOnly);
+            WriteString(writer, model.Registry);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="QuobyteVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, QuobyteVolumeSourceV1 model)
+        {
+            model.Volume = ReadString(reader);
+            model.Group = ReadString(reader);
+            model.User = ReadString(reader);
+            model.Tenant = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+            model.Registry = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="RBDPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class RBDPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<RBDPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="RBDPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static RBDPersistentVolumeSourceV1BinarySerializer Instance { get; } = new RBDPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="RBDPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public RBDPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x6EBE78F392F062E7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="RBDPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, RBDPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.Image);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.Keyring);
+            WriteString(writer, model.Pool);
+            WriteString(writer, model.User);
+            WriteList(writer, model.Monitors, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="RBDPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, RBDPersistentVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.Image = ReadInternedString(reader);
+            model.SecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Keyring = ReadString(reader);
+            model.Pool = ReadString(reader);
+            model.User = ReadString(reader);
+            ReadStringList(reader, model.Monitors);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="RBDVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class RBDVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<RBDVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="RBDVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static RBDVolumeSourceV1BinarySerializer Instance { get; } = new RBDVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="RBDVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public RBDVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x66A72092CADBF056UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="RBDVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, RBDVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.Image);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.Keyring);
+            WriteString(writer, model.Pool);
+            WriteString(writer, model.User);
+            WriteList(writer, model.Monitors, WriteString);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="RBDVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, RBDVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.Image = ReadInternedString(reader);
+            model.SecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.Keyring = ReadString(reader);
+            model.Pool = ReadString(reader);
+            model.User = ReadString(reader);
+            ReadStringList(reader, model.Monitors);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ReplicaSetConditionV1"/>.
+    /// </summary>
+    public sealed class ReplicaSetConditionV1BinarySerializer
+        : KubeModelBinarySerializer<ReplicaSetConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ReplicaSetConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static ReplicaSetConditionV1BinarySerializer Instance { get; } = new ReplicaSetConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ReplicaSetConditionV1BinarySerializer"/>.
+        /// </summary>
+        public ReplicaSetConditionV1BinarySerializer()
+            : base(schemaHash: 0x1E92730BD63DA6D5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ReplicaSetConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ReplicaSetConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ReplicaSetConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ReplicaSetConditionV1 model)
+        {
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ReplicaSetSpecV1"/>.
+    /// </summary>
+    public sealed class ReplicaSetSpecV1BinarySerializer
+        : KubeModelBinarySerializer<ReplicaSetSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ReplicaSetSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static ReplicaSetSpecV1BinarySerializer Instance { get; } = new ReplicaSetSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ReplicaSetSpecV1BinarySerializer"/>.
+        /// </summary>
+        public ReplicaSetSpecV1BinarySerializer()
+            : base(schemaHash: 0x981647B9D7435B36UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ReplicaSetSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ReplicaSetSpecV1 model)
+        {
+            PodTemplateSpecV1BinarySerializer.Instance.Write(writer, model.Template);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.Selector);
+            WriteInt32(writer, model.MinReadySeconds);
+            WriteInt32(writer, model.Replicas);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ReplicaSetSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ReplicaSetSpecV1 model)
+        {
+            model.Template = PodTemplateSpecV1BinarySerializer.Instance.Read(reader);
+            model.Selector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            model.MinReadySeconds = ReadInt32(reader);
+            model.Replicas = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ReplicaSetStatusV1"/>.
+    /// </summary>
+    public sealed class ReplicaSetStatusV1BinarySerializer
+        : KubeModelBinarySerializer<ReplicaSetStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ReplicaSetStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static ReplicaSetStatusV1BinarySerializer Instance { get; } = new ReplicaSetStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ReplicaSetStatusV1BinarySerializer"/>.
+        /// </summary>
+        public ReplicaSetStatusV1BinarySerializer()
+            : base(schemaHash: 0x864A411F3C1E2767UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ReplicaSetStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ReplicaSetStatusV1 model)
+        {
+            WriteInt64(writer, model.ObservedGeneration);
+            WriteInt32(writer, model.AvailableReplicas);
+            WriteList(writer, model.Conditions, ReplicaSetConditionV1BinarySerializer.Instance.Write);
+            WriteInt32(writer, model.FullyLabeledReplicas);
+            WriteInt32(writer, model.ReadyReplicas);
+            WriteInt32(writer, model.Replicas);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ReplicaSetStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ReplicaSetStatusV1 model)
+        {
+            model.ObservedGeneration = ReadInt64(reader);
+            model.AvailableReplicas = ReadInt32(reader);
+            ReadList(reader, model.Conditions, ReplicaSetConditionV1BinarySerializer.Instance.Read);
+            model.FullyLabeledReplicas = ReadInt32(reader);
+            model.ReadyReplicas = ReadInt32(reader);
+            model.Replicas = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ReplicaSetV1"/>.
+    /// </summary>
+    public sealed class ReplicaSetV1BinarySerializer
+        : KubeModelBinarySerializer<ReplicaSetV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ReplicaSetV1BinarySerializer"/>.
+        /// </summary>
+        public static ReplicaSetV1BinarySerializer Instance { get; } = new ReplicaSetV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ReplicaSetV1BinarySerializer"/>.
+        /// </summary>
+        public ReplicaSetV1BinarySerializer()
+            : base(schemaHash: 0x0AAA49D0D51EE527UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ReplicaSetV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ReplicaSetV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            ReplicaSetSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            ReplicaSetStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ReplicaSetV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ReplicaSetV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = ReplicaSetSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = ReplicaSetStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ResourceClaimV1"/>.
+    /// </summary>
+    public sealed class ResourceClaimV1BinarySerializer
+        : KubeModelBinarySerializer<ResourceClaimV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceClaimV1BinarySerializer"/>.
+        /// </summary>
+        public static ResourceClaimV1BinarySerializer Instance { get; } = new ResourceClaimV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceClaimV1BinarySerializer"/>.
+        /// </summary>
+        public ResourceClaimV1BinarySerializer()
+            : base(schemaHash: 0x4CF208AFFC640F1EUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ResourceClaimV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ResourceClaimV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Request);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ResourceClaimV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ResourceClaimV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Request = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ResourceFieldSelectorV1"/>.
+    /// </summary>
+    public sealed class ResourceFieldSelectorV1BinarySerializer
+        : KubeModelBinarySerializer<ResourceFieldSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceFieldSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public static ResourceFieldSelectorV1BinarySerializer Instance { get; } = new ResourceFieldSelectorV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceFieldSelectorV1BinarySerializer"/>.
+        /// </summary>
+        public ResourceFieldSelectorV1BinarySerializer()
+            : base(schemaHash: 0x0F4B54C514C20753UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ResourceFieldSelectorV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ResourceFieldSelectorV1 model)
+        {
+            WriteString(writer, model.ContainerName);
+            WriteString(writer, model.Resource);
+            WriteString(writer, model.Divisor);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ResourceFieldSelectorV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ResourceFieldSelectorV1 model)
+        {
+            model.ContainerName = ReadString(reader);
+            model.Resource = ReadInternedString(reader);
+            model.Divisor = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ResourceHealthV1"/>.
+    /// </summary>
+    public sealed class ResourceHealthV1BinarySerializer
+        : KubeModelBinarySerializer<ResourceHealthV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceHealthV1BinarySerializer"/>.
+        /// </summary>
+        public static ResourceHealthV1BinarySerializer Instance { get; } = new ResourceHealthV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceHealthV1BinarySerializer"/>.
+        /// </summary>
+        public ResourceHealthV1BinarySerializer()
+            : base(schemaHash: 0x48760CA1FE86C5A4UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ResourceHealthV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ResourceHealthV1 model)
+        {
+            WriteString(writer, model.ResourceID);
+            WriteString(writer, model.Health);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ResourceHealthV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ResourceHealthV1 model)
+        {
+            model.ResourceID = ReadString(reader);
+            model.Health = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ResourceRequirementsV1"/>.
+    /// </summary>
+    public sealed class ResourceRequirementsV1BinarySerializer
+        : KubeModelBinarySerializer<ResourceRequirementsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceRequirementsV1BinarySerializer"/>.
+        /// </summary>
+        public static ResourceRequirementsV1BinarySerializer Instance { get; } = new ResourceRequirementsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceRequirementsV1BinarySerializer"/>.
+        /// </summary>
+        public ResourceRequirementsV1BinarySerializer()
+            : base(schemaHash: 0x8846C97918B97816UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ResourceRequirementsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ResourceRequirementsV1 model)
+        {
+            WriteList(writer, model.Claims, ResourceClaimV1BinarySerializer.Instance.Write);
+            WriteDictionary(writer, model.Limits, WriteString);
+            WriteDictionary(writer, model.Requests, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ResourceRequirementsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ResourceRequirementsV1 model)
+        {
+            ReadList(reader, model.Claims, ResourceClaimV1BinarySerializer.Instance.Read);
+            ReadStringDictionary(reader, model.Limits, InternedStrings.DictionaryKeys | InternedStrings.Values);
+            ReadStringDictionary(reader, model.Requests, InternedStrings.DictionaryKeys | InternedStrings.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ResourceStatusV1"/>.
+    /// </summary>
+    public sealed class ResourceStatusV1BinarySerializer
+        : KubeModelBinarySerializer<ResourceStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static ResourceStatusV1BinarySerializer Instance { get; } = new ResourceStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceStatusV1BinarySerializer"/>.
+        /// </summary>
+        public ResourceStatusV1BinarySerializer()
+            : base(schemaHash: 0x48F2B5BDA026FEF4UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ResourceStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ResourceStatusV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteList(writer, model.Resources, ResourceHealthV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ResourceStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ResourceStatusV1 model)
+        {
+            model.Name = ReadString(reader);
+            ReadList(reader, model.Resources, ResourceHealthV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="RollingUpdateDaemonSetV1"/>.
+    /// </summary>
+    public sealed class RollingUpdateDaemonSetV1BinarySerializer
+        : KubeModelBinarySerializer<RollingUpdateDaemonSetV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="RollingUpdateDaemonSetV1BinarySerializer"/>.
+        /// </summary>
+        public static RollingUpdateDaemonSetV1BinarySerializer Instance { get; } = new RollingUpdateDaemonSetV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="RollingUpdateDaemonSetV1BinarySerializer"/>.
+        /// </summary>
+        public RollingUpdateDaemonSetV1BinarySerializer()
+            : base(schemaHash: 0xEDBAC25CC31F0970UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="RollingUpdateDaemonSetV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, RollingUpdateDaemonSetV1 model)
+        {
+            WriteInt32OrString(writer, model.MaxSurge);
+            WriteInt32OrString(writer, model.MaxUnavailable);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="RollingUpdateDaemonSetV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, RollingUpdateDaemonSetV1 model)
+        {
+            model.MaxSurge = ReadInt32OrString(reader);
+            model.MaxUnavailable = ReadInt32OrString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="RollingUpdateDeploymentV1"/>.
+    /// </summary>
+    public sealed class RollingUpdateDeploymentV1BinarySerializer
+        : KubeModelBinarySerializer<RollingUpdateDeploymentV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="RollingUpdateDeploymentV1BinarySerializer"/>.
+        /// </summary>
+        public static RollingUpdateDeploymentV1BinarySerializer Instance { get; } = new RollingUpdateDeploymentV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="RollingUpdateDeploymentV1BinarySerializer"/>.
+        /// </summary>
+        public RollingUpdateDeploymentV1BinarySerializer()
+            : base(schemaHash: 0x1A1E9A2A5D0BD95DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="RollingUpdateDeploymentV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, RollingUpdateDeploymentV1 model)
+        {
+            WriteInt32OrString(writer, model.MaxSurge);
+            WriteInt32OrString(writer, model.MaxUnavailable);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="RollingUpdateDeploymentV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, RollingUpdateDeploymentV1 model)
+        {
+            model.MaxSurge = ReadInt32OrString(reader);
+            model.MaxUnavailable = ReadInt32OrString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="RollingUpdateStatefulSetStrategyV1"/>.
+    /// </summary>
+    public sealed class RollingUpdateStatefulSetStrategyV1BinarySerializer
+        : KubeModelBinarySerializer<RollingUpdateStatefulSetStrategyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="RollingUpdateStatefulSetStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public static RollingUpdateStatefulSetStrategyV1BinarySerializer Instance { get; } = new RollingUpdateStatefulSetStrategyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="RollingUpdateStatefulSetStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public RollingUpdateStatefulSetStrategyV1BinarySerializer()
+            : base(schemaHash: 0x6DFB24A072FEAC03UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="RollingUpdateStatefulSetStrategyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, RollingUpdateStatefulSetStrategyV1 model)
+        {
+            WriteInt32OrString(writer, model.MaxUnavailable);
+            WriteInt32(writer, model.Partition);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="RollingUpdateStatefulSetStrategyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, RollingUpdateStatefulSetStrategyV1 model)
+        {
+            model.MaxUnavailable = ReadInt32OrString(reader);
+            model.Partition = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SELinuxOptionsV1"/>.
+    /// </summary>
+    public sealed class SELinuxOptionsV1BinarySerializer
+        : KubeModelBinarySerializer<SELinuxOptionsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SELinuxOptionsV1BinarySerializer"/>.
+        /// </summary>
+        public static SELinuxOptionsV1BinarySerializer Instance { get; } = new SELinuxOptionsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SELinuxOptionsV1BinarySerializer"/>.
+        /// </summary>
+        public SELinuxOptionsV1BinarySerializer()
+            : base(schemaHash: 0x85AED28C86EDCFCDUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SELinuxOptionsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SELinuxOptionsV1 model)
+        {
+            WriteString(writer, model.Role);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Level);
+            WriteString(writer, model.User);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SELinuxOptionsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SELinuxOptionsV1 model)
+        {
+            model.Role = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Level = ReadString(reader);
+            model.User = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ScaleIOPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ScaleIOPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ScaleIOPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ScaleIOPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ScaleIOPersistentVolumeSourceV1BinarySerializer Instance { get; } = new ScaleIOPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ScaleIOPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ScaleIOPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x82754CAEFD9CF2CCUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ScaleIOPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ScaleIOPersistentVolumeSourceV1 model)
+        {
+            WriteBoolean(writer, model.SslEnabled);
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.StorageMode);
+            WriteString(writer, model.VolumeName);
+            SecretReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.StoragePool);
+            WriteString(writer, model.System);
+            WriteString(writer, model.ProtectionDomain);
+            WriteString(writer, model.Gateway);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ScaleIOPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ScaleIOPersistentVolumeSourceV1 model)
+        {
+            model.SslEnabled = ReadBoolean(reader);
+            model.FsType = ReadString(reader);
+            model.StorageMode = ReadString(reader);
+            model.VolumeName = ReadString(reader);
+            model.SecretRef = SecretReferenceV1BinarySerializer.Instance.Read(reader);
+            model.StoragePool = ReadString(reader);
+            model.System = ReadString(reader);
+            model.ProtectionDomain = ReadString(reader);
+            model.Gateway = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ScaleIOVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ScaleIOVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<ScaleIOVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ScaleIOVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static ScaleIOVolumeSourceV1BinarySerializer Instance { get; } = new ScaleIOVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ScaleIOVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public ScaleIOVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x579C3CCC49ED8466UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ScaleIOVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ScaleIOVolumeSourceV1 model)
+        {
+            WriteBoolean(writer, model.SslEnabled);
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.StorageMode);
+            WriteString(writer, model.VolumeName);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteString(writer, model.StoragePool);
+            WriteString(writer, model.System);
+            WriteString(writer, model.ProtectionDomain);
+            WriteString(writer, model.Gateway);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ScaleIOVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ScaleIOVolumeSourceV1 model)
+        {
+            model.SslEnabled = ReadBoolean(reader);
+            model.FsType = ReadString(reader);
+            model.StorageMode = ReadString(reader);
+            model.VolumeName = ReadString(reader);
+            model.SecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.StoragePool = ReadString(reader);
+            model.System = ReadString(reader);
+            model.ProtectionDomain = ReadString(reader);
+            model.Gateway = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SeccompProfileV1"/>.
+    /// </summary>
+    public sealed class SeccompProfileV1BinarySerializer
+        : KubeModelBinarySerializer<SeccompProfileV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SeccompProfileV1BinarySerializer"/>.
+        /// </summary>
+        public static SeccompProfileV1BinarySerializer Instance { get; } = new SeccompProfileV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SeccompProfileV1BinarySerializer"/>.
+        /// </summary>
+        public SeccompProfileV1BinarySerializer()
+            : base(schemaHash: 0xEE6DD0DEA7FF7CBFUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SeccompProfileV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SeccompProfileV1 model)
+        {
+            WriteString(writer, model.LocalhostProfile);
+            WriteString(writer, model.Type);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SeccompProfileV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SeccompProfileV1 model)
+        {
+            model.LocalhostProfile = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SecretEnvSourceV1"/>.
+    /// </summary>
+    public sealed class SecretEnvSourceV1BinarySerializer
+        : KubeModelBinarySerializer<SecretEnvSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretEnvSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static SecretEnvSourceV1BinarySerializer Instance { get; } = new SecretEnvSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretEnvSourceV1BinarySerializer"/>.
+        /// </summary>
+        public SecretEnvSourceV1BinarySerializer()
+            : base(schemaHash: 0x8EC92C1EA7AD7755UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SecretEnvSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SecretEnvSourceV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteBoolean(writer, model.Optional);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SecretEnvSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SecretEnvSourceV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SecretKeySelectorV1"/>.
+    /// </summary>
+    public sealed class SecretKeySelectorV1BinarySerializer
+        : KubeModelBinarySerializer<SecretKeySelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretKeySelectorV1BinarySerializer"/>.
+        /// </summary>
+        public static SecretKeySelectorV1BinarySerializer Instance { get; } = new SecretKeySelectorV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretKeySelectorV1BinarySerializer"/>.
+        /// </summary>
+        public SecretKeySelectorV1BinarySerializer()
+            : base(schemaHash: 0x46FA87D44F37CFBCUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SecretKeySelectorV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SecretKeySelectorV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteBoolean(writer, model.Optional);
+            WriteString(writer, model.Key);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SecretKeySelectorV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SecretKeySelectorV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+            model.Key = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SecretProjectionV1"/>.
+    /// </summary>
+    public sealed class SecretProjectionV1BinarySerializer
+        : KubeModelBinarySerializer<SecretProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public static SecretProjectionV1BinarySerializer Instance { get; } = new SecretProjectionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public SecretProjectionV1BinarySerializer()
+            : base(schemaHash: 0x198E9B717A6DF79FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SecretProjectionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SecretProjectionV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteBoolean(writer, model.Optional);
+            WriteList(writer, model.Items, KeyToPathV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SecretProjectionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SecretProjectionV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+            ReadList(reader, model.Items, KeyToPathV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SecretReferenceV1"/>.
+    /// </summary>
+    public sealed class SecretReferenceV1BinarySerializer
+        : KubeModelBinarySerializer<SecretReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public static SecretReferenceV1BinarySerializer Instance { get; } = new SecretReferenceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public SecretReferenceV1BinarySerializer()
+            : base(schemaHash: 0xF151A8B7A51EACB0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SecretReferenceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SecretReferenceV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Namespace);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SecretReferenceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SecretReferenceV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Namespace = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SecretV1"/>.
+    /// </summary>
+    public sealed class SecretV1BinarySerializer
+        : KubeModelBinarySerializer<SecretV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretV1BinarySerializer"/>.
+        /// </summary>
+        public static SecretV1BinarySerializer Instance { get; } = new SecretV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretV1BinarySerializer"/>.
+        /// </summary>
+        public SecretV1BinarySerializer()
+            : base(schemaHash: 0xF81E792514EA0E83UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SecretV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SecretV1 model)
+        {
+            WriteDictionary(writer, model.Data, WriteString);
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            WriteDictionary(writer, model.StringData, WriteString);
+            WriteString(writer, model.Kind);
+            WriteBoolean(writer, model.Immutable);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.ApiVersion);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SecretV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SecretV1 model)
+        {
+            ReadStringDictionary(reader, model.Data);
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            ReadStringDictionary(reader, model.StringData);
+            model.Kind = ReadInternedString(reader);
+            model.Immutable = ReadBoolean(reader);
+            model.Type = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SecretVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class SecretVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<SecretVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static SecretVolumeSourceV1BinarySerializer Instance { get; } = new SecretVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public SecretVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x3EEFF38DEF0B1C5FUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SecretVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SecretVolumeSourceV1 model)
+        {
+            WriteInt32(writer, model.DefaultMode);
+            WriteString(writer, model.SecretName);
+            WriteBoolean(writer, model.Optional);
+            WriteList(writer, model.Items, KeyToPathV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SecretVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SecretVolumeSourceV1 model)
+        {
+            model.DefaultMode = ReadInt32(reader);
+            model.SecretName = ReadString(reader);
+            model.Optional = ReadBoolean(reader);
+            ReadList(reader, model.Items, KeyToPathV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SecurityContextV1"/>.
+    /// </summary>
+    public sealed class SecurityContextV1BinarySerializer
+        : KubeModelBinarySerializer<SecurityContextV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecurityContextV1BinarySerializer"/>.
+        /// </summary>
+        public static SecurityContextV1BinarySerializer Instance { get; } = new SecurityContextV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SecurityContextV1BinarySerializer"/>.
+        /// </summary>
+        public SecurityContextV1BinarySerializer()
+            : base(schemaHash: 0xC63396554FEA19D1UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SecurityContextV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SecurityContextV1 model)
+        {
+            WriteBoolean(writer, model.Privileged);
+            AppArmorProfileV1BinarySerializer.Instance.Write(writer, model.AppArmorProfile);
+            SeccompProfileV1BinarySerializer.Instance.Write(writer, model.SeccompProfile);
+            WriteBoolean(writer, model.ReadOnlyRootFilesystem);
+            WriteBoolean(writer, model.AllowPrivilegeEscalation);
+            WriteInt64(writer, model.RunAsGroup);
+            WriteInt64(writer, model.RunAsUser);
+            CapabilitiesV1BinarySerializer.Instance.Write(writer, model.Capabilities);
+            SELinuxOptionsV1BinarySerializer.Instance.Write(writer, model.SeLinuxOptions);
+            WindowsSecurityContextOptionsV1BinarySerializer.Instance.Write(writer, model.WindowsOptions);
+            WriteString(writer, model.ProcMount);
+            WriteBoolean(writer, model.RunAsNonRoot);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SecurityContextV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SecurityContextV1 model)
+        {
+            model.Privileged = ReadBoolean(reader);
+            model.AppArmorProfile = AppArmorProfileV1BinarySerializer.Instance.Read(reader);
+            model.SeccompProfile = SeccompProfileV1BinarySerializer.Instance.Read(reader);
+            model.ReadOnlyRootFilesystem = ReadBoolean(reader);
+            model.AllowPrivilegeEscalation = ReadBoolean(reader);
+            model.RunAsGroup = ReadInt64(reader);
+            model.RunAsUser = ReadInt64(reader);
+            model.Capabilities = CapabilitiesV1BinarySerializer.Instance.Read(reader);
+            model.SeLinuxOptions = SELinuxOptionsV1BinarySerializer.Instance.Read(reader);
+            model.WindowsOptions = WindowsSecurityContextOptionsV1BinarySerializer.Instance.Read(reader);
+            model.ProcMount = ReadString(reader);
+            model.RunAsNonRoot = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ServiceAccountTokenProjectionV1"/>.
+    /// </summary>
+    public sealed class ServiceAccountTokenProjectionV1BinarySerializer
+        : KubeModelBinarySerializer<ServiceAccountTokenProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServiceAccountTokenProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public static ServiceAccountTokenProjectionV1BinarySerializer Instance { get; } = new ServiceAccountTokenProjectionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ServiceAccountTokenProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public ServiceAccountTokenProjectionV1BinarySerializer()
+            : base(schemaHash: 0x83DF796D91A805B9UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ServiceAccountTokenProjectionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ServiceAccountTokenProjectionV1 model)
+        {
+            WriteString(writer, model.Audience);
+            WriteString(writer, model.Path);
+            WriteInt64(writer, model.ExpirationSeconds);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ServiceAccountTokenProjectionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ServiceAccountTokenProjectionV1 model)
+        {
+            model.Audience = ReadString(reader);
+            model.Path = ReadString(reader);
+            model.ExpirationSeconds = ReadInt64(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ServiceAccountV1"/>.
+    /// </summary>
+    public sealed class ServiceAccountV1BinarySerializer
+        : KubeModelBinarySerializer<ServiceAccountV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServiceAccountV1BinarySerializer"/>.
+        /// </summary>
+        public static ServiceAccountV1BinarySerializer Instance { get; } = new ServiceAccountV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ServiceAccountV1BinarySerializer"/>.
+        /// </summary>
+        public ServiceAccountV1BinarySerializer()
+            : base(schemaHash: 0x5C6F3EEBD8B14AB9UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ServiceAccountV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ServiceAccountV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            WriteBoolean(writer, model.AutomountServiceAccountToken);
+            WriteList(writer, model.ImagePullSecrets, LocalObjectReferenceV1BinarySerializer.Instance.Write);
+            WriteList(writer, model.Secrets, ObjectReferenceV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ServiceAccountV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ServiceAccountV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.AutomountServiceAccountToken = ReadBoolean(reader);
+            ReadList(reader, model.ImagePullSecrets, LocalObjectReferenceV1BinarySerializer.Instance.Read);
+            ReadList(reader, model.Secrets, ObjectReferenceV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ServiceBackendPortV1"/>.
+    /// </summary>
+    public sealed class ServiceBackendPortV1BinarySerializer
+        : KubeModelBinarySerializer<ServiceBackendPortV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServiceBackendPortV1BinarySerializer"/>.
+        /// </summary>
+        public static ServiceBackendPortV1BinarySerializer Instance { get; } = new ServiceBackendPortV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ServiceBackendPortV1BinarySerializer"/>.
+        /// </summary>
+        public ServiceBackendPortV1BinarySerializer()
+            : base(schemaHash: 0x14A11036D60B9E4AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ServiceBackendPortV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ServiceBackendPortV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteInt32(writer, model.Number);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ServiceBackendPortV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ServiceBackendPortV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Number = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ServicePortV1"/>.
+    /// </summary>
+    public sealed class ServicePortV1BinarySerializer
+        : KubeModelBinarySerializer<ServicePortV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServicePortV1BinarySerializer"/>.
+        /// </summary>
+        public static ServicePortV1BinarySerializer Instance { get; } = new ServicePortV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ServicePortV1BinarySerializer"/>.
+        /// </summary>
+        public ServicePortV1BinarySerializer()
+            : base(schemaHash: 0x6B7F204E98ABC66EUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ServicePortV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ServicePortV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.AppProtocol);
+            WriteString(writer, model.Protocol);
+            WriteInt32(writer, model.NodePort);
+            WriteInt32(writer, model.Port);
+            WriteInt32OrString(writer, model.TargetPort);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ServicePortV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ServicePortV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.AppProtocol = ReadString(reader);
+            model.Protocol = ReadInternedString(reader);
+            model.NodePort = ReadInt32(reader);
+            model.Port = ReadInt32(reader).GetValueOrDefault();
+            model.TargetPort = ReadInt32OrString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ServiceSpecV1"/>.
+    /// </summary>
+    public sealed class ServiceSpecV1BinarySerializer
+        : KubeModelBinarySerializer<ServiceSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServiceSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static ServiceSpecV1BinarySerializer Instance { get; } = new ServiceSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ServiceSpecV1BinarySerializer"/>.
+        /// </summary>
+        public ServiceSpecV1BinarySerializer()
+            : base(schemaHash: 0x0DAA58EBE0CDBBA0UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ServiceSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ServiceSpecV1 model)
+        {
+            WriteString(writer, model.ClusterIP);
+            WriteString(writer, model.LoadBalancerIP);
+            WriteString(writer, model.ExternalName);
+            WriteString(writer, model.Type);
+            SessionAffinityConfigV1BinarySerializer.Instance.Write(writer, model.SessionAffinityConfig);
+            WriteString(writer, model.TrafficDistribution);
+            WriteDictionary(writer, model.Selector, WriteString);
+            WriteBoolean(writer, model.AllocateLoadBalancerNodePorts);
+            WriteList(writer, model.ClusterIPs, WriteString);
+            WriteList(writer, model.ExternalIPs, WriteString);
+            WriteList(writer, model.IpFamilies, WriteString);
+            WriteString(writer, model.LoadBalancerClass);
+            WriteList(writer, model.LoadBalancerSourceRanges, WriteString);
+            WriteList(writer, model.Ports, ServicePortV1BinarySerializer.Instance.Write);
+            WriteBoolean(writer, model.PublishNotReadyAddresses);
+            WriteInt32(writer, model.HealthCheckNodePort);
+            WriteString(writer, model.ExternalTrafficPolicy);
+            WriteString(writer, model.InternalTrafficPolicy);
+            WriteString(writer, model.IpFamilyPolicy);
+            WriteString(writer, model.SessionAffinity);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ServiceSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ServiceSpecV1 model)
+        {
+            model.ClusterIP = ReadString(reader);
+            model.LoadBalancerIP = ReadString(reader);
+            model.ExternalName = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.SessionAffinityConfig = SessionAffinityConfigV1BinarySerializer.Instance.Read(reader);
+            model.TrafficDistribution = ReadString(reader);
+            ReadStringDictionary(reader, model.Selector, InternedStrings.DictionaryKeys | InternedStrings.Values);
+            model.AllocateLoadBalancerNodePorts = ReadBoolean(reader);
+            ReadStringList(reader, model.ClusterIPs);
+            ReadStringList(reader, model.ExternalIPs);
+            ReadStringList(reader, model.IpFamilies);
+            model.LoadBalancerClass = ReadString(reader);
+            ReadStringList(reader, model.LoadBalancerSourceRanges);
+            ReadList(reader, model.Ports, ServicePortV1BinarySerializer.Instance.Read);
+            model.PublishNotReadyAddresses = ReadBoolean(reader);
+            model.HealthCheckNodePort = ReadInt32(reader);
+            model.ExternalTrafficPolicy = ReadInternedString(reader);
+            model.InternalTrafficPolicy = ReadInternedString(reader);
+            model.IpFamilyPolicy = ReadInternedString(reader);
+            model.SessionAffinity = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ServiceStatusV1"/>.
+    /// </summary>
+    public sealed class ServiceStatusV1BinarySerializer
+        : KubeModelBinarySerializer<ServiceStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServiceStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static ServiceStatusV1BinarySerializer Instance { get; } = new ServiceStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ServiceStatusV1BinarySerializer"/>.
+        /// </summary>
+        public ServiceStatusV1BinarySerializer()
+            : base(schemaHash: 0xDA859CDAE2380B2CUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ServiceStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ServiceStatusV1 model)
+        {
+            LoadBalancerStatusV1BinarySerializer.Instance.Write(writer, model.LoadBalancer);
+            WriteList(writer, model.Conditions, ConditionV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ServiceStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ServiceStatusV1 model)
+        {
+            model.LoadBalancer = LoadBalancerStatusV1BinarySerializer.Instance.Read(reader);
+            ReadList(reader, model.Conditions, ConditionV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="ServiceV1"/>.
+    /// </summary>
+    public sealed class ServiceV1BinarySerializer
+        : KubeModelBinarySerializer<ServiceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServiceV1BinarySerializer"/>.
+        /// </summary>
+        public static ServiceV1BinarySerializer Instance { get; } = new ServiceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="ServiceV1BinarySerializer"/>.
+        /// </summary>
+        public ServiceV1BinarySerializer()
+            : base(schemaHash: 0x83A3CF438ADCF990UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="ServiceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, ServiceV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            ServiceSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            ServiceStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="ServiceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, ServiceV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = ServiceSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = ServiceStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SessionAffinityConfigV1"/>.
+    /// </summary>
+    public sealed class SessionAffinityConfigV1BinarySerializer
+        : KubeModelBinarySerializer<SessionAffinityConfigV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SessionAffinityConfigV1BinarySerializer"/>.
+        /// </summary>
+        public static SessionAffinityConfigV1BinarySerializer Instance { get; } = new SessionAffinityConfigV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SessionAffinityConfigV1BinarySerializer"/>.
+        /// </summary>
+        public SessionAffinityConfigV1BinarySerializer()
+            : base(schemaHash: 0x9DA1CFA843937B4EUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SessionAffinityConfigV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SessionAffinityConfigV1 model)
+        {
+            ClientIPConfigV1BinarySerializer.Instance.Write(writer, model.ClientIP);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SessionAffinityConfigV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SessionAffinityConfigV1 model)
+        {
+            model.ClientIP = ClientIPConfigV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SleepActionV1"/>.
+    /// </summary>
+    public sealed class SleepActionV1BinarySerializer
+        : KubeModelBinarySerializer<SleepActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SleepActionV1BinarySerializer"/>.
+        /// </summary>
+        public static SleepActionV1BinarySerializer Instance { get; } = new SleepActionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SleepActionV1BinarySerializer"/>.
+        /// </summary>
+        public SleepActionV1BinarySerializer()
+            : base(schemaHash: 0x11D66E66A75696F2UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SleepActionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SleepActionV1 model)
+        {
+            WriteInt64(writer, model.Seconds);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SleepActionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SleepActionV1 model)
+        {
+            model.Seconds = ReadInt64(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StatefulSetConditionV1"/>.
+    /// </summary>
+    public sealed class StatefulSetConditionV1BinarySerializer
+        : KubeModelBinarySerializer<StatefulSetConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StatefulSetConditionV1BinarySerializer"/>.
+        /// </summary>
+        public static StatefulSetConditionV1BinarySerializer Instance { get; } = new StatefulSetConditionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StatefulSetConditionV1BinarySerializer"/>.
+        /// </summary>
+        public StatefulSetConditionV1BinarySerializer()
+            : base(schemaHash: 0x7181D14D2334152DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StatefulSetConditionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StatefulSetConditionV1 model)
+        {
+            WriteDateTime(writer, model.LastTransitionTime);
+            WriteString(writer, model.Message);
+            WriteString(writer, model.Type);
+            WriteString(writer, model.Reason);
+            WriteString(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StatefulSetConditionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StatefulSetConditionV1 model)
+        {
+            model.LastTransitionTime = ReadDateTime(reader);
+            model.Message = ReadString(reader);
+            model.Type = ReadInternedString(reader);
+            model.Reason = ReadInternedString(reader);
+            model.Status = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StatefulSetOrdinalsV1"/>.
+    /// </summary>
+    public sealed class StatefulSetOrdinalsV1BinarySerializer
+        : KubeModelBinarySerializer<StatefulSetOrdinalsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StatefulSetOrdinalsV1BinarySerializer"/>.
+        /// </summary>
+        public static StatefulSetOrdinalsV1BinarySerializer Instance { get; } = new StatefulSetOrdinalsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StatefulSetOrdinalsV1BinarySerializer"/>.
+        /// </summary>
+        public StatefulSetOrdinalsV1BinarySerializer()
+            : base(schemaHash: 0xBE9084503CAB5577UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StatefulSetOrdinalsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StatefulSetOrdinalsV1 model)
+        {
+            WriteInt32(writer, model.Start);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StatefulSetOrdinalsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StatefulSetOrdinalsV1 model)
+        {
+            model.Start = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StatefulSetPersistentVolumeClaimRetentionPolicyV1"/>.
+    /// </summary>
+    public sealed class StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer
+        : KubeModelBinarySerializer<StatefulSetPersistentVolumeClaimRetentionPolicyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer"/>.
+        /// </summary>
+        public static StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer Instance { get; } = new StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer"/>.
+        /// </summary>
+        public StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer()
+            : base(schemaHash: 0xF5E1207117FC2E55UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StatefulSetPersistentVolumeClaimRetentionPolicyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StatefulSetPersistentVolumeClaimRetentionPolicyV1 model)
+        {
+            WriteString(writer, model.WhenDeleted);
+            WriteString(writer, model.WhenScaled);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StatefulSetPersistentVolumeClaimRetentionPolicyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StatefulSetPersistentVolumeClaimRetentionPolicyV1 model)
+        {
+            model.WhenDeleted = ReadString(reader);
+            model.WhenScaled = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StatefulSetSpecV1"/>.
+    /// </summary>
+    public sealed class StatefulSetSpecV1BinarySerializer
+        : KubeModelBinarySerializer<StatefulSetSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StatefulSetSpecV1BinarySerializer"/>.
+        /// </summary>
+        public static StatefulSetSpecV1BinarySerializer Instance { get; } = new StatefulSetSpecV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StatefulSetSpecV1BinarySerializer"/>.
+        /// </summary>
+        public StatefulSetSpecV1BinarySerializer()
+            : base(schemaHash: 0x29288A8B543425DAUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StatefulSetSpecV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StatefulSetSpecV1 model)
+        {
+            WriteString(writer, model.ServiceName);
+            PodTemplateSpecV1BinarySerializer.Instance.Write(writer, model.Template);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.Selector);
+            WriteInt32(writer, model.MinReadySeconds);
+            StatefulSetOrdinalsV1BinarySerializer.Instance.Write(writer, model.Ordinals);
+            WriteInt32(writer, model.Replicas);
+            WriteList(writer, model.VolumeClaimTemplates, PersistentVolumeClaimV1BinarySerializer.Instance.Write);
+            WriteInt32(writer, model.RevisionHistoryLimit);
+            StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer.Instance.Write(writer, model.PersistentVolumeClaimRetentionPolicy);
+            WriteString(writer, model.PodManagementPolicy);
+            StatefulSetUpdateStrategyV1BinarySerializer.Instance.Write(writer, model.UpdateStrategy);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StatefulSetSpecV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StatefulSetSpecV1 model)
+        {
+            model.ServiceName = ReadString(reader);
+            model.Template = PodTemplateSpecV1BinarySerializer.Instance.Read(reader);
+            model.Selector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            model.MinReadySeconds = ReadInt32(reader);
+            model.Ordinals = StatefulSetOrdinalsV1BinarySerializer.Instance.Read(reader);
+            model.Replicas = ReadInt32(reader);
+            ReadList(reader, model.VolumeClaimTemplates, PersistentVolumeClaimV1BinarySerializer.Instance.Read);
+            model.RevisionHistoryLimit = ReadInt32(reader);
+            model.PersistentVolumeClaimRetentionPolicy = StatefulSetPersistentVolumeClaimRetentionPolicyV1BinarySerializer.Instance.Read(reader);
+            model.PodManagementPolicy = ReadInternedString(reader);
+            model.UpdateStrategy = StatefulSetUpdateStrategyV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StatefulSetStatusV1"/>.
+    /// </summary>
+    public sealed class StatefulSetStatusV1BinarySerializer
+        : KubeModelBinarySerializer<StatefulSetStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StatefulSetStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static StatefulSetStatusV1BinarySerializer Instance { get; } = new StatefulSetStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StatefulSetStatusV1BinarySerializer"/>.
+        /// </summary>
+        public StatefulSetStatusV1BinarySerializer()
+            : base(schemaHash: 0xAC58E1FB2D48DFF3UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StatefulSetStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StatefulSetStatusV1 model)
+        {
+            WriteString(writer, model.CurrentRevision);
+            WriteInt64(writer, model.ObservedGeneration);
+            WriteString(writer, model.UpdateRevision);
+            WriteInt32(writer, model.AvailableReplicas);
+            WriteList(writer, model.Conditions, StatefulSetConditionV1BinarySerializer.Instance.Write);
+            WriteInt32(writer, model.CurrentReplicas);
+            WriteInt32(writer, model.ReadyReplicas);
+            WriteInt32(writer, model.Replicas);
+            WriteInt32(writer, model.UpdatedReplicas);
+            WriteInt32(writer, model.CollisionCount);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StatefulSetStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StatefulSetStatusV1 model)
+        {
+            model.CurrentRevision = ReadString(reader);
+            model.ObservedGeneration = ReadInt64(reader);
+            model.UpdateRevision = ReadString(reader);
+            model.AvailableReplicas = ReadInt32(reader);
+            ReadList(reader, model.Conditions, StatefulSetConditionV1BinarySerializer.Instance.Read);
+            model.CurrentReplicas = ReadInt32(reader);
+            model.ReadyReplicas = ReadInt32(reader);
+            model.Replicas = ReadInt32(reader).GetValueOrDefault();
+            model.UpdatedReplicas = ReadInt32(reader);
+            model.CollisionCount = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StatefulSetUpdateStrategyV1"/>.
+    /// </summary>
+    public sealed class StatefulSetUpdateStrategyV1BinarySerializer
+        : KubeModelBinarySerializer<StatefulSetUpdateStrategyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StatefulSetUpdateStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public static StatefulSetUpdateStrategyV1BinarySerializer Instance { get; } = new StatefulSetUpdateStrategyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StatefulSetUpdateStrategyV1BinarySerializer"/>.
+        /// </summary>
+        public StatefulSetUpdateStrategyV1BinarySerializer()
+            : base(schemaHash: 0x2F723667E26D0C0BUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StatefulSetUpdateStrategyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StatefulSetUpdateStrategyV1 model)
+        {
+            RollingUpdateStatefulSetStrategyV1BinarySerializer.Instance.Write(writer, model.RollingUpdate);
+            WriteString(writer, model.Type);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StatefulSetUpdateStrategyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StatefulSetUpdateStrategyV1 model)
+        {
+            model.RollingUpdate = RollingUpdateStatefulSetStrategyV1BinarySerializer.Instance.Read(reader);
+            model.Type = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StatefulSetV1"/>.
+    /// </summary>
+    public sealed class StatefulSetV1BinarySerializer
+        : KubeModelBinarySerializer<StatefulSetV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StatefulSetV1BinarySerializer"/>.
+        /// </summary>
+        public static StatefulSetV1BinarySerializer Instance { get; } = new StatefulSetV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StatefulSetV1BinarySerializer"/>.
+        /// </summary>
+        public StatefulSetV1BinarySerializer()
+            : base(schemaHash: 0x5DE0FBC5276D5F37UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StatefulSetV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StatefulSetV1 model)
+        {
+            ObjectMetaV1BinarySerializer.Instance.Write(writer, model.Metadata);
+            StatefulSetSpecV1BinarySerializer.Instance.Write(writer, model.Spec);
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.ApiVersion);
+            StatefulSetStatusV1BinarySerializer.Instance.Write(writer, model.Status);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StatefulSetV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StatefulSetV1 model)
+        {
+            model.Metadata = ObjectMetaV1BinarySerializer.Instance.Read(reader);
+            model.Spec = StatefulSetSpecV1BinarySerializer.Instance.Read(reader);
+            model.Kind = ReadInternedString(reader);
+            model.ApiVersion = ReadInternedString(reader);
+            model.Status = StatefulSetStatusV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StorageOSPersistentVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class StorageOSPersistentVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<StorageOSPersistentVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StorageOSPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static StorageOSPersistentVolumeSourceV1BinarySerializer Instance { get; } = new StorageOSPersistentVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StorageOSPersistentVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public StorageOSPersistentVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x5366E9396040D7C5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StorageOSPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StorageOSPersistentVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.VolumeName);
+            WriteString(writer, model.VolumeNamespace);
+            ObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StorageOSPersistentVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StorageOSPersistentVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.VolumeName = ReadString(reader);
+            model.VolumeNamespace = ReadString(reader);
+            model.SecretRef = ObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="StorageOSVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class StorageOSVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<StorageOSVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StorageOSVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static StorageOSVolumeSourceV1BinarySerializer Instance { get; } = new StorageOSVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="StorageOSVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public StorageOSVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x2E83EF5D2389AB85UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="StorageOSVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, StorageOSVolumeSourceV1 model)
+        {
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.VolumeName);
+            WriteString(writer, model.VolumeNamespace);
+            LocalObjectReferenceV1BinarySerializer.Instance.Write(writer, model.SecretRef);
+            WriteBoolean(writer, model.ReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="StorageOSVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, StorageOSVolumeSourceV1 model)
+        {
+            model.FsType = ReadString(reader);
+            model.VolumeName = ReadString(reader);
+            model.VolumeNamespace = ReadString(reader);
+            model.SecretRef = LocalObjectReferenceV1BinarySerializer.Instance.Read(reader);
+            model.ReadOnly = ReadBoolean(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SuccessPolicyRuleV1"/>.
+    /// </summary>
+    public sealed class SuccessPolicyRuleV1BinarySerializer
+        : KubeModelBinarySerializer<SuccessPolicyRuleV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SuccessPolicyRuleV1BinarySerializer"/>.
+        /// </summary>
+        public static SuccessPolicyRuleV1BinarySerializer Instance { get; } = new SuccessPolicyRuleV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SuccessPolicyRuleV1BinarySerializer"/>.
+        /// </summary>
+        public SuccessPolicyRuleV1BinarySerializer()
+            : base(schemaHash: 0xEDD6F4F3F4EC7451UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SuccessPolicyRuleV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SuccessPolicyRuleV1 model)
+        {
+            WriteString(writer, model.SucceededIndexes);
+            WriteInt32(writer, model.SucceededCount);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SuccessPolicyRuleV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SuccessPolicyRuleV1 model)
+        {
+            model.SucceededIndexes = ReadString(reader);
+            model.SucceededCount = ReadInt32(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SuccessPolicyV1"/>.
+    /// </summary>
+    public sealed class SuccessPolicyV1BinarySerializer
+        : KubeModelBinarySerializer<SuccessPolicyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SuccessPolicyV1BinarySerializer"/>.
+        /// </summary>
+        public static SuccessPolicyV1BinarySerializer Instance { get; } = new SuccessPolicyV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SuccessPolicyV1BinarySerializer"/>.
+        /// </summary>
+        public SuccessPolicyV1BinarySerializer()
+            : base(schemaHash: 0xAA4411B7C1FC8627UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SuccessPolicyV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SuccessPolicyV1 model)
+        {
+            WriteList(writer, model.Rules, SuccessPolicyRuleV1BinarySerializer.Instance.Write);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SuccessPolicyV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SuccessPolicyV1 model)
+        {
+            ReadList(reader, model.Rules, SuccessPolicyRuleV1BinarySerializer.Instance.Read);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="SysctlV1"/>.
+    /// </summary>
+    public sealed class SysctlV1BinarySerializer
+        : KubeModelBinarySerializer<SysctlV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SysctlV1BinarySerializer"/>.
+        /// </summary>
+        public static SysctlV1BinarySerializer Instance { get; } = new SysctlV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="SysctlV1BinarySerializer"/>.
+        /// </summary>
+        public SysctlV1BinarySerializer()
+            : base(schemaHash: 0x4E834E9A748AE64DUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="SysctlV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, SysctlV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Value);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="SysctlV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, SysctlV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.Value = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="TCPSocketActionV1"/>.
+    /// </summary>
+    public sealed class TCPSocketActionV1BinarySerializer
+        : KubeModelBinarySerializer<TCPSocketActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TCPSocketActionV1BinarySerializer"/>.
+        /// </summary>
+        public static TCPSocketActionV1BinarySerializer Instance { get; } = new TCPSocketActionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="TCPSocketActionV1BinarySerializer"/>.
+        /// </summary>
+        public TCPSocketActionV1BinarySerializer()
+            : base(schemaHash: 0xF6F141018506A38BUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="TCPSocketActionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, TCPSocketActionV1 model)
+        {
+            WriteString(writer, model.Host);
+            WriteInt32OrString(writer, model.Port);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="TCPSocketActionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, TCPSocketActionV1 model)
+        {
+            model.Host = ReadString(reader);
+            model.Port = ReadInt32OrString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="TaintV1"/>.
+    /// </summary>
+    public sealed class TaintV1BinarySerializer
+        : KubeModelBinarySerializer<TaintV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TaintV1BinarySerializer"/>.
+        /// </summary>
+        public static TaintV1BinarySerializer Instance { get; } = new TaintV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="TaintV1BinarySerializer"/>.
+        /// </summary>
+        public TaintV1BinarySerializer()
+            : base(schemaHash: 0x99AE9B970350B86AUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="TaintV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, TaintV1 model)
+        {
+            WriteDateTime(writer, model.TimeAdded);
+            WriteString(writer, model.Value);
+            WriteString(writer, model.Effect);
+            WriteString(writer, model.Key);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="TaintV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, TaintV1 model)
+        {
+            model.TimeAdded = ReadDateTime(reader);
+            model.Value = ReadString(reader);
+            model.Effect = ReadInternedString(reader);
+            model.Key = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="TolerationV1"/>.
+    /// </summary>
+    public sealed class TolerationV1BinarySerializer
+        : KubeModelBinarySerializer<TolerationV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TolerationV1BinarySerializer"/>.
+        /// </summary>
+        public static TolerationV1BinarySerializer Instance { get; } = new TolerationV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="TolerationV1BinarySerializer"/>.
+        /// </summary>
+        public TolerationV1BinarySerializer()
+            : base(schemaHash: 0x36287845C75CEDC6UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="TolerationV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, TolerationV1 model)
+        {
+            WriteString(writer, model.Value);
+            WriteString(writer, model.Operator);
+            WriteInt64(writer, model.TolerationSeconds);
+            WriteString(writer, model.Effect);
+            WriteString(writer, model.Key);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="TolerationV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, TolerationV1 model)
+        {
+            model.Value = ReadString(reader);
+            model.Operator = ReadInternedString(reader);
+            model.TolerationSeconds = ReadInt64(reader);
+            model.Effect = ReadInternedString(reader);
+            model.Key = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="TopologySpreadConstraintV1"/>.
+    /// </summary>
+    public sealed class TopologySpreadConstraintV1BinarySerializer
+        : KubeModelBinarySerializer<TopologySpreadConstraintV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TopologySpreadConstraintV1BinarySerializer"/>.
+        /// </summary>
+        public static TopologySpreadConstraintV1BinarySerializer Instance { get; } = new TopologySpreadConstraintV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="TopologySpreadConstraintV1BinarySerializer"/>.
+        /// </summary>
+        public TopologySpreadConstraintV1BinarySerializer()
+            : base(schemaHash: 0x60187A8509780919UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="TopologySpreadConstraintV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, TopologySpreadConstraintV1 model)
+        {
+            WriteString(writer, model.WhenUnsatisfiable);
+            LabelSelectorV1BinarySerializer.Instance.Write(writer, model.LabelSelector);
+            WriteList(writer, model.MatchLabelKeys, WriteString);
+            WriteInt32(writer, model.MinDomains);
+            WriteInt32(writer, model.MaxSkew);
+            WriteString(writer, model.NodeAffinityPolicy);
+            WriteString(writer, model.NodeTaintsPolicy);
+            WriteString(writer, model.TopologyKey);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="TopologySpreadConstraintV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, TopologySpreadConstraintV1 model)
+        {
+            model.WhenUnsatisfiable = ReadString(reader);
+            model.LabelSelector = LabelSelectorV1BinarySerializer.Instance.Read(reader);
+            ReadStringList(reader, model.MatchLabelKeys);
+            model.MinDomains = ReadInt32(reader);
+            model.MaxSkew = ReadInt32(reader).GetValueOrDefault();
+            model.NodeAffinityPolicy = ReadInternedString(reader);
+            model.NodeTaintsPolicy = ReadInternedString(reader);
+            model.TopologyKey = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="TypedLocalObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class TypedLocalObjectReferenceV1BinarySerializer
+        : KubeModelBinarySerializer<TypedLocalObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TypedLocalObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public static TypedLocalObjectReferenceV1BinarySerializer Instance { get; } = new TypedLocalObjectReferenceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="TypedLocalObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public TypedLocalObjectReferenceV1BinarySerializer()
+            : base(schemaHash: 0xF462183445090271UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="TypedLocalObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, TypedLocalObjectReferenceV1 model)
+        {
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.Name);
+            WriteString(writer, model.ApiGroup);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="TypedLocalObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, TypedLocalObjectReferenceV1 model)
+        {
+            model.Kind = ReadInternedString(reader);
+            model.Name = ReadString(reader);
+            model.ApiGroup = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="TypedObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class TypedObjectReferenceV1BinarySerializer
+        : KubeModelBinarySerializer<TypedObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TypedObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public static TypedObjectReferenceV1BinarySerializer Instance { get; } = new TypedObjectReferenceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="TypedObjectReferenceV1BinarySerializer"/>.
+        /// </summary>
+        public TypedObjectReferenceV1BinarySerializer()
+            : base(schemaHash: 0x7F2F4CEDD9FE47B7UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="TypedObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, TypedObjectReferenceV1 model)
+        {
+            WriteString(writer, model.Kind);
+            WriteString(writer, model.Name);
+            WriteString(writer, model.Namespace);
+            WriteString(writer, model.ApiGroup);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="TypedObjectReferenceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, TypedObjectReferenceV1 model)
+        {
+            model.Kind = ReadInternedString(reader);
+            model.Name = ReadString(reader);
+            model.Namespace = ReadInternedString(reader);
+            model.ApiGroup = ReadInternedString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="UncountedTerminatedPodsV1"/>.
+    /// </summary>
+    public sealed class UncountedTerminatedPodsV1BinarySerializer
+        : KubeModelBinarySerializer<UncountedTerminatedPodsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="UncountedTerminatedPodsV1BinarySerializer"/>.
+        /// </summary>
+        public static UncountedTerminatedPodsV1BinarySerializer Instance { get; } = new UncountedTerminatedPodsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="UncountedTerminatedPodsV1BinarySerializer"/>.
+        /// </summary>
+        public UncountedTerminatedPodsV1BinarySerializer()
+            : base(schemaHash: 0x86F1DB3BDB769CB5UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="UncountedTerminatedPodsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, UncountedTerminatedPodsV1 model)
+        {
+            WriteList(writer, model.Failed, WriteString);
+            WriteList(writer, model.Succeeded, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="UncountedTerminatedPodsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, UncountedTerminatedPodsV1 model)
+        {
+            ReadStringList(reader, model.Failed);
+            ReadStringList(reader, model.Succeeded);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VolumeDeviceV1"/>.
+    /// </summary>
+    public sealed class VolumeDeviceV1BinarySerializer
+        : KubeModelBinarySerializer<VolumeDeviceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeDeviceV1BinarySerializer"/>.
+        /// </summary>
+        public static VolumeDeviceV1BinarySerializer Instance { get; } = new VolumeDeviceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeDeviceV1BinarySerializer"/>.
+        /// </summary>
+        public VolumeDeviceV1BinarySerializer()
+            : base(schemaHash: 0xD558E09CDB16B694UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VolumeDeviceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VolumeDeviceV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.DevicePath);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VolumeDeviceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VolumeDeviceV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.DevicePath = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VolumeMountStatusV1"/>.
+    /// </summary>
+    public sealed class VolumeMountStatusV1BinarySerializer
+        : KubeModelBinarySerializer<VolumeMountStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeMountStatusV1BinarySerializer"/>.
+        /// </summary>
+        public static VolumeMountStatusV1BinarySerializer Instance { get; } = new VolumeMountStatusV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeMountStatusV1BinarySerializer"/>.
+        /// </summary>
+        public VolumeMountStatusV1BinarySerializer()
+            : base(schemaHash: 0x3F358B778C93006CUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VolumeMountStatusV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VolumeMountStatusV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.MountPath);
+            WriteBoolean(writer, model.ReadOnly);
+            WriteString(writer, model.RecursiveReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VolumeMountStatusV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VolumeMountStatusV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.MountPath = ReadInternedString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+            model.RecursiveReadOnly = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VolumeMountV1"/>.
+    /// </summary>
+    public sealed class VolumeMountV1BinarySerializer
+        : KubeModelBinarySerializer<VolumeMountV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeMountV1BinarySerializer"/>.
+        /// </summary>
+        public static VolumeMountV1BinarySerializer Instance { get; } = new VolumeMountV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeMountV1BinarySerializer"/>.
+        /// </summary>
+        public VolumeMountV1BinarySerializer()
+            : base(schemaHash: 0xA93D3A1E17993B42UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VolumeMountV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VolumeMountV1 model)
+        {
+            WriteString(writer, model.Name);
+            WriteString(writer, model.MountPath);
+            WriteString(writer, model.SubPath);
+            WriteString(writer, model.MountPropagation);
+            WriteString(writer, model.SubPathExpr);
+            WriteBoolean(writer, model.ReadOnly);
+            WriteString(writer, model.RecursiveReadOnly);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VolumeMountV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VolumeMountV1 model)
+        {
+            model.Name = ReadString(reader);
+            model.MountPath = ReadInternedString(reader);
+            model.SubPath = ReadString(reader);
+            model.MountPropagation = ReadString(reader);
+            model.SubPathExpr = ReadString(reader);
+            model.ReadOnly = ReadBoolean(reader);
+            model.RecursiveReadOnly = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VolumeNodeAffinityV1"/>.
+    /// </summary>
+    public sealed class VolumeNodeAffinityV1BinarySerializer
+        : KubeModelBinarySerializer<VolumeNodeAffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeNodeAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public static VolumeNodeAffinityV1BinarySerializer Instance { get; } = new VolumeNodeAffinityV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeNodeAffinityV1BinarySerializer"/>.
+        /// </summary>
+        public VolumeNodeAffinityV1BinarySerializer()
+            : base(schemaHash: 0xD02B45B9FE29F316UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VolumeNodeAffinityV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VolumeNodeAffinityV1 model)
+        {
+            NodeSelectorV1BinarySerializer.Instance.Write(writer, model.Required);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VolumeNodeAffinityV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VolumeNodeAffinityV1 model)
+        {
+            model.Required = NodeSelectorV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VolumeProjectionV1"/>.
+    /// </summary>
+    public sealed class VolumeProjectionV1BinarySerializer
+        : KubeModelBinarySerializer<VolumeProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public static VolumeProjectionV1BinarySerializer Instance { get; } = new VolumeProjectionV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeProjectionV1BinarySerializer"/>.
+        /// </summary>
+        public VolumeProjectionV1BinarySerializer()
+            : base(schemaHash: 0x2B91A13E69B13088UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VolumeProjectionV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VolumeProjectionV1 model)
+        {
+            DownwardAPIProjectionV1BinarySerializer.Instance.Write(writer, model.DownwardAPI);
+            ClusterTrustBundleProjectionV1BinarySerializer.Instance.Write(writer, model.ClusterTrustBundle);
+            ServiceAccountTokenProjectionV1BinarySerializer.Instance.Write(writer, model.ServiceAccountToken);
+            ConfigMapProjectionV1BinarySerializer.Instance.Write(writer, model.ConfigMap);
+            SecretProjectionV1BinarySerializer.Instance.Write(writer, model.Secret);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VolumeProjectionV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VolumeProjectionV1 model)
+        {
+            model.DownwardAPI = DownwardAPIProjectionV1BinarySerializer.Instance.Read(reader);
+            model.ClusterTrustBundle = ClusterTrustBundleProjectionV1BinarySerializer.Instance.Read(reader);
+            model.ServiceAccountToken = ServiceAccountTokenProjectionV1BinarySerializer.Instance.Read(reader);
+            model.ConfigMap = ConfigMapProjectionV1BinarySerializer.Instance.Read(reader);
+            model.Secret = SecretProjectionV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VolumeResourceRequirementsV1"/>.
+    /// </summary>
+    public sealed class VolumeResourceRequirementsV1BinarySerializer
+        : KubeModelBinarySerializer<VolumeResourceRequirementsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeResourceRequirementsV1BinarySerializer"/>.
+        /// </summary>
+        public static VolumeResourceRequirementsV1BinarySerializer Instance { get; } = new VolumeResourceRequirementsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeResourceRequirementsV1BinarySerializer"/>.
+        /// </summary>
+        public VolumeResourceRequirementsV1BinarySerializer()
+            : base(schemaHash: 0x43AFB4113CEAA975UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VolumeResourceRequirementsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VolumeResourceRequirementsV1 model)
+        {
+            WriteDictionary(writer, model.Limits, WriteString);
+            WriteDictionary(writer, model.Requests, WriteString);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VolumeResourceRequirementsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VolumeResourceRequirementsV1 model)
+        {
+            ReadStringDictionary(reader, model.Limits, InternedStrings.DictionaryKeys | InternedStrings.Values);
+            ReadStringDictionary(reader, model.Requests, InternedStrings.DictionaryKeys | InternedStrings.Values);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VolumeV1"/>.
+    /// </summary>
+    public sealed class VolumeV1BinarySerializer
+        : KubeModelBinarySerializer<VolumeV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeV1BinarySerializer"/>.
+        /// </summary>
+        public static VolumeV1BinarySerializer Instance { get; } = new VolumeV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeV1BinarySerializer"/>.
+        /// </summary>
+        public VolumeV1BinarySerializer()
+            : base(schemaHash: 0x8463598135E624DCUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VolumeV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VolumeV1 model)
+        {
+            DownwardAPIVolumeSourceV1BinarySerializer.Instance.Write(writer, model.DownwardAPI);
+            ScaleIOVolumeSourceV1BinarySerializer.Instance.Write(writer, model.ScaleIO);
+            FCVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Fc);
+            ProjectedVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Projected);
+            RBDVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Rbd);
+            AWSElasticBlockStoreVolumeSourceV1BinarySerializer.Instance.Write(writer, model.AwsElasticBlockStore);
+            AzureFileVolumeSourceV1BinarySerializer.Instance.Write(writer, model.AzureFile);
+            FlexVolumeSourceV1BinarySerializer.Instance.Write(writer, model.FlexVolume);
+            ImageVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Image);
+            WriteString(writer, model.Name);
+            PortworxVolumeSourceV1BinarySerializer.Instance.Write(writer, model.PortworxVolume);
+            QuobyteVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Quobyte);
+            VsphereVirtualDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.VsphereVolume);
+            HostPathVolumeSourceV1BinarySerializer.Instance.Write(writer, model.HostPath);
+            CSIVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Csi);
+            ISCSIVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Iscsi);
+            AzureDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.AzureDisk);
+            GCEPersistentDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.GcePersistentDisk);
+            PhotonPersistentDiskVolumeSourceV1BinarySerializer.Instance.Write(writer, model.PhotonPersistentDisk);
+            EphemeralVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Ephemeral);
+            PersistentVolumeClaimVolumeSourceV1BinarySerializer.Instance.Write(writer, model.PersistentVolumeClaim);
+            GitRepoVolumeSourceV1BinarySerializer.Instance.Write(writer, model.GitRepo);
+            ConfigMapVolumeSourceV1BinarySerializer.Instance.Write(writer, model.ConfigMap);
+            CinderVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Cinder);
+            EmptyDirVolumeSourceV1BinarySerializer.Instance.Write(writer, model.EmptyDir);
+            FlockerVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Flocker);
+            CephFSVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Cephfs);
+            GlusterfsVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Glusterfs);
+            NFSVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Nfs);
+            StorageOSVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Storageos);
+            SecretVolumeSourceV1BinarySerializer.Instance.Write(writer, model.Secret);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VolumeV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VolumeV1 model)
+        {
+            model.DownwardAPI = DownwardAPIVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.ScaleIO = ScaleIOVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Fc = FCVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Projected = ProjectedVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Rbd = RBDVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.AwsElasticBlockStore = AWSElasticBlockStoreVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.AzureFile = AzureFileVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.FlexVolume = FlexVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Image = ImageVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Name = ReadString(reader);
+            model.PortworxVolume = PortworxVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Quobyte = QuobyteVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.VsphereVolume = VsphereVirtualDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.HostPath = HostPathVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Csi = CSIVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Iscsi = ISCSIVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.AzureDisk = AzureDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.GcePersistentDisk = GCEPersistentDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.PhotonPersistentDisk = PhotonPersistentDiskVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Ephemeral = EphemeralVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.PersistentVolumeClaim = PersistentVolumeClaimVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.GitRepo = GitRepoVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.ConfigMap = ConfigMapVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Cinder = CinderVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.EmptyDir = EmptyDirVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Flocker = FlockerVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Cephfs = CephFSVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Glusterfs = GlusterfsVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Nfs = NFSVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Storageos = StorageOSVolumeSourceV1BinarySerializer.Instance.Read(reader);
+            model.Secret = SecretVolumeSourceV1BinarySerializer.Instance.Read(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="VsphereVirtualDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class VsphereVirtualDiskVolumeSourceV1BinarySerializer
+        : KubeModelBinarySerializer<VsphereVirtualDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VsphereVirtualDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public static VsphereVirtualDiskVolumeSourceV1BinarySerializer Instance { get; } = new VsphereVirtualDiskVolumeSourceV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="VsphereVirtualDiskVolumeSourceV1BinarySerializer"/>.
+        /// </summary>
+        public VsphereVirtualDiskVolumeSourceV1BinarySerializer()
+            : base(schemaHash: 0x1C9AE0457DD5C1BDUL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="VsphereVirtualDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, VsphereVirtualDiskVolumeSourceV1 model)
+        {
+            WriteString(writer, model.StoragePolicyID);
+            WriteString(writer, model.FsType);
+            WriteString(writer, model.StoragePolicyName);
+            WriteString(writer, model.VolumePath);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="VsphereVirtualDiskVolumeSourceV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, VsphereVirtualDiskVolumeSourceV1 model)
+        {
+            model.StoragePolicyID = ReadString(reader);
+            model.FsType = ReadString(reader);
+            model.StoragePolicyName = ReadString(reader);
+            model.VolumePath = ReadString(reader);
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="WeightedPodAffinityTermV1"/>.
+    /// </summary>
+    public sealed class WeightedPodAffinityTermV1BinarySerializer
+        : KubeModelBinarySerializer<WeightedPodAffinityTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="WeightedPodAffinityTermV1BinarySerializer"/>.
+        /// </summary>
+        public static WeightedPodAffinityTermV1BinarySerializer Instance { get; } = new WeightedPodAffinityTermV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="WeightedPodAffinityTermV1BinarySerializer"/>.
+        /// </summary>
+        public WeightedPodAffinityTermV1BinarySerializer()
+            : base(schemaHash: 0x24734BFA7AE2D147UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="WeightedPodAffinityTermV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, WeightedPodAffinityTermV1 model)
+        {
+            PodAffinityTermV1BinarySerializer.Instance.Write(writer, model.PodAffinityTerm);
+            WriteInt32(writer, model.Weight);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="WeightedPodAffinityTermV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, WeightedPodAffinityTermV1 model)
+        {
+            model.PodAffinityTerm = PodAffinityTermV1BinarySerializer.Instance.Read(reader);
+            model.Weight = ReadInt32(reader).GetValueOrDefault();
+        }
+    }
+
+    /// <summary>
+    ///     Generated binary serialiser for <see cref="WindowsSecurityContextOptionsV1"/>.
+    /// </summary>
+    public sealed class WindowsSecurityContextOptionsV1BinarySerializer
+        : KubeModelBinarySerializer<WindowsSecurityContextOptionsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="WindowsSecurityContextOptionsV1BinarySerializer"/>.
+        /// </summary>
+        public static WindowsSecurityContextOptionsV1BinarySerializer Instance { get; } = new WindowsSecurityContextOptionsV1BinarySerializer();
+
+        /// <summary>
+        ///     Create a new <see cref="WindowsSecurityContextOptionsV1BinarySerializer"/>.
+        /// </summary>
+        public WindowsSecurityContextOptionsV1BinarySerializer()
+            : base(schemaHash: 0x687DFDA80949ADC8UL)
+        {
+        }
+
+        /// <summary>
+        ///     Write the values of <see cref="WindowsSecurityContextOptionsV1"/> properties.
+        /// </summary>
+        protected override void WriteProperties(BinaryWriter writer, WindowsSecurityContextOptionsV1 model)
+        {
+            WriteString(writer, model.GmsaCredentialSpec);
+            WriteString(writer, model.GmsaCredentialSpecName);
+            WriteString(writer, model.RunAsUserName);
+            WriteBoolean(writer, model.HostProcess);
+        }
+
+        /// <summary>
+        ///     Read the values of <see cref="WindowsSecurityContextOptionsV1"/> properties.
+        /// </summary>
+        protected override void ReadProperties(BinaryReader reader, WindowsSecurityContextOptionsV1 model)
+        {
+            model.GmsaCredentialSpec = ReadString(reader);
+            model.GmsaCredentialSpecName = ReadString(reader);
+            model.RunAsUserName = ReadString(reader);
+            model.HostProcess = ReadBoolean(reader);
+        }
+    }
+}
@@ -0,0 +1,8868 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+
+namespace KubeClient.Models.Converters
+{
+    /// <summary>
+    ///     Generated (streaming) JSON converters for frequently-deserialised model types.
+    /// </summary>
+    public static partial class KubeModelConverters
+    {
+        /// <summary>
+        ///     Generated converters, with their model types.
+        /// </summary>
+        static readonly (Type modelType, JsonConverter converter)[] GeneratedConverters =
+        {
+            (typeof(AWSElasticBlockStoreVolumeSourceV1), AWSElasticBlockStoreVolumeSourceV1Converter.Instance),
+            (typeof(AffinityV1), AffinityV1Converter.Instance),
+            (typeof(AppArmorProfileV1), AppArmorProfileV1Converter.Instance),
+            (typeof(AzureDiskVolumeSourceV1), AzureDiskVolumeSourceV1Converter.Instance),
+            (typeof(AzureFileVolumeSourceV1), AzureFileVolumeSourceV1Converter.Instance),
+            (typeof(CSIVolumeSourceV1), CSIVolumeSourceV1Converter.Instance),
+            (typeof(CapabilitiesV1), CapabilitiesV1Converter.Instance),
+            (typeof(CephFSVolumeSourceV1), CephFSVolumeSourceV1Converter.Instance),
+            (typeof(CinderVolumeSourceV1), CinderVolumeSourceV1Converter.Instance),
+            (typeof(ClusterTrustBundleProjectionV1), ClusterTrustBundleProjectionV1Converter.Instance),
+            (typeof(ConfigMapEnvSourceV1), ConfigMapEnvSourceV1Converter.Instance),
+            (typeof(ConfigMapKeySelectorV1), ConfigMapKeySelectorV1Converter.Instance),
+            (typeof(ConfigMapListV1), ConfigMapListV1Converter.Instance),
+            (typeof(ConfigMapProjectionV1), ConfigMapProjectionV1Converter.Instance),
+            (typeof(ConfigMapV1), ConfigMapV1Converter.Instance),
+            (typeof(ConfigMapVolumeSourceV1), ConfigMapVolumeSourceV1Converter.Instance),
+            (typeof(ContainerPortV1), ContainerPortV1Converter.Instance),
+            (typeof(ContainerResizePolicyV1), ContainerResizePolicyV1Converter.Instance),
+            (typeof(ContainerStateRunningV1), ContainerStateRunningV1Converter.Instance),
+            (typeof(ContainerStateTerminatedV1), ContainerStateTerminatedV1Converter.Instance),
+            (typeof(ContainerStateV1), ContainerStateV1Converter.Instance),
+            (typeof(ContainerStateWaitingV1), ContainerStateWaitingV1Converter.Instance),
+            (typeof(ContainerStatusV1), ContainerStatusV1Converter.Instance),
+            (typeof(ContainerUserV1), ContainerUserV1Converter.Instance),
+            (typeof(ContainerV1), ContainerV1Converter.Instance),
+            (typeof(DownwardAPIProjectionV1), DownwardAPIProjectionV1Converter.Instance),
+            (typeof(DownwardAPIVolumeFileV1), DownwardAPIVolumeFileV1Converter.Instance),
+            (typeof(DownwardAPIVolumeSourceV1), DownwardAPIVolumeSourceV1Converter.Instance),
+            (typeof(EmptyDirVolumeSourceV1), EmptyDirVolumeSourceV1Converter.Instance),
+            (typeof(EndpointAddressV1), EndpointAddressV1Converter.Instance),
+            (typeof(EndpointConditionsV1), EndpointConditionsV1Converter.Instance),
+            (typeof(EndpointHintsV1), EndpointHintsV1Converter.Instance),
+            (typeof(EndpointPortV1), EndpointPortV1Converter.Instance),
+            (typeof(EndpointSliceListV1), EndpointSliceListV1Converter.Instance),
+            (typeof(EndpointSliceV1), EndpointSliceV1Converter.Instance),
+            (typeof(EndpointSubsetV1), EndpointSubsetV1Converter.Instance),
+            (typeof(EndpointV1), EndpointV1Converter.Instance),
+            (typeof(EndpointsListV1), EndpointsListV1Converter.Instance),
+            (typeof(EndpointsV1), EndpointsV1Converter.Instance),
+            (typeof(EnvFromSourceV1), EnvFromSourceV1Converter.Instance),
+            (typeof(EnvVarSourceV1), EnvVarSourceV1Converter.Instance),
+            (typeof(EnvVarV1), EnvVarV1Converter.Instance),
+            (typeof(EphemeralContainerV1), EphemeralContainerV1Converter.Instance),
+            (typeof(EphemeralVolumeSourceV1), EphemeralVolumeSourceV1Converter.Instance),
+            (typeof(EventListV1), EventListV1Converter.Instance),
+            (typeof(EventSeriesV1), EventSeriesV1Converter.Instance),
+            (typeof(EventSourceV1), EventSourceV1Converter.Instance),
+            (typeof(EventV1), EventV1Converter.Instance),
+            (typeof(ExecActionV1), ExecActionV1Converter.Instance),
+            (typeof(FCVolumeSourceV1), FCVolumeSourceV1Converter.Instance),
+            (typeof(FieldsV1), FieldsV1Converter.Instance),
+            (typeof(FlexVolumeSourceV1), FlexVolumeSourceV1Converter.Instance),
+            (typeof(FlockerVolumeSourceV1), FlockerVolumeSourceV1Converter.Instance),
+            (typeof(ForZoneV1), ForZoneV1Converter.Instance),
+            (typeof(GCEPersistentDiskVolumeSourceV1), GCEPersistentDiskVolumeSourceV1Converter.Instance),
+            (typeof(GRPCActionV1), GRPCActionV1Converter.Instance),
+            (typeof(GitRepoVolumeSourceV1), GitRepoVolumeSourceV1Converter.Instance),
+            (typeof(GlusterfsVolumeSourceV1), GlusterfsVolumeSourceV1Converter.Instance),
+            (typeof(HTTPGetActionV1), HTTPGetActionV1Converter.Instance),
+            (typeof(HTTPHeaderV1), HTTPHeaderV1Converter.Instance),
+            (typeof(HostAliasV1), HostAliasV1Converter.Instance),
+            (typeof(HostIPV1), HostIPV1Converter.Instance),
+            (typeof(HostPathVolumeSourceV1), HostPathVolumeSourceV1Converter.Instance),
+            (typeof(ISCSIVolumeSourceV1), ISCSIVolumeSourceV1Converter.Instance),
+            (typeof(ImageVolumeSourceV1), ImageVolumeSourceV1Converter.Instance),
+            (typeof(KeyToPathV1), KeyToPathV1Converter.Instance),
+            (typeof(LabelSelectorRequirementV1), LabelSelectorRequirementV1Converter.Instance),
+            (typeof(LabelSelectorV1), LabelSelectorV1Converter.Instance),
+            (typeof(LifecycleHandlerV1), LifecycleHandlerV1Converter.Instance),
+            (typeof(LifecycleV1), LifecycleV1Converter.Instance),
+            (typeof(LinuxContainerUserV1), LinuxContainerUserV1Converter.Instance),
+            (typeof(ListMetaV1), ListMetaV1Converter.Instance),
+            (typeof(LocalObjectReferenceV1), LocalObjectReferenceV1Converter.Instance),
+            (typeof(ManagedFieldsEntryV1), ManagedFieldsEntryV1Converter.Instance),
+            (typeof(NFSVolumeSourceV1), NFSVolumeSourceV1Converter.Instance),
+            (typeof(NodeAffinityV1), NodeAffinityV1Converter.Instance),
+            (typeof(NodeSelectorRequirementV1), NodeSelectorRequirementV1Converter.Instance),
+            (typeof(NodeSelectorTermV1), NodeSelectorTermV1Converter.Instance),
+            (typeof(NodeSelectorV1), NodeSelectorV1Converter.Instance),
+            (typeof(ObjectFieldSelectorV1), ObjectFieldSelectorV1Converter.Instance),
+            (typeof(ObjectMetaV1), ObjectMetaV1Converter.Instance),
+            (typeof(ObjectReferenceV1), ObjectReferenceV1Converter.Instance),
+            (typeof(OwnerReferenceV1), OwnerReferenceV1Converter.Instance),
+            (typeof(PersistentVolumeClaimSpecV1), PersistentVolumeClaimSpecV1Converter.Instance),
+            (typeof(PersistentVolumeClaimTemplateV1), PersistentVolumeClaimTemplateV1Converter.Instance),
+            (typeof(PersistentVolumeClaimVolumeSourceV1), PersistentVolumeClaimVolumeSourceV1Converter.Instance),
+            (typeof(PhotonPersistentDiskVolumeSourceV1), PhotonPersistentDiskVolumeSourceV1Converter.Instance),
+            (typeof(PodAffinityTermV1), PodAffinityTermV1Converter.Instance),
+            (typeof(PodAffinityV1), PodAffinityV1Converter.Instance),
+            (typeof(PodAntiAffinityV1), PodAntiAffinityV1Converter.Instance),
+            (typeof(PodConditionV1), PodConditionV1Converter.Instance),
+            (typeof(PodDNSConfigOptionV1), PodDNSConfigOptionV1Converter.Instance),
+            (typeof(PodDNSConfigV1), PodDNSConfigV1Converter.Instance),
+            (typeof(PodIPV1), PodIPV1Converter.Instance),
+            (typeof(PodListV1), PodListV1Converter.Instance),
+            (typeof(PodOSV1), PodOSV1Converter.Instance),
+            (typeof(PodReadinessGateV1), PodReadinessGateV1Converter.Instance),
+            (typeof(PodResourceClaimStatusV1), PodResourceClaimStatusV1Converter.Instance),
+            (typeof(PodResourceClaimV1), PodResourceClaimV1Converter.Instance),
+            (typeof(PodSchedulingGateV1), PodSchedulingGateV1Converter.Instance),
+            (typeof(PodSecurityContextV1), PodSecurityContextV1Converter.Instance),
+            (typeof(PodSpecV1), PodSpecV1Converter.Instance),
+            (typeof(PodStatusV1), PodStatusV1Converter.Instance),
+            (typeof(PodV1), PodV1Converter.Instance),
+            (typeof(PortworxVolumeSourceV1), PortworxVolumeSourceV1Converter.Instance),
+            (typeof(PreferredSchedulingTermV1), PreferredSchedulingTermV1Converter.Instance),
+            (typeof(ProbeV1), ProbeV1Converter.Instance),
+            (typeof(ProjectedVolumeSourceV1), ProjectedVolumeSourceV1Converter.Instance),
+            (typeof(QuobyteVolumeSourceV1), QuobyteVolumeSourceV1Converter.Instance),
+            (typeof(RBDVolumeSourceV1), RBDVolumeSourceV1Converter.Instance),
+            (typeof(ResourceClaimV1), ResourceClaimV1Converter.Instance),
+            (typeof(ResourceFieldSelectorV1), ResourceFieldSelectorV1Converter.Instance),
+            (typeof(ResourceHealthV1), ResourceHealthV1Converter.Instance),
+            (typeof(ResourceRequirementsV1), ResourceRequirementsV1Converter.Instance),
+            (typeof(ResourceStatusV1), ResourceStatusV1Converter.Instance),
+            (typeof(SELinuxOptionsV1), SELinuxOptionsV1Converter.Instance),
+            (typeof(ScaleIOVolumeSourceV1), ScaleIOVolumeSourceV1Converter.Instance),
+            (typeof(SeccompProfileV1), SeccompProfileV1Converter.Instance),
+            (typeof(SecretEnvSourceV1), SecretEnvSourceV1Converter.Instance),
+            (typeof(SecretKeySelectorV1), SecretKeySelectorV1Converter.Instance),
+            (typeof(SecretProjectionV1), SecretProjectionV1Converter.Instance),
+            (typeof(SecretVolumeSourceV1), SecretVolumeSourceV1Converter.Instance),
+            (typeof(SecurityContextV1), SecurityContextV1Converter.Instance),
+            (typeof(ServiceAccountTokenProjectionV1), ServiceAccountTokenProjectionV1Converter.Instance),
+            (typeof(SleepActionV1), SleepActionV1Converter.Instance),
+            (typeof(StorageOSVolumeSourceV1), StorageOSVolumeSourceV1Converter.Instance),
+            (typeof(SysctlV1), SysctlV1Converter.Instance),
+            (typeof(TCPSocketActionV1), TCPSocketActionV1Converter.Instance),
+            (typeof(TolerationV1), TolerationV1Converter.Instance),
+            (typeof(TopologySpreadConstraintV1), TopologySpreadConstraintV1Converter.Instance),
+            (typeof(TypedLocalObjectReferenceV1), TypedLocalObjectReferenceV1Converter.Instance),
+            (typeof(TypedObjectReferenceV1), TypedObjectReferenceV1Converter.Instance),
+            (typeof(VolumeDeviceV1), VolumeDeviceV1Converter.Instance),
+            (typeof(VolumeMountStatusV1), VolumeMountStatusV1Converter.Instance),
+            (typeof(VolumeMountV1), VolumeMountV1Converter.Instance),
+            (typeof(VolumeProjectionV1), VolumeProjectionV1Converter.Instance),
+            (typeof(VolumeResourceRequirementsV1), VolumeResourceRequirementsV1Converter.Instance),
+            (typeof(VolumeV1), VolumeV1Converter.Instance),
+            (typeof(VsphereVirtualDiskVolumeSourceV1), VsphereVirtualDiskVolumeSourceV1Converter.Instance),
+            (typeof(WeightedPodAffinityTermV1), WeightedPodAffinityTermV1Converter.Instance),
+            (typeof(WindowsSecurityContextOptionsV1), WindowsSecurityContextOptionsV1Converter.Instance),
+        };
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="AWSElasticBlockStoreVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class AWSElasticBlockStoreVolumeSourceV1Converter
+        : KubeModelConverter<AWSElasticBlockStoreVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AWSElasticBlockStoreVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static AWSElasticBlockStoreVolumeSourceV1Converter Instance { get; } = new AWSElasticBlockStoreVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="AWSElasticBlockStoreVolumeSourceV1Converter"/>.
+        /// </summary>
+        public AWSElasticBlockStoreVolumeSourceV1Converter()
+            : base("volumeID", "fsType", "partition", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="AWSElasticBlockStoreVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(AWSElasticBlockStoreVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "volumeID":
+                {
+                    model.VolumeID = reader.ReadAsString();
+
+                    return true;
+                }
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "partition":
+                {
+                    model.Partition = reader.ReadAsInt32() ?? model.Partition;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="AffinityV1"/>.
+    /// </summary>
+    public sealed class AffinityV1Converter
+        : KubeModelConverter<AffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AffinityV1Converter"/>.
+        /// </summary>
+        public static AffinityV1Converter Instance { get; } = new AffinityV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="AffinityV1Converter"/>.
+        /// </summary>
+        public AffinityV1Converter()
+            : base("nodeAffinity", "podAffinity", "podAntiAffinity")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="AffinityV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(AffinityV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "nodeAffinity":
+                {
+                    model.NodeAffinity = ReadModel(reader, NodeAffinityV1Converter.Instance, model.NodeAffinity, serializer) ?? model.NodeAffinity;
+
+                    return true;
+                }
+                case "podAffinity":
+                {
+                    model.PodAffinity = ReadModel(reader, PodAffinityV1Converter.Instance, model.PodAffinity, serializer) ?? model.PodAffinity;
+
+                    return true;
+                }
+                case "podAntiAffinity":
+                {
+                    model.PodAntiAffinity = ReadModel(reader, PodAntiAffinityV1Converter.Instance, model.PodAntiAffinity, serializer) ?? model.PodAntiAffinity;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="AppArmorProfileV1"/>.
+    /// </summary>
+    public sealed class AppArmorProfileV1Converter
+        : KubeModelConverter<AppArmorProfileV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AppArmorProfileV1Converter"/>.
+        /// </summary>
+        public static AppArmorProfileV1Converter Instance { get; } = new AppArmorProfileV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="AppArmorProfileV1Converter"/>.
+        /// </summary>
+        public AppArmorProfileV1Converter()
+            : base("localhostProfile", "type")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="AppArmorProfileV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(AppArmorProfileV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "localhostProfile":
+                {
+                    model.LocalhostProfile = reader.ReadAsString() ?? model.LocalhostProfile;
+
+                    return true;
+                }
+                case "type":
+                {
+                    model.Type = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="AzureDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class AzureDiskVolumeSourceV1Converter
+        : KubeModelConverter<AzureDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AzureDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static AzureDiskVolumeSourceV1Converter Instance { get; } = new AzureDiskVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="AzureDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public AzureDiskVolumeSourceV1Converter()
+            : base("diskURI", "kind", "cachingMode", "diskName", "fsType", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="AzureDiskVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(AzureDiskVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "diskURI":
+                {
+                    model.DiskURI = reader.ReadAsString();
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = ReadAsInternedString(reader) ?? model.Kind;
+
+                    return true;
+                }
+                case "cachingMode":
+                {
+                    model.CachingMode = reader.ReadAsString() ?? model.CachingMode;
+
+                    return true;
+                }
+                case "diskName":
+                {
+                    model.DiskName = reader.ReadAsString();
+
+                    return true;
+                }
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="AzureFileVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class AzureFileVolumeSourceV1Converter
+        : KubeModelConverter<AzureFileVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="AzureFileVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static AzureFileVolumeSourceV1Converter Instance { get; } = new AzureFileVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="AzureFileVolumeSourceV1Converter"/>.
+        /// </summary>
+        public AzureFileVolumeSourceV1Converter()
+            : base("secretName", "shareName", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="AzureFileVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(AzureFileVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "secretName":
+                {
+                    model.SecretName = reader.ReadAsString();
+
+                    return true;
+                }
+                case "shareName":
+                {
+                    model.ShareName = reader.ReadAsString();
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="CSIVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CSIVolumeSourceV1Converter
+        : KubeModelConverter<CSIVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CSIVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static CSIVolumeSourceV1Converter Instance { get; } = new CSIVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="CSIVolumeSourceV1Converter"/>.
+        /// </summary>
+        public CSIVolumeSourceV1Converter()
+            : base("fsType", "nodePublishSecretRef", "driver", "volumeAttributes", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="CSIVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(CSIVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "nodePublishSecretRef":
+                {
+                    model.NodePublishSecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.NodePublishSecretRef, serializer) ?? model.NodePublishSecretRef;
+
+                    return true;
+                }
+                case "driver":
+                {
+                    model.Driver = reader.ReadAsString();
+
+                    return true;
+                }
+                case "volumeAttributes":
+                {
+                    ReadStringDictionary(reader, model.VolumeAttributes);
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="CapabilitiesV1"/>.
+    /// </summary>
+    public sealed class CapabilitiesV1Converter
+        : KubeModelConverter<CapabilitiesV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CapabilitiesV1Converter"/>.
+        /// </summary>
+        public static CapabilitiesV1Converter Instance { get; } = new CapabilitiesV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="CapabilitiesV1Converter"/>.
+        /// </summary>
+        public CapabilitiesV1Converter()
+            : base("add", "drop")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="CapabilitiesV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(CapabilitiesV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "add":
+                {
+                    ReadStringList(reader, model.Add);
+
+                    return true;
+                }
+                case "drop":
+                {
+                    ReadStringList(reader, model.Drop);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="CephFSVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CephFSVolumeSourceV1Converter
+        : KubeModelConverter<CephFSVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CephFSVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static CephFSVolumeSourceV1Converter Instance { get; } = new CephFSVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="CephFSVolumeSourceV1Converter"/>.
+        /// </summary>
+        public CephFSVolumeSourceV1Converter()
+            : base("secretFile", "secretRef", "path", "user", "monitors", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="CephFSVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(CephFSVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "secretFile":
+                {
+                    model.SecretFile = reader.ReadAsString() ?? model.SecretFile;
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.SecretRef, serializer) ?? model.SecretRef;
+
+                    return true;
+                }
+                case "path":
+                {
+                    model.Path = reader.ReadAsString() ?? model.Path;
+
+                    return true;
+                }
+                case "user":
+                {
+                    model.User = reader.ReadAsString() ?? model.User;
+
+                    return true;
+                }
+                case "monitors":
+                {
+                    ReadStringList(reader, model.Monitors);
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="CinderVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class CinderVolumeSourceV1Converter
+        : KubeModelConverter<CinderVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="CinderVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static CinderVolumeSourceV1Converter Instance { get; } = new CinderVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="CinderVolumeSourceV1Converter"/>.
+        /// </summary>
+        public CinderVolumeSourceV1Converter()
+            : base("volumeID", "fsType", "secretRef", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="CinderVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(CinderVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "volumeID":
+                {
+                    model.VolumeID = reader.ReadAsString();
+
+                    return true;
+                }
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.SecretRef, serializer) ?? model.SecretRef;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ClusterTrustBundleProjectionV1"/>.
+    /// </summary>
+    public sealed class ClusterTrustBundleProjectionV1Converter
+        : KubeModelConverter<ClusterTrustBundleProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ClusterTrustBundleProjectionV1Converter"/>.
+        /// </summary>
+        public static ClusterTrustBundleProjectionV1Converter Instance { get; } = new ClusterTrustBundleProjectionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ClusterTrustBundleProjectionV1Converter"/>.
+        /// </summary>
+        public ClusterTrustBundleProjectionV1Converter()
+            : base("name", "signerName", "path", "optional", "labelSelector")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ClusterTrustBundleProjectionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ClusterTrustBundleProjectionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "signerName":
+                {
+                    model.SignerName = reader.ReadAsString() ?? model.SignerName;
+
+                    return true;
+                }
+                case "path":
+                {
+                    model.Path = reader.ReadAsString();
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                case "labelSelector":
+                {
+                    model.LabelSelector = ReadModel(reader, LabelSelectorV1Converter.Instance, model.LabelSelector, serializer) ?? model.LabelSelector;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ConfigMapEnvSourceV1"/>.
+    /// </summary>
+    public sealed class ConfigMapEnvSourceV1Converter
+        : KubeModelConverter<ConfigMapEnvSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapEnvSourceV1Converter"/>.
+        /// </summary>
+        public static ConfigMapEnvSourceV1Converter Instance { get; } = new ConfigMapEnvSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapEnvSourceV1Converter"/>.
+        /// </summary>
+        public ConfigMapEnvSourceV1Converter()
+            : base("name", "optional")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ConfigMapEnvSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ConfigMapEnvSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ConfigMapKeySelectorV1"/>.
+    /// </summary>
+    public sealed class ConfigMapKeySelectorV1Converter
+        : KubeModelConverter<ConfigMapKeySelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapKeySelectorV1Converter"/>.
+        /// </summary>
+        public static ConfigMapKeySelectorV1Converter Instance { get; } = new ConfigMapKeySelectorV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapKeySelectorV1Converter"/>.
+        /// </summary>
+        public ConfigMapKeySelectorV1Converter()
+            : base("name", "optional", "key")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ConfigMapKeySelectorV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ConfigMapKeySelectorV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                case "key":
+                {
+                    model.Key = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ConfigMapListV1"/>.
+    /// </summary>
+    public sealed class ConfigMapListV1Converter
+        : KubeModelConverter<ConfigMapListV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapListV1Converter"/>.
+        /// </summary>
+        public static ConfigMapListV1Converter Instance { get; } = new ConfigMapListV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapListV1Converter"/>.
+        /// </summary>
+        public ConfigMapListV1Converter()
+            : base("metadata", "kind", "apiVersion", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ConfigMapListV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ConfigMapListV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ListMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, ConfigMapV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ConfigMapProjectionV1"/>.
+    /// </summary>
+    public sealed class ConfigMapProjectionV1Converter
+        : KubeModelConverter<ConfigMapProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapProjectionV1Converter"/>.
+        /// </summary>
+        public static ConfigMapProjectionV1Converter Instance { get; } = new ConfigMapProjectionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapProjectionV1Converter"/>.
+        /// </summary>
+        public ConfigMapProjectionV1Converter()
+            : base("name", "optional", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ConfigMapProjectionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ConfigMapProjectionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, KeyToPathV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ConfigMapV1"/>.
+    /// </summary>
+    public sealed class ConfigMapV1Converter
+        : KubeModelConverter<ConfigMapV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapV1Converter"/>.
+        /// </summary>
+        public static ConfigMapV1Converter Instance { get; } = new ConfigMapV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapV1Converter"/>.
+        /// </summary>
+        public ConfigMapV1Converter()
+            : base("binaryData", "data", "metadata", "kind", "immutable", "apiVersion")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ConfigMapV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ConfigMapV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "binaryData":
+                {
+                    ReadStringDictionary(reader, model.BinaryData);
+
+                    return true;
+                }
+                case "data":
+                {
+                    ReadStringDictionary(reader, model.Data);
+
+                    return true;
+                }
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ObjectMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "immutable":
+                {
+                    model.Immutable = reader.ReadAsBoolean() ?? model.Immutable;
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ConfigMapVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ConfigMapVolumeSourceV1Converter
+        : KubeModelConverter<ConfigMapVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ConfigMapVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static ConfigMapVolumeSourceV1Converter Instance { get; } = new ConfigMapVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ConfigMapVolumeSourceV1Converter"/>.
+        /// </summary>
+        public ConfigMapVolumeSourceV1Converter()
+            : base("defaultMode", "name", "optional", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ConfigMapVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ConfigMapVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "defaultMode":
+                {
+                    model.DefaultMode = reader.ReadAsInt32() ?? model.DefaultMode;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, KeyToPathV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerPortV1"/>.
+    /// </summary>
+    public sealed class ContainerPortV1Converter
+        : KubeModelConverter<ContainerPortV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerPortV1Converter"/>.
+        /// </summary>
+        public static ContainerPortV1Converter Instance { get; } = new ContainerPortV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerPortV1Converter"/>.
+        /// </summary>
+        public ContainerPortV1Converter()
+            : base("hostIP", "name", "protocol", "containerPort", "hostPort")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerPortV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerPortV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "hostIP":
+                {
+                    model.HostIP = ReadAsInternedString(reader) ?? model.HostIP;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "protocol":
+                {
+                    model.Protocol = ReadAsInternedString(reader) ?? model.Protocol;
+
+                    return true;
+                }
+                case "containerPort":
+                {
+                    model.ContainerPort = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                case "hostPort":
+                {
+                    model.HostPort = reader.ReadAsInt32() ?? model.HostPort;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerResizePolicyV1"/>.
+    /// </summary>
+    public sealed class ContainerResizePolicyV1Converter
+        : KubeModelConverter<ContainerResizePolicyV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerResizePolicyV1Converter"/>.
+        /// </summary>
+        public static ContainerResizePolicyV1Converter Instance { get; } = new ContainerResizePolicyV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerResizePolicyV1Converter"/>.
+        /// </summary>
+        public ContainerResizePolicyV1Converter()
+            : base("resourceName", "restartPolicy")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerResizePolicyV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerResizePolicyV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "resourceName":
+                {
+                    model.ResourceName = reader.ReadAsString();
+
+                    return true;
+                }
+                case "restartPolicy":
+                {
+                    model.RestartPolicy = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerStateRunningV1"/>.
+    /// </summary>
+    public sealed class ContainerStateRunningV1Converter
+        : KubeModelConverter<ContainerStateRunningV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateRunningV1Converter"/>.
+        /// </summary>
+        public static ContainerStateRunningV1Converter Instance { get; } = new ContainerStateRunningV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateRunningV1Converter"/>.
+        /// </summary>
+        public ContainerStateRunningV1Converter()
+            : base("startedAt")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerStateRunningV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerStateRunningV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "startedAt":
+                {
+                    model.StartedAt = reader.ReadAsDateTime() ?? model.StartedAt;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerStateTerminatedV1"/>.
+    /// </summary>
+    public sealed class ContainerStateTerminatedV1Converter
+        : KubeModelConverter<ContainerStateTerminatedV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateTerminatedV1Converter"/>.
+        /// </summary>
+        public static ContainerStateTerminatedV1Converter Instance { get; } = new ContainerStateTerminatedV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateTerminatedV1Converter"/>.
+        /// </summary>
+        public ContainerStateTerminatedV1Converter()
+            : base("containerID", "exitCode", "message", "signal", "reason", "finishedAt", "startedAt")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerStateTerminatedV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerStateTerminatedV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "containerID":
+                {
+                    model.ContainerID = reader.ReadAsString() ?? model.ContainerID;
+
+                    return true;
+                }
+                case "exitCode":
+                {
+                    model.ExitCode = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                case "message":
+                {
+                    model.Message = reader.ReadAsString() ?? model.Message;
+
+                    return true;
+                }
+                case "signal":
+                {
+                    model.Signal = reader.ReadAsInt32() ?? model.Signal;
+
+                    return true;
+                }
+                case "reason":
+                {
+                    model.Reason = ReadAsInternedString(reader) ?? model.Reason;
+
+                    return true;
+                }
+                case "finishedAt":
+                {
+                    model.FinishedAt = reader.ReadAsDateTime() ?? model.FinishedAt;
+
+                    return true;
+                }
+                case "startedAt":
+                {
+                    model.StartedAt = reader.ReadAsDateTime() ?? model.StartedAt;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerStateV1"/>.
+    /// </summary>
+    public sealed class ContainerStateV1Converter
+        : KubeModelConverter<ContainerStateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateV1Converter"/>.
+        /// </summary>
+        public static ContainerStateV1Converter Instance { get; } = new ContainerStateV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateV1Converter"/>.
+        /// </summary>
+        public ContainerStateV1Converter()
+            : base("terminated", "running", "waiting")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerStateV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerStateV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "terminated":
+                {
+                    model.Terminated = ReadModel(reader, ContainerStateTerminatedV1Converter.Instance, model.Terminated, serializer) ?? model.Terminated;
+
+                    return true;
+                }
+                case "running":
+                {
+                    model.Running = ReadModel(reader, ContainerStateRunningV1Converter.Instance, model.Running, serializer) ?? model.Running;
+
+                    return true;
+                }
+                case "waiting":
+                {
+                    model.Waiting = ReadModel(reader, ContainerStateWaitingV1Converter.Instance, model.Waiting, serializer) ?? model.Waiting;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerStateWaitingV1"/>.
+    /// </summary>
+    public sealed class ContainerStateWaitingV1Converter
+        : KubeModelConverter<ContainerStateWaitingV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStateWaitingV1Converter"/>.
+        /// </summary>
+        public static ContainerStateWaitingV1Converter Instance { get; } = new ContainerStateWaitingV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStateWaitingV1Converter"/>.
+        /// </summary>
+        public ContainerStateWaitingV1Converter()
+            : base("message", "reason")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerStateWaitingV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerStateWaitingV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "message":
+                {
+                    model.Message = reader.ReadAsString() ?? model.Message;
+
+                    return true;
+                }
+                case "reason":
+                {
+                    model.Reason = ReadAsInternedString(reader) ?? model.Reason;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerStatusV1"/>.
+    /// </summary>
+    public sealed class ContainerStatusV1Converter
+        : KubeModelConverter<ContainerStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerStatusV1Converter"/>.
+        /// </summary>
+        public static ContainerStatusV1Converter Instance { get; } = new ContainerStatusV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerStatusV1Converter"/>.
+        /// </summary>
+        public ContainerStatusV1Converter()
+            : base("containerID", "imageID", "started", "image", "lastState", "name", "state", "user", "allocatedResources", "allocatedResourcesStatus", "resources", "volumeMounts", "restartCount", "ready")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerStatusV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerStatusV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "containerID":
+                {
+                    model.ContainerID = reader.ReadAsString() ?? model.ContainerID;
+
+                    return true;
+                }
+                case "imageID":
+                {
+                    model.ImageID = reader.ReadAsString();
+
+                    return true;
+                }
+                case "started":
+                {
+                    model.Started = reader.ReadAsBoolean() ?? model.Started;
+
+                    return true;
+                }
+                case "image":
+                {
+                    model.Image = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "lastState":
+                {
+                    model.LastState = ReadModel(reader, ContainerStateV1Converter.Instance, model.LastState, serializer) ?? model.LastState;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "state":
+                {
+                    model.State = ReadModel(reader, ContainerStateV1Converter.Instance, model.State, serializer) ?? model.State;
+
+                    return true;
+                }
+                case "user":
+                {
+                    model.User = ReadModel(reader, ContainerUserV1Converter.Instance, model.User, serializer) ?? model.User;
+
+                    return true;
+                }
+                case "allocatedResources":
+                {
+                    ReadStringDictionary(reader, model.AllocatedResources);
+
+                    return true;
+                }
+                case "allocatedResourcesStatus":
+                {
+                    ReadModelList(reader, ResourceStatusV1Converter.Instance, model.AllocatedResourcesStatus, serializer);
+
+                    return true;
+                }
+                case "resources":
+                {
+                    model.Resources = ReadModel(reader, ResourceRequirementsV1Converter.Instance, model.Resources, serializer) ?? model.Resources;
+
+                    return true;
+                }
+                case "volumeMounts":
+                {
+                    ReadModelList(reader, VolumeMountStatusV1Converter.Instance, model.VolumeMounts, serializer);
+
+                    return true;
+                }
+                case "restartCount":
+                {
+                    model.RestartCount = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                case "ready":
+                {
+                    model.Ready = RequiredValue(reader.ReadAsBoolean(), reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerUserV1"/>.
+    /// </summary>
+    public sealed class ContainerUserV1Converter
+        : KubeModelConverter<ContainerUserV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerUserV1Converter"/>.
+        /// </summary>
+        public static ContainerUserV1Converter Instance { get; } = new ContainerUserV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerUserV1Converter"/>.
+        /// </summary>
+        public ContainerUserV1Converter()
+            : base("linux")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerUserV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerUserV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "linux":
+                {
+                    model.Linux = ReadModel(reader, LinuxContainerUserV1Converter.Instance, model.Linux, serializer) ?? model.Linux;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ContainerV1"/>.
+    /// </summary>
+    public sealed class ContainerV1Converter
+        : KubeModelConverter<ContainerV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ContainerV1Converter"/>.
+        /// </summary>
+        public static ContainerV1Converter Instance { get; } = new ContainerV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ContainerV1Converter"/>.
+        /// </summary>
+        public ContainerV1Converter()
+            : base("command", "image", "lifecycle", "livenessProbe", "name", "readinessProbe", "startupProbe", "stdinOnce", "terminationMessagePath", "envFrom", "stdin", "workingDir", "args", "ports", "resources", "volumeDevices", "volumeMounts", "securityContext", "env", "imagePullPolicy", "resizePolicy", "restartPolicy", "terminationMessagePolicy", "tty")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ContainerV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ContainerV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "command":
+                {
+                    ReadStringList(reader, model.Command, InternedStrings.Values);
+
+                    return true;
+                }
+                case "image":
+                {
+                    model.Image = ReadAsInternedString(reader) ?? model.Image;
+
+                    return true;
+                }
+                case "lifecycle":
+                {
+                    model.Lifecycle = ReadModel(reader, LifecycleV1Converter.Instance, model.Lifecycle, serializer) ?? model.Lifecycle;
+
+                    return true;
+                }
+                case "livenessProbe":
+                {
+                    model.LivenessProbe = ReadModel(reader, ProbeV1Converter.Instance, model.LivenessProbe, serializer) ?? model.LivenessProbe;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "readinessProbe":
+                {
+                    model.ReadinessProbe = ReadModel(reader, ProbeV1Converter.Instance, model.ReadinessProbe, serializer) ?? model.ReadinessProbe;
+
+                    return true;
+                }
+                case "startupProbe":
+                {
+                    model.StartupProbe = ReadModel(reader, ProbeV1Converter.Instance, model.StartupProbe, serializer) ?? model.StartupProbe;
+
+                    return true;
+                }
+                case "stdinOnce":
+                {
+                    model.StdinOnce = reader.ReadAsBoolean() ?? model.StdinOnce;
+
+                    return true;
+                }
+                case "terminationMessagePath":
+                {
+                    model.TerminationMessagePath = ReadAsInternedString(reader) ?? model.TerminationMessagePath;
+
+                    return true;
+                }
+                case "envFrom":
+                {
+                    ReadModelList(reader, EnvFromSourceV1Converter.Instance, model.EnvFrom, serializer);
+
+                    return true;
+                }
+                case "stdin":
+                {
+                    model.Stdin = reader.ReadAsBoolean() ?? model.Stdin;
+
+                    return true;
+                }
+                case "workingDir":
+                {
+                    model.WorkingDir = reader.ReadAsString() ?? model.WorkingDir;
+
+                    return true;
+                }
+                case "args":
+                {
+                    ReadStringList(reader, model.Args, InternedStrings.Values);
+
+                    return true;
+                }
+                case "ports":
+                {
+                    ReadModelList(reader, ContainerPortV1Converter.Instance, model.Ports, serializer);
+
+                    return true;
+                }
+                case "resources":
+                {
+                    model.Resources = ReadModel(reader, ResourceRequirementsV1Converter.Instance, model.Resources, serializer) ?? model.Resources;
+
+                    return true;
+                }
+                case "volumeDevices":
+                {
+                    ReadModelList(reader, VolumeDeviceV1Converter.Instance, model.VolumeDevices, serializer);
+
+                    return true;
+                }
+                case "volumeMounts":
+                {
+                    ReadModelList(reader, VolumeMountV1Converter.Instance, model.VolumeMounts, serializer);
+
+                    return true;
+                }
+                case "securityContext":
+                {
+                    model.SecurityContext = ReadModel(reader, SecurityContextV1Converter.Instance, model.SecurityContext, serializer) ?? model.SecurityContext;
+
+                    return true;
+                }
+                case "env":
+                {
+                    ReadModelList(reader, EnvVarV1Converter.Instance, model.Env, serializer);
+
+                    return true;
+                }
+                case "imagePullPolicy":
+                {
+                    model.ImagePullPolicy = ReadAsInternedString(reader) ?? model.ImagePullPolicy;
+
+                    return true;
+                }
+                case "resizePolicy":
+                {
+                    ReadModelList(reader, ContainerResizePolicyV1Converter.Instance, model.ResizePolicy, serializer);
+
+                    return true;
+                }
+                case "restartPolicy":
+                {
+                    model.RestartPolicy = ReadAsInternedString(reader) ?? model.RestartPolicy;
+
+                    return true;
+                }
+                case "terminationMessagePolicy":
+                {
+                    model.TerminationMessagePolicy = ReadAsInternedString(reader) ?? model.TerminationMessagePolicy;
+
+                    return true;
+                }
+                case "tty":
+                {
+                    model.Tty = reader.ReadAsBoolean() ?? model.Tty;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="DownwardAPIProjectionV1"/>.
+    /// </summary>
+    public sealed class DownwardAPIProjectionV1Converter
+        : KubeModelConverter<DownwardAPIProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DownwardAPIProjectionV1Converter"/>.
+        /// </summary>
+        public static DownwardAPIProjectionV1Converter Instance { get; } = new DownwardAPIProjectionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="DownwardAPIProjectionV1Converter"/>.
+        /// </summary>
+        public DownwardAPIProjectionV1Converter()
+            : base("items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="DownwardAPIProjectionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(DownwardAPIProjectionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "items":
+                {
+                    ReadModelList(reader, DownwardAPIVolumeFileV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="DownwardAPIVolumeFileV1"/>.
+    /// </summary>
+    public sealed class DownwardAPIVolumeFileV1Converter
+        : KubeModelConverter<DownwardAPIVolumeFileV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DownwardAPIVolumeFileV1Converter"/>.
+        /// </summary>
+        public static DownwardAPIVolumeFileV1Converter Instance { get; } = new DownwardAPIVolumeFileV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="DownwardAPIVolumeFileV1Converter"/>.
+        /// </summary>
+        public DownwardAPIVolumeFileV1Converter()
+            : base("mode", "fieldRef", "resourceFieldRef", "path")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="DownwardAPIVolumeFileV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(DownwardAPIVolumeFileV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "mode":
+                {
+                    model.Mode = reader.ReadAsInt32() ?? model.Mode;
+
+                    return true;
+                }
+                case "fieldRef":
+                {
+                    model.FieldRef = ReadModel(reader, ObjectFieldSelectorV1Converter.Instance, model.FieldRef, serializer) ?? model.FieldRef;
+
+                    return true;
+                }
+                case "resourceFieldRef":
+                {
+                    model.ResourceFieldRef = ReadModel(reader, ResourceFieldSelectorV1Converter.Instance, model.ResourceFieldRef, serializer) ?? model.ResourceFieldRef;
+
+                    return true;
+                }
+                case "path":
+                {
+                    model.Path = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="DownwardAPIVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class DownwardAPIVolumeSourceV1Converter
+        : KubeModelConverter<DownwardAPIVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="DownwardAPIVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static DownwardAPIVolumeSourceV1Converter Instance { get; } = new DownwardAPIVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="DownwardAPIVolumeSourceV1Converter"/>.
+        /// </summary>
+        public DownwardAPIVolumeSourceV1Converter()
+            : base("defaultMode", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="DownwardAPIVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(DownwardAPIVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "defaultMode":
+                {
+                    model.DefaultMode = reader.ReadAsInt32() ?? model.DefaultMode;
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, DownwardAPIVolumeFileV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EmptyDirVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class EmptyDirVolumeSourceV1Converter
+        : KubeModelConverter<EmptyDirVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EmptyDirVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static EmptyDirVolumeSourceV1Converter Instance { get; } = new EmptyDirVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EmptyDirVolumeSourceV1Converter"/>.
+        /// </summary>
+        public EmptyDirVolumeSourceV1Converter()
+            : base("medium", "sizeLimit")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EmptyDirVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EmptyDirVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "medium":
+                {
+                    model.Medium = reader.ReadAsString() ?? model.Medium;
+
+                    return true;
+                }
+                case "sizeLimit":
+                {
+                    model.SizeLimit = reader.ReadAsString() ?? model.SizeLimit;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointAddressV1"/>.
+    /// </summary>
+    public sealed class EndpointAddressV1Converter
+        : KubeModelConverter<EndpointAddressV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointAddressV1Converter"/>.
+        /// </summary>
+        public static EndpointAddressV1Converter Instance { get; } = new EndpointAddressV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointAddressV1Converter"/>.
+        /// </summary>
+        public EndpointAddressV1Converter()
+            : base("hostname", "nodeName", "targetRef", "ip")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointAddressV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointAddressV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "hostname":
+                {
+                    model.Hostname = reader.ReadAsString() ?? model.Hostname;
+
+                    return true;
+                }
+                case "nodeName":
+                {
+                    model.NodeName = ReadAsInternedString(reader) ?? model.NodeName;
+
+                    return true;
+                }
+                case "targetRef":
+                {
+                    model.TargetRef = ReadModel(reader, ObjectReferenceV1Converter.Instance, model.TargetRef, serializer) ?? model.TargetRef;
+
+                    return true;
+                }
+                case "ip":
+                {
+                    model.Ip = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointConditionsV1"/>.
+    /// </summary>
+    public sealed class EndpointConditionsV1Converter
+        : KubeModelConverter<EndpointConditionsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointConditionsV1Converter"/>.
+        /// </summary>
+        public static EndpointConditionsV1Converter Instance { get; } = new EndpointConditionsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointConditionsV1Converter"/>.
+        /// </summary>
+        public EndpointConditionsV1Converter()
+            : base("serving", "terminating", "ready")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointConditionsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointConditionsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "serving":
+                {
+                    model.Serving = reader.ReadAsBoolean() ?? model.Serving;
+
+                    return true;
+                }
+                case "terminating":
+                {
+                    model.Terminating = reader.ReadAsBoolean() ?? model.Terminating;
+
+                    return true;
+                }
+                case "ready":
+                {
+                    model.Ready = reader.ReadAsBoolean() ?? model.Ready;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointHintsV1"/>.
+    /// </summary>
+    public sealed class EndpointHintsV1Converter
+        : KubeModelConverter<EndpointHintsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointHintsV1Converter"/>.
+        /// </summary>
+        public static EndpointHintsV1Converter Instance { get; } = new EndpointHintsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointHintsV1Converter"/>.
+        /// </summary>
+        public EndpointHintsV1Converter()
+            : base("forZones")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointHintsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointHintsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "forZones":
+                {
+                    ReadModelList(reader, ForZoneV1Converter.Instance, model.ForZones, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointPortV1"/>.
+    /// </summary>
+    public sealed class EndpointPortV1Converter
+        : KubeModelConverter<EndpointPortV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointPortV1Converter"/>.
+        /// </summary>
+        public static EndpointPortV1Converter Instance { get; } = new EndpointPortV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointPortV1Converter"/>.
+        /// </summary>
+        public EndpointPortV1Converter()
+            : base("name", "appProtocol", "protocol", "port")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointPortV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointPortV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "appProtocol":
+                {
+                    model.AppProtocol = reader.ReadAsString() ?? model.AppProtocol;
+
+                    return true;
+                }
+                case "protocol":
+                {
+                    model.Protocol = ReadAsInternedString(reader) ?? model.Protocol;
+
+                    return true;
+                }
+                case "port":
+                {
+                    model.Port = reader.ReadAsInt32() ?? model.Port;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointSliceListV1"/>.
+    /// </summary>
+    public sealed class EndpointSliceListV1Converter
+        : KubeModelConverter<EndpointSliceListV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointSliceListV1Converter"/>.
+        /// </summary>
+        public static EndpointSliceListV1Converter Instance { get; } = new EndpointSliceListV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointSliceListV1Converter"/>.
+        /// </summary>
+        public EndpointSliceListV1Converter()
+            : base("metadata", "kind", "apiVersion", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointSliceListV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointSliceListV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ListMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, EndpointSliceV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointSliceV1"/>.
+    /// </summary>
+    public sealed class EndpointSliceV1Converter
+        : KubeModelConverter<EndpointSliceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointSliceV1Converter"/>.
+        /// </summary>
+        public static EndpointSliceV1Converter Instance { get; } = new EndpointSliceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointSliceV1Converter"/>.
+        /// </summary>
+        public EndpointSliceV1Converter()
+            : base("metadata", "kind", "addressType", "apiVersion", "endpoints", "ports")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointSliceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointSliceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ObjectMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "addressType":
+                {
+                    model.AddressType = reader.ReadAsString();
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "endpoints":
+                {
+                    ReadModelList(reader, EndpointV1Converter.Instance, model.Endpoints, serializer);
+
+                    return true;
+                }
+                case "ports":
+                {
+                    ReadModelList(reader, EndpointPortV1Converter.Instance, model.Ports, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointSubsetV1"/>.
+    /// </summary>
+    public sealed class EndpointSubsetV1Converter
+        : KubeModelConverter<EndpointSubsetV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointSubsetV1Converter"/>.
+        /// </summary>
+        public static EndpointSubsetV1Converter Instance { get; } = new EndpointSubsetV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointSubsetV1Converter"/>.
+        /// </summary>
+        public EndpointSubsetV1Converter()
+            : base("addresses", "notReadyAddresses", "ports")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointSubsetV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointSubsetV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "addresses":
+                {
+                    ReadModelList(reader, EndpointAddressV1Converter.Instance, model.Addresses, serializer);
+
+                    return true;
+                }
+                case "notReadyAddresses":
+                {
+                    ReadModelList(reader, EndpointAddressV1Converter.Instance, model.NotReadyAddresses, serializer);
+
+                    return true;
+                }
+                case "ports":
+                {
+                    ReadModelList(reader, EndpointPortV1Converter.Instance, model.Ports, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointV1"/>.
+    /// </summary>
+    public sealed class EndpointV1Converter
+        : KubeModelConverter<EndpointV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointV1Converter"/>.
+        /// </summary>
+        public static EndpointV1Converter Instance { get; } = new EndpointV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointV1Converter"/>.
+        /// </summary>
+        public EndpointV1Converter()
+            : base("hostname", "nodeName", "zone", "targetRef", "addresses", "conditions", "hints", "deprecatedTopology")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "hostname":
+                {
+                    model.Hostname = reader.ReadAsString() ?? model.Hostname;
+
+                    return true;
+                }
+                case "nodeName":
+                {
+                    model.NodeName = ReadAsInternedString(reader) ?? model.NodeName;
+
+                    return true;
+                }
+                case "zone":
+                {
+                    model.Zone = reader.ReadAsString() ?? model.Zone;
+
+                    return true;
+                }
+                case "targetRef":
+                {
+                    model.TargetRef = ReadModel(reader, ObjectReferenceV1Converter.Instance, model.TargetRef, serializer) ?? model.TargetRef;
+
+                    return true;
+                }
+                case "addresses":
+                {
+                    ReadStringList(reader, model.Addresses);
+
+                    return true;
+                }
+                case "conditions":
+                {
+                    model.Conditions = ReadModel(reader, EndpointConditionsV1Converter.Instance, model.Conditions, serializer) ?? model.Conditions;
+
+                    return true;
+                }
+                case "hints":
+                {
+                    model.Hints = ReadModel(reader, EndpointHintsV1Converter.Instance, model.Hints, serializer) ?? model.Hints;
+
+                    return true;
+                }
+                case "deprecatedTopology":
+                {
+                    ReadStringDictionary(reader, model.DeprecatedTopology);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointsListV1"/>.
+    /// </summary>
+    public sealed class EndpointsListV1Converter
+        : KubeModelConverter<EndpointsListV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointsListV1Converter"/>.
+        /// </summary>
+        public static EndpointsListV1Converter Instance { get; } = new EndpointsListV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointsListV1Converter"/>.
+        /// </summary>
+        public EndpointsListV1Converter()
+            : base("metadata", "kind", "apiVersion", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointsListV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointsListV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ListMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, EndpointsV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EndpointsV1"/>.
+    /// </summary>
+    public sealed class EndpointsV1Converter
+        : KubeModelConverter<EndpointsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EndpointsV1Converter"/>.
+        /// </summary>
+        public static EndpointsV1Converter Instance { get; } = new EndpointsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EndpointsV1Converter"/>.
+        /// </summary>
+        public EndpointsV1Converter()
+            : base("metadata", "kind", "apiVersion", "subsets")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EndpointsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EndpointsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ObjectMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "subsets":
+                {
+                    ReadModelList(reader, EndpointSubsetV1Converter.Instance, model.Subsets, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EnvFromSourceV1"/>.
+    /// </summary>
+    public sealed class EnvFromSourceV1Converter
+        : KubeModelConverter<EnvFromSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EnvFromSourceV1Converter"/>.
+        /// </summary>
+        public static EnvFromSourceV1Converter Instance { get; } = new EnvFromSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EnvFromSourceV1Converter"/>.
+        /// </summary>
+        public EnvFromSourceV1Converter()
+            : base("configMapRef", "secretRef", "prefix")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EnvFromSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EnvFromSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "configMapRef":
+                {
+                    model.ConfigMapRef = ReadModel(reader, ConfigMapEnvSourceV1Converter.Instance, model.ConfigMapRef, serializer) ?? model.ConfigMapRef;
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, SecretEnvSourceV1Converter.Instance, model.SecretRef, serializer) ?? model.SecretRef;
+
+                    return true;
+                }
+                case "prefix":
+                {
+                    model.Prefix = reader.ReadAsString() ?? model.Prefix;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EnvVarSourceV1"/>.
+    /// </summary>
+    public sealed class EnvVarSourceV1Converter
+        : KubeModelConverter<EnvVarSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EnvVarSourceV1Converter"/>.
+        /// </summary>
+        public static EnvVarSourceV1Converter Instance { get; } = new EnvVarSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EnvVarSourceV1Converter"/>.
+        /// </summary>
+        public EnvVarSourceV1Converter()
+            : base("configMapKeyRef", "fieldRef", "resourceFieldRef", "secretKeyRef")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EnvVarSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EnvVarSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "configMapKeyRef":
+                {
+                    model.ConfigMapKeyRef = ReadModel(reader, ConfigMapKeySelectorV1Converter.Instance, model.ConfigMapKeyRef, serializer) ?? model.ConfigMapKeyRef;
+
+                    return true;
+                }
+                case "fieldRef":
+                {
+                    model.FieldRef = ReadModel(reader, ObjectFieldSelectorV1Converter.Instance, model.FieldRef, serializer) ?? model.FieldRef;
+
+                    return true;
+                }
+                case "resourceFieldRef":
+                {
+                    model.ResourceFieldRef = ReadModel(reader, ResourceFieldSelectorV1Converter.Instance, model.ResourceFieldRef, serializer) ?? model.ResourceFieldRef;
+
+                    return true;
+                }
+                case "secretKeyRef":
+                {
+                    model.SecretKeyRef = ReadModel(reader, SecretKeySelectorV1Converter.Instance, model.SecretKeyRef, serializer) ?? model.SecretKeyRef;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EnvVarV1"/>.
+    /// </summary>
+    public sealed class EnvVarV1Converter
+        : KubeModelConverter<EnvVarV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EnvVarV1Converter"/>.
+        /// </summary>
+        public static EnvVarV1Converter Instance { get; } = new EnvVarV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EnvVarV1Converter"/>.
+        /// </summary>
+        public EnvVarV1Converter()
+            : base("name", "value", "valueFrom")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EnvVarV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EnvVarV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "value":
+                {
+                    model.Value = reader.ReadAsString() ?? model.Value;
+
+                    return true;
+                }
+                case "valueFrom":
+                {
+                    model.ValueFrom = ReadModel(reader, EnvVarSourceV1Converter.Instance, model.ValueFrom, serializer) ?? model.ValueFrom;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EphemeralContainerV1"/>.
+    /// </summary>
+    public sealed class EphemeralContainerV1Converter
+        : KubeModelConverter<EphemeralContainerV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EphemeralContainerV1Converter"/>.
+        /// </summary>
+        public static EphemeralContainerV1Converter Instance { get; } = new EphemeralContainerV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EphemeralContainerV1Converter"/>.
+        /// </summary>
+        public EphemeralContainerV1Converter()
+            : base("command", "image", "lifecycle", "livenessProbe", "name", "readinessProbe", "startupProbe", "stdinOnce", "targetContainerName", "terminationMessagePath", "envFrom", "stdin", "workingDir", "args", "ports", "resources", "volumeDevices", "volumeMounts", "securityContext", "env", "imagePullPolicy", "resizePolicy", "restartPolicy", "terminationMessagePolicy", "tty")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EphemeralContainerV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EphemeralContainerV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "command":
+                {
+                    ReadStringList(reader, model.Command, InternedStrings.Values);
+
+                    return true;
+                }
+                case "image":
+                {
+                    model.Image = ReadAsInternedString(reader) ?? model.Image;
+
+                    return true;
+                }
+                case "lifecycle":
+                {
+                    model.Lifecycle = ReadModel(reader, LifecycleV1Converter.Instance, model.Lifecycle, serializer) ?? model.Lifecycle;
+
+                    return true;
+                }
+                case "livenessProbe":
+                {
+                    model.LivenessProbe = ReadModel(reader, ProbeV1Converter.Instance, model.LivenessProbe, serializer) ?? model.LivenessProbe;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "readinessProbe":
+                {
+                    model.ReadinessProbe = ReadModel(reader, ProbeV1Converter.Instance, model.ReadinessProbe, serializer) ?? model.ReadinessProbe;
+
+                    return true;
+                }
+                case "startupProbe":
+                {
+                    model.StartupProbe = ReadModel(reader, ProbeV1Converter.Instance, model.StartupProbe, serializer) ?? model.StartupProbe;
+
+                    return true;
+                }
+                case "stdinOnce":
+                {
+                    model.StdinOnce = reader.ReadAsBoolean() ?? model.StdinOnce;
+
+                    return true;
+                }
+                case "targetContainerName":
+                {
+                    model.TargetContainerName = reader.ReadAsString() ?? model.TargetContainerName;
+
+                    return true;
+                }
+                case "terminationMessagePath":
+                {
+                    model.TerminationMessagePath = ReadAsInternedString(reader) ?? model.TerminationMessagePath;
+
+                    return true;
+                }
+                case "envFrom":
+                {
+                    ReadModelList(reader, EnvFromSourceV1Converter.Instance, model.EnvFrom, serializer);
+
+                    return true;
+                }
+                case "stdin":
+                {
+                    model.Stdin = reader.ReadAsBoolean() ?? model.Stdin;
+
+                    return true;
+                }
+                case "workingDir":
+                {
+                    model.WorkingDir = reader.ReadAsString() ?? model.WorkingDir;
+
+                    return true;
+                }
+                case "args":
+                {
+                    ReadStringList(reader, model.Args, InternedStrings.Values);
+
+                    return true;
+                }
+                case "ports":
+                {
+                    ReadModelList(reader, ContainerPortV1Converter.Instance, model.Ports, serializer);
+
+                    return true;
+                }
+                case "resources":
+                {
+                    model.Resources = ReadModel(reader, ResourceRequirementsV1Converter.Instance, model.Resources, serializer) ?? model.Resources;
+
+                    return true;
+                }
+                case "volumeDevices":
+                {
+                    ReadModelList(reader, VolumeDeviceV1Converter.Instance, model.VolumeDevices, serializer);
+
+                    return true;
+                }
+                case "volumeMounts":
+                {
+                    ReadModelList(reader, VolumeMountV1Converter.Instance, model.VolumeMounts, serializer);
+
+                    return true;
+                }
+                case "securityContext":
+                {
+                    model.SecurityContext = ReadModel(reader, SecurityContextV1Converter.Instance, model.SecurityContext, serializer) ?? model.SecurityContext;
+
+                    return true;
+                }
+                case "env":
+                {
+                    ReadModelList(reader, EnvVarV1Converter.Instance, model.Env, serializer);
+
+                    return true;
+                }
+                case "imagePullPolicy":
+                {
+                    model.ImagePullPolicy = ReadAsInternedString(reader) ?? model.ImagePullPolicy;
+
+                    return true;
+                }
+                case "resizePolicy":
+                {
+                    ReadModelList(reader, ContainerResizePolicyV1Converter.Instance, model.ResizePolicy, serializer);
+
+                    return true;
+                }
+                case "restartPolicy":
+                {
+                    model.RestartPolicy = ReadAsInternedString(reader) ?? model.RestartPolicy;
+
+                    return true;
+                }
+                case "terminationMessagePolicy":
+                {
+                    model.TerminationMessagePolicy = ReadAsInternedString(reader) ?? model.TerminationMessagePolicy;
+
+                    return true;
+                }
+                case "tty":
+                {
+                    model.Tty = reader.ReadAsBoolean() ?? model.Tty;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EphemeralVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class EphemeralVolumeSourceV1Converter
+        : KubeModelConverter<EphemeralVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EphemeralVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static EphemeralVolumeSourceV1Converter Instance { get; } = new EphemeralVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EphemeralVolumeSourceV1Converter"/>.
+        /// </summary>
+        public EphemeralVolumeSourceV1Converter()
+            : base("volumeClaimTemplate")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EphemeralVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EphemeralVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "volumeClaimTemplate":
+                {
+                    model.VolumeClaimTemplate = ReadModel(reader, PersistentVolumeClaimTemplateV1Converter.Instance, model.VolumeClaimTemplate, serializer) ?? model.VolumeClaimTemplate;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EventListV1"/>.
+    /// </summary>
+    public sealed class EventListV1Converter
+        : KubeModelConverter<EventListV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EventListV1Converter"/>.
+        /// </summary>
+        public static EventListV1Converter Instance { get; } = new EventListV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EventListV1Converter"/>.
+        /// </summary>
+        public EventListV1Converter()
+            : base("metadata", "kind", "apiVersion", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EventListV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EventListV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ListMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, EventV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EventSeriesV1"/>.
+    /// </summary>
+    public sealed class EventSeriesV1Converter
+        : KubeModelConverter<EventSeriesV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EventSeriesV1Converter"/>.
+        /// </summary>
+        public static EventSeriesV1Converter Instance { get; } = new EventSeriesV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EventSeriesV1Converter"/>.
+        /// </summary>
+        public EventSeriesV1Converter()
+            : base("lastObservedTime", "count")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EventSeriesV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EventSeriesV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "lastObservedTime":
+                {
+                    model.LastObservedTime = reader.ReadAsDateTime();
+
+                    return true;
+                }
+                case "count":
+                {
+                    model.Count = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EventSourceV1"/>.
+    /// </summary>
+    public sealed class EventSourceV1Converter
+        : KubeModelConverter<EventSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EventSourceV1Converter"/>.
+        /// </summary>
+        public static EventSourceV1Converter Instance { get; } = new EventSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EventSourceV1Converter"/>.
+        /// </summary>
+        public EventSourceV1Converter()
+            : base("component", "host")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EventSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EventSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "component":
+                {
+                    model.Component = reader.ReadAsString() ?? model.Component;
+
+                    return true;
+                }
+                case "host":
+                {
+                    model.Host = reader.ReadAsString() ?? model.Host;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="EventV1"/>.
+    /// </summary>
+    public sealed class EventV1Converter
+        : KubeModelConverter<EventV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="EventV1Converter"/>.
+        /// </summary>
+        public static EventV1Converter Instance { get; } = new EventV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="EventV1Converter"/>.
+        /// </summary>
+        public EventV1Converter()
+            : base("metadata", "kind", "related", "eventTime", "message", "reportingInstance", "source", "type", "action", "apiVersion", "reason", "firstTimestamp", "lastTimestamp", "series", "count", "involvedObject", "reportingComponent")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="EventV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(EventV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ObjectMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "related":
+                {
+                    model.Related = ReadModel(reader, ObjectReferenceV1Converter.Instance, model.Related, serializer) ?? model.Related;
+
+                    return true;
+                }
+                case "eventTime":
+                {
+                    model.EventTime = reader.ReadAsDateTime() ?? model.EventTime;
+
+                    return true;
+                }
+                case "message":
+                {
+                    model.Message = reader.ReadAsString() ?? model.Message;
+
+                    return true;
+                }
+                case "reportingInstance":
+                {
+                    model.ReportingInstance = reader.ReadAsString() ?? model.ReportingInstance;
+
+                    return true;
+                }
+                case "source":
+                {
+                    model.Source = ReadModel(reader, EventSourceV1Converter.Instance, model.Source, serializer) ?? model.Source;
+
+                    return true;
+                }
+                case "type":
+                {
+                    model.Type = ReadAsInternedString(reader) ?? model.Type;
+
+                    return true;
+                }
+                case "action":
+                {
+                    model.Action = reader.ReadAsString() ?? model.Action;
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "reason":
+                {
+                    model.Reason = ReadAsInternedString(reader) ?? model.Reason;
+
+                    return true;
+                }
+                case "firstTimestamp":
+                {
+                    model.FirstTimestamp = reader.ReadAsDateTime() ?? model.FirstTimestamp;
+
+                    return true;
+                }
+                case "lastTimestamp":
+                {
+                    model.LastTimestamp = reader.ReadAsDateTime() ?? model.LastTimestamp;
+
+                    return true;
+                }
+                case "series":
+                {
+                    model.Series = ReadModel(reader, EventSeriesV1Converter.Instance, model.Series, serializer) ?? model.Series;
+
+                    return true;
+                }
+                case "count":
+                {
+                    model.Count = reader.ReadAsInt32() ?? model.Count;
+
+                    return true;
+                }
+                case "involvedObject":
+                {
+                    model.InvolvedObject = ReadModel(reader, ObjectReferenceV1Converter.Instance, model.InvolvedObject, serializer);
+
+                    return true;
+                }
+                case "reportingComponent":
+                {
+                    model.ReportingComponent = reader.ReadAsString() ?? model.ReportingComponent;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ExecActionV1"/>.
+    /// </summary>
+    public sealed class ExecActionV1Converter
+        : KubeModelConverter<ExecActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ExecActionV1Converter"/>.
+        /// </summary>
+        public static ExecActionV1Converter Instance { get; } = new ExecActionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ExecActionV1Converter"/>.
+        /// </summary>
+        public ExecActionV1Converter()
+            : base("command")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ExecActionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ExecActionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "command":
+                {
+                    ReadStringList(reader, model.Command, InternedStrings.Values);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="FCVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class FCVolumeSourceV1Converter
+        : KubeModelConverter<FCVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FCVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static FCVolumeSourceV1Converter Instance { get; } = new FCVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="FCVolumeSourceV1Converter"/>.
+        /// </summary>
+        public FCVolumeSourceV1Converter()
+            : base("fsType", "lun", "targetWWNs", "wwids", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="FCVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(FCVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "lun":
+                {
+                    model.Lun = reader.ReadAsInt32() ?? model.Lun;
+
+                    return true;
+                }
+                case "targetWWNs":
+                {
+                    ReadStringList(reader, model.TargetWWNs);
+
+                    return true;
+                }
+                case "wwids":
+                {
+                    ReadStringList(reader, model.Wwids);
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="FieldsV1"/>.
+    /// </summary>
+    public sealed class FieldsV1Converter
+        : KubeModelConverter<FieldsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FieldsV1Converter"/>.
+        /// </summary>
+        public static FieldsV1Converter Instance { get; } = new FieldsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="FieldsV1Converter"/>.
+        /// </summary>
+        public FieldsV1Converter()
+            : base()
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="FieldsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(FieldsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="FlexVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class FlexVolumeSourceV1Converter
+        : KubeModelConverter<FlexVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FlexVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static FlexVolumeSourceV1Converter Instance { get; } = new FlexVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="FlexVolumeSourceV1Converter"/>.
+        /// </summary>
+        public FlexVolumeSourceV1Converter()
+            : base("fsType", "secretRef", "driver", "options", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="FlexVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(FlexVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.SecretRef, serializer) ?? model.SecretRef;
+
+                    return true;
+                }
+                case "driver":
+                {
+                    model.Driver = reader.ReadAsString();
+
+                    return true;
+                }
+                case "options":
+                {
+                    ReadStringDictionary(reader, model.Options);
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="FlockerVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class FlockerVolumeSourceV1Converter
+        : KubeModelConverter<FlockerVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="FlockerVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static FlockerVolumeSourceV1Converter Instance { get; } = new FlockerVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="FlockerVolumeSourceV1Converter"/>.
+        /// </summary>
+        public FlockerVolumeSourceV1Converter()
+            : base("datasetUUID", "datasetName")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="FlockerVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(FlockerVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "datasetUUID":
+                {
+                    model.DatasetUUID = reader.ReadAsString() ?? model.DatasetUUID;
+
+                    return true;
+                }
+                case "datasetName":
+                {
+                    model.DatasetName = reader.ReadAsString() ?? model.DatasetName;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ForZoneV1"/>.
+    /// </summary>
+    public sealed class ForZoneV1Converter
+        : KubeModelConverter<ForZoneV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ForZoneV1Converter"/>.
+        /// </summary>
+        public static ForZoneV1Converter Instance { get; } = new ForZoneV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ForZoneV1Converter"/>.
+        /// </summary>
+        public ForZoneV1Converter()
+            : base("name")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ForZoneV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ForZoneV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="GCEPersistentDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class GCEPersistentDiskVolumeSourceV1Converter
+        : KubeModelConverter<GCEPersistentDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GCEPersistentDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static GCEPersistentDiskVolumeSourceV1Converter Instance { get; } = new GCEPersistentDiskVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="GCEPersistentDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public GCEPersistentDiskVolumeSourceV1Converter()
+            : base("fsType", "pdName", "partition", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="GCEPersistentDiskVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(GCEPersistentDiskVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "pdName":
+                {
+                    model.PdName = reader.ReadAsString();
+
+                    return true;
+                }
+                case "partition":
+                {
+                    model.Partition = reader.ReadAsInt32() ?? model.Partition;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="GRPCActionV1"/>.
+    /// </summary>
+    public sealed class GRPCActionV1Converter
+        : KubeModelConverter<GRPCActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GRPCActionV1Converter"/>.
+        /// </summary>
+        public static GRPCActionV1Converter Instance { get; } = new GRPCActionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="GRPCActionV1Converter"/>.
+        /// </summary>
+        public GRPCActionV1Converter()
+            : base("service", "port")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="GRPCActionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(GRPCActionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "service":
+                {
+                    model.Service = reader.ReadAsString() ?? model.Service;
+
+                    return true;
+                }
+                case "port":
+                {
+                    model.Port = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="GitRepoVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class GitRepoVolumeSourceV1Converter
+        : KubeModelConverter<GitRepoVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GitRepoVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static GitRepoVolumeSourceV1Converter Instance { get; } = new GitRepoVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="GitRepoVolumeSourceV1Converter"/>.
+        /// </summary>
+        public GitRepoVolumeSourceV1Converter()
+            : base("revision", "directory", "repository")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="GitRepoVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(GitRepoVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "revision":
+                {
+                    model.Revision = reader.ReadAsString() ?? model.Revision;
+
+                    return true;
+                }
+                case "directory":
+                {
+                    model.Directory = reader.ReadAsString() ?? model.Directory;
+
+                    return true;
+                }
+                case "repository":
+                {
+                    model.Repository = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="GlusterfsVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class GlusterfsVolumeSourceV1Converter
+        : KubeModelConverter<GlusterfsVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="GlusterfsVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static GlusterfsVolumeSourceV1Converter Instance { get; } = new GlusterfsVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="GlusterfsVolumeSourceV1Converter"/>.
+        /// </summary>
+        public GlusterfsVolumeSourceV1Converter()
+            : base("path", "endpoints", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="GlusterfsVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(GlusterfsVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "path":
+                {
+                    model.Path = reader.ReadAsString();
+
+                    return true;
+                }
+                case "endpoints":
+                {
+                    model.Endpoints = reader.ReadAsString();
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="HTTPGetActionV1"/>.
+    /// </summary>
+    public sealed class HTTPGetActionV1Converter
+        : KubeModelConverter<HTTPGetActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HTTPGetActionV1Converter"/>.
+        /// </summary>
+        public static HTTPGetActionV1Converter Instance { get; } = new HTTPGetActionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="HTTPGetActionV1Converter"/>.
+        /// </summary>
+        public HTTPGetActionV1Converter()
+            : base("scheme", "path", "httpHeaders", "host", "port")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="HTTPGetActionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(HTTPGetActionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "scheme":
+                {
+                    model.Scheme = ReadAsInternedString(reader) ?? model.Scheme;
+
+                    return true;
+                }
+                case "path":
+                {
+                    model.Path = reader.ReadAsString() ?? model.Path;
+
+                    return true;
+                }
+                case "httpHeaders":
+                {
+                    ReadModelList(reader, HTTPHeaderV1Converter.Instance, model.HttpHeaders, serializer);
+
+                    return true;
+                }
+                case "host":
+                {
+                    model.Host = reader.ReadAsString() ?? model.Host;
+
+                    return true;
+                }
+                case "port":
+                {
+                    model.Port = ReadInt32OrString(reader, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="HTTPHeaderV1"/>.
+    /// </summary>
+    public sealed class HTTPHeaderV1Converter
+        : KubeModelConverter<HTTPHeaderV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HTTPHeaderV1Converter"/>.
+        /// </summary>
+        public static HTTPHeaderV1Converter Instance { get; } = new HTTPHeaderV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="HTTPHeaderV1Converter"/>.
+        /// </summary>
+        public HTTPHeaderV1Converter()
+            : base("name", "value")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="HTTPHeaderV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(HTTPHeaderV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "value":
+                {
+                    model.Value = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="HostAliasV1"/>.
+    /// </summary>
+    public sealed class HostAliasV1Converter
+        : KubeModelConverter<HostAliasV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HostAliasV1Converter"/>.
+        /// </summary>
+        public static HostAliasV1Converter Instance { get; } = new HostAliasV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="HostAliasV1Converter"/>.
+        /// </summary>
+        public HostAliasV1Converter()
+            : base("ip", "hostnames")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="HostAliasV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(HostAliasV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "ip":
+                {
+                    model.Ip = reader.ReadAsString();
+
+                    return true;
+                }
+                case "hostnames":
+                {
+                    ReadStringList(reader, model.Hostnames);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="HostIPV1"/>.
+    /// </summary>
+    public sealed class HostIPV1Converter
+        : KubeModelConverter<HostIPV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HostIPV1Converter"/>.
+        /// </summary>
+        public static HostIPV1Converter Instance { get; } = new HostIPV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="HostIPV1Converter"/>.
+        /// </summary>
+        public HostIPV1Converter()
+            : base("ip")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="HostIPV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(HostIPV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "ip":
+                {
+                    model.Ip = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="HostPathVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class HostPathVolumeSourceV1Converter
+        : KubeModelConverter<HostPathVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="HostPathVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static HostPathVolumeSourceV1Converter Instance { get; } = new HostPathVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="HostPathVolumeSourceV1Converter"/>.
+        /// </summary>
+        public HostPathVolumeSourceV1Converter()
+            : base("type", "path")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="HostPathVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(HostPathVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "type":
+                {
+                    model.Type = ReadAsInternedString(reader) ?? model.Type;
+
+                    return true;
+                }
+                case "path":
+                {
+                    model.Path = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ISCSIVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ISCSIVolumeSourceV1Converter
+        : KubeModelConverter<ISCSIVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ISCSIVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static ISCSIVolumeSourceV1Converter Instance { get; } = new ISCSIVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ISCSIVolumeSourceV1Converter"/>.
+        /// </summary>
+        public ISCSIVolumeSourceV1Converter()
+            : base("fsType", "initiatorName", "iscsiInterface", "secretRef", "targetPortal", "chapAuthSession", "iqn", "lun", "portals", "chapAuthDiscovery", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ISCSIVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ISCSIVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "initiatorName":
+                {
+                    model.InitiatorName = reader.ReadAsString() ?? model.InitiatorName;
+
+                    return true;
+                }
+                case "iscsiInterface":
+                {
+                    model.IscsiInterface = reader.ReadAsString() ?? model.IscsiInterface;
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.SecretRef, serializer) ?? model.SecretRef;
+
+                    return true;
+                }
+                case "targetPortal":
+                {
+                    model.TargetPortal = reader.ReadAsString();
+
+                    return true;
+                }
+                case "chapAuthSession":
+                {
+                    model.ChapAuthSession = reader.ReadAsBoolean() ?? model.ChapAuthSession;
+
+                    return true;
+                }
+                case "iqn":
+                {
+                    model.Iqn = reader.ReadAsString();
+
+                    return true;
+                }
+                case "lun":
+                {
+                    model.Lun = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                case "portals":
+                {
+                    ReadStringList(reader, model.Portals);
+
+                    return true;
+                }
+                case "chapAuthDiscovery":
+                {
+                    model.ChapAuthDiscovery = reader.ReadAsBoolean() ?? model.ChapAuthDiscovery;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ImageVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ImageVolumeSourceV1Converter
+        : KubeModelConverter<ImageVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ImageVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static ImageVolumeSourceV1Converter Instance { get; } = new ImageVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ImageVolumeSourceV1Converter"/>.
+        /// </summary>
+        public ImageVolumeSourceV1Converter()
+            : base("reference", "pullPolicy")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ImageVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ImageVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "reference":
+                {
+                    model.Reference = reader.ReadAsString() ?? model.Reference;
+
+                    return true;
+                }
+                case "pullPolicy":
+                {
+                    model.PullPolicy = ReadAsInternedString(reader) ?? model.PullPolicy;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="KeyToPathV1"/>.
+    /// </summary>
+    public sealed class KeyToPathV1Converter
+        : KubeModelConverter<KeyToPathV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="KeyToPathV1Converter"/>.
+        /// </summary>
+        public static KeyToPathV1Converter Instance { get; } = new KeyToPathV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="KeyToPathV1Converter"/>.
+        /// </summary>
+        public KeyToPathV1Converter()
+            : base("mode", "path", "key")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="KeyToPathV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(KeyToPathV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "mode":
+                {
+                    model.Mode = reader.ReadAsInt32() ?? model.Mode;
+
+                    return true;
+                }
+                case "path":
+                {
+                    model.Path = reader.ReadAsString();
+
+                    return true;
+                }
+                case "key":
+                {
+                    model.Key = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="LabelSelectorRequirementV1"/>.
+    /// </summary>
+    public sealed class LabelSelectorRequirementV1Converter
+        : KubeModelConverter<LabelSelectorRequirementV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LabelSelectorRequirementV1Converter"/>.
+        /// </summary>
+        public static LabelSelectorRequirementV1Converter Instance { get; } = new LabelSelectorRequirementV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="LabelSelectorRequirementV1Converter"/>.
+        /// </summary>
+        public LabelSelectorRequirementV1Converter()
+            : base("operator", "values", "key")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="LabelSelectorRequirementV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(LabelSelectorRequirementV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "operator":
+                {
+                    model.Operator = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "values":
+                {
+                    ReadStringList(reader, model.Values);
+
+                    return true;
+                }
+                case "key":
+                {
+                    model.Key = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="LabelSelectorV1"/>.
+    /// </summary>
+    public sealed class LabelSelectorV1Converter
+        : KubeModelConverter<LabelSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LabelSelectorV1Converter"/>.
+        /// </summary>
+        public static LabelSelectorV1Converter Instance { get; } = new LabelSelectorV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="LabelSelectorV1Converter"/>.
+        /// </summary>
+        public LabelSelectorV1Converter()
+            : base("matchExpressions", "matchLabels")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="LabelSelectorV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(LabelSelectorV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "matchExpressions":
+                {
+                    ReadModelList(reader, LabelSelectorRequirementV1Converter.Instance, model.MatchExpressions, serializer);
+
+                    return true;
+                }
+                case "matchLabels":
+                {
+                    ReadStringDictionary(reader, model.MatchLabels, InternedStrings.DictionaryKeys | InternedStrings.Values);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="LifecycleHandlerV1"/>.
+    /// </summary>
+    public sealed class LifecycleHandlerV1Converter
+        : KubeModelConverter<LifecycleHandlerV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LifecycleHandlerV1Converter"/>.
+        /// </summary>
+        public static LifecycleHandlerV1Converter Instance { get; } = new LifecycleHandlerV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="LifecycleHandlerV1Converter"/>.
+        /// </summary>
+        public LifecycleHandlerV1Converter()
+            : base("exec", "sleep", "httpGet", "tcpSocket")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="LifecycleHandlerV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(LifecycleHandlerV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "exec":
+                {
+                    model.Exec = ReadModel(reader, ExecActionV1Converter.Instance, model.Exec, serializer) ?? model.Exec;
+
+                    return true;
+                }
+                case "sleep":
+                {
+                    model.Sleep = ReadModel(reader, SleepActionV1Converter.Instance, model.Sleep, serializer) ?? model.Sleep;
+
+                    return true;
+                }
+                case "httpGet":
+                {
+                    model.HttpGet = ReadModel(reader, HTTPGetActionV1Converter.Instance, model.HttpGet, serializer) ?? model.HttpGet;
+
+                    return true;
+                }
+                case "tcpSocket":
+                {
+                    model.TcpSocket = ReadModel(reader, TCPSocketActionV1Converter.Instance, model.TcpSocket, serializer) ?? model.TcpSocket;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="LifecycleV1"/>.
+    /// </summary>
+    public sealed class LifecycleV1Converter
+        : KubeModelConverter<LifecycleV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LifecycleV1Converter"/>.
+        /// </summary>
+        public static LifecycleV1Converter Instance { get; } = new LifecycleV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="LifecycleV1Converter"/>.
+        /// </summary>
+        public LifecycleV1Converter()
+            : base("preStop", "postStart")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="LifecycleV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(LifecycleV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "preStop":
+                {
+                    model.PreStop = ReadModel(reader, LifecycleHandlerV1Converter.Instance, model.PreStop, serializer) ?? model.PreStop;
+
+                    return true;
+                }
+                case "postStart":
+                {
+                    model.PostStart = ReadModel(reader, LifecycleHandlerV1Converter.Instance, model.PostStart, serializer) ?? model.PostStart;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="LinuxContainerUserV1"/>.
+    /// </summary>
+    public sealed class LinuxContainerUserV1Converter
+        : KubeModelConverter<LinuxContainerUserV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LinuxContainerUserV1Converter"/>.
+        /// </summary>
+        public static LinuxContainerUserV1Converter Instance { get; } = new LinuxContainerUserV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="LinuxContainerUserV1Converter"/>.
+        /// </summary>
+        public LinuxContainerUserV1Converter()
+            : base("gid", "uid", "supplementalGroups")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="LinuxContainerUserV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(LinuxContainerUserV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "gid":
+                {
+                    model.Gid = RequiredValue(ReadAsInt64(reader, serializer), reader);
+
+                    return true;
+                }
+                case "uid":
+                {
+                    model.Uid = RequiredValue(ReadAsInt64(reader, serializer), reader);
+
+                    return true;
+                }
+                case "supplementalGroups":
+                {
+                    ReadList(reader, model.SupplementalGroups, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ListMetaV1"/>.
+    /// </summary>
+    public sealed class ListMetaV1Converter
+        : KubeModelConverter<ListMetaV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ListMetaV1Converter"/>.
+        /// </summary>
+        public static ListMetaV1Converter Instance { get; } = new ListMetaV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ListMetaV1Converter"/>.
+        /// </summary>
+        public ListMetaV1Converter()
+            : base("continue", "selfLink", "resourceVersion", "remainingItemCount")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ListMetaV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ListMetaV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "continue":
+                {
+                    model.Continue = reader.ReadAsString() ?? model.Continue;
+
+                    return true;
+                }
+                case "selfLink":
+                {
+                    model.SelfLink = reader.ReadAsString() ?? model.SelfLink;
+
+                    return true;
+                }
+                case "resourceVersion":
+                {
+                    model.ResourceVersion = reader.ReadAsString() ?? model.ResourceVersion;
+
+                    return true;
+                }
+                case "remainingItemCount":
+                {
+                    model.RemainingItemCount = ReadAsInt64(reader, serializer) ?? model.RemainingItemCount;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="LocalObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class LocalObjectReferenceV1Converter
+        : KubeModelConverter<LocalObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="LocalObjectReferenceV1Converter"/>.
+        /// </summary>
+        public static LocalObjectReferenceV1Converter Instance { get; } = new LocalObjectReferenceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="LocalObjectReferenceV1Converter"/>.
+        /// </summary>
+        public LocalObjectReferenceV1Converter()
+            : base("name")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="LocalObjectReferenceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(LocalObjectReferenceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ManagedFieldsEntryV1"/>.
+    /// </summary>
+    public sealed class ManagedFieldsEntryV1Converter
+        : KubeModelConverter<ManagedFieldsEntryV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ManagedFieldsEntryV1Converter"/>.
+        /// </summary>
+        public static ManagedFieldsEntryV1Converter Instance { get; } = new ManagedFieldsEntryV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ManagedFieldsEntryV1Converter"/>.
+        /// </summary>
+        public ManagedFieldsEntryV1Converter()
+            : base("fieldsV1", "fieldsType", "subresource", "time", "apiVersion", "operation", "manager")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ManagedFieldsEntryV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ManagedFieldsEntryV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fieldsV1":
+                {
+                    model.FieldsV1 = ReadModel(reader, FieldsV1Converter.Instance, model.FieldsV1, serializer) ?? model.FieldsV1;
+
+                    return true;
+                }
+                case "fieldsType":
+                {
+                    model.FieldsType = ReadAsInternedString(reader) ?? model.FieldsType;
+
+                    return true;
+                }
+                case "subresource":
+                {
+                    model.Subresource = reader.ReadAsString() ?? model.Subresource;
+
+                    return true;
+                }
+                case "time":
+                {
+                    model.Time = reader.ReadAsDateTime() ?? model.Time;
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = ReadAsInternedString(reader) ?? model.ApiVersion;
+
+                    return true;
+                }
+                case "operation":
+                {
+                    model.Operation = ReadAsInternedString(reader) ?? model.Operation;
+
+                    return true;
+                }
+                case "manager":
+                {
+                    model.Manager = ReadAsInternedString(reader) ?? model.Manager;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="NFSVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class NFSVolumeSourceV1Converter
+        : KubeModelConverter<NFSVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NFSVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static NFSVolumeSourceV1Converter Instance { get; } = new NFSVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="NFSVolumeSourceV1Converter"/>.
+        /// </summary>
+        public NFSVolumeSourceV1Converter()
+            : base("path", "server", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="NFSVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(NFSVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "path":
+                {
+                    model.Path = reader.ReadAsString();
+
+                    return true;
+                }
+                case "server":
+                {
+                    model.Server = reader.ReadAsString();
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="NodeAffinityV1"/>.
+    /// </summary>
+    public sealed class NodeAffinityV1Converter
+        : KubeModelConverter<NodeAffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeAffinityV1Converter"/>.
+        /// </summary>
+        public static NodeAffinityV1Converter Instance { get; } = new NodeAffinityV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeAffinityV1Converter"/>.
+        /// </summary>
+        public NodeAffinityV1Converter()
+            : base("preferredDuringSchedulingIgnoredDuringExecution", "requiredDuringSchedulingIgnoredDuringExecution")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="NodeAffinityV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(NodeAffinityV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "preferredDuringSchedulingIgnoredDuringExecution":
+                {
+                    ReadModelList(reader, PreferredSchedulingTermV1Converter.Instance, model.PreferredDuringSchedulingIgnoredDuringExecution, serializer);
+
+                    return true;
+                }
+                case "requiredDuringSchedulingIgnoredDuringExecution":
+                {
+                    model.RequiredDuringSchedulingIgnoredDuringExecution = ReadModel(reader, NodeSelectorV1Converter.Instance, model.RequiredDuringSchedulingIgnoredDuringExecution, serializer) ?? model.RequiredDuringSchedulingIgnoredDuringExecution;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="NodeSelectorRequirementV1"/>.
+    /// </summary>
+    public sealed class NodeSelectorRequirementV1Converter
+        : KubeModelConverter<NodeSelectorRequirementV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSelectorRequirementV1Converter"/>.
+        /// </summary>
+        public static NodeSelectorRequirementV1Converter Instance { get; } = new NodeSelectorRequirementV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSelectorRequirementV1Converter"/>.
+        /// </summary>
+        public NodeSelectorRequirementV1Converter()
+            : base("operator", "values", "key")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="NodeSelectorRequirementV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(NodeSelectorRequirementV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "operator":
+                {
+                    model.Operator = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "values":
+                {
+                    ReadStringList(reader, model.Values);
+
+                    return true;
+                }
+                case "key":
+                {
+                    model.Key = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="NodeSelectorTermV1"/>.
+    /// </summary>
+    public sealed class NodeSelectorTermV1Converter
+        : KubeModelConverter<NodeSelectorTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSelectorTermV1Converter"/>.
+        /// </summary>
+        public static NodeSelectorTermV1Converter Instance { get; } = new NodeSelectorTermV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSelectorTermV1Converter"/>.
+        /// </summary>
+        public NodeSelectorTermV1Converter()
+            : base("matchExpressions", "matchFields")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="NodeSelectorTermV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(NodeSelectorTermV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "matchExpressions":
+                {
+                    ReadModelList(reader, NodeSelectorRequirementV1Converter.Instance, model.MatchExpressions, serializer);
+
+                    return true;
+                }
+                case "matchFields":
+                {
+                    ReadModelList(reader, NodeSelectorRequirementV1Converter.Instance, model.MatchFields, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="NodeSelectorV1"/>.
+    /// </summary>
+    public sealed class NodeSelectorV1Converter
+        : KubeModelConverter<NodeSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="NodeSelectorV1Converter"/>.
+        /// </summary>
+        public static NodeSelectorV1Converter Instance { get; } = new NodeSelectorV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="NodeSelectorV1Converter"/>.
+        /// </summary>
+        public NodeSelectorV1Converter()
+            : base("nodeSelectorTerms")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="NodeSelectorV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(NodeSelectorV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "nodeSelectorTerms":
+                {
+                    ReadModelList(reader, NodeSelectorTermV1Converter.Instance, model.NodeSelectorTerms, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ObjectFieldSelectorV1"/>.
+    /// </summary>
+    public sealed class ObjectFieldSelectorV1Converter
+        : KubeModelConverter<ObjectFieldSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ObjectFieldSelectorV1Converter"/>.
+        /// </summary>
+        public static ObjectFieldSelectorV1Converter Instance { get; } = new ObjectFieldSelectorV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ObjectFieldSelectorV1Converter"/>.
+        /// </summary>
+        public ObjectFieldSelectorV1Converter()
+            : base("fieldPath", "apiVersion")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ObjectFieldSelectorV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ObjectFieldSelectorV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fieldPath":
+                {
+                    model.FieldPath = reader.ReadAsString();
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = ReadAsInternedString(reader) ?? model.ApiVersion;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ObjectMetaV1"/>.
+    /// </summary>
+    public sealed class ObjectMetaV1Converter
+        : KubeModelConverter<ObjectMetaV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ObjectMetaV1Converter"/>.
+        /// </summary>
+        public static ObjectMetaV1Converter Instance { get; } = new ObjectMetaV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ObjectMetaV1Converter"/>.
+        /// </summary>
+        public ObjectMetaV1Converter()
+            : base("uid", "generateName", "name", "namespace", "selfLink", "generation", "resourceVersion", "creationTimestamp", "deletionTimestamp", "annotations", "deletionGracePeriodSeconds", "finalizers", "labels", "managedFields", "ownerReferences")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ObjectMetaV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ObjectMetaV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "uid":
+                {
+                    model.Uid = reader.ReadAsString() ?? model.Uid;
+
+                    return true;
+                }
+                case "generateName":
+                {
+                    model.GenerateName = ReadAsInternedString(reader) ?? model.GenerateName;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "namespace":
+                {
+                    model.Namespace = ReadAsInternedString(reader) ?? model.Namespace;
+
+                    return true;
+                }
+                case "selfLink":
+                {
+                    model.SelfLink = reader.ReadAsString() ?? model.SelfLink;
+
+                    return true;
+                }
+                case "generation":
+                {
+                    model.Generation = ReadAsInt64(reader, serializer) ?? model.Generation;
+
+                    return true;
+                }
+                case "resourceVersion":
+                {
+                    model.ResourceVersion = reader.ReadAsString() ?? model.ResourceVersion;
+
+                    return true;
+                }
+                case "creationTimestamp":
+                {
+                    model.CreationTimestamp = reader.ReadAsDateTime() ?? model.CreationTimestamp;
+
+                    return true;
+                }
+                case "deletionTimestamp":
+                {
+                    model.DeletionTimestamp = reader.ReadAsDateTime() ?? model.DeletionTimestamp;
+
+                    return true;
+                }
+                case "annotations":
+                {
+                    ReadStringDictionary(reader, model.Annotations, InternedStrings.DictionaryKeys);
+
+                    return true;
+                }
+                case "deletionGracePeriodSeconds":
+                {
+                    model.DeletionGracePeriodSeconds = ReadAsInt64(reader, serializer) ?? model.DeletionGracePeriodSeconds;
+
+                    return true;
+                }
+                case "finalizers":
+                {
+                    ReadStringList(reader, model.Finalizers, InternedStrings.Values);
+
+                    return true;
+                }
+                case "labels":
+                {
+                    ReadStringDictionary(reader, model.Labels, InternedStrings.DictionaryKeys | InternedStrings.Values);
+
+                    return true;
+                }
+                case "managedFields":
+                {
+                    ReadModelList(reader, ManagedFieldsEntryV1Converter.Instance, model.ManagedFields, serializer);
+
+                    return true;
+                }
+                case "ownerReferences":
+                {
+                    ReadModelList(reader, OwnerReferenceV1Converter.Instance, model.OwnerReferences, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Read the value of a property that does not correspond to any property defined on <see cref="ObjectMetaV1"/> (into <see cref="ObjectMetaV1.ExtensionData"/>).
+        /// </summary>
+        protected override void ReadUnknownProperty(ObjectMetaV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            model.ExtensionData[propertyName] = ReadValue<JToken>(reader, serializer);
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class ObjectReferenceV1Converter
+        : KubeModelConverter<ObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ObjectReferenceV1Converter"/>.
+        /// </summary>
+        public static ObjectReferenceV1Converter Instance { get; } = new ObjectReferenceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ObjectReferenceV1Converter"/>.
+        /// </summary>
+        public ObjectReferenceV1Converter()
+            : base("kind", "uid", "name", "namespace", "fieldPath", "apiVersion", "resourceVersion")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ObjectReferenceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ObjectReferenceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "uid":
+                {
+                    model.Uid = reader.ReadAsString() ?? model.Uid;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "namespace":
+                {
+                    model.Namespace = ReadAsInternedString(reader) ?? model.Namespace;
+
+                    return true;
+                }
+                case "fieldPath":
+                {
+                    model.FieldPath = reader.ReadAsString() ?? model.FieldPath;
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "resourceVersion":
+                {
+                    model.ResourceVersion = reader.ReadAsString() ?? model.ResourceVersion;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="OwnerReferenceV1"/>.
+    /// </summary>
+    public sealed class OwnerReferenceV1Converter
+        : KubeModelConverter<OwnerReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="OwnerReferenceV1Converter"/>.
+        /// </summary>
+        public static OwnerReferenceV1Converter Instance { get; } = new OwnerReferenceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="OwnerReferenceV1Converter"/>.
+        /// </summary>
+        public OwnerReferenceV1Converter()
+            : base("kind", "uid", "name", "apiVersion", "blockOwnerDeletion", "controller")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="OwnerReferenceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(OwnerReferenceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "uid":
+                {
+                    model.Uid = reader.ReadAsString();
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "blockOwnerDeletion":
+                {
+                    model.BlockOwnerDeletion = reader.ReadAsBoolean() ?? model.BlockOwnerDeletion;
+
+                    return true;
+                }
+                case "controller":
+                {
+                    model.Controller = reader.ReadAsBoolean() ?? model.Controller;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PersistentVolumeClaimSpecV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimSpecV1Converter
+        : KubeModelConverter<PersistentVolumeClaimSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimSpecV1Converter"/>.
+        /// </summary>
+        public static PersistentVolumeClaimSpecV1Converter Instance { get; } = new PersistentVolumeClaimSpecV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimSpecV1Converter"/>.
+        /// </summary>
+        public PersistentVolumeClaimSpecV1Converter()
+            : base("dataSource", "storageClassName", "volumeAttributesClassName", "volumeMode", "volumeName", "dataSourceRef", "selector", "accessModes", "resources")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PersistentVolumeClaimSpecV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PersistentVolumeClaimSpecV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "dataSource":
+                {
+                    model.DataSource = ReadModel(reader, TypedLocalObjectReferenceV1Converter.Instance, model.DataSource, serializer) ?? model.DataSource;
+
+                    return true;
+                }
+                case "storageClassName":
+                {
+                    model.StorageClassName = ReadAsInternedString(reader) ?? model.StorageClassName;
+
+                    return true;
+                }
+                case "volumeAttributesClassName":
+                {
+                    model.VolumeAttributesClassName = ReadAsInternedString(reader) ?? model.VolumeAttributesClassName;
+
+                    return true;
+                }
+                case "volumeMode":
+                {
+                    model.VolumeMode = reader.ReadAsString() ?? model.VolumeMode;
+
+                    return true;
+                }
+                case "volumeName":
+                {
+                    model.VolumeName = reader.ReadAsString() ?? model.VolumeName;
+
+                    return true;
+                }
+                case "dataSourceRef":
+                {
+                    model.DataSourceRef = ReadModel(reader, TypedObjectReferenceV1Converter.Instance, model.DataSourceRef, serializer) ?? model.DataSourceRef;
+
+                    return true;
+                }
+                case "selector":
+                {
+                    model.Selector = ReadModel(reader, LabelSelectorV1Converter.Instance, model.Selector, serializer) ?? model.Selector;
+
+                    return true;
+                }
+                case "accessModes":
+                {
+                    ReadStringList(reader, model.AccessModes);
+
+                    return true;
+                }
+                case "resources":
+                {
+                    model.Resources = ReadModel(reader, VolumeResourceRequirementsV1Converter.Instance, model.Resources, serializer) ?? model.Resources;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PersistentVolumeClaimTemplateV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimTemplateV1Converter
+        : KubeModelConverter<PersistentVolumeClaimTemplateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimTemplateV1Converter"/>.
+        /// </summary>
+        public static PersistentVolumeClaimTemplateV1Converter Instance { get; } = new PersistentVolumeClaimTemplateV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimTemplateV1Converter"/>.
+        /// </summary>
+        public PersistentVolumeClaimTemplateV1Converter()
+            : base("metadata", "spec")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PersistentVolumeClaimTemplateV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PersistentVolumeClaimTemplateV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = ReadModel(reader, ObjectMetaV1Converter.Instance, model.Metadata, serializer) ?? model.Metadata;
+
+                    return true;
+                }
+                case "spec":
+                {
+                    model.Spec = ReadModel(reader, PersistentVolumeClaimSpecV1Converter.Instance, model.Spec, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PersistentVolumeClaimVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class PersistentVolumeClaimVolumeSourceV1Converter
+        : KubeModelConverter<PersistentVolumeClaimVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PersistentVolumeClaimVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static PersistentVolumeClaimVolumeSourceV1Converter Instance { get; } = new PersistentVolumeClaimVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PersistentVolumeClaimVolumeSourceV1Converter"/>.
+        /// </summary>
+        public PersistentVolumeClaimVolumeSourceV1Converter()
+            : base("claimName", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PersistentVolumeClaimVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PersistentVolumeClaimVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "claimName":
+                {
+                    model.ClaimName = reader.ReadAsString();
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PhotonPersistentDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class PhotonPersistentDiskVolumeSourceV1Converter
+        : KubeModelConverter<PhotonPersistentDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PhotonPersistentDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static PhotonPersistentDiskVolumeSourceV1Converter Instance { get; } = new PhotonPersistentDiskVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PhotonPersistentDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public PhotonPersistentDiskVolumeSourceV1Converter()
+            : base("pdID", "fsType")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PhotonPersistentDiskVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PhotonPersistentDiskVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "pdID":
+                {
+                    model.PdID = reader.ReadAsString();
+
+                    return true;
+                }
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodAffinityTermV1"/>.
+    /// </summary>
+    public sealed class PodAffinityTermV1Converter
+        : KubeModelConverter<PodAffinityTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodAffinityTermV1Converter"/>.
+        /// </summary>
+        public static PodAffinityTermV1Converter Instance { get; } = new PodAffinityTermV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodAffinityTermV1Converter"/>.
+        /// </summary>
+        public PodAffinityTermV1Converter()
+            : base("labelSelector", "namespaceSelector", "matchLabelKeys", "mismatchLabelKeys", "namespaces", "topologyKey")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodAffinityTermV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodAffinityTermV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "labelSelector":
+                {
+                    model.LabelSelector = ReadModel(reader, LabelSelectorV1Converter.Instance, model.LabelSelector, serializer) ?? model.LabelSelector;
+
+                    return true;
+                }
+                case "namespaceSelector":
+                {
+                    model.NamespaceSelector = ReadModel(reader, LabelSelectorV1Converter.Instance, model.NamespaceSelector, serializer) ?? model.NamespaceSelector;
+
+                    return true;
+                }
+                case "matchLabelKeys":
+                {
+                    ReadStringList(reader, model.MatchLabelKeys);
+
+                    return true;
+                }
+                case "mismatchLabelKeys":
+                {
+                    ReadStringList(reader, model.MismatchLabelKeys);
+
+                    return true;
+                }
+                case "namespaces":
+                {
+                    ReadStringList(reader, model.Namespaces);
+
+                    return true;
+                }
+                case "topologyKey":
+                {
+                    model.TopologyKey = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodAffinityV1"/>.
+    /// </summary>
+    public sealed class PodAffinityV1Converter
+        : KubeModelConverter<PodAffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodAffinityV1Converter"/>.
+        /// </summary>
+        public static PodAffinityV1Converter Instance { get; } = new PodAffinityV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodAffinityV1Converter"/>.
+        /// </summary>
+        public PodAffinityV1Converter()
+            : base("preferredDuringSchedulingIgnoredDuringExecution", "requiredDuringSchedulingIgnoredDuringExecution")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodAffinityV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodAffinityV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "preferredDuringSchedulingIgnoredDuringExecution":
+                {
+                    ReadModelList(reader, WeightedPodAffinityTermV1Converter.Instance, model.PreferredDuringSchedulingIgnoredDuringExecution, serializer);
+
+                    return true;
+                }
+                case "requiredDuringSchedulingIgnoredDuringExecution":
+                {
+                    ReadModelList(reader, PodAffinityTermV1Converter.Instance, model.RequiredDuringSchedulingIgnoredDuringExecution, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodAntiAffinityV1"/>.
+    /// </summary>
+    public sealed class PodAntiAffinityV1Converter
+        : KubeModelConverter<PodAntiAffinityV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodAntiAffinityV1Converter"/>.
+        /// </summary>
+        public static PodAntiAffinityV1Converter Instance { get; } = new PodAntiAffinityV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodAntiAffinityV1Converter"/>.
+        /// </summary>
+        public PodAntiAffinityV1Converter()
+            : base("preferredDuringSchedulingIgnoredDuringExecution", "requiredDuringSchedulingIgnoredDuringExecution")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodAntiAffinityV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodAntiAffinityV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "preferredDuringSchedulingIgnoredDuringExecution":
+                {
+                    ReadModelList(reader, WeightedPodAffinityTermV1Converter.Instance, model.PreferredDuringSchedulingIgnoredDuringExecution, serializer);
+
+                    return true;
+                }
+                case "requiredDuringSchedulingIgnoredDuringExecution":
+                {
+                    ReadModelList(reader, PodAffinityTermV1Converter.Instance, model.RequiredDuringSchedulingIgnoredDuringExecution, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodConditionV1"/>.
+    /// </summary>
+    public sealed class PodConditionV1Converter
+        : KubeModelConverter<PodConditionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodConditionV1Converter"/>.
+        /// </summary>
+        public static PodConditionV1Converter Instance { get; } = new PodConditionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodConditionV1Converter"/>.
+        /// </summary>
+        public PodConditionV1Converter()
+            : base("lastProbeTime", "lastTransitionTime", "message", "type", "reason", "status")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodConditionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodConditionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "lastProbeTime":
+                {
+                    model.LastProbeTime = reader.ReadAsDateTime() ?? model.LastProbeTime;
+
+                    return true;
+                }
+                case "lastTransitionTime":
+                {
+                    model.LastTransitionTime = reader.ReadAsDateTime() ?? model.LastTransitionTime;
+
+                    return true;
+                }
+                case "message":
+                {
+                    model.Message = reader.ReadAsString() ?? model.Message;
+
+                    return true;
+                }
+                case "type":
+                {
+                    model.Type = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "reason":
+                {
+                    model.Reason = ReadAsInternedString(reader) ?? model.Reason;
+
+                    return true;
+                }
+                case "status":
+                {
+                    model.Status = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodDNSConfigOptionV1"/>.
+    /// </summary>
+    public sealed class PodDNSConfigOptionV1Converter
+        : KubeModelConverter<PodDNSConfigOptionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodDNSConfigOptionV1Converter"/>.
+        /// </summary>
+        public static PodDNSConfigOptionV1Converter Instance { get; } = new PodDNSConfigOptionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodDNSConfigOptionV1Converter"/>.
+        /// </summary>
+        public PodDNSConfigOptionV1Converter()
+            : base("name", "value")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodDNSConfigOptionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodDNSConfigOptionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "value":
+                {
+                    model.Value = reader.ReadAsString() ?? model.Value;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodDNSConfigV1"/>.
+    /// </summary>
+    public sealed class PodDNSConfigV1Converter
+        : KubeModelConverter<PodDNSConfigV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodDNSConfigV1Converter"/>.
+        /// </summary>
+        public static PodDNSConfigV1Converter Instance { get; } = new PodDNSConfigV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodDNSConfigV1Converter"/>.
+        /// </summary>
+        public PodDNSConfigV1Converter()
+            : base("nameservers", "options", "searches")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodDNSConfigV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodDNSConfigV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "nameservers":
+                {
+                    ReadStringList(reader, model.Nameservers);
+
+                    return true;
+                }
+                case "options":
+                {
+                    ReadModelList(reader, PodDNSConfigOptionV1Converter.Instance, model.Options, serializer);
+
+                    return true;
+                }
+                case "searches":
+                {
+                    ReadStringList(reader, model.Searches);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodIPV1"/>.
+    /// </summary>
+    public sealed class PodIPV1Converter
+        : KubeModelConverter<PodIPV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodIPV1Converter"/>.
+        /// </summary>
+        public static PodIPV1Converter Instance { get; } = new PodIPV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodIPV1Converter"/>.
+        /// </summary>
+        public PodIPV1Converter()
+            : base("ip")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodIPV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodIPV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "ip":
+                {
+                    model.Ip = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodListV1"/>.
+    /// </summary>
+    public sealed class PodListV1Converter
+        : KubeModelConverter<PodListV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodListV1Converter"/>.
+        /// </summary>
+        public static PodListV1Converter Instance { get; } = new PodListV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodListV1Converter"/>.
+        /// </summary>
+        public PodListV1Converter()
+            : base("metadata", "kind", "apiVersion", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodListV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodListV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ListMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, PodV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodOSV1"/>.
+    /// </summary>
+    public sealed class PodOSV1Converter
+        : KubeModelConverter<PodOSV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodOSV1Converter"/>.
+        /// </summary>
+        public static PodOSV1Converter Instance { get; } = new PodOSV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodOSV1Converter"/>.
+        /// </summary>
+        public PodOSV1Converter()
+            : base("name")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodOSV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodOSV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodReadinessGateV1"/>.
+    /// </summary>
+    public sealed class PodReadinessGateV1Converter
+        : KubeModelConverter<PodReadinessGateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodReadinessGateV1Converter"/>.
+        /// </summary>
+        public static PodReadinessGateV1Converter Instance { get; } = new PodReadinessGateV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodReadinessGateV1Converter"/>.
+        /// </summary>
+        public PodReadinessGateV1Converter()
+            : base("conditionType")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodReadinessGateV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodReadinessGateV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "conditionType":
+                {
+                    model.ConditionType = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodResourceClaimStatusV1"/>.
+    /// </summary>
+    public sealed class PodResourceClaimStatusV1Converter
+        : KubeModelConverter<PodResourceClaimStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodResourceClaimStatusV1Converter"/>.
+        /// </summary>
+        public static PodResourceClaimStatusV1Converter Instance { get; } = new PodResourceClaimStatusV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodResourceClaimStatusV1Converter"/>.
+        /// </summary>
+        public PodResourceClaimStatusV1Converter()
+            : base("name", "resourceClaimName")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodResourceClaimStatusV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodResourceClaimStatusV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "resourceClaimName":
+                {
+                    model.ResourceClaimName = reader.ReadAsString() ?? model.ResourceClaimName;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodResourceClaimV1"/>.
+    /// </summary>
+    public sealed class PodResourceClaimV1Converter
+        : KubeModelConverter<PodResourceClaimV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodResourceClaimV1Converter"/>.
+        /// </summary>
+        public static PodResourceClaimV1Converter Instance { get; } = new PodResourceClaimV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodResourceClaimV1Converter"/>.
+        /// </summary>
+        public PodResourceClaimV1Converter()
+            : base("name", "resourceClaimName", "resourceClaimTemplateName")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodResourceClaimV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodResourceClaimV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "resourceClaimName":
+                {
+                    model.ResourceClaimName = reader.ReadAsString() ?? model.ResourceClaimName;
+
+                    return true;
+                }
+                case "resourceClaimTemplateName":
+                {
+                    model.ResourceClaimTemplateName = reader.ReadAsString() ?? model.ResourceClaimTemplateName;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodSchedulingGateV1"/>.
+    /// </summary>
+    public sealed class PodSchedulingGateV1Converter
+        : KubeModelConverter<PodSchedulingGateV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodSchedulingGateV1Converter"/>.
+        /// </summary>
+        public static PodSchedulingGateV1Converter Instance { get; } = new PodSchedulingGateV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodSchedulingGateV1Converter"/>.
+        /// </summary>
+        public PodSchedulingGateV1Converter()
+            : base("name")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodSchedulingGateV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodSchedulingGateV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodSecurityContextV1"/>.
+    /// </summary>
+    public sealed class PodSecurityContextV1Converter
+        : KubeModelConverter<PodSecurityContextV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodSecurityContextV1Converter"/>.
+        /// </summary>
+        public static PodSecurityContextV1Converter Instance { get; } = new PodSecurityContextV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodSecurityContextV1Converter"/>.
+        /// </summary>
+        public PodSecurityContextV1Converter()
+            : base("appArmorProfile", "seccompProfile", "fsGroup", "runAsGroup", "runAsUser", "seLinuxOptions", "supplementalGroups", "sysctls", "windowsOptions", "runAsNonRoot", "fsGroupChangePolicy", "supplementalGroupsPolicy")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodSecurityContextV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodSecurityContextV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "appArmorProfile":
+                {
+                    model.AppArmorProfile = ReadModel(reader, AppArmorProfileV1Converter.Instance, model.AppArmorProfile, serializer) ?? model.AppArmorProfile;
+
+                    return true;
+                }
+                case "seccompProfile":
+                {
+                    model.SeccompProfile = ReadModel(reader, SeccompProfileV1Converter.Instance, model.SeccompProfile, serializer) ?? model.SeccompProfile;
+
+                    return true;
+                }
+                case "fsGroup":
+                {
+                    model.FsGroup = ReadAsInt64(reader, serializer) ?? model.FsGroup;
+
+                    return true;
+                }
+                case "runAsGroup":
+                {
+                    model.RunAsGroup = ReadAsInt64(reader, serializer) ?? model.RunAsGroup;
+
+                    return true;
+                }
+                case "runAsUser":
+                {
+                    model.RunAsUser = ReadAsInt64(reader, serializer) ?? model.RunAsUser;
+
+                    return true;
+                }
+                case "seLinuxOptions":
+                {
+                    model.SeLinuxOptions = ReadModel(reader, SELinuxOptionsV1Converter.Instance, model.SeLinuxOptions, serializer) ?? model.SeLinuxOptions;
+
+                    return true;
+                }
+                case "supplementalGroups":
+                {
+                    ReadList(reader, model.SupplementalGroups, serializer);
+
+                    return true;
+                }
+                case "sysctls":
+                {
+                    ReadModelList(reader, SysctlV1Converter.Instance, model.Sysctls, serializer);
+
+                    return true;
+                }
+                case "windowsOptions":
+                {
+                    model.WindowsOptions = ReadModel(reader, WindowsSecurityContextOptionsV1Converter.Instance, model.WindowsOptions, serializer) ?? model.WindowsOptions;
+
+                    return true;
+                }
+                case "runAsNonRoot":
+                {
+                    model.RunAsNonRoot = reader.ReadAsBoolean() ?? model.RunAsNonRoot;
+
+                    return true;
+                }
+                case "fsGroupChangePolicy":
+                {
+                    model.FsGroupChangePolicy = ReadAsInternedString(reader) ?? model.FsGroupChangePolicy;
+
+                    return true;
+                }
+                case "supplementalGroupsPolicy":
+                {
+                    model.SupplementalGroupsPolicy = ReadAsInternedString(reader) ?? model.SupplementalGroupsPolicy;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodSpecV1"/>.
+    /// </summary>
+    public sealed class PodSpecV1Converter
+        : KubeModelConverter<PodSpecV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodSpecV1Converter"/>.
+        /// </summary>
+        public static PodSpecV1Converter Instance { get; } = new PodSpecV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodSpecV1Converter"/>.
+        /// </summary>
+        public PodSpecV1Converter()
+            : base("hostIPC", "hostPID", "setHostnameAsFQDN", "overhead", "hostname", "nodeName", "priorityClassName", "runtimeClassName", "schedulerName", "serviceAccountName", "shareProcessNamespace", "dnsConfig", "hostNetwork", "automountServiceAccountToken", "subdomain", "nodeSelector", "activeDeadlineSeconds", "containers", "enableServiceLinks", "ephemeralContainers", "hostAliases", "hostUsers", "imagePullSecrets", "initContainers", "os", "readinessGates", "resourceClaims", "schedulingGates", "terminationGracePeriodSeconds", "tolerations", "topologySpreadConstraints", "volumes", "securityContext", "serviceAccount", "affinity", "dnsPolicy", "preemptionPolicy", "priority", "restartPolicy")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodSpecV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodSpecV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "hostIPC":
+                {
+                    model.HostIPC = reader.ReadAsBoolean() ?? model.HostIPC;
+
+                    return true;
+                }
+                case "hostPID":
+                {
+                    model.HostPID = reader.ReadAsBoolean() ?? model.HostPID;
+
+                    return true;
+                }
+                case "setHostnameAsFQDN":
+                {
+                    model.SetHostnameAsFQDN = reader.ReadAsBoolean() ?? model.SetHostnameAsFQDN;
+
+                    return true;
+                }
+                case "overhead":
+                {
+                    ReadStringDictionary(reader, model.Overhead);
+
+                    return true;
+                }
+                case "hostname":
+                {
+                    model.Hostname = reader.ReadAsString() ?? model.Hostname;
+
+                    return true;
+                }
+                case "nodeName":
+                {
+                    model.NodeName = ReadAsInternedString(reader) ?? model.NodeName;
+
+                    return true;
+                }
+                case "priorityClassName":
+                {
+                    model.PriorityClassName = ReadAsInternedString(reader) ?? model.PriorityClassName;
+
+                    return true;
+                }
+                case "runtimeClassName":
+                {
+                    model.RuntimeClassName = ReadAsInternedString(reader) ?? model.RuntimeClassName;
+
+                    return true;
+                }
+                case "schedulerName":
+                {
+                    model.SchedulerName = ReadAsInternedString(reader) ?? model.SchedulerName;
+
+                    return true;
+                }
+                case "serviceAccountName":
+                {
+                    model.ServiceAccountName = ReadAsInternedString(reader) ?? model.ServiceAccountName;
+
+                    return true;
+                }
+                case "shareProcessNamespace":
+                {
+                    model.ShareProcessNamespace = reader.ReadAsBoolean() ?? model.ShareProcessNamespace;
+
+                    return true;
+                }
+                case "dnsConfig":
+                {
+                    model.DnsConfig = ReadModel(reader, PodDNSConfigV1Converter.Instance, model.DnsConfig, serializer) ?? model.DnsConfig;
+
+                    return true;
+                }
+                case "hostNetwork":
+                {
+                    model.HostNetwork = reader.ReadAsBoolean() ?? model.HostNetwork;
+
+                    return true;
+                }
+                case "automountServiceAccountToken":
+                {
+                    model.AutomountServiceAccountToken = reader.ReadAsBoolean() ?? model.AutomountServiceAccountToken;
+
+                    return true;
+                }
+                case "subdomain":
+                {
+                    model.Subdomain = reader.ReadAsString() ?? model.Subdomain;
+
+                    return true;
+                }
+                case "nodeSelector":
+                {
+                    ReadStringDictionary(reader, model.NodeSelector, InternedStrings.DictionaryKeys | InternedStrings.Values);
+
+                    return true;
+                }
+                case "activeDeadlineSeconds":
+                {
+                    model.ActiveDeadlineSeconds = ReadAsInt64(reader, serializer) ?? model.ActiveDeadlineSeconds;
+
+                    return true;
+                }
+                case "containers":
+                {
+                    ReadModelList(reader, ContainerV1Converter.Instance, model.Containers, serializer);
+
+                    return true;
+                }
+                case "enableServiceLinks":
+                {
+                    model.EnableServiceLinks = reader.ReadAsBoolean() ?? model.EnableServiceLinks;
+
+                    return true;
+                }
+                case "ephemeralContainers":
+                {
+                    ReadModelList(reader, EphemeralContainerV1Converter.Instance, model.EphemeralContainers, serializer);
+
+                    return true;
+                }
+                case "hostAliases":
+                {
+                    ReadModelList(reader, HostAliasV1Converter.Instance, model.HostAliases, serializer);
+
+                    return true;
+                }
+                case "hostUsers":
+                {
+                    model.HostUsers = reader.ReadAsBoolean() ?? model.HostUsers;
+
+                    return true;
+                }
+                case "imagePullSecrets":
+                {
+                    ReadModelList(reader, LocalObjectReferenceV1Converter.Instance, model.ImagePullSecrets, serializer);
+
+                    return true;
+                }
+                case "initContainers":
+                {
+                    ReadModelList(reader, ContainerV1Converter.Instance, model.InitContainers, serializer);
+
+                    return true;
+                }
+                case "os":
+                {
+                    model.Os = ReadModel(reader, PodOSV1Converter.Instance, model.Os, serializer) ?? model.Os;
+
+                    return true;
+                }
+                case "readinessGates":
+                {
+                    ReadModelList(reader, PodReadinessGateV1Converter.Instance, model.ReadinessGates, serializer);
+
+                    return true;
+                }
+                case "resourceClaims":
+                {
+                    ReadModelList(reader, PodResourceClaimV1Converter.Instance, model.ResourceClaims, serializer);
+
+                    return true;
+                }
+                case "schedulingGates":
+                {
+                    ReadModelList(reader, PodSchedulingGateV1Converter.Instance, model.SchedulingGates, serializer);
+
+                    return true;
+                }
+                case "terminationGracePeriodSeconds":
+                {
+                    model.TerminationGracePeriodSeconds = ReadAsInt64(reader, serializer) ?? model.TerminationGracePeriodSeconds;
+
+                    return true;
+                }
+                case "tolerations":
+                {
+                    ReadModelList(reader, TolerationV1Converter.Instance, model.Tolerations, serializer);
+
+                    return true;
+                }
+                case "topologySpreadConstraints":
+                {
+                    ReadModelList(reader, TopologySpreadConstraintV1Converter.Instance, model.TopologySpreadConstraints, serializer);
+
+                    return true;
+                }
+                case "volumes":
+                {
+                    ReadModelList(reader, VolumeV1Converter.Instance, model.Volumes, serializer);
+
+                    return true;
+                }
+                case "securityContext":
+                {
+                    model.SecurityContext = ReadModel(reader, PodSecurityContextV1Converter.Instance, model.SecurityContext, serializer) ?? model.SecurityContext;
+
+                    return true;
+                }
+                case "serviceAccount":
+                {
+                    model.ServiceAccount = ReadAsInternedString(reader) ?? model.ServiceAccount;
+
+                    return true;
+                }
+                case "affinity":
+                {
+                    model.Affinity = ReadModel(reader, AffinityV1Converter.Instance, model.Affinity, serializer) ?? model.Affinity;
+
+                    return true;
+                }
+                case "dnsPolicy":
+                {
+                    model.DnsPolicy = ReadAsInternedString(reader) ?? model.DnsPolicy;
+
+                    return true;
+                }
+                case "preemptionPolicy":
+                {
+                    model.PreemptionPolicy = ReadAsInternedString(reader) ?? model.PreemptionPolicy;
+
+                    return true;
+                }
+                case "priority":
+                {
+                    model.Priority = reader.ReadAsInt32() ?? model.Priority;
+
+                    return true;
+                }
+                case "restartPolicy":
+                {
+                    model.RestartPolicy = ReadAsInternedString(reader) ?? model.RestartPolicy;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodStatusV1"/>.
+    /// </summary>
+    public sealed class PodStatusV1Converter
+        : KubeModelConverter<PodStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodStatusV1Converter"/>.
+        /// </summary>
+        public static PodStatusV1Converter Instance { get; } = new PodStatusV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodStatusV1Converter"/>.
+        /// </summary>
+        public PodStatusV1Converter()
+            : base("hostIP", "podIP", "message", "nominatedNodeName", "phase", "resize", "startTime", "reason", "conditions", "containerStatuses", "ephemeralContainerStatuses", "hostIPs", "initContainerStatuses", "podIPs", "qosClass", "resourceClaimStatuses")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodStatusV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodStatusV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "hostIP":
+                {
+                    model.HostIP = ReadAsInternedString(reader) ?? model.HostIP;
+
+                    return true;
+                }
+                case "podIP":
+                {
+                    model.PodIP = reader.ReadAsString() ?? model.PodIP;
+
+                    return true;
+                }
+                case "message":
+                {
+                    model.Message = reader.ReadAsString() ?? model.Message;
+
+                    return true;
+                }
+                case "nominatedNodeName":
+                {
+                    model.NominatedNodeName = reader.ReadAsString() ?? model.NominatedNodeName;
+
+                    return true;
+                }
+                case "phase":
+                {
+                    model.Phase = ReadAsInternedString(reader) ?? model.Phase;
+
+                    return true;
+                }
+                case "resize":
+                {
+                    model.Resize = reader.ReadAsString() ?? model.Resize;
+
+                    return true;
+                }
+                case "startTime":
+                {
+                    model.StartTime = reader.ReadAsDateTime() ?? model.StartTime;
+
+                    return true;
+                }
+                case "reason":
+                {
+                    model.Reason = ReadAsInternedString(reader) ?? model.Reason;
+
+                    return true;
+                }
+                case "conditions":
+                {
+                    ReadModelList(reader, PodConditionV1Converter.Instance, model.Conditions, serializer);
+
+                    return true;
+                }
+                case "containerStatuses":
+                {
+                    ReadModelList(reader, ContainerStatusV1Converter.Instance, model.ContainerStatuses, serializer);
+
+                    return true;
+                }
+                case "ephemeralContainerStatuses":
+                {
+                    ReadModelList(reader, ContainerStatusV1Converter.Instance, model.EphemeralContainerStatuses, serializer);
+
+                    return true;
+                }
+                case "hostIPs":
+                {
+                    ReadModelList(reader, HostIPV1Converter.Instance, model.HostIPs, serializer);
+
+                    return true;
+                }
+                case "initContainerStatuses":
+                {
+                    ReadModelList(reader, ContainerStatusV1Converter.Instance, model.InitContainerStatuses, serializer);
+
+                    return true;
+                }
+                case "podIPs":
+                {
+                    ReadModelList(reader, PodIPV1Converter.Instance, model.PodIPs, serializer);
+
+                    return true;
+                }
+                case "qosClass":
+                {
+                    model.QosClass = ReadAsInternedString(reader) ?? model.QosClass;
+
+                    return true;
+                }
+                case "resourceClaimStatuses":
+                {
+                    ReadModelList(reader, PodResourceClaimStatusV1Converter.Instance, model.ResourceClaimStatuses, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodV1"/>.
+    /// </summary>
+    public sealed class PodV1Converter
+        : KubeModelConverter<PodV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodV1Converter"/>.
+        /// </summary>
+        public static PodV1Converter Instance { get; } = new PodV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodV1Converter"/>.
+        /// </summary>
+        public PodV1Converter()
+            : base("metadata", "spec", "kind", "apiVersion", "status")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadModel(reader, ObjectMetaV1Converter.Instance, model.Metadata, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "spec":
+                {
+                    model.Spec = ReadModel(reader, PodSpecV1Converter.Instance, model.Spec, serializer) ?? model.Spec;
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "status":
+                {
+                    model.Status = ReadModel(reader, PodStatusV1Converter.Instance, model.Status, serializer) ?? model.Status;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PortworxVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class PortworxVolumeSourceV1Converter
+        : KubeModelConverter<PortworxVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PortworxVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static PortworxVolumeSourceV1Converter Instance { get; } = new PortworxVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PortworxVolumeSourceV1Converter"/>.
+        /// </summary>
+        public PortworxVolumeSourceV1Converter()
+            : base("volumeID", "fsType", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PortworxVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PortworxVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "volumeID":
+                {
+                    model.VolumeID = reader.ReadAsString();
+
+                    return true;
+                }
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PreferredSchedulingTermV1"/>.
+    /// </summary>
+    public sealed class PreferredSchedulingTermV1Converter
+        : KubeModelConverter<PreferredSchedulingTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PreferredSchedulingTermV1Converter"/>.
+        /// </summary>
+        public static PreferredSchedulingTermV1Converter Instance { get; } = new PreferredSchedulingTermV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="PreferredSchedulingTermV1Converter"/>.
+        /// </summary>
+        public PreferredSchedulingTermV1Converter()
+            : base("preference", "weight")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PreferredSchedulingTermV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PreferredSchedulingTermV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "preference":
+                {
+                    model.Preference = ReadModel(reader, NodeSelectorTermV1Converter.Instance, model.Preference, serializer);
+
+                    return true;
+                }
+                case "weight":
+                {
+                    model.Weight = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ProbeV1"/>.
+    /// </summary>
+    public sealed class ProbeV1Converter
+        : KubeModelConverter<ProbeV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ProbeV1Converter"/>.
+        /// </summary>
+        public static ProbeV1Converter Instance { get; } = new ProbeV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ProbeV1Converter"/>.
+        /// </summary>
+        public ProbeV1Converter()
+            : base("exec", "grpc", "failureThreshold", "successThreshold", "initialDelaySeconds", "periodSeconds", "terminationGracePeriodSeconds", "timeoutSeconds", "httpGet", "tcpSocket")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ProbeV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ProbeV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "exec":
+                {
+                    model.Exec = ReadModel(reader, ExecActionV1Converter.Instance, model.Exec, serializer) ?? model.Exec;
+
+                    return true;
+                }
+                case "grpc":
+                {
+                    model.Grpc = ReadModel(reader, GRPCActionV1Converter.Instance, model.Grpc, serializer) ?? model.Grpc;
+
+                    return true;
+                }
+                case "failureThreshold":
+                {
+                    model.FailureThreshold = reader.ReadAsInt32() ?? model.FailureThreshold;
+
+                    return true;
+                }
+                case "successThreshold":
+                {
+                    model.SuccessThreshold = reader.ReadAsInt32() ?? model.SuccessThreshold;
+
+                    return true;
+                }
+                case "initialDelaySeconds":
+                {
+                    model.InitialDelaySeconds = reader.ReadAsInt32() ?? model.InitialDelaySeconds;
+
+                    return true;
+                }
+                case "periodSeconds":
+                {
+                    model.PeriodSeconds = reader.ReadAsInt32() ?? model.PeriodSeconds;
+
+                    return true;
+                }
+                case "terminationGracePeriodSeconds":
+                {
+                    model.TerminationGracePeriodSeconds = ReadAsInt64(reader, serializer) ?? model.TerminationGracePeriodSeconds;
+
+                    return true;
+                }
+                case "timeoutSeconds":
+                {
+                    model.TimeoutSeconds = reader.ReadAsInt32() ?? model.TimeoutSeconds;
+
+                    return true;
+                }
+                case "httpGet":
+                {
+                    model.HttpGet = ReadModel(reader, HTTPGetActionV1Converter.Instance, model.HttpGet, serializer) ?? model.HttpGet;
+
+                    return true;
+                }
+                case "tcpSocket":
+                {
+                    model.TcpSocket = ReadModel(reader, TCPSocketActionV1Converter.Instance, model.TcpSocket, serializer) ?? model.TcpSocket;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ProjectedVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ProjectedVolumeSourceV1Converter
+        : KubeModelConverter<ProjectedVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ProjectedVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static ProjectedVolumeSourceV1Converter Instance { get; } = new ProjectedVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ProjectedVolumeSourceV1Converter"/>.
+        /// </summary>
+        public ProjectedVolumeSourceV1Converter()
+            : base("defaultMode", "sources")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ProjectedVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ProjectedVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "defaultMode":
+                {
+                    model.DefaultMode = reader.ReadAsInt32() ?? model.DefaultMode;
+
+                    return true;
+                }
+                case "sources":
+                {
+                    ReadModelList(reader, VolumeProjectionV1Converter.Instance, model.Sources, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="QuobyteVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class QuobyteVolumeSourceV1Converter
+        : KubeModelConverter<QuobyteVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="QuobyteVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static QuobyteVolumeSourceV1Converter Instance { get; } = new QuobyteVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="QuobyteVolumeSourceV1Converter"/>.
+        /// </summary>
+        public QuobyteVolumeSourceV1Converter()
+            : base("volume", "group", "user", "tenant", "readOnly", "registry")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="QuobyteVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(QuobyteVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "volume":
+                {
+                    model.Volume = reader.ReadAsString();
+
+                    return true;
+                }
+                case "group":
+                {
+                    model.Group = reader.ReadAsString() ?? model.Group;
+
+                    return true;
+                }
+                case "user":
+                {
+                    model.User = reader.ReadAsString() ?? model.User;
+
+                    return true;
+                }
+                case "tenant":
+                {
+                    model.Tenant = reader.ReadAsString() ?? model.Tenant;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                case "registry":
+                {
+                    model.Registry = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="RBDVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class RBDVolumeSourceV1Converter
+        : KubeModelConverter<RBDVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="RBDVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static RBDVolumeSourceV1Converter Instance { get; } = new RBDVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="RBDVolumeSourceV1Converter"/>.
+        /// </summary>
+        public RBDVolumeSourceV1Converter()
+            : base("fsType", "image", "secretRef", "keyring", "pool", "user", "monitors", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="RBDVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(RBDVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "image":
+                {
+                    model.Image = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.SecretRef, serializer) ?? model.SecretRef;
+
+                    return true;
+                }
+                case "keyring":
+                {
+                    model.Keyring = reader.ReadAsString() ?? model.Keyring;
+
+                    return true;
+                }
+                case "pool":
+                {
+                    model.Pool = reader.ReadAsString() ?? model.Pool;
+
+                    return true;
+                }
+                case "user":
+                {
+                    model.User = reader.ReadAsString() ?? model.User;
+
+                    return true;
+                }
+                case "monitors":
+                {
+                    ReadStringList(reader, model.Monitors);
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ResourceClaimV1"/>.
+    /// </summary>
+    public sealed class ResourceClaimV1Converter
+        : KubeModelConverter<ResourceClaimV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceClaimV1Converter"/>.
+        /// </summary>
+        public static ResourceClaimV1Converter Instance { get; } = new ResourceClaimV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceClaimV1Converter"/>.
+        /// </summary>
+        public ResourceClaimV1Converter()
+            : base("name", "request")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ResourceClaimV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ResourceClaimV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "request":
+                {
+                    model.Request = reader.ReadAsString() ?? model.Request;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ResourceFieldSelectorV1"/>.
+    /// </summary>
+    public sealed class ResourceFieldSelectorV1Converter
+        : KubeModelConverter<ResourceFieldSelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceFieldSelectorV1Converter"/>.
+        /// </summary>
+        public static ResourceFieldSelectorV1Converter Instance { get; } = new ResourceFieldSelectorV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceFieldSelectorV1Converter"/>.
+        /// </summary>
+        public ResourceFieldSelectorV1Converter()
+            : base("containerName", "resource", "divisor")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ResourceFieldSelectorV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ResourceFieldSelectorV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "containerName":
+                {
+                    model.ContainerName = reader.ReadAsString() ?? model.ContainerName;
+
+                    return true;
+                }
+                case "resource":
+                {
+                    model.Resource = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "divisor":
+                {
+                    model.Divisor = reader.ReadAsString() ?? model.Divisor;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ResourceHealthV1"/>.
+    /// </summary>
+    public sealed class ResourceHealthV1Converter
+        : KubeModelConverter<ResourceHealthV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceHealthV1Converter"/>.
+        /// </summary>
+        public static ResourceHealthV1Converter Instance { get; } = new ResourceHealthV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceHealthV1Converter"/>.
+        /// </summary>
+        public ResourceHealthV1Converter()
+            : base("resourceID", "health")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ResourceHealthV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ResourceHealthV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "resourceID":
+                {
+                    model.ResourceID = reader.ReadAsString();
+
+                    return true;
+                }
+                case "health":
+                {
+                    model.Health = reader.ReadAsString() ?? model.Health;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ResourceRequirementsV1"/>.
+    /// </summary>
+    public sealed class ResourceRequirementsV1Converter
+        : KubeModelConverter<ResourceRequirementsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceRequirementsV1Converter"/>.
+        /// </summary>
+        public static ResourceRequirementsV1Converter Instance { get; } = new ResourceRequirementsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceRequirementsV1Converter"/>.
+        /// </summary>
+        public ResourceRequirementsV1Converter()
+            : base("claims", "limits", "requests")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ResourceRequirementsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ResourceRequirementsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "claims":
+                {
+                    ReadModelList(reader, ResourceClaimV1Converter.Instance, model.Claims, serializer);
+
+                    return true;
+                }
+                case "limits":
+                {
+                    ReadStringDictionary(reader, model.Limits, InternedStrings.DictionaryKeys | InternedStrings.Values);
+
+                    return true;
+                }
+                case "requests":
+                {
+                    ReadStringDictionary(reader, model.Requests, InternedStrings.DictionaryKeys | InternedStrings.Values);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ResourceStatusV1"/>.
+    /// </summary>
+    public sealed class ResourceStatusV1Converter
+        : KubeModelConverter<ResourceStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ResourceStatusV1Converter"/>.
+        /// </summary>
+        public static ResourceStatusV1Converter Instance { get; } = new ResourceStatusV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ResourceStatusV1Converter"/>.
+        /// </summary>
+        public ResourceStatusV1Converter()
+            : base("name", "resources")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ResourceStatusV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ResourceStatusV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "resources":
+                {
+                    ReadModelList(reader, ResourceHealthV1Converter.Instance, model.Resources, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SELinuxOptionsV1"/>.
+    /// </summary>
+    public sealed class SELinuxOptionsV1Converter
+        : KubeModelConverter<SELinuxOptionsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SELinuxOptionsV1Converter"/>.
+        /// </summary>
+        public static SELinuxOptionsV1Converter Instance { get; } = new SELinuxOptionsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SELinuxOptionsV1Converter"/>.
+        /// </summary>
+        public SELinuxOptionsV1Converter()
+            : base("role", "type", "level", "user")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SELinuxOptionsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SELinuxOptionsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "role":
+                {
+                    model.Role = reader.ReadAsString() ?? model.Role;
+
+                    return true;
+                }
+                case "type":
+                {
+                    model.Type = ReadAsInternedString(reader) ?? model.Type;
+
+                    return true;
+                }
+                case "level":
+                {
+                    model.Level = reader.ReadAsString() ?? model.Level;
+
+                    return true;
+                }
+                case "user":
+                {
+                    model.User = reader.ReadAsString() ?? model.User;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ScaleIOVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class ScaleIOVolumeSourceV1Converter
+        : KubeModelConverter<ScaleIOVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ScaleIOVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static ScaleIOVolumeSourceV1Converter Instance { get; } = new ScaleIOVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ScaleIOVolumeSourceV1Converter"/>.
+        /// </summary>
+        public ScaleIOVolumeSourceV1Converter()
+            : base("sslEnabled", "fsType", "storageMode", "volumeName", "secretRef", "storagePool", "system", "protectionDomain", "gateway", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ScaleIOVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ScaleIOVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "sslEnabled":
+                {
+                    model.SslEnabled = reader.ReadAsBoolean() ?? model.SslEnabled;
+
+                    return true;
+                }
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "storageMode":
+                {
+                    model.StorageMode = reader.ReadAsString() ?? model.StorageMode;
+
+                    return true;
+                }
+                case "volumeName":
+                {
+                    model.VolumeName = reader.ReadAsString() ?? model.VolumeName;
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.SecretRef, serializer);
+
+                    return true;
+                }
+                case "storagePool":
+                {
+                    model.StoragePool = reader.ReadAsString() ?? model.StoragePool;
+
+                    return true;
+                }
+                case "system":
+                {
+                    model.System = reader.ReadAsString();
+
+                    return true;
+                }
+                case "protectionDomain":
+                {
+                    model.ProtectionDomain = reader.ReadAsString() ?? model.ProtectionDomain;
+
+                    return true;
+                }
+                case "gateway":
+                {
+                    model.Gateway = reader.ReadAsString();
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SeccompProfileV1"/>.
+    /// </summary>
+    public sealed class SeccompProfileV1Converter
+        : KubeModelConverter<SeccompProfileV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SeccompProfileV1Converter"/>.
+        /// </summary>
+        public static SeccompProfileV1Converter Instance { get; } = new SeccompProfileV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SeccompProfileV1Converter"/>.
+        /// </summary>
+        public SeccompProfileV1Converter()
+            : base("localhostProfile", "type")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SeccompProfileV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SeccompProfileV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "localhostProfile":
+                {
+                    model.LocalhostProfile = reader.ReadAsString() ?? model.LocalhostProfile;
+
+                    return true;
+                }
+                case "type":
+                {
+                    model.Type = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SecretEnvSourceV1"/>.
+    /// </summary>
+    public sealed class SecretEnvSourceV1Converter
+        : KubeModelConverter<SecretEnvSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretEnvSourceV1Converter"/>.
+        /// </summary>
+        public static SecretEnvSourceV1Converter Instance { get; } = new SecretEnvSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretEnvSourceV1Converter"/>.
+        /// </summary>
+        public SecretEnvSourceV1Converter()
+            : base("name", "optional")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SecretEnvSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SecretEnvSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SecretKeySelectorV1"/>.
+    /// </summary>
+    public sealed class SecretKeySelectorV1Converter
+        : KubeModelConverter<SecretKeySelectorV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretKeySelectorV1Converter"/>.
+        /// </summary>
+        public static SecretKeySelectorV1Converter Instance { get; } = new SecretKeySelectorV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretKeySelectorV1Converter"/>.
+        /// </summary>
+        public SecretKeySelectorV1Converter()
+            : base("name", "optional", "key")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SecretKeySelectorV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SecretKeySelectorV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                case "key":
+                {
+                    model.Key = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SecretProjectionV1"/>.
+    /// </summary>
+    public sealed class SecretProjectionV1Converter
+        : KubeModelConverter<SecretProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretProjectionV1Converter"/>.
+        /// </summary>
+        public static SecretProjectionV1Converter Instance { get; } = new SecretProjectionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretProjectionV1Converter"/>.
+        /// </summary>
+        public SecretProjectionV1Converter()
+            : base("name", "optional", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SecretProjectionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SecretProjectionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString() ?? model.Name;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, KeyToPathV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SecretVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class SecretVolumeSourceV1Converter
+        : KubeModelConverter<SecretVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecretVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static SecretVolumeSourceV1Converter Instance { get; } = new SecretVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SecretVolumeSourceV1Converter"/>.
+        /// </summary>
+        public SecretVolumeSourceV1Converter()
+            : base("defaultMode", "secretName", "optional", "items")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SecretVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SecretVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "defaultMode":
+                {
+                    model.DefaultMode = reader.ReadAsInt32() ?? model.DefaultMode;
+
+                    return true;
+                }
+                case "secretName":
+                {
+                    model.SecretName = reader.ReadAsString() ?? model.SecretName;
+
+                    return true;
+                }
+                case "optional":
+                {
+                    model.Optional = reader.ReadAsBoolean() ?? model.Optional;
+
+                    return true;
+                }
+                case "items":
+                {
+                    ReadModelList(reader, KeyToPathV1Converter.Instance, model.Items, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SecurityContextV1"/>.
+    /// </summary>
+    public sealed class SecurityContextV1Converter
+        : KubeModelConverter<SecurityContextV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SecurityContextV1Converter"/>.
+        /// </summary>
+        public static SecurityContextV1Converter Instance { get; } = new SecurityContextV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SecurityContextV1Converter"/>.
+        /// </summary>
+        public SecurityContextV1Converter()
+            : base("privileged", "appArmorProfile", "seccompProfile", "readOnlyRootFilesystem", "allowPrivilegeEscalation", "runAsGroup", "runAsUser", "capabilities", "seLinuxOptions", "windowsOptions", "procMount", "runAsNonRoot")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SecurityContextV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SecurityContextV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "privileged":
+                {
+                    model.Privileged = reader.ReadAsBoolean() ?? model.Privileged;
+
+                    return true;
+                }
+                case "appArmorProfile":
+                {
+                    model.AppArmorProfile = ReadModel(reader, AppArmorProfileV1Converter.Instance, model.AppArmorProfile, serializer) ?? model.AppArmorProfile;
+
+                    return true;
+                }
+                case "seccompProfile":
+                {
+                    model.SeccompProfile = ReadModel(reader, SeccompProfileV1Converter.Instance, model.SeccompProfile, serializer) ?? model.SeccompProfile;
+
+                    return true;
+                }
+                case "readOnlyRootFilesystem":
+                {
+                    model.ReadOnlyRootFilesystem = reader.ReadAsBoolean() ?? model.ReadOnlyRootFilesystem;
+
+                    return true;
+                }
+                case "allowPrivilegeEscalation":
+                {
+                    model.AllowPrivilegeEscalation = reader.ReadAsBoolean() ?? model.AllowPrivilegeEscalation;
+
+                    return true;
+                }
+                case "runAsGroup":
+                {
+                    model.RunAsGroup = ReadAsInt64(reader, serializer) ?? model.RunAsGroup;
+
+                    return true;
+                }
+                case "runAsUser":
+                {
+                    model.RunAsUser = ReadAsInt64(reader, serializer) ?? model.RunAsUser;
+
+                    return true;
+                }
+                case "capabilities":
+                {
+                    model.Capabilities = ReadModel(reader, CapabilitiesV1Converter.Instance, model.Capabilities, serializer) ?? model.Capabilities;
+
+                    return true;
+                }
+                case "seLinuxOptions":
+                {
+                    model.SeLinuxOptions = ReadModel(reader, SELinuxOptionsV1Converter.Instance, model.SeLinuxOptions, serializer) ?? model.SeLinuxOptions;
+
+                    return true;
+                }
+                case "windowsOptions":
+                {
+                    model.WindowsOptions = ReadModel(reader, WindowsSecurityContextOptionsV1Converter.Instance, model.WindowsOptions, serializer) ?? model.WindowsOptions;
+
+                    return true;
+                }
+                case "procMount":
+                {
+                    model.ProcMount = reader.ReadAsString() ?? model.ProcMount;
+
+                    return true;
+                }
+                case "runAsNonRoot":
+                {
+                    model.RunAsNonRoot = reader.ReadAsBoolean() ?? model.RunAsNonRoot;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="ServiceAccountTokenProjectionV1"/>.
+    /// </summary>
+    public sealed class ServiceAccountTokenProjectionV1Converter
+        : KubeModelConverter<ServiceAccountTokenProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="ServiceAccountTokenProjectionV1Converter"/>.
+        /// </summary>
+        public static ServiceAccountTokenProjectionV1Converter Instance { get; } = new ServiceAccountTokenProjectionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="ServiceAccountTokenProjectionV1Converter"/>.
+        /// </summary>
+        public ServiceAccountTokenProjectionV1Converter()
+            : base("audience", "path", "expirationSeconds")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="ServiceAccountTokenProjectionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(ServiceAccountTokenProjectionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "audience":
+                {
+                    model.Audience = reader.ReadAsString() ?? model.Audience;
+
+                    return true;
+                }
+                case "path":
+                {
+                    model.Path = reader.ReadAsString();
+
+                    return true;
+                }
+                case "expirationSeconds":
+                {
+                    model.ExpirationSeconds = ReadAsInt64(reader, serializer) ?? model.ExpirationSeconds;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SleepActionV1"/>.
+    /// </summary>
+    public sealed class SleepActionV1Converter
+        : KubeModelConverter<SleepActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SleepActionV1Converter"/>.
+        /// </summary>
+        public static SleepActionV1Converter Instance { get; } = new SleepActionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SleepActionV1Converter"/>.
+        /// </summary>
+        public SleepActionV1Converter()
+            : base("seconds")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SleepActionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SleepActionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "seconds":
+                {
+                    model.Seconds = RequiredValue(ReadAsInt64(reader, serializer), reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="StorageOSVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class StorageOSVolumeSourceV1Converter
+        : KubeModelConverter<StorageOSVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="StorageOSVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static StorageOSVolumeSourceV1Converter Instance { get; } = new StorageOSVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="StorageOSVolumeSourceV1Converter"/>.
+        /// </summary>
+        public StorageOSVolumeSourceV1Converter()
+            : base("fsType", "volumeName", "volumeNamespace", "secretRef", "readOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="StorageOSVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(StorageOSVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "volumeName":
+                {
+                    model.VolumeName = reader.ReadAsString() ?? model.VolumeName;
+
+                    return true;
+                }
+                case "volumeNamespace":
+                {
+                    model.VolumeNamespace = reader.ReadAsString() ?? model.VolumeNamespace;
+
+                    return true;
+                }
+                case "secretRef":
+                {
+                    model.SecretRef = ReadModel(reader, LocalObjectReferenceV1Converter.Instance, model.SecretRef, serializer) ?? model.SecretRef;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="SysctlV1"/>.
+    /// </summary>
+    public sealed class SysctlV1Converter
+        : KubeModelConverter<SysctlV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="SysctlV1Converter"/>.
+        /// </summary>
+        public static SysctlV1Converter Instance { get; } = new SysctlV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="SysctlV1Converter"/>.
+        /// </summary>
+        public SysctlV1Converter()
+            : base("name", "value")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="SysctlV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(SysctlV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "value":
+                {
+                    model.Value = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="TCPSocketActionV1"/>.
+    /// </summary>
+    public sealed class TCPSocketActionV1Converter
+        : KubeModelConverter<TCPSocketActionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TCPSocketActionV1Converter"/>.
+        /// </summary>
+        public static TCPSocketActionV1Converter Instance { get; } = new TCPSocketActionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="TCPSocketActionV1Converter"/>.
+        /// </summary>
+        public TCPSocketActionV1Converter()
+            : base("host", "port")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="TCPSocketActionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(TCPSocketActionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "host":
+                {
+                    model.Host = reader.ReadAsString() ?? model.Host;
+
+                    return true;
+                }
+                case "port":
+                {
+                    model.Port = ReadInt32OrString(reader, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="TolerationV1"/>.
+    /// </summary>
+    public sealed class TolerationV1Converter
+        : KubeModelConverter<TolerationV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TolerationV1Converter"/>.
+        /// </summary>
+        public static TolerationV1Converter Instance { get; } = new TolerationV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="TolerationV1Converter"/>.
+        /// </summary>
+        public TolerationV1Converter()
+            : base("value", "operator", "tolerationSeconds", "effect", "key")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="TolerationV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(TolerationV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "value":
+                {
+                    model.Value = reader.ReadAsString() ?? model.Value;
+
+                    return true;
+                }
+                case "operator":
+                {
+                    model.Operator = ReadAsInternedString(reader) ?? model.Operator;
+
+                    return true;
+                }
+                case "tolerationSeconds":
+                {
+                    model.TolerationSeconds = ReadAsInt64(reader, serializer) ?? model.TolerationSeconds;
+
+                    return true;
+                }
+                case "effect":
+                {
+                    model.Effect = ReadAsInternedString(reader) ?? model.Effect;
+
+                    return true;
+                }
+                case "key":
+                {
+                    model.Key = reader.ReadAsString() ?? model.Key;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="TopologySpreadConstraintV1"/>.
+    /// </summary>
+    public sealed class TopologySpreadConstraintV1Converter
+        : KubeModelConverter<TopologySpreadConstraintV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TopologySpreadConstraintV1Converter"/>.
+        /// </summary>
+        public static TopologySpreadConstraintV1Converter Instance { get; } = new TopologySpreadConstraintV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="TopologySpreadConstraintV1Converter"/>.
+        /// </summary>
+        public TopologySpreadConstraintV1Converter()
+            : base("whenUnsatisfiable", "labelSelector", "matchLabelKeys", "minDomains", "maxSkew", "nodeAffinityPolicy", "nodeTaintsPolicy", "topologyKey")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="TopologySpreadConstraintV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(TopologySpreadConstraintV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "whenUnsatisfiable":
+                {
+                    model.WhenUnsatisfiable = reader.ReadAsString();
+
+                    return true;
+                }
+                case "labelSelector":
+                {
+                    model.LabelSelector = ReadModel(reader, LabelSelectorV1Converter.Instance, model.LabelSelector, serializer) ?? model.LabelSelector;
+
+                    return true;
+                }
+                case "matchLabelKeys":
+                {
+                    ReadStringList(reader, model.MatchLabelKeys);
+
+                    return true;
+                }
+                case "minDomains":
+                {
+                    model.MinDomains = reader.ReadAsInt32() ?? model.MinDomains;
+
+                    return true;
+                }
+                case "maxSkew":
+                {
+                    model.MaxSkew = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                case "nodeAffinityPolicy":
+                {
+                    model.NodeAffinityPolicy = ReadAsInternedString(reader) ?? model.NodeAffinityPolicy;
+
+                    return true;
+                }
+                case "nodeTaintsPolicy":
+                {
+                    model.NodeTaintsPolicy = ReadAsInternedString(reader) ?? model.NodeTaintsPolicy;
+
+                    return true;
+                }
+                case "topologyKey":
+                {
+                    model.TopologyKey = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="TypedLocalObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class TypedLocalObjectReferenceV1Converter
+        : KubeModelConverter<TypedLocalObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TypedLocalObjectReferenceV1Converter"/>.
+        /// </summary>
+        public static TypedLocalObjectReferenceV1Converter Instance { get; } = new TypedLocalObjectReferenceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="TypedLocalObjectReferenceV1Converter"/>.
+        /// </summary>
+        public TypedLocalObjectReferenceV1Converter()
+            : base("kind", "name", "apiGroup")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="TypedLocalObjectReferenceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(TypedLocalObjectReferenceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "kind":
+                {
+                    model.Kind = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "apiGroup":
+                {
+                    model.ApiGroup = ReadAsInternedString(reader) ?? model.ApiGroup;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="TypedObjectReferenceV1"/>.
+    /// </summary>
+    public sealed class TypedObjectReferenceV1Converter
+        : KubeModelConverter<TypedObjectReferenceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="TypedObjectReferenceV1Converter"/>.
+        /// </summary>
+        public static TypedObjectReferenceV1Converter Instance { get; } = new TypedObjectReferenceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="TypedObjectReferenceV1Converter"/>.
+        /// </summary>
+        public TypedObjectReferenceV1Converter()
+            : base("kind", "name", "namespace", "apiGroup")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="TypedObjectReferenceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(TypedObjectReferenceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "kind":
+                {
+                    model.Kind = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "namespace":
+                {
+                    model.Namespace = ReadAsInternedString(reader) ?? model.Namespace;
+
+                    return true;
+                }
+                case "apiGroup":
+                {
+                    model.ApiGroup = ReadAsInternedString(reader) ?? model.ApiGroup;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="VolumeDeviceV1"/>.
+    /// </summary>
+    public sealed class VolumeDeviceV1Converter
+        : KubeModelConverter<VolumeDeviceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeDeviceV1Converter"/>.
+        /// </summary>
+        public static VolumeDeviceV1Converter Instance { get; } = new VolumeDeviceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeDeviceV1Converter"/>.
+        /// </summary>
+        public VolumeDeviceV1Converter()
+            : base("name", "devicePath")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="VolumeDeviceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(VolumeDeviceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "devicePath":
+                {
+                    model.DevicePath = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="VolumeMountStatusV1"/>.
+    /// </summary>
+    public sealed class VolumeMountStatusV1Converter
+        : KubeModelConverter<VolumeMountStatusV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeMountStatusV1Converter"/>.
+        /// </summary>
+        public static VolumeMountStatusV1Converter Instance { get; } = new VolumeMountStatusV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeMountStatusV1Converter"/>.
+        /// </summary>
+        public VolumeMountStatusV1Converter()
+            : base("name", "mountPath", "readOnly", "recursiveReadOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="VolumeMountStatusV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(VolumeMountStatusV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "mountPath":
+                {
+                    model.MountPath = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                case "recursiveReadOnly":
+                {
+                    model.RecursiveReadOnly = reader.ReadAsString() ?? model.RecursiveReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="VolumeMountV1"/>.
+    /// </summary>
+    public sealed class VolumeMountV1Converter
+        : KubeModelConverter<VolumeMountV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeMountV1Converter"/>.
+        /// </summary>
+        public static VolumeMountV1Converter Instance { get; } = new VolumeMountV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeMountV1Converter"/>.
+        /// </summary>
+        public VolumeMountV1Converter()
+            : base("name", "mountPath", "subPath", "mountPropagation", "subPathExpr", "readOnly", "recursiveReadOnly")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="VolumeMountV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(VolumeMountV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "mountPath":
+                {
+                    model.MountPath = ReadAsInternedString(reader);
+
+                    return true;
+                }
+                case "subPath":
+                {
+                    model.SubPath = reader.ReadAsString() ?? model.SubPath;
+
+                    return true;
+                }
+                case "mountPropagation":
+                {
+                    model.MountPropagation = reader.ReadAsString() ?? model.MountPropagation;
+
+                    return true;
+                }
+                case "subPathExpr":
+                {
+                    model.SubPathExpr = reader.ReadAsString() ?? model.SubPathExpr;
+
+                    return true;
+                }
+                case "readOnly":
+                {
+                    model.ReadOnly = reader.ReadAsBoolean() ?? model.ReadOnly;
+
+                    return true;
+                }
+                case "recursiveReadOnly":
+                {
+                    model.RecursiveReadOnly = reader.ReadAsString() ?? model.RecursiveReadOnly;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="VolumeProjectionV1"/>.
+    /// </summary>
+    public sealed class VolumeProjectionV1Converter
+        : KubeModelConverter<VolumeProjectionV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeProjectionV1Converter"/>.
+        /// </summary>
+        public static VolumeProjectionV1Converter Instance { get; } = new VolumeProjectionV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeProjectionV1Converter"/>.
+        /// </summary>
+        public VolumeProjectionV1Converter()
+            : base("downwardAPI", "clusterTrustBundle", "serviceAccountToken", "configMap", "secret")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="VolumeProjectionV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(VolumeProjectionV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "downwardAPI":
+                {
+                    model.DownwardAPI = ReadModel(reader, DownwardAPIProjectionV1Converter.Instance, model.DownwardAPI, serializer) ?? model.DownwardAPI;
+
+                    return true;
+                }
+                case "clusterTrustBundle":
+                {
+                    model.ClusterTrustBundle = ReadModel(reader, ClusterTrustBundleProjectionV1Converter.Instance, model.ClusterTrustBundle, serializer) ?? model.ClusterTrustBundle;
+
+                    return true;
+                }
+                case "serviceAccountToken":
+                {
+                    model.ServiceAccountToken = ReadModel(reader, ServiceAccountTokenProjectionV1Converter.Instance, model.ServiceAccountToken, serializer) ?? model.ServiceAccountToken;
+
+                    return true;
+                }
+                case "configMap":
+                {
+                    model.ConfigMap = ReadModel(reader, ConfigMapProjectionV1Converter.Instance, model.ConfigMap, serializer) ?? model.ConfigMap;
+
+                    return true;
+                }
+                case "secret":
+                {
+                    model.Secret = ReadModel(reader, SecretProjectionV1Converter.Instance, model.Secret, serializer) ?? model.Secret;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="VolumeResourceRequirementsV1"/>.
+    /// </summary>
+    public sealed class VolumeResourceRequirementsV1Converter
+        : KubeModelConverter<VolumeResourceRequirementsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeResourceRequirementsV1Converter"/>.
+        /// </summary>
+        public static VolumeResourceRequirementsV1Converter Instance { get; } = new VolumeResourceRequirementsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeResourceRequirementsV1Converter"/>.
+        /// </summary>
+        public VolumeResourceRequirementsV1Converter()
+            : base("limits", "requests")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="VolumeResourceRequirementsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(VolumeResourceRequirementsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "limits":
+                {
+                    ReadStringDictionary(reader, model.Limits, InternedStrings.DictionaryKeys | InternedStrings.Values);
+
+                    return true;
+                }
+                case "requests":
+                {
+                    ReadStringDictionary(reader, model.Requests, InternedStrings.DictionaryKeys | InternedStrings.Values);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="VolumeV1"/>.
+    /// </summary>
+    public sealed class VolumeV1Converter
+        : KubeModelConverter<VolumeV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VolumeV1Converter"/>.
+        /// </summary>
+        public static VolumeV1Converter Instance { get; } = new VolumeV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="VolumeV1Converter"/>.
+        /// </summary>
+        public VolumeV1Converter()
+            : base("downwardAPI", "scaleIO", "fc", "projected", "rbd", "awsElasticBlockStore", "azureFile", "flexVolume", "image", "name", "portworxVolume", "quobyte", "vsphereVolume", "hostPath", "csi", "iscsi", "azureDisk", "gcePersistentDisk", "photonPersistentDisk", "ephemeral", "persistentVolumeClaim", "gitRepo", "configMap", "cinder", "emptyDir", "flocker", "cephfs", "glusterfs", "nfs", "storageos", "secret")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="VolumeV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(VolumeV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "downwardAPI":
+                {
+                    model.DownwardAPI = ReadModel(reader, DownwardAPIVolumeSourceV1Converter.Instance, model.DownwardAPI, serializer) ?? model.DownwardAPI;
+
+                    return true;
+                }
+                case "scaleIO":
+                {
+                    model.ScaleIO = ReadModel(reader, ScaleIOVolumeSourceV1Converter.Instance, model.ScaleIO, serializer) ?? model.ScaleIO;
+
+                    return true;
+                }
+                case "fc":
+                {
+                    model.Fc = ReadModel(reader, FCVolumeSourceV1Converter.Instance, model.Fc, serializer) ?? model.Fc;
+
+                    return true;
+                }
+                case "projected":
+                {
+                    model.Projected = ReadModel(reader, ProjectedVolumeSourceV1Converter.Instance, model.Projected, serializer) ?? model.Projected;
+
+                    return true;
+                }
+                case "rbd":
+                {
+                    model.Rbd = ReadModel(reader, RBDVolumeSourceV1Converter.Instance, model.Rbd, serializer) ?? model.Rbd;
+
+                    return true;
+                }
+                case "awsElasticBlockStore":
+                {
+                    model.AwsElasticBlockStore = ReadModel(reader, AWSElasticBlockStoreVolumeSourceV1Converter.Instance, model.AwsElasticBlockStore, serializer) ?? model.AwsElasticBlockStore;
+
+                    return true;
+                }
+                case "azureFile":
+                {
+                    model.AzureFile = ReadModel(reader, AzureFileVolumeSourceV1Converter.Instance, model.AzureFile, serializer) ?? model.AzureFile;
+
+                    return true;
+                }
+                case "flexVolume":
+                {
+                    model.FlexVolume = ReadModel(reader, FlexVolumeSourceV1Converter.Instance, model.FlexVolume, serializer) ?? model.FlexVolume;
+
+                    return true;
+                }
+                case "image":
+                {
+                    model.Image = ReadModel(reader, ImageVolumeSourceV1Converter.Instance, model.Image, serializer) ?? model.Image;
+
+                    return true;
+                }
+                case "name":
+                {
+                    model.Name = reader.ReadAsString();
+
+                    return true;
+                }
+                case "portworxVolume":
+                {
+                    model.PortworxVolume = ReadModel(reader, PortworxVolumeSourceV1Converter.Instance, model.PortworxVolume, serializer) ?? model.PortworxVolume;
+
+                    return true;
+                }
+                case "quobyte":
+                {
+                    model.Quobyte = ReadModel(reader, QuobyteVolumeSourceV1Converter.Instance, model.Quobyte, serializer) ?? model.Quobyte;
+
+                    return true;
+                }
+                case "vsphereVolume":
+                {
+                    model.VsphereVolume = ReadModel(reader, VsphereVirtualDiskVolumeSourceV1Converter.Instance, model.VsphereVolume, serializer) ?? model.VsphereVolume;
+
+                    return true;
+                }
+                case "hostPath":
+                {
+                    model.HostPath = ReadModel(reader, HostPathVolumeSourceV1Converter.Instance, model.HostPath, serializer) ?? model.HostPath;
+
+                    return true;
+                }
+                case "csi":
+                {
+                    model.Csi = ReadModel(reader, CSIVolumeSourceV1Converter.Instance, model.Csi, serializer) ?? model.Csi;
+
+                    return true;
+                }
+                case "iscsi":
+                {
+                    model.Iscsi = ReadModel(reader, ISCSIVolumeSourceV1Converter.Instance, model.Iscsi, serializer) ?? model.Iscsi;
+
+                    return true;
+                }
+                case "azureDisk":
+                {
+                    model.AzureDisk = ReadModel(reader, AzureDiskVolumeSourceV1Converter.Instance, model.AzureDisk, serializer) ?? model.AzureDisk;
+
+                    return true;
+                }
+                case "gcePersistentDisk":
+                {
+                    model.GcePersistentDisk = ReadModel(reader, GCEPersistentDiskVolumeSourceV1Converter.Instance, model.GcePersistentDisk, serializer) ?? model.GcePersistentDisk;
+
+                    return true;
+                }
+                case "photonPersistentDisk":
+                {
+                    model.PhotonPersistentDisk = ReadModel(reader, PhotonPersistentDiskVolumeSourceV1Converter.Instance, model.PhotonPersistentDisk, serializer) ?? model.PhotonPersistentDisk;
+
+                    return true;
+                }
+                case "ephemeral":
+                {
+                    model.Ephemeral = ReadModel(reader, EphemeralVolumeSourceV1Converter.Instance, model.Ephemeral, serializer) ?? model.Ephemeral;
+
+                    return true;
+                }
+                case "persistentVolumeClaim":
+                {
+                    model.PersistentVolumeClaim = ReadModel(reader, PersistentVolumeClaimVolumeSourceV1Converter.Instance, model.PersistentVolumeClaim, serializer) ?? model.PersistentVolumeClaim;
+
+                    return true;
+                }
+                case "gitRepo":
+                {
+                    model.GitRepo = ReadModel(reader, GitRepoVolumeSourceV1Converter.Instance, model.GitRepo, serializer) ?? model.GitRepo;
+
+                    return true;
+                }
+                case "configMap":
+                {
+                    model.ConfigMap = ReadModel(reader, ConfigMapVolumeSourceV1Converter.Instance, model.ConfigMap, serializer) ?? model.ConfigMap;
+
+                    return true;
+                }
+                case "cinder":
+                {
+                    model.Cinder = ReadModel(reader, CinderVolumeSourceV1Converter.Instance, model.Cinder, serializer) ?? model.Cinder;
+
+                    return true;
+                }
+                case "emptyDir":
+                {
+                    model.EmptyDir = ReadModel(reader, EmptyDirVolumeSourceV1Converter.Instance, model.EmptyDir, serializer) ?? model.EmptyDir;
+
+                    return true;
+                }
+                case "flocker":
+                {
+                    model.Flocker = ReadModel(reader, FlockerVolumeSourceV1Converter.Instance, model.Flocker, serializer) ?? model.Flocker;
+
+                    return true;
+                }
+                case "cephfs":
+                {
+                    model.Cephfs = ReadModel(reader, CephFSVolumeSourceV1Converter.Instance, model.Cephfs, serializer) ?? model.Cephfs;
+
+                    return true;
+                }
+                case "glusterfs":
+                {
+                    model.Glusterfs = ReadModel(reader, GlusterfsVolumeSourceV1Converter.Instance, model.Glusterfs, serializer) ?? model.Glusterfs;
+
+                    return true;
+                }
+                case "nfs":
+                {
+                    model.Nfs = ReadModel(reader, NFSVolumeSourceV1Converter.Instance, model.Nfs, serializer) ?? model.Nfs;
+
+                    return true;
+                }
+                case "storageos":
+                {
+                    model.Storageos = ReadModel(reader, StorageOSVolumeSourceV1Converter.Instance, model.Storageos, serializer) ?? model.Storageos;
+
+                    return true;
+                }
+                case "secret":
+                {
+                    model.Secret = ReadModel(reader, SecretVolumeSourceV1Converter.Instance, model.Secret, serializer) ?? model.Secret;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="VsphereVirtualDiskVolumeSourceV1"/>.
+    /// </summary>
+    public sealed class VsphereVirtualDiskVolumeSourceV1Converter
+        : KubeModelConverter<VsphereVirtualDiskVolumeSourceV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="VsphereVirtualDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public static VsphereVirtualDiskVolumeSourceV1Converter Instance { get; } = new VsphereVirtualDiskVolumeSourceV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="VsphereVirtualDiskVolumeSourceV1Converter"/>.
+        /// </summary>
+        public VsphereVirtualDiskVolumeSourceV1Converter()
+            : base("storagePolicyID", "fsType", "storagePolicyName", "volumePath")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="VsphereVirtualDiskVolumeSourceV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(VsphereVirtualDiskVolumeSourceV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "storagePolicyID":
+                {
+                    model.StoragePolicyID = reader.ReadAsString() ?? model.StoragePolicyID;
+
+                    return true;
+                }
+                case "fsType":
+                {
+                    model.FsType = reader.ReadAsString() ?? model.FsType;
+
+                    return true;
+                }
+                case "storagePolicyName":
+                {
+                    model.StoragePolicyName = reader.ReadAsString() ?? model.StoragePolicyName;
+
+                    return true;
+                }
+                case "volumePath":
+                {
+                    model.VolumePath = reader.ReadAsString();
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="WeightedPodAffinityTermV1"/>.
+    /// </summary>
+    public sealed class WeightedPodAffinityTermV1Converter
+        : KubeModelConverter<WeightedPodAffinityTermV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="WeightedPodAffinityTermV1Converter"/>.
+        /// </summary>
+        public static WeightedPodAffinityTermV1Converter Instance { get; } = new WeightedPodAffinityTermV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="WeightedPodAffinityTermV1Converter"/>.
+        /// </summary>
+        public WeightedPodAffinityTermV1Converter()
+            : base("podAffinityTerm", "weight")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="WeightedPodAffinityTermV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(WeightedPodAffinityTermV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "podAffinityTerm":
+                {
+                    model.PodAffinityTerm = ReadModel(reader, PodAffinityTermV1Converter.Instance, model.PodAffinityTerm, serializer);
+
+                    return true;
+                }
+                case "weight":
+                {
+                    model.Weight = RequiredValue(reader.ReadAsInt32(), reader);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="WindowsSecurityContextOptionsV1"/>.
+    /// </summary>
+    public sealed class WindowsSecurityContextOptionsV1Converter
+        : KubeModelConverter<WindowsSecurityContextOptionsV1>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="WindowsSecurityContextOptionsV1Converter"/>.
+        /// </summary>
+        public static WindowsSecurityContextOptionsV1Converter Instance { get; } = new WindowsSecurityContextOptionsV1Converter();
+
+        /// <summary>
+        ///     Create a new <see cref="WindowsSecurityContextOptionsV1Converter"/>.
+        /// </summary>
+        public WindowsSecurityContextOptionsV1Converter()
+            : base("gmsaCredentialSpec", "gmsaCredentialSpecName", "runAsUserName", "hostProcess")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="WindowsSecurityContextOptionsV1"/> property.
+        /// </summary>
+        protected override bool ReadProperty(WindowsSecurityContextOptionsV1 model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "gmsaCredentialSpec":
+                {
+                    model.GmsaCredentialSpec = reader.ReadAsString() ?? model.GmsaCredentialSpec;
+
+                    return true;
+                }
+                case "gmsaCredentialSpecName":
+                {
+                    model.GmsaCredentialSpecName = reader.ReadAsString() ?? model.GmsaCredentialSpecName;
+
+                    return true;
+                }
+                case "runAsUserName":
+                {
+                    model.RunAsUserName = reader.ReadAsString() ?? model.RunAsUserName;
+
+                    return true;
+                }
+                case "hostProcess":
+                {
+                    model.HostProcess = reader.ReadAsBoolean() ?? model.HostProcess;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+}
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     LocalObjectReference contains enough information to let you locate the referenced object inside the same namespace.
     /// </summary>
-    public partial class LocalObjectReferenceV1
+    public partial class LocalObjectReferenceV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name of the referent. This field is effectively required, but due to backwards compatibility is allowed to be empty. Instances of this type with an empty value here are almost certainly wrong. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#names
@@ -16,5 +16,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "name")]
         [JsonProperty("name", NullValueHandling = NullValueHandling.Ignore)]
         public string Name { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     MatchCondition represents a condition which must be fulfilled for a request to be sent to a webhook.
     /// </summary>
-    public partial class MatchConditionV1Beta1
+    public partial class MatchConditionV1Beta1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name is an identifier for this match condition, used for strategic merging of MatchConditions, as well as providing an identifier for logging purposes. A good name should be descriptive of the associated expression. Name must be a qualified name consisting of alphanumeric characters, '-', '_' or '.', and must start and end with an alphanumeric character (e.g. 'MyName',  or 'my.name',  or '123-abc', regex used for validation is '([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9]') with an optional DNS subdomain prefix and '/' (e.g. 'example.com/MyName')
@@ -33,5 +33,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "expression")]
         [JsonProperty("expression", NullValueHandling = NullValueHandling.Include)]
         public string Expression { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     Describes the state of a migration at a certain point.
     /// </summary>
-    public partial class MigrationConditionV1Alpha1
+    public partial class MigrationConditionV1Alpha1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     The last time this condition was updated.
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
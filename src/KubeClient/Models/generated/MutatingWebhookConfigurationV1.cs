@@ -26,7 +26,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "webhooks")]
         [JsonProperty("webhooks", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<MutatingWebhookV1> Webhooks { get; } = new List<MutatingWebhookV1>();
+        public KubeKeyedList<string, MutatingWebhookV1> Webhooks { get; } = new KubeKeyedList<string, MutatingWebhookV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Webhooks"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     MutatingWebhook describes an admission webhook and the resources and operations it applies to.
     /// </summary>
-    public partial class MutatingWebhookV1
+    public partial class MutatingWebhookV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     The name of the admission webhook. Name should be fully qualified, e.g., imagepolicy.kubernetes.io, where "imagepolicy" is the name of the webhook, and kubernetes.io is the name of the organization. Required.
@@ -88,7 +88,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "matchConditions")]
         [JsonProperty("matchConditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<MatchConditionV1> MatchConditions { get; } = new List<MatchConditionV1>();
+        public KubeKeyedList<string, MatchConditionV1> MatchConditions { get; } = new KubeKeyedList<string, MatchConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="MatchConditions"/> property should be serialised.
@@ -153,5 +153,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "reinvocationPolicy")]
         [JsonProperty("reinvocationPolicy", NullValueHandling = NullValueHandling.Ignore)]
         public string ReinvocationPolicy { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
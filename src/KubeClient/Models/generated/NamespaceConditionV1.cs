@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     NamespaceCondition contains details about state of namespace.
     /// </summary>
-    public partial class NamespaceConditionV1
+    public partial class NamespaceConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Description not provided.
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
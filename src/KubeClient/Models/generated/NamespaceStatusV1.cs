@@ -23,7 +23,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<NamespaceConditionV1> Conditions { get; } = new List<NamespaceConditionV1>();
+        public KubeKeyedList<string, NamespaceConditionV1> Conditions { get; } = new KubeKeyedList<string, NamespaceConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
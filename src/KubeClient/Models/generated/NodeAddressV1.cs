@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     NodeAddress contains information for the node's address.
     /// </summary>
-    public partial class NodeAddressV1
+    public partial class NodeAddressV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Node address type, one of Hostname, ExternalIP or InternalIP.
@@ -23,5 +23,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "address")]
         [JsonProperty("address", NullValueHandling = NullValueHandling.Include)]
         public string Address { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
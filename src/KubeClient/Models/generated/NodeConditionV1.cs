@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     NodeCondition contains condition information for a node.
     /// </summary>
-    public partial class NodeConditionV1
+    public partial class NodeConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Last time we got an update on a given condition.
@@ -51,5 +51,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
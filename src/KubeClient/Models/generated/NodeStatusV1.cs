@@ -73,7 +73,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "addresses")]
         [JsonProperty("addresses", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<NodeAddressV1> Addresses { get; } = new List<NodeAddressV1>();
+        public KubeKeyedList<string, NodeAddressV1> Addresses { get; } = new KubeKeyedList<string, NodeAddressV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Addresses"/> property should be serialised.
@@ -86,7 +86,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<NodeConditionV1> Conditions { get; } = new List<NodeConditionV1>();
+        public KubeKeyedList<string, NodeConditionV1> Conditions { get; } = new KubeKeyedList<string, NodeConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -149,7 +149,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "uid")]
         [YamlMember(Alias = "ownerReferences")]
         [JsonProperty("ownerReferences", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<OwnerReferenceV1> OwnerReferences { get; } = new List<OwnerReferenceV1>();
+        public KubeKeyedList<string, OwnerReferenceV1> OwnerReferences { get; } = new KubeKeyedList<string, OwnerReferenceV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="OwnerReferences"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ObjectReference contains enough information to let you inspect or modify the referred object.
     /// </summary>
-    public partial class ObjectReferenceV1 : KubeObjectV1
+    public partial class ObjectReferenceV1 : KubeObjectV1, IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     UID of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#uids
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "resourceVersion")]
         [JsonProperty("resourceVersion", NullValueHandling = NullValueHandling.Ignore)]
         public string ResourceVersion { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
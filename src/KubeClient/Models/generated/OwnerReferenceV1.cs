@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     OwnerReference contains enough information to let you identify an owning object. An owning object must be in the same namespace as the dependent, or be cluster-scoped, so there is no namespace field.
     /// </summary>
-    public partial class OwnerReferenceV1 : KubeObjectV1
+    public partial class OwnerReferenceV1 : KubeObjectV1, IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     UID of the referent. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names#uids
@@ -37,5 +37,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "controller")]
         [JsonProperty("controller", NullValueHandling = NullValueHandling.Ignore)]
         public bool? Controller { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("uid").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Uid;
     }
 }
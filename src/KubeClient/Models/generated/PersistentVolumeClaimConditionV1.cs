@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     PersistentVolumeClaimCondition contains details about state of pvc
     /// </summary>
-    public partial class PersistentVolumeClaimConditionV1
+    public partial class PersistentVolumeClaimConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     lastProbeTime is the time we probed the condition.
@@ -51,5 +51,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
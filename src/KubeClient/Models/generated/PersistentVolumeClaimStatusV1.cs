@@ -105,7 +105,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<PersistentVolumeClaimConditionV1> Conditions { get; } = new List<PersistentVolumeClaimConditionV1>();
+        public KubeKeyedList<string, PersistentVolumeClaimConditionV1> Conditions { get; } = new KubeKeyedList<string, PersistentVolumeClaimConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
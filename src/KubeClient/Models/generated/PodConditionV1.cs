@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     PodCondition contains details for the current condition of this pod.
     /// </summary>
-    public partial class PodConditionV1
+    public partial class PodConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Last time we probed the condition.
@@ -51,5 +51,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     PodIP represents a single IP address allocated to the pod.
     /// </summary>
-    public partial class PodIPV1
+    public partial class PodIPV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     IP is the IP address assigned to the pod
@@ -16,5 +16,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "ip")]
         [JsonProperty("ip", NullValueHandling = NullValueHandling.Include)]
         public string Ip { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("ip").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Ip;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     PodResourceClaimStatus is stored in the PodStatus for each PodResourceClaim which references a ResourceClaimTemplate. It stores the generated name for the corresponding ResourceClaim.
     /// </summary>
-    public partial class PodResourceClaimStatusV1
+    public partial class PodResourceClaimStatusV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name uniquely identifies this resource claim inside the pod. This must match the name of an entry in pod.spec.resourceClaims, which implies that the string must be a DNS_LABEL.
@@ -23,5 +23,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "resourceClaimName")]
         [JsonProperty("resourceClaimName", NullValueHandling = NullValueHandling.Ignore)]
         public string ResourceClaimName { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
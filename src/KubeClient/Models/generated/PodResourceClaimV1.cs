@@ -10,7 +10,7 @@ namespace KubeClient.Models
     ///     
     ///     It adds a name to it that uniquely identifies the ResourceClaim inside the Pod. Containers that need access to the ResourceClaim reference it with this name.
     /// </summary>
-    public partial class PodResourceClaimV1
+    public partial class PodResourceClaimV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name uniquely identifies this resource claim inside the pod. This must be a DNS_LABEL.
@@ -40,5 +40,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "resourceClaimTemplateName")]
         [JsonProperty("resourceClaimTemplateName", NullValueHandling = NullValueHandling.Ignore)]
         public string ResourceClaimTemplateName { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -15,7 +15,7 @@ namespace KubeClient.Models
         /// </summary>
         [YamlMember(Alias = "resourceClaims")]
         [JsonProperty("resourceClaims", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ResourceClaimSchedulingStatusV1Alpha3> ResourceClaims { get; } = new List<ResourceClaimSchedulingStatusV1Alpha3>();
+        public KubeKeyedList<string, ResourceClaimSchedulingStatusV1Alpha3> ResourceClaims { get; } = new KubeKeyedList<string, ResourceClaimSchedulingStatusV1Alpha3>();
 
         /// <summary>
         ///     Determine whether the <see cref="ResourceClaims"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     PodSchedulingGate is associated to a Pod to guard its scheduling.
     /// </summary>
-    public partial class PodSchedulingGateV1
+    public partial class PodSchedulingGateV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name of the scheduling gate. Each scheduling gate must have a unique name field.
@@ -16,5 +16,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "name")]
         [JsonProperty("name", NullValueHandling = NullValueHandling.Include)]
         public string Name { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -145,7 +145,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "containers")]
         [JsonProperty("containers", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ContainerV1> Containers { get; } = new List<ContainerV1>();
+        public KubeKeyedList<string, ContainerV1> Containers { get; } = new KubeKeyedList<string, ContainerV1>();
 
         /// <summary>
         ///     EnableServiceLinks indicates whether information about services should be injected into pod's environment variables, matching the syntax of Docker links. Optional: Defaults to true.
@@ -160,7 +160,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "ephemeralContainers")]
         [JsonProperty("ephemeralContainers", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<EphemeralContainerV1> EphemeralContainers { get; } = new List<EphemeralContainerV1>();
+        public KubeKeyedList<string, EphemeralContainerV1> EphemeralContainers { get; } = new KubeKeyedList<string, EphemeralContainerV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="EphemeralContainers"/> property should be serialised.
@@ -173,7 +173,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "ip")]
         [YamlMember(Alias = "hostAliases")]
         [JsonProperty("hostAliases", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<HostAliasV1> HostAliases { get; } = new List<HostAliasV1>();
+        public KubeKeyedList<string, HostAliasV1> HostAliases { get; } = new KubeKeyedList<string, HostAliasV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="HostAliases"/> property should be serialised.
@@ -193,7 +193,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "imagePullSecrets")]
         [JsonProperty("imagePullSecrets", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<LocalObjectReferenceV1> ImagePullSecrets { get; } = new List<LocalObjectReferenceV1>();
+        public KubeKeyedList<string, LocalObjectReferenceV1> ImagePullSecrets { get; } = new KubeKeyedList<string, LocalObjectReferenceV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="ImagePullSecrets"/> property should be serialised.
@@ -206,7 +206,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "initContainers")]
         [JsonProperty("initContainers", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ContainerV1> InitContainers { get; } = new List<ContainerV1>();
+        public KubeKeyedList<string, ContainerV1> InitContainers { get; } = new KubeKeyedList<string, ContainerV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="InitContainers"/> property should be serialised.
@@ -247,7 +247,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "resourceClaims")]
         [JsonProperty("resourceClaims", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<PodResourceClaimV1> ResourceClaims { get; } = new List<PodResourceClaimV1>();
+        public KubeKeyedList<string, PodResourceClaimV1> ResourceClaims { get; } = new KubeKeyedList<string, PodResourceClaimV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="ResourceClaims"/> property should be serialised.
@@ -262,7 +262,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "schedulingGates")]
         [JsonProperty("schedulingGates", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<PodSchedulingGateV1> SchedulingGates { get; } = new List<PodSchedulingGateV1>();
+        public KubeKeyedList<string, PodSchedulingGateV1> SchedulingGates { get; } = new KubeKeyedList<string, PodSchedulingGateV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="SchedulingGates"/> property should be serialised.
@@ -294,7 +294,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "topologyKey")]
         [YamlMember(Alias = "topologySpreadConstraints")]
         [JsonProperty("topologySpreadConstraints", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<TopologySpreadConstraintV1> TopologySpreadConstraints { get; } = new List<TopologySpreadConstraintV1>();
+        public KubeKeyedList<(string topologyKey, string whenUnsatisfiable), TopologySpreadConstraintV1> TopologySpreadConstraints { get; } = new KubeKeyedList<(string topologyKey, string whenUnsatisfiable), TopologySpreadConstraintV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="TopologySpreadConstraints"/> property should be serialised.
@@ -308,7 +308,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "volumes")]
         [JsonProperty("volumes", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<VolumeV1> Volumes { get; } = new List<VolumeV1>();
+        public KubeKeyedList<string, VolumeV1> Volumes { get; } = new KubeKeyedList<string, VolumeV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Volumes"/> property should be serialised.
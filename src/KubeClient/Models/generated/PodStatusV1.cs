@@ -76,7 +76,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<PodConditionV1> Conditions { get; } = new List<PodConditionV1>();
+        public KubeKeyedList<string, PodConditionV1> Conditions { get; } = new KubeKeyedList<string, PodConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -138,7 +138,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "ip")]
         [YamlMember(Alias = "podIPs")]
         [JsonProperty("podIPs", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<PodIPV1> PodIPs { get; } = new List<PodIPV1>();
+        public KubeKeyedList<string, PodIPV1> PodIPs { get; } = new KubeKeyedList<string, PodIPV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="PodIPs"/> property should be serialised.
@@ -159,7 +159,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "resourceClaimStatuses")]
         [JsonProperty("resourceClaimStatuses", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<PodResourceClaimStatusV1> ResourceClaimStatuses { get; } = new List<PodResourceClaimStatusV1>();
+        public KubeKeyedList<string, PodResourceClaimStatusV1> ResourceClaimStatuses { get; } = new KubeKeyedList<string, PodResourceClaimStatusV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="ResourceClaimStatuses"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     PriorityLevelConfigurationCondition defines the condition of priority level.
     /// </summary>
-    public partial class PriorityLevelConfigurationConditionV1Beta3
+    public partial class PriorityLevelConfigurationConditionV1Beta3 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     `lastTransitionTime` is the last time the condition transitioned from one status to another.
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Ignore)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
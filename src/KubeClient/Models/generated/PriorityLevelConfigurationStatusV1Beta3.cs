@@ -16,7 +16,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<PriorityLevelConfigurationConditionV1Beta3> Conditions { get; } = new List<PriorityLevelConfigurationConditionV1Beta3>();
+        public KubeKeyedList<string, PriorityLevelConfigurationConditionV1Beta3> Conditions { get; } = new KubeKeyedList<string, PriorityLevelConfigurationConditionV1Beta3>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -30,7 +30,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ReplicaSetConditionV1> Conditions { get; } = new List<ReplicaSetConditionV1>();
+        public KubeKeyedList<string, ReplicaSetConditionV1> Conditions { get; } = new KubeKeyedList<string, ReplicaSetConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -30,7 +30,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ReplicationControllerConditionV1> Conditions { get; } = new List<ReplicationControllerConditionV1>();
+        public KubeKeyedList<string, ReplicationControllerConditionV1> Conditions { get; } = new KubeKeyedList<string, ReplicationControllerConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
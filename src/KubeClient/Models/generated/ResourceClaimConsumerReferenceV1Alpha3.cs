@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ResourceClaimConsumerReference contains enough information to let you locate the consumer of a ResourceClaim. The user must be a resource in the same namespace as the ResourceClaim.
     /// </summary>
-    public partial class ResourceClaimConsumerReferenceV1Alpha3
+    public partial class ResourceClaimConsumerReferenceV1Alpha3 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     UID identifies exactly one incarnation of the resource.
@@ -37,5 +37,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "apiGroup")]
         [JsonProperty("apiGroup", NullValueHandling = NullValueHandling.Ignore)]
         public string ApiGroup { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("uid").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Uid;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ResourceClaimSchedulingStatus contains information about one particular ResourceClaim with "WaitForFirstConsumer" allocation mode.
     /// </summary>
-    public partial class ResourceClaimSchedulingStatusV1Alpha3
+    public partial class ResourceClaimSchedulingStatusV1Alpha3 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name matches the pod.spec.resourceClaims[*].Name field.
@@ -30,5 +30,10 @@ namespace KubeClient.Models
         ///     Determine whether the <see cref="UnsuitableNodes"/> property should be serialised.
         /// </summary>
         public bool ShouldSerializeUnsuitableNodes() => UnsuitableNodes.Count > 0;
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
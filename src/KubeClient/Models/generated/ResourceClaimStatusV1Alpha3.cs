@@ -40,7 +40,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "uid")]
         [YamlMember(Alias = "reservedFor")]
         [JsonProperty("reservedFor", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ResourceClaimConsumerReferenceV1Alpha3> ReservedFor { get; } = new List<ResourceClaimConsumerReferenceV1Alpha3>();
+        public KubeKeyedList<string, ResourceClaimConsumerReferenceV1Alpha3> ReservedFor { get; } = new KubeKeyedList<string, ResourceClaimConsumerReferenceV1Alpha3>();
 
         /// <summary>
         ///     Determine whether the <see cref="ReservedFor"/> property should be serialised.
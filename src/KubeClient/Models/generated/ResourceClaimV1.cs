@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ResourceClaim references one entry in PodSpec.ResourceClaims.
     /// </summary>
-    public partial class ResourceClaimV1
+    public partial class ResourceClaimV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name must match the name of one entry in pod.spec.resourceClaims of the Pod where this field is used. It makes that resource available inside a container.
@@ -23,5 +23,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "request")]
         [JsonProperty("request", NullValueHandling = NullValueHandling.Ignore)]
         public string Request { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
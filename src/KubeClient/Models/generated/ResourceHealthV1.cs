@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ResourceHealth represents the health of a resource. It has the latest device health information. This is a part of KEP https://kep.k8s.io/4680 and historical health changes are planned to be added in future iterations of a KEP.
     /// </summary>
-    public partial class ResourceHealthV1
+    public partial class ResourceHealthV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     ResourceID is the unique identifier of the resource. See the ResourceID type for more information.
@@ -31,5 +31,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "health")]
         [JsonProperty("health", NullValueHandling = NullValueHandling.Ignore)]
         public string Health { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("resourceID").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => ResourceID;
     }
 }
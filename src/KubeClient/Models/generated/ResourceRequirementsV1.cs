@@ -19,7 +19,7 @@ namespace KubeClient.Models
         /// </summary>
         [YamlMember(Alias = "claims")]
         [JsonProperty("claims", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ResourceClaimV1> Claims { get; } = new List<ResourceClaimV1>();
+        public KubeKeyedList<string, ResourceClaimV1> Claims { get; } = new KubeKeyedList<string, ResourceClaimV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Claims"/> property should be serialised.
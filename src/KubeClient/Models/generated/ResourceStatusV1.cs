@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     No description provided.
     /// </summary>
-    public partial class ResourceStatusV1
+    public partial class ResourceStatusV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name of the resource. Must be unique within the pod and match one of the resources from the pod spec.
@@ -22,11 +22,16 @@ namespace KubeClient.Models
         /// </summary>
         [YamlMember(Alias = "resources")]
         [JsonProperty("resources", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ResourceHealthV1> Resources { get; } = new List<ResourceHealthV1>();
+        public KubeKeyedList<string, ResourceHealthV1> Resources { get; } = new KubeKeyedList<string, ResourceHealthV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Resources"/> property should be serialised.
         /// </summary>
         public bool ShouldSerializeResources() => Resources.Count > 0;
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
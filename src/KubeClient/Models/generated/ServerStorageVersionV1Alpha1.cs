@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     An API server instance reports the version it can decode and the version it encodes objects to when persisting objects in the backend.
     /// </summary>
-    public partial class ServerStorageVersionV1Alpha1
+    public partial class ServerStorageVersionV1Alpha1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     The ID of the reporting API server.
@@ -47,5 +47,10 @@ namespace KubeClient.Models
         ///     Determine whether the <see cref="ServedVersions"/> property should be serialised.
         /// </summary>
         public bool ShouldSerializeServedVersions() => ServedVersions.Count > 0;
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("apiServerID").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => ApiServerID;
     }
 }
@@ -47,7 +47,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "secrets")]
         [JsonProperty("secrets", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ObjectReferenceV1> Secrets { get; } = new List<ObjectReferenceV1>();
+        public KubeKeyedList<string, ObjectReferenceV1> Secrets { get; } = new KubeKeyedList<string, ObjectReferenceV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Secrets"/> property should be serialised.
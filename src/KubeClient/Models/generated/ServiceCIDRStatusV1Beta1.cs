@@ -16,7 +16,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ConditionV1> Conditions { get; } = new List<ConditionV1>();
+        public KubeKeyedList<string, ConditionV1> Conditions { get; } = new KubeKeyedList<string, ConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ServicePort contains information on service's port.
     /// </summary>
-    public partial class ServicePortV1
+    public partial class ServicePortV1 : IKubeKeyedListItem<(int port, string protocol)>
     {
         /// <summary>
         ///     The name of this port within the service. This must be a DNS_LABEL. All ports within a ServiceSpec must have unique names. When considering the endpoints for a Service, this must match the 'name' field in the EndpointPort. Optional if only one ServicePort is defined on this service.
@@ -60,5 +60,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "targetPort")]
         [JsonProperty("targetPort", NullValueHandling = NullValueHandling.Ignore)]
         public Int32OrStringV1 TargetPort { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("port", "protocol").
+        /// </summary>
+        (int port, string protocol) IKubeKeyedListItem<(int port, string protocol)>.ListKey => (Port, Protocol);
     }
 }
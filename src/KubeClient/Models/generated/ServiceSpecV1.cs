@@ -136,7 +136,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "port")]
         [YamlMember(Alias = "ports")]
         [JsonProperty("ports", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ServicePortV1> Ports { get; } = new List<ServicePortV1>();
+        public KubeKeyedList<(int port, string protocol), ServicePortV1> Ports { get; } = new KubeKeyedList<(int port, string protocol), ServicePortV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Ports"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     StatefulSetCondition describes the state of a statefulset at a certain point.
     /// </summary>
-    public partial class StatefulSetConditionV1
+    public partial class StatefulSetConditionV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Last time the condition transitioned from one status to another.
@@ -44,5 +44,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "status")]
         [JsonProperty("status", NullValueHandling = NullValueHandling.Include)]
         public string Status { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("type").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Type;
     }
 }
@@ -44,7 +44,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<StatefulSetConditionV1> Conditions { get; } = new List<StatefulSetConditionV1>();
+        public KubeKeyedList<string, StatefulSetConditionV1> Conditions { get; } = new KubeKeyedList<string, StatefulSetConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
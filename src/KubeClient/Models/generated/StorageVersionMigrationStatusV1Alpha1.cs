@@ -23,7 +23,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "type")]
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<MigrationConditionV1Alpha1> Conditions { get; } = new List<MigrationConditionV1Alpha1>();
+        public KubeKeyedList<string, MigrationConditionV1Alpha1> Conditions { get; } = new KubeKeyedList<string, MigrationConditionV1Alpha1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -22,7 +22,7 @@ namespace KubeClient.Models
         /// </summary>
         [YamlMember(Alias = "conditions")]
         [JsonProperty("conditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<StorageVersionConditionV1Alpha1> Conditions { get; } = new List<StorageVersionConditionV1Alpha1>();
+        public KubeKeyedList<string, StorageVersionConditionV1Alpha1> Conditions { get; } = new KubeKeyedList<string, StorageVersionConditionV1Alpha1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Conditions"/> property should be serialised.
@@ -34,7 +34,7 @@ namespace KubeClient.Models
         /// </summary>
         [YamlMember(Alias = "storageVersions")]
         [JsonProperty("storageVersions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ServerStorageVersionV1Alpha1> StorageVersions { get; } = new List<ServerStorageVersionV1Alpha1>();
+        public KubeKeyedList<string, ServerStorageVersionV1Alpha1> StorageVersions { get; } = new KubeKeyedList<string, ServerStorageVersionV1Alpha1>();
 
         /// <summary>
         ///     Determine whether the <see cref="StorageVersions"/> property should be serialised.
@@ -0,0 +1,295 @@
+using System;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Computes Kubernetes strategic-merge patches.
+    /// </summary>
+    public static partial class StrategicMergePatch
+    {
+        /// <summary>
+        ///     Generated model properties that have a patch strategy (or whose values contain properties that do), with their patch strategies, merge keys, and model types.
+        /// </summary>
+        static readonly (Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)[] GeneratedProperties =
+        {
+            (typeof(APIServiceListV1), "items", default, null, typeof(APIServiceV1)),
+            (typeof(APIServiceStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(APIServiceV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(APIServiceV1), "status", default, null, typeof(APIServiceStatusV1)),
+            (typeof(BindingV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(CSIDriverListV1), "items", default, null, typeof(CSIDriverV1)),
+            (typeof(CSIDriverV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(CSINodeListV1), "items", default, null, typeof(CSINodeV1)),
+            (typeof(CSINodeSpecV1), "drivers", PatchStrategies.Merge, "name", null),
+            (typeof(CSINodeV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(CSINodeV1), "spec", default, null, typeof(CSINodeSpecV1)),
+            (typeof(CSIStorageCapacityListV1), "items", default, null, typeof(CSIStorageCapacityV1)),
+            (typeof(CSIStorageCapacityV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(CertificateSigningRequestListV1), "items", default, null, typeof(CertificateSigningRequestV1)),
+            (typeof(CertificateSigningRequestV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ClusterRoleBindingListV1), "items", default, null, typeof(ClusterRoleBindingV1)),
+            (typeof(ClusterRoleBindingV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ClusterRoleListV1), "items", default, null, typeof(ClusterRoleV1)),
+            (typeof(ClusterRoleV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ClusterTrustBundleListV1Alpha1), "items", default, null, typeof(ClusterTrustBundleV1Alpha1)),
+            (typeof(ClusterTrustBundleV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ComponentStatusListV1), "items", default, null, typeof(ComponentStatusV1)),
+            (typeof(ComponentStatusV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ComponentStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(ConfigMapListV1), "items", default, null, typeof(ConfigMapV1)),
+            (typeof(ConfigMapV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ContainerStatusV1), "allocatedResourcesStatus", PatchStrategies.Merge, "name", null),
+            (typeof(ContainerStatusV1), "volumeMounts", PatchStrategies.Merge, "mountPath", null),
+            (typeof(ContainerV1), "ports", PatchStrategies.Merge, "containerPort", null),
+            (typeof(ContainerV1), "volumeDevices", PatchStrategies.Merge, "devicePath", null),
+            (typeof(ContainerV1), "volumeMounts", PatchStrategies.Merge, "mountPath", null),
+            (typeof(ContainerV1), "env", PatchStrategies.Merge, "name", null),
+            (typeof(ControllerRevisionListV1), "items", default, null, typeof(ControllerRevisionV1)),
+            (typeof(ControllerRevisionV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(CronJobListV1), "items", default, null, typeof(CronJobV1)),
+            (typeof(CronJobSpecV1), "jobTemplate", default, null, typeof(JobTemplateSpecV1)),
+            (typeof(CronJobV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(CronJobV1), "spec", default, null, typeof(CronJobSpecV1)),
+            (typeof(CustomResourceDefinitionListV1), "items", default, null, typeof(CustomResourceDefinitionV1)),
+            (typeof(CustomResourceDefinitionSpecV1), "versions", default, null, typeof(CustomResourceDefinitionVersionV1)),
+            (typeof(CustomResourceDefinitionV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(CustomResourceDefinitionV1), "spec", default, null, typeof(CustomResourceDefinitionSpecV1)),
+            (typeof(CustomResourceDefinitionVersionV1), "schema", default, null, typeof(CustomResourceValidationV1)),
+            (typeof(CustomResourceValidationV1), "openAPIV3Schema", default, null, typeof(JSONSchemaPropsV1)),
+            (typeof(DaemonSetListV1), "items", default, null, typeof(DaemonSetV1)),
+            (typeof(DaemonSetSpecV1), "template", default, null, typeof(PodTemplateSpecV1)),
+            (typeof(DaemonSetStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(DaemonSetV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(DaemonSetV1), "spec", default, null, typeof(DaemonSetSpecV1)),
+            (typeof(DaemonSetV1), "status", default, null, typeof(DaemonSetStatusV1)),
+            (typeof(DeploymentListV1), "items", default, null, typeof(DeploymentV1)),
+            (typeof(DeploymentSpecV1), "template", default, null, typeof(PodTemplateSpecV1)),
+            (typeof(DeploymentSpecV1), "strategy", PatchStrategies.RetainKeys, null, null),
+            (typeof(DeploymentStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(DeploymentV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(DeploymentV1), "spec", default, null, typeof(DeploymentSpecV1)),
+            (typeof(DeploymentV1), "status", default, null, typeof(DeploymentStatusV1)),
+            (typeof(DeviceClassListV1Alpha3), "items", default, null, typeof(DeviceClassV1Alpha3)),
+            (typeof(DeviceClassV1Alpha3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(EndpointSliceListV1), "items", default, null, typeof(EndpointSliceV1)),
+            (typeof(EndpointSliceV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(EndpointsListV1), "items", default, null, typeof(EndpointsV1)),
+            (typeof(EndpointsV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(EphemeralContainerV1), "ports", PatchStrategies.Merge, "containerPort", null),
+            (typeof(EphemeralContainerV1), "volumeDevices", PatchStrategies.Merge, "devicePath", null),
+            (typeof(EphemeralContainerV1), "volumeMounts", PatchStrategies.Merge, "mountPath", null),
+            (typeof(EphemeralContainerV1), "env", PatchStrategies.Merge, "name", null),
+            (typeof(EphemeralVolumeSourceV1), "volumeClaimTemplate", default, null, typeof(PersistentVolumeClaimTemplateV1)),
+            (typeof(EventListV1), "items", default, null, typeof(EventV1)),
+            (typeof(EventV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(EvictionV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(FlowSchemaListV1), "items", default, null, typeof(FlowSchemaV1)),
+            (typeof(FlowSchemaListV1Beta3), "items", default, null, typeof(FlowSchemaV1Beta3)),
+            (typeof(FlowSchemaStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(FlowSchemaStatusV1Beta3), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(FlowSchemaV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(FlowSchemaV1), "status", default, null, typeof(FlowSchemaStatusV1)),
+            (typeof(FlowSchemaV1Beta3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(FlowSchemaV1Beta3), "status", default, null, typeof(FlowSchemaStatusV1Beta3)),
+            (typeof(HorizontalPodAutoscalerListV1), "items", default, null, typeof(HorizontalPodAutoscalerV1)),
+            (typeof(HorizontalPodAutoscalerListV2), "items", default, null, typeof(HorizontalPodAutoscalerV2)),
+            (typeof(HorizontalPodAutoscalerStatusV2), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(HorizontalPodAutoscalerV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(HorizontalPodAutoscalerV2), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(HorizontalPodAutoscalerV2), "status", default, null, typeof(HorizontalPodAutoscalerStatusV2)),
+            (typeof(IPAddressListV1Beta1), "items", default, null, typeof(IPAddressV1Beta1)),
+            (typeof(IPAddressV1Beta1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(IngressClassListV1), "items", default, null, typeof(IngressClassV1)),
+            (typeof(IngressClassV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(IngressListV1), "items", default, null, typeof(IngressV1)),
+            (typeof(IngressV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(JSONSchemaPropsV1), "allOf", default, null, typeof(JSONSchemaPropsV1)),
+            (typeof(JSONSchemaPropsV1), "anyOf", default, null, typeof(JSONSchemaPropsV1)),
+            (typeof(JSONSchemaPropsV1), "oneOf", default, null, typeof(JSONSchemaPropsV1)),
+            (typeof(JSONSchemaPropsV1), "x-kubernetes-validations", PatchStrategies.Merge, "rule", null),
+            (typeof(JSONSchemaPropsV1), "not", default, null, typeof(JSONSchemaPropsV1)),
+            (typeof(JobListV1), "items", default, null, typeof(JobV1)),
+            (typeof(JobSpecV1), "template", default, null, typeof(PodTemplateSpecV1)),
+            (typeof(JobStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(JobTemplateSpecV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(JobTemplateSpecV1), "spec", default, null, typeof(JobSpecV1)),
+            (typeof(JobV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(JobV1), "spec", default, null, typeof(JobSpecV1)),
+            (typeof(JobV1), "status", default, null, typeof(JobStatusV1)),
+            (typeof(LeaseCandidateListV1Alpha1), "items", default, null, typeof(LeaseCandidateV1Alpha1)),
+            (typeof(LeaseCandidateV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(LeaseListV1), "items", default, null, typeof(LeaseV1)),
+            (typeof(LeaseV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(LimitRangeListV1), "items", default, null, typeof(LimitRangeV1)),
+            (typeof(LimitRangeV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(LocalSubjectAccessReviewV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(MutatingWebhookConfigurationListV1), "items", default, null, typeof(MutatingWebhookConfigurationV1)),
+            (typeof(MutatingWebhookConfigurationV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(MutatingWebhookConfigurationV1), "webhooks", PatchStrategies.Merge, "name", typeof(MutatingWebhookV1)),
+            (typeof(MutatingWebhookV1), "matchConditions", PatchStrategies.Merge, "name", null),
+            (typeof(NamespaceListV1), "items", default, null, typeof(NamespaceV1)),
+            (typeof(NamespaceStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(NamespaceV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(NamespaceV1), "status", default, null, typeof(NamespaceStatusV1)),
+            (typeof(NetworkPolicyListV1), "items", default, null, typeof(NetworkPolicyV1)),
+            (typeof(NetworkPolicyV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(NodeListV1), "items", default, null, typeof(NodeV1)),
+            (typeof(NodeSpecV1), "podCIDRs", PatchStrategies.Merge, null, null),
+            (typeof(NodeStatusV1), "addresses", PatchStrategies.Merge, "type", null),
+            (typeof(NodeStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(NodeV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(NodeV1), "spec", default, null, typeof(NodeSpecV1)),
+            (typeof(NodeV1), "status", default, null, typeof(NodeStatusV1)),
+            (typeof(ObjectMetaV1), "finalizers", PatchStrategies.Merge, null, null),
+            (typeof(ObjectMetaV1), "ownerReferences", PatchStrategies.Merge, "uid", null),
+            (typeof(PersistentVolumeClaimListV1), "items", default, null, typeof(PersistentVolumeClaimV1)),
+            (typeof(PersistentVolumeClaimStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(PersistentVolumeClaimTemplateV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PersistentVolumeClaimV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PersistentVolumeClaimV1), "status", default, null, typeof(PersistentVolumeClaimStatusV1)),
+            (typeof(PersistentVolumeListV1), "items", default, null, typeof(PersistentVolumeV1)),
+            (typeof(PersistentVolumeV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PodDisruptionBudgetListV1), "items", default, null, typeof(PodDisruptionBudgetV1)),
+            (typeof(PodDisruptionBudgetStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(PodDisruptionBudgetV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PodDisruptionBudgetV1), "status", default, null, typeof(PodDisruptionBudgetStatusV1)),
+            (typeof(PodListV1), "items", default, null, typeof(PodV1)),
+            (typeof(PodSchedulingContextListV1Alpha3), "items", default, null, typeof(PodSchedulingContextV1Alpha3)),
+            (typeof(PodSchedulingContextV1Alpha3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PodSpecV1), "containers", PatchStrategies.Merge, "name", typeof(ContainerV1)),
+            (typeof(PodSpecV1), "ephemeralContainers", PatchStrategies.Merge, "name", typeof(EphemeralContainerV1)),
+            (typeof(PodSpecV1), "hostAliases", PatchStrategies.Merge, "ip", null),
+            (typeof(PodSpecV1), "imagePullSecrets", PatchStrategies.Merge, "name", null),
+            (typeof(PodSpecV1), "initContainers", PatchStrategies.Merge, "name", typeof(ContainerV1)),
+            (typeof(PodSpecV1), "resourceClaims", PatchStrategies.Merge | PatchStrategies.RetainKeys, "name", null),
+            (typeof(PodSpecV1), "schedulingGates", PatchStrategies.Merge, "name", null),
+            (typeof(PodSpecV1), "topologySpreadConstraints", PatchStrategies.Merge, "topologyKey", null),
+            (typeof(PodSpecV1), "volumes", PatchStrategies.Merge | PatchStrategies.RetainKeys, "name", typeof(VolumeV1)),
+            (typeof(PodStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(PodStatusV1), "containerStatuses", default, null, typeof(ContainerStatusV1)),
+            (typeof(PodStatusV1), "ephemeralContainerStatuses", default, null, typeof(ContainerStatusV1)),
+            (typeof(PodStatusV1), "hostIPs", PatchStrategies.Merge, "ip", null),
+            (typeof(PodStatusV1), "initContainerStatuses", default, null, typeof(ContainerStatusV1)),
+            (typeof(PodStatusV1), "podIPs", PatchStrategies.Merge, "ip", null),
+            (typeof(PodStatusV1), "resourceClaimStatuses", PatchStrategies.Merge | PatchStrategies.RetainKeys, "name", null),
+            (typeof(PodTemplateListV1), "items", default, null, typeof(PodTemplateV1)),
+            (typeof(PodTemplateSpecV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PodTemplateSpecV1), "spec", default, null, typeof(PodSpecV1)),
+            (typeof(PodTemplateV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PodTemplateV1), "template", default, null, typeof(PodTemplateSpecV1)),
+            (typeof(PodV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PodV1), "spec", default, null, typeof(PodSpecV1)),
+            (typeof(PodV1), "status", default, null, typeof(PodStatusV1)),
+            (typeof(PriorityClassListV1), "items", default, null, typeof(PriorityClassV1)),
+            (typeof(PriorityClassV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PriorityLevelConfigurationListV1), "items", default, null, typeof(PriorityLevelConfigurationV1)),
+            (typeof(PriorityLevelConfigurationListV1Beta3), "items", default, null, typeof(PriorityLevelConfigurationV1Beta3)),
+            (typeof(PriorityLevelConfigurationStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(PriorityLevelConfigurationStatusV1Beta3), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(PriorityLevelConfigurationV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PriorityLevelConfigurationV1), "status", default, null, typeof(PriorityLevelConfigurationStatusV1)),
+            (typeof(PriorityLevelConfigurationV1Beta3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(PriorityLevelConfigurationV1Beta3), "status", default, null, typeof(PriorityLevelConfigurationStatusV1Beta3)),
+            (typeof(ReplicaSetListV1), "items", default, null, typeof(ReplicaSetV1)),
+            (typeof(ReplicaSetSpecV1), "template", default, null, typeof(PodTemplateSpecV1)),
+            (typeof(ReplicaSetStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(ReplicaSetV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ReplicaSetV1), "spec", default, null, typeof(ReplicaSetSpecV1)),
+            (typeof(ReplicaSetV1), "status", default, null, typeof(ReplicaSetStatusV1)),
+            (typeof(ReplicationControllerListV1), "items", default, null, typeof(ReplicationControllerV1)),
+            (typeof(ReplicationControllerSpecV1), "template", default, null, typeof(PodTemplateSpecV1)),
+            (typeof(ReplicationControllerStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(ReplicationControllerV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ReplicationControllerV1), "spec", default, null, typeof(ReplicationControllerSpecV1)),
+            (typeof(ReplicationControllerV1), "status", default, null, typeof(ReplicationControllerStatusV1)),
+            (typeof(ResourceClaimListV1Alpha3), "items", default, null, typeof(ResourceClaimV1Alpha3)),
+            (typeof(ResourceClaimStatusV1Alpha3), "reservedFor", PatchStrategies.Merge, "uid", null),
+            (typeof(ResourceClaimTemplateListV1Alpha3), "items", default, null, typeof(ResourceClaimTemplateV1Alpha3)),
+            (typeof(ResourceClaimTemplateSpecV1Alpha3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ResourceClaimTemplateV1Alpha3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ResourceClaimTemplateV1Alpha3), "spec", default, null, typeof(ResourceClaimTemplateSpecV1Alpha3)),
+            (typeof(ResourceClaimV1Alpha3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ResourceClaimV1Alpha3), "status", default, null, typeof(ResourceClaimStatusV1Alpha3)),
+            (typeof(ResourceQuotaListV1), "items", default, null, typeof(ResourceQuotaV1)),
+            (typeof(ResourceQuotaV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ResourceSliceListV1Alpha3), "items", default, null, typeof(ResourceSliceV1Alpha3)),
+            (typeof(ResourceSliceV1Alpha3), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(RoleBindingListV1), "items", default, null, typeof(RoleBindingV1)),
+            (typeof(RoleBindingV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(RoleListV1), "items", default, null, typeof(RoleV1)),
+            (typeof(RoleV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(RuntimeClassListV1), "items", default, null, typeof(RuntimeClassV1)),
+            (typeof(RuntimeClassV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ScaleV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(SecretListV1), "items", default, null, typeof(SecretV1)),
+            (typeof(SecretV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(SelfSubjectAccessReviewV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(SelfSubjectReviewV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(SelfSubjectReviewV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(SelfSubjectReviewV1Beta1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(SelfSubjectRulesReviewV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ServiceAccountListV1), "items", default, null, typeof(ServiceAccountV1)),
+            (typeof(ServiceAccountV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ServiceAccountV1), "secrets", PatchStrategies.Merge, "name", null),
+            (typeof(ServiceCIDRListV1Beta1), "items", default, null, typeof(ServiceCIDRV1Beta1)),
+            (typeof(ServiceCIDRStatusV1Beta1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(ServiceCIDRV1Beta1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ServiceCIDRV1Beta1), "status", default, null, typeof(ServiceCIDRStatusV1Beta1)),
+            (typeof(ServiceListV1), "items", default, null, typeof(ServiceV1)),
+            (typeof(ServiceSpecV1), "ports", PatchStrategies.Merge, "port", null),
+            (typeof(ServiceStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(ServiceV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ServiceV1), "spec", default, null, typeof(ServiceSpecV1)),
+            (typeof(ServiceV1), "status", default, null, typeof(ServiceStatusV1)),
+            (typeof(StatefulSetListV1), "items", default, null, typeof(StatefulSetV1)),
+            (typeof(StatefulSetSpecV1), "template", default, null, typeof(PodTemplateSpecV1)),
+            (typeof(StatefulSetSpecV1), "volumeClaimTemplates", default, null, typeof(PersistentVolumeClaimV1)),
+            (typeof(StatefulSetStatusV1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(StatefulSetV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(StatefulSetV1), "spec", default, null, typeof(StatefulSetSpecV1)),
+            (typeof(StatefulSetV1), "status", default, null, typeof(StatefulSetStatusV1)),
+            (typeof(StorageClassListV1), "items", default, null, typeof(StorageClassV1)),
+            (typeof(StorageClassV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(StorageVersionListV1Alpha1), "items", default, null, typeof(StorageVersionV1Alpha1)),
+            (typeof(StorageVersionMigrationListV1Alpha1), "items", PatchStrategies.Merge, "type", typeof(StorageVersionMigrationV1Alpha1)),
+            (typeof(StorageVersionMigrationStatusV1Alpha1), "conditions", PatchStrategies.Merge, "type", null),
+            (typeof(StorageVersionMigrationV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(StorageVersionMigrationV1Alpha1), "status", default, null, typeof(StorageVersionMigrationStatusV1Alpha1)),
+            (typeof(StorageVersionV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(SubjectAccessReviewV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(TokenReviewV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingAdmissionPolicyBindingListV1), "items", default, null, typeof(ValidatingAdmissionPolicyBindingV1)),
+            (typeof(ValidatingAdmissionPolicyBindingListV1Alpha1), "items", default, null, typeof(ValidatingAdmissionPolicyBindingV1Alpha1)),
+            (typeof(ValidatingAdmissionPolicyBindingListV1Beta1), "items", default, null, typeof(ValidatingAdmissionPolicyBindingV1Beta1)),
+            (typeof(ValidatingAdmissionPolicyBindingV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingAdmissionPolicyBindingV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingAdmissionPolicyBindingV1Beta1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingAdmissionPolicyListV1), "items", default, null, typeof(ValidatingAdmissionPolicyV1)),
+            (typeof(ValidatingAdmissionPolicyListV1Alpha1), "items", default, null, typeof(ValidatingAdmissionPolicyV1Alpha1)),
+            (typeof(ValidatingAdmissionPolicyListV1Beta1), "items", default, null, typeof(ValidatingAdmissionPolicyV1Beta1)),
+            (typeof(ValidatingAdmissionPolicySpecV1), "matchConditions", PatchStrategies.Merge, "name", null),
+            (typeof(ValidatingAdmissionPolicySpecV1), "variables", PatchStrategies.Merge, "name", null),
+            (typeof(ValidatingAdmissionPolicySpecV1Alpha1), "matchConditions", PatchStrategies.Merge, "name", null),
+            (typeof(ValidatingAdmissionPolicySpecV1Alpha1), "variables", PatchStrategies.Merge, "name", null),
+            (typeof(ValidatingAdmissionPolicySpecV1Beta1), "matchConditions", PatchStrategies.Merge, "name", null),
+            (typeof(ValidatingAdmissionPolicySpecV1Beta1), "variables", PatchStrategies.Merge, "name", null),
+            (typeof(ValidatingAdmissionPolicyV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingAdmissionPolicyV1), "spec", default, null, typeof(ValidatingAdmissionPolicySpecV1)),
+            (typeof(ValidatingAdmissionPolicyV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingAdmissionPolicyV1Alpha1), "spec", default, null, typeof(ValidatingAdmissionPolicySpecV1Alpha1)),
+            (typeof(ValidatingAdmissionPolicyV1Beta1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingAdmissionPolicyV1Beta1), "spec", default, null, typeof(ValidatingAdmissionPolicySpecV1Beta1)),
+            (typeof(ValidatingWebhookConfigurationListV1), "items", default, null, typeof(ValidatingWebhookConfigurationV1)),
+            (typeof(ValidatingWebhookConfigurationV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(ValidatingWebhookConfigurationV1), "webhooks", PatchStrategies.Merge, "name", typeof(ValidatingWebhookV1)),
+            (typeof(ValidatingWebhookV1), "matchConditions", PatchStrategies.Merge, "name", null),
+            (typeof(VolumeAttachmentListV1), "items", default, null, typeof(VolumeAttachmentV1)),
+            (typeof(VolumeAttachmentV1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(VolumeAttributesClassListV1Alpha1), "items", default, null, typeof(VolumeAttributesClassV1Alpha1)),
+            (typeof(VolumeAttributesClassListV1Beta1), "items", default, null, typeof(VolumeAttributesClassV1Beta1)),
+            (typeof(VolumeAttributesClassV1Alpha1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(VolumeAttributesClassV1Beta1), "metadata", default, null, typeof(ObjectMetaV1)),
+            (typeof(VolumeV1), "ephemeral", default, null, typeof(EphemeralVolumeSourceV1)),
+        };
+    }
+}
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     TopologySpreadConstraint specifies how to spread matching pods among the given topology.
     /// </summary>
-    public partial class TopologySpreadConstraintV1
+    public partial class TopologySpreadConstraintV1 : IKubeKeyedListItem<(string topologyKey, string whenUnsatisfiable)>
     {
         /// <summary>
         ///     WhenUnsatisfiable indicates how to deal with a pod if it doesn't satisfy the spread constraint. - DoNotSchedule (default) tells the scheduler not to schedule it. - ScheduleAnyway tells the scheduler to schedule the pod in any location,
@@ -81,5 +81,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "topologyKey")]
         [JsonProperty("topologyKey", NullValueHandling = NullValueHandling.Include)]
         public string TopologyKey { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("topologyKey", "whenUnsatisfiable").
+        /// </summary>
+        (string topologyKey, string whenUnsatisfiable) IKubeKeyedListItem<(string topologyKey, string whenUnsatisfiable)>.ListKey => (TopologyKey, WhenUnsatisfiable);
     }
 }
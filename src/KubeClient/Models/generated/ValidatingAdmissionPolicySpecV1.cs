@@ -44,7 +44,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "matchConditions")]
         [JsonProperty("matchConditions", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<MatchConditionV1> MatchConditions { get; } = new List<MatchConditionV1>();
+        public KubeKeyedList<string, MatchConditionV1> MatchConditions { get; } = new KubeKeyedList<string, MatchConditionV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="MatchConditions"/> property should be serialised.
@@ -78,7 +78,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "variables")]
         [JsonProperty("variables", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<VariableV1> Variables { get; } = new List<VariableV1>();
+        public KubeKeyedList<string, VariableV1> Variables { get; } = new KubeKeyedList<string, VariableV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Variables"/> property should be serialised.
@@ -26,7 +26,7 @@ namespace KubeClient.Models
         [MergeStrategy(Key = "name")]
         [YamlMember(Alias = "webhooks")]
         [JsonProperty("webhooks", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
-        public List<ValidatingWebhookV1> Webhooks { get; } = new List<ValidatingWebhookV1>();
+        public KubeKeyedList<string, ValidatingWebhookV1> Webhooks { get; } = new KubeKeyedList<string, ValidatingWebhookV1>();
 
         /// <summary>
         ///     Determine whether the <see cref="Webhooks"/> property should be serialised.
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     ValidationRule describes a validation rule written in the CEL expression language.
     /// </summary>
-    public partial class ValidationRuleV1
+    public partial class ValidationRuleV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Message represents the message displayed when validation fails. The message is required if the Rule contains line breaks. The message must not contain line breaks. If unset, the message is "failed rule: {Rule}". e.g. "must be a URL with the host matching spec.host"
@@ -89,5 +89,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "reason")]
         [JsonProperty("reason", NullValueHandling = NullValueHandling.Ignore)]
         public string Reason { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("rule").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Rule;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     Variable is the definition of a variable that is used for composition. A variable is defined as a named expression.
     /// </summary>
-    public partial class VariableV1
+    public partial class VariableV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name is the name of the variable. The name must be a valid CEL identifier and unique among all variables. The variable can be accessed in other expressions through `variables` For example, if name is "foo", the variable will be available as `variables.foo`
@@ -23,5 +23,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "expression")]
         [JsonProperty("expression", NullValueHandling = NullValueHandling.Include)]
         public string Expression { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
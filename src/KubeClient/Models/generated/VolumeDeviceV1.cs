@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     volumeDevice describes a mapping of a raw block device within a container.
     /// </summary>
-    public partial class VolumeDeviceV1
+    public partial class VolumeDeviceV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     name must match the name of a persistentVolumeClaim in the pod
@@ -23,5 +23,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "devicePath")]
         [JsonProperty("devicePath", NullValueHandling = NullValueHandling.Include)]
         public string DevicePath { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("devicePath").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => DevicePath;
     }
 }
@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     VolumeMountStatus shows status of volume mounts.
     /// </summary>
-    public partial class VolumeMountStatusV1
+    public partial class VolumeMountStatusV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     Name corresponds to the name of the original VolumeMount.
@@ -37,5 +37,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "recursiveReadOnly")]
         [JsonProperty("recursiveReadOnly", NullValueHandling = NullValueHandling.Ignore)]
         public string RecursiveReadOnly { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("mountPath").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => MountPath;
     }
 }
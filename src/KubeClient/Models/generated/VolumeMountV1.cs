@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     VolumeMount describes a mounting of a Volume within a container.
     /// </summary>
-    public partial class VolumeMountV1
+    public partial class VolumeMountV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     This must match the Name of a Volume.
@@ -66,5 +66,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "recursiveReadOnly")]
         [JsonProperty("recursiveReadOnly", NullValueHandling = NullValueHandling.Ignore)]
         public string RecursiveReadOnly { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("mountPath").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => MountPath;
     }
 }
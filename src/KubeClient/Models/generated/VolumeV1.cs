@@ -8,7 +8,7 @@ namespace KubeClient.Models
     /// <summary>
     ///     Volume represents a named volume in a pod that may be accessed by any container in the pod.
     /// </summary>
-    public partial class VolumeV1
+    public partial class VolumeV1 : IKubeKeyedListItem<string>
     {
         /// <summary>
         ///     downwardAPI represents downward API about the pod that should populate this volume
@@ -243,5 +243,10 @@ namespace KubeClient.Models
         [YamlMember(Alias = "secret")]
         [JsonProperty("secret", NullValueHandling = NullValueHandling.Ignore)]
         public SecretVolumeSourceV1 Secret { get; set; }
+
+        /// <summary>
+        ///     The key that identifies the item within a keyed list ("name").
+        /// </summary>
+        string IKubeKeyedListItem<string>.ListKey => Name;
     }
 }
@@ -17,6 +17,26 @@ namespace KubeClient
     /// </summary>
     public static class ResourceClientExtensions
     {
+        /// <summary>
+        ///     Get the statistics (reconnects, bookmarks, and expired resource versions) for the watches started by a resource client.
+        /// </summary>
+        /// <param name="resourceClient">
+        ///     The resource client.
+        /// </param>
+        /// <returns>
+        ///     The client's <see cref="KubeWatchStatistics"/>.
+        /// </returns>
+        public static KubeWatchStatistics GetWatchStatistics(this IKubeResourceClient resourceClient)
+        {
+            if (resourceClient == null)
+                throw new ArgumentNullException(nameof(resourceClient));
+
+            if (!(resourceClient is KubeResourceClient kubeResourceClient))
+                throw new NotSupportedException($"Resource client type '{resourceClient.GetType().FullName}' does not record watch statistics (it is not derived from {nameof(KubeResourceClient)}).");
+
+            return kubeResourceClient.WatchStatistics;
+        }
+
         /// <summary>
         ///     Update (PATCH) an existing Deployment.
         /// </summary>
@@ -0,0 +1,778 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Reflection;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace KubeClient.ResourceClients
+{
+    using ApiMetadata;
+    using Http;
+    using Http.Formatters;
+    using Models;
+
+    /// <summary>
+    ///     A client for bulk operations on (heterogeneous) Kubernetes resources.
+    /// </summary>
+    /// <remarks>
+    ///     Operations are executed concurrently (up to <see cref="KubeBulkOptions.MaxConcurrency"/> at a time), in phases ordered by resource kind (see <see cref="KubeBulkOptions.KindPhases"/>).
+    ///
+    ///     Requests that the API server rejects with "429 Too Many Requests" are retried with exponential back-off (or after the delay specified by the server's "Retry-After" header).
+    ///
+    ///     For best throughput, enable <see cref="KubeClientOptions.EnableHttp2"/> so that concurrent requests can share a connection.
+    /// </remarks>
+    public sealed class BulkResourceClient
+        : KubeResourceClient, IBulkResourceClient
+    {
+        /// <summary>
+        ///     The status code returned by the API server when a client should slow down.
+        /// </summary>
+        const int StatusCodeTooManyRequests = 429;
+
+        /// <summary>
+        ///     Settings for serialising request bodies.
+        /// </summary>
+        static readonly JsonSerializerSettings RequestSerializerSettings = SerializerSettings;
+
+        /// <summary>
+        ///     The source of random jitter for retry delays.
+        /// </summary>
+        static readonly Random RetryJitter = new Random();
+
+        /// <summary>
+        ///     A lock used to synchronise loading of API metadata.
+        /// </summary>
+        readonly SemaphoreSlim _apiMetadataLock = new SemaphoreSlim(initialCount: 1, maxCount: 1);
+
+        /// <summary>
+        ///     Create a new <see cref="BulkResourceClient"/>.
+        /// </summary>
+        /// <param name="client">
+        ///     The Kubernetes API client.
+        /// </param>
+        public BulkResourceClient(IKubeApiClient client)
+            : base(client)
+        {
+        }
+
+        /// <summary>
+        ///     Metadata for Kubernetes resource APIs (used to resolve the API path for each resource).
+        /// </summary>
+        public KubeApiMetadataCache ApiMetadata { get; } = new KubeApiMetadataCache();
+
+        /// <summary>
+        ///     Create or update resources using server-side apply operations.
+        /// </summary>
+        /// <param name="resources">
+        ///     The desired state of each resource.
+        /// </param>
+        /// <param name="fieldManager">
+        ///     The name of the field manager to use when performing the server-side apply.
+        /// </param>
+        /// <param name="force">
+        ///     Allow the field manager to take ownership of fields if required?
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each resource (in the same order as <paramref name="resources"/>).
+        /// </returns>
+        public Task<IReadOnlyList<KubeBulkResult>> Apply(IEnumerable<KubeResourceV1> resources, string fieldManager, bool force = false, KubeBulkOptions options = null, CancellationToken cancellationToken = default)
+        {
+            if (resources == null)
+                throw new ArgumentNullException(nameof(resources));
+
+            if (String.IsNullOrWhiteSpace(fieldManager))
+                throw new ArgumentException($"Argument cannot be null, empty, or entirely composed of whitespace: {nameof(fieldManager)}.", nameof(fieldManager));
+
+            return Execute(
+                resources.Select(resource => KubeBulkOperation.Apply(resource, fieldManager, force)),
+                options,
+                cancellationToken
+            );
+        }
+
+        /// <summary>
+        ///     Delete resources.
+        /// </summary>
+        /// <param name="resources">
+        ///     The resources to delete (only their kind, API version, name, and namespace are used).
+        /// </param>
+        /// <param name="propagationPolicy">
+        ///     An optional <see cref="DeletePropagationPolicy"/> indicating how child resources should be deleted (if at all).
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each resource (in the same order as <paramref name="resources"/>).
+        /// </returns>
+        public Task<IReadOnlyList<KubeBulkResult>> Delete(IEnumerable<KubeResourceV1> resources, DeletePropagationPolicy? propagationPolicy = null, KubeBulkOptions options = null, CancellationToken cancellationToken = default)
+        {
+            if (resources == null)
+                throw new ArgumentNullException(nameof(resources));
+
+            return Execute(
+                resources.Select(resource => KubeBulkOperation.Delete(resource, propagationPolicy)),
+                options,
+                cancellationToken
+            );
+        }
+
+        /// <summary>
+        ///     Execute a stream of operations.
+        /// </summary>
+        /// <param name="operations">
+        ///     The operations to execute.
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each operation (in the same order as <paramref name="operations"/>).
+        /// </returns>
+        /// <remarks>
+        ///     Since operations are ordered by kind, the stream is read to completion before any operations are executed.
+        /// </remarks>
+        public async Task<IReadOnlyList<KubeBulkResult>> Execute(IAsyncEnumerable<KubeBulkOperation> operations, KubeBulkOptions options = null, CancellationToken cancellationToken = default)
+        {
+            if (operations == null)
+                throw new ArgumentNullException(nameof(operations));
+
+            var bufferedOperations = new List<KubeBulkOperation>();
+            await foreach (KubeBulkOperation operation in operations.WithCancellation(cancellationToken))
+                bufferedOperations.Add(operation);
+
+            return await Execute(bufferedOperations, options, cancellationToken);
+        }
+
+        /// <summary>
+        ///     Execute operations.
+        /// </summary>
+        /// <param name="operations">
+        ///     The operations to execute.
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each operation (in the same order as <paramref name="operations"/>).
+        /// </returns>
+        /// <remarks>
+        ///     Operations that create, update, patch, or apply resources are executed first (in the order specified by <see cref="KubeBulkOptions.KindPhases"/>), followed by operations that delete resources (in the reverse order).
+        ///
+        ///     A failed operation does not cause an exception to be thrown; check <see cref="KubeBulkResult.IsSuccess"/> and <see cref="KubeBulkResult.Error"/> for each result.
+        /// </remarks>
+        public async Task<IReadOnlyList<KubeBulkResult>> Execute(IEnumerable<KubeBulkOperation> operations, KubeBulkOptions options = null, CancellationToken cancellationToken = default)
+        {
+            if (operations == null)
+                throw new ArgumentNullException(nameof(operations));
+
+            options = (options ?? new KubeBulkOptions()).EnsureValid();
+
+            KubeBulkOperation[] operationArray = operations.ToArray();
+            if (Array.IndexOf(operationArray, null) != -1)
+                throw new ArgumentException("Operations cannot contain null.", nameof(operations));
+
+            var results = new KubeBulkResult[operationArray.Length];
+            if (operationArray.Length == 0)
+                return results;
+
+            await EnsureApiMetadata(cancellationToken).ConfigureAwait(false);
+
+            var execution = new BulkExecution(operationArray, results, options);
+
+            bool phaseFailed = false;
+            foreach (int[] phase in GetPhases(operationArray, options.KindPhases))
+            {
+                if (phaseFailed && !options.ContinueOnError)
+                {
+                    foreach (int operationIndex in phase)
+                        results[operationIndex] = new KubeBulkResult(operationArray[operationIndex], resource: null, status: null, error: null, attempts: 0);
+
+                    continue;
+                }
+
+                await ExecutePhase(execution, phase, cancellationToken).ConfigureAwait(false);
+
+                phaseFailed |= phase.Any(operationIndex => !results[operationIndex].IsSuccess);
+            }
+
+            return results;
+        }
+
+        /// <summary>
+        ///     Group operations into phases.
+        /// </summary>
+        /// <param name="operations">
+        ///     The operations.
+        /// </param>
+        /// <param name="kindPhases">
+        ///     The phases in which resources are created or updated, by kind.
+        /// </param>
+        /// <returns>
+        ///     The indexes of the operations in each phase (in execution order).
+        /// </returns>
+        static IEnumerable<int[]> GetPhases(KubeBulkOperation[] operations, IReadOnlyList<IReadOnlyCollection<string>> kindPhases)
+        {
+            int lastPhase = kindPhases.Count;
+
+            return Enumerable.Range(0, operations.Length)
+                .GroupBy(operationIndex =>
+                {
+                    KubeBulkOperation operation = operations[operationIndex];
+
+                    int phase = lastPhase;
+                    for (int kindPhase = 0; kindPhase < kindPhases.Count; kindPhase++)
+                    {
+                        if (kindPhases[kindPhase].Contains(operation.Resource.Kind))
+                        {
+                            phase = kindPhase;
+
+                            break;
+                        }
+                    }
+
+                    // Deletions happen after everything else, in reverse order.
+                    if (operation.Action == KubeBulkAction.Delete)
+                        phase = (lastPhase + 1) + (lastPhase - phase);
+
+                    return phase;
+                })
+                .OrderBy(phase => phase.Key)
+                .Select(phase => phase.ToArray());
+        }
+
+        /// <summary>
+        ///     Execute the operations in a phase, with bounded concurrency.
+        /// </summary>
+        /// <param name="execution">
+        ///     The current execution.
+        /// </param>
+        /// <param name="phase">
+        ///     The indexes of the operations in the phase.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="Task"/> representing the asynchronous operation.
+        /// </returns>
+        async Task ExecutePhase(BulkExecution execution, int[] phase, CancellationToken cancellationToken)
+        {
+            execution.Phase++;
+
+            int nextOperation = -1;
+
+            // A fixed number of workers, each taking the next operation as soon as its previous one completes.
+            Task[] workers = new Task[Math.Min(execution.Options.MaxConcurrency, phase.Length)];
+            for (int workerIndex = 0; workerIndex < workers.Length; workerIndex++)
+            {
+                workers[workerIndex] = Task.Run(async () =>
+                {
+                    int phaseIndex;
+                    while ((phaseIndex = Interlocked.Increment(ref nextOperation)) < phase.Length)
+                    {
+                        int operationIndex = phase[phaseIndex];
+
+                        execution.Results[operationIndex] = await ExecuteOperation(execution, execution.Operations[operationIndex], cancellationToken).ConfigureAwait(false);
+                    }
+                }, cancellationToken);
+            }
+
+            await Task.WhenAll(workers).ConfigureAwait(false);
+        }
+
+        /// <summary>
+        ///     Execute a single operation (retrying if the API server asks the client to slow down).
+        /// </summary>
+        /// <param name="execution">
+        ///     The current execution.
+        /// </param>
+        /// <param name="operation">
+        ///     The operation to execute.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to cancel the operation.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="KubeBulkResult"/>.
+        /// </returns>
+        async Task<KubeBulkResult> ExecuteOperation(BulkExecution execution, KubeBulkOperation operation, CancellationToken cancellationToken)
+        {
+            KubeResourceV1 resource = operation.Resource;
+
+            HttpMethod method;
+            string requestPath;
+            string requestBody;
+            string requestMediaType;
+
+            int attempts = 0;
+            try
+            {
+                string collectionPath = await GetCollectionPath(execution, resource, cancellationToken).ConfigureAwait(false);
+                string resourcePath = operation.Action != KubeBulkAction.Create ? $"{collectionPath}/{Uri.EscapeDataString(resource.Metadata.Name)}" : null;
+
+                switch (operation.Action)
+                {
+                    case KubeBulkAction.Create:
+                    {
+                        method = HttpMethod.Post;
+                        requestPath = collectionPath;
+                        requestBody = JsonConvert.SerializeObject(resource, RequestSerializerSettings);
+                        requestMediaType = WellKnownMediaTypes.Json;
+
+                        break;
+                    }
+                    case KubeBulkAction.Update:
+                    {
+                        method = HttpMethod.Put;
+                        requestPath = resourcePath;
+                        requestBody = JsonConvert.SerializeObject(resource, RequestSerializerSettings);
+                        requestMediaType = WellKnownMediaTypes.Json;
+
+                        break;
+                    }
+                    case KubeBulkAction.Patch:
+                    {
+                        method = OtherHttpMethods.Patch;
+                        requestPath = resourcePath;
+                        if (operation.PatchBody != null)
+                        {
+                            requestBody = operation.PatchBody.ToString(Formatting.None);
+                            requestMediaType = StrategicMergePatchMediaType;
+                        }
+                        else
+                        {
+                            requestBody = JsonConvert.SerializeObject(resource, RequestSerializerSettings);
+                            requestMediaType = MergePatchMediaType;
+                        }
+
+                        break;
+                    }
+                    case KubeBulkAction.Apply:
+                    {
+                        method = OtherHttpMethods.Patch;
+                        requestPath = $"{resourcePath}?fieldManager={Uri.EscapeDataString(operation.FieldManager)}";
+                        if (operation.Force)
+                            requestPath += "&force=true";
+
+                        // JSON is also valid YAML.
+                        requestBody = JsonConvert.SerializeObject(resource, RequestSerializerSettings);
+                        requestMediaType = ApplyPatchYamlMediaType;
+
+                        break;
+                    }
+                    case KubeBulkAction.Delete:
+                    {
+                        method = HttpMethod.Delete;
+                        requestPath = resourcePath;
+                        requestBody = JsonConvert.SerializeObject(new DeleteOptionsV1
+                        {
+                            PropagationPolicy = operation.PropagationPolicy
+                        }, RequestSerializerSettings);
+                        requestMediaType = WellKnownMediaTypes.Json;
+
+                        break;
+                    }
+                    default:
+                    {
+                        throw new KubeClientException($"Unsupported bulk action '{operation.Action}'.");
+                    }
+                }
+
+                HttpRequest request = CreateRequest(requestPath);
+
+                while (true)
+                {
+                    attempts++;
+
+                    TimeSpan retryDelay;
+                    using (StringContent content = new StringContent(requestBody, Encoding.UTF8, requestMediaType))
+                    using (HttpResponseMessage responseMessage = await Http.SendAsync(request, method, content, cancellationToken).ConfigureAwait(false))
+                    {
+                        if ((int)responseMessage.StatusCode != StatusCodeTooManyRequests || attempts > execution.Options.MaxRetries)
+                            return await ReadResult(operation, responseMessage, attempts).ConfigureAwait(false);
+
+                        retryDelay = GetRetryDelay(responseMessage, attempts, execution.Options);
+                    }
+
+                    await Task.Delay(retryDelay, cancellationToken).ConfigureAwait(false);
+                }
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
+            catch (Exception operationError)
+            {
+                return new KubeBulkResult(operation, resource: null, status: null, error: operationError, attempts: attempts);
+            }
+        }
+
+        /// <summary>
+        ///     Read the result of an operation from the API server's response.
+        /// </summary>
+        /// <param name="operation">
+        ///     The operation.
+        /// </param>
+        /// <param name="responseMessage">
+        ///     The response message.
+        /// </param>
+        /// <param name="attempts">
+        ///     The number of requests made for the operation.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="KubeBulkResult"/>.
+        /// </returns>
+        static async Task<KubeBulkResult> ReadResult(KubeBulkOperation operation, HttpResponseMessage responseMessage, int attempts)
+        {
+            Type modelType = operation.Resource.GetType();
+
+            if (responseMessage.IsSuccessStatusCode)
+            {
+                JsonSerializer serializer = responseMessage.GetJsonSerializer();
+
+                using (Stream responseStream = await responseMessage.Content.ReadAsStreamAsync().ConfigureAwait(false))
+                using (TextReader responseReader = new StreamReader(responseStream))
+                using (JsonTextReader responseJsonReader = new JsonTextReader(responseReader))
+                {
+                    if (operation.Action != KubeBulkAction.Delete)
+                    {
+                        var resource = (KubeResourceV1)serializer.Deserialize(responseJsonReader, modelType);
+
+                        return new KubeBulkResult(operation, resource, status: null, error: null, attempts);
+                    }
+
+                    // Depending on the propagation policy, a deletion returns either the resource or a Status.
+                    JObject responseJson = JObject.Load(responseJsonReader);
+                    if (responseJson.Value<string>("kind") == "Status")
+                    {
+                        StatusV1 deleteStatus = serializer.Deserialize<StatusV1>(responseJson.CreateReader());
+
+                        return new KubeBulkResult(operation, resource: null, deleteStatus, error: null, attempts);
+                    }
+
+                    var deletedResource = (KubeResourceV1)serializer.Deserialize(responseJson.CreateReader(), modelType);
+
+                    return new KubeBulkResult(operation, deletedResource, status: null, error: null, attempts);
+                }
+            }
+
+            StatusV1 status = await responseMessage.ReadContentAsStatusV1Async(responseMessage.StatusCode).ConfigureAwait(false);
+
+            // The resource has already been deleted.
+            if (operation.Action == KubeBulkAction.Delete && responseMessage.StatusCode == HttpStatusCode.NotFound)
+                return new KubeBulkResult(operation, resource: null, status, error: null, attempts);
+
+            var operationError = new KubeApiException($"Unable to {operation}.",
+                HttpRequestException<StatusV1>.Create(responseMessage.StatusCode, status)
+            );
+
+            return new KubeBulkResult(operation, resource: null, status, operationError, attempts);
+        }
+
+        /// <summary>
+        ///     Determine how long to wait before retrying a request that the API server rejected with "429 Too Many Requests".
+        /// </summary>
+        /// <param name="responseMessage">
+        ///     The response message.
+        /// </param>
+        /// <param name="attempts">
+        ///     The number of requests made so far.
+        /// </param>
+        /// <param name="options">
+        ///     The <see cref="KubeBulkOptions"/>.
+        /// </param>
+        /// <returns>
+        ///     The retry delay.
+        /// </returns>
+        static TimeSpan GetRetryDelay(HttpResponseMessage responseMessage, int attempts, KubeBulkOptions options)
+        {
+            TimeSpan? retryAfter = responseMessage.Headers.RetryAfter?.Delta;
+            if (retryAfter == null && responseMessage.Headers.RetryAfter?.Date is DateTimeOffset retryAt)
+                retryAfter = retryAt - DateTimeOffset.UtcNow;
+
+            TimeSpan retryDelay;
+            if (retryAfter > TimeSpan.Zero)
+                retryDelay = retryAfter.Value;
+            else
+            {
+                double jitter;
+                lock (RetryJitter)
+                {
+                    jitter = RetryJitter.NextDouble();
+                }
+
+                // Exponential back-off, with jitter (between 50% and 100% of the delay) so that throttled requests don't all retry at once.
+                double backoffMilliseconds = options.InitialRetryDelay.TotalMilliseconds * Math.Pow(2, Math.Min(attempts - 1, 30));
+                retryDelay = TimeSpan.FromMilliseconds(
+                    Math.Min(backoffMilliseconds, options.MaxRetryDelay.TotalMilliseconds) * (0.5 + jitter / 2)
+                );
+            }
+
+            return retryDelay < options.MaxRetryDelay ? retryDelay : options.MaxRetryDelay;
+        }
+
+        /// <summary>
+        ///     Get the path of the API for the collection that contains the specified resource.
+        /// </summary>
+        /// <param name="execution">
+        ///     The current execution.
+        /// </param>
+        /// <param name="resource">
+        ///     The resource.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to cancel the operation.
+        /// </param>
+        /// <returns>
+        ///     The collection path (without the resource name).
+        /// </returns>
+        /// <remarks>
+        ///     If the resource's kind is not known (e.g. because it is a custom resource whose definition was created in an earlier phase), metadata is loaded from the API server (at most once per phase).
+        /// </remarks>
+        async Task<string> GetCollectionPath(BulkExecution execution, KubeResourceV1 resource, CancellationToken cancellationToken)
+        {
+            string kind = resource.Kind;
+            string apiVersion = resource.ApiVersion;
+            if (String.IsNullOrWhiteSpace(kind) || String.IsNullOrWhiteSpace(apiVersion))
+                (kind, apiVersion) = KubeObjectV1.GetKubeKind(resource.GetType());
+
+            if (String.IsNullOrWhiteSpace(kind) || String.IsNullOrWhiteSpace(apiVersion))
+                throw new KubeClientException($"Cannot determine the kind and API version of resource '{resource.Metadata?.Name}' (model type '{resource.GetType().FullName}').");
+
+            KubeApiMetadata apiMetadata = ApiMetadata.Get(kind, apiVersion);
+            if (apiMetadata == null)
+            {
+                await _apiMetadataLock.WaitAsync(cancellationToken).ConfigureAwait(false);
+                try
+                {
+                    apiMetadata = ApiMetadata.Get(kind, apiVersion);
+                    if (apiMetadata == null && execution.MetadataLoadedPhase != execution.Phase)
+                    {
+                        execution.MetadataLoadedPhase = execution.Phase;
+
+                        await ApiMetadata.Load(KubeClient, cancellationToken: cancellationToken).ConfigureAwait(false);
+                        apiMetadata = ApiMetadata.Get(kind, apiVersion);
+                    }
+                }
+                finally
+                {
+                    _apiMetadataLock.Release();
+                }
+            }
+
+            if (apiMetadata == null)
+                throw new KubeClientException($"Cannot find resource API for kind '{kind}', apiVersion '{apiVersion}'.");
+
+            KubeApiPathMetadata namespacedPathMetadata = apiMetadata.PrimaryNamespacedPathMetadata;
+            if (namespacedPathMetadata != null)
+            {
+                string kubeNamespace = resource.Metadata?.Namespace;
+                if (String.IsNullOrWhiteSpace(kubeNamespace))
+                    kubeNamespace = KubeClient.DefaultNamespace;
+
+                return namespacedPathMetadata.Path.Replace("{namespace}", Uri.EscapeDataString(kubeNamespace));
+            }
+
+            KubeApiPathMetadata pathMetadata = apiMetadata.PrimaryPathMetadata;
+            if (pathMetadata == null)
+                throw new KubeClientException($"Cannot find resource API path for kind '{kind}', apiVersion '{apiVersion}'.");
+
+            return pathMetadata.Path;
+        }
+
+        /// <summary>
+        ///     Ensure that API metadata has been loaded for the built-in models (and any additional model assemblies).
+        /// </summary>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to cancel the operation.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="Task"/> representing the asynchronous operation.
+        /// </returns>
+        async Task EnsureApiMetadata(CancellationToken cancellationToken)
+        {
+            if (!ApiMetadata.IsEmpty)
+                return;
+
+            await _apiMetadataLock.WaitAsync(cancellationToken).ConfigureAwait(false);
+            try
+            {
+                if (!ApiMetadata.IsEmpty)
+                    return;
+
+                ApiMetadata.LoadFromMetadata(
+                    typeof(KubeObjectV1).GetTypeInfo().Assembly
+                );
+
+                foreach (Assembly modelTypeAssembly in KubeClient.GetClientOptions().ModelTypeAssemblies)
+                    ApiMetadata.LoadFromMetadata(modelTypeAssembly);
+            }
+            finally
+            {
+                _apiMetadataLock.Release();
+            }
+        }
+
+        /// <summary>
+        ///     State for a single execution of bulk operations.
+        /// </summary>
+        sealed class BulkExecution
+        {
+            /// <summary>
+            ///     Create new <see cref="BulkExecution"/> state.
+            /// </summary>
+            /// <param name="operations">
+            ///     The operations to execute.
+            /// </param>
+            /// <param name="results">
+            ///     The array that receives the result of each operation.
+            /// </param>
+            /// <param name="options">
+            ///     The <see cref="KubeBulkOptions"/>.
+            /// </param>
+            public BulkExecution(KubeBulkOperation[] operations, KubeBulkResult[] results, KubeBulkOptions options)
+            {
+                Operations = operations;
+                Results = results;
+                Options = options;
+            }
+
+            /// <summary>
+            ///     The operations to execute.
+            /// </summary>
+            public KubeBulkOperation[] Operations { get; }
+
+            /// <summary>
+            ///     The array that receives the result of each operation.
+            /// </summary>
+            public KubeBulkResult[] Results { get; }
+
+            /// <summary>
+            ///     The <see cref="KubeBulkOptions"/>.
+            /// </summary>
+            public KubeBulkOptions Options { get; }
+
+            /// <summary>
+            ///     The number of the phase currently being executed.
+            /// </summary>
+            public int Phase { get; set; }
+
+            /// <summary>
+            ///     The number of the phase in which API metadata was last loaded from the API server (or 0, if it has not been loaded).
+            /// </summary>
+            public int MetadataLoadedPhase { get; set; }
+        }
+    }
+
+    /// <summary>
+    ///     Represents a client for bulk operations on (heterogeneous) Kubernetes resources.
+    /// </summary>
+    public interface IBulkResourceClient
+        : IKubeResourceClient
+    {
+        /// <summary>
+        ///     Metadata for Kubernetes resource APIs (used to resolve the API path for each resource).
+        /// </summary>
+        KubeApiMetadataCache ApiMetadata { get; }
+
+        /// <summary>
+        ///     Create or update resources using server-side apply operations.
+        /// </summary>
+        /// <param name="resources">
+        ///     The desired state of each resource.
+        /// </param>
+        /// <param name="fieldManager">
+        ///     The name of the field manager to use when performing the server-side apply.
+        /// </param>
+        /// <param name="force">
+        ///     Allow the field manager to take ownership of fields if required?
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each resource (in the same order as <paramref name="resources"/>).
+        /// </returns>
+        Task<IReadOnlyList<KubeBulkResult>> Apply(IEnumerable<KubeResourceV1> resources, string fieldManager, bool force = false, KubeBulkOptions options = null, CancellationToken cancellationToken = default);
+
+        /// <summary>
+        ///     Delete resources.
+        /// </summary>
+        /// <param name="resources">
+        ///     The resources to delete (only their kind, API version, name, and namespace are used).
+        /// </param>
+        /// <param name="propagationPolicy">
+        ///     An optional <see cref="DeletePropagationPolicy"/> indicating how child resources should be deleted (if at all).
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each resource (in the same order as <paramref name="resources"/>).
+        /// </returns>
+        Task<IReadOnlyList<KubeBulkResult>> Delete(IEnumerable<KubeResourceV1> resources, DeletePropagationPolicy? propagationPolicy = null, KubeBulkOptions options = null, CancellationToken cancellationToken = default);
+
+        /// <summary>
+        ///     Execute a stream of operations.
+        /// </summary>
+        /// <param name="operations">
+        ///     The operations to execute.
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each operation (in the same order as <paramref name="operations"/>).
+        /// </returns>
+        Task<IReadOnlyList<KubeBulkResult>> Execute(IAsyncEnumerable<KubeBulkOperation> operations, KubeBulkOptions options = null, CancellationToken cancellationToken = default);
+
+        /// <summary>
+        ///     Execute operations.
+        /// </summary>
+        /// <param name="operations">
+        ///     The operations to execute.
+        /// </param>
+        /// <param name="options">
+        ///     Optional <see cref="KubeBulkOptions"/> that control how the operations are executed.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the operations.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeBulkResult"/> for each operation (in the same order as <paramref name="operations"/>).
+        /// </returns>
+        Task<IReadOnlyList<KubeBulkResult>> Execute(IEnumerable<KubeBulkOperation> operations, KubeBulkOptions options = null, CancellationToken cancellationToken = default);
+    }
+}
@@ -47,11 +47,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
             return await GetSingleResource<ConfigMapV1>(
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name,
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace
-                }),
+                CreateRequest(KubeResourcePaths.ConfigMapsV1.ByName(name, kubeNamespace ?? KubeClient.DefaultNamespace)),
                 cancellationToken: cancellationToken
             );
         }
@@ -74,11 +70,7 @@ namespace KubeClient.ResourceClients
         public async Task<ConfigMapListV1> List(string labelSelector = null, string kubeNamespace = null, CancellationToken cancellationToken = default)
         {
             return await GetResourceList<ConfigMapListV1>(
-                Requests.Collection.WithTemplateParameters(new
-                {
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace,
-                    LabelSelector = labelSelector
-                }),
+                CreateRequest(KubeResourcePaths.ConfigMapsV1.Collection(kubeNamespace ?? KubeClient.DefaultNamespace, labelSelector)),
                 cancellationToken: cancellationToken
             );
         }
@@ -119,10 +111,16 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        public IObservable<IResourceEventV1<ConfigMapV1>> WatchAll(string labelSelector = null, string kubeNamespace = null)
+        public IObservable<IResourceEventV1<ConfigMapV1>> WatchAll(string labelSelector = null, string kubeNamespace = null, string resourceVersion = null, bool includeBookmarks = false)
         {
             return ObserveEvents<ConfigMapV1>(
                 Requests.Collection.WithTemplateParameters(new
@@ -131,7 +129,9 @@ namespace KubeClient.ResourceClients
                     LabelSelector = labelSelector,
                     Watch = true
                 }),
-                operationDescription: $"watch all v1/ConfigMaps with label selector '{labelSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}"
+                operationDescription: $"watch all v1/ConfigMaps with label selector '{labelSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}",
+                resourceVersion: resourceVersion,
+                includeBookmarks: includeBookmarks
             );
         }
 
@@ -193,11 +193,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentNullException(nameof(patchAction));
 
             return await PatchResource(patchAction,
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name,
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace
-                }),
+                CreateRequest(KubeResourcePaths.ConfigMapsV1.ByName(name, kubeNamespace ?? KubeClient.DefaultNamespace)),
                 cancellationToken
             );
         }
@@ -316,10 +312,16 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        IObservable<IResourceEventV1<ConfigMapV1>> WatchAll(string labelSelector = null, string kubeNamespace = null);
+        IObservable<IResourceEventV1<ConfigMapV1>> WatchAll(string labelSelector = null, string kubeNamespace = null, string resourceVersion = null, bool includeBookmarks = false);
 
         /// <summary>
         ///     Request creation of a <see cref="ConfigMapV1"/>.
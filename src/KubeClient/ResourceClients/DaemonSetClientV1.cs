@@ -46,11 +46,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
             return await GetSingleResource<DaemonSetV1>(
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name,
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace
-                }),
+                CreateRequest(KubeResourcePaths.DaemonSetsV1.ByName(name, kubeNamespace ?? KubeClient.DefaultNamespace)),
                 cancellationToken: cancellationToken
             );
         }
@@ -73,11 +69,7 @@ namespace KubeClient.ResourceClients
         public async Task<DaemonSetListV1> List(string labelSelector = null, string kubeNamespace = null, CancellationToken cancellationToken = default)
         {
             return await GetResourceList<DaemonSetListV1>(
-                Requests.Collection.WithTemplateParameters(new
-                {
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace,
-                    LabelSelector = labelSelector
-                }),
+                CreateRequest(KubeResourcePaths.DaemonSetsV1.Collection(kubeNamespace ?? KubeClient.DefaultNamespace, labelSelector)),
                 cancellationToken: cancellationToken
             );
         }
@@ -91,10 +83,16 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        public IObservable<IResourceEventV1<DaemonSetV1>> WatchAll(string labelSelector = null, string kubeNamespace = null)
+        public IObservable<IResourceEventV1<DaemonSetV1>> WatchAll(string labelSelector = null, string kubeNamespace = null, string resourceVersion = null, bool includeBookmarks = false)
         {
             return ObserveEvents<DaemonSetV1>(
                 Requests.Collection.WithTemplateParameters(new
@@ -103,7 +101,9 @@ namespace KubeClient.ResourceClients
                     LabelSelector = labelSelector,
                     Watch = true
                 }),
-                operationDescription: $"watch all v1/DaemonSets with label selector '{labelSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}"
+                operationDescription: $"watch all v1/DaemonSets with label selector '{labelSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}",
+                resourceVersion: resourceVersion,
+                includeBookmarks: includeBookmarks
             );
         }
 
@@ -163,11 +163,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentNullException(nameof(patchAction));
 
             return await PatchResource(patchAction,
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name,
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace
-                }),
+                CreateRequest(KubeResourcePaths.DaemonSetsV1.ByName(name, kubeNamespace ?? KubeClient.DefaultNamespace)),
                 cancellationToken
             );
         }
@@ -261,10 +257,16 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        IObservable<IResourceEventV1<DaemonSetV1>> WatchAll(string labelSelector = null, string kubeNamespace = null);
+        IObservable<IResourceEventV1<DaemonSetV1>> WatchAll(string labelSelector = null, string kubeNamespace = null, string resourceVersion = null, bool includeBookmarks = false);
 
         /// <summary>
         ///     Request creation of a <see cref="DaemonSetV1"/>.
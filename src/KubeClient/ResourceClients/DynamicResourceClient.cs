@@ -1,11 +1,14 @@
 using Microsoft.AspNetCore.JsonPatch;
 using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
 using System;
 using System.Collections.Generic;
 using System.IO;
 using System.Net;
 using System.Net.Http;
+using System.Reactive.Linq;
 using System.Reflection;
+using System.Runtime.CompilerServices;
 using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
@@ -193,6 +196,201 @@ namespace KubeClient.ResourceClients
             }
         }
 
+        /// <summary>
+        ///     Enumerate resources, retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while resources from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each resource as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        public IAsyncEnumerable<KubeResourceV1> ListPaged(string kind, string apiVersion, string kubeNamespace = null, int pageSize = DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default)
+        {
+            if (String.IsNullOrWhiteSpace(kind))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'kind'.", nameof(kind));
+
+            if (String.IsNullOrWhiteSpace(apiVersion))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'apiVersion'.", nameof(apiVersion));
+
+            return EnumerateResources<KubeResourceV1>(kind, apiVersion, GetModelType(kind, apiVersion), kubeNamespace, pageSize, prefetchNextPage, metadataOnly: false, cancellationToken);
+        }
+
+        /// <summary>
+        ///     Enumerate resources of the specified type, retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource to enumerate.
+        /// </typeparam>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while resources from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each resource as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        public IAsyncEnumerable<TResource> ListPaged<TResource>(string kubeNamespace = null, int pageSize = DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default)
+            where TResource : KubeResourceV1
+        {
+            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind<TResource>();
+            if (String.IsNullOrWhiteSpace(kind))
+                throw new KubeClientException($"Cannot determine the resource kind that corresponds to model type '{typeof(TResource).FullName}'.");
+
+            return EnumerateResources<TResource>(kind, apiVersion, typeof(TResource), kubeNamespace, pageSize, prefetchNextPage, metadataOnly: false, cancellationToken);
+        }
+
+        /// <summary>
+        ///     List the metadata (only) for resources.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel the operation.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="PartialObjectMetadataListV1"/> containing the metadata for each resource.
+        /// </returns>
+        /// <remarks>
+        ///     Useful when only resource metadata (e.g. labels, owner references, or resource versions) is required, since the API server does not send the rest of each resource.
+        /// </remarks>
+        public async Task<PartialObjectMetadataListV1> ListMetadata(string kind, string apiVersion, string kubeNamespace = null, CancellationToken cancellationToken = default)
+        {
+            if (String.IsNullOrWhiteSpace(kind))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'kind'.", nameof(kind));
+
+            if (String.IsNullOrWhiteSpace(apiVersion))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'apiVersion'.", nameof(apiVersion));
+
+            bool isNamespaced = !String.IsNullOrWhiteSpace(kubeNamespace);
+
+            await EnsureApiMetadata(cancellationToken);
+            string apiPath = GetApiPath(kind, apiVersion, isNamespaced);
+
+            HttpRequest request = AcceptPartialObjectMetadata(
+                KubeRequest.Create(apiPath).WithTemplateParameter("namespace", kubeNamespace),
+                isList: true
+            );
+
+            using (HttpResponseMessage responseMessage = await Http.GetAsync(request, cancellationToken).ConfigureAwait(false))
+            {
+                if (responseMessage.IsSuccessStatusCode)
+                    return await responseMessage.ReadContentAsAsync<PartialObjectMetadataListV1>().ConfigureAwait(false);
+
+                StatusV1 status = await responseMessage.ReadContentAsStatusV1Async(HttpStatusCode.NotFound).ConfigureAwait(false);
+
+                throw new KubeClientException($"Unable to list metadata for {apiVersion}/{kind} resources (HTTP status {responseMessage.StatusCode}).",
+                    innerException: new HttpRequestException<StatusV1>(responseMessage.StatusCode, status)
+                );
+            }
+        }
+
+        /// <summary>
+        ///     Enumerate the metadata (only) for resources, retrieving it in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while resources from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields the metadata for each resource as soon as it has been received.
+        /// </returns>
+        public IAsyncEnumerable<PartialObjectMetadataV1> ListMetadataPaged(string kind, string apiVersion, string kubeNamespace = null, int pageSize = DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default)
+        {
+            if (String.IsNullOrWhiteSpace(kind))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'kind'.", nameof(kind));
+
+            if (String.IsNullOrWhiteSpace(apiVersion))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'apiVersion'.", nameof(apiVersion));
+
+            return EnumerateResources<PartialObjectMetadataV1>(kind, apiVersion, typeof(PartialObjectMetadataV1), kubeNamespace, pageSize, prefetchNextPage, metadataOnly: true, cancellationToken);
+        }
+
+        /// <summary>
+        ///     Watch for events relating to resources, receiving only their metadata.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IObservable{T}"/> representing the event stream (each event's resource is a <see cref="PartialObjectMetadataV1"/>).
+        /// </returns>
+        public IObservable<IResourceEventV1<PartialObjectMetadataV1>> WatchMetadata(string kind, string apiVersion, string kubeNamespace = null)
+        {
+            if (String.IsNullOrWhiteSpace(kind))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'kind'.", nameof(kind));
+
+            if (String.IsNullOrWhiteSpace(apiVersion))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'apiVersion'.", nameof(apiVersion));
+
+            bool isNamespaced = !String.IsNullOrWhiteSpace(kubeNamespace);
+
+            return Observable.FromAsync(cancellationToken => EnsureApiMetadata(cancellationToken)).SelectMany(_ =>
+            {
+                string apiPath = GetApiPath(kind, apiVersion, isNamespaced);
+
+                HttpRequest request = AcceptPartialObjectMetadata(
+                    KubeRequest.Create(apiPath)
+                        .WithTemplateParameter("namespace", kubeNamespace)
+                        .WithQueryParameter("watch", true),
+                    isList: false
+                );
+
+                return ObserveEvents<PartialObjectMetadataV1>(request,
+                    operationDescription: isNamespaced ? $"watch metadata for {apiVersion}/{kind} resources in namespace {kubeNamespace}" : $"watch metadata for {apiVersion}/{kind} resources"
+                );
+            });
+        }
+
         /// <summary>
         ///     Perform a JSON patch operation on a Kubernetes resource.
         /// </summary>
@@ -231,50 +429,95 @@ namespace KubeClient.ResourceClients
             if (patch == null)
                 throw new ArgumentNullException(nameof(patch));
 
-            bool isNamespaced = !String.IsNullOrWhiteSpace(kubeNamespace);
+            return await SendPatch(name, kind, apiVersion, patch, PatchMediaType, kubeNamespace, cancellationToken);
+        }
 
-            await EnsureApiMetadata(cancellationToken);
-            string apiPath = GetApiPath(kind, apiVersion, isNamespaced);
+        /// <summary>
+        ///     Perform a strategic-merge patch operation on a Kubernetes resource.
+        /// </summary>
+        /// <param name="name">
+        ///     The resource name.
+        /// </param>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="patch">
+        ///     A <see cref="JObject"/> representing the strategic-merge patch to apply.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the request.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeResourceV1"/> representing the updated resource.
+        /// </returns>
+        public async Task<KubeResourceV1> PatchStrategic(string name, string kind, string apiVersion, JObject patch, string kubeNamespace = null, CancellationToken cancellationToken = default)
+        {
+            if (String.IsNullOrWhiteSpace(name))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
-            Type modelType = GetModelType(kind, apiVersion);
+            if (String.IsNullOrWhiteSpace(kind))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'kind'.", nameof(kind));
 
-            HttpRequest request = KubeRequest.Create(apiPath).WithRelativeUri("{name}")
-                .WithTemplateParameters(new
-                {
-                    name = name,
-                    @namespace = kubeNamespace
-                });
+            if (String.IsNullOrWhiteSpace(apiVersion))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'apiVersion'.", nameof(apiVersion));
 
-            using (HttpResponseMessage responseMessage = await Http.PatchAsync(request, patchBody: patch, mediaType: PatchMediaType, cancellationToken: cancellationToken).ConfigureAwait(false))
-            {
-                if (responseMessage.IsSuccessStatusCode)
-                {
-                    // Code is slightly ugly for types only known at runtime; see if KubeClient.Http could be improved here.
-                    using (Stream responseStream = await responseMessage.Content.ReadAsStreamAsync().ConfigureAwait(false))
-                    using (TextReader responseReader = new StreamReader(responseStream))
-                    {
-                        JsonSerializer serializer = responseMessage.GetJsonSerializer();
+            if (patch == null)
+                throw new ArgumentNullException(nameof(patch));
 
-                        return (KubeResourceV1)serializer.Deserialize(responseReader, modelType);
-                    }
-                }
+            return await SendPatch(name, kind, apiVersion, patch, StrategicMergePatchMediaType, kubeNamespace, cancellationToken);
+        }
 
-                // Ensure that HttpStatusCode.NotFound actually refers to the target resource.
-                StatusV1 status = await responseMessage.ReadContentAsStatusV1Async(HttpStatusCode.NotFound).ConfigureAwait(false);
-                if (status.Reason == "NotFound")
-                {
-                    string errorMessage = isNamespaced ?
-                        $"Unable to patch {apiVersion}/{kind} resource '{name}' in namespace '{kubeNamespace}' (resource not found)."
-                        :
-                        $"Unable to patch {apiVersion}/{kind} resource '{name}' (resource not found).";
+        /// <summary>
+        ///     Update a Kubernetes resource using a strategic-merge patch computed from the differences between two versions of the resource.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource to update.
+        /// </typeparam>
+        /// <param name="original">
+        ///     A <typeparamref name="TResource"/> representing the original state of the resource (e.g. as last retrieved from the Kubernetes API).
+        /// </param>
+        /// <param name="modified">
+        ///     A <typeparamref name="TResource"/> representing the new state of the resource.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the request.
+        /// </param>
+        /// <returns>
+        ///     A <typeparamref name="TResource"/> representing the updated resource.
+        /// </returns>
+        /// <remarks>
+        ///     Only the fields that differ between <paramref name="original"/> and <paramref name="modified"/> are sent (see <see cref="StrategicMergePatch"/>).
+        /// </remarks>
+        public async Task<TResource> PatchStrategic<TResource>(TResource original, TResource modified, CancellationToken cancellationToken = default)
+            where TResource : KubeResourceV1
+        {
+            if (original == null)
+                throw new ArgumentNullException(nameof(original));
 
-                    throw new KubeClientException(errorMessage);
-                }
+            if (modified == null)
+                throw new ArgumentNullException(nameof(modified));
 
-                throw new KubeClientException($"Unable to patch {apiVersion}/{kind} resource (HTTP status {responseMessage.StatusCode}).",
-                    innerException: new HttpRequestException<StatusV1>(responseMessage.StatusCode, status)
-                );
-            }
+            if (String.IsNullOrWhiteSpace(modified.Metadata?.Name))
+                throw new ArgumentException("Cannot patch a resource if its metadata does not specify a name.", nameof(modified));
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            KubeResourceV1 patchedResource = await PatchStrategic(
+                modified.Metadata.Name,
+                modified.Kind,
+                modified.ApiVersion,
+                patch,
+                kubeNamespace: modified.Metadata.Namespace,
+                cancellationToken
+            );
+
+            return (TResource)patchedResource;
         }
 
         /// <summary>
@@ -563,6 +806,143 @@ namespace KubeClient.ResourceClients
             }
         }
 
+        /// <summary>
+        ///     Send a PATCH request for a Kubernetes resource.
+        /// </summary>
+        /// <param name="name">
+        ///     The resource name.
+        /// </param>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="patchBody">
+        ///     The patch to apply.
+        /// </param>
+        /// <param name="mediaType">
+        ///     The media type of the patch.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     A <see cref="CancellationToken"/> that can be used to cancel the request.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeResourceV1"/> representing the updated resource.
+        /// </returns>
+        async Task<KubeResourceV1> SendPatch(string name, string kind, string apiVersion, object patchBody, string mediaType, string kubeNamespace, CancellationToken cancellationToken)
+        {
+            bool isNamespaced = !String.IsNullOrWhiteSpace(kubeNamespace);
+
+            await EnsureApiMetadata(cancellationToken);
+            string apiPath = GetApiPath(kind, apiVersion, isNamespaced);
+
+            Type modelType = GetModelType(kind, apiVersion);
+
+            HttpRequest request = KubeRequest.Create(apiPath).WithRelativeUri("{name}")
+                .WithTemplateParameters(new
+                {
+                    name = name,
+                    @namespace = kubeNamespace
+                });
+
+            using (HttpResponseMessage responseMessage = await Http.PatchAsync(request, patchBody: patchBody, mediaType: mediaType, cancellationToken: cancellationToken).ConfigureAwait(false))
+            {
+                if (responseMessage.IsSuccessStatusCode)
+                {
+                    // Code is slightly ugly for types only known at runtime; see if KubeClient.Http could be improved here.
+                    using (Stream responseStream = await responseMessage.Content.ReadAsStreamAsync().ConfigureAwait(false))
+                    using (TextReader responseReader = new StreamReader(responseStream))
+                    {
+                        JsonSerializer serializer = responseMessage.GetJsonSerializer();
+
+                        return (KubeResourceV1)serializer.Deserialize(responseReader, modelType);
+                    }
+                }
+
+                // Ensure that HttpStatusCode.NotFound actually refers to the target resource.
+                StatusV1 status = await responseMessage.ReadContentAsStatusV1Async(HttpStatusCode.NotFound).ConfigureAwait(false);
+                if (status.Reason == "NotFound")
+                {
+                    string errorMessage = isNamespaced ?
+                        $"Unable to patch {apiVersion}/{kind} resource '{name}' in namespace '{kubeNamespace}' (resource not found)."
+                        :
+                        $"Unable to patch {apiVersion}/{kind} resource '{name}' (resource not found).";
+
+                    throw new KubeClientException(errorMessage);
+                }
+
+                throw new KubeClientException($"Unable to patch {apiVersion}/{kind} resource (HTTP status {responseMessage.StatusCode}).",
+                    innerException: new HttpRequestException<StatusV1>(responseMessage.StatusCode, status)
+                );
+            }
+        }
+
+        /// <summary>
+        ///     Enumerate resources, retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource to enumerate.
+        /// </typeparam>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="modelType">
+        ///     The CLR type to deserialise resources as.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while resources from the current page are still being enumerated?
+        /// </param>
+        /// <param name="metadataOnly">
+        ///     Request only resource metadata (i.e. <see cref="PartialObjectMetadataV1"/>) instead of complete resources?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each resource as soon as it has been received.
+        /// </returns>
+        async IAsyncEnumerable<TResource> EnumerateResources<TResource>(string kind, string apiVersion, Type modelType, string kubeNamespace, int pageSize, bool prefetchNextPage, bool metadataOnly, [EnumeratorCancellation] CancellationToken cancellationToken)
+            where TResource : KubeResourceV1
+        {
+            bool isNamespaced = !String.IsNullOrWhiteSpace(kubeNamespace);
+
+            await EnsureApiMetadata(cancellationToken);
+            string apiPath = GetApiPath(kind, apiVersion, isNamespaced);
+
+            HttpRequest request = KubeRequest.Create(apiPath)
+                .WithTemplateParameter("namespace", kubeNamespace);
+
+            string operationDescription = metadataOnly ? $"list metadata for {apiVersion}/{kind} resources" : $"list {apiVersion}/{kind} resources";
+            if (isNamespaced)
+                operationDescription += $" in namespace {kubeNamespace}";
+
+            if (metadataOnly)
+                request = AcceptPartialObjectMetadata(request, isList: true);
+
+            IAsyncEnumerable<TResource> resources = EnumerateResourceList<TResource>(request,
+                operationDescription: operationDescription,
+                itemType: modelType,
+                pageSize: pageSize,
+                prefetchNextPage: prefetchNextPage,
+                cancellationToken: cancellationToken
+            );
+            await foreach (TResource resource in resources)
+                yield return resource;
+        }
+
         /// <summary>
         ///     Get the primary path for the specified Kubernetes resource API.
         /// </summary>
@@ -714,6 +1094,56 @@ namespace KubeClient.ResourceClients
         /// </returns>
         Task<KubeResourceListV1> List(string kind, string apiVersion, string kubeNamespace = null, CancellationToken cancellationToken = default);
 
+        /// <summary>
+        ///     Enumerate resources, retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while resources from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each resource as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        IAsyncEnumerable<KubeResourceV1> ListPaged(string kind, string apiVersion, string kubeNamespace = null, int pageSize = KubeResourceClient.DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default);
+
+        /// <summary>
+        ///     Enumerate resources of the specified type, retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource to enumerate.
+        /// </typeparam>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while resources from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each resource as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        IAsyncEnumerable<TResource> ListPaged<TResource>(string kubeNamespace = null, int pageSize = KubeResourceClient.DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default)
+            where TResource : KubeResourceV1;
+
         /// <summary>
         ///     Create a Kubernetes resource.
         /// </summary>
@@ -737,6 +1167,69 @@ namespace KubeClient.ResourceClients
         Task<TResource> Create<TResource>(TResource resource, bool isNamespaced = true, CancellationToken cancellationToken = default)
             where TResource : KubeResourceV1;
 
+        /// <summary>
+        ///     List the metadata (only) for resources.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel the operation.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="PartialObjectMetadataListV1"/> containing the metadata for each resource.
+        /// </returns>
+        Task<PartialObjectMetadataListV1> ListMetadata(string kind, string apiVersion, string kubeNamespace = null, CancellationToken cancellationToken = default);
+
+        /// <summary>
+        ///     Enumerate the metadata (only) for resources, retrieving it in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while resources from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional cancellation token that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields the metadata for each resource as soon as it has been received.
+        /// </returns>
+        IAsyncEnumerable<PartialObjectMetadataV1> ListMetadataPaged(string kind, string apiVersion, string kubeNamespace = null, int pageSize = KubeResourceClient.DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default);
+
+        /// <summary>
+        ///     Watch for events relating to resources, receiving only their metadata.
+        /// </summary>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IObservable{T}"/> representing the event stream (each event's resource is a <see cref="PartialObjectMetadataV1"/>).
+        /// </returns>
+        IObservable<IResourceEventV1<PartialObjectMetadataV1>> WatchMetadata(string kind, string apiVersion, string kubeNamespace = null);
+
         /// <summary>
         ///     Perform a JSON patch operation on a Kubernetes resource.
         /// </summary>
@@ -763,6 +1256,53 @@ namespace KubeClient.ResourceClients
         /// </returns>
         Task<KubeResourceV1> Patch(string name, string kind, string apiVersion, JsonPatchDocument patch, string kubeNamespace = null, CancellationToken cancellationToken = default);
 
+        /// <summary>
+        ///     Perform a strategic-merge patch operation on a Kubernetes resource.
+        /// </summary>
+        /// <param name="name">
+        ///     The resource name.
+        /// </param>
+        /// <param name="kind">
+        ///     The resource kind.
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The resource API version.
+        /// </param>
+        /// <param name="patch">
+        ///     A <see cref="JObject"/> representing the strategic-merge patch to apply.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The (optional) name of a Kubernetes namespace containing the resources.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the request.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="KubeResourceV1"/> representing the updated resource.
+        /// </returns>
+        Task<KubeResourceV1> PatchStrategic(string name, string kind, string apiVersion, JObject patch, string kubeNamespace = null, CancellationToken cancellationToken = default);
+
+        /// <summary>
+        ///     Update a Kubernetes resource using a strategic-merge patch computed from the differences between two versions of the resource.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource to update.
+        /// </typeparam>
+        /// <param name="original">
+        ///     A <typeparamref name="TResource"/> representing the original state of the resource (e.g. as last retrieved from the Kubernetes API).
+        /// </param>
+        /// <param name="modified">
+        ///     A <typeparamref name="TResource"/> representing the new state of the resource.
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the request.
+        /// </param>
+        /// <returns>
+        ///     A <typeparamref name="TResource"/> representing the updated resource.
+        /// </returns>
+        Task<TResource> PatchStrategic<TResource>(TResource original, TResource modified, CancellationToken cancellationToken = default)
+            where TResource : KubeResourceV1;
+
         /// <summary>
         ///     Update a Kubernetes resource using a server-side apply operation.
         /// </summary>
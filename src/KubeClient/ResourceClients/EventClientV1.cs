@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -45,11 +46,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
             return await GetSingleResource<EventV1>(
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name,
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace
-                }),
+                CreateRequest(KubeResourcePaths.EventsV1.ByName(name, kubeNamespace ?? KubeClient.DefaultNamespace)),
                 cancellationToken: cancellationToken
             );
         }
@@ -89,6 +86,41 @@ namespace KubeClient.ResourceClients
             );
         }
 
+        /// <summary>
+        ///     Enumerate all Events in the specified namespace (optionally matching a label selector), retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="labelSelector">
+        ///     An optional Kubernetes label selector expression used to filter the Events.
+        /// </param>
+        /// <param name="fieldSelector">
+        ///     An optional Kubernetes field selector expression used to filter the Events.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of Events to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while Events from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each <see cref="EventV1"/> as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        public IAsyncEnumerable<EventV1> ListPaged(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, int pageSize = DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default)
+        {
+            return EnumerateResourceList<EventV1>(
+                CreateRequest(KubeResourcePaths.EventsV1.Collection(kubeNamespace ?? KubeClient.DefaultNamespace, labelSelector, fieldSelector)),
+                operationDescription: $"list v1/Events with label selector '{labelSelector ?? "<none>"}' and field selector '{fieldSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}",
+                pageSize: pageSize,
+                prefetchNextPage: prefetchNextPage,
+                cancellationToken: cancellationToken
+            );
+        }
+
         /// <summary>
         ///     Watch for events relating to Events.
         /// </summary>
@@ -104,10 +136,13 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        public IObservable<IResourceEventV1<EventV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string resourceVersion = null, string kubeNamespace = null)
+        public IObservable<IResourceEventV1<EventV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string resourceVersion = null, string kubeNamespace = null, bool includeBookmarks = false)
         {
             return ObserveEvents<EventV1>(
                 Requests.WatchCollection.WithTemplateParameters(new
@@ -117,7 +152,8 @@ namespace KubeClient.ResourceClients
                     FieldSelector = fieldSelector,
                     ResourceVersion = resourceVersion
                 }),
-                operationDescription: $"watch all v1/Events with label selector '{labelSelector ?? "<none>"}', field selector '{fieldSelector ?? "<none>"}', and resource version '{resourceVersion ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}"
+                operationDescription: $"watch all v1/Events with label selector '{labelSelector ?? "<none>"}', field selector '{fieldSelector ?? "<none>"}', and resource version '{resourceVersion ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}",
+                includeBookmarks: includeBookmarks
             );
         }
 
@@ -189,6 +225,32 @@ namespace KubeClient.ResourceClients
         /// </returns>
         Task<EventListV1> List(string labelSelector = null, string fieldSelector = null, string resourceVersion = null, string kubeNamespace = null, CancellationToken cancellationToken = default);
 
+        /// <summary>
+        ///     Enumerate all Events in the specified namespace (optionally matching a label selector), retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="labelSelector">
+        ///     An optional Kubernetes label selector expression used to filter the Events.
+        /// </param>
+        /// <param name="fieldSelector">
+        ///     An optional Kubernetes field selector expression used to filter the Events.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of Events to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while Events from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each <see cref="EventV1"/> as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        IAsyncEnumerable<EventV1> ListPaged(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, int pageSize = KubeResourceClient.DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default);
+
         /// <summary>
         ///     Watch for events relating to Events.
         /// </summary>
@@ -204,9 +266,12 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        IObservable<IResourceEventV1<EventV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string resourceVersion = null, string kubeNamespace = null);
+        IObservable<IResourceEventV1<EventV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string resourceVersion = null, string kubeNamespace = null, bool includeBookmarks = false);
     }
 }
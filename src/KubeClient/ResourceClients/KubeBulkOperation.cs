@@ -0,0 +1,204 @@
+using Newtonsoft.Json.Linq;
+using System;
+
+namespace KubeClient.ResourceClients
+{
+    using Models;
+
+    /// <summary>
+    ///     The action performed by a <see cref="KubeBulkOperation"/>.
+    /// </summary>
+    public enum KubeBulkAction
+    {
+        /// <summary>
+        ///     Create the resource.
+        /// </summary>
+        Create,
+
+        /// <summary>
+        ///     Replace the resource.
+        /// </summary>
+        Update,
+
+        /// <summary>
+        ///     Patch the resource (using a strategic-merge patch or, if no patch is specified, a JSON merge patch containing the resource).
+        /// </summary>
+        Patch,
+
+        /// <summary>
+        ///     Create or update the resource using a server-side apply operation.
+        /// </summary>
+        Apply,
+
+        /// <summary>
+        ///     Delete the resource.
+        /// </summary>
+        Delete
+    }
+
+    /// <summary>
+    ///     An operation on a single Kubernetes resource, executed as part of a bulk operation.
+    /// </summary>
+    /// <remarks>
+    ///     Resources of different kinds can be mixed in the same bulk operation (the API path for each resource is resolved from its kind and API version).
+    /// </remarks>
+    public sealed class KubeBulkOperation
+    {
+        /// <summary>
+        ///     Create a new <see cref="KubeBulkOperation"/>.
+        /// </summary>
+        /// <param name="action">
+        ///     The action to perform.
+        /// </param>
+        /// <param name="resource">
+        ///     The target resource (its kind, API version, name, and namespace identify the resource API to call).
+        /// </param>
+        KubeBulkOperation(KubeBulkAction action, KubeResourceV1 resource)
+        {
+            if (resource == null)
+                throw new ArgumentNullException(nameof(resource));
+
+            if (action != KubeBulkAction.Create && String.IsNullOrWhiteSpace(resource.Metadata?.Name))
+                throw new ArgumentException($"Cannot {action.ToString().ToLowerInvariant()} a resource if its metadata does not specify a name.", nameof(resource));
+
+            Action = action;
+            Resource = resource;
+        }
+
+        /// <summary>
+        ///     The action to perform.
+        /// </summary>
+        public KubeBulkAction Action { get; }
+
+        /// <summary>
+        ///     The target resource.
+        /// </summary>
+        public KubeResourceV1 Resource { get; }
+
+        /// <summary>
+        ///     An optional strategic-merge patch to apply (<see cref="KubeBulkAction.Patch"/> only).
+        /// </summary>
+        public JObject PatchBody { get; private set; }
+
+        /// <summary>
+        ///     The name of the field manager used for server-side apply (<see cref="KubeBulkAction.Apply"/> only).
+        /// </summary>
+        public string FieldManager { get; private set; }
+
+        /// <summary>
+        ///     Allow the field manager to take ownership of fields if required (<see cref="KubeBulkAction.Apply"/> only)?
+        /// </summary>
+        public bool Force { get; private set; }
+
+        /// <summary>
+        ///     An optional <see cref="DeletePropagationPolicy"/> indicating how child resources should be deleted (<see cref="KubeBulkAction.Delete"/> only).
+        /// </summary>
+        public DeletePropagationPolicy? PropagationPolicy { get; private set; }
+
+        /// <summary>
+        ///     Create an operation that creates a resource.
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource to create.
+        /// </param>
+        /// <returns>
+        ///     The new <see cref="KubeBulkOperation"/>.
+        /// </returns>
+        public static KubeBulkOperation Create(KubeResourceV1 resource) => new KubeBulkOperation(KubeBulkAction.Create, resource);
+
+        /// <summary>
+        ///     Create an operation that replaces a resource.
+        /// </summary>
+        /// <param name="resource">
+        ///     The new state of the resource.
+        /// </param>
+        /// <returns>
+        ///     The new <see cref="KubeBulkOperation"/>.
+        /// </returns>
+        public static KubeBulkOperation Update(KubeResourceV1 resource) => new KubeBulkOperation(KubeBulkAction.Update, resource);
+
+        /// <summary>
+        ///     Create an operation that patches a resource.
+        /// </summary>
+        /// <param name="resource">
+        ///     The target resource (if <paramref name="patch"/> is not specified, the resource itself is sent as a JSON merge patch).
+        /// </param>
+        /// <param name="patch">
+        ///     An optional strategic-merge patch (see <see cref="StrategicMergePatch"/>).
+        /// </param>
+        /// <returns>
+        ///     The new <see cref="KubeBulkOperation"/>.
+        /// </returns>
+        public static KubeBulkOperation Patch(KubeResourceV1 resource, JObject patch = null)
+        {
+            return new KubeBulkOperation(KubeBulkAction.Patch, resource)
+            {
+                PatchBody = patch
+            };
+        }
+
+        /// <summary>
+        ///     Create an operation that creates or updates a resource using a server-side apply operation.
+        /// </summary>
+        /// <param name="resource">
+        ///     The desired state of the resource.
+        /// </param>
+        /// <param name="fieldManager">
+        ///     The name of the field manager to use when performing the server-side apply.
+        /// </param>
+        /// <param name="force">
+        ///     Allow the field manager to take ownership of fields if required?
+        /// </param>
+        /// <returns>
+        ///     The new <see cref="KubeBulkOperation"/>.
+        /// </returns>
+        public static KubeBulkOperation Apply(KubeResourceV1 resource, string fieldManager, bool force = false)
+        {
+            if (String.IsNullOrWhiteSpace(fieldManager))
+                throw new ArgumentException($"Argument cannot be null, empty, or entirely composed of whitespace: {nameof(fieldManager)}.", nameof(fieldManager));
+
+            return new KubeBulkOperation(KubeBulkAction.Apply, resource)
+            {
+                FieldManager = fieldManager,
+                Force = force
+            };
+        }
+
+        /// <summary>
+        ///     Create an operation that deletes a resource.
+        /// </summary>
+        /// <param name="resource">
+        ///     The resource to delete.
+        /// </param>
+        /// <param name="propagationPolicy">
+        ///     An optional <see cref="DeletePropagationPolicy"/> indicating how child resources should be deleted (if at all).
+        /// </param>
+        /// <returns>
+        ///     The new <see cref="KubeBulkOperation"/>.
+        /// </returns>
+        public static KubeBulkOperation Delete(KubeResourceV1 resource, DeletePropagationPolicy? propagationPolicy = null)
+        {
+            return new KubeBulkOperation(KubeBulkAction.Delete, resource)
+            {
+                PropagationPolicy = propagationPolicy
+            };
+        }
+
+        /// <summary>
+        ///     Get a short description of the operation (for use in error messages).
+        /// </summary>
+        /// <returns>
+        ///     The operation description.
+        /// </returns>
+        public override string ToString()
+        {
+            string resourceDescription = $"{Resource.ApiVersion}/{Resource.Kind} resource";
+            if (!String.IsNullOrWhiteSpace(Resource.Metadata?.Name))
+                resourceDescription += $" '{Resource.Metadata.Name}'";
+            if (!String.IsNullOrWhiteSpace(Resource.Metadata?.Namespace))
+                resourceDescription += $" in namespace '{Resource.Metadata.Namespace}'";
+
+            return $"{Action.ToString().ToLowerInvariant()} {resourceDescription}";
+        }
+    }
+}
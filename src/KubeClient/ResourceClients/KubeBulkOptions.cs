@@ -0,0 +1,108 @@
+using System;
+using System.Collections.Generic;
+
+namespace KubeClient.ResourceClients
+{
+    /// <summary>
+    ///     Options for bulk operations on Kubernetes resources.
+    /// </summary>
+    public sealed class KubeBulkOptions
+    {
+        /// <summary>
+        ///     The default maximum number of concurrent requests.
+        /// </summary>
+        public const int DefaultMaxConcurrency = 16;
+
+        /// <summary>
+        ///     The default maximum number of times a request is retried after the API server responds with "429 Too Many Requests".
+        /// </summary>
+        public const int DefaultMaxRetries = 5;
+
+        /// <summary>
+        ///     The default phases in which resources are created or updated, by kind (resources of kinds not listed here are processed in a final phase).
+        /// </summary>
+        /// <remarks>
+        ///     Custom resource definitions and namespaces come first, since other resources may depend on them; resources that are referenced by workloads (such as service accounts, secrets, config maps, and volume claims) come next.
+        /// </remarks>
+        public static readonly IReadOnlyList<IReadOnlyCollection<string>> DefaultKindPhases = new IReadOnlyCollection<string>[]
+        {
+            new HashSet<string>
+            {
+                "CustomResourceDefinition",
+                "Namespace"
+            },
+            new HashSet<string>
+            {
+                "PriorityClass",
+                "StorageClass",
+                "ResourceQuota",
+                "LimitRange",
+                "ServiceAccount",
+                "Secret",
+                "ConfigMap",
+                "PersistentVolume",
+                "PersistentVolumeClaim",
+                "ClusterRole",
+                "ClusterRoleBinding",
+                "Role",
+                "RoleBinding"
+            }
+        };
+
+        /// <summary>
+        ///     The maximum number of concurrent requests (defaults to <see cref="DefaultMaxConcurrency"/>).
+        /// </summary>
+        public int MaxConcurrency { get; set; } = DefaultMaxConcurrency;
+
+        /// <summary>
+        ///     The maximum number of times a request is retried after the API server responds with "429 Too Many Requests" (defaults to <see cref="DefaultMaxRetries"/>).
+        /// </summary>
+        public int MaxRetries { get; set; } = DefaultMaxRetries;
+
+        /// <summary>
+        ///     The delay before the first retry, if the API server does not specify one (doubled for each subsequent retry).
+        /// </summary>
+        public TimeSpan InitialRetryDelay { get; set; } = TimeSpan.FromMilliseconds(250);
+
+        /// <summary>
+        ///     The maximum delay between retries.
+        /// </summary>
+        public TimeSpan MaxRetryDelay { get; set; } = TimeSpan.FromSeconds(30);
+
+        /// <summary>
+        ///     The phases in which resources are created or updated, by kind (defaults to <see cref="DefaultKindPhases"/>).
+        /// </summary>
+        /// <remarks>
+        ///     Each phase completes before the next one starts. Resources are deleted in the reverse order.
+        /// </remarks>
+        public IReadOnlyList<IReadOnlyCollection<string>> KindPhases { get; set; } = DefaultKindPhases;
+
+        /// <summary>
+        ///     Continue with later phases if an operation in an earlier phase fails (by default, operations in later phases are skipped)?
+        /// </summary>
+        public bool ContinueOnError { get; set; }
+
+        /// <summary>
+        ///     Ensure that the <see cref="KubeBulkOptions"/> are valid.
+        /// </summary>
+        /// <returns>
+        ///     The <see cref="KubeBulkOptions"/> (enables inline use).
+        /// </returns>
+        public KubeBulkOptions EnsureValid()
+        {
+            if (MaxConcurrency < 1)
+                throw new KubeClientException("Invalid KubeBulkOptions: maximum concurrency must be at least 1.");
+
+            if (MaxRetries < 0)
+                throw new KubeClientException("Invalid KubeBulkOptions: maximum number of retries cannot be less than 0.");
+
+            if (InitialRetryDelay < TimeSpan.Zero || MaxRetryDelay < InitialRetryDelay)
+                throw new KubeClientException("Invalid KubeBulkOptions: retry delays cannot be negative, and the maximum retry delay cannot be less than the initial retry delay.");
+
+            if (KindPhases == null)
+                throw new KubeClientException("Invalid KubeBulkOptions: must specify kind phases.");
+
+            return this;
+        }
+    }
+}
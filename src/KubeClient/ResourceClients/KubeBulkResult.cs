@@ -0,0 +1,80 @@
+using System;
+
+namespace KubeClient.ResourceClients
+{
+    using Models;
+
+    /// <summary>
+    ///     The result of a single <see cref="KubeBulkOperation"/>.
+    /// </summary>
+    public sealed class KubeBulkResult
+    {
+        /// <summary>
+        ///     Create a new <see cref="KubeBulkResult"/>.
+        /// </summary>
+        /// <param name="operation">
+        ///     The operation.
+        /// </param>
+        /// <param name="resource">
+        ///     The resource returned by the API server (if any).
+        /// </param>
+        /// <param name="status">
+        ///     The <see cref="StatusV1"/> returned by the API server (if any).
+        /// </param>
+        /// <param name="error">
+        ///     The exception (if any) that caused the operation to fail.
+        /// </param>
+        /// <param name="attempts">
+        ///     The number of requests made for the operation.
+        /// </param>
+        public KubeBulkResult(KubeBulkOperation operation, KubeResourceV1 resource, StatusV1 status, Exception error, int attempts)
+        {
+            if (operation == null)
+                throw new ArgumentNullException(nameof(operation));
+
+            if (attempts < 0)
+                throw new ArgumentOutOfRangeException(nameof(attempts), attempts, "Number of attempts cannot be less than 0.");
+
+            Operation = operation;
+            Resource = resource;
+            Status = status;
+            Error = error;
+            Attempts = attempts;
+        }
+
+        /// <summary>
+        ///     The operation.
+        /// </summary>
+        public KubeBulkOperation Operation { get; }
+
+        /// <summary>
+        ///     The resource returned by the API server (if any).
+        /// </summary>
+        public KubeResourceV1 Resource { get; }
+
+        /// <summary>
+        ///     The <see cref="StatusV1"/> returned by the API server (e.g. the result of a delete operation, or the reason an operation failed), if any.
+        /// </summary>
+        public StatusV1 Status { get; }
+
+        /// <summary>
+        ///     The exception (if any) that caused the operation to fail.
+        /// </summary>
+        public Exception Error { get; }
+
+        /// <summary>
+        ///     The number of requests made for the operation (including retries after the API server asked the client to slow down).
+        /// </summary>
+        public int Attempts { get; }
+
+        /// <summary>
+        ///     Did the operation succeed?
+        /// </summary>
+        public bool IsSuccess => Error == null && Attempts > 0;
+
+        /// <summary>
+        ///     Was the operation skipped (because an operation in an earlier phase failed)?
+        /// </summary>
+        public bool IsSkipped => Error == null && Attempts == 0;
+    }
+}
@@ -2,8 +2,9 @@ using Microsoft.AspNetCore.JsonPatch;
 using Microsoft.Extensions.Logging;
 using Newtonsoft.Json;
 using Newtonsoft.Json.Converters;
-using Newtonsoft.Json.Linq;
 using System;
+using System.Buffers;
+using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using System.Net;
@@ -11,6 +12,7 @@ using System.Net.Http;
 using System.Net.Http.Headers;
 using System.Reactive;
 using System.Reactive.Linq;
+using System.Runtime.CompilerServices;
 using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
@@ -18,6 +20,7 @@ using System.Threading.Tasks;
 namespace KubeClient.ResourceClients
 {
     using Http;
+    using Http.Formatters;
     using Http.Formatters.Json;
     using Models;
     using Models.ContractResolvers;
@@ -40,6 +43,11 @@ namespace KubeClient.ResourceClients
         /// </summary>
         protected const int DefaultStreamingBufferSize = 2048;
 
+        /// <summary>
+        ///     The default number of resources to retrieve per request when listing resources in pages (chunks).
+        /// </summary>
+        public const int DefaultListPageSize = 500;
+
         /// <summary>
         ///     The media type used to indicate that request is a Kubernetes PATCH request.
         /// </summary>
@@ -50,6 +58,11 @@ namespace KubeClient.ResourceClients
         /// </summary>
         protected static readonly string MergePatchMediaType = "application/merge-patch+json";
 
+        /// <summary>
+        ///     The media type used to indicate that request is a Kubernetes strategic-merge-style PATCH request.
+        /// </summary>
+        protected static readonly string StrategicMergePatchMediaType = "application/strategic-merge-patch+json";
+
         /// <summary>
         ///     The media type used to indicate that request is a Kubernetes server-side-apply PATCH request in JSON format.
         /// </summary>
@@ -60,6 +73,16 @@ namespace KubeClient.ResourceClients
         /// </summary>
         protected static readonly string ApplyPatchYamlMediaType = "application/apply-patch+yaml";
 
+        /// <summary>
+        ///     The media type used to request metadata-only resources (i.e. <see cref="PartialObjectMetadataV1"/>) instead of complete resources.
+        /// </summary>
+        protected static readonly string PartialObjectMetadataMediaType = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1";
+
+        /// <summary>
+        ///     The media type used to request metadata-only resource lists (i.e. <see cref="PartialObjectMetadataListV1"/>) instead of complete resource lists.
+        /// </summary>
+        protected static readonly string PartialObjectMetadataListMediaType = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1";
+
         /// <summary>
         ///     JSON serialisation settings.
         /// </summary>
@@ -84,7 +107,8 @@ namespace KubeClient.ResourceClients
                 SupportedMediaTypes =
                 {
                     PatchMediaType,
-                    MergePatchMediaType
+                    MergePatchMediaType,
+                    StrategicMergePatchMediaType
                 }
             })
         );
@@ -108,6 +132,11 @@ namespace KubeClient.ResourceClients
         /// </summary>
         public IKubeApiClient KubeClient { get; }
 
+        /// <summary>
+        ///     Counters for the watches started by the client (reconnects, bookmarks, and expired resource versions).
+        /// </summary>
+        public KubeWatchStatistics WatchStatistics { get; } = new KubeWatchStatistics();
+
         /// <summary>
         ///     The Kubernetes API client (for <see cref="IKubeResourceClient"/>).
         /// </summary>
@@ -123,6 +152,60 @@ namespace KubeClient.ResourceClients
         /// </summary>
         protected ILoggerFactory LoggerFactory => KubeClient.LoggerFactory;
 
+        /// <summary>
+        ///     Create a Kubernetes API request for the specified request path.
+        /// </summary>
+        /// <param name="requestPath">
+        ///     The request path (and query, if any), relative to the API server's base address (already fully-populated and escaped, e.g. by <see cref="KubeResourcePaths"/>).
+        /// </param>
+        /// <returns>
+        ///     The new <see cref="HttpRequest"/>.
+        /// </returns>
+        /// <remarks>
+        ///     The request path is not treated as a URI template, so building the request does not involve parsing a template or evaluating template parameters.
+        /// </remarks>
+        protected static HttpRequest CreateRequest(string requestPath)
+        {
+            if (String.IsNullOrWhiteSpace(requestPath))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'requestPath'.", nameof(requestPath));
+
+            return KubeRequest.BaseRequest.WithLiteralUri(
+                new Uri(requestPath, UriKind.Relative)
+            );
+        }
+
+        /// <summary>
+        ///     Create a copy of the request that asks the API server to return only resource metadata (i.e. <see cref="PartialObjectMetadataV1"/> / <see cref="PartialObjectMetadataListV1"/>) instead of complete resources.
+        /// </summary>
+        /// <param name="request">
+        ///     The <see cref="HttpRequest"/> for the resource(s).
+        /// </param>
+        /// <param name="isList">
+        ///     Does the request return a resource list (rather than a single resource or a stream of watch events)?
+        /// </param>
+        /// <returns>
+        ///     The new <see cref="HttpRequest"/>.
+        /// </returns>
+        /// <remarks>
+        ///     Complete resources are still accepted (as a fall-back, for API servers that cannot return metadata only); they can be deserialised as <see cref="PartialObjectMetadataV1"/> because it only declares the resource metadata.
+        /// </remarks>
+        protected static HttpRequest AcceptPartialObjectMetadata(HttpRequest request, bool isList)
+        {
+            if (request == null)
+                throw new ArgumentNullException(nameof(request));
+
+            MediaTypeWithQualityHeaderValue partialObjectMetadataMediaType = MediaTypeWithQualityHeaderValue.Parse(
+                isList ? PartialObjectMetadataListMediaType : PartialObjectMetadataMediaType
+            );
+            MediaTypeWithQualityHeaderValue fallbackMediaType = new MediaTypeWithQualityHeaderValue(WellKnownMediaTypes.Json);
+
+            return request.AcceptNoMediaTypes().WithRequestAction(requestMessage =>
+            {
+                requestMessage.Headers.Accept.Add(partialObjectMetadataMediaType);
+                requestMessage.Headers.Accept.Add(fallbackMediaType);
+            });
+        }
+
         /// <summary>
         ///     Get a single resource, returning <c>null</c> if it does not exist.
         /// </summary>
@@ -210,6 +293,150 @@ namespace KubeClient.ResourceClients
             }
         }
 
+        /// <summary>
+        ///     Enumerate a list of resources, retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource to enumerate.
+        /// </typeparam>
+        /// <param name="request">
+        ///     An <see cref="HttpRequest"/> representing the resource list to retrieve (must not already specify "limit", "continue", or "resourceVersion").
+        /// </param>
+        /// <param name="operationDescription">
+        ///     A short description of the operation (used in error messages if the request fails).
+        /// </param>
+        /// <param name="itemType">
+        ///     An optional CLR type (derived from <typeparamref name="TResource"/>) to deserialise resources as (defaults to <typeparamref name="TResource"/>).
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of resources to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page as soon as its continuation token is available (i.e. while resources from the current page are still being enumerated)?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each resource as soon as it has been deserialised.
+        /// </returns>
+        /// <remarks>
+        ///     Each page is streamed (rather than buffered) and its resources are deserialised one at a time, so memory use is bounded by the size of a single resource (plus the page that is being prefetched, if any), no matter how many resources there are in total.
+        ///
+        ///     The API server includes the continuation token in each page's list metadata (which precedes the page's items), so the next page can be requested before the current page has been enumerated.
+        ///     If a continuation token expires before it is used (HTTP 410 / Gone), enumeration fails with a <see cref="KubeApiException"/>; the list must then be enumerated again from the beginning.
+        /// </remarks>
+        protected async IAsyncEnumerable<TResource> EnumerateResourceList<TResource>(HttpRequest request, string operationDescription, Type itemType = null, int pageSize = DefaultListPageSize, bool prefetchNextPage = false, [EnumeratorCancellation] CancellationToken cancellationToken = default)
+            where TResource : KubeResourceV1
+        {
+            if (request == null)
+                throw new ArgumentNullException(nameof(request));
+
+            if (String.IsNullOrWhiteSpace(operationDescription))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'operationDescription'.", nameof(operationDescription));
+
+            if (pageSize < 1)
+                throw new ArgumentOutOfRangeException(nameof(pageSize), pageSize, "Page size must be greater than 0.");
+
+            itemType = itemType ?? typeof(TResource);
+
+            JsonSerializer serializer = JsonSerializer.Create(
+                request.GetFormatters().Values.GetJsonSerializerSettings()
+            );
+
+            HttpRequest GetPageRequest(string continuationToken)
+            {
+                HttpRequest pageRequest = request.WithQueryParameter("limit", pageSize);
+                if (!String.IsNullOrWhiteSpace(continuationToken))
+                    pageRequest = pageRequest.WithQueryParameter("continue", continuationToken);
+
+                return pageRequest;
+            }
+
+            Task<HttpResponseMessage> nextPageResponse = Http.GetStreamedAsync(GetPageRequest(continuationToken: null), cancellationToken);
+            try
+            {
+                while (nextPageResponse != null)
+                {
+                    using (HttpResponseMessage responseMessage = await nextPageResponse.ConfigureAwait(false))
+                    {
+                        nextPageResponse = null;
+
+                        if (!responseMessage.IsSuccessStatusCode)
+                        {
+                            throw new KubeApiException($"Unable to {operationDescription} (HTTP status {responseMessage.StatusCode}).",
+                                innerException: new HttpRequestException<StatusV1>(responseMessage.StatusCode,
+                                    response: await responseMessage.ReadContentAsStatusV1Async(responseMessage.StatusCode).ConfigureAwait(false)
+                                )
+                            );
+                        }
+
+                        string continuationToken = null;
+
+                        using (Stream responseStream = await responseMessage.Content.ReadAsStreamAsync().ConfigureAwait(false))
+                        using (TextReader responseReader = new StreamReader(responseStream))
+                        using (JsonTextReader responseJsonReader = new JsonTextReader(responseReader) { ArrayPool = JsonCharArrayPool.Instance })
+                        {
+                            if (!await responseJsonReader.ReadAsync(cancellationToken).ConfigureAwait(false) || responseJsonReader.TokenType != JsonToken.StartObject)
+                                throw new KubeClientException($"Unable to {operationDescription} (response is not a JSON object).");
+
+                            while (await responseJsonReader.ReadAsync(cancellationToken).ConfigureAwait(false) && responseJsonReader.TokenType == JsonToken.PropertyName)
+                            {
+                                string propertyName = (string)responseJsonReader.Value;
+                                await responseJsonReader.ReadAsync(cancellationToken).ConfigureAwait(false);
+
+                                switch (propertyName)
+                                {
+                                    case "metadata":
+                                    {
+                                        ListMetaV1 listMetadata = serializer.Deserialize<ListMetaV1>(responseJsonReader);
+                                        continuationToken = listMetadata?.Continue;
+
+                                        if (prefetchNextPage && !String.IsNullOrWhiteSpace(continuationToken))
+                                            nextPageResponse = Http.GetStreamedAsync(GetPageRequest(continuationToken), cancellationToken);
+
+                                        break;
+                                    }
+                                    case "items" when responseJsonReader.TokenType == JsonToken.StartArray:
+                                    {
+                                        // Each resource is deserialised directly from the response stream, and yielded before the next one is read.
+                                        while (await responseJsonReader.ReadAsync(cancellationToken).ConfigureAwait(false) && responseJsonReader.TokenType != JsonToken.EndArray)
+                                        {
+                                            var resource = (TResource)serializer.Deserialize(responseJsonReader, itemType);
+                                            if (resource != null)
+                                                yield return resource;
+                                        }
+
+                                        break;
+                                    }
+                                    default:
+                                    {
+                                        await responseJsonReader.SkipAsync(cancellationToken).ConfigureAwait(false);
+
+                                        break;
+                                    }
+                                }
+                            }
+                        }
+
+                        if (nextPageResponse == null && !String.IsNullOrWhiteSpace(continuationToken))
+                            nextPageResponse = Http.GetStreamedAsync(GetPageRequest(continuationToken), cancellationToken);
+                    }
+                }
+            }
+            finally
+            {
+                // Enumeration was abandoned (or failed) while the next page was being prefetched.
+                if (nextPageResponse != null)
+                {
+                    _ = nextPageResponse.ContinueWith(
+                        pageResponse => pageResponse.Result.Dispose(),
+                        TaskContinuationOptions.OnlyOnRanToCompletion
+                    );
+                }
+            }
+        }
+
         /// <summary>
         ///     Perform a JSON patch operation on a Kubernetes resource.
         /// </summary>
@@ -337,23 +564,18 @@ namespace KubeClient.ResourceClients
             if (String.IsNullOrWhiteSpace(kubeNamespace))
                 kubeNamespace = KubeClient.DefaultNamespace;
 
-            var response = Http.DeleteAsJsonAsync(
+            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind<TResource>();
+
+            return await DeleteSingleResource<TResource>(
                 resourceByNameRequestTemplate.WithTemplateParameters(new
                 {
                     Name = name,
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace
+                    Namespace = kubeNamespace
                 }),
-                deleteBody: new DeleteOptionsV1
-                {
-                    PropagationPolicy = propagationPolicy
-                },
+                operationDescription: $"delete {apiVersion}/{kind} resource '{name}' in namespace '{kubeNamespace}'",
+                propagationPolicy: propagationPolicy,
                 cancellationToken: cancellationToken
             );
-
-            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind<TResource>();
-            string operationDescription = $"delete {apiVersion}/{kind} resource '{name}' in namespace '{kubeNamespace}'";
-
-            return await response.ReadContentAsResourceOrStatusV1<TResource>(operationDescription, HttpStatusCode.OK, HttpStatusCode.NotFound);
         }
 
         /// <summary>
@@ -386,11 +608,50 @@ namespace KubeClient.ResourceClients
             if (String.IsNullOrWhiteSpace(name))
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
-            var response = Http.DeleteAsJsonAsync(
+            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind<TResource>();
+
+            return await DeleteSingleResource<TResource>(
                 resourceByNameNoNamespaceRequestTemplate.WithTemplateParameters(new
                 {
                     Name = name
                 }),
+                operationDescription: $"delete {apiVersion}/{kind} resource '{name}'",
+                propagationPolicy: propagationPolicy,
+                cancellationToken: cancellationToken
+            );
+        }
+
+        /// <summary>
+        ///     Request deletion of a single resource.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The type of resource to delete.
+        /// </typeparam>
+        /// <param name="request">
+        ///     An <see cref="HttpRequest"/> representing the resource to delete.
+        /// </param>
+        /// <param name="operationDescription">
+        ///     A short description of the operation (used in error messages if the request fails).
+        /// </param>
+        /// <param name="propagationPolicy">
+        ///     A <see cref="DeletePropagationPolicy"/> indicating how child resources should be deleted (if at all).
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel the request.
+        /// </param>
+        /// <returns>
+        ///     A <typeparamref name="TResource"/> representing the resource's most recent state before it was deleted, if <paramref name="propagationPolicy"/> is <see cref="DeletePropagationPolicy.Foreground"/>; otherwise, a <see cref="StatusV1"/> indicating the operation result.
+        /// </returns>
+        protected async Task<KubeResourceResultV1<TResource>> DeleteSingleResource<TResource>(HttpRequest request, string operationDescription, DeletePropagationPolicy? propagationPolicy = null, CancellationToken cancellationToken = default)
+            where TResource : KubeResourceV1
+        {
+            if (request == null)
+                throw new ArgumentNullException(nameof(request));
+
+            if (String.IsNullOrWhiteSpace(operationDescription))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'operationDescription'.", nameof(operationDescription));
+
+            var response = Http.DeleteAsJsonAsync(request,
                 deleteBody: new DeleteOptionsV1
                 {
                     PropagationPolicy = propagationPolicy
@@ -398,9 +659,6 @@ namespace KubeClient.ResourceClients
                 cancellationToken: cancellationToken
             );
 
-            (string kind, string apiVersion) = KubeObjectV1.GetKubeKind<TResource>();
-            string operationDescription = $"delete {apiVersion}/{kind} resource '{name}'";
-
             return await response.ReadContentAsResourceOrStatusV1<TResource>(operationDescription, HttpStatusCode.OK, HttpStatusCode.NotFound);
         }
 
@@ -416,10 +674,23 @@ namespace KubeClient.ResourceClients
         /// <param name="operationDescription">
         ///     A short description of the operation (used in error messages if the request fails).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional resource version to start watching from (if not specified, the API server starts the watch from its most recent resource version).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish <see cref="ResourceEventType.Bookmark"/> events (whose resource only has a resource version) to subscribers?
+        ///
+        ///     Useful for subscribers that track the resource version to resume from (e.g. <see cref="Informers.KubeResourceInformer{TResource}"/>). Default is <c>false</c>.
+        /// </param>
         /// <returns>
         ///     The <see cref="IObservable{T}"/>.
         /// </returns>
-        protected IObservable<IResourceEventV1<TResource>> ObserveEvents<TResource>(HttpRequest request, string operationDescription)
+        /// <remarks>
+        ///     Watch bookmarks are requested from the API server, and used to advance the resource version that the watch resumes from if it is reconnected (the bookmark's object is never deserialised).
+        ///
+        ///     Bookmarks are only published if <paramref name="includeBookmarks"/> is <c>true</c> and a model can be created for them (i.e. <typeparamref name="TResource"/> is not abstract, or is a base class of a well-known model type).
+        /// </remarks>
+        protected IObservable<IResourceEventV1<TResource>> ObserveEvents<TResource>(HttpRequest request, string operationDescription, string resourceVersion = null, bool includeBookmarks = false)
             where TResource : KubeResourceV1
         {
             if (request == null)
@@ -428,7 +699,13 @@ namespace KubeClient.ResourceClients
             if (String.IsNullOrWhiteSpace(operationDescription))
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'operationDescription'.", nameof(operationDescription));
 
-            JsonSerializerSettings serializerSettings = request.GetFormatters().Values.GetJsonSerializerSettings();
+            request = request.WithQueryParameter("allowWatchBookmarks", true);
+            if (!String.IsNullOrWhiteSpace(resourceVersion))
+                request = request.WithQueryParameter("resourceVersion", resourceVersion);
+
+            JsonSerializer eventSerializer = JsonSerializer.Create(
+                request.GetFormatters().Values.GetJsonSerializerSettings()
+            );
 
             ILogger logger = LoggerFactory.CreateLogger(GetType());
 
@@ -442,22 +719,59 @@ namespace KubeClient.ResourceClients
                         HttpRequest currentRequest = request;
 
                         if (!String.IsNullOrWhiteSpace(lastObservedResourceVersion))
+                        {
                             currentRequest = currentRequest.WithQueryParameter("resourceVersion", lastObservedResourceVersion);
 
+                            WatchStatistics.RecordReconnect();
+                        }
+
                         return currentRequest;
                     },
+                    lineSelector: (line, lineLength) =>
+                    {
+                        string eventType = WatchEventReader.ReadEventType(line, lineLength);
+                        if (WatchEventReader.IsBookmark(eventType))
+                        {
+                            (string kind, string apiVersion, string bookmarkResourceVersion) = WatchEventReader.ReadBookmark(line, lineLength);
+
+                            lastObservedResourceVersion = RecordBookmark(bookmarkResourceVersion) ?? lastObservedResourceVersion;
+                            if (!includeBookmarks)
+                                return null;
+
+                            TResource bookmarkResource = CreateBookmarkResource<TResource>(kind, apiVersion);
+                            if (bookmarkResource == null)
+                                return null;
+
+                            return CreateBookmarkEvent(bookmarkResource, bookmarkResourceVersion);
+                        }
+
+                        if (WatchEventReader.IsError(eventType))
+                            throw new KubeApiException($"Unable to {operationDescription}.", WatchEventReader.ReadErrorStatus(line, lineLength, eventSerializer));
+
+                        // Each event is deserialised directly from the (pooled) line buffer.
+                        using (JsonTextReader lineJsonReader = WatchEventReader.CreateReader(line, lineLength))
+                        {
+                            return (IResourceEventV1<TResource>)eventSerializer.Deserialize<ResourceEventV1<TResource>>(lineJsonReader);
+                        }
+                    },
                     shouldRetry: exception => exception == null // Only retry if there was no exception
                 )
-                .Do(
-                    line => CheckForEventError(line, operationDescription)
+                .Where(
+                    resourceEvent => resourceEvent != null // Bookmarks that are not published.
                 )
-                .Select(
-                    line => (IResourceEventV1<TResource>)JsonConvert.DeserializeObject<ResourceEventV1<TResource>>(line, serializerSettings)
-                )
-                .Do(resourceEvent =>
-                {
-                    lastObservedResourceVersion = resourceEvent.Resource.Metadata.ResourceVersion;
-                });
+                .Do(
+                    resourceEvent => lastObservedResourceVersion = RecordEvent(resourceEvent) ?? lastObservedResourceVersion,
+                    watchError =>
+                    {
+                        // Don't try to resume from a resource version that the API server no longer has (the subscriber is expected to list resources again, and re-subscribe).
+                        if (WatchEventReader.IsResourceVersionExpired(watchError))
+                        {
+                            lastObservedResourceVersion = null;
+
+                            WatchStatistics.RecordExpiration();
+                        }
+                    }
+                );
         }
 
         /// <summary>
@@ -469,11 +783,23 @@ namespace KubeClient.ResourceClients
         /// <param name="operationDescription">
         ///     A short description of the operation (used in error messages if the request fails).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional resource version to start watching from (if not specified, the API server starts the watch from its most recent resource version).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish <see cref="ResourceEventType.Bookmark"/> events (whose resource only has a resource version) to subscribers?
+        ///
+        ///     Useful for subscribers that track the resource version to resume from (e.g. <see cref="Informers.KubeResourceInformer{TResource}"/>). Default is <c>false</c>.
+        /// </param>
         /// <returns>
         ///     The <see cref="IObservable{T}"/>.
         /// </returns>
-        /// <remarks>If you have custom model types you need to deserialise, ensure that their assemblies are added to <see cref="KubeClientOptions.ModelTypeAssemblies"/>.</remarks>
-        protected IObservable<IResourceEventV1<KubeResourceV1>> ObserveEventsDynamic(HttpRequest request, string operationDescription)
+        /// <remarks>
+        ///     If you have custom model types you need to deserialise, ensure that their assemblies are added to <see cref="KubeClientOptions.ModelTypeAssemblies"/>.
+        ///
+        ///     Watch bookmarks are requested from the API server, and used to advance the resource version that the watch resumes from if it is reconnected (bookmarks for well-known model types are never deserialised).
+        /// </remarks>
+        protected IObservable<IResourceEventV1<KubeResourceV1>> ObserveEventsDynamic(HttpRequest request, string operationDescription, string resourceVersion = null, bool includeBookmarks = false)
         {
             if (request == null)
                 throw new ArgumentNullException(nameof(request));
@@ -481,6 +807,10 @@ namespace KubeClient.ResourceClients
             if (String.IsNullOrWhiteSpace(operationDescription))
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'operationDescription'.", nameof(operationDescription));
 
+            request = request.WithQueryParameter("allowWatchBookmarks", true);
+            if (!String.IsNullOrWhiteSpace(resourceVersion))
+                request = request.WithQueryParameter("resourceVersion", resourceVersion);
+
             JsonSerializer eventSerializer = JsonSerializer.Create(
                 request.GetFormatters().Values.GetJsonSerializerSettings()
             );
@@ -502,31 +832,168 @@ namespace KubeClient.ResourceClients
                         HttpRequest currentRequest = request;
 
                         if (!String.IsNullOrWhiteSpace(lastObservedResourceVersion))
+                        {
                             currentRequest = currentRequest.WithQueryParameter("resourceVersion", lastObservedResourceVersion);
 
+                            WatchStatistics.RecordReconnect();
+                        }
+
                         return currentRequest;
                     },
+                    lineSelector: (line, lineLength) =>
+                    {
+                        string eventType = WatchEventReader.ReadEventType(line, lineLength);
+                        if (WatchEventReader.IsBookmark(eventType))
+                        {
+                            (string kind, string apiVersion, string bookmarkResourceVersion) = WatchEventReader.ReadBookmark(line, lineLength);
+
+                            lastObservedResourceVersion = RecordBookmark(bookmarkResourceVersion) ?? lastObservedResourceVersion;
+                            if (!includeBookmarks)
+                                return null;
+
+                            // Custom model types are not known here, so their bookmarks (which are tiny) are deserialised as usual.
+                            KubeResourceV1 bookmarkResource = CreateBookmarkResource<KubeResourceV1>(kind, apiVersion);
+                            if (bookmarkResource != null)
+                                return CreateBookmarkEvent(bookmarkResource, bookmarkResourceVersion);
+                        }
+                        else if (WatchEventReader.IsError(eventType))
+                            throw new KubeApiException($"Unable to {operationDescription}.", WatchEventReader.ReadErrorStatus(line, lineLength, eventSerializer));
+
+                        // Each event is deserialised directly from the (pooled) line buffer, in a single pass (ResourceEventV1Converter reads forward-only, and dispatches on the resource's kind / apiVersion as soon as it has seen them).
+                        using (JsonTextReader lineJsonReader = WatchEventReader.CreateReader(line, lineLength))
+                        {
+                            try
+                            {
+                                return eventSerializer.Deserialize<ResourceEventV1<KubeResourceV1>>(lineJsonReader);
+                            }
+                            catch (KubeApiException eventError) // Error event.
+                            {
+                                throw new KubeApiException($"Unable to {operationDescription}.", eventError.Status);
+                            }
+                        }
+                    },
                     shouldRetry: exception => exception == null // Only retry if there was no exception
                 )
-                .Do(
-                    line => CheckForEventError(line, operationDescription)
+                .Where(
+                    resourceEvent => resourceEvent != null // Bookmarks that are not published.
                 )
-                .Select(line =>
-                {
-                    IResourceEventV1<KubeResourceV1> resourceEvent;
-
-                    using (StringReader lineReader = new StringReader(line))
-                    using (JsonReader lineJsonReader = new JsonTextReader(lineReader))
+                .Do(
+                    resourceEvent => lastObservedResourceVersion = RecordEvent(resourceEvent) ?? lastObservedResourceVersion,
+                    watchError =>
                     {
-                        resourceEvent = eventSerializer.Deserialize<ResourceEventV1<KubeResourceV1>>(lineJsonReader);
+                        // Don't try to resume from a resource version that the API server no longer has (the subscriber is expected to list resources again, and re-subscribe).
+                        if (WatchEventReader.IsResourceVersionExpired(watchError))
+                        {
+                            lastObservedResourceVersion = null;
+
+                            WatchStatistics.RecordExpiration();
+                        }
                     }
+                );
+        }
 
-                    return resourceEvent;
-                })
-                .Do(resourceEvent =>
-                {
-                    lastObservedResourceVersion = resourceEvent.Resource.Metadata.ResourceVersion;
-                });
+        /// <summary>
+        ///     Create an empty resource to represent a bookmark.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The resource type that the watch relates to.
+        /// </typeparam>
+        /// <param name="kind">
+        ///     The bookmark object's kind (if known).
+        /// </param>
+        /// <param name="apiVersion">
+        ///     The bookmark object's apiVersion (if known).
+        /// </param>
+        /// <returns>
+        ///     The resource, or <c>null</c> if <typeparamref name="TResource"/> is abstract and the bookmark's kind / apiVersion do not identify a well-known model type derived from it.
+        /// </returns>
+        static TResource CreateBookmarkResource<TResource>(string kind, string apiVersion)
+            where TResource : KubeResourceV1
+        {
+            Type resourceType = typeof(TResource);
+            if (resourceType.IsAbstract)
+            {
+                if (kind == null || apiVersion == null || !KnownModels.TryGetResourceType(kind, apiVersion, out resourceType))
+                    return null;
+
+                if (!typeof(TResource).IsAssignableFrom(resourceType))
+                    return null;
+            }
+
+            return (TResource)Activator.CreateInstance(resourceType);
+        }
+
+        /// <summary>
+        ///     Create a <see cref="ResourceEventType.Bookmark"/> event.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The resource type that the event relates to.
+        /// </typeparam>
+        /// <param name="resource">
+        ///     An empty resource to represent the bookmark.
+        /// </param>
+        /// <param name="resourceVersion">
+        ///     The bookmark's resource version.
+        /// </param>
+        /// <returns>
+        ///     The bookmark event.
+        /// </returns>
+        static IResourceEventV1<TResource> CreateBookmarkEvent<TResource>(TResource resource, string resourceVersion)
+            where TResource : KubeResourceV1
+        {
+            resource.Metadata = new ObjectMetaV1
+            {
+                ResourceVersion = resourceVersion
+            };
+
+            return new ResourceEventV1<TResource>
+            {
+                EventType = ResourceEventType.Bookmark,
+                Resource = resource
+            };
+        }
+
+        /// <summary>
+        ///     Record an observed event in the client's <see cref="WatchStatistics"/>.
+        /// </summary>
+        /// <typeparam name="TResource">
+        ///     The resource type that the event relates to.
+        /// </typeparam>
+        /// <param name="resourceEvent">
+        ///     The event.
+        /// </param>
+        /// <returns>
+        ///     The event's resource version (or <c>null</c>, if the event does not have one, or is a bookmark).
+        /// </returns>
+        /// <remarks>
+        ///     Bookmarks are recorded (see <see cref="RecordBookmark"/>) as soon as they are read, whether or not they are published.
+        /// </remarks>
+        string RecordEvent<TResource>(IResourceEventV1<TResource> resourceEvent)
+            where TResource : KubeResourceV1
+        {
+            if (resourceEvent.EventType == ResourceEventType.Bookmark)
+                return null;
+
+            string resourceVersion = resourceEvent.Resource?.Metadata?.ResourceVersion;
+            WatchStatistics.RecordResourceVersion(resourceVersion);
+
+            return resourceVersion;
+        }
+
+        /// <summary>
+        ///     Record a bookmark in the client's <see cref="WatchStatistics"/>.
+        /// </summary>
+        /// <param name="resourceVersion">
+        ///     The bookmark's resource version.
+        /// </param>
+        /// <returns>
+        ///     The bookmark's resource version (or <c>null</c>, if the bookmark does not have one).
+        /// </returns>
+        string RecordBookmark(string resourceVersion)
+        {
+            WatchStatistics.RecordBookmark(resourceVersion);
+
+            return String.IsNullOrWhiteSpace(resourceVersion) ? null : resourceVersion;
         }
 
         /// <summary>
@@ -586,7 +1053,51 @@ namespace KubeClient.ResourceClients
             if (String.IsNullOrWhiteSpace(operationDescription))
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'operationDescription'.", nameof(operationDescription));
 
-            return Observable.Create<string>(async (subscriber, subscriptionCancellationToken) =>
+            return ObserveLines(requestFactory, operationDescription,
+                lineSelector: (line, lineLength) => new String(line, 0, lineLength),
+                bufferSize
+            );
+        }
+
+        /// <summary>
+        ///     Get an <see cref="IObservable{T}"/> for values selected from lines streamed from an HTTP GET request.
+        /// </summary>
+        /// <typeparam name="TLine">
+        ///     The type of value selected from each line.
+        /// </typeparam>
+        /// <param name="requestFactory">
+        ///     A delegate that produces the <see cref="HttpRequest"/> to execute.
+        /// </param>
+        /// <param name="operationDescription">
+        ///     A short description of the operation (used in error messages if the request fails).
+        /// </param>
+        /// <param name="lineSelector">
+        ///     A delegate that selects a value from the characters of a line (and the number of characters in the line).
+        ///     
+        ///     <para>
+        ///         The line's characters are in a pooled buffer that is reused once the delegate returns, so the delegate must not retain a reference to it.
+        ///     </para>
+        /// </param>
+        /// <param name="bufferSize">
+        ///     The buffer size to use when streaming data.
+        /// 
+        ///     Default is 2048 bytes.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="IObservable{T}"/>.
+        /// </returns>
+        protected IObservable<TLine> ObserveLines<TLine>(Func<HttpRequest> requestFactory, string operationDescription, Func<char[], int, TLine> lineSelector, int bufferSize = DefaultStreamingBufferSize)
+        {
+            if (requestFactory == null)
+                throw new ArgumentNullException(nameof(requestFactory));
+
+            if (String.IsNullOrWhiteSpace(operationDescription))
+                throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'operationDescription'.", nameof(operationDescription));
+
+            if (lineSelector == null)
+                throw new ArgumentNullException(nameof(lineSelector));
+
+            return Observable.Create<TLine>(async (subscriber, subscriptionCancellationToken) =>
             {
                 // NOTE: The CancellationToken above represents the subscriber (i.e. IObserver) subscription to this sequence (i.e. IObservable), and is canceled only when their subscription is disposed.
 
@@ -621,61 +1132,80 @@ namespace KubeClient.ResourceClients
 
                         using (Stream responseStream = await responseMessage.Content.ReadAsStreamAsync().ConfigureAwait(false))
                         {
-                            StringBuilder lineBuilder = new StringBuilder();
+                            // Buffers are pooled (and lines are only copied into strings if the line selector does so).
+                            byte[] buffer = ArrayPool<byte>.Shared.Rent(bufferSize);
+                            char[] decodedCharacters = ArrayPool<char>.Shared.Rent(encoding.GetMaxCharCount(bufferSize));
+                            char[] line = ArrayPool<char>.Shared.Rent(bufferSize);
+                            int lineLength = 0;
 
-                            byte[] buffer = new byte[bufferSize];
-                            int bytesRead = await responseStream.ReadAsync(buffer, 0, buffer.Length, subscriptionCancellationToken).ConfigureAwait(false);
-                            while (bytesRead > 0)
+                            try
                             {
-                                // AF: Slightly inefficient because we wind up scanning the buffer twice.
-                                char[] decodedCharacters = new char[decoder.GetCharCount(buffer, 0, bytesRead)];
-                                int charactersDecoded = decoder.GetChars(buffer, 0, bytesRead, decodedCharacters, 0);
-                                for (int charIndex = 0; charIndex < charactersDecoded; charIndex++)
+                                int bytesRead = await responseStream.ReadAsync(buffer, 0, bufferSize, subscriptionCancellationToken).ConfigureAwait(false);
+                                while (bytesRead > 0)
                                 {
-                                    const char CR = '\r';
-                                    const char LF = '\n';
-
-                                    char decodedCharacter = decodedCharacters[charIndex];
-                                    switch (decodedCharacter)
+                                    int charactersDecoded = decoder.GetChars(buffer, 0, bytesRead, decodedCharacters, 0);
+                                    for (int charIndex = 0; charIndex < charactersDecoded; charIndex++)
                                     {
-                                        case CR:
+                                        const char CR = '\r';
+                                        const char LF = '\n';
+
+                                        char decodedCharacter = decodedCharacters[charIndex];
+                                        switch (decodedCharacter)
                                         {
-                                            if (charIndex < charactersDecoded - 1 && decodedCharacters[charIndex + 1] == LF)
+                                            case CR:
                                             {
-                                                charIndex++;
+                                                if (charIndex < charactersDecoded - 1 && decodedCharacters[charIndex + 1] == LF)
+                                                {
+                                                    charIndex++;
 
-                                                goto case LF;
+                                                    goto case LF;
+                                                }
+
+                                                break;
                                             }
+                                            case LF:
+                                            {
+                                                TLine selectedLine = lineSelector(line, lineLength);
+                                                lineLength = 0;
 
-                                            break;
-                                        }
-                                        case LF:
-                                        {
-                                            string line = lineBuilder.ToString();
-                                            lineBuilder.Clear();
+                                                subscriber.OnNext(selectedLine);
+
+                                                break;
+                                            }
+                                            default:
+                                            {
+                                                if (lineLength == line.Length)
+                                                {
+                                                    char[] largerLine = ArrayPool<char>.Shared.Rent(line.Length * 2);
+                                                    Array.Copy(line, largerLine, lineLength);
+                                                    ArrayPool<char>.Shared.Return(line);
 
-                                            subscriber.OnNext(line);
+                                                    line = largerLine;
+                                                }
 
-                                            break;
-                                        }
-                                        default:
-                                        {
-                                            lineBuilder.Append(decodedCharacter);
+                                                line[lineLength++] = decodedCharacter;
 
-                                            break;
+                                                break;
+                                            }
                                         }
                                     }
+
+                                    bytesRead = await responseStream.ReadAsync(buffer, 0, bufferSize, subscriptionCancellationToken).ConfigureAwait(false);
                                 }
 
-                                bytesRead = await responseStream.ReadAsync(buffer, 0, buffer.Length, subscriptionCancellationToken).ConfigureAwait(false);
+                                // If stream doesn't end with a line-terminator sequence, publish trailing characters as the last line.
+                                if (lineLength > 0)
+                                {
+                                    subscriber.OnNext(
+                                        lineSelector(line, lineLength)
+                                    );
+                                }
                             }
-
-                            // If stream doesn't end with a line-terminator sequence, publish trailing characters as the last line.
-                            if (lineBuilder.Length > 0)
+                            finally
                             {
-                                subscriber.OnNext(
-                                    lineBuilder.ToString()
-                                );
+                                ArrayPool<char>.Shared.Return(line);
+                                ArrayPool<char>.Shared.Return(decodedCharacters);
+                                ArrayPool<byte>.Shared.Return(buffer);
                             }
                         }
                     }
@@ -736,6 +1266,50 @@ namespace KubeClient.ResourceClients
         ///     The <see cref="IObservable{T}"/>.
         /// </returns>
         protected IObservable<string> ObserveLinesWithRetry(string operationDescription, Func<HttpRequest> requestFactory, Func<Exception, bool> shouldRetry, int bufferSize = DefaultStreamingBufferSize)
+        {
+            return ObserveLinesWithRetry(operationDescription, requestFactory,
+                lineSelector: (line, lineLength) => new String(line, 0, lineLength),
+                shouldRetry,
+                bufferSize
+            );
+        }
+
+        /// <summary>
+        ///     Get an <see cref="IObservable{T}"/> (with automatic retry) for values selected from lines streamed from an HTTP GET request.
+        /// </summary>
+        /// <typeparam name="TLine">
+        ///     The type of value selected from each line.
+        /// </typeparam>
+        /// <param name="operationDescription">
+        ///     A short description of the operation (used in error messages if the request fails).
+        /// </param>
+        /// <param name="requestFactory">
+        ///     A delegate that produces the <see cref="HttpRequest"/> to execute.
+        /// </param>
+        /// <param name="lineSelector">
+        ///     A delegate that selects a value from the characters of a line (and the number of characters in the line).
+        ///     
+        ///     <para>
+        ///         The line's characters are in a pooled buffer that is reused once the delegate returns, so the delegate must not retain a reference to it.
+        ///     </para>
+        /// </param>
+        /// <param name="shouldRetry">
+        ///     A delegate that returns <c>true</c>, if the operation should be retried (i.e. sequence continues); otherwise, <c>false</c>.
+        ///     
+        ///     <para>
+        ///         If the retry is due to successful completion of the underlying sequence of lines (<see cref="IObserver{T}.OnCompleted"/>), the exception passed to the delegate be <c>null</c>.
+        ///         If the retry is due to an exception (<see cref="IObserver{T}.OnError(Exception)"/>), the exception will be passed to the delegate.
+        ///     </para>
+        /// </param>
+        /// <param name="bufferSize">
+        ///     The buffer size to use when streaming data.
+        /// 
+        ///     Default is 2048 bytes.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="IObservable{T}"/>.
+        /// </returns>
+        protected IObservable<TLine> ObserveLinesWithRetry<TLine>(string operationDescription, Func<HttpRequest> requestFactory, Func<char[], int, TLine> lineSelector, Func<Exception, bool> shouldRetry, int bufferSize = DefaultStreamingBufferSize)
         {
             if (requestFactory == null)
                 throw new ArgumentNullException(nameof(requestFactory));
@@ -743,14 +1317,15 @@ namespace KubeClient.ResourceClients
             if (String.IsNullOrWhiteSpace(operationDescription))
                 throw new ArgumentException($"Argument cannot be null, empty, or entirely composed of whitespace: {nameof(operationDescription)}.", nameof(operationDescription));
 
+            if (lineSelector == null)
+                throw new ArgumentNullException(nameof(lineSelector));
+
             if (shouldRetry == null)
                 throw new ArgumentNullException(nameof(shouldRetry));
 
-            HttpRequest currentRequest = requestFactory();
-
             ILogger logger = LoggerFactory.CreateLogger(GetType());
 
-            return ObserveLines(requestFactory, operationDescription, bufferSize)
+            return ObserveLines(requestFactory, operationDescription, lineSelector, bufferSize)
                 .RetryWhen(exceptions => Observable.Create((IObserver<Unit> retrySignal) =>
                 {
                     return exceptions.Subscribe(
@@ -789,25 +1364,5 @@ namespace KubeClient.ResourceClients
                     );
                 }));
         }
-
-        /// <summary>
-        ///     Check if an error was encountered in an event stream.
-        /// </summary>
-        /// <param name="line">
-        ///     The current line in the event stream.
-        /// </param>
-        /// <param name="operationDescription">
-        ///     A short description of the operation being performed (used in exception message if an error is encountered).
-        /// </param>
-        static void CheckForEventError(string line, string operationDescription)
-        {
-            JToken watchEvent = JToken.Parse(line);
-            if (!watchEvent.SelectToken("type").Value<string>().Equals("error", StringComparison.OrdinalIgnoreCase))
-                return;
-
-            StatusV1 status = watchEvent.SelectToken("object").ToObject<StatusV1>();
-
-            throw new KubeApiException($"Unable to {operationDescription}.", status);
-        }
     }
 }
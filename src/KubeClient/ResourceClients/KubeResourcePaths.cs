@@ -0,0 +1,82 @@
+using System;
+using System.Text;
+
+namespace KubeClient.ResourceClients
+{
+    /// <summary>
+    ///     Precompiled request paths for Kubernetes resource APIs.
+    /// </summary>
+    /// <remarks>
+    ///     Each path is assembled directly from its (escaped) segments, so (unlike a request template) nothing needs to be parsed or evaluated when a request is built.
+    ///
+    ///     The paths for each API are generated (see generate_models.py); use them with <see cref="KubeResourceClient"/>'s CreateRequest method.
+    /// </remarks>
+    public static partial class KubeResourcePaths
+    {
+        /// <summary>
+        ///     Escape a value for use as a path segment.
+        /// </summary>
+        /// <param name="value">
+        ///     The value (e.g. a resource name or namespace).
+        /// </param>
+        /// <param name="parameterName">
+        ///     The name of the parameter that supplied the value (used in error messages if the value is missing).
+        /// </param>
+        /// <returns>
+        ///     The escaped value (the same string instance, if no characters need to be escaped).
+        /// </returns>
+        static string Segment(string value, string parameterName)
+        {
+            if (String.IsNullOrWhiteSpace(value))
+                throw new ArgumentException($"Argument cannot be null, empty, or entirely composed of whitespace: '{parameterName}'.", parameterName);
+
+            return Uri.EscapeDataString(value);
+        }
+
+        /// <summary>
+        ///     Append the query parameters for a collection-level request to its path.
+        /// </summary>
+        /// <param name="path">
+        ///     The collection path.
+        /// </param>
+        /// <param name="labelSelector">
+        ///     An optional Kubernetes label selector expression used to filter the resources.
+        /// </param>
+        /// <param name="fieldSelector">
+        ///     An optional Kubernetes field selector expression used to filter the resources.
+        /// </param>
+        /// <param name="watch">
+        ///     Watch for changes to the resources (rather than listing them)?
+        /// </param>
+        /// <returns>
+        ///     The path and query (the same string instance as <paramref name="path"/>, if there are no query parameters).
+        /// </returns>
+        static string WithQuery(string path, string labelSelector, string fieldSelector, bool watch)
+        {
+            bool hasLabelSelector = !String.IsNullOrEmpty(labelSelector);
+            bool hasFieldSelector = !String.IsNullOrEmpty(fieldSelector);
+            if (!hasLabelSelector && !hasFieldSelector && !watch)
+                return path;
+
+            StringBuilder pathAndQuery = new StringBuilder(path,
+                capacity: path.Length + (labelSelector?.Length ?? 0) + (fieldSelector?.Length ?? 0) + 64
+            );
+
+            char separator = '?';
+            if (hasLabelSelector)
+            {
+                pathAndQuery.Append(separator).Append("labelSelector=").Append(Uri.EscapeDataString(labelSelector));
+                separator = '&';
+            }
+            if (hasFieldSelector)
+            {
+                pathAndQuery.Append(separator).Append("fieldSelector=").Append(Uri.EscapeDataString(fieldSelector));
+                separator = '&';
+            }
+            if (watch)
+                pathAndQuery.Append(separator).Append("watch=true");
+
+            return pathAndQuery.ToString();
+        }
+    }
+}
@@ -0,0 +1,133 @@
+using System;
+using System.Threading;
+
+namespace KubeClient.ResourceClients
+{
+    /// <summary>
+    ///     Thread-safe counters that describe the health of one or more resource watches (reconnects, relists, bookmarks, and expired resource versions).
+    /// </summary>
+    /// <remarks>
+    ///     A rising <see cref="Relists"/> / <see cref="Expirations"/> count (or a large <see cref="BookmarkAge"/>) usually means that watches are being restarted without a usable resource version, which is expensive for the API server.
+    /// </remarks>
+    public sealed class KubeWatchStatistics
+    {
+        /// <summary>
+        ///     The number of times a watch has been reconnected (resuming from a previously-observed resource version).
+        /// </summary>
+        long _reconnects;
+
+        /// <summary>
+        ///     The number of times resources have been listed again (rather than resuming a watch).
+        /// </summary>
+        long _relists;
+
+        /// <summary>
+        ///     The number of bookmark events received.
+        /// </summary>
+        long _bookmarks;
+
+        /// <summary>
+        ///     The number of times the API server has reported that a watch's resource version is too old (i.e. "410 Gone").
+        /// </summary>
+        long _expirations;
+
+        /// <summary>
+        ///     The time (as UTC ticks) when the last bookmark event was received, or 0 if no bookmark has been received.
+        /// </summary>
+        long _lastBookmarkTicks;
+
+        /// <summary>
+        ///     The last resource version observed (from any event, including bookmarks).
+        /// </summary>
+        string _lastResourceVersion;
+
+        /// <summary>
+        ///     The number of times a watch has been reconnected (resuming from a previously-observed resource version).
+        /// </summary>
+        public long Reconnects => Interlocked.Read(ref _reconnects);
+
+        /// <summary>
+        ///     The number of times resources have been listed again (rather than resuming a watch).
+        /// </summary>
+        /// <remarks>
+        ///     Relists are performed (and recorded) by a <see cref="Informers.KubeResourceInformer{TResource}"/> that shares these statistics.
+        /// </remarks>
+        public long Relists => Interlocked.Read(ref _relists);
+
+        /// <summary>
+        ///     The number of bookmark events received.
+        /// </summary>
+        public long Bookmarks => Interlocked.Read(ref _bookmarks);
+
+        /// <summary>
+        ///     The number of times the API server has reported that a watch's resource version is too old (i.e. "410 Gone").
+        /// </summary>
+        public long Expirations => Interlocked.Read(ref _expirations);
+
+        /// <summary>
+        ///     The time (UTC) when the last bookmark event was received (or <c>null</c>, if no bookmark has been received).
+        /// </summary>
+        public DateTime? LastBookmarkTime
+        {
+            get
+            {
+                long lastBookmarkTicks = Interlocked.Read(ref _lastBookmarkTicks);
+                if (lastBookmarkTicks == 0)
+                    return null;
+
+                return new DateTime(lastBookmarkTicks, DateTimeKind.Utc);
+            }
+        }
+
+        /// <summary>
+        ///     The time elapsed since the last bookmark event was received (or <c>null</c>, if no bookmark has been received).
+        /// </summary>
+        public TimeSpan? BookmarkAge => DateTime.UtcNow - LastBookmarkTime;
+
+        /// <summary>
+        ///     The last resource version observed (from any event, including bookmarks).
+        /// </summary>
+        public string LastResourceVersion => Volatile.Read(ref _lastResourceVersion);
+
+        /// <summary>
+        ///     Record that a watch has been reconnected.
+        /// </summary>
+        internal void RecordReconnect() => Interlocked.Increment(ref _reconnects);
+
+        /// <summary>
+        ///     Record that resources have been listed again.
+        /// </summary>
+        internal void RecordRelist() => Interlocked.Increment(ref _relists);
+
+        /// <summary>
+        ///     Record that the API server has reported that a watch's resource version is too old.
+        /// </summary>
+        internal void RecordExpiration() => Interlocked.Increment(ref _expirations);
+
+        /// <summary>
+        ///     Record that a bookmark event has been received.
+        /// </summary>
+        /// <param name="resourceVersion">
+        ///     The bookmark's resource version.
+        /// </param>
+        internal void RecordBookmark(string resourceVersion)
+        {
+            Interlocked.Increment(ref _bookmarks);
+            Interlocked.Exchange(ref _lastBookmarkTicks, DateTime.UtcNow.Ticks);
+
+            RecordResourceVersion(resourceVersion);
+        }
+
+        /// <summary>
+        ///     Record the resource version of an observed event.
+        /// </summary>
+        /// <param name="resourceVersion">
+        ///     The resource version (ignored if <c>null</c> or empty).
+        /// </param>
+        internal void RecordResourceVersion(string resourceVersion)
+        {
+            if (!String.IsNullOrWhiteSpace(resourceVersion))
+                Volatile.Write(ref _lastResourceVersion, resourceVersion);
+        }
+    }
+}
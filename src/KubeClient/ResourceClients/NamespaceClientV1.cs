@@ -42,10 +42,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
             return await GetSingleResource<NamespaceV1>(
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name
-                }),
+                CreateRequest(KubeResourcePaths.NamespacesV1.ByName(name)),
                 cancellationToken: cancellationToken
             );
         }
@@ -65,10 +62,7 @@ namespace KubeClient.ResourceClients
         public async Task<NamespaceListV1> List(string labelSelector = null, CancellationToken cancellationToken = default)
         {
             return await GetResourceList<NamespaceListV1>(
-                Requests.Collection.WithTemplateParameters(new
-                {
-                    LabelSelector = labelSelector
-                }),
+                CreateRequest(KubeResourcePaths.NamespacesV1.Collection(labelSelector)),
                 cancellationToken: cancellationToken
             );
         }
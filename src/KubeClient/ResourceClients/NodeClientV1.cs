@@ -44,10 +44,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
             return await GetSingleResource<NodeV1>(
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name
-                }),
+                CreateRequest(KubeResourcePaths.NodesV1.ByName(name)),
                 cancellationToken: cancellationToken
             );
         }
@@ -67,10 +64,7 @@ namespace KubeClient.ResourceClients
         public async Task<NodeListV1> List(string labelSelector = null, CancellationToken cancellationToken = default)
         {
             return await GetResourceList<NodeListV1>(
-                Requests.Collection.WithTemplateParameters(new
-                {
-                    LabelSelector = labelSelector
-                }),
+                CreateRequest(KubeResourcePaths.NodesV1.Collection(labelSelector)),
                 cancellationToken: cancellationToken
             );
         }
@@ -81,10 +75,16 @@ namespace KubeClient.ResourceClients
         /// <param name="labelSelector">
         ///     An optional Kubernetes label selector expression used to filter the Nodes.
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        public IObservable<IResourceEventV1<NodeV1>> WatchAll(string labelSelector = null)
+        public IObservable<IResourceEventV1<NodeV1>> WatchAll(string labelSelector = null, string resourceVersion = null, bool includeBookmarks = false)
         {
             return ObserveEvents<NodeV1>(
                 Requests.Collection.WithTemplateParameters(new
@@ -92,7 +92,9 @@ namespace KubeClient.ResourceClients
                     LabelSelector = labelSelector,
                     Watch = true
                 }),
-                operationDescription: $"watch all v1/nodes with label selector '{labelSelector ?? "<none>"}'"
+                operationDescription: $"watch all v1/nodes with label selector '{labelSelector ?? "<none>"}'",
+                resourceVersion: resourceVersion,
+                includeBookmarks: includeBookmarks
             );
         }
 
@@ -146,10 +148,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentNullException(nameof(patchAction));
 
             return await PatchResource(patchAction,
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name,
-                }),
+                CreateRequest(KubeResourcePaths.NodesV1.ByName(name)),
                 cancellationToken
             );
         }
@@ -236,10 +235,16 @@ namespace KubeClient.ResourceClients
         /// <param name="labelSelector">
         ///     An optional Kubernetes label selector expression used to filter the Nodes.
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        IObservable<IResourceEventV1<NodeV1>> WatchAll(string labelSelector = null);
+        IObservable<IResourceEventV1<NodeV1>> WatchAll(string labelSelector = null, string resourceVersion = null, bool includeBookmarks = false);
 
         /// <summary>
         ///     Request creation of a <see cref="NodeV1"/>.
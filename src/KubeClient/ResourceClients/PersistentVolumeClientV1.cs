@@ -43,10 +43,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
             return await GetSingleResource<PersistentVolumeV1>(
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name
-                }),
+                CreateRequest(KubeResourcePaths.PersistentVolumesV1.ByName(name)),
                 cancellationToken: cancellationToken
             );
         }
@@ -66,10 +63,7 @@ namespace KubeClient.ResourceClients
         public async Task<PersistentVolumeListV1> List(string labelSelector = null, CancellationToken cancellationToken = default)
         {
             return await GetResourceList<PersistentVolumeListV1>(
-                Requests.Collection.WithTemplateParameters(new
-                {
-                    LabelSelector = labelSelector
-                }),
+                CreateRequest(KubeResourcePaths.PersistentVolumesV1.Collection(labelSelector)),
                 cancellationToken: cancellationToken
             );
         }
@@ -80,10 +74,16 @@ namespace KubeClient.ResourceClients
         /// <param name="labelSelector">
         ///     An optional Kubernetes label selector expression used to filter the PersistentVolumes.
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        public IObservable<IResourceEventV1<PersistentVolumeV1>> WatchAll(string labelSelector = null)
+        public IObservable<IResourceEventV1<PersistentVolumeV1>> WatchAll(string labelSelector = null, string resourceVersion = null, bool includeBookmarks = false)
         {
             return ObserveEvents<PersistentVolumeV1>(
                 Requests.Collection.WithTemplateParameters(new
@@ -91,7 +91,9 @@ namespace KubeClient.ResourceClients
                     LabelSelector = labelSelector,
                     Watch = true
                 }),
-                operationDescription: $"watch all v1/PersistentVolumes with label selector '{labelSelector ?? "<none>"}'"
+                operationDescription: $"watch all v1/PersistentVolumes with label selector '{labelSelector ?? "<none>"}'",
+                resourceVersion: resourceVersion,
+                includeBookmarks: includeBookmarks
             );
         }
 
@@ -203,10 +205,16 @@ namespace KubeClient.ResourceClients
         /// <param name="labelSelector">
         ///     An optional Kubernetes label selector expression used to filter the PersistentVolumes.
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        IObservable<IResourceEventV1<PersistentVolumeV1>> WatchAll(string labelSelector = null);
+        IObservable<IResourceEventV1<PersistentVolumeV1>> WatchAll(string labelSelector = null, string resourceVersion = null, bool includeBookmarks = false);
 
         /// <summary>
         ///     Request creation of a <see cref="PersistentVolumeV1"/>.
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Net.Http;
 using System.Threading;
 using System.Threading.Tasks;
@@ -46,11 +47,7 @@ namespace KubeClient.ResourceClients
                 throw new ArgumentException("Argument cannot be null, empty, or entirely composed of whitespace: 'name'.", nameof(name));
 
             return await GetSingleResource<PodV1>(
-                Requests.ByName.WithTemplateParameters(new
-                {
-                    Name = name,
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace
-                }),
+                CreateRequest(KubeResourcePaths.PodsV1.ByName(name, kubeNamespace ?? KubeClient.DefaultNamespace)),
                 cancellationToken: cancellationToken
             );
         }
@@ -76,12 +73,42 @@ namespace KubeClient.ResourceClients
         public async Task<PodListV1> List(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, CancellationToken cancellationToken = default)
         {
             return await GetResourceList<PodListV1>(
-                Requests.Collection.WithTemplateParameters(new
-                {
-                    Namespace = kubeNamespace ?? KubeClient.DefaultNamespace,
-                    LabelSelector = labelSelector,
-                    FieldSelector = fieldSelector
-                }),
+                CreateRequest(KubeResourcePaths.PodsV1.Collection(kubeNamespace ?? KubeClient.DefaultNamespace, labelSelector, fieldSelector)),
+                cancellationToken: cancellationToken
+            );
+        }
+
+        /// <summary>
+        ///     Enumerate all Pods in the specified namespace (optionally matching a label selector), retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="labelSelector">
+        ///     An optional Kubernetes label selector expression used to filter the Pods.
+        /// </param>
+        /// <param name="fieldSelector">
+        ///     An optional Kubernetes field selector expression used to filter the Pods.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of Pods to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while Pods from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each <see cref="PodV1"/> as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        public IAsyncEnumerable<PodV1> ListPaged(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, int pageSize = DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default)
+        {
+            return EnumerateResourceList<PodV1>(
+                CreateRequest(KubeResourcePaths.PodsV1.Collection(kubeNamespace ?? KubeClient.DefaultNamespace, labelSelector, fieldSelector)),
+                operationDescription: $"list v1/Pods with label selector '{labelSelector ?? "<none>"}' and field selector '{fieldSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}",
+                pageSize: pageSize,
+                prefetchNextPage: prefetchNextPage,
                 cancellationToken: cancellationToken
             );
         }
@@ -98,10 +125,16 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        public IObservable<IResourceEventV1<PodV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null)
+        public IObservable<IResourceEventV1<PodV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, string resourceVersion = null, bool includeBookmarks = false)
         {
             return ObserveEvents<PodV1>(
                 Requests.Collection.WithTemplateParameters(new
@@ -111,7 +144,9 @@ namespace KubeClient.ResourceClients
                     FieldSelector = fieldSelector,
                     Watch = true
                 }),
-                operationDescription: $"watch all v1/Pods with label selector '{labelSelector ?? "<none>"}' and field selector '{fieldSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}"
+                operationDescription: $"watch all v1/Pods with label selector '{labelSelector ?? "<none>"}' and field selector '{fieldSelector ?? "<none>"}' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}",
+                resourceVersion: resourceVersion,
+                includeBookmarks: includeBookmarks
             );
         }
 
@@ -338,6 +373,32 @@ namespace KubeClient.ResourceClients
         /// </returns>
         Task<PodListV1> List(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, CancellationToken cancellationToken = default);
 
+        /// <summary>
+        ///     Enumerate all Pods in the specified namespace (optionally matching a label selector), retrieving them in pages (chunks) of limited size.
+        /// </summary>
+        /// <param name="labelSelector">
+        ///     An optional Kubernetes label selector expression used to filter the Pods.
+        /// </param>
+        /// <param name="fieldSelector">
+        ///     An optional Kubernetes field selector expression used to filter the Pods.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
+        /// </param>
+        /// <param name="pageSize">
+        ///     The maximum number of Pods to retrieve per request.
+        /// </param>
+        /// <param name="prefetchNextPage">
+        ///     Request the next page while Pods from the current page are still being enumerated?
+        /// </param>
+        /// <param name="cancellationToken">
+        ///     An optional <see cref="CancellationToken"/> that can be used to cancel enumeration.
+        /// </param>
+        /// <returns>
+        ///     An <see cref="IAsyncEnumerable{T}"/> that yields each <see cref="PodV1"/> as soon as it has been received (without buffering the entire list).
+        /// </returns>
+        IAsyncEnumerable<PodV1> ListPaged(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, int pageSize = KubeResourceClient.DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default);
+
         /// <summary>
         ///     Watch for events relating to Pods.
         /// </summary>
@@ -350,10 +411,16 @@ namespace KubeClient.ResourceClients
         /// <param name="kubeNamespace">
         ///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).
         /// </param>
+        /// <param name="resourceVersion">
+        ///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).
+        /// </param>
+        /// <param name="includeBookmarks">
+        ///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?
+        /// </param>
         /// <returns>
         ///     An <see cref="IObservable{T}"/> representing the event stream.
         /// </returns>
-        IObservable<IResourceEventV1<PodV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null);
+        IObservable<IResourceEventV1<PodV1>> WatchAll(string labelSelector = null, string fieldSelector = null, string kubeNamespace = null, string resourceVersion = null, bool includeBookmarks = false);
 
         /// <summary>
         ///     Get the combined logs for the Pod with the specified name.
@@ -0,0 +1,272 @@
+using Newtonsoft.Json;
+using System;
+using System.IO;
+using System.Net.Http;
+
+namespace KubeClient.ResourceClients
+{
+    using Http;
+    using Models;
+    using Utilities;
+
+    /// <summary>
+    ///     Forward-only readers for the parts of a watch event (in a pooled line buffer) that are needed before (or instead of) deserialising the whole event.
+    /// </summary>
+    static class WatchEventReader
+    {
+        /// <summary>
+        ///     The type of a bookmark event.
+        /// </summary>
+        const string BookmarkEventType = "BOOKMARK";
+
+        /// <summary>
+        ///     The type of an error event.
+        /// </summary>
+        const string ErrorEventType = "ERROR";
+
+        /// <summary>
+        ///     The status code reported by the API server when a watch is started from a resource version that is no longer available.
+        /// </summary>
+        const int StatusCodeGone = 410;
+
+        /// <summary>
+        ///     Read the type of a watch event.
+        /// </summary>
+        /// <param name="line">
+        ///     The characters of the line containing the event.
+        /// </param>
+        /// <param name="lineLength">
+        ///     The number of characters in the line.
+        /// </param>
+        /// <returns>
+        ///     The event type (or <c>null</c>, if the event does not have a type).
+        /// </returns>
+        /// <remarks>
+        ///     The API server always writes the event's "type" property first, so only the start of the line is read.
+        /// </remarks>
+        public static string ReadEventType(char[] line, int lineLength)
+        {
+            using (JsonTextReader reader = CreateReader(line, lineLength))
+            {
+                if (!ReadToProperty(reader, "type"))
+                    return null;
+
+                return reader.ReadAsString();
+            }
+        }
+
+        /// <summary>
+        ///     Determine whether the specified event type represents a bookmark event.
+        /// </summary>
+        /// <param name="eventType">
+        ///     The event type (from <see cref="ReadEventType"/>).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the event is a bookmark; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool IsBookmark(string eventType) => String.Equals(eventType, BookmarkEventType, StringComparison.OrdinalIgnoreCase);
+
+        /// <summary>
+        ///     Determine whether the specified event type represents an error event.
+        /// </summary>
+        /// <param name="eventType">
+        ///     The event type (from <see cref="ReadEventType"/>).
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the event is an error; otherwise, <c>false</c>.
+        /// </returns>
+        public static bool IsError(string eventType) => String.Equals(eventType, ErrorEventType, StringComparison.OrdinalIgnoreCase);
+
+        /// <summary>
+        ///     Read the kind, API version, and resource version of a bookmark event's object (without deserialising the object).
+        /// </summary>
+        /// <param name="line">
+        ///     The characters of the line containing the event.
+        /// </param>
+        /// <param name="lineLength">
+        ///     The number of characters in the line.
+        /// </param>
+        /// <returns>
+        ///     The object's kind, API version, and resource version (any of which may be <c>null</c>, if not present).
+        /// </returns>
+        public static (string kind, string apiVersion, string resourceVersion) ReadBookmark(char[] line, int lineLength)
+        {
+            string kind = null;
+            string apiVersion = null;
+            string resourceVersion = null;
+
+            using (JsonTextReader reader = CreateReader(line, lineLength))
+            {
+                if (!ReadToProperty(reader, "object") || !reader.Read() || reader.TokenType != JsonToken.StartObject)
+                    return (kind, apiVersion, resourceVersion);
+
+                while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+                {
+                    switch ((string)reader.Value)
+                    {
+                        case "kind":
+                        {
+                            kind = reader.ReadAsString();
+
+                            break;
+                        }
+                        case "apiVersion":
+                        {
+                            apiVersion = reader.ReadAsString();
+
+                            break;
+                        }
+                        case "metadata":
+                        {
+                            reader.Read();
+                            if (reader.TokenType != JsonToken.StartObject)
+                            {
+                                reader.Skip();
+
+                                break;
+                            }
+
+                            if (ReadToProperty(reader, "resourceVersion"))
+                            {
+                                resourceVersion = reader.ReadAsString();
+
+                                // Skip the rest of the metadata.
+                                while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+                                {
+                                    reader.Read();
+                                    reader.Skip();
+                                }
+                            }
+
+                            break;
+                        }
+                        default:
+                        {
+                            reader.Read();
+                            reader.Skip();
+
+                            break;
+                        }
+                    }
+                }
+            }
+
+            return (kind, apiVersion, resourceVersion);
+        }
+
+        /// <summary>
+        ///     Read the <see cref="StatusV1"/> from an error event.
+        /// </summary>
+        /// <param name="line">
+        ///     The characters of the line containing the event.
+        /// </param>
+        /// <param name="lineLength">
+        ///     The number of characters in the line.
+        /// </param>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> used to deserialise the status.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="StatusV1"/> (or <c>null</c>, if the event does not have an object).
+        /// </returns>
+        public static StatusV1 ReadErrorStatus(char[] line, int lineLength, JsonSerializer serializer)
+        {
+            if (serializer == null)
+                throw new ArgumentNullException(nameof(serializer));
+
+            using (JsonTextReader reader = CreateReader(line, lineLength))
+            {
+                if (!ReadToProperty(reader, "object") || !reader.Read())
+                    return null;
+
+                return serializer.Deserialize<StatusV1>(reader);
+            }
+        }
+
+        /// <summary>
+        ///     Create a <see cref="JsonTextReader"/> that reads an event directly from its (pooled) line buffer.
+        /// </summary>
+        /// <param name="line">
+        ///     The characters of the line containing the event.
+        /// </param>
+        /// <param name="lineLength">
+        ///     The number of characters in the line.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="JsonTextReader"/> (which closes the underlying <see cref="TextReader"/> when it is disposed).
+        /// </returns>
+        public static JsonTextReader CreateReader(char[] line, int lineLength)
+        {
+            if (line == null)
+                throw new ArgumentNullException(nameof(line));
+
+            return new JsonTextReader(new CharArrayReader(line, 0, lineLength))
+            {
+                ArrayPool = JsonCharArrayPool.Instance
+            };
+        }
+
+        /// <summary>
+        ///     Determine whether an exception indicates that a watch's resource version is too old (i.e. "410 Gone").
+        /// </summary>
+        /// <param name="error">
+        ///     The exception.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the watch must be restarted from a fresh list of resources; otherwise, <c>false</c>.
+        /// </returns>
+        /// <remarks>
+        ///     The API server usually reports an expired resource version using an error event (<see cref="KubeApiException"/>), but may also reject the watch request itself (<see cref="HttpRequestException{TResponse}"/>, wrapped in a <see cref="KubeClientException"/>).
+        /// </remarks>
+        public static bool IsResourceVersionExpired(Exception error)
+        {
+            switch (error)
+            {
+                case KubeApiException apiError:
+                {
+                    return apiError.Status?.Code == StatusCodeGone;
+                }
+                case KubeClientException clientError when clientError.InnerException is HttpRequestException<StatusV1> requestError:
+                {
+                    return (int?)requestError.StatusCode == StatusCodeGone || requestError.Response?.Code == StatusCodeGone;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Advance the reader to the specified property of the current object (skipping the values of any preceding properties).
+        /// </summary>
+        /// <param name="reader">
+        ///     The <see cref="JsonReader"/>, positioned at the start of the object (or, for the top-level object, before it).
+        /// </param>
+        /// <param name="propertyName">
+        ///     The name of the target property.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the reader is now positioned at the property's name; <c>false</c>, if the object does not have the property (or the reader is not positioned at an object).
+        /// </returns>
+        static bool ReadToProperty(JsonReader reader, string propertyName)
+        {
+            if (reader.TokenType == JsonToken.None)
+                reader.Read();
+
+            if (reader.TokenType != JsonToken.StartObject)
+                return false;
+
+            while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+            {
+                if ((string)reader.Value == propertyName)
+                    return true;
+
+                reader.Read();
+                reader.Skip();
+            }
+
+            return false;
+        }
+    }
+}
@@ -0,0 +1,101 @@
+using System;
+using System.IO;
+
+namespace KubeClient.Utilities
+{
+    /// <summary>
+    ///     A <see cref="TextReader"/> that reads from a range of characters in an array (without copying them into a <see cref="String"/>).
+    /// </summary>
+    sealed class CharArrayReader
+        : TextReader
+    {
+        /// <summary>
+        ///     The array containing the characters to read.
+        /// </summary>
+        readonly char[] _characters;
+
+        /// <summary>
+        ///     The index (in <see cref="_characters"/>) of the next character to read.
+        /// </summary>
+        int _position;
+
+        /// <summary>
+        ///     The index (in <see cref="_characters"/>) after the last character to read.
+        /// </summary>
+        readonly int _end;
+
+        /// <summary>
+        ///     Create a new <see cref="CharArrayReader"/>.
+        /// </summary>
+        /// <param name="characters">
+        ///     The array containing the characters to read.
+        /// </param>
+        /// <param name="index">
+        ///     The index (in <paramref name="characters"/>) of the first character to read.
+        /// </param>
+        /// <param name="count">
+        ///     The number of characters to read.
+        /// </param>
+        public CharArrayReader(char[] characters, int index, int count)
+        {
+            if (characters == null)
+                throw new ArgumentNullException(nameof(characters));
+
+            if (index < 0 || index > characters.Length)
+                throw new ArgumentOutOfRangeException(nameof(index), index, "Index must be within the bounds of the array.");
+
+            if (count < 0 || count > characters.Length - index)
+                throw new ArgumentOutOfRangeException(nameof(count), count, "Count must be within the bounds of the array.");
+
+            _characters = characters;
+            _position = index;
+            _end = index + count;
+        }
+
+        /// <summary>
+        ///     Get the next character (without consuming it).
+        /// </summary>
+        /// <returns>
+        ///     The next character, or -1 if there are no more characters to read.
+        /// </returns>
+        public override int Peek() => _position < _end ? _characters[_position] : -1;
+
+        /// <summary>
+        ///     Read the next character.
+        /// </summary>
+        /// <returns>
+        ///     The next character, or -1 if there are no more characters to read.
+        /// </returns>
+        public override int Read() => _position < _end ? _characters[_position++] : -1;
+
+        /// <summary>
+        ///     Read characters into a buffer.
+        /// </summary>
+        /// <param name="buffer">
+        ///     The buffer to read into.
+        /// </param>
+        /// <param name="index">
+        ///     The index (in <paramref name="buffer"/>) at which to start writing.
+        /// </param>
+        /// <param name="count">
+        ///     The maximum number of characters to read.
+        /// </param>
+        /// <returns>
+        ///     The number of characters read (0 if there are no more characters to read).
+        /// </returns>
+        public override int Read(char[] buffer, int index, int count)
+        {
+            if (buffer == null)
+                throw new ArgumentNullException(nameof(buffer));
+
+            int charactersRead = Math.Min(count, _end - _position);
+            if (charactersRead <= 0)
+                return 0;
+
+            Array.Copy(_characters, _position, buffer, index, charactersRead);
+            _position += charactersRead;
+
+            return charactersRead;
+        }
+    }
+}
@@ -0,0 +1,43 @@
+using Newtonsoft.Json;
+using System.Buffers;
+
+namespace KubeClient.Utilities
+{
+    /// <summary>
+    ///     An <see cref="IArrayPool{T}"/> that enables <see cref="JsonTextReader"/>s to rent their character buffers from <see cref="ArrayPool{T}.Shared"/>.
+    /// </summary>
+    sealed class JsonCharArrayPool
+        : IArrayPool<char>
+    {
+        /// <summary>
+        ///     The singleton instance of <see cref="JsonCharArrayPool"/>.
+        /// </summary>
+        public static readonly JsonCharArrayPool Instance = new JsonCharArrayPool();
+
+        /// <summary>
+        ///     Create a new <see cref="JsonCharArrayPool"/>.
+        /// </summary>
+        JsonCharArrayPool()
+        {
+        }
+
+        /// <summary>
+        ///     Rent an array from the pool.
+        /// </summary>
+        /// <param name="minimumLength">
+        ///     The minimum required length of the array.
+        /// </param>
+        /// <returns>
+        ///     The array (which may be longer than <paramref name="minimumLength"/>).
+        /// </returns>
+        public char[] Rent(int minimumLength) => ArrayPool<char>.Shared.Rent(minimumLength);
+
+        /// <summary>
+        ///     Return an array to the pool.
+        /// </summary>
+        /// <param name="array">
+        ///     The array (previously obtained from <see cref="Rent"/>).
+        /// </param>
+        public void Return(char[] array) => ArrayPool<char>.Shared.Return(array);
+    }
+}
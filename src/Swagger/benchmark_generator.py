@@ -0,0 +1,267 @@
+"""
+Benchmark the phases of the model generator.
+
+Run from this directory:
+
+    python benchmark_generator.py [--swagger FILE] [--inflate N] [--repeat N] [--output FILE]
+
+Each phase (parsing the swagger document, parse_apis, parse_models, get_data_types, parse_properties, planning, and rendering) is timed against the swagger document, and against a synthetic document containing N copies of each of its API definitions (and paths).
+Generated code is rendered in memory (nothing is written to the model directory).
+Paths in the synthetic document only contain the operation metadata used by the generator, so its parse_swagger_document timings are not directly comparable with those for the original document.
+
+Results are written as JSON (to stdout, or to --output FILE) so they can be compared between commits.
+"""
+
+import argparse
+import json
+import os.path
+import platform
+import statistics
+import sys
+import time
+
+import generate_models
+
+RESULTS_VERSION = 1
+# Definitions shared by all API groups (referenced, but not copied, by inflated documents).
+SHARED_DEFINITION_PREFIX = 'io.k8s.apimachinery.'
+
+def inflate_swagger_document(definitions, paths, factor):
+    """
+    Create a synthetic (larger) swagger document by copying each API definition (and path).
+
+    Copies are renamed (e.g. "io.k8s.api.core.v1.Pod" -> "io.k8s.api.core.v1.PodCopy1", with kind "PodCopy1"), and references between copied definitions are updated accordingly.
+
+    :param definitions: The swagger definitions, keyed by definition name.
+    :param paths: The swagger paths (as returned by load_swagger).
+    :param factor: The size of the synthetic document, relative to the original (1 means no copies).
+    :return: A tuple of (definitions, paths).
+    """
+
+    copied_definition_names = set(
+        definition_name
+        for definition_name in definitions.keys()
+        if not definition_name.startswith(SHARED_DEFINITION_PREFIX) and definition_name not in generate_models.IGNORE_MODELS
+    )
+
+    inflated_definitions = dict(definitions)
+    inflated_paths = dict(paths)
+    for copy_index in range(1, factor):
+        suffix = 'Copy{0}'.format(copy_index)
+
+        for definition_name in copied_definition_names:
+            inflated_definitions[definition_name + suffix] = copy_swagger_value(definitions[definition_name], suffix, copied_definition_names)
+
+        for (api_path, api_verbs) in paths.items():
+            inflated_paths['/copy{0}{1}'.format(copy_index, api_path)] = copy_swagger_value(api_verbs, suffix, copied_definition_names)
+
+    return (inflated_definitions, inflated_paths)
+
+def copy_swagger_value(value, suffix, copied_definition_names):
+    """
+    Deep-copy a value from a swagger document, renaming references to (and kinds of) copied definitions.
+
+    :param value: The value to copy.
+    :param suffix: The suffix appended to the names of copied definitions (and their kinds).
+    :param copied_definition_names: The names of all definitions that are being copied.
+    :return: The copied value.
+    """
+
+    if isinstance(value, list):
+        return [copy_swagger_value(item, suffix, copied_definition_names) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    copied_value = {}
+    for (key, item) in value.items():
+        if key == '$ref' and isinstance(item, str):
+            definition_name = item.replace('#/definitions/', '')
+            if definition_name in copied_definition_names:
+                item = '#/definitions/' + definition_name + suffix
+        elif key == 'x-kubernetes-group-version-kind':
+            # Definitions have a list of group / version / kind; operations (in paths) have a single one.
+            if isinstance(item, list):
+                item = [dict(group_version_kind, kind=group_version_kind['kind'] + suffix) for group_version_kind in item]
+            else:
+                item = dict(item, kind=item['kind'] + suffix)
+        else:
+            item = copy_swagger_value(item, suffix, copied_definition_names)
+
+        copied_value[key] = item
+
+    return copied_value
+
+def run_phases(swagger_json):
+    """
+    Run each phase of the model generator (without writing any files).
+
+    :param swagger_json: The swagger document (JSON).
+    :return: A tuple of (elapsed seconds, keyed by phase name; number of class files rendered).
+    """
+
+    timings = {}
+
+    def timed(phase_name, action, *action_args):
+        start_time = time.perf_counter()
+        result = action(*action_args)
+        timings[phase_name] = time.perf_counter() - start_time
+
+        return result
+
+    (definitions, paths) = timed('parse_swagger_document', generate_models.parse_swagger_document, swagger_json)
+    apis = timed('parse_apis', generate_models.parse_apis, paths)
+    models = timed('parse_models', generate_models.parse_models, definitions)
+    data_types = timed('get_data_types', generate_models.get_data_types, models)
+    timed('parse_properties', generate_models.parse_properties, models, data_types, definitions)
+    render_plan = timed('get_render_plan', generate_models.get_render_plan, definitions, models, apis)
+
+    def render_models():
+        plans = [
+            generate_models.KubeModelRenderPlan.from_model(model, resource_api)
+            for (_, model, resource_api) in render_plan.values()
+        ]
+        for plan in plans:
+            generate_models.render_model(plan)
+
+        return plans
+
+    plans = timed('render_models', render_models)
+
+    def render_known_models():
+        registrations = []
+        for plan in plans:
+            registration = generate_models.KubeModelRegistration.from_plan(plan)
+            if registration:
+                registrations.append(registration)
+
+        return generate_models.render_known_models(registrations)
+
+    timed('render_known_models', render_known_models)
+
+    generated_models = [model for (_, model, _) in render_plan.values()]
+    timed('render_model_converters', lambda: generate_models.render_model_converters(
+        generate_models.get_model_converter_models({
+            model.clr_name: model
+            for model in generated_models
+        })
+    ))
+    timed('render_interned_string_properties', generate_models.render_interned_string_properties, generated_models)
+
+    return (timings, len(render_plan))
+
+def benchmark_document(document_name, swagger_json, inflation, repeat):
+    """
+    Benchmark the phases of the model generator against a swagger document.
+
+    :param document_name: The name of the document (for reporting).
+    :param swagger_json: The swagger document (JSON).
+    :param inflation: The size of the document, relative to the original.
+    :param repeat: The number of times to run the generator.
+    :return: The results for the document.
+    """
+
+    runs = []
+    model_count = 0
+    for _ in range(repeat):
+        (timings, model_count) = run_phases(swagger_json)
+        runs.append(timings)
+
+    phases = {}
+    for phase_name in runs[0].keys():
+        elapsed_ms = [run[phase_name] * 1000.0 for run in runs]
+        phases[phase_name] = {
+            'min_ms': round(min(elapsed_ms), 3),
+            'median_ms': round(statistics.median(elapsed_ms), 3),
+            'max_ms': round(max(elapsed_ms), 3)
+        }
+
+    total_ms = [sum(run.values()) * 1000.0 for run in runs]
+
+    return {
+        'document': document_name,
+        'inflation': inflation,
+        'document_bytes': len(swagger_json.encode('utf8')),
+        'class_files': model_count,
+        'phases': phases,
+        'total': {
+            'min_ms': round(min(total_ms), 3),
+            'median_ms': round(statistics.median(total_ms), 3),
+            'max_ms': round(max(total_ms), 3)
+        }
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--swagger',
+        default=generate_models.SWAGGER_FILE_NAME,
+        metavar='FILE',
+        help='The Kubernetes swagger (JSON) document to benchmark against (default: %(default)s).'
+    )
+    parser.add_argument('--inflate',
+        type=int,
+        default=10,
+        metavar='N',
+        help='Also benchmark against a synthetic document N times the size of the original (default: %(default)s; 1 to disable).'
+    )
+    parser.add_argument('--repeat',
+        type=int,
+        default=3,
+        metavar='N',
+        help='Run the generator N times against each document (default: %(default)s).'
+    )
+    parser.add_argument('--output',
+        metavar='FILE',
+        help='Write results (JSON) to FILE (default: stdout).'
+    )
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.repeat < 1:
+        sys.exit('--repeat must be at least 1.')
+
+    if args.inflate < 1:
+        sys.exit('--inflate must be at least 1.')
+
+    with open(args.swagger, 'rb') as swagger_file:
+        swagger_json = swagger_file.read().decode('utf8')
+
+    document_name = os.path.basename(args.swagger)
+    documents = [
+        benchmark_document(document_name, swagger_json, 1, args.repeat)
+    ]
+
+    if args.inflate > 1:
+        (definitions, paths) = generate_models.parse_swagger_document(swagger_json)
+        (definitions, paths) = inflate_swagger_document(definitions, paths, args.inflate)
+
+        inflated_swagger_json = json.dumps({
+            'definitions': definitions,
+            'paths': paths
+        })
+        del definitions, paths
+
+        documents.append(
+            benchmark_document('{0} (x{1})'.format(document_name, args.inflate), inflated_swagger_json, args.inflate, args.repeat)
+        )
+
+    results = {
+        'version': RESULTS_VERSION,
+        'python': platform.python_version(),
+        'generator_hash': generate_models.get_generator_hash(),
+        'repeat': args.repeat,
+        'documents': documents
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf8', newline=generate_models.LINE_ENDING) as output_file:
+            json.dump(results, output_file, indent=2)
+            output_file.write(generate_models.LINE_ENDING)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write(generate_models.LINE_ENDING)
+
+if __name__ == '__main__':
+    main()
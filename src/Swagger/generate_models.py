@@ -1,10 +1,51 @@
 """
 Generate model classes from Kubernetes swagger.
+
+Run from this directory:
+
+    python generate_models.py [--swagger FILE] [--no-cache] [--incremental] [--jobs N] [--system-text-json] [--lazy-collections] [--clone-and-equality] [--parsed-quantities] [--partition-by-group] [--projections FILE]
+
+With --incremental, only files whose generated content has changed are (re)written, and files for models that no longer exist are removed.
+With --jobs N, model files are rendered and written by a pool of N processes.
+With --system-text-json, model properties are also decorated for System.Text.Json, and a JsonSerializerContext covering all generated models is emitted (both only compiled for .NET 8 and later).
+With --clone-and-equality, models also implement IKubeModelEquatable (DeepClone, Equals / GetHashCode, and IsSemanticallyEqual), without using reflection.
+With --parsed-quantities, resource quantities (e.g. requests, limits, and capacity) are represented by the QuantityResource value type (parsed once, when deserialised) rather than by strings.
+With --partition-by-group, models are partitioned by API group (see below).
+With --projections FILE, slim projection models (containing only selected fields) are generated instead of the regular models (see below).
+
+The parts of the swagger document used by the generator are cached (in pre-parsed form) under .swagger-cache; use --no-cache to bypass this.
+
+When partitioning by API group, the models for each group are written to a subdirectory of the output directory (e.g. "Apps"), together with a registration entry point (e.g. "KnownModels.Apps.Register()") that adds their metadata (and that of the partitions they depend on) to KnownModels, and preserves them when the application is trimmed.
+Models from the core API group (and apimachinery) form the "Core" partition (which also includes any model they reference), and models from alpha / beta API versions are placed in the "Alpha" / "Beta" partitions (regardless of their API group).
+Nothing else references a partition's models, so partitions that are not used by an application can be removed from the build (e.g. <Compile Remove="Models/generated/Alpha/**" />) or by the trimmer; the Core, Apps, Batch, Networking, Rbac, ApiExtensions, and ApiRegistration partitions are always required by the KubeClient assembly itself.
+Applications must register the partitions they use at startup; switch between partitioned and regular output using --incremental (or from a clean output directory) so that stale copies of generated files are removed.
+
+A projection file is a JSON object that maps the CLR name of each projection to its root model (a definition name, e.g. "io.k8s.api.core.v1.Pod", or CLR name, e.g. "PodV1") and the paths of the fields to include:
+
+    {
+        "PodPlacement": {
+            "root": "PodV1",
+            "fields": ["spec.nodeName", "spec.containers.image", "status.phase"]
+        }
+    }
+
+Path segments are JSON property names (lists and dictionaries are traversed implicitly); a path that ends on a model includes the whole model.
+A minimal nested class is generated for each model along the selected paths, and projections of resources always include "kind", "apiVersion", and "metadata" (so they can be listed and watched like the full model).
+Projections of resources are marked with [KubeProjection(typeof(...))] rather than [KubeObject(...)]; they take their kind and apiVersion from the projected model, but are never returned by kind / apiVersion lookups.
+Projections are written (with a streaming JSON converter that skips all other properties without deserialising them) to the directory containing the projection file, in the "KubeClient.Models.Projections" namespace.
 """
 
+import argparse
+import codecs
+import concurrent.futures
+import copy
+import hashlib
+import io
 import json
 import os.path
+import pickle
 import pprint
+import re
 
 BASE_DIRECTORY = os.path.abspath('../KubeClient/Models/generated')
 ROOT_NAMESPACE = 'KubeClient.Models'
@@ -70,15 +111,36 @@ IGNORE_MODELS = {
 
     # Hand-coded:
     'io.k8s.kubernetes.pkg.apis.extensions.v1beta1.ThirdPartyResource',
-    'io.k8s.kubernetes.pkg.apis.extensions.v1beta1.ThirdPartyResourceList'
+    'io.k8s.kubernetes.pkg.apis.extensions.v1beta1.ThirdPartyResourceList',
+    'io.k8s.apimachinery.pkg.apis.meta.v1.PartialObjectMetadata',
+    'io.k8s.apimachinery.pkg.apis.meta.v1.PartialObjectMetadataList'
 }
 VALUE_TYPE_NAMES = [
     'bool',
     'int',
     'long',
     'double',
-    'DateTime'
+    'DateTime',
+    'QuantityResource'
+]
+# Types that can be compared using "==" in generated equality members (other intrinsic types are compared using Equals).
+EQUALITY_OPERATOR_TYPE_NAMES = VALUE_TYPE_NAMES + [
+    'string',
+    'Int32OrStringV1'
+]
+# Hand-crafted models (treated as intrinsic data-types) that implement IKubeModelEquatable.
+HAND_CRAFTED_EQUATABLE_MODELS = [
+    'DeleteOptionsV1'
+]
+# Properties (model CLR name, property JSON name) that are always ignored when comparing models for semantic equality (they change on every write).
+SEMANTIC_EQUALITY_IGNORED_PROPERTIES = [
+    ('ObjectMetaV1', 'resourceVersion'),
+    ('ListMetaV1', 'resourceVersion')
 ]
+# Hand-coded fields (in the partial classes for generated models) that hold JSON extension data, keyed by model CLR name.
+EXTENSION_DATA_FIELDS = {
+    'ObjectMetaV1': '_extensionData'
+}
 KUBE_ACTIONS = {
     'deletecollection': 'DeleteCollection',
     'list': 'List',
@@ -91,6 +153,220 @@ KUBE_ACTIONS = {
     'watchlist': 'WatchList',
 }
 LINE_ENDING = '\n'
+MANIFEST_FILE_NAME = '.generated-manifest.json'
+MANIFEST_VERSION = 1
+SWAGGER_FILE_NAME = 'kube-1.31-swagger.json'
+SWAGGER_CACHE_DIRECTORY = '.swagger-cache'
+SWAGGER_CACHE_VERSION = 1
+SWAGGER_READ_CHUNK_SIZE = 1024 * 1024
+SWAGGER_OPERATION_KEYS = [
+    'x-kubernetes-action',
+    'x-kubernetes-group-version-kind'
+]
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+KNOWN_MODELS_FILE_NAME = 'KnownModels.cs'
+JSON_CONTEXT_FILE_NAME = 'KubeModelJsonContext.cs'
+JSON_CONTEXT_CONVERTERS = [
+    'Int32OrStringV1JsonConverter',
+    'MicroTimeV1JsonConverter',
+    'QuantityResourceJsonConverter'
+]
+SYSTEM_TEXT_JSON_CONDITION = 'NET8_0_OR_GREATER'
+MODEL_CONVERTERS_FILE_NAME = 'KubeModelConverters.cs'
+MODEL_CONVERTERS_NAMESPACE = ROOT_NAMESPACE + '.Converters'
+PROJECTIONS_NAMESPACE = ROOT_NAMESPACE + '.Projections'
+PROJECTION_CONVERTERS_FILE_SUFFIX = 'Converters.cs'
+# Models that get a generated (streaming) JSON converter; models that they reference (directly or indirectly) get one, too.
+MODEL_CONVERTER_ALLOW_LIST = [
+    'ConfigMapV1',
+    'ConfigMapListV1',
+    'EndpointsV1',
+    'EndpointsListV1',
+    'EndpointSliceV1',
+    'EndpointSliceListV1',
+    'EventV1',
+    'EventListV1',
+    'PodV1',
+    'PodListV1'
+]
+# Hand-coded extension-data properties (model CLR name -> property name) that receive JSON properties not defined by the model.
+MODEL_CONVERTER_EXTENSION_DATA = {
+    'ObjectMetaV1': 'ExtensionData'
+}
+# Intrinsic data-types that have a dedicated reader (CLR type name -> expression that reads a nullable value, given a reader positioned on the property name).
+MODEL_CONVERTER_INTRINSIC_READERS = {
+    'string': 'reader.ReadAsString()',
+    'int': 'reader.ReadAsInt32()',
+    'long': 'ReadAsInt64(reader, serializer)',
+    'bool': 'reader.ReadAsBoolean()',
+    'double': 'reader.ReadAsDouble()',
+    'DateTime': 'reader.ReadAsDateTime()',
+    'Int32OrStringV1': 'ReadInt32OrString(reader, serializer)',
+    'QuantityResource': 'ReadQuantity(reader, serializer)'
+}
+BINARY_SERIALIZERS_FILE_NAME = 'KubeModelBinarySerializers.cs'
+# Contributes to every model's schema hash; increment it when the encoding used by generated binary serialisers changes (so that existing snapshots are rejected).
+BINARY_SERIALIZER_FORMAT_VERSION = 1
+# Models that get a generated binary serialiser (used for local snapshots of watched resources); models that they reference (directly or indirectly) get one, too.
+BINARY_SERIALIZER_ALLOW_LIST = [
+    'ConfigMapV1',
+    'CronJobV1',
+    'DaemonSetV1',
+    'DeploymentV1',
+    'EndpointsV1',
+    'EndpointSliceV1',
+    'EventV1',
+    'IngressV1',
+    'JobV1',
+    'LeaseV1',
+    'NamespaceV1',
+    'NodeV1',
+    'PersistentVolumeClaimV1',
+    'PersistentVolumeV1',
+    'PodV1',
+    'ReplicaSetV1',
+    'SecretV1',
+    'ServiceAccountV1',
+    'ServiceV1',
+    'StatefulSetV1'
+]
+# Intrinsic data-types that have dedicated binary helpers (CLR type name -> helper name suffix, e.g. "WriteInt32" / "ReadInt32"); all other non-model values are written as JSON.
+BINARY_SERIALIZER_INTRINSIC_HELPERS = {
+    'string': 'String',
+    'bool': 'Boolean',
+    'int': 'Int32',
+    'long': 'Int64',
+    'double': 'Double',
+    'DateTime': 'DateTime',
+    'Int32OrStringV1': 'Int32OrString',
+    'QuantityResource': 'Quantity'
+}
+class KubeResourceClientPlan(object):
+    """
+    Everything needed to render the precompiled request paths (and, unless it has a hand-written client, the typed resource client) for a listable resource.
+    """
+
+    def __init__(self, model, list_model, collection_path, actions, has_hand_written_client):
+        self.model = model
+        self.list_model = list_model
+        self.actions = actions
+        self.has_hand_written_client = has_hand_written_client
+
+        # "api/v1/namespaces/{namespace}/pods" -> ("api/v1/namespaces/", "/pods"); cluster-scoped paths have no prefix.
+        self.is_namespaced = '{namespace}' in collection_path
+        if self.is_namespaced:
+            (self.path_prefix, self.path_suffix) = collection_path.split('{namespace}')
+        else:
+            (self.path_prefix, self.path_suffix) = (None, collection_path)
+
+        # The plural form of the kind is derived from the resource name (e.g. "NetworkPolicy" / "networkpolicies" -> "NetworkPolicies").
+        resource_name = collection_path.split('/')[-1]
+        kind = model.name
+        common_length = len(os.path.commonprefix([kind.lower(), resource_name]))
+        self.plural_kind = kind[:common_length] + resource_name[common_length:]
+
+        self.client_name = kind + 'Client' + model.pretty_api_version
+        self.interface_name = 'I' + self.client_name
+        self.paths_name = self.plural_kind + model.pretty_api_version
+
+    def __repr__(self):
+        return 'KubeResourceClientPlan(clr_name="{}")'.format(self.model.clr_name)
+
+    @property
+    def display_name(self):
+        return '{0} ({1})'.format(self.plural_kind, self.model.api_groupversion)
+
+    def has_action(self, action):
+        return action in self.actions
+
+CORE_PARTITION_NAME = 'Core'
+# Partition names for API groups whose names are not simply the capitalised group name.
+PARTITION_NAMES = {
+    'admissionregistration': 'AdmissionRegistration',
+    'apiextensions': 'ApiExtensions',
+    'apiregistration': 'ApiRegistration',
+    'apiserverinternal': 'ApiServerInternal',
+    'flowcontrol': 'FlowControl',
+    'storagemigration': 'StorageMigration'
+}
+PRERELEASE_API_VERSION_PATTERN = re.compile(r'^v\d+(alpha|beta)\d+$')
+PARTITION_REGISTRATION_FILE_NAME_PATTERN = re.compile(r'^KnownModels\.\w+\.cs$')
+TRIM_ANNOTATIONS_CONDITION = 'NET5_0_OR_GREATER'
+INTERNED_STRING_PROPERTIES_FILE_NAME = 'InternedStringProperties.cs'
+PATCH_PROPERTIES_FILE_NAME = 'StrategicMergePatch.cs'
+INDEXED_FIELDS_FILE_NAME = 'IndexedFields.cs'
+RESOURCE_CLIENTS_FILE_NAME = 'KubeResourceClients.cs'
+RESOURCE_CLIENTS_NAMESPACE = 'KubeClient.ResourceClients'
+# Hand-written resource clients (in any project under this directory) take precedence over generated ones with the same name.
+RESOURCE_CLIENTS_SOURCE_DIRECTORY = os.path.abspath('..')
+RESOURCE_CLIENT_CLASS_PATTERN = re.compile(r'\bclass (\w+Client\w*)\b')
+# Commonly-indexed (string) fields, by definition name; based on the fields that the API server supports in field selectors (metadata.name and metadata.namespace are hand-coded, since they apply to all resources).
+INDEXED_FIELDS = {
+    'io.k8s.api.certificates.v1.CertificateSigningRequest': ['spec.signerName'],
+    'io.k8s.api.coordination.v1.Lease': ['spec.holderIdentity'],
+    'io.k8s.api.core.v1.Event': [
+        'involvedObject.apiVersion', 'involvedObject.fieldPath', 'involvedObject.kind', 'involvedObject.name', 'involvedObject.namespace', 'involvedObject.resourceVersion', 'involvedObject.uid',
+        'reason', 'reportingComponent', 'source.component', 'source.host', 'type'
+    ],
+    'io.k8s.api.core.v1.Namespace': ['status.phase'],
+    'io.k8s.api.core.v1.PersistentVolume': ['spec.claimRef.name', 'spec.claimRef.namespace', 'spec.claimRef.uid', 'spec.storageClassName'],
+    'io.k8s.api.core.v1.PersistentVolumeClaim': ['spec.storageClassName', 'spec.volumeName'],
+    'io.k8s.api.core.v1.Pod': [
+        'spec.nodeName', 'spec.restartPolicy', 'spec.schedulerName', 'spec.serviceAccountName',
+        'status.hostIP', 'status.nominatedNodeName', 'status.phase', 'status.podIP'
+    ],
+    'io.k8s.api.core.v1.Secret': ['type'],
+    'io.k8s.api.core.v1.Service': ['spec.clusterIP', 'spec.type']
+}
+# Low-cardinality string properties (JSON name -> InternedStrings flags) whose values repeat across many resources (the swagger document does not identify enum-like properties).
+INTERNED_STRING_PROPERTIES = {
+    'apiGroup': ('Values',),
+    'apiVersion': ('Values',),
+    'effect': ('Values',),
+    'fieldsType': ('Values',),
+    'generateName': ('Values',),
+    'hostIP': ('Values',),
+    'image': ('Values',),
+    'kind': ('Values',),
+    'manager': ('Values',),
+    'mountPath': ('Values',),
+    'namespace': ('Values',),
+    'nodeName': ('Values',),
+    'operation': ('Values',),
+    'operator': ('Values',),
+    'phase': ('Values',),
+    'protocol': ('Values',),
+    'qosClass': ('Values',),
+    'reason': ('Values',),
+    'resource': ('Values',),
+    'scheme': ('Values',),
+    'schedulerName': ('Values',),
+    'serviceAccount': ('Values',),
+    'serviceAccountName': ('Values',),
+    'status': ('Values',),
+    'storageClassName': ('Values',),
+    'terminationMessagePath': ('Values',),
+    'type': ('Values',),
+    'args': ('Values',),
+    'command': ('Values',),
+    'finalizers': ('Values',),
+    'allocatable': ('DictionaryKeys', 'Values'),
+    'capacity': ('DictionaryKeys', 'Values'),
+    'labels': ('DictionaryKeys', 'Values'),
+    'limits': ('DictionaryKeys', 'Values'),
+    'matchLabels': ('DictionaryKeys', 'Values'),
+    'nodeSelector': ('DictionaryKeys', 'Values'),
+    'requests': ('DictionaryKeys', 'Values'),
+    'selector': ('DictionaryKeys', 'Values'),
+    # Annotation values are frequently large and / or unique (e.g. last-applied-configuration, timestamps).
+    'annotations': ('DictionaryKeys',)
+}
+# Suffixes of JSON property names that, by API convention, denote enum-like string properties.
+INTERNED_STRING_PROPERTY_SUFFIXES = ('Policy', 'ClassName')
+MODEL_CLASS_PATTERN = re.compile(r'public partial class (\w+)(?: : (\w+))?')
+KUBE_OBJECT_ATTRIBUTE_PATTERN = re.compile(r'\[KubeObject\("([^"]+)", "([^"]+)"\)\]')
+KUBE_LIST_ITEM_ATTRIBUTE_PATTERN = re.compile(r'\[KubeListItem\("([^"]+)", "([^"]+)"\)\]')
+KUBE_API_ATTRIBUTE_PATTERN = re.compile(r'\[KubeApi\((KubeAction\.\w+), "([^"]+)"\)\]')
 
 
 class KubeModel(object):
@@ -112,6 +388,12 @@ class KubeModel(object):
         self.required_property_keys = required_property_keys
         self.properties = {}
 
+        # The model's key when it is an item in a list with "x-kubernetes-list-type: map" (a list of KubeModelProperty), if any.
+        self.list_key_properties = None
+
+        # The CLR name of the model that this model is a projection of (see project_model), if any.
+        self.projection_of = None
+
     def update_properties(self, property_definitions, data_types):
         self.properties.clear()
 
@@ -256,7 +538,7 @@ class KubeModel(object):
 
 
 class KubeModelProperty(object):
-    def __init__(self, name, json_name, summary, data_type, is_optional, is_merge, is_retain_keys, merge_key):
+    def __init__(self, name, json_name, summary, data_type, is_optional, is_merge, is_retain_keys, merge_key, list_map_keys=None):
         self.name = sanitize_name(name)
         self.json_name = json_name
         self.summary = summary or 'No summary provided'
@@ -273,6 +555,12 @@ class KubeModelProperty(object):
         self.is_retain_keys = is_retain_keys
         self.merge_key = merge_key
 
+        # The JSON names of the item properties that identify each item in a list with "x-kubernetes-list-type: map", if any.
+        self.list_map_keys = list_map_keys
+
+        # The CLR type name of the key that identifies each item in the list (only set once the item model's key properties have been resolved).
+        self.list_key_clr_type_name = None
+
     def __repr__(self):
         return 'KubeModelProperty(name="{}",type={})'.format(
             self.name,
@@ -297,7 +585,20 @@ class KubeModelProperty(object):
 
         merge_key = property_definition.get('x-kubernetes-patch-merge-key')
 
-        return KubeModelProperty(name, json_name, summary, data_type, is_optional, is_merge, is_retain_keys, merge_key)
+        list_map_keys = None
+        if property_definition.get('x-kubernetes-list-type') == 'map':
+            list_map_keys = property_definition.get('x-kubernetes-list-map-keys')
+
+        return KubeModelProperty(name, json_name, summary, data_type, is_optional, is_merge, is_retain_keys, merge_key, list_map_keys)
+
+    def to_clr_type_name(self, is_nullable=False):
+        if self.list_key_clr_type_name:
+            return 'KubeKeyedList<{0}, {1}>'.format(
+                self.list_key_clr_type_name,
+                self.data_type.element_type.to_clr_type_name()
+            )
+
+        return self.data_type.to_clr_type_name(is_nullable)
 
 
 class KubeDataType(object):
@@ -433,6 +734,221 @@ class KubeModelDataType(KubeDataType):
     def to_clr_type_name(self, is_nullable=False):
         return self.model.clr_name
 
+class KubeModelRenderPlan(object):
+    """
+    Everything needed to render a model's class file.
+
+    Unlike KubeModel, this does not reference the rest of the model graph (so it can be cheaply pickled and sent to another process).
+    """
+
+    def __init__(self, name, clr_name, summary, api_groupversion, is_kube_object, is_kube_resource, is_kube_resource_list, list_item, resource_api, properties, items_property, list_key, projection_of=None):
+        self.name = name
+        self.clr_name = clr_name
+        self.summary = summary
+        self.api_groupversion = api_groupversion
+        self.is_kube_object = is_kube_object
+        self.is_kube_resource = is_kube_resource
+        self.is_kube_resource_list = is_kube_resource_list
+        self.list_item = list_item
+        self.resource_api = resource_api
+        self.properties = properties
+        self.items_property = items_property
+        self.list_key = list_key
+        self.projection_of = projection_of
+
+    def __repr__(self):
+        return 'KubeModelRenderPlan(clr_name="{}")'.format(self.clr_name)
+
+    @classmethod
+    def from_model(cls, model, resource_api):
+        # (kind, apiVersion, CLR type name) of list items, if any.
+        list_item = None
+        if model.has_list_items():
+            try:
+                list_item_model = model.list_item_data_type().model
+            except AttributeError:
+                print('List item datatype "{0}" is not a model'.format(model.name))
+                pprint.pprint(model.list_item_data_type)
+
+                raise
+
+            list_item = (
+                list_item_model.name,
+                list_item_model.api_groupversion,
+                model.list_item_data_type().to_clr_type_name()
+            )
+
+        property_names = [name for name in model.properties.keys()]
+
+        # Properties inherited from the model's base class are not rendered.
+        if model.is_kube_object():
+            property_names.remove('apiVersion')
+            property_names.remove('kind')
+
+            if model.has_kube_metadata() or model.has_kube_list_metadata():
+                property_names.remove('metadata')
+
+            if model.is_kube_resource_list() and model.has_list_items():
+                property_names.remove('items')
+
+        # Special case for Items property (we override the base class's property, adding the JsonProperty attribute).
+        items_property = None
+        if model.is_kube_resource_list() and model.has_list_items():
+            items_property = KubePropertyRenderPlan.from_property(model.properties['items'])
+
+        # (key CLR type name, key expression, key JSON names), if the model is an item in a keyed list.
+        list_key = None
+        if model.list_key_properties:
+            (list_key_clr_type_name, list_key_expression) = get_list_key(model.list_key_properties)
+
+            list_key = (
+                list_key_clr_type_name,
+                list_key_expression,
+                [key_property.json_name for key_property in model.list_key_properties]
+            )
+
+        return KubeModelRenderPlan(
+            model.name,
+            model.clr_name,
+            model.summary,
+            model.api_groupversion,
+            model.is_kube_object(),
+            model.is_kube_resource(),
+            model.is_kube_resource_list(),
+            list_item,
+            resource_api,
+            [
+                KubePropertyRenderPlan.from_property(model.properties[property_name])
+                for property_name in property_names
+            ],
+            items_property,
+            list_key,
+            model.projection_of
+        )
+
+class KubePropertyRenderPlan(object):
+    """
+    Everything needed to render a model property.
+    """
+
+    def __init__(self, name, json_name, summary, clr_type_name, optional_clr_type_name, is_collection, is_optional, is_merge, is_retain_keys, merge_key, value_kind):
+        self.name = name
+        self.json_name = json_name
+        self.summary = summary
+        self.clr_type_name = clr_type_name
+        self.optional_clr_type_name = optional_clr_type_name
+        self.is_collection = is_collection
+        self.is_optional = is_optional
+        self.is_merge = is_merge
+        self.is_retain_keys = is_retain_keys
+        self.merge_key = merge_key
+
+        # How the property's value is cloned and compared (see get_value_kind).
+        self.value_kind = value_kind
+
+    def __repr__(self):
+        return 'KubePropertyRenderPlan(name="{}",type="{}")'.format(self.name, self.clr_type_name)
+
+    @classmethod
+    def from_property(cls, model_property):
+        return KubePropertyRenderPlan(
+            model_property.name,
+            model_property.json_name,
+            model_property.summary,
+            model_property.to_clr_type_name(),
+            model_property.to_clr_type_name(is_nullable=model_property.is_optional),
+            model_property.data_type.is_collection(),
+            model_property.is_optional,
+            model_property.is_merge,
+            model_property.is_retain_keys,
+            model_property.merge_key,
+            get_value_kind(model_property.data_type)
+        )
+
+def get_value_kind(data_type):
+    """
+    Determine how values of the specified data-type are cloned and compared by generated equality members.
+
+    :param data_type: The KubeDataType.
+    :return: "value" (immutable values), "model" (models that implement IKubeModelEquatable), or "list:" / "dict:" followed by the kind of the collection's elements (e.g. "dict:list:value").
+    """
+
+    if isinstance(data_type, KubeArrayDataType):
+        return 'list:' + get_value_kind(data_type.element_type)
+
+    if isinstance(data_type, KubeDictionaryDataType):
+        return 'dict:' + get_value_kind(data_type.element_type)
+
+    if isinstance(data_type, KubeModelDataType) or data_type.to_clr_type_name() in HAND_CRAFTED_EQUATABLE_MODELS:
+        return 'model'
+
+    return 'value'
+
+class KubeModelRegistration(object):
+    """
+    Registration metadata for a model class that represents a Kubernetes resource or resource list (used to generate the KnownModels registry).
+    """
+
+    def __init__(self, clr_name, kind, api_groupversion, is_resource_list, list_item_kind, list_item_api_groupversion, api_paths):
+        self.clr_name = clr_name
+        self.kind = kind
+        self.api_groupversion = api_groupversion
+        self.is_resource_list = is_resource_list
+        self.list_item_kind = list_item_kind
+        self.list_item_api_groupversion = list_item_api_groupversion
+        self.api_paths = api_paths
+
+    def __repr__(self):
+        return 'KubeModelRegistration(clr_name="{}",kind="{}",api_version="{}")'.format(
+            self.clr_name,
+            self.kind,
+            self.api_groupversion
+        )
+
+    @classmethod
+    def from_plan(cls, plan):
+        if plan.is_kube_resource:
+            return KubeModelRegistration(plan.clr_name, plan.name, plan.api_groupversion, False, None, None, get_kube_api_paths(plan))
+
+        if plan.is_kube_resource_list:
+            (list_item_kind, list_item_api_groupversion) = (plan.list_item[0], plan.list_item[1]) if plan.list_item else (None, None)
+
+            return KubeModelRegistration(plan.clr_name, plan.name, plan.api_groupversion, True, list_item_kind, list_item_api_groupversion, [])
+
+        return None
+
+    @classmethod
+    def from_model_file(cls, class_file_name):
+        """
+        Create registration metadata from an existing model class file (e.g. one generated from an older version of the Kubernetes API).
+
+        :return: The registration metadata, or None if the file does not contain a resource or resource-list model.
+        """
+
+        with open(class_file_name, encoding='utf8', errors='replace') as class_file:
+            content = class_file.read()
+
+        class_match = MODEL_CLASS_PATTERN.search(content)
+        kube_object_match = KUBE_OBJECT_ATTRIBUTE_PATTERN.search(content)
+        if not class_match or not kube_object_match:
+            return None
+
+        (clr_name, base_class) = class_match.groups()
+        (kind, api_groupversion) = kube_object_match.groups()
+
+        if base_class == 'KubeResourceV1':
+            api_paths = KUBE_API_ATTRIBUTE_PATTERN.findall(content)
+
+            return KubeModelRegistration(clr_name, kind, api_groupversion, False, None, None, api_paths)
+
+        if base_class == 'KubeResourceListV1':
+            list_item_match = KUBE_LIST_ITEM_ATTRIBUTE_PATTERN.search(content)
+            (list_item_kind, list_item_api_groupversion) = list_item_match.groups() if list_item_match else (None, None)
+
+            return KubeModelRegistration(clr_name, kind, api_groupversion, True, list_item_kind, list_item_api_groupversion, [])
+
+        return None
+
 def capitalize_name(name):
     return name[0].capitalize() + name[1:]
 
@@ -486,7 +1002,15 @@ def parse_models(definitions):
 
     return models
 
-def get_data_types(models):
+def get_data_types(models, parsed_quantities=False):
+    """
+    Get all known data-types (models and well-known intrinsic data-types), keyed by definition name.
+
+    :param models: All models, keyed by definition name.
+    :param parsed_quantities: Represent resource quantities using QuantityResource (rather than string)?
+    :return: A dictionary of data-types, keyed by definition name.
+    """
+
     data_types = {
         model_name: KubeModelDataType(
             models[model_name]
@@ -501,7 +1025,7 @@ def get_data_types(models):
         'io.k8s.apimachinery.pkg.apis.meta.v1.Time': KubeIntrinsicDataType('DateTime'),
         'io.k8s.apimachinery.pkg.apis.meta.v1.MicroTime': KubeIntrinsicDataType('DateTime'),
         'io.k8s.apimachinery.pkg.util.intstr.IntOrString': KubeIntrinsicDataType('Int32OrStringV1'),
-        'io.k8s.apimachinery.pkg.api.resource.Quantity': KubeIntrinsicDataType('string'),
+        'io.k8s.apimachinery.pkg.api.resource.Quantity': KubeIntrinsicDataType('QuantityResource' if parsed_quantities else 'string'),
         'io.k8s.apimachinery.pkg.apis.meta.v1.DeleteOptions': KubeIntrinsicDataType('DeleteOptionsV1')  # This model is hand-crafted
     })
 
@@ -520,6 +1044,80 @@ def parse_properties(models, data_types, definitions):
         model = models[definition_name]
         model.update_properties(properties, data_types)
 
+    resolve_list_keys(models)
+
+def resolve_list_keys(models):
+    """
+    Resolve the key properties for items in lists with "x-kubernetes-list-type: map" (so those lists can be rendered as keyed lists).
+
+    A list is left as a plain list if its items are not models, if they lack any of the key properties, or if they are already keyed by different properties (in another list).
+    """
+
+    for definition_name in sorted(models.keys()):
+        model = models[definition_name]
+
+        for model_property in model.properties.values():
+            if not model_property.list_map_keys or not isinstance(model_property.data_type, KubeArrayDataType):
+                continue
+
+            # The items property of a resource list overrides the base class's property, so its type cannot change.
+            if model_property.json_name == 'items' and model.is_kube_resource_list():
+                continue
+
+            item_data_type = model_property.data_type.element_type
+            if not isinstance(item_data_type, KubeModelDataType):
+                continue
+
+            item_model = item_data_type.model
+            key_properties = [
+                item_model.properties.get(list_map_key)
+                for list_map_key in model_property.list_map_keys
+            ]
+            if not all(key_property and key_property.data_type.is_intrinsic() for key_property in key_properties):
+                continue
+
+            if item_model.list_key_properties is None:
+                item_model.list_key_properties = key_properties
+            elif item_model.list_key_properties != key_properties:
+                print('Items of list property "{0}.{1}" are already keyed by different properties; the list will not be keyed.'.format(
+                    model.clr_name,
+                    model_property.json_name
+                ))
+
+                continue
+
+            (model_property.list_key_clr_type_name, _) = get_list_key(key_properties)
+
+def get_list_key(key_properties):
+    """
+    Get the C# key type and key expression for items in a list with "x-kubernetes-list-type: map".
+
+    :param key_properties: The item's key properties (KubeModelProperty).
+    :return: A tuple of (key CLR type name, key expression); composite keys are named tuples.
+    """
+
+    if len(key_properties) == 1:
+        key_property = key_properties[0]
+
+        return (
+            key_property.data_type.to_clr_type_name(is_nullable=key_property.is_optional),
+            key_property.name
+        )
+
+    key_clr_type_name = '({0})'.format(', '.join(
+        '{0} {1}'.format(
+            key_property.data_type.to_clr_type_name(is_nullable=key_property.is_optional),
+            key_property.json_name
+        )
+        for key_property in key_properties
+    ))
+    key_expression = '({0})'.format(', '.join(
+        key_property.name
+        for key_property in key_properties
+    ))
+
+    return (key_clr_type_name, key_expression)
+
 def parse_apis(api_paths):
     apis = {}
 
@@ -554,238 +1152,3352 @@ def parse_apis(api_paths):
 
     return apis
 
-def main():
-    try:
-        os.stat(BASE_DIRECTORY)
-    except FileNotFoundError:
-        os.mkdir(BASE_DIRECTORY)
-
-    with open('kube-1.31-swagger.json') as kube_swagger_file:
-        kube_swagger = json.load(kube_swagger_file)
-
-    paths = kube_swagger["paths"]
-    apis = parse_apis(paths)
-
-    definitions = kube_swagger["definitions"]
-    models = parse_models(definitions)
+def get_render_plan(definitions, models, apis):
+    """
+    Determine which model is rendered to each class file.
 
-    data_types = get_data_types(models)
-    parse_properties(models, data_types, definitions)
+    :param definitions: The swagger definitions, keyed by definition name.
+    :param models: The parsed models (with properties), keyed by definition name.
+    :param apis: The parsed APIs, keyed by group / version / kind.
+    :return: A tuple of (definition name, KubeModel, resource API) for each class file, keyed by class file name.
+    """
 
+    # Several definitions can map to the same CLR name (and therefore the same file); the last one wins.
+    render_plan = {}
     for definition_name in sorted(definitions.keys(), key=get_defname_sort_key):
         if definition_name in IGNORE_MODELS:
             continue
 
         model = models[definition_name]
 
-        class_namespace = ROOT_NAMESPACE
-        class_directory_path = BASE_DIRECTORY
-
-        if not os.path.exists(class_directory_path):
-            os.mkdir(class_directory_path)
-        
         resource_api_key = '{}/{}/{}'.format(model.kube_group, model.api_version, model.name)
         resource_api = apis.get(resource_api_key)
 
-        class_file_name = os.path.join(class_directory_path, model.clr_name + '.cs')
-        with open(class_file_name, 'w') as class_file:
-            class_file.write('using Newtonsoft.Json;' + LINE_ENDING)
-            class_file.write('using System;' + LINE_ENDING)
-            class_file.write('using System.Collections.Generic;' + LINE_ENDING)
-            class_file.write('using YamlDotNet.Serialization;' + LINE_ENDING)
-            class_file.write(LINE_ENDING)
-            class_file.write('namespace ' + class_namespace + LINE_ENDING)
-            class_file.write('{' + LINE_ENDING)
+        class_file_base_name = model.clr_name + '.cs'
+        render_plan.pop(class_file_base_name, None)
+        render_plan[class_file_base_name] = (definition_name, model, resource_api)
+
+    return render_plan
 
-            class_file.write('    /// <summary>' + LINE_ENDING)
+def get_kube_api_paths(plan):
+    """
+    Get the API paths for a model.
+
+    :param plan: The model's KubeModelRenderPlan.
+    :return: A sequence of (KubeAction, path) tuples (ordered by action, then path).
+    """
+
+    resource_api = plan.resource_api
+    if not plan.is_kube_resource or not resource_api:
+        return []
+
+    action_paths = {}
+    for action in sorted(resource_api.keys()):
+        api_paths = resource_api[action]
+        api_action = 'KubeAction.' + KUBE_ACTIONS.get(action,
+            action.capitalize()  # Default
+        )
+
+        for api_path in api_paths:
+            if api_action not in action_paths:
+                action_paths[api_action] = []
+
+            action_paths[api_action].append(api_path)
+
+    kube_api_paths = []
+    for api_action in sorted(action_paths.keys()):
+        for api_path in sorted(action_paths[api_action]):
+            kube_api_path = (api_action, api_path.strip('/'))
+
+            # Ignore duplicates.
+            if kube_api_path not in kube_api_paths:
+                kube_api_paths.append(kube_api_path)
+
+    return kube_api_paths
+
+def render_model(plan, class_namespace=ROOT_NAMESPACE, system_text_json=False, lazy_collections=False, clone_and_equality=False):
+    """
+    Render the C# source for a model class.
+
+    :param plan: The KubeModelRenderPlan for the model to render.
+    :param class_namespace: The namespace for the generated class.
+    :param system_text_json: Also decorate the model for System.Text.Json?
+    :param lazy_collections: Only allocate collection properties when they are first accessed?
+    :param clone_and_equality: Also implement IKubeModelEquatable (deep-cloning and structural equality)?
+    :return: The generated source code.
+    """
+
+    class_file = io.StringIO()
+
+    class_file.write('using Newtonsoft.Json;' + LINE_ENDING)
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write('using System.Collections.Generic;' + LINE_ENDING)
+    class_file.write('using YamlDotNet.Serialization;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+
+    class_file.write('    /// <summary>' + LINE_ENDING)
+
+    for model_summary_line in plan.summary.split('\n'):
+        class_file.write('    ///     ' + model_summary_line + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+
+    model_annotations = []
+
+    if plan.list_item:
+        (list_item_kind, list_item_api_groupversion, _) = plan.list_item
+
+        model_annotations.append('    [KubeListItem("{0}", "{1}")]{2}'.format(
+            list_item_kind,
+            list_item_api_groupversion,
+            LINE_ENDING
+        ))
+
+    # Projections are marked with the model they project (rather than its kind and apiVersion) so that they are not found by kind / apiVersion lookups (which would then have 2 candidate model types).
+    if plan.projection_of and (plan.is_kube_resource or plan.is_kube_resource_list):
+        model_annotations.append('    [KubeProjection(typeof({0}))]{1}'.format(
+            plan.projection_of,
+            LINE_ENDING
+        ))
+    elif plan.is_kube_resource or plan.is_kube_resource_list:
+        model_annotations.append('    [KubeObject("{0}", "{1}")]{2}'.format(
+            plan.name,
+            plan.api_groupversion,
+            LINE_ENDING
+        ))
+
+    # TODO: Add KubeResourceAliasAttribute, but how do we infer singularName and shortNames? These are only available via the API.
+
+    for (api_action, api_path) in get_kube_api_paths(plan):
+        model_annotations.append('    [KubeApi({0}, "{1}")]{2}'.format(
+            api_action,
+            api_path,
+            LINE_ENDING
+        ))
+
+    model_annotations.sort(key=len)  # Shorter attributes come first
+    for model_annotation in model_annotations:
+        class_file.write(model_annotation)
+
+    # Resource lists are enumerable, so System.Text.Json needs a converter to treat them as objects.
+    if system_text_json and plan.is_kube_resource_list and plan.list_item:
+        write_system_text_json_attribute(class_file, '    ',
+            'JsonConverter(typeof(Converters.KubeResourceListV1JsonConverter<{0}, {1}>))'.format(
+                plan.clr_name,
+                plan.list_item[2]
+            )
+        )
+
+    base_types = []
+    if plan.is_kube_resource:
+        base_types.append('KubeResourceV1')
+    elif plan.is_kube_resource_list:
+        if plan.list_item:
+            base_types.append('KubeResourceListV1<{0}>'.format(
+                plan.list_item[2]
+            ))
+        else:
+            base_types.append('KubeResourceListV1')
+    elif plan.is_kube_object:
+        base_types.append('KubeObjectV1')
+
+    if plan.list_key:
+        base_types.append('IKubeKeyedListItem<{0}>'.format(plan.list_key[0]))
+
+    if clone_and_equality:
+        base_types.append('IKubeModelEquatable<{0}>'.format(plan.clr_name))
+
+    class_file.write('    public partial class ' + plan.clr_name)
+    if base_types:
+        class_file.write(' : ' + ', '.join(base_types))
+
+    class_file.write(LINE_ENDING)
+
+    class_file.write('    {' + LINE_ENDING)
 
-            for model_summary_line in model.summary.split('\n'):
-                class_file.write('    ///     ' + model_summary_line + LINE_ENDING)
-            class_file.write('    /// </summary>' + LINE_ENDING)
+    properties = plan.properties
 
-            model_annotations = []
+    for property_index in range(0, len(properties)):
+        model_property = properties[property_index]
 
-            if model.has_list_items():
-                try:
-                    list_item_model = model.list_item_data_type().model
-                except AttributeError:
-                    print('List item datatype "{0}" is not a model'.format(model.name))
-                    pprint.pprint(model.list_item_data_type)
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        for property_summary_line in model_property.summary.split('\n'):
+            class_file.write('        ///     ' + property_summary_line + LINE_ENDING)
+        class_file.write('        /// </summary>' + LINE_ENDING)
 
-                    raise
+        if model_property.is_collection:
+            if model_property.is_retain_keys:
+                class_file.write('        [RetainKeysStrategy]%s' % (LINE_ENDING, ))
+
+            # Shorter attribute comes before [YamlMember]...
+            if model_property.is_merge:
+                if not model_property.merge_key:
+                    class_file.write('        [MergeStrategy]%s' % (LINE_ENDING,))
+                elif len(model_property.merge_key) <= len(model_property.json_name):
+                    class_file.write('        [MergeStrategy(Key = "%s")]%s' % (model_property.merge_key, LINE_ENDING))  
+
+            class_file.write('        [YamlMember(Alias = "%s")]%s' % (model_property.json_name, LINE_ENDING))
+
+            # ...but longer attribute comes after [YamlMember].
+            if model_property.is_merge:
+                if model_property.merge_key and len(model_property.merge_key) > len(model_property.json_name):
+                    class_file.write('        [MergeStrategy(Key = "%s")]%s' % (model_property.merge_key, LINE_ENDING))
+
+            class_file.write('        [JsonProperty("%s", ObjectCreationHandling = ObjectCreationHandling.Reuse)]%s' % (model_property.json_name, LINE_ENDING))
+
+            if system_text_json:
+                write_system_text_json_attribute(class_file, '        ', 'JsonPropertyName("{0}")'.format(model_property.json_name))
+
+            if lazy_collections:
+                field_name = '_' + model_property.name[0].lower() + model_property.name[1:]
+
+                class_file.write('        public %s %s => %s ??= new %s();%s' % (
+                    model_property.clr_type_name,
+                    model_property.name,
+                    field_name,
+                    model_property.clr_type_name,
+                    LINE_ENDING
+                ))
+                class_file.write(LINE_ENDING)
 
-                model_annotations.append('    [KubeListItem("{0}", "{1}")]{2}'.format(
-                    list_item_model.name,
-                    list_item_model.api_groupversion,
+                class_file.write('        /// <summary>' + LINE_ENDING)
+                class_file.write('        ///     The backing field for <see cref="{0}"/> (only allocated when the property is first accessed).{1}'.format(model_property.name, LINE_ENDING))
+                class_file.write('        /// </summary>' + LINE_ENDING)
+                class_file.write('        %s %s;%s' % (
+                    model_property.clr_type_name,
+                    field_name,
                     LINE_ENDING
                 ))
+            else:
+                field_name = None
 
-            if model.is_kube_resource() or model.is_kube_resource_list():
-                model_annotations.append('    [KubeObject("{0}", "{1}")]{2}'.format(
-                    model.name,
-                    model.api_groupversion,
+                class_file.write('        public %s %s { get; } = new %s();%s' % (
+                    model_property.clr_type_name,
+                    model_property.name,
+                    model_property.clr_type_name,
                     LINE_ENDING
                 ))
 
-            # TODO: Add KubeResourceAliasAttribute, but how do we infer singularName and shortNames? These are only available via the API.
-
-            if model.is_kube_resource() and resource_api:
-                added_annotations = set()
-                action_paths = {}
-                for action in sorted(resource_api.keys()):
-                    api_paths = resource_api[action]
-                    api_action = 'KubeAction.' + KUBE_ACTIONS.get(action,
-                        action.capitalize()  # Default
-                    )
-
-                    for api_path in api_paths:
-                        if api_action not in action_paths:
-                            action_paths[api_action] = []
-
-                        action_paths[api_action].append(api_path)
-
-                for api_action in sorted(action_paths.keys()):
-                    for api_path in sorted(action_paths[api_action]):
-                        annotation = '    [KubeApi({0}, "{1}")]{2}'.format(
-                            api_action,
-                            api_path.strip('/'),
-                            LINE_ENDING
-                        )
-
-                        # Ignore duplicates.
-                        if annotation not in added_annotations:
-                            model_annotations.append(annotation)
-                            added_annotations.add(annotation)
-
-            model_annotations.sort(key=len)  # Shorter attributes come first
-            for model_annotation in model_annotations:
-                class_file.write(model_annotation)
-
-            class_file.write('    public partial class ' + model.clr_name)
-            if model.is_kube_resource():
-                class_file.write(' : KubeResourceV1')
-            elif model.is_kube_resource_list():
-                if model.has_list_items():
-                    class_file.write(' : KubeResourceListV1<{0}>'.format(
-                        model.list_item_data_type().to_clr_type_name()
-                    ))
+            # Don't serialise empty lists for optional properties.
+            # See tintoy/dotnet-kube-client#36 for reasoning behind this.
+            if model_property.is_optional:
+                class_file.write(LINE_ENDING)
+
+                class_file.write('        /// <summary>' + LINE_ENDING)
+                class_file.write('        ///     Determine whether the <see cref="{0}"/> property should be serialised.{1}'.format(model_property.name, LINE_ENDING))
+                class_file.write('        /// </summary>' + LINE_ENDING)
+                if field_name:
+                    # Check the backing field (rather than the property), so that checking doesn't allocate the collection.
+                    class_file.write('        public bool ShouldSerialize{0}() => {1} != null && {1}.Count > 0;{2}'.format(model_property.name, field_name, LINE_ENDING))
                 else:
-                    class_file.write(' : KubeResourceListV1')
-            elif model.is_kube_object():
-                class_file.write(' : KubeObjectV1')
+                    class_file.write('        public bool ShouldSerialize{0}() => {0}.Count > 0;{1}'.format(model_property.name, LINE_ENDING))
+        else:
+            if model_property.is_retain_keys:
+                class_file.write('        [RetainKeysStrategy]%s' % (LINE_ENDING, ))
+
+            # Shorter attribute comes before [JsonProperty]...
+            if model_property.is_merge:
+                if not model_property.merge_key:
+                    class_file.write('        [MergeStrategy]%s' % (LINE_ENDING,))
+
+            class_file.write('        [YamlMember(Alias = "%s")]%s' % (model_property.json_name, LINE_ENDING))
+
+            if model_property.is_optional:
+                class_file.write('        [JsonProperty("%s", NullValueHandling = NullValueHandling.Ignore)]%s' % (model_property.json_name, LINE_ENDING))
+            else:
+                class_file.write('        [JsonProperty("%s", NullValueHandling = NullValueHandling.Include)]%s' % (model_property.json_name, LINE_ENDING))
+
+            # ...but longer attribute comes after [YamlMember].
+            if model_property.is_merge:
+                if model_property.merge_key:
+                    class_file.write('        [MergeStrategy(Key = "%s")]%s' % (model_property.merge_key, LINE_ENDING))
+
+            if system_text_json:
+                write_system_text_json_attribute(class_file, '        ', 'JsonPropertyName("{0}")'.format(model_property.json_name))
 
+                # Required properties are serialised even when null (equivalent to NullValueHandling.Include).
+                if not model_property.is_optional:
+                    write_system_text_json_attribute(class_file, '        ', 'JsonIgnore(Condition = global::System.Text.Json.Serialization.JsonIgnoreCondition.Never)')
+
+            class_file.write('        public %s %s { get; set; }%s' % (
+                model_property.optional_clr_type_name,
+                model_property.name,
+                LINE_ENDING
+            ))
+
+        if property_index + 1 < len(properties):
             class_file.write(LINE_ENDING)
 
-            class_file.write('    {' + LINE_ENDING)
+    # Special case for Items property (we override the base class's property, adding the JsonProperty attribute).
+    if plan.items_property:
+        model_property = plan.items_property
 
-            properties = model.properties
-            property_names = [name for name in properties.keys()]
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        for property_summary_line in model_property.summary.split('\n'):
+            class_file.write('        ///     ' + property_summary_line + LINE_ENDING)
+        class_file.write('        /// </summary>' + LINE_ENDING)
 
-            if model.is_kube_object():
-                property_names.remove('apiVersion')
-                property_names.remove('kind')
+        class_file.write('        [JsonProperty("%s", ObjectCreationHandling = ObjectCreationHandling.Reuse)]%s' % (model_property.json_name, LINE_ENDING))
 
-                if model.has_kube_metadata() or model.has_kube_list_metadata():
-                    property_names.remove('metadata')
+        if system_text_json:
+            write_system_text_json_attribute(class_file, '        ', 'JsonPropertyName("{0}")'.format(model_property.json_name))
 
-                if model.is_kube_resource_list() and model.has_list_items():
-                    property_names.remove('items')
+        class_file.write('        public override %s %s { get; } = new %s();%s' % (
+            model_property.clr_type_name,
+            model_property.name,
+            model_property.clr_type_name,
+            LINE_ENDING
+        ))
 
-            for property_index in range(0, len(property_names)):
-                property_name = property_names[property_index]
-                model_property = properties[property_name]
+    # Key for items in a list with "x-kubernetes-list-type: map" (explicitly implemented, so it is not serialised).
+    if plan.list_key:
+        (list_key_clr_type_name, list_key_expression, list_key_json_names) = plan.list_key
 
-                class_file.write('        /// <summary>' + LINE_ENDING)
-                for property_summary_line in model_property.summary.split('\n'):
-                    class_file.write('        ///     ' + property_summary_line + LINE_ENDING)
-                class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     The key that identifies the item within a keyed list ({0}).{1}'.format(
+            ', '.join('"{0}"'.format(json_name) for json_name in list_key_json_names),
+            LINE_ENDING
+        ))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        {0} IKubeKeyedListItem<{0}>.ListKey => {1};{2}'.format(
+            list_key_clr_type_name,
+            list_key_expression,
+            LINE_ENDING
+        ))
 
-                if model_property.data_type.is_collection():
-                    if model_property.is_retain_keys:
-                        class_file.write('        [RetainKeysStrategy]%s' % (LINE_ENDING, ))
-
-                    # Shorter attribute comes before [YamlMember]...
-                    if model_property.is_merge:
-                        if not model_property.merge_key:
-                            class_file.write('        [MergeStrategy]%s' % (LINE_ENDING,))
-                        elif len(model_property.merge_key) <= len(model_property.json_name):
-                            class_file.write('        [MergeStrategy(Key = "%s")]%s' % (model_property.merge_key, LINE_ENDING))  
-
-                    class_file.write('        [YamlMember(Alias = "%s")]%s' % (model_property.json_name, LINE_ENDING))
-
-                    # ...but longer attribute comes after [YamlMember].
-                    if model_property.is_merge:
-                        if model_property.merge_key and len(model_property.merge_key) > len(model_property.json_name):
-                            class_file.write('        [MergeStrategy(Key = "%s")]%s' % (model_property.merge_key, LINE_ENDING))
-
-                    class_file.write('        [JsonProperty("%s", ObjectCreationHandling = ObjectCreationHandling.Reuse)]%s' % (model_property.json_name, LINE_ENDING))
-
-                    class_file.write('        public %s %s { get; } = new %s();%s' % (
-                        model_property.data_type.to_clr_type_name(),
-                        model_property.name,
-                        model_property.data_type.to_clr_type_name(),
-                        LINE_ENDING
-                    ))
-
-                    # Don't serialise empty lists for optional properties.
-                    # See tintoy/dotnet-kube-client#36 for reasoning behind this.
-                    if model_property.is_optional:
-                        class_file.write(LINE_ENDING)
-
-                        class_file.write('        /// <summary>' + LINE_ENDING)
-                        class_file.write('        ///     Determine whether the <see cref="{0}"/> property should be serialised.{1}'.format(model_property.name, LINE_ENDING))
-                        class_file.write('        /// </summary>' + LINE_ENDING)
-                        class_file.write('        public bool ShouldSerialize{0}() => {0}.Count > 0;{1}'.format(model_property.name, LINE_ENDING))
-                else:
-                    if model_property.is_retain_keys:
-                        class_file.write('        [RetainKeysStrategy]%s' % (LINE_ENDING, ))
+    if clone_and_equality:
+        write_equality_members(class_file, plan, lazy_collections)
 
-                    # Shorter attribute comes before [JsonProperty]...
-                    if model_property.is_merge:
-                        if not model_property.merge_key:
-                            class_file.write('        [MergeStrategy]%s' % (LINE_ENDING,))
+    class_file.write('    }' + LINE_ENDING) # Class
 
-                    class_file.write('        [YamlMember(Alias = "%s")]%s' % (model_property.json_name, LINE_ENDING))
+    class_file.write('}' + LINE_ENDING) # Namespace
 
-                    if model_property.is_optional:
-                        class_file.write('        [JsonProperty("%s", NullValueHandling = NullValueHandling.Ignore)]%s' % (model_property.json_name, LINE_ENDING))
-                    else:
-                        class_file.write('        [JsonProperty("%s", NullValueHandling = NullValueHandling.Include)]%s' % (model_property.json_name, LINE_ENDING))
+    return class_file.getvalue()
 
-                    # ...but longer attribute comes after [YamlMember].
-                    if model_property.is_merge:
-                        if model_property.merge_key:
-                            class_file.write('        [MergeStrategy(Key = "%s")]%s' % (model_property.merge_key, LINE_ENDING))
+def get_equality_members(plan, lazy_collections):
+    """
+    Get the members that are cloned and compared by a model's generated equality members (including those inherited from its base class).
 
-                    class_file.write('        public %s %s { get; set; }%s' % (
-                        model_property.data_type.to_clr_type_name(is_nullable=model_property.is_optional),
-                        model_property.name,
-                        LINE_ENDING
-                    ))
+    :param plan: The model's KubeModelRenderPlan.
+    :param lazy_collections: Are collection properties only allocated when they are first accessed?
+    :return: A sequence of (property name, value expression, value kind, CLR type name, always ignore for semantic equality, semantic-equality flag that ignores the member) tuples.
+    """
 
-                if property_index + 1 < len(property_names):
-                    class_file.write(LINE_ENDING)
+    members = []
 
-            # Special case for Items property (we override the base class's property, adding the JsonProperty attribute).
-            if model.is_kube_resource_list() and model.has_list_items():
-                model_property = model.properties['items']
+    if plan.is_kube_object:
+        members.append(('Kind', 'Kind', 'value', 'string', True, None))
+        members.append(('ApiVersion', 'ApiVersion', 'value', 'string', True, None))
 
-                class_file.write('        /// <summary>' + LINE_ENDING)
-                for property_summary_line in model_property.summary.split('\n'):
-                    class_file.write('        ///     ' + property_summary_line + LINE_ENDING)
-                class_file.write('        /// </summary>' + LINE_ENDING)
+    if plan.is_kube_resource:
+        members.append(('Metadata', 'Metadata', 'model', 'ObjectMetaV1', False, None))
+    elif plan.is_kube_resource_list:
+        members.append(('Metadata', 'Metadata', 'model', 'ListMetaV1', False, None))
 
-                class_file.write('        [JsonProperty("%s", ObjectCreationHandling = ObjectCreationHandling.Reuse)]%s' % (model_property.json_name, LINE_ENDING))
-                class_file.write('        public override %s %s { get; } = new %s();%s' % (
-                    model_property.data_type.to_clr_type_name(),
-                    model_property.name,
-                    model_property.data_type.to_clr_type_name(),
-                    LINE_ENDING
-                ))
+    for model_property in plan.properties:
+        # Read lazily-allocated collections via their backing fields (so that comparing and cloning doesn't allocate them).
+        value_expression = model_property.name
+        if model_property.is_collection and lazy_collections:
+            value_expression = '_' + model_property.name[0].lower() + model_property.name[1:]
 
-            class_file.write('    }' + LINE_ENDING) # Class
+        ignore_flag = None
+        if plan.is_kube_resource and model_property.json_name == 'status':
+            ignore_flag = 'ignoreStatus'
+        elif plan.clr_name == 'ObjectMetaV1' and model_property.json_name == 'managedFields':
+            ignore_flag = 'ignoreManagedFields'
+
+        members.append((
+            model_property.name,
+            value_expression,
+            model_property.value_kind,
+            model_property.clr_type_name,
+            (plan.clr_name, model_property.json_name) in SEMANTIC_EQUALITY_IGNORED_PROPERTIES,
+            ignore_flag
+        ))
+
+    if plan.items_property:
+        model_property = plan.items_property
+
+        members.append((model_property.name, model_property.name, model_property.value_kind, model_property.clr_type_name, False, None))
+
+    return members
+
+def get_equality_expression(value_expression, value_kind, clr_type_name, semantic):
+    """
+    Get the C# expression that compares a member's value with the equivalent member of another model (named "other").
+
+    :param value_expression: The expression for the member's value.
+    :param value_kind: The member's value kind (see get_value_kind).
+    :param clr_type_name: The member's CLR type name.
+    :param semantic: Compare for semantic (rather than strict) equality?
+    :return: The C# expression.
+    """
+
+    if value_kind == 'value':
+        if clr_type_name.rstrip('?') in EQUALITY_OPERATOR_TYPE_NAMES:
+            return '{0} == other.{0}'.format(value_expression)
+
+        return 'Equals({0}, other.{0})'.format(value_expression)
+
+    if value_kind == 'model':
+        if semantic:
+            return 'KubeModelEquality.AreSemanticallyEqual({0}, other.{0}, ignoreStatus, ignoreManagedFields)'.format(value_expression)
+
+        return 'KubeModelEquality.AreEqual({0}, other.{0})'.format(value_expression)
+
+    if value_kind in ('list:value', 'list:model'):
+        if semantic and value_kind == 'list:model':
+            return 'KubeModelEquality.ListsSemanticallyEqual({0}, other.{0}, ignoreStatus, ignoreManagedFields)'.format(value_expression)
+
+        return 'KubeModelEquality.ListsEqual({0}, other.{0})'.format(value_expression)
+
+    if value_kind in ('dict:value', 'dict:model'):
+        if semantic and value_kind == 'dict:model':
+            return 'KubeModelEquality.DictionariesSemanticallyEqual({0}, other.{0}, ignoreStatus, ignoreManagedFields)'.format(value_expression)
+
+        return 'KubeModelEquality.DictionariesEqual({0}, other.{0})'.format(value_expression)
+
+    if value_kind == 'dict:list:value':
+        return 'KubeModelEquality.DictionariesOfListsEqual({0}, other.{0})'.format(value_expression)
+
+    raise ValueError('Cannot generate equality members for values of kind "{0}".'.format(value_kind))
+
+def get_copy_method_name(value_kind):
+    """
+    Get the name of the KubeModelEquality method that copies the contents of a collection of the specified value kind (see get_value_kind).
+    """
+
+    if value_kind in ('list:value', 'dict:value'):
+        return 'CopyValues'
+
+    if value_kind in ('list:model', 'dict:model'):
+        return 'CopyModels'
+
+    if value_kind == 'dict:list:value':
+        return 'CopyLists'
+
+    raise ValueError('Cannot generate equality members for values of kind "{0}".'.format(value_kind))
+
+def write_equality_members(class_file, plan, lazy_collections):
+    """
+    Write the members that implement IKubeModelEquatable (deep-cloning and structural equality) for a model.
+
+    :param class_file: The file to write to.
+    :param plan: The model's KubeModelRenderPlan.
+    :param lazy_collections: Are collection properties only allocated when they are first accessed?
+    """
+
+    members = get_equality_members(plan, lazy_collections)
+    extension_data_field = EXTENSION_DATA_FIELDS.get(plan.clr_name)
+
+    def write_comparison(comparisons):
+        if not comparisons:
+            class_file.write('            return true;' + LINE_ENDING)
+
+            return
+
+        class_file.write('            return ' + (LINE_ENDING + '                && ').join(comparisons) + ';' + LINE_ENDING)
+
+    def write_reference_checks():
+        class_file.write('            if (ReferenceEquals(other, null))' + LINE_ENDING)
+        class_file.write('                return false;' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+        class_file.write('            if (ReferenceEquals(other, this))' + LINE_ENDING)
+        class_file.write('                return true;' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+
+    # DeepClone
+    class_file.write(LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Create a deep clone of the <see cref="{0}"/>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        /// <returns>' + LINE_ENDING)
+    class_file.write('        ///     The new <see cref="{0}"/>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </returns>' + LINE_ENDING)
+    class_file.write('        public {0} DeepClone(){1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        {' + LINE_ENDING)
+
+    assignments = []
+    copy_statements = []
+    for (name, value_expression, value_kind, clr_type_name, _, _) in members:
+        if value_kind == 'value':
+            assignments.append('{0} = {1}'.format(name, value_expression))
+        elif value_kind == 'model':
+            assignments.append('{0} = {1}?.DeepClone()'.format(name, value_expression))
+        elif value_expression != name:
+            copy_statements.append('if ({0} != null){1}                KubeModelEquality.{2}({0}, clone.{3});'.format(value_expression, LINE_ENDING, get_copy_method_name(value_kind), name))
+        else:
+            copy_statements.append('KubeModelEquality.{0}({1}, clone.{2});'.format(get_copy_method_name(value_kind), value_expression, name))
+
+    if extension_data_field:
+        copy_statements.append('KubeModelEquality.CopyExtensionData({0}, clone.{0});'.format(extension_data_field))
+
+    if assignments:
+        class_file.write('            var clone = new {0}{1}'.format(plan.clr_name, LINE_ENDING))
+        class_file.write('            {' + LINE_ENDING)
+        class_file.write((',' + LINE_ENDING).join(
+            '                ' + assignment
+            for assignment in assignments
+        ) + LINE_ENDING)
+        class_file.write('            };' + LINE_ENDING)
+    else:
+        class_file.write('            var clone = new {0}();{1}'.format(plan.clr_name, LINE_ENDING))
+
+    if copy_statements:
+        class_file.write(LINE_ENDING)
+        for copy_statement in copy_statements:
+            class_file.write('            ' + copy_statement + LINE_ENDING)
+
+    class_file.write(LINE_ENDING)
+    class_file.write('            return clone;' + LINE_ENDING)
+    class_file.write('        }' + LINE_ENDING)
+
+    # Equals
+    comparisons = [
+        get_equality_expression(value_expression, value_kind, clr_type_name, semantic=False)
+        for (_, value_expression, value_kind, clr_type_name, _, _) in members
+    ]
+    if extension_data_field:
+        comparisons.append('KubeModelEquality.ExtensionDataEqual({0}, other.{0})'.format(extension_data_field))
+
+    class_file.write(LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Determine whether the <see cref="{0}"/> is equal to another <see cref="{0}"/>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        /// <param name="other">' + LINE_ENDING)
+    class_file.write('        ///     The other <see cref="{0}"/>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </param>' + LINE_ENDING)
+    class_file.write('        /// <returns>' + LINE_ENDING)
+    class_file.write('        ///     <c>true</c>, if the <see cref="{0}"/>s are equal; otherwise, <c>false</c>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </returns>' + LINE_ENDING)
+    class_file.write('        public bool Equals({0} other){1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        {' + LINE_ENDING)
+    write_reference_checks()
+    write_comparison(comparisons)
+    class_file.write('        }' + LINE_ENDING)
+
+    # IsSemanticallyEqual
+    semantic_comparisons = []
+    for (_, value_expression, value_kind, clr_type_name, is_semantically_ignored, ignore_flag) in members:
+        if is_semantically_ignored:
+            continue
+
+        comparison = get_equality_expression(value_expression, value_kind, clr_type_name, semantic=True)
+        if ignore_flag:
+            comparison = '({0} || {1})'.format(ignore_flag, comparison)
+
+        semantic_comparisons.append(comparison)
+
+    if extension_data_field:
+        semantic_comparisons.append('KubeModelEquality.ExtensionDataEqual({0}, other.{0})'.format(extension_data_field))
+
+    class_file.write(LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Determine whether the <see cref="{0}"/> is semantically equal to another <see cref="{0}"/>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        /// <param name="other">' + LINE_ENDING)
+    class_file.write('        ///     The other <see cref="{0}"/>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </param>' + LINE_ENDING)
+    class_file.write('        /// <param name="ignoreStatus">' + LINE_ENDING)
+    class_file.write('        ///     Ignore differences in the status of resources?' + LINE_ENDING)
+    class_file.write('        /// </param>' + LINE_ENDING)
+    class_file.write('        /// <param name="ignoreManagedFields">' + LINE_ENDING)
+    class_file.write('        ///     Ignore differences in the managed-fields metadata of resources?' + LINE_ENDING)
+    class_file.write('        /// </param>' + LINE_ENDING)
+    class_file.write('        /// <returns>' + LINE_ENDING)
+    class_file.write('        ///     <c>true</c>, if the <see cref="{0}"/>s are semantically equal; otherwise, <c>false</c>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </returns>' + LINE_ENDING)
+    class_file.write('        public bool IsSemanticallyEqual({0} other, bool ignoreStatus = false, bool ignoreManagedFields = false){1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        {' + LINE_ENDING)
+    write_reference_checks()
+    write_comparison(semantic_comparisons)
+    class_file.write('        }' + LINE_ENDING)
+
+    # Equals(object)
+    class_file.write(LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Determine whether the <see cref="{0}"/> is equal to another object.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        /// <param name="obj">' + LINE_ENDING)
+    class_file.write('        ///     The other object.' + LINE_ENDING)
+    class_file.write('        /// </param>' + LINE_ENDING)
+    class_file.write('        /// <returns>' + LINE_ENDING)
+    class_file.write('        ///     <c>true</c>, if the other object is an equal <see cref="{0}"/>; otherwise, <c>false</c>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </returns>' + LINE_ENDING)
+    class_file.write('        public override bool Equals(object obj) => Equals(obj as {0});{1}'.format(plan.clr_name, LINE_ENDING))
+
+    # GetHashCode (collections only contribute their size, so that hashing stays cheap).
+    class_file.write(LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Get a hash code for the <see cref="{0}"/>.{1}'.format(plan.clr_name, LINE_ENDING))
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        /// <returns>' + LINE_ENDING)
+    class_file.write('        ///     The hash code.' + LINE_ENDING)
+    class_file.write('        /// </returns>' + LINE_ENDING)
+    class_file.write('        public override int GetHashCode()' + LINE_ENDING)
+    class_file.write('        {' + LINE_ENDING)
+    class_file.write('            var hashCode = new HashCode();' + LINE_ENDING)
+    for (_, value_expression, value_kind, _, _, _) in members:
+        if value_kind in ('value', 'model'):
+            class_file.write('            hashCode.Add({0});{1}'.format(value_expression, LINE_ENDING))
+        else:
+            class_file.write('            hashCode.Add(KubeModelEquality.GetCount({0}));{1}'.format(value_expression, LINE_ENDING))
+    class_file.write(LINE_ENDING)
+    class_file.write('            return hashCode.ToHashCode();' + LINE_ENDING)
+    class_file.write('        }' + LINE_ENDING)
+
+def write_system_text_json_attribute(class_file, indent, attribute):
+    """
+    Write a System.Text.Json attribute (only compiled on target frameworks where System.Text.Json is available).
+
+    The attribute is fully-qualified because its name may clash with the equivalent Newtonsoft.Json attribute (or with model properties named "System").
+
+    :param class_file: The file to write to.
+    :param indent: The indent for the attribute.
+    :param attribute: The attribute (name and arguments, without the System.Text.Json.Serialization namespace).
+    """
+
+    class_file.write('#if ' + SYSTEM_TEXT_JSON_CONDITION + LINE_ENDING)
+    class_file.write('{0}[global::System.Text.Json.Serialization.{1}]{2}'.format(indent, attribute, LINE_ENDING))
+    class_file.write('#endif' + LINE_ENDING)
+
+def render_json_context(clr_names, class_namespace=ROOT_NAMESPACE, class_name='KubeModelJsonContext'):
+    """
+    Render the C# source for a System.Text.Json JsonSerializerContext covering the specified model types.
+
+    :param clr_names: The CLR names of the model types.
+    :param class_namespace: The namespace for the generated class.
+    :param class_name: The name of the generated class.
+    :return: The generated source code.
+    """
+
+    class_file = io.StringIO()
+
+    class_file.write('#if ' + SYSTEM_TEXT_JSON_CONDITION + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('using System.Text.Json.Serialization;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+    class_file.write('    using Converters;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('    /// <summary>' + LINE_ENDING)
+    class_file.write('    ///     Source-generated System.Text.Json serialisation metadata for generated model types.' + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+    class_file.write('    [JsonSourceGenerationOptions(' + LINE_ENDING)
+    class_file.write('        PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase,' + LINE_ENDING)
+    class_file.write('        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,' + LINE_ENDING)
+    class_file.write('        PreferredObjectCreationHandling = JsonObjectCreationHandling.Populate,' + LINE_ENDING)
+    class_file.write('        Converters = new[] {{ {0} }}{1}'.format(
+        ', '.join('typeof({0})'.format(converter) for converter in JSON_CONTEXT_CONVERTERS),
+        LINE_ENDING
+    ))
+    class_file.write('    )]' + LINE_ENDING)
+    for clr_name in sorted(clr_names):
+        class_file.write('    [JsonSerializable(typeof({0}))]{1}'.format(clr_name, LINE_ENDING))
+    class_file.write('    public partial class ' + class_name + LINE_ENDING)
+    class_file.write('        : JsonSerializerContext' + LINE_ENDING)
+    class_file.write('    {' + LINE_ENDING)
+    class_file.write('    }' + LINE_ENDING) # Class
+    class_file.write('}' + LINE_ENDING) # Namespace
+    class_file.write(LINE_ENDING)
+    class_file.write('#endif // ' + SYSTEM_TEXT_JSON_CONDITION + LINE_ENDING)
+
+    return class_file.getvalue()
+
+def get_retained_model_registrations(class_directory_path, generated_file_names):
+    """
+    Get registration metadata for model files in the output directory that were not generated by this run (e.g. models from older versions of the Kubernetes API, which are retained for backward compatibility).
+
+    :param class_directory_path: The output directory.
+    :param generated_file_names: The names of files generated by this run.
+    :return: A list of KubeModelRegistration.
+    """
+
+    registrations = []
+    for class_file_base_name in sorted(os.listdir(class_directory_path)):
+        if not class_file_base_name.endswith('.cs') or class_file_base_name in generated_file_names:
+            continue
+
+        if class_file_base_name in (KNOWN_MODELS_FILE_NAME, JSON_CONTEXT_FILE_NAME, MODEL_CONVERTERS_FILE_NAME, BINARY_SERIALIZERS_FILE_NAME, INTERNED_STRING_PROPERTIES_FILE_NAME, PATCH_PROPERTIES_FILE_NAME, INDEXED_FIELDS_FILE_NAME, RESOURCE_CLIENTS_FILE_NAME):
+            continue
+
+        registration = KubeModelRegistration.from_model_file(
+            os.path.join(class_directory_path, class_file_base_name)
+        )
+        if registration:
+            registrations.append(registration)
+
+    return registrations
+
+def get_known_model_tables(registrations):
+    """
+    Get the table entries that describe resource and resource-list models (used by the KnownModels registry, and by model partitions).
+
+    :param registrations: KubeModelRegistration for the resource and resource-list models.
+    :return: A tuple of (resource-type entries, API-action entries, API path templates, resource-list-type entries), each of which is a list of C# expressions.
+    """
+
+    registrations = sorted(registrations, key=lambda registration: registration.clr_name)
+
+    # API paths are shared between many resource types (e.g. the same type in different API versions), so each distinct path template is only emitted once.
+    api_path_templates = sorted(set(
+        api_path
+        for registration in registrations
+        for (_, api_path) in registration.api_paths
+    ))
+    api_path_template_indexes = {
+        api_path: api_path_template_index
+        for (api_path_template_index, api_path) in enumerate(api_path_templates)
+    }
+
+    resource_type_entries = []
+    api_actions = []
+    for registration in registrations:
+        if registration.is_resource_list:
+            continue
+
+        resource_type_entries.append('(typeof({0}), "{1}", "{2}", {3}, {4})'.format(
+            registration.clr_name,
+            registration.kind,
+            registration.api_groupversion,
+            len(api_actions),
+            len(registration.api_paths)
+        ))
+        api_actions.extend(registration.api_paths)
+
+    api_action_entries = [
+        '({0}, {1})'.format(api_action, api_path_template_indexes[api_path])
+        for (api_action, api_path) in api_actions
+    ]
+
+    api_path_template_entries = [
+        '"{0}"'.format(api_path)
+        for api_path in api_path_templates
+    ]
+
+    resource_list_type_entries = []
+    for registration in registrations:
+        if not registration.is_resource_list:
+            continue
+
+        resource_list_type_entries.append('(typeof({0}), "{1}", "{2}", {3}, {4})'.format(
+            registration.clr_name,
+            registration.kind,
+            registration.api_groupversion,
+            get_csharp_string_literal(registration.list_item_kind),
+            get_csharp_string_literal(registration.list_item_api_groupversion)
+        ))
+
+    return (resource_type_entries, api_action_entries, api_path_template_entries, resource_list_type_entries)
+
+def write_table(class_file, indent, summary, declaration, entries):
+    """
+    Write the C# declaration of a static table (an array field with an initialiser).
+
+    :param class_file: The file to write to.
+    :param indent: The indent for the declaration.
+    :param summary: The summary for the declaration's documentation comment.
+    :param declaration: The field declaration (without its initialiser).
+    :param entries: The C# expression for each entry in the table.
+    """
+
+    class_file.write(indent + '/// <summary>' + LINE_ENDING)
+    class_file.write(indent + '///     ' + summary + LINE_ENDING)
+    class_file.write(indent + '/// </summary>' + LINE_ENDING)
+    class_file.write(indent + declaration + ' =' + LINE_ENDING)
+    class_file.write(indent + '{' + LINE_ENDING)
+    for entry in entries:
+        class_file.write(indent + '    ' + entry + ',' + LINE_ENDING)
+    class_file.write(indent + '};' + LINE_ENDING)
+
+def render_known_models(registrations, class_namespace=ROOT_NAMESPACE):
+    """
+    Render the C# source for the KnownModels registry.
+
+    :param registrations: KubeModelRegistration for all resource and resource-list models.
+    :param class_namespace: The namespace for the generated class.
+    :return: The generated source code.
+    """
+
+    (resource_type_entries, api_action_entries, api_path_template_entries, resource_list_type_entries) = get_known_model_tables(registrations)
+
+    class_file = io.StringIO()
+
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+    class_file.write('    /// <summary>' + LINE_ENDING)
+    class_file.write('    ///     Metadata for well-known model types.' + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+    class_file.write('    public static partial class KnownModels' + LINE_ENDING)
+    class_file.write('    {' + LINE_ENDING)
+
+    write_table(class_file, '        ',
+        'Generated resource model types (derived from <see cref="KubeResourceV1"/>), with their kinds and API versions (and the range of <see cref="GeneratedApiActions"/> that describes their APIs).',
+        'static readonly (Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount)[] GeneratedResourceTypes',
+        resource_type_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '        ',
+        'API actions for generated resource model types (each with an index into <see cref="GeneratedApiPathTemplates"/>).',
+        'static readonly (KubeAction action, int pathTemplate)[] GeneratedApiActions',
+        api_action_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '        ',
+        'API path templates for generated resource model types.',
+        'static readonly string[] GeneratedApiPathTemplates',
+        api_path_template_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '        ',
+        'Generated resource-list model types (derived from <see cref="KubeResourceListV1"/>), with their kinds and API versions (and those of their items, if known).',
+        'static readonly (Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion)[] GeneratedResourceListTypes',
+        resource_list_type_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    # A switch statement (rather than a dictionary lookup) because it is used to dispatch every event in dynamic watches; the compiler turns string switches into a hash-based jump table.
+    resource_types_by_kind = {}
+    for registration in sorted(registrations, key=lambda registration: registration.clr_name):
+        if registration.is_resource_list:
+            continue
+
+        resource_types_by_kind.setdefault(registration.kind, []).append(registration)
+
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Get the generated resource model type (derived from <see cref="KubeResourceV1"/>) for the specified kind and API version.' + LINE_ENDING)
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        /// <param name="kind">' + LINE_ENDING)
+    class_file.write('        ///     The resource kind.' + LINE_ENDING)
+    class_file.write('        /// </param>' + LINE_ENDING)
+    class_file.write('        /// <param name="apiVersion">' + LINE_ENDING)
+    class_file.write('        ///     The resource API version.' + LINE_ENDING)
+    class_file.write('        /// </param>' + LINE_ENDING)
+    class_file.write('        /// <returns>' + LINE_ENDING)
+    class_file.write('        ///     The model type, or <c>null</c> if there is no generated model type for the specified kind and API version.' + LINE_ENDING)
+    class_file.write('        /// </returns>' + LINE_ENDING)
+    class_file.write('        static Type GetGeneratedResourceType(string kind, string apiVersion)' + LINE_ENDING)
+    class_file.write('        {' + LINE_ENDING)
+    class_file.write('            switch (kind)' + LINE_ENDING)
+    class_file.write('            {' + LINE_ENDING)
+    for kind in sorted(resource_types_by_kind.keys()):
+        class_file.write('                case "{0}":{1}'.format(kind, LINE_ENDING))
+        class_file.write('                {' + LINE_ENDING)
+        class_file.write('                    switch (apiVersion)' + LINE_ENDING)
+        class_file.write('                    {' + LINE_ENDING)
+        for registration in sorted(resource_types_by_kind[kind], key=lambda registration: registration.api_groupversion):
+            class_file.write('                        case "{0}": return typeof({1});{2}'.format(
+                registration.api_groupversion,
+                registration.clr_name,
+                LINE_ENDING
+            ))
+        class_file.write('                    }' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+        class_file.write('                    break;' + LINE_ENDING)
+        class_file.write('                }' + LINE_ENDING)
+    class_file.write('            }' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('            return null;' + LINE_ENDING)
+    class_file.write('        }' + LINE_ENDING)
+
+    class_file.write('    }' + LINE_ENDING) # Class
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def get_partition_name(definition_name):
+    """
+    Get the name of the partition that contains the model generated from a swagger definition (when partitioning models by API group).
+
+    :param definition_name: The definition name (e.g. "io.k8s.api.apps.v1.Deployment").
+    :return: The partition name (e.g. "Apps").
+    """
+
+    name_components = definition_name.split('.')
+
+    prerelease_match = PRERELEASE_API_VERSION_PATTERN.match(name_components[-2])
+    if prerelease_match:
+        return capitalize_name(prerelease_match.group(1))
+
+    if definition_name.startswith('io.k8s.apimachinery.') or name_components[-3] == 'core':
+        return CORE_PARTITION_NAME
+
+    api_group = name_components[-3]
+
+    return PARTITION_NAMES.get(api_group, capitalize_name(api_group))
+
+def get_referenced_models(model):
+    """
+    Get the models referenced by a model's properties (directly, or as list items or dictionary values).
+
+    :param model: The KubeModel.
+    :return: A generator that yields the referenced KubeModels.
+    """
+
+    for model_property in model.properties.values():
+        data_type = model_property.data_type
+        while data_type.is_collection():
+            data_type = data_type.element_type
+
+        if isinstance(data_type, KubeModelDataType):
+            yield data_type.model
+
+def get_model_partitions(render_plan):
+    """
+    Assign each model to be generated to a partition (when partitioning models by API group).
+
+    :param render_plan: The render plan (see get_render_plan).
+    :return: A tuple of (partition names, keyed by model CLR name; names of the partitions that each partition depends on, keyed by partition name).
+    """
+
+    models = {
+        model.clr_name: model
+        for (_, model, _) in render_plan.values()
+    }
+    model_partitions = {
+        model.clr_name: get_partition_name(definition_name)
+        for (definition_name, model, _) in render_plan.values()
+    }
+
+    # Every other partition depends on the core partition, so it must be self-contained (a few CLR names, e.g. EventSeriesV1, are shared by models from more than one API group, and the last one wins).
+    pending_clr_names = [
+        clr_name
+        for (clr_name, partition_name) in model_partitions.items()
+        if partition_name == CORE_PARTITION_NAME
+    ]
+    while pending_clr_names:
+        model = models[pending_clr_names.pop()]
+
+        for referenced_model in get_referenced_models(model):
+            clr_name = referenced_model.clr_name
+            if model_partitions.get(clr_name, CORE_PARTITION_NAME) != CORE_PARTITION_NAME:
+                model_partitions[clr_name] = CORE_PARTITION_NAME
+                pending_clr_names.append(clr_name)
+
+    partition_dependencies = {
+        partition_name: set()
+        for partition_name in model_partitions.values()
+    }
+    for (clr_name, partition_name) in model_partitions.items():
+        for referenced_model in get_referenced_models(models[clr_name]):
+            referenced_partition_name = model_partitions.get(referenced_model.clr_name)
+            if referenced_partition_name and referenced_partition_name != partition_name:
+                partition_dependencies[partition_name].add(referenced_partition_name)
+
+    return (model_partitions, partition_dependencies)
+
+def render_partition_registration(partition_name, dependency_names, models, registrations, patch_properties, indexed_fields, converter_models, binary_serializer_models, class_namespace=ROOT_NAMESPACE):
+    """
+    Render the C# source for a model partition's registration entry point (when partitioning models by API group).
+
+    :param partition_name: The partition name.
+    :param dependency_names: The names of the partitions that the partition depends on.
+    :param models: The partition's models.
+    :param registrations: KubeModelRegistration for the partition's resource and resource-list models.
+    :param patch_properties: The partition's model properties used to compute strategic-merge patches (see get_patch_properties).
+    :param indexed_fields: The partition's model fields whose values can be used as index keys (see get_indexed_fields).
+    :param converter_models: The partition's models that have a generated JSON converter.
+    :param binary_serializer_models: The partition's models that have a generated binary serialiser.
+    :param class_namespace: The namespace for the generated class.
+    :return: The generated source code.
+    """
+
+    (resource_type_entries, api_action_entries, api_path_template_entries, resource_list_type_entries) = get_known_model_tables(registrations)
+
+    class_file = io.StringIO()
+
+    class_file.write('using Newtonsoft.Json;' + LINE_ENDING)
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write('#if ' + TRIM_ANNOTATIONS_CONDITION + LINE_ENDING)
+    class_file.write('using System.Diagnostics.CodeAnalysis;' + LINE_ENDING)
+    class_file.write('#endif // ' + TRIM_ANNOTATIONS_CONDITION + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+    class_file.write('    using Converters;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('    /// <summary>' + LINE_ENDING)
+    class_file.write('    ///     Metadata for well-known model types.' + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+    class_file.write('    public static partial class KnownModels' + LINE_ENDING)
+    class_file.write('    {' + LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Generated models in the "{0}" partition.{1}'.format(partition_name, LINE_ENDING))
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    if dependency_names:
+        class_file.write('        /// <remarks>' + LINE_ENDING)
+        class_file.write('        ///     Depends on the {0} partition{1}.{2}'.format(
+            ', '.join('"{0}"'.format(dependency_name) for dependency_name in sorted(dependency_names)),
+            's' if len(dependency_names) > 1 else '',
+            LINE_ENDING
+        ))
+        class_file.write('        /// </remarks>' + LINE_ENDING)
+    class_file.write('        public static class ' + partition_name + LINE_ENDING)
+    class_file.write('        {' + LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'Resource model types (derived from <see cref="KubeResourceV1"/>), with their kinds and API versions (and the range of <see cref="ApiActions"/> that describes their APIs).',
+        'static readonly (Type modelType, string kind, string apiVersion, int firstApiAction, int apiActionCount)[] ResourceTypes',
+        resource_type_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'API actions for resource model types (each with an index into <see cref="ApiPathTemplates"/>).',
+        'static readonly (KubeAction action, int pathTemplate)[] ApiActions',
+        api_action_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'API path templates for resource model types.',
+        'static readonly string[] ApiPathTemplates',
+        api_path_template_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'Resource-list model types (derived from <see cref="KubeResourceListV1"/>), with their kinds and API versions (and those of their items, if known).',
+        'static readonly (Type modelType, string kind, string apiVersion, string itemKind, string itemApiVersion)[] ResourceListTypes',
+        resource_list_type_entries
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'Model properties whose string values are interned, with the parts of their values that are interned.',
+        'static readonly (Type modelType, string propertyName, InternedStrings internedStrings)[] InternedProperties',
+        get_interned_string_property_entries(models)
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'Model properties that have a patch strategy (or whose values contain properties that do), with their patch strategies, merge keys, and model types.',
+        'static readonly (Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)[] PatchProperties',
+        get_patch_property_entries(patch_properties)
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'Model fields whose values can be used as index keys, with functions that get their values.',
+        'static readonly (Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue)[] IndexedFields',
+        get_indexed_field_entries(indexed_fields)
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'Generated (streaming) JSON converters, with their model types.',
+        'static readonly (Type modelType, JsonConverter converter)[] ModelConverters',
+        [
+            '(typeof({0}), {0}Converter.Instance)'.format(model.clr_name)
+            for model in converter_models
+        ]
+    )
+    class_file.write(LINE_ENDING)
+
+    write_table(class_file, '            ',
+        'Generated binary serialisers, with their model types.',
+        'static readonly (Type modelType, KubeModelBinarySerializer serializer)[] BinarySerializers',
+        [
+            '(typeof({0}), {0}BinarySerializer.Instance)'.format(model.clr_name)
+            for model in binary_serializer_models
+        ]
+    )
+    class_file.write(LINE_ENDING)
+
+    class_file.write('            /// <summary>' + LINE_ENDING)
+    class_file.write('            ///     Metadata for the partition\'s models.' + LINE_ENDING)
+    class_file.write('            /// </summary>' + LINE_ENDING)
+    class_file.write('            public static KubeModelPartition Partition {{ get; }} = new KubeModelPartition("{0}", ResourceTypes, ApiActions, ApiPathTemplates, ResourceListTypes, InternedProperties, PatchProperties, IndexedFields, ModelConverters, BinarySerializers);{1}'.format(
+        partition_name,
+        LINE_ENDING
+    ))
+    class_file.write(LINE_ENDING)
+
+    class_file.write('            /// <summary>' + LINE_ENDING)
+    class_file.write('            ///     Register the partition\'s models (and those of the partitions it depends on) with <see cref="KnownModels"/>.' + LINE_ENDING)
+    class_file.write('            /// </summary>' + LINE_ENDING)
+    class_file.write('            /// <remarks>' + LINE_ENDING)
+    class_file.write('            ///     Also ensures that the members of the partition\'s models used by the serialiser are preserved when the application is trimmed.' + LINE_ENDING)
+    class_file.write('            /// </remarks>' + LINE_ENDING)
+    class_file.write('#if ' + TRIM_ANNOTATIONS_CONDITION + LINE_ENDING)
+    for model in sorted(models, key=lambda model: model.clr_name):
+        class_file.write('            [DynamicDependency(ModelMembers, typeof({0}))]{1}'.format(model.clr_name, LINE_ENDING))
+    class_file.write('#endif // ' + TRIM_ANNOTATIONS_CONDITION + LINE_ENDING)
+    class_file.write('            public static void Register()' + LINE_ENDING)
+    class_file.write('            {' + LINE_ENDING)
+    class_file.write('                if (!KnownModels.Register(Partition))' + LINE_ENDING)
+    class_file.write('                    return;' + LINE_ENDING)
+    if dependency_names:
+        class_file.write(LINE_ENDING)
+    for dependency_name in sorted(dependency_names):
+        class_file.write('                {0}.Register();{1}'.format(dependency_name, LINE_ENDING))
+    class_file.write('            }' + LINE_ENDING)
+
+    class_file.write(LINE_ENDING)
+    class_file.write('#if ' + TRIM_ANNOTATIONS_CONDITION + LINE_ENDING)
+    class_file.write('            /// <summary>' + LINE_ENDING)
+    class_file.write('            ///     The members of the partition\'s models that are used by the serialiser.' + LINE_ENDING)
+    class_file.write('            /// </summary>' + LINE_ENDING)
+    class_file.write('            const DynamicallyAccessedMemberTypes ModelMembers = DynamicallyAccessedMemberTypes.PublicConstructors | DynamicallyAccessedMemberTypes.PublicProperties;' + LINE_ENDING)
+    class_file.write('#endif // ' + TRIM_ANNOTATIONS_CONDITION + LINE_ENDING)
+
+    class_file.write('        }' + LINE_ENDING) # Partition class
+    class_file.write('    }' + LINE_ENDING) # Class
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def get_interned_strings(model_property):
+    """
+    Determine which parts (if any) of a model property's value should be interned when it is deserialised.
+
+    :param model_property: The KubeModelProperty.
+    :return: The names of the InternedStrings flags for the property (empty, if the property's value should not be interned).
+    """
+
+    data_type = model_property.data_type
+    if data_type.is_collection():
+        data_type = data_type.element_type
+
+    if not data_type.is_intrinsic() or data_type.to_clr_type_name() != 'string':
+        return ()
+
+    interned_strings = INTERNED_STRING_PROPERTIES.get(model_property.json_name)
+    if interned_strings is None:
+        if not model_property.json_name.endswith(INTERNED_STRING_PROPERTY_SUFFIXES):
+            return ()
+
+        interned_strings = ('Values',)
+
+    # Only dictionaries have keys.
+    if not isinstance(model_property.data_type, KubeDictionaryDataType):
+        interned_strings = tuple(flag for flag in interned_strings if flag != 'DictionaryKeys')
+
+    return interned_strings
+
+def get_interned_strings_expression(interned_strings):
+    """
+    Get the C# expression for a combination of InternedStrings flags.
+
+    :param interned_strings: The names of the InternedStrings flags.
+    :return: The expression.
+    """
+
+    return ' | '.join('InternedStrings.' + flag for flag in interned_strings)
+
+def render_interned_string_properties(models, class_namespace=ROOT_NAMESPACE):
+    """
+    Render the C# source for the table of model properties whose string values are interned.
+
+    :param models: The models to be generated.
+    :param class_namespace: The namespace for the generated class.
+    :return: The generated source code.
+    """
+
+    class_file = io.StringIO()
+
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+
+    class_file.write('    /// <summary>' + LINE_ENDING)
+    class_file.write('    ///     Model properties whose string values are interned when they are deserialised.' + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+    class_file.write('    public static partial class InternedStringProperties' + LINE_ENDING)
+    class_file.write('    {' + LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Generated model properties, with the parts of their values that are interned.' + LINE_ENDING)
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        static readonly (Type modelType, string propertyName, InternedStrings internedStrings)[] GeneratedProperties =' + LINE_ENDING)
+    class_file.write('        {' + LINE_ENDING)
+    for entry in get_interned_string_property_entries(models):
+        class_file.write('            ' + entry + ',' + LINE_ENDING)
+    class_file.write('        };' + LINE_ENDING)
+
+    class_file.write('    }' + LINE_ENDING) # Class
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def get_interned_string_property_entries(models):
+    """
+    Get the table entries that describe model properties whose string values are interned.
+
+    :param models: The models.
+    :return: A list of C# expressions (one per property), sorted by model CLR name.
+    """
+
+    entries = []
+    for model in sorted(models, key=lambda model: model.clr_name):
+        for model_property in model.properties.values():
+            # Declared by KubeObjectV1 (see InternedStringProperties.HandCodedProperties).
+            if model.is_kube_object() and model_property.json_name in ('kind', 'apiVersion'):
+                continue
+
+            interned_strings = get_interned_strings(model_property)
+            if not interned_strings:
+                continue
+
+            entries.append('(typeof({0}), nameof({0}.{1}), {2})'.format(
+                model.clr_name,
+                model_property.name,
+                get_interned_strings_expression(interned_strings)
+            ))
+
+    return entries
+
+def render_patch_properties(models, class_namespace=ROOT_NAMESPACE):
+    """
+    Render the C# source for the table of model properties used to compute strategic-merge patches.
+
+    :param models: The models to be generated.
+    :param class_namespace: The namespace for the generated class.
+    :return: The generated source code.
+    """
+
+    class_file = io.StringIO()
+
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+
+    class_file.write('    /// <summary>' + LINE_ENDING)
+    class_file.write('    ///     Computes Kubernetes strategic-merge patches.' + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+    class_file.write('    public static partial class StrategicMergePatch' + LINE_ENDING)
+    class_file.write('    {' + LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Generated model properties that have a patch strategy (or whose values contain properties that do), with their patch strategies, merge keys, and model types.' + LINE_ENDING)
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        static readonly (Type modelType, string jsonName, PatchStrategies patchStrategies, string mergeKey, Type propertyModelType)[] GeneratedProperties =' + LINE_ENDING)
+    class_file.write('        {' + LINE_ENDING)
+    for entry in get_patch_property_entries(get_patch_properties(models)):
+        class_file.write('            ' + entry + ',' + LINE_ENDING)
+    class_file.write('        };' + LINE_ENDING)
+
+    class_file.write('    }' + LINE_ENDING) # Class
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def get_patch_properties(models):
+    """
+    Get the model properties that are relevant when computing a strategic-merge patch.
+
+    A property is relevant if it has a patch strategy, or if its value (or, for arrays, its items) is a model that has relevant properties.
+    Dictionary values are not considered (they are always merged key-by-key).
+
+    :param models: The models to be generated.
+    :return: A list of (KubeModel, KubeModelProperty, KubeModel or None) tuples for the relevant properties (and the models of their values), sorted by model CLR name.
+    """
+
+    clr_names = set(model.clr_name for model in models)
+
+    def get_property_model(model_property):
+        data_type = model_property.data_type
+        if isinstance(data_type, KubeArrayDataType):
+            data_type = data_type.element_type
+
+        if isinstance(data_type, KubeModelDataType) and data_type.model.clr_name in clr_names:
+            return data_type.model
+
+        return None
+
+    def has_patch_strategy(model_property):
+        return model_property.is_merge or model_property.is_retain_keys
+
+    # Models with relevant properties (directly or indirectly).
+    patch_clr_names = set()
+    is_changed = True
+    while is_changed:
+        is_changed = False
+
+        for model in models:
+            if model.clr_name in patch_clr_names:
+                continue
+
+            for model_property in model.properties.values():
+                property_model = get_property_model(model_property)
+                if has_patch_strategy(model_property) or (property_model and property_model.clr_name in patch_clr_names):
+                    patch_clr_names.add(model.clr_name)
+                    is_changed = True
+
+                    break
+
+    patch_properties = []
+    for model in sorted(models, key=lambda model: model.clr_name):
+        if model.clr_name not in patch_clr_names:
+            continue
+
+        for model_property in model.properties.values():
+            property_model = get_property_model(model_property)
+            if property_model and property_model.clr_name not in patch_clr_names:
+                property_model = None
+
+            if has_patch_strategy(model_property) or property_model:
+                patch_properties.append((model, model_property, property_model))
+
+    return patch_properties
+
+def get_patch_property_entries(patch_properties):
+    """
+    Get the table entries that describe model properties used to compute strategic-merge patches.
+
+    :param patch_properties: A list of (KubeModel, KubeModelProperty, KubeModel or None) tuples, from get_patch_properties.
+    :return: A list of C# expressions (one per property).
+    """
+
+    return [
+        '(typeof({0}), "{1}", {2}, {3}, {4})'.format(
+            model.clr_name,
+            model_property.json_name,
+            get_patch_strategies_expression(model_property),
+            '"{0}"'.format(model_property.merge_key) if model_property.merge_key else 'null',
+            'typeof({0})'.format(property_model.clr_name) if property_model else 'null'
+        )
+        for (model, model_property, property_model) in patch_properties
+    ]
+
+def get_patch_strategies_expression(model_property):
+    """
+    Get the C# expression for a model property's patch strategies.
+
+    Properties without a patch strategy (that are only listed because their values contain properties that have one) get 'default' (i.e. no flags), since the patch engine never reads PatchStrategies.Replace.
+
+    :param model_property: The model property.
+    :return: The C# expression.
+    """
+
+    patch_strategies = []
+    if model_property.is_merge:
+        patch_strategies.append('PatchStrategies.Merge')
+    if model_property.is_retain_keys:
+        patch_strategies.append('PatchStrategies.RetainKeys')
+
+    return ' | '.join(patch_strategies) or 'default'
+
+def render_indexed_fields(indexed_fields, class_namespace=ROOT_NAMESPACE):
+    """
+    Render the C# source for the table of model fields whose values can be used as index keys.
+
+    :param indexed_fields: The indexed fields (see get_indexed_fields).
+    :param class_namespace: The namespace for the generated class.
+    :return: The generated source code.
+    """
+
+    class_file = io.StringIO()
+
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+
+    class_file.write('    /// <summary>' + LINE_ENDING)
+    class_file.write('    ///     Model fields whose values can be used as index keys.' + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+    class_file.write('    public static partial class IndexedFields' + LINE_ENDING)
+    class_file.write('    {' + LINE_ENDING)
+    class_file.write('        /// <summary>' + LINE_ENDING)
+    class_file.write('        ///     Generated model fields, with functions that get their values.' + LINE_ENDING)
+    class_file.write('        /// </summary>' + LINE_ENDING)
+    class_file.write('        static readonly (Type modelType, string fieldPath, Func<KubeResourceV1, string> getValue)[] GeneratedFields =' + LINE_ENDING)
+    class_file.write('        {' + LINE_ENDING)
+    for entry in get_indexed_field_entries(indexed_fields):
+        class_file.write('            ' + entry + ',' + LINE_ENDING)
+    class_file.write('        };' + LINE_ENDING)
+
+    class_file.write('    }' + LINE_ENDING) # Class
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def get_indexed_fields(models):
+    """
+    Get the model fields whose values can be used as index keys (see INDEXED_FIELDS).
+
+    Models that are not being generated are ignored, but a field path that cannot be resolved to a string property is an error.
+
+    :param models: The models to be generated, keyed by definition name.
+    :return: A list of (KubeModel, field path, list of KubeModelProperty along the path) tuples, sorted by model CLR name.
+    """
+
+    indexed_fields = []
+    for (definition_name, field_paths) in INDEXED_FIELDS.items():
+        model = models.get(definition_name)
+        if not model:
+            continue
+
+        for field_path in field_paths:
+            property_path = []
+
+            field_model = model
+            for json_name in field_path.split('.'):
+                if not field_model:
+                    raise ValueError('Indexed field "{0}" of {1}: "{2}" is not a model.'.format(field_path, model.clr_name, property_path[-1].json_name))
+
+                model_property = next(
+                    (model_property for model_property in field_model.properties.values() if model_property.json_name == json_name),
+                    None
+                )
+                if not model_property:
+                    raise ValueError('Indexed field "{0}" of {1}: {2} has no property named "{3}".'.format(field_path, model.clr_name, field_model.clr_name, json_name))
+
+                property_path.append(model_property)
+
+                field_model = model_property.data_type.model if isinstance(model_property.data_type, KubeModelDataType) else None
+
+            data_type = property_path[-1].data_type
+            if not data_type.is_intrinsic() or data_type.to_clr_type_name() != 'string':
+                raise ValueError('Indexed field "{0}" of {1} is not a string (type {2}).'.format(field_path, model.clr_name, data_type.to_clr_type_name()))
+
+            indexed_fields.append((model, field_path, property_path))
+
+    indexed_fields.sort(key=lambda indexed_field: (indexed_field[0].clr_name, indexed_field[1]))
+
+    return indexed_fields
+
+def get_indexed_field_entries(indexed_fields):
+    """
+    Get the table entries that describe model fields whose values can be used as index keys.
+
+    :param indexed_fields: A list of (KubeModel, field path, list of KubeModelProperty) tuples, from get_indexed_fields.
+    :return: A list of C# expressions (one per field).
+    """
+
+    return [
+        '(typeof({0}), "{1}", resource => (({0})resource).{2})'.format(
+            model.clr_name,
+            field_path,
+            '?.'.join(model_property.name for model_property in property_path)
+        )
+        for (model, field_path, property_path) in indexed_fields
+    ]
+
+def get_hand_written_client_names(source_directory=RESOURCE_CLIENTS_SOURCE_DIRECTORY):
+    """
+    Get the names of hand-written resource client classes.
+
+    Generated files (and build output) are ignored.
+
+    :param source_directory: The directory to search (recursively) for C# source files.
+    :return: A set of class names.
+    """
+
+    client_names = set()
+    for (directory_path, directory_names, file_names) in os.walk(source_directory):
+        directory_names[:] = [
+            directory_name
+            for directory_name in directory_names
+            if directory_name not in ('bin', 'obj', 'generated')
+        ]
+
+        for file_name in file_names:
+            if not file_name.endswith('.cs'):
+                continue
+
+            with open(os.path.join(directory_path, file_name), encoding='utf8', errors='replace') as source_file:
+                client_names.update(
+                    RESOURCE_CLIENT_CLASS_PATTERN.findall(source_file.read())
+                )
+
+    return client_names
+
+def get_resource_client_plans(render_plan, apis, hand_written_client_names):
+    """
+    Determine the resource client (and request paths) to render for each listable resource.
+
+    A resource is listable if its list model is being generated and the API has a "list" action; when the API has both namespaced and cluster-wide list paths, the namespaced path is used.
+
+    :param render_plan: The render plan (see get_render_plan).
+    :param apis: The parsed APIs, keyed by group / version / kind.
+    :param hand_written_client_names: The names of hand-written resource client classes (see get_hand_written_client_names).
+    :return: A list of KubeResourceClientPlan, sorted by the model's CLR name.
+    """
+
+    plan_models = {
+        model.clr_name: model
+        for (_, model, _) in render_plan.values()
+    }
+
+    client_plans = []
+    for list_model in plan_models.values():
+        if not list_model.is_kube_resource_list() or not list_model.has_list_items():
+            continue
+
+        model = list_model.list_item_data_type().model
+        if plan_models.get(model.clr_name) is not model or not model.is_kube_resource():
+            continue
+
+        resource_api = apis.get('{}/{}/{}'.format(model.kube_group, model.api_version, model.name))
+        if not resource_api or 'list' not in resource_api:
+            continue
+
+        collection_paths = sorted(
+            (api_path.strip('/') for api_path in resource_api['list']),
+            key=lambda api_path: ('{namespace}' not in api_path, api_path)
+        )
+        collection_path = collection_paths[0]
+
+        # Single-resource actions are only available if the API addresses resources by name, directly below the collection.
+        resource_paths = set(
+            api_path.strip('/')
+            for action in ('get', 'patch', 'delete')
+            for api_path in resource_api.get(action, [])
+        )
+        actions = set(
+            action
+            for action in resource_api.keys()
+            if action not in ('get', 'patch', 'delete') or collection_path + '/{name}' in resource_paths
+        )
+
+        client_plans.append(KubeResourceClientPlan(model, list_model, collection_path, actions,
+            has_hand_written_client=model.name + 'Client' + model.pretty_api_version in hand_written_client_names
+        ))
+
+    client_plans.sort(key=lambda client_plan: client_plan.model.clr_name)
+
+    return client_plans
+
+def render_resource_clients(client_plans, class_namespace=RESOURCE_CLIENTS_NAMESPACE):
+    """
+    Render the C# source for the precompiled request paths and typed resource clients of listable resources.
+
+    Resources that have a hand-written client only get request paths (which the hand-written client can use).
+
+    :param client_plans: A list of KubeResourceClientPlan (see get_resource_client_plans).
+    :param class_namespace: The namespace for the generated classes.
+    :return: The generated source code.
+    """
+
+    class_file = io.StringIO()
+
+    class_file.write('using Microsoft.AspNetCore.JsonPatch;' + LINE_ENDING)
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write('using System.Collections.Generic;' + LINE_ENDING)
+    class_file.write('using System.Threading;' + LINE_ENDING)
+    class_file.write('using System.Threading.Tasks;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+    class_file.write('    using Http;' + LINE_ENDING)
+    class_file.write('    using Models;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+
+    class_file.write('    /// <summary>' + LINE_ENDING)
+    class_file.write('    ///     Precompiled request paths for Kubernetes resource APIs.' + LINE_ENDING)
+    class_file.write('    /// </summary>' + LINE_ENDING)
+    class_file.write('    public static partial class KubeResourcePaths' + LINE_ENDING)
+    class_file.write('    {' + LINE_ENDING)
+    for (index, client_plan) in enumerate(client_plans):
+        if index > 0:
+            class_file.write(LINE_ENDING)
+
+        write_resource_paths(class_file, client_plan)
+    class_file.write('    }' + LINE_ENDING) # KubeResourcePaths
+
+    generated_client_plans = [client_plan for client_plan in client_plans if not client_plan.has_hand_written_client]
+    for client_plan in generated_client_plans:
+        class_file.write(LINE_ENDING)
+        write_resource_client(class_file, client_plan)
+
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    if generated_client_plans:
+        class_file.write(LINE_ENDING)
+        class_file.write('namespace KubeClient' + LINE_ENDING)
+        class_file.write('{' + LINE_ENDING)
+        class_file.write('    using ResourceClients;' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+        class_file.write('    /// <summary>' + LINE_ENDING)
+        class_file.write('    ///     Extension methods for creating Kubernetes resource clients for a <see cref="KubeApiClient"/>.' + LINE_ENDING)
+        class_file.write('    /// </summary>' + LINE_ENDING)
+        class_file.write('    public static partial class ClientFactoryExtensions' + LINE_ENDING)
+        class_file.write('    {' + LINE_ENDING)
+        for (index, client_plan) in enumerate(generated_client_plans):
+            if index > 0:
+                class_file.write(LINE_ENDING)
+
+            write_lines(class_file, '        ', [
+                '/// <summary>',
+                '///     Get the Kubernetes {0} resource client.'.format(client_plan.display_name),
+                '/// </summary>',
+                '/// <param name="kubeClient">',
+                '///     The Kubernetes API client.',
+                '/// </param>',
+                '/// <returns>',
+                '///     The resource client.',
+                '/// </returns>',
+                'public static {0} {1}(this IKubeApiClient kubeClient)'.format(client_plan.interface_name, client_plan.paths_name),
+                '{',
+                '    if (kubeClient == null)',
+                '        throw new ArgumentNullException(nameof(kubeClient));',
+                '',
+                '    return kubeClient.ResourceClient<{0}>('.format(client_plan.interface_name),
+                '        client => new {0}(client)'.format(client_plan.client_name),
+                '    );',
+                '}',
+            ])
+        class_file.write('    }' + LINE_ENDING) # ClientFactoryExtensions
+        class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def write_lines(class_file, indent, lines):
+    for line in lines:
+        class_file.write((indent + line if line else '') + LINE_ENDING)
+
+def write_resource_paths(class_file, client_plan):
+    """
+    Write the precompiled request paths for a listable resource.
+
+    :param class_file: The file to write to.
+    :param client_plan: The resource's KubeResourceClientPlan.
+    """
+
+    kind = client_plan.model.name
+    if client_plan.is_namespaced:
+        namespace_parameter = 'string kubeNamespace, '
+        collection_path_expression = '"{0}", Segment(kubeNamespace, nameof(kubeNamespace)), "{1}"'.format(client_plan.path_prefix, client_plan.path_suffix)
+        namespace_doc = [
+            '/// <param name="kubeNamespace">',
+            '///     The target Kubernetes namespace.',
+            '/// </param>',
+        ]
+        in_namespace = ' in the specified namespace'
+    else:
+        namespace_parameter = ''
+        collection_path_expression = None
+        namespace_doc = []
+        in_namespace = ''
+
+    lines = [
+        '/// <summary>',
+        '///     Request paths for the Kubernetes {0} API.'.format(client_plan.display_name),
+        '/// </summary>',
+        'public static class {0}'.format(client_plan.paths_name),
+        '{',
+        '    /// <summary>',
+        '    ///     Get the path (and query) for the {0}{1}.'.format(client_plan.plural_kind, in_namespace),
+        '    /// </summary>',
+    ]
+    lines += ['    ' + line for line in namespace_doc]
+    lines += [
+        '    /// <param name="labelSelector">',
+        '    ///     An optional Kubernetes label selector expression used to filter the {0}.'.format(client_plan.plural_kind),
+        '    /// </param>',
+        '    /// <param name="fieldSelector">',
+        '    ///     An optional Kubernetes field selector expression used to filter the {0}.'.format(client_plan.plural_kind),
+        '    /// </param>',
+        '    /// <param name="watch">',
+        '    ///     Watch for changes to the {0} (rather than listing them)?'.format(client_plan.plural_kind),
+        '    /// </param>',
+        '    /// <returns>',
+        '    ///     The request path (relative to the API server\'s base address).',
+        '    /// </returns>',
+    ]
+    if client_plan.is_namespaced:
+        lines += [
+            '    public static string Collection({0}string labelSelector = null, string fieldSelector = null, bool watch = false)'.format(namespace_parameter),
+            '    {',
+            '        return WithQuery(String.Concat({0}), labelSelector, fieldSelector, watch);'.format(collection_path_expression),
+            '    }',
+        ]
+    else:
+        lines += [
+            '    public static string Collection(string labelSelector = null, string fieldSelector = null, bool watch = false)',
+            '    {',
+            '        return WithQuery("{0}", labelSelector, fieldSelector, watch);'.format(client_plan.path_suffix),
+            '    }',
+        ]
+
+    if client_plan.has_action('get'):
+        lines += [
+            '',
+            '    /// <summary>',
+            '    ///     Get the path for the {0} with the specified name{1}.'.format(kind, in_namespace),
+            '    /// </summary>',
+            '    /// <param name="name">',
+            '    ///     The name of the {0}.'.format(kind),
+            '    /// </param>',
+        ]
+        lines += ['    ' + line for line in namespace_doc]
+        lines += [
+            '    /// <returns>',
+            '    ///     The request path (relative to the API server\'s base address).',
+            '    /// </returns>',
+        ]
+        if client_plan.is_namespaced:
+            lines += [
+                '    public static string ByName(string name, string kubeNamespace)',
+                '    {',
+                '        return String.Concat({0}, "/", Segment(name, nameof(name)));'.format(collection_path_expression),
+                '    }',
+            ]
+        else:
+            lines += [
+                '    public static string ByName(string name)',
+                '    {',
+                '        return String.Concat("{0}/", Segment(name, nameof(name)));'.format(client_plan.path_suffix),
+                '    }',
+            ]
+
+    lines.append('}')
+
+    write_lines(class_file, '        ', lines)
+
+def get_resource_client_members(client_plan):
+    """
+    Get the members of a generated resource client.
+
+    :param client_plan: The resource's KubeResourceClientPlan.
+    :return: A list of (documentation lines, signature, implementation lines) tuples (one per member); the signature is shared by the client and its interface.
+    """
+
+    model = client_plan.model
+    kind = model.name
+    plural_kind = client_plan.plural_kind
+    api_description = '{0}/{1}'.format(model.api_groupversion, kind)
+    paths = 'KubeResourcePaths.' + client_plan.paths_name
+
+    namespace_parameter_doc = [
+        '/// <param name="kubeNamespace">',
+        '///     The target Kubernetes namespace (defaults to <see cref="KubeApiClient.DefaultNamespace"/>).',
+        '/// </param>',
+    ] if client_plan.is_namespaced else []
+    namespace_parameter = 'string kubeNamespace = null, ' if client_plan.is_namespaced else ''
+    namespace_argument = 'kubeNamespace ?? KubeClient.DefaultNamespace, ' if client_plan.is_namespaced else ''
+    in_namespace = ' in the specified namespace' if client_plan.is_namespaced else ''
+    namespace_description = ' in namespace {kubeNamespace ?? KubeClient.DefaultNamespace}' if client_plan.is_namespaced else ''
+    name_and_namespace_arguments = 'name, kubeNamespace ?? KubeClient.DefaultNamespace' if client_plan.is_namespaced else 'name'
+
+    selector_parameters_doc = [
+        '/// <param name="labelSelector">',
+        '///     An optional Kubernetes label selector expression used to filter the {0}.'.format(plural_kind),
+        '/// </param>',
+        '/// <param name="fieldSelector">',
+        '///     An optional Kubernetes field selector expression used to filter the {0}.'.format(plural_kind),
+        '/// </param>',
+    ]
+    selectors_description = 'with label selector \'{labelSelector ?? "<none>"}\' and field selector \'{fieldSelector ?? "<none>"}\''
+    cancellation_token_doc = [
+        '/// <param name="cancellationToken">',
+        '///     An optional <see cref="CancellationToken"/> that can be used to cancel the request.',
+        '/// </param>',
+    ]
+
+    members = []
+
+    if client_plan.has_action('get'):
+        members.append((
+            [
+                '/// <summary>',
+                '///     Get the {0} with the specified name.'.format(kind),
+                '/// </summary>',
+                '/// <param name="name">',
+                '///     The name of the {0} to retrieve.'.format(kind),
+                '/// </param>',
+            ] + namespace_parameter_doc + cancellation_token_doc + [
+                '/// <returns>',
+                '///     A <see cref="{0}"/> representing the current state for the {1}, or <c>null</c> if no {1} was found with the specified name{2}.'.format(model.clr_name, kind, ' and namespace' if client_plan.is_namespaced else ''),
+                '/// </returns>',
+            ],
+            'Task<{0}> Get(string name, {1}CancellationToken cancellationToken = default)'.format(model.clr_name, namespace_parameter),
+            [
+                'return GetSingleResource<{0}>('.format(model.clr_name),
+                '    CreateRequest({0}.ByName({1})),'.format(paths, name_and_namespace_arguments),
+                '    cancellationToken: cancellationToken',
+                ');',
+            ]
+        ))
+
+    members.append((
+        [
+            '/// <summary>',
+            '///     Get all {0}{1}, optionally matching a label and / or field selector.'.format(plural_kind, in_namespace),
+            '/// </summary>',
+        ] + selector_parameters_doc + namespace_parameter_doc + cancellation_token_doc + [
+            '/// <returns>',
+            '///     A <see cref="{0}"/> containing the {1}.'.format(client_plan.list_model.clr_name, plural_kind),
+            '/// </returns>',
+        ],
+        'Task<{0}> List(string labelSelector = null, string fieldSelector = null, {1}CancellationToken cancellationToken = default)'.format(client_plan.list_model.clr_name, namespace_parameter),
+        [
+            'return GetResourceList<{0}>('.format(client_plan.list_model.clr_name),
+            '    CreateRequest({0}.Collection({1}labelSelector, fieldSelector)),'.format(paths, namespace_argument),
+            '    cancellationToken: cancellationToken',
+            ');',
+        ]
+    ))
+
+    members.append((
+        [
+            '/// <summary>',
+            '///     Enumerate all {0}{1} (optionally matching a label and / or field selector), retrieving them in pages (chunks) of limited size.'.format(plural_kind, in_namespace),
+            '/// </summary>',
+        ] + selector_parameters_doc + namespace_parameter_doc + [
+            '/// <param name="pageSize">',
+            '///     The maximum number of {0} to retrieve per request.'.format(plural_kind),
+            '/// </param>',
+            '/// <param name="prefetchNextPage">',
+            '///     Request the next page while {0} from the current page are still being enumerated?'.format(plural_kind),
+            '/// </param>',
+            '/// <param name="cancellationToken">',
+            '///     An optional <see cref="CancellationToken"/> that can be used to cancel enumeration.',
+            '/// </param>',
+            '/// <returns>',
+            '///     An <see cref="IAsyncEnumerable{{T}}"/> that yields each <see cref="{0}"/> as soon as it has been received (without buffering the entire list).'.format(model.clr_name),
+            '/// </returns>',
+        ],
+        'IAsyncEnumerable<{0}> ListPaged(string labelSelector = null, string fieldSelector = null, {1}int pageSize = KubeResourceClient.DefaultListPageSize, bool prefetchNextPage = false, CancellationToken cancellationToken = default)'.format(model.clr_name, namespace_parameter),
+        [
+            'return EnumerateResourceList<{0}>('.format(model.clr_name),
+            '    CreateRequest({0}.Collection({1}labelSelector, fieldSelector)),'.format(paths, namespace_argument),
+            '    operationDescription: $"list {0}/{1} {2}{3}",'.format(model.api_groupversion, plural_kind, selectors_description, namespace_description),
+            '    pageSize: pageSize,',
+            '    prefetchNextPage: prefetchNextPage,',
+            '    cancellationToken: cancellationToken',
+            ');',
+        ]
+    ))
+
+    if client_plan.has_action('watchlist') or client_plan.has_action('watch'):
+        members.append((
+            [
+                '/// <summary>',
+                '///     Watch for events relating to {0}{1}, optionally matching a label and / or field selector.'.format(plural_kind, in_namespace),
+                '/// </summary>',
+            ] + selector_parameters_doc + namespace_parameter_doc + [
+                '/// <param name="resourceVersion">',
+                '///     An optional Kubernetes resource version (<seealso cref="ObjectMetaV1.ResourceVersion"/>) to start watching from (only events for newer versions are returned).',
+                '/// </param>',
+                '/// <param name="includeBookmarks">',
+                '///     Publish bookmark events (<see cref="ResourceEventType.Bookmark"/>) to subscribers (e.g. to keep track of the resource version to resume from)?',
+                '/// </param>',
+                '/// <returns>',
+                '///     An <see cref="IObservable{T}"/> representing the event stream.',
+                '/// </returns>',
+            ],
+            'IObservable<IResourceEventV1<{0}>> WatchAll(string labelSelector = null, string fieldSelector = null{1}, string resourceVersion = null, bool includeBookmarks = false)'.format(model.clr_name, ', string kubeNamespace = null' if client_plan.is_namespaced else ''),
+            [
+                'return ObserveEvents<{0}>('.format(model.clr_name),
+                '    CreateRequest({0}.Collection({1}labelSelector, fieldSelector, watch: true)),'.format(paths, namespace_argument),
+                '    operationDescription: $"watch all {0}/{1} {2}{3}",'.format(model.api_groupversion, plural_kind, selectors_description, namespace_description),
+                '    resourceVersion: resourceVersion,',
+                '    includeBookmarks: includeBookmarks',
+                ');',
+            ]
+        ))
+
+    if client_plan.has_action('post'):
+        new_resource = 'new' + kind
+        if client_plan.is_namespaced:
+            create_path_arguments = '{0}.Metadata?.Namespace ?? KubeClient.DefaultNamespace'.format(new_resource)
+            create_namespace_description = ' in namespace {{{0}.Metadata?.Namespace ?? KubeClient.DefaultNamespace}}'.format(new_resource)
+        else:
+            create_path_arguments = ''
+            create_namespace_description = ''
+
+        members.append((
+            [
+                '/// <summary>',
+                '///     Request creation of a <see cref="{0}"/>.'.format(model.clr_name),
+                '/// </summary>',
+                '/// <param name="{0}">'.format(new_resource),
+                '///     A <see cref="{0}"/> representing the {1} to create.'.format(model.clr_name, kind),
+                '/// </param>',
+            ] + cancellation_token_doc + [
+                '/// <returns>',
+                '///     A <see cref="{0}"/> representing the current state for the newly-created {1}.'.format(model.clr_name, kind),
+                '/// </returns>',
+            ],
+            'Task<{0}> Create({0} {1}, CancellationToken cancellationToken = default)'.format(model.clr_name, new_resource),
+            [
+                'if ({0} == null)'.format(new_resource),
+                '    throw new ArgumentNullException(nameof({0}));'.format(new_resource),
+                '',
+                'return Http',
+                '    .PostAsJsonAsync(',
+                '        CreateRequest({0}.Collection({1})),'.format(paths, create_path_arguments),
+                '        postBody: {0},'.format(new_resource),
+                '        cancellationToken: cancellationToken',
+                '    )',
+                '    .ReadContentAsObjectV1Async<{0}>('.format(model.clr_name),
+                '        operationDescription: $"create {0} resource{1}"'.format(api_description, create_namespace_description),
+                '    );',
+            ]
+        ))
+
+    if client_plan.has_action('patch'):
+        members.append((
+            [
+                '/// <summary>',
+                '///     Request update (PATCH) of a <see cref="{0}"/>.'.format(model.clr_name),
+                '/// </summary>',
+                '/// <param name="name">',
+                '///     The name of the target {0}.'.format(kind),
+                '/// </param>',
+                '/// <param name="patchAction">',
+                '///     A delegate that customises the patch operation.',
+                '/// </param>',
+            ] + namespace_parameter_doc + cancellation_token_doc + [
+                '/// <returns>',
+                '///     A <see cref="{0}"/> representing the current state for the updated {1}.'.format(model.clr_name, kind),
+                '/// </returns>',
+            ],
+            'Task<{0}> Update(string name, Action<JsonPatchDocument<{0}>> patchAction, {1}CancellationToken cancellationToken = default)'.format(model.clr_name, namespace_parameter),
+            [
+                'return PatchResource(patchAction,',
+                '    CreateRequest({0}.ByName({1})),'.format(paths, name_and_namespace_arguments),
+                '    cancellationToken',
+                ');',
+            ]
+        ))
+
+    if client_plan.has_action('delete'):
+        members.append((
+            [
+                '/// <summary>',
+                '///     Request deletion of the specified {0}.'.format(kind),
+                '/// </summary>',
+                '/// <param name="name">',
+                '///     The name of the {0} to delete.'.format(kind),
+                '/// </param>',
+            ] + namespace_parameter_doc + [
+                '/// <param name="propagationPolicy">',
+                '///     A <see cref="DeletePropagationPolicy"/> indicating how child resources should be deleted (if at all).',
+                '/// </param>',
+            ] + cancellation_token_doc + [
+                '/// <returns>',
+                '///     A <see cref="{0}"/> representing the {1}\'s most recent state before it was deleted, if <paramref name="propagationPolicy"/> is <see cref="DeletePropagationPolicy.Foreground"/>; otherwise, a <see cref="StatusV1"/> indicating the operation result.'.format(model.clr_name, kind),
+                '/// </returns>',
+            ],
+            'Task<KubeResourceResultV1<{0}>> Delete(string name, {1}DeletePropagationPolicy? propagationPolicy = null, CancellationToken cancellationToken = default)'.format(model.clr_name, namespace_parameter),
+            [
+                'return DeleteSingleResource<{0}>('.format(model.clr_name),
+                '    CreateRequest({0}.ByName({1})),'.format(paths, name_and_namespace_arguments),
+                '    operationDescription: $"delete {0} resource \'{{name}}\'{1}",'.format(api_description, namespace_description),
+                '    propagationPolicy: propagationPolicy,',
+                '    cancellationToken: cancellationToken',
+                ');',
+            ]
+        ))
+
+    return members
+
+def write_resource_client(class_file, client_plan):
+    """
+    Write a generated resource client (and its interface).
+
+    :param class_file: The file to write to.
+    :param client_plan: The resource's KubeResourceClientPlan.
+    """
+
+    members = get_resource_client_members(client_plan)
+
+    lines = [
+        '/// <summary>',
+        '///     A client for the Kubernetes {0} API.'.format(client_plan.display_name),
+        '/// </summary>',
+        'public partial class {0}'.format(client_plan.client_name),
+        '    : KubeResourceClient, {0}'.format(client_plan.interface_name),
+        '{',
+        '    /// <summary>',
+        '    ///     Create a new <see cref="{0}"/>.'.format(client_plan.client_name),
+        '    /// </summary>',
+        '    /// <param name="client">',
+        '    ///     The Kubernetes API client.',
+        '    /// </param>',
+        '    public {0}(IKubeApiClient client)'.format(client_plan.client_name),
+        '        : base(client)',
+        '    {',
+        '    }',
+    ]
+    for (doc_lines, signature, body_lines) in members:
+        lines.append('')
+        lines += ['    ' + line for line in doc_lines]
+        lines.append('    public ' + signature.replace('KubeResourceClient.DefaultListPageSize', 'DefaultListPageSize'))
+        lines.append('    {')
+        lines += [('        ' + line if line else '') for line in body_lines]
+        lines.append('    }')
+    lines += [
+        '}',
+        '',
+        '/// <summary>',
+        '///     Represents a client for the Kubernetes {0} API.'.format(client_plan.display_name),
+        '/// </summary>',
+        'public partial interface {0}'.format(client_plan.interface_name),
+        '    : IKubeResourceClient',
+        '{',
+    ]
+    for (index, (doc_lines, signature, _)) in enumerate(members):
+        if index > 0:
+            lines.append('')
+        lines += ['    ' + line for line in doc_lines]
+        lines.append('    ' + signature + ';')
+    lines.append('}')
+
+    write_lines(class_file, '    ', lines)
+
+def get_model_converter_models(models, allow_list=MODEL_CONVERTER_ALLOW_LIST):
+    """
+    Get the models that should have a generated JSON converter.
+
+    :param models: The models to be generated, keyed by CLR name.
+    :param allow_list: The CLR names of the models selected for generated converters.
+    :return: The selected models (and all models that they reference), sorted by CLR name.
+    """
+
+    converter_models = {}
+
+    pending_clr_names = [clr_name for clr_name in allow_list if clr_name in models]
+    while pending_clr_names:
+        clr_name = pending_clr_names.pop()
+        if clr_name in converter_models:
+            continue
+
+        model = models[clr_name]
+        converter_models[clr_name] = model
+
+        for model_property in model.properties.values():
+            data_type = model_property.data_type
+            while data_type.is_collection():
+                data_type = data_type.element_type
+
+            if isinstance(data_type, KubeModelDataType):
+                pending_clr_names.append(data_type.model.clr_name)
+
+    return [converter_models[clr_name] for clr_name in sorted(converter_models.keys())]
+
+def get_model_converter_statement(model_property, converter_clr_names, is_inherited=False):
+    """
+    Get the C# statement that a generated JSON converter uses to read a model property.
+
+    :param model_property: The KubeModelProperty to read.
+    :param converter_clr_names: The CLR names of all models that have a generated converter.
+    :param is_inherited: Is the property inherited from the model's base class (so its null-value handling is determined by the serialiser)?
+    :return: The statement.
+    """
+
+    data_type = model_property.data_type
+    target = 'model.' + model_property.name
+    interned_strings = get_interned_strings(model_property)
+
+    if data_type.is_collection():
+        collection_kind = 'List' if isinstance(data_type, KubeArrayDataType) else 'Dictionary'
+        element_type = data_type.element_type
+
+        if isinstance(element_type, KubeModelDataType) and element_type.model.clr_name in converter_clr_names:
+            return 'ReadModel{0}(reader, {1}Converter.Instance, {2}, serializer);'.format(collection_kind, element_type.model.clr_name, target)
+
+        if element_type.is_intrinsic() and element_type.to_clr_type_name() == 'string':
+            if interned_strings:
+                return 'ReadString{0}(reader, {1}, {2});'.format(collection_kind, target, get_interned_strings_expression(interned_strings))
+
+            return 'ReadString{0}(reader, {1});'.format(collection_kind, target)
+
+        return 'Read{0}(reader, {1}, serializer);'.format(collection_kind, target)
+
+    clr_type_name = get_cts_type_name(data_type.name)
+    is_nullable = True
+    if isinstance(data_type, KubeModelDataType) and data_type.model.clr_name in converter_clr_names:
+        read_expression = 'ReadModel(reader, {0}Converter.Instance, {1}, serializer)'.format(data_type.model.clr_name, target)
+    elif interned_strings:
+        read_expression = 'ReadAsInternedString(reader)'
+    elif not isinstance(data_type, KubeModelDataType) and clr_type_name in MODEL_CONVERTER_INTRINSIC_READERS:
+        read_expression = MODEL_CONVERTER_INTRINSIC_READERS[clr_type_name]
+    else:
+        read_expression = 'ReadValue<{0}>(reader, serializer)'.format(
+            data_type.to_clr_type_name(is_nullable=model_property.is_optional)
+        )
+        is_nullable = False
+
+    if is_inherited:
+        return '{0} = InheritedValue({1}, {0}, serializer);'.format(target, read_expression)
+
+    if model_property.is_optional:
+        return '{0} = {1} ?? {0};'.format(target, read_expression)
+
+    if is_nullable and data_type.to_clr_type_name() in VALUE_TYPE_NAMES:
+        return '{0} = RequiredValue({1}, reader);'.format(target, read_expression)
+
+    return '{0} = {1};'.format(target, read_expression)
+
+def render_model_converters(converter_models, class_namespace=MODEL_CONVERTERS_NAMESPACE, attach_to_models=False, register_converters=True, converter_clr_names=None):
+    """
+    Render the C# source for generated (streaming) JSON converters.
+
+    :param converter_models: The models to generate converters for.
+    :param class_namespace: The namespace for the generated classes.
+    :param attach_to_models: Attach each converter to its model (using JsonConverterAttribute, on a partial declaration of the model class in the same namespace), rather than registering it with KubeModelConverters?
+    :param register_converters: Register the converters with KubeModelConverters (if they are not attached to their models)? If not, they must be registered some other way (e.g. by a model partition).
+    :param converter_clr_names: The CLR names of all models that have a generated converter (defaults to those of the converter models).
+    :return: The generated source code.
+    """
+
+    if converter_clr_names is None:
+        converter_clr_names = set(model.clr_name for model in converter_models)
+
+    class_file = io.StringIO()
+
+    class_file.write('using Newtonsoft.Json;' + LINE_ENDING)
+    class_file.write('using Newtonsoft.Json.Linq;' + LINE_ENDING)
+    class_file.write('using System;' + LINE_ENDING)
+    if attach_to_models:
+        class_file.write('using ' + MODEL_CONVERTERS_NAMESPACE + ';' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+
+    if attach_to_models:
+        for (model_index, model) in enumerate(converter_models):
+            if model_index > 0:
+                class_file.write(LINE_ENDING)
+
+            class_file.write('    [JsonConverter(typeof({0}Converter))]{1}'.format(model.clr_name, LINE_ENDING))
+            class_file.write('    public partial class {0}{1}'.format(model.clr_name, LINE_ENDING))
+            class_file.write('    {' + LINE_ENDING)
+            class_file.write('    }' + LINE_ENDING) # Class
+    elif register_converters:
+        class_file.write('    /// <summary>' + LINE_ENDING)
+        class_file.write('    ///     Generated (streaming) JSON converters for frequently-deserialised model types.' + LINE_ENDING)
+        class_file.write('    /// </summary>' + LINE_ENDING)
+        class_file.write('    public static partial class KubeModelConverters' + LINE_ENDING)
+        class_file.write('    {' + LINE_ENDING)
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     Generated converters, with their model types.' + LINE_ENDING)
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        static readonly (Type modelType, JsonConverter converter)[] GeneratedConverters =' + LINE_ENDING)
+        class_file.write('        {' + LINE_ENDING)
+        for model in converter_models:
+            class_file.write('            (typeof({0}), {0}Converter.Instance),{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        };' + LINE_ENDING)
+        class_file.write('    }' + LINE_ENDING) # Class
+
+    for (model_index, model) in enumerate(converter_models):
+        # (JSON name, statement) for each property; properties inherited from the model's base class are read like the contract-based path reads them.
+        property_statements = []
+        for model_property in model.properties.values():
+            is_inherited = False
+            if model.is_kube_object():
+                if model_property.json_name in ('kind', 'apiVersion'):
+                    is_inherited = True
+                elif model_property.json_name == 'metadata' and (model.has_kube_metadata() or model.has_kube_list_metadata()):
+                    is_inherited = True
+
+            property_statements.append((
+                model_property.json_name,
+                get_model_converter_statement(model_property, converter_clr_names, is_inherited)
+            ))
+
+        if model_index > 0 or attach_to_models or register_converters:
+            class_file.write(LINE_ENDING)
+        class_file.write('    /// <summary>' + LINE_ENDING)
+        class_file.write('    ///     Generated JSON converter for <see cref="{0}"/>.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('    /// </summary>' + LINE_ENDING)
+        class_file.write('    public sealed class {0}Converter{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        : KubeModelConverter<{0}>{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('    {' + LINE_ENDING)
+
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     The shared instance of <see cref="{0}Converter"/>.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        public static {0}Converter Instance {{ get; }} = new {0}Converter();{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write(LINE_ENDING)
+
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     Create a new <see cref="{0}Converter"/>.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        public {0}Converter(){1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('            : base({0}){1}'.format(
+            ', '.join('"{0}"'.format(json_name) for (json_name, _) in property_statements),
+            LINE_ENDING
+        ))
+        class_file.write('        {' + LINE_ENDING)
+        class_file.write('        }' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     Read the value of a <see cref="{0}"/> property.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        protected override bool ReadProperty({0} model, string propertyName, JsonReader reader, JsonSerializer serializer){1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        {' + LINE_ENDING)
+        class_file.write('            switch (propertyName)' + LINE_ENDING)
+        class_file.write('            {' + LINE_ENDING)
+        for (json_name, statement) in property_statements:
+            class_file.write('                case "{0}":{1}'.format(json_name, LINE_ENDING))
+            class_file.write('                {' + LINE_ENDING)
+            class_file.write('                    ' + statement + LINE_ENDING)
+            class_file.write(LINE_ENDING)
+            class_file.write('                    return true;' + LINE_ENDING)
+            class_file.write('                }' + LINE_ENDING)
+        class_file.write('                default:' + LINE_ENDING)
+        class_file.write('                {' + LINE_ENDING)
+        class_file.write('                    return false;' + LINE_ENDING)
+        class_file.write('                }' + LINE_ENDING)
+        class_file.write('            }' + LINE_ENDING)
+        class_file.write('        }' + LINE_ENDING)
+
+        extension_data_property = MODEL_CONVERTER_EXTENSION_DATA.get(model.clr_name)
+        if extension_data_property:
+            class_file.write(LINE_ENDING)
+            class_file.write('        /// <summary>' + LINE_ENDING)
+            class_file.write('        ///     Read the value of a property that does not correspond to any property defined on <see cref="{0}"/> (into <see cref="{0}.{1}"/>).{2}'.format(model.clr_name, extension_data_property, LINE_ENDING))
+            class_file.write('        /// </summary>' + LINE_ENDING)
+            class_file.write('        protected override void ReadUnknownProperty({0} model, string propertyName, JsonReader reader, JsonSerializer serializer){1}'.format(model.clr_name, LINE_ENDING))
+            class_file.write('        {' + LINE_ENDING)
+            class_file.write('            model.{0}[propertyName] = ReadValue<JToken>(reader, serializer);{1}'.format(extension_data_property, LINE_ENDING))
+            class_file.write('        }' + LINE_ENDING)
+
+        class_file.write('    }' + LINE_ENDING) # Class
+
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def get_binary_serializer_statements(model_property, serializer_clr_names):
+    """
+    Get the C# statements that a generated binary serialiser uses to write and read a model property.
+
+    :param model_property: The KubeModelProperty to write and read.
+    :param serializer_clr_names: The CLR names of all models that have a generated binary serialiser.
+    :return: A tuple of (write statement, read statement).
+    """
+
+    data_type = model_property.data_type
+    target = 'model.' + model_property.name
+    interned_strings = get_interned_strings(model_property)
+
+    if data_type.is_collection():
+        collection_kind = 'List' if isinstance(data_type, KubeArrayDataType) else 'Dictionary'
+        element_type = data_type.element_type
+
+        if isinstance(element_type, KubeModelDataType) and element_type.model.clr_name in serializer_clr_names:
+            serializer = '{0}BinarySerializer.Instance'.format(element_type.model.clr_name)
+
+            return (
+                'Write{0}(writer, {1}, {2}.Write);'.format(collection_kind, target, serializer),
+                'Read{0}(reader, {1}, {2}.Read);'.format(collection_kind, target, serializer)
+            )
+
+        if element_type.is_intrinsic() and element_type.to_clr_type_name() == 'string':
+            if interned_strings:
+                read_statement = 'ReadString{0}(reader, {1}, {2});'.format(collection_kind, target, get_interned_strings_expression(interned_strings))
+            else:
+                read_statement = 'ReadString{0}(reader, {1});'.format(collection_kind, target)
+
+            return (
+                'Write{0}(writer, {1}, WriteString);'.format(collection_kind, target),
+                read_statement
+            )
+
+        # Nested collections (and collections of other values) are populated from JSON.
+        return (
+            'WriteJson(writer, {0});'.format(target),
+            'ReadJson(reader, {0});'.format(target)
+        )
+
+    clr_type_name = get_cts_type_name(data_type.name)
+    property_type_name = model_property.to_clr_type_name(is_nullable=model_property.is_optional)
+
+    if isinstance(data_type, KubeModelDataType) and data_type.model.clr_name in serializer_clr_names:
+        serializer = '{0}BinarySerializer.Instance'.format(data_type.model.clr_name)
+
+        return (
+            '{0}.Write(writer, {1});'.format(serializer, target),
+            '{0} = {1}.Read(reader);'.format(target, serializer)
+        )
+
+    if not isinstance(data_type, KubeModelDataType) and clr_type_name in BINARY_SERIALIZER_INTRINSIC_HELPERS:
+        helper_name = BINARY_SERIALIZER_INTRINSIC_HELPERS[clr_type_name]
+        if interned_strings:
+            read_expression = 'ReadInternedString(reader)'
+        else:
+            read_expression = 'Read{0}(reader)'.format(helper_name)
+
+        # Helpers for value types read nullable values.
+        if property_type_name in VALUE_TYPE_NAMES:
+            read_expression += '.GetValueOrDefault()'
+
+        return (
+            'Write{0}(writer, {1});'.format(helper_name, target),
+            '{0} = {1};'.format(target, read_expression)
+        )
+
+    return (
+        'WriteJson(writer, {0});'.format(target),
+        '{0} = ReadJson<{1}>(reader);'.format(target, property_type_name)
+    )
+
+def get_binary_serializer_schema_hashes(serializer_models, property_statements):
+    """
+    Compute the schema hash for each model that has a generated binary serialiser.
+
+    A model's schema hash covers the format version, and the properties (with their types and binary encodings) of the model and of every model it references (directly or indirectly), so it changes whenever data written for an older version of the model can no longer be read.
+
+    :param serializer_models: The models that have a generated binary serialiser, keyed by CLR name.
+    :param property_statements: The (property, write statement, read statement) for each model's properties, keyed by CLR name.
+    :return: A dictionary of 64-bit schema hashes, keyed by CLR name.
+    """
+
+    model_schemas = {
+        clr_name: clr_name + '(' + ';'.join(
+            '{0}:{1}:{2}'.format(
+                model_property.json_name,
+                model_property.to_clr_type_name(is_nullable=model_property.is_optional),
+                write_statement
+            )
+            for (model_property, write_statement, _) in property_statements[clr_name]
+        ) + ')'
+        for clr_name in serializer_models.keys()
+    }
+
+    schema_hashes = {}
+    for clr_name in serializer_models.keys():
+        referenced_models = get_model_converter_models(serializer_models, allow_list=[clr_name])
+
+        schema = hashlib.sha256(str(BINARY_SERIALIZER_FORMAT_VERSION).encode('utf8'))
+        for referenced_model in referenced_models:
+            schema.update(model_schemas[referenced_model.clr_name].encode('utf8'))
+
+        schema_hashes[clr_name] = int.from_bytes(schema.digest()[:8], 'big')
+
+    return schema_hashes
+
+def render_binary_serializers(serializer_models, class_namespace=MODEL_CONVERTERS_NAMESPACE, register_serializers=True, all_serializer_models=None):
+    """
+    Render the C# source for generated binary serialisers.
+
+    :param serializer_models: The models to generate binary serialisers for.
+    :param class_namespace: The namespace for the generated classes.
+    :param register_serializers: Register the serialisers with KubeModelBinarySerializers? If not, they must be registered some other way (e.g. by a model partition).
+    :param all_serializer_models: All models that have a generated binary serialiser (defaults to the serialiser models); used to resolve (and hash) referenced models.
+    :return: The generated source code.
+    """
+
+    if all_serializer_models is None:
+        all_serializer_models = serializer_models
+
+    all_serializer_models = {
+        model.clr_name: model
+        for model in all_serializer_models
+    }
+    property_statements = {
+        clr_name: [
+            (model_property,) + get_binary_serializer_statements(model_property, all_serializer_models)
+            for model_property in model.properties.values()
+        ]
+        for (clr_name, model) in all_serializer_models.items()
+    }
+    schema_hashes = get_binary_serializer_schema_hashes(all_serializer_models, property_statements)
+
+    class_file = io.StringIO()
+
+    class_file.write('using System;' + LINE_ENDING)
+    class_file.write('using System.IO;' + LINE_ENDING)
+    class_file.write(LINE_ENDING)
+    class_file.write('namespace ' + class_namespace + LINE_ENDING)
+    class_file.write('{' + LINE_ENDING)
+
+    if register_serializers:
+        class_file.write('    /// <summary>' + LINE_ENDING)
+        class_file.write('    ///     Generated binary serialisers for model types that are commonly watched (and cached in local snapshots).' + LINE_ENDING)
+        class_file.write('    /// </summary>' + LINE_ENDING)
+        class_file.write('    public static partial class KubeModelBinarySerializers' + LINE_ENDING)
+        class_file.write('    {' + LINE_ENDING)
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     Generated binary serialisers, with their model types.' + LINE_ENDING)
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        static readonly (Type modelType, KubeModelBinarySerializer serializer)[] GeneratedSerializers =' + LINE_ENDING)
+        class_file.write('        {' + LINE_ENDING)
+        for model in serializer_models:
+            class_file.write('            (typeof({0}), {0}BinarySerializer.Instance),{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        };' + LINE_ENDING)
+        class_file.write('    }' + LINE_ENDING) # Class
+
+    for (model_index, model) in enumerate(serializer_models):
+        statements = [
+            (write_statement, read_statement)
+            for (_, write_statement, read_statement) in property_statements[model.clr_name]
+        ]
+
+        extension_data_property = MODEL_CONVERTER_EXTENSION_DATA.get(model.clr_name)
+        if extension_data_property:
+            statements.append((
+                'WriteJson(writer, model.{0});'.format(extension_data_property),
+                'ReadJson(reader, model.{0});'.format(extension_data_property)
+            ))
+
+        if model_index > 0 or register_serializers:
+            class_file.write(LINE_ENDING)
+        class_file.write('    /// <summary>' + LINE_ENDING)
+        class_file.write('    ///     Generated binary serialiser for <see cref="{0}"/>.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('    /// </summary>' + LINE_ENDING)
+        class_file.write('    public sealed class {0}BinarySerializer{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        : KubeModelBinarySerializer<{0}>{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('    {' + LINE_ENDING)
+
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     The shared instance of <see cref="{0}BinarySerializer"/>.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        public static {0}BinarySerializer Instance {{ get; }} = new {0}BinarySerializer();{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write(LINE_ENDING)
+
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     Create a new <see cref="{0}BinarySerializer"/>.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        public {0}BinarySerializer(){1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('            : base(schemaHash: 0x{0:016X}UL){1}'.format(schema_hashes[model.clr_name], LINE_ENDING))
+        class_file.write('        {' + LINE_ENDING)
+        class_file.write('        }' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     Write the values of <see cref="{0}"/> properties.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        protected override void WriteProperties(BinaryWriter writer, {0} model){1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        {' + LINE_ENDING)
+        for (write_statement, _) in statements:
+            class_file.write('            ' + write_statement + LINE_ENDING)
+        class_file.write('        }' + LINE_ENDING)
+        class_file.write(LINE_ENDING)
+
+        class_file.write('        /// <summary>' + LINE_ENDING)
+        class_file.write('        ///     Read the values of <see cref="{0}"/> properties.{1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        /// </summary>' + LINE_ENDING)
+        class_file.write('        protected override void ReadProperties(BinaryReader reader, {0} model){1}'.format(model.clr_name, LINE_ENDING))
+        class_file.write('        {' + LINE_ENDING)
+        for (_, read_statement) in statements:
+            class_file.write('            ' + read_statement + LINE_ENDING)
+        class_file.write('        }' + LINE_ENDING)
+
+        class_file.write('    }' + LINE_ENDING) # Class
+
+    class_file.write('}' + LINE_ENDING) # Namespace
+
+    return class_file.getvalue()
+
+def load_projections(projections_file_name):
+    """
+    Load projection definitions from a projection file (see the module docstring for its format).
+
+    :param projections_file_name: The full path of the projection file.
+    :return: A tuple of (root model name, field paths) for each projection, keyed by projection CLR name.
+    """
+
+    with open(projections_file_name, encoding='utf8') as projections_file:
+        projection_definitions = json.load(projections_file)
+
+    projections = {}
+    for projection_name in sorted(projection_definitions.keys()):
+        projection_definition = projection_definitions[projection_name]
+
+        root_model_name = projection_definition.get('root')
+        if not root_model_name:
+            raise ValueError('Projection "{0}" does not specify a root model.'.format(projection_name))
+
+        field_paths = projection_definition.get('fields')
+        if not field_paths:
+            raise ValueError('Projection "{0}" does not specify any fields.'.format(projection_name))
+
+        projections[projection_name] = (root_model_name, field_paths)
+
+    return projections
+
+def get_projection_field_tree(field_paths):
+    """
+    Build a tree of the JSON property names selected by a projection's field paths.
+
+    :param field_paths: The field paths (e.g. "spec.containers.image").
+    :return: The selected property names, mapped to the tree for their selected sub-properties (or None, if the whole property is selected).
+    """
+
+    field_tree = {}
+    for field_path in field_paths:
+        path_segments = field_path.split('.')
+
+        node = field_tree
+        for path_segment in path_segments[:-1]:
+            node = node.setdefault(path_segment, {})
+            if node is None:
+                break # Whole property already selected.
+        else:
+            node[path_segments[-1]] = None
+
+    return field_tree
+
+def find_projection_root(root_model_name, models):
+    """
+    Find the root model for a projection.
+
+    :param root_model_name: The swagger definition name or CLR name of the root model.
+    :param models: The parsed models (with properties), keyed by definition name.
+    :return: The root KubeModel.
+    """
+
+    root_model = models.get(root_model_name)
+    if root_model:
+        return root_model
+
+    for definition_name in sorted(models.keys(), key=get_defname_sort_key):
+        if models[definition_name].clr_name == root_model_name:
+            return models[definition_name]
+
+    raise ValueError('Cannot find a model named "{0}".'.format(root_model_name))
+
+def get_projection_models(projection_name, root_model, field_paths):
+    """
+    Create the models for a projection, walking the data-type graph from the root model along the selected field paths.
+
+    :param projection_name: The CLR name of the projection (i.e. of its root model).
+    :param root_model: The KubeModel that the projection selects fields from.
+    :param field_paths: The paths of the selected fields.
+    :return: The projection's models (root model first); each is a KubeModel with only the selected properties.
+    """
+
+    if root_model.is_kube_resource_list():
+        raise ValueError('Projection "{0}" cannot have a resource list ({1}) as its root (use a projection of the item model, instead).'.format(
+            projection_name,
+            root_model.clr_name
+        ))
+
+    projection_models = []
+    projected_root_model = project_model(root_model, get_projection_field_tree(field_paths), projection_name, projection_name, '', projection_models)
+    projected_root_model.summary = 'Projection of <see cref="{0}"/> ({1}).'.format(
+        root_model.clr_name,
+        ', '.join('"{0}"'.format(field_path) for field_path in field_paths)
+    )
+
+    return projection_models
+
+def project_model(model, field_tree, clr_name, projection_name, field_path, projection_models):
+    """
+    Create a projection of a model that only has the selected properties (and, recursively, projections of the models they select fields from).
+
+    :param model: The KubeModel to project.
+    :param field_tree: The selected fields (see get_projection_field_tree).
+    :param clr_name: The CLR name for the projected model.
+    :param projection_name: The CLR name of the projection's root model.
+    :param field_path: The field path of the model within the projection (empty for the root model).
+    :param projection_models: A list that receives the projected models.
+    :return: The projected KubeModel.
+    """
+
+    projected_model = KubeModel(model.name, model.summary, model.api_version, model.pretty_api_version, model.kube_group, model.required_property_keys)
+    projected_model.clr_name = clr_name
+    projected_model.projection_of = model.clr_name
+    projected_model.summary = 'Projection of <see cref="{0}"/> (field "{1}") for <see cref="{2}"/>.'.format(model.clr_name, field_path, projection_name)
+
+    projection_models.append(projected_model)
+
+    # Projections of resources are still resources.
+    selected_fields = dict(field_tree)
+    if model.is_kube_resource():
+        for json_name in ('kind', 'apiVersion', 'metadata'):
+            if selected_fields.get(json_name):
+                print('Projection "{0}" always includes all of "{1}{2}".'.format(projection_name, field_path + '.' if field_path else '', json_name))
+
+            selected_fields[json_name] = None
+
+    model_json_names = set(model_property.json_name for model_property in model.properties.values())
+    for json_name in sorted(selected_fields.keys()):
+        if json_name not in model_json_names:
+            raise ValueError('Projection "{0}": {1} has no property named "{2}" (field "{3}{2}").'.format(projection_name, model.clr_name, json_name, field_path + '.' if field_path else ''))
+
+    # Selected properties are declared in the same order as they are in the original model.
+    for (property_key, model_property) in model.properties.items():
+        json_name = model_property.json_name
+        if json_name not in selected_fields:
+            continue
+
+        property_field_path = field_path + '.' + json_name if field_path else json_name
+
+        # Keyed lists are rendered as plain lists (the item's key properties may not be selected).
+        projected_property = copy.copy(model_property)
+        projected_property.list_map_keys = None
+        projected_property.list_key_clr_type_name = None
+
+        property_field_tree = selected_fields[json_name]
+        if property_field_tree is not None:
+            projected_property.data_type = project_data_type(model_property.data_type, property_field_tree,
+                clr_name + model_property.name,
+                projection_name,
+                property_field_path,
+                projection_models
+            )
+
+        projected_model.properties[property_key] = projected_property
+
+    return projected_model
+
+def project_data_type(data_type, field_tree, clr_name, projection_name, field_path, projection_models):
+    """
+    Create a projection of a property's data-type (lists and dictionaries are projected by projecting their elements).
+
+    :param data_type: The KubeDataType to project.
+    :param field_tree: The fields selected from the data-type's model.
+    :param clr_name: The CLR name for the projected model.
+    :param projection_name: The CLR name of the projection's root model.
+    :param field_path: The field path of the property within the projection.
+    :param projection_models: A list that receives the projected models.
+    :return: The projected KubeDataType.
+    """
+
+    if isinstance(data_type, KubeArrayDataType):
+        return KubeArrayDataType(
+            project_data_type(data_type.element_type, field_tree, clr_name, projection_name, field_path, projection_models)
+        )
+
+    if isinstance(data_type, KubeDictionaryDataType):
+        return KubeDictionaryDataType(
+            project_data_type(data_type.element_type, field_tree, clr_name, projection_name, field_path, projection_models)
+        )
+
+    if not isinstance(data_type, KubeModelDataType):
+        raise ValueError('Projection "{0}": cannot select fields from "{1}" (type {2} is not a model).'.format(projection_name, field_path, data_type.to_clr_type_name()))
+
+    return KubeModelDataType(
+        project_model(data_type.model, field_tree, clr_name, projection_name, field_path, projection_models)
+    )
+
+def write_projections(projections_file_name, models, system_text_json, lazy_collections, clone_and_equality, only_if_changed):
+    """
+    Generate and write the models (and JSON converters) for the projections defined in a projection file.
+
+    :param projections_file_name: The full path of the projection file (projections are written to the same directory).
+    :param models: The parsed models (with properties), keyed by definition name.
+    :param system_text_json: Also decorate the models for System.Text.Json?
+    :param lazy_collections: Only allocate collection properties when they are first accessed?
+    :param clone_and_equality: Also implement IKubeModelEquatable (deep-cloning and structural equality)?
+    :param only_if_changed: Only write files whose content has changed?
+    :return: The number of files written.
+    """
+
+    class_directory_path = os.path.dirname(os.path.abspath(projections_file_name))
+
+    files_written = 0
+    for (projection_name, (root_model_name, field_paths)) in load_projections(projections_file_name).items():
+        projection_models = get_projection_models(projection_name,
+            find_projection_root(root_model_name, models),
+            field_paths
+        )
+
+        for projection_model in projection_models:
+            (was_written, _) = write_generated_file(
+                os.path.join(class_directory_path, projection_model.clr_name + '.cs'),
+                render_model(
+                    KubeModelRenderPlan.from_model(projection_model, resource_api=None),
+                    PROJECTIONS_NAMESPACE, system_text_json, lazy_collections, clone_and_equality
+                ),
+                only_if_changed
+            )
+            if was_written:
+                files_written += 1
+
+        (was_written, _) = write_generated_file(
+            os.path.join(class_directory_path, projection_name + PROJECTION_CONVERTERS_FILE_SUFFIX),
+            render_model_converters(
+                sorted(projection_models, key=lambda projection_model: projection_model.clr_name),
+                PROJECTIONS_NAMESPACE,
+                attach_to_models=True
+            ),
+            only_if_changed
+        )
+        if was_written:
+            files_written += 1
+
+    return files_written
+
+def get_csharp_string_literal(value):
+    if value is None:
+        return 'null'
+
+    return '"{0}"'.format(value)
+
+def write_generated_file(class_file_name, content, only_if_changed):
+    """
+    Write a generated file to disk.
+
+    :param class_file_name: The full path of the file.
+    :param content: The generated content.
+    :param only_if_changed: Only write the file if its content has changed?
+    :return: A tuple of (was the file written, hash of the content).
+    """
+
+    output_hash = get_output_hash(content)
+
+    if only_if_changed:
+        existing_content = read_existing_output(class_file_name)
+        if existing_content is not None and get_output_hash(existing_content) == output_hash:
+            return (False, output_hash)
+
+    with open(class_file_name, 'w') as class_file:
+        class_file.write(content)
+
+    return (True, output_hash)
+
+def get_output_file_name(class_file_base_name, partition_name=None):
+    """
+    Get the name of a generated file, relative to the output directory.
+
+    :param class_file_base_name: The file's base name.
+    :param partition_name: The name of the partition that contains the file (if any).
+    :return: The relative file name (using "/" as the separator, so that it can also be used as a manifest key).
+    """
+
+    if partition_name:
+        return partition_name + '/' + class_file_base_name
+
+    return class_file_base_name
+
+def remove_stale_output_files(class_directory_path, output_file_names):
+    """
+    Remove copies of generated files from locations where they are no longer generated (e.g. after switching between partitioned and regular output).
+
+    Only files in the output directory (and its immediate subdirectories) that have the same name as a file generated by this run (or a partition's registration entry point) are removed; subdirectories left empty are also removed.
+
+    :param class_directory_path: The output directory.
+    :param output_file_names: The names (relative to the output directory, see get_output_file_name) of all files generated by this run.
+    :return: The number of files removed.
+    """
+
+    output_file_names = set(output_file_names)
+    output_base_names = set(
+        output_file_name.split('/')[-1]
+        for output_file_name in output_file_names
+    )
+
+    partition_names = sorted(
+        directory_name
+        for directory_name in os.listdir(class_directory_path)
+        if os.path.isdir(os.path.join(class_directory_path, directory_name))
+    )
+
+    files_removed = 0
+    for partition_name in [None] + partition_names:
+        directory_path = os.path.join(class_directory_path, partition_name) if partition_name else class_directory_path
+
+        for class_file_base_name in sorted(os.listdir(directory_path)):
+            if not class_file_base_name.endswith('.cs'):
+                continue
+
+            if get_output_file_name(class_file_base_name, partition_name) in output_file_names:
+                continue
+
+            is_registration = partition_name and PARTITION_REGISTRATION_FILE_NAME_PATTERN.match(class_file_base_name)
+            if class_file_base_name in output_base_names or is_registration:
+                os.remove(os.path.join(directory_path, class_file_base_name))
+
+                files_removed += 1
+
+        if partition_name and not os.listdir(directory_path):
+            os.rmdir(directory_path)
+
+    return files_removed
+
+def load_swagger(swagger_file_name, cache_directory=None):
+    """
+    Load the parts of a Kubernetes swagger document that the generator uses.
+
+    :param swagger_file_name: The full path of the swagger (JSON) document.
+    :param cache_directory: An optional directory used to cache pre-parsed documents (keyed by document hash).
+    :return: A tuple of (definitions, paths), where paths only contain the per-operation metadata used by parse_apis.
+    """
+
+    # Hash and decode the document as it is read, so its raw bytes are never held in memory alongside the decoded text.
+    swagger_hasher = hashlib.sha256()
+    swagger_decoder = codecs.getincrementaldecoder('utf8')()
+    swagger_chunks = []
+    with open(swagger_file_name, 'rb') as swagger_file:
+        for swagger_chunk in iter(lambda: swagger_file.read(SWAGGER_READ_CHUNK_SIZE), b''):
+            swagger_hasher.update(swagger_chunk)
+            swagger_chunks.append(swagger_decoder.decode(swagger_chunk))
+
+    swagger_chunks.append(swagger_decoder.decode(b'', final=True))
+
+    cache_file_name = None
+    if cache_directory:
+        cache_file_name = os.path.join(cache_directory, '{0}-v{1}.pickle'.format(swagger_hasher.hexdigest(), SWAGGER_CACHE_VERSION))
+
+        try:
+            with open(cache_file_name, 'rb') as cache_file:
+                return pickle.load(cache_file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            pass
+
+    swagger_json = ''.join(swagger_chunks)
+    del swagger_chunks
+
+    swagger_document = parse_swagger_document(swagger_json)
+    del swagger_json
+
+    if cache_file_name:
+        os.makedirs(cache_directory, exist_ok=True)
+
+        # Write to a temporary file first, so a partially-written cache file is never picked up.
+        with open(cache_file_name + '.tmp', 'wb') as cache_file:
+            pickle.dump(swagger_document, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(cache_file_name + '.tmp', cache_file_name)
+
+    return swagger_document
+
+def parse_swagger_document(swagger_json):
+    """
+    Parse a Kubernetes swagger document, one entry at a time.
+
+    Only the entries under "definitions" are kept as-is; each entry under "paths" is reduced to its operations' Kubernetes metadata as soon as it has been parsed, and everything else is discarded.
+
+    :param swagger_json: The swagger document (JSON).
+    :return: A tuple of (definitions, paths).
+    """
+
+    decoder = json.JSONDecoder()
+
+    definitions = {}
+    paths = {}
+
+    def read_definition(definition_name, index):
+        (definitions[definition_name], end_index) = decoder.raw_decode(swagger_json, index)
+
+        return end_index
+
+    def read_path(api_path, index):
+        (api_verbs, end_index) = decoder.raw_decode(swagger_json, index)
+        paths[api_path] = get_slim_api_verbs(api_verbs)
+
+        return end_index
+
+    def read_document_member(key, index):
+        if key == 'definitions':
+            return read_json_object(swagger_json, index, decoder, read_definition)
+
+        if key == 'paths':
+            return read_json_object(swagger_json, index, decoder, read_path)
+
+        (_, end_index) = decoder.raw_decode(swagger_json, index)
+
+        return end_index
+
+    read_json_object(swagger_json, 0, decoder, read_document_member)
+
+    return (definitions, paths)
+
+def read_json_object(json_text, index, decoder, read_member):
+    """
+    Walk the members of a JSON object without materialising the object itself.
+
+    :param json_text: The JSON text.
+    :param index: The index in the text where the object starts (leading whitespace is permitted).
+    :param decoder: The JSONDecoder used to decode member names.
+    :param read_member: A callable taking (member name, index of member value) that consumes the member's value and returns the index where the value ends.
+    :return: The index immediately after the end of the object.
+    """
+
+    index = skip_json_whitespace(json_text, index)
+    if json_text[index:index + 1] != '{':
+        raise ValueError('Expected JSON object at index {0}.'.format(index))
+
+    index = skip_json_whitespace(json_text, index + 1)
+    if json_text[index:index + 1] == '}':
+        return index + 1
+
+    while True:
+        (member_name, index) = decoder.raw_decode(json_text, index)
+        if not isinstance(member_name, str):
+            raise ValueError('Expected JSON object member name at index {0}.'.format(index))
+
+        index = skip_json_whitespace(json_text, index)
+        if json_text[index:index + 1] != ':':
+            raise ValueError('Expected ":" at index {0}.'.format(index))
+
+        index = read_member(member_name, skip_json_whitespace(json_text, index + 1))
+
+        index = skip_json_whitespace(json_text, index)
+        delimiter = json_text[index:index + 1]
+        if delimiter == '}':
+            return index + 1
+
+        if delimiter != ',':
+            raise ValueError('Expected "," or "}}" at index {0}.'.format(index))
+
+        index = skip_json_whitespace(json_text, index + 1)
+
+def skip_json_whitespace(json_text, index):
+    return JSON_WHITESPACE.match(json_text, index).end()
+
+def get_slim_api_verbs(api_verbs):
+    """
+    Reduce a swagger path item to the Kubernetes metadata for each of its operations.
+    """
+
+    slim_api_verbs = {}
+    for (api_verb, api_metadata) in api_verbs.items():
+        if api_verb == 'parameters' or not isinstance(api_metadata, dict):
+            continue
+
+        slim_api_verbs[api_verb] = {
+            key: api_metadata[key]
+            for key in SWAGGER_OPERATION_KEYS
+            if key in api_metadata
+        }
+
+    return slim_api_verbs
+
+def load_manifest(manifest_file_name):
+    """
+    Load the manifest from a previous (incremental) generator run.
+
+    :param manifest_file_name: The full path of the manifest file.
+    :return: The manifest entries, keyed by generated file name (empty if there is no manifest).
+    """
+
+    try:
+        with open(manifest_file_name) as manifest_file:
+            manifest = json.load(manifest_file)
+    except FileNotFoundError:
+        return {}
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+
+    return manifest.get('files', {})
+
+def save_manifest(manifest_file_name, manifest_entries):
+    """
+    Save the manifest for the current (incremental) generator run.
+
+    :param manifest_file_name: The full path of the manifest file.
+    :param manifest_entries: The manifest entries, keyed by generated file name.
+    """
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'files': manifest_entries
+    }
+
+    with open(manifest_file_name, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        manifest_file.write(LINE_ENDING)
+
+def get_generator_hash(system_text_json=False, lazy_collections=False, clone_and_equality=False, parsed_quantities=False):
+    """
+    Compute a hash of the generator itself, and the options that affect its output (so that changes to either invalidate the manifest).
+    """
+
+    generator_hash = hashlib.sha256()
+    with open(__file__, 'rb') as generator_file:
+        generator_hash.update(generator_file.read())
+
+    generator_hash.update(json.dumps({
+        'system_text_json': system_text_json,
+        'lazy_collections': lazy_collections,
+        'clone_and_equality': clone_and_equality,
+        'parsed_quantities': parsed_quantities
+    }).encode('utf8'))
+
+    return generator_hash.hexdigest()
+
+def get_input_hash(generator_hash, definition_name, definition, resource_api, data_types, model):
+    """
+    Compute a hash of everything that contributes to a model's rendered output.
+
+    :param generator_hash: The hash of the generator itself.
+    :param definition_name: The name of the model's swagger definition.
+    :param definition: The model's swagger definition.
+    :param resource_api: The model's API paths (keyed by action), if any.
+    :param data_types: All known data-types (used to resolve the names of referenced models).
+    :param model: The KubeModel (used to resolve list keys, which depend on other definitions).
+    :return: The input hash.
+    """
+
+    # A model's output also depends on the CLR names of the models it references.
+    references = {}
+    for reference in find_references(definition):
+        data_type = data_types.get(reference)
+        if data_type:
+            references[reference] = data_type.to_clr_type_name()
+
+    # A model's output also depends on the keys of keyed lists (determined by the definitions of the lists' owners and items).
+    list_keys = {
+        model_property.json_name: model_property.list_key_clr_type_name
+        for model_property in model.properties.values()
+        if model_property.list_key_clr_type_name
+    }
+    if model.list_key_properties:
+        list_keys[''] = get_list_key(model.list_key_properties)
+
+    model_inputs = json.dumps([generator_hash, definition_name, definition, resource_api, references, list_keys], sort_keys=True)
+
+    return hashlib.sha256(model_inputs.encode('utf8')).hexdigest()
+
+def get_output_hash(content):
+    return hashlib.sha256(content.encode('utf8')).hexdigest()
+
+def find_references(definition):
+    """
+    Find the names of all definitions referenced (via '$ref') by a swagger definition.
+    """
+
+    if isinstance(definition, dict):
+        for (key, value) in definition.items():
+            if key == '$ref' and isinstance(value, str):
+                yield value.replace('#/definitions/', '')
+            else:
+                yield from find_references(value)
+    elif isinstance(definition, list):
+        for item in definition:
+            yield from find_references(item)
+
+def read_existing_output(class_file_name):
+    try:
+        with open(class_file_name) as class_file:
+            return class_file.read()
+    except FileNotFoundError:
+        return None
+
+def write_model_file(write_request):
+    """
+    Render a model's class file and write it to disk.
+
+    This is the unit of work for both serial and parallel generation (so it must be a top-level function, and its request must be picklable).
+
+    :param write_request: A tuple of (class file name, KubeModelRenderPlan, class namespace, decorate for System.Text.Json, allocate collections lazily, implement clone and equality, only write if changed).
+    :return: A tuple of (was the file written, hash of the rendered content).
+    """
+
+    (class_file_name, plan, class_namespace, system_text_json, lazy_collections, clone_and_equality, only_if_changed) = write_request
+
+    return write_generated_file(class_file_name,
+        render_model(plan, class_namespace, system_text_json, lazy_collections, clone_and_equality),
+        only_if_changed
+    )
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--incremental',
+        action='store_true',
+        help='Only write model files whose content has changed, and remove files for models that no longer exist (tracked via a manifest in the output directory).'
+    )
+    parser.add_argument('--swagger',
+        default=SWAGGER_FILE_NAME,
+        metavar='FILE',
+        help='The Kubernetes swagger (JSON) document to generate models from (default: %(default)s).'
+    )
+    parser.add_argument('--no-cache',
+        action='store_true',
+        help='Always parse the swagger document (rather than using a pre-parsed copy from "{0}", if available).'.format(SWAGGER_CACHE_DIRECTORY)
+    )
+    parser.add_argument('--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Render and write model files using a pool of N processes (default: 1, i.e. serial).'
+    )
+    parser.add_argument('--system-text-json',
+        action='store_true',
+        help='Also decorate models for System.Text.Json, and generate a JsonSerializerContext ("{0}") covering all generated models.'.format(JSON_CONTEXT_FILE_NAME)
+    )
+    parser.add_argument('--lazy-collections',
+        action='store_true',
+        help='Only allocate collection (list and dictionary) properties when they are first accessed (rather than when the model is created).'
+    )
+    parser.add_argument('--clone-and-equality',
+        action='store_true',
+        help='Also generate deep-cloning and structural equality members (DeepClone, Equals / GetHashCode, and IsSemanticallyEqual) for all models.'
+    )
+    parser.add_argument('--parsed-quantities',
+        action='store_true',
+        help='Represent resource quantities (e.g. "1500m" or "2Gi") using the QuantityResource value type, rather than as strings.'
+    )
+    parser.add_argument('--partition-by-group',
+        action='store_true',
+        help='Partition models by API group (into subdirectories of the output directory), each with its own registration entry point.'
+    )
+    parser.add_argument('--projections',
+        metavar='FILE',
+        help='Generate the projection models defined in FILE (into the directory that contains it) instead of the regular models.'
+    )
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    try:
+        os.stat(BASE_DIRECTORY)
+    except FileNotFoundError:
+        os.mkdir(BASE_DIRECTORY)
+
+    (definitions, paths) = load_swagger(args.swagger,
+        cache_directory=None if args.no_cache else SWAGGER_CACHE_DIRECTORY
+    )
+
+    apis = parse_apis(paths)
+    del paths
+
+    models = parse_models(definitions)
+
+    data_types = get_data_types(models, args.parsed_quantities)
+    parse_properties(models, data_types, definitions)
+
+    if args.projections:
+        files_written = write_projections(args.projections, models, args.system_text_json, args.lazy_collections, args.clone_and_equality,
+            only_if_changed=args.incremental
+        )
+        print('{0} file(s) written.'.format(files_written))
+
+        return
+
+    manifest_file_name = os.path.join(BASE_DIRECTORY, MANIFEST_FILE_NAME)
+    previous_manifest = load_manifest(manifest_file_name) if args.incremental else {}
+    manifest = {}
+    generator_hash = get_generator_hash(args.system_text_json, args.lazy_collections, args.clone_and_equality, args.parsed_quantities)
+
+    render_plan = get_render_plan(definitions, models, apis)
+
+    (model_partitions, partition_dependencies) = get_model_partitions(render_plan) if args.partition_by_group else ({}, {})
+
+    files_written = 0
+    files_removed = 0
+
+    class_namespace = ROOT_NAMESPACE
+    class_directory_path = BASE_DIRECTORY
+
+    for partition_name in partition_dependencies.keys():
+        partition_directory_path = os.path.join(class_directory_path, partition_name)
+        if not os.path.exists(partition_directory_path):
+            os.mkdir(partition_directory_path)
+
+    # The names (relative to the output directory) of all files generated by this run (whether or not they were actually written).
+    output_file_names = [
+        get_output_file_name(class_file_base_name, model_partitions.get(model.clr_name))
+        for (class_file_base_name, (_, model, _)) in render_plan.items()
+    ]
+
+    def write_output_file(output_file_name, content):
+        nonlocal files_written
+
+        output_file_names.append(output_file_name)
+
+        (was_written, output_hash) = write_generated_file(
+            os.path.join(class_directory_path, output_file_name),
+            content,
+            only_if_changed=args.incremental
+        )
+        if was_written:
+            files_written += 1
+
+        if args.incremental:
+            manifest[output_file_name] = {
+                'definition': None,
+                'input': None,
+                'output': output_hash
+            }
+
+    pending_files = []
+    for (class_file_base_name, (definition_name, model, resource_api)) in render_plan.items():
+        output_file_name = get_output_file_name(class_file_base_name, model_partitions.get(model.clr_name))
+        class_file_name = os.path.join(class_directory_path, output_file_name)
+
+        input_hash = None
+        if args.incremental:
+            input_hash = get_input_hash(generator_hash, definition_name, definitions[definition_name], resource_api, data_types, model)
+
+            previous_entry = previous_manifest.get(output_file_name)
+            if previous_entry and previous_entry['input'] == input_hash and os.path.exists(class_file_name):
+                manifest[output_file_name] = previous_entry
+
+                continue
+
+        pending_files.append((
+            output_file_name,
+            definition_name,
+            input_hash,
+            (class_file_name, KubeModelRenderPlan.from_model(model, resource_api), class_namespace, args.system_text_json, args.lazy_collections, args.clone_and_equality, args.incremental)
+        ))
+
+    registrations = []
+    partition_registrations = {
+        partition_name: []
+        for partition_name in partition_dependencies.keys()
+    }
+    for (definition_name, model, resource_api) in render_plan.values():
+        registration = KubeModelRegistration.from_plan(
+            KubeModelRenderPlan.from_model(model, resource_api)
+        )
+        if not registration:
+            continue
+
+        if model.clr_name in model_partitions:
+            partition_registrations[model_partitions[model.clr_name]].append(registration)
+        else:
+            registrations.append(registration)
+
+    registrations += get_retained_model_registrations(class_directory_path, render_plan.keys())
+
+    write_requests = [pending_file[3] for pending_file in pending_files]
+    if args.jobs > 1 and len(write_requests) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            write_results = list(executor.map(write_model_file, write_requests,
+                chunksize=max(1, len(write_requests) // (args.jobs * 4))
+            ))
+    else:
+        write_results = [write_model_file(write_request) for write_request in write_requests]
+
+    for ((output_file_name, definition_name, input_hash, _), (was_written, output_hash)) in zip(pending_files, write_results):
+        if was_written:
+            files_written += 1
+
+        if args.incremental:
+            manifest[output_file_name] = {
+                'definition': definition_name,
+                'input': input_hash,
+                'output': output_hash
+            }
+
+    plan_models = [model for (_, model, _) in render_plan.values()]
+    unpartitioned_models = [model for model in plan_models if model.clr_name not in model_partitions]
+
+    converter_models = get_model_converter_models({
+        model.clr_name: model
+        for model in plan_models
+    })
+    converter_clr_names = set(model.clr_name for model in converter_models)
+    binary_serializer_models = get_model_converter_models({
+            model.clr_name: model
+            for model in plan_models
+        },
+        allow_list=BINARY_SERIALIZER_ALLOW_LIST
+    )
+
+    write_output_file(KNOWN_MODELS_FILE_NAME,
+        render_known_models(registrations, class_namespace)
+    )
+    write_output_file(MODEL_CONVERTERS_FILE_NAME,
+        render_model_converters(
+            [model for model in converter_models if model.clr_name not in model_partitions],
+            converter_clr_names=converter_clr_names
+        )
+    )
+    write_output_file(BINARY_SERIALIZERS_FILE_NAME,
+        render_binary_serializers(
+            [model for model in binary_serializer_models if model.clr_name not in model_partitions],
+            all_serializer_models=binary_serializer_models
+        )
+    )
+    write_output_file(INTERNED_STRING_PROPERTIES_FILE_NAME,
+        render_interned_string_properties(unpartitioned_models, class_namespace)
+    )
+    write_output_file(PATCH_PROPERTIES_FILE_NAME,
+        render_patch_properties(unpartitioned_models, class_namespace)
+    )
+
+    # Indexed fields are determined by definition name (models that are not generated have none).
+    indexed_fields = get_indexed_fields({
+        definition_name: model
+        for (definition_name, model, _) in render_plan.values()
+    })
+    write_output_file(INDEXED_FIELDS_FILE_NAME,
+        render_indexed_fields(
+            [indexed_field for indexed_field in indexed_fields if indexed_field[0].clr_name not in model_partitions],
+            class_namespace
+        )
+    )
+
+    # Resources with hand-written clients still get precompiled request paths (for use by those clients).
+    client_plans = get_resource_client_plans(render_plan, apis, get_hand_written_client_names())
+    write_output_file(RESOURCE_CLIENTS_FILE_NAME,
+        render_resource_clients(
+            [client_plan for client_plan in client_plans if client_plan.model.clr_name not in model_partitions]
+        )
+    )
+    if args.system_text_json and not args.partition_by_group:
+        write_output_file(JSON_CONTEXT_FILE_NAME,
+            render_json_context(
+                [model.clr_name for model in plan_models],
+                class_namespace
+            )
+        )
+
+    # Patch properties are determined across all models (properties can refer to models in other partitions).
+    patch_properties = get_patch_properties(plan_models)
+    for partition_name in sorted(partition_dependencies.keys()):
+        partition_models = [model for model in plan_models if model_partitions.get(model.clr_name) == partition_name]
+        partition_converter_models = [model for model in converter_models if model_partitions.get(model.clr_name) == partition_name]
+        partition_binary_serializer_models = [model for model in binary_serializer_models if model_partitions.get(model.clr_name) == partition_name]
+
+        write_output_file(get_output_file_name('KnownModels.{0}.cs'.format(partition_name), partition_name),
+            render_partition_registration(partition_name, partition_dependencies[partition_name], partition_models, partition_registrations[partition_name],
+                patch_properties=[
+                    patch_property
+                    for patch_property in patch_properties
+                    if model_partitions.get(patch_property[0].clr_name) == partition_name
+                ],
+                indexed_fields=[
+                    indexed_field
+                    for indexed_field in indexed_fields
+                    if model_partitions.get(indexed_field[0].clr_name) == partition_name
+                ],
+                converter_models=partition_converter_models,
+                binary_serializer_models=partition_binary_serializer_models,
+                class_namespace=class_namespace
+            )
+        )
+        if partition_converter_models:
+            write_output_file(get_output_file_name(MODEL_CONVERTERS_FILE_NAME, partition_name),
+                render_model_converters(partition_converter_models,
+                    register_converters=False,
+                    converter_clr_names=converter_clr_names
+                )
+            )
+        if partition_binary_serializer_models:
+            write_output_file(get_output_file_name(BINARY_SERIALIZERS_FILE_NAME, partition_name),
+                render_binary_serializers(partition_binary_serializer_models,
+                    register_serializers=False,
+                    all_serializer_models=binary_serializer_models
+                )
+            )
+        partition_client_plans = [client_plan for client_plan in client_plans if model_partitions.get(client_plan.model.clr_name) == partition_name]
+        if partition_client_plans:
+            write_output_file(get_output_file_name(RESOURCE_CLIENTS_FILE_NAME, partition_name),
+                render_resource_clients(partition_client_plans)
+            )
+        if args.system_text_json:
+            write_output_file(get_output_file_name(JSON_CONTEXT_FILE_NAME, partition_name),
+                render_json_context(
+                    [model.clr_name for model in partition_models],
+                    class_namespace,
+                    class_name=partition_name + 'ModelJsonContext'
+                )
+            )
+
+    files_removed += remove_stale_output_files(class_directory_path, output_file_names)
+
+    if args.incremental:
+        # Remove output for models that no longer exist (but only files that we generated in the first place).
+        for class_file_base_name in sorted(previous_manifest.keys()):
+            if class_file_base_name in manifest:
+                continue
+
+            class_file_name = os.path.join(BASE_DIRECTORY, class_file_base_name)
+            if os.path.exists(class_file_name):
+                os.remove(class_file_name)
+
+                files_removed += 1
+
+        save_manifest(manifest_file_name, manifest)
 
-            class_file.write('}' + LINE_ENDING) # Namespace
+    print('{0} file(s) written, {1} file(s) removed.'.format(files_written, files_removed))
 
 if __name__ == '__main__':
     main()
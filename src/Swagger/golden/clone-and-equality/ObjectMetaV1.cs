@@ -0,0 +1,305 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using YamlDotNet.Serialization;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     ObjectMeta is metadata that all persisted resources must have, which includes all objects users must create.
+    /// </summary>
+    public partial class ObjectMetaV1 : IKubeModelEquatable<ObjectMetaV1>
+    {
+        /// <summary>
+        ///     UID is the unique in time and space value for this object. It is typically generated by the server on successful creation of a resource and is not allowed to change on PUT operations.
+        ///     
+        ///     Populated by the system. Read-only. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names#uids
+        /// </summary>
+        [YamlMember(Alias = "uid")]
+        [JsonProperty("uid", NullValueHandling = NullValueHandling.Ignore)]
+        public string Uid { get; set; }
+
+        /// <summary>
+        ///     GenerateName is an optional prefix, used by the server, to generate a unique name ONLY IF the Name field has not been provided. If this field is used, the name returned to the client will be different than the name passed. This value will also be combined with a unique suffix. The provided value has the same validation rules as the Name field, and may be truncated by the length of the suffix required to make the value unique on the server.
+        ///     
+        ///     If this field is specified and the generated name exists, the server will return a 409.
+        ///     
+        ///     Applied only if Name is not specified. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#idempotency
+        /// </summary>
+        [YamlMember(Alias = "generateName")]
+        [JsonProperty("generateName", NullValueHandling = NullValueHandling.Ignore)]
+        public string GenerateName { get; set; }
+
+        /// <summary>
+        ///     Name must be unique within a namespace. Is required when creating resources, although some resources may allow a client to request the generation of an appropriate name automatically. Name is primarily intended for creation idempotence and configuration definition. Cannot be updated. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/names#names
+        /// </summary>
+        [YamlMember(Alias = "name")]
+        [JsonProperty("name", NullValueHandling = NullValueHandling.Ignore)]
+        public string Name { get; set; }
+
+        /// <summary>
+        ///     Namespace defines the space within which each name must be unique. An empty namespace is equivalent to the "default" namespace, but "default" is the canonical representation. Not all objects are required to be scoped to a namespace - the value of this field for those objects will be empty.
+        ///     
+        ///     Must be a DNS_LABEL. Cannot be updated. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/namespaces
+        /// </summary>
+        [YamlMember(Alias = "namespace")]
+        [JsonProperty("namespace", NullValueHandling = NullValueHandling.Ignore)]
+        public string Namespace { get; set; }
+
+        /// <summary>
+        ///     Deprecated: selfLink is a legacy read-only field that is no longer populated by the system.
+        /// </summary>
+        [YamlMember(Alias = "selfLink")]
+        [JsonProperty("selfLink", NullValueHandling = NullValueHandling.Ignore)]
+        public string SelfLink { get; set; }
+
+        /// <summary>
+        ///     A sequence number representing a specific generation of the desired state. Populated by the system. Read-only.
+        /// </summary>
+        [YamlMember(Alias = "generation")]
+        [JsonProperty("generation", NullValueHandling = NullValueHandling.Ignore)]
+        public long? Generation { get; set; }
+
+        /// <summary>
+        ///     An opaque value that represents the internal version of this object that can be used by clients to determine when objects have changed. May be used for optimistic concurrency, change detection, and the watch operation on a resource or set of resources. Clients must treat these values as opaque and passed unmodified back to the server. They may only be valid for a particular resource or set of resources.
+        ///     
+        ///     Populated by the system. Read-only. Value must be treated as opaque by clients and . More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#concurrency-control-and-consistency
+        /// </summary>
+        [YamlMember(Alias = "resourceVersion")]
+        [JsonProperty("resourceVersion", NullValueHandling = NullValueHandling.Ignore)]
+        public string ResourceVersion { get; set; }
+
+        /// <summary>
+        ///     CreationTimestamp is a timestamp representing the server time when this object was created. It is not guaranteed to be set in happens-before order across separate operations. Clients may not set this value. It is represented in RFC3339 form and is in UTC.
+        ///     
+        ///     Populated by the system. Read-only. Null for lists. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        /// </summary>
+        [YamlMember(Alias = "creationTimestamp")]
+        [JsonProperty("creationTimestamp", NullValueHandling = NullValueHandling.Ignore)]
+        public DateTime? CreationTimestamp { get; set; }
+
+        /// <summary>
+        ///     DeletionTimestamp is RFC 3339 date and time at which this resource will be deleted. This field is set by the server when a graceful deletion is requested by the user, and is not directly settable by a client. The resource is expected to be deleted (no longer visible from resource lists, and not reachable by name) after the time in this field, once the finalizers list is empty. As long as the finalizers list contains items, deletion is blocked. Once the deletionTimestamp is set, this value may not be unset or be set further into the future, although it may be shortened or the resource may be deleted prior to this time. For example, a user may request that a pod is deleted in 30 seconds. The Kubelet will react by sending a graceful termination signal to the containers in the pod. After that 30 seconds, the Kubelet will send a hard termination signal (SIGKILL) to the container and after cleanup, remove the pod from the API. In the presence of network partitions, this object may still exist after this timestamp, until an administrator or automated process can determine the resource is fully terminated. If not set, graceful deletion of the object has not been requested.
+        ///     
+        ///     Populated by the system when a graceful deletion is requested. Read-only. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#metadata
+        /// </summary>
+        [YamlMember(Alias = "deletionTimestamp")]
+        [JsonProperty("deletionTimestamp", NullValueHandling = NullValueHandling.Ignore)]
+        public DateTime? DeletionTimestamp { get; set; }
+
+        /// <summary>
+        ///     Annotations is an unstructured key value map stored with a resource that may be set by external tools to store and retrieve arbitrary metadata. They are not queryable and should be preserved when modifying objects. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/annotations
+        /// </summary>
+        [YamlMember(Alias = "annotations")]
+        [JsonProperty("annotations", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+        public Dictionary<string, string> Annotations { get; } = new Dictionary<string, string>();
+
+        /// <summary>
+        ///     Determine whether the <see cref="Annotations"/> property should be serialised.
+        /// </summary>
+        public bool ShouldSerializeAnnotations() => Annotations.Count > 0;
+
+        /// <summary>
+        ///     Number of seconds allowed for this object to gracefully terminate before it will be removed from the system. Only set when deletionTimestamp is also set. May only be shortened. Read-only.
+        /// </summary>
+        [YamlMember(Alias = "deletionGracePeriodSeconds")]
+        [JsonProperty("deletionGracePeriodSeconds", NullValueHandling = NullValueHandling.Ignore)]
+        public long? DeletionGracePeriodSeconds { get; set; }
+
+        /// <summary>
+        ///     Must be empty before the object is deleted from the registry. Each entry is an identifier for the responsible component that will remove the entry from the list. If the deletionTimestamp of the object is non-nil, entries in this list can only be removed. Finalizers may be processed and removed in any order.  Order is NOT enforced because it introduces significant risk of stuck finalizers. finalizers is a shared field, any actor with permission can reorder it. If the finalizer list is processed in order, then this can lead to a situation in which the component responsible for the first finalizer in the list is waiting for a signal (field value, external system, or other) produced by a component responsible for a finalizer later in the list, resulting in a deadlock. Without enforced ordering finalizers are free to order amongst themselves and are not vulnerable to ordering changes in the list.
+        /// </summary>
+        [MergeStrategy]
+        [YamlMember(Alias = "finalizers")]
+        [JsonProperty("finalizers", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+        public List<string> Finalizers { get; } = new List<string>();
+
+        /// <summary>
+        ///     Determine whether the <see cref="Finalizers"/> property should be serialised.
+        /// </summary>
+        public bool ShouldSerializeFinalizers() => Finalizers.Count > 0;
+
+        /// <summary>
+        ///     Map of string keys and values that can be used to organize and categorize (scope and select) objects. May match selectors of replication controllers and services. More info: https://kubernetes.io/docs/concepts/overview/working-with-objects/labels
+        /// </summary>
+        [YamlMember(Alias = "labels")]
+        [JsonProperty("labels", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+        public Dictionary<string, string> Labels { get; } = new Dictionary<string, string>();
+
+        /// <summary>
+        ///     Determine whether the <see cref="Labels"/> property should be serialised.
+        /// </summary>
+        public bool ShouldSerializeLabels() => Labels.Count > 0;
+
+        /// <summary>
+        ///     ManagedFields maps workflow-id and version to the set of fields that are managed by that workflow. This is mostly for internal housekeeping, and users typically shouldn't need to set or understand this field. A workflow can be the user's name, a controller's name, or the name of a specific apply path like "ci-cd". The set of fields is always in the version that the workflow used when modifying the object.
+        /// </summary>
+        [YamlMember(Alias = "managedFields")]
+        [JsonProperty("managedFields", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+        public List<ManagedFieldsEntryV1> ManagedFields { get; } = new List<ManagedFieldsEntryV1>();
+
+        /// <summary>
+        ///     Determine whether the <see cref="ManagedFields"/> property should be serialised.
+        /// </summary>
+        public bool ShouldSerializeManagedFields() => ManagedFields.Count > 0;
+
+        /// <summary>
+        ///     List of objects depended by this object. If ALL objects in the list have been deleted, this object will be garbage collected. If this object is managed by a controller, then an entry in this list will point to this controller, with the controller field set to true. There cannot be more than one managing controller.
+        /// </summary>
+        [MergeStrategy(Key = "uid")]
+        [YamlMember(Alias = "ownerReferences")]
+        [JsonProperty("ownerReferences", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+        public KubeKeyedList<string, OwnerReferenceV1> OwnerReferences { get; } = new KubeKeyedList<string, OwnerReferenceV1>();
+
+        /// <summary>
+        ///     Determine whether the <see cref="OwnerReferences"/> property should be serialised.
+        /// </summary>
+        public bool ShouldSerializeOwnerReferences() => OwnerReferences.Count > 0;
+
+        /// <summary>
+        ///     Create a deep clone of the <see cref="ObjectMetaV1"/>.
+        /// </summary>
+        /// <returns>
+        ///     The new <see cref="ObjectMetaV1"/>.
+        /// </returns>
+        public ObjectMetaV1 DeepClone()
+        {
+            var clone = new ObjectMetaV1
+            {
+                Uid = Uid,
+                GenerateName = GenerateName,
+                Name = Name,
+                Namespace = Namespace,
+                SelfLink = SelfLink,
+                Generation = Generation,
+                ResourceVersion = ResourceVersion,
+                CreationTimestamp = CreationTimestamp,
+                DeletionTimestamp = DeletionTimestamp,
+                DeletionGracePeriodSeconds = DeletionGracePeriodSeconds
+            };
+
+            KubeModelEquality.CopyValues(Annotations, clone.Annotations);
+            KubeModelEquality.CopyValues(Finalizers, clone.Finalizers);
+            KubeModelEquality.CopyValues(Labels, clone.Labels);
+            KubeModelEquality.CopyModels(ManagedFields, clone.ManagedFields);
+            KubeModelEquality.CopyModels(OwnerReferences, clone.OwnerReferences);
+            KubeModelEquality.CopyExtensionData(_extensionData, clone._extensionData);
+
+            return clone;
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="ObjectMetaV1"/> is equal to another <see cref="ObjectMetaV1"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="ObjectMetaV1"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="ObjectMetaV1"/>s are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public bool Equals(ObjectMetaV1 other)
+        {
+            if (ReferenceEquals(other, null))
+                return false;
+
+            if (ReferenceEquals(other, this))
+                return true;
+
+            return Uid == other.Uid
+                && GenerateName == other.GenerateName
+                && Name == other.Name
+                && Namespace == other.Namespace
+                && SelfLink == other.SelfLink
+                && Generation == other.Generation
+                && ResourceVersion == other.ResourceVersion
+                && CreationTimestamp == other.CreationTimestamp
+                && DeletionTimestamp == other.DeletionTimestamp
+                && KubeModelEquality.DictionariesEqual(Annotations, other.Annotations)
+                && DeletionGracePeriodSeconds == other.DeletionGracePeriodSeconds
+                && KubeModelEquality.ListsEqual(Finalizers, other.Finalizers)
+                && KubeModelEquality.DictionariesEqual(Labels, other.Labels)
+                && KubeModelEquality.ListsEqual(ManagedFields, other.ManagedFields)
+                && KubeModelEquality.ListsEqual(OwnerReferences, other.OwnerReferences)
+                && KubeModelEquality.ExtensionDataEqual(_extensionData, other._extensionData);
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="ObjectMetaV1"/> is semantically equal to another <see cref="ObjectMetaV1"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="ObjectMetaV1"/>.
+        /// </param>
+        /// <param name="ignoreStatus">
+        ///     Ignore differences in the status of resources?
+        /// </param>
+        /// <param name="ignoreManagedFields">
+        ///     Ignore differences in the managed-fields metadata of resources?
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="ObjectMetaV1"/>s are semantically equal; otherwise, <c>false</c>.
+        /// </returns>
+        public bool IsSemanticallyEqual(ObjectMetaV1 other, bool ignoreStatus = false, bool ignoreManagedFields = false)
+        {
+            if (ReferenceEquals(other, null))
+                return false;
+
+            if (ReferenceEquals(other, this))
+                return true;
+
+            return Uid == other.Uid
+                && GenerateName == other.GenerateName
+                && Name == other.Name
+                && Namespace == other.Namespace
+                && SelfLink == other.SelfLink
+                && Generation == other.Generation
+                && CreationTimestamp == other.CreationTimestamp
+                && DeletionTimestamp == other.DeletionTimestamp
+                && KubeModelEquality.DictionariesEqual(Annotations, other.Annotations)
+                && DeletionGracePeriodSeconds == other.DeletionGracePeriodSeconds
+                && KubeModelEquality.ListsEqual(Finalizers, other.Finalizers)
+                && KubeModelEquality.DictionariesEqual(Labels, other.Labels)
+                && (ignoreManagedFields || KubeModelEquality.ListsSemanticallyEqual(ManagedFields, other.ManagedFields, ignoreStatus, ignoreManagedFields))
+                && KubeModelEquality.ListsSemanticallyEqual(OwnerReferences, other.OwnerReferences, ignoreStatus, ignoreManagedFields)
+                && KubeModelEquality.ExtensionDataEqual(_extensionData, other._extensionData);
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="ObjectMetaV1"/> is equal to another object.
+        /// </summary>
+        /// <param name="obj">
+        ///     The other object.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the other object is an equal <see cref="ObjectMetaV1"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public override bool Equals(object obj) => Equals(obj as ObjectMetaV1);
+
+        /// <summary>
+        ///     Get a hash code for the <see cref="ObjectMetaV1"/>.
+        /// </summary>
+        /// <returns>
+        ///     The hash code.
+        /// </returns>
+        public override int GetHashCode()
+        {
+            var hashCode = new HashCode();
+            hashCode.Add(Uid);
+            hashCode.Add(GenerateName);
+            hashCode.Add(Name);
+            hashCode.Add(Namespace);
+            hashCode.Add(SelfLink);
+            hashCode.Add(Generation);
+            hashCode.Add(ResourceVersion);
+            hashCode.Add(CreationTimestamp);
+            hashCode.Add(DeletionTimestamp);
+            hashCode.Add(KubeModelEquality.GetCount(Annotations));
+            hashCode.Add(DeletionGracePeriodSeconds);
+            hashCode.Add(KubeModelEquality.GetCount(Finalizers));
+            hashCode.Add(KubeModelEquality.GetCount(Labels));
+            hashCode.Add(KubeModelEquality.GetCount(ManagedFields));
+            hashCode.Add(KubeModelEquality.GetCount(OwnerReferences));
+
+            return hashCode.ToHashCode();
+        }
+    }
+}
@@ -0,0 +1,147 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using YamlDotNet.Serialization;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     Pod is a collection of containers that can run on a host. This resource is created by clients and scheduled onto hosts.
+    /// </summary>
+    [KubeObject("Pod", "v1")]
+    [KubeApi(KubeAction.List, "api/v1/pods")]
+    [KubeApi(KubeAction.WatchList, "api/v1/watch/pods")]
+    [KubeApi(KubeAction.List, "api/v1/namespaces/{namespace}/pods")]
+    [KubeApi(KubeAction.Create, "api/v1/namespaces/{namespace}/pods")]
+    [KubeApi(KubeAction.Get, "api/v1/namespaces/{namespace}/pods/{name}")]
+    [KubeApi(KubeAction.Patch, "api/v1/namespaces/{namespace}/pods/{name}")]
+    [KubeApi(KubeAction.Delete, "api/v1/namespaces/{namespace}/pods/{name}")]
+    [KubeApi(KubeAction.Update, "api/v1/namespaces/{namespace}/pods/{name}")]
+    [KubeApi(KubeAction.Get, "api/v1/namespaces/{namespace}/pods/{name}/log")]
+    [KubeApi(KubeAction.WatchList, "api/v1/watch/namespaces/{namespace}/pods")]
+    [KubeApi(KubeAction.DeleteCollection, "api/v1/namespaces/{namespace}/pods")]
+    [KubeApi(KubeAction.Get, "api/v1/namespaces/{namespace}/pods/{name}/status")]
+    [KubeApi(KubeAction.Watch, "api/v1/watch/namespaces/{namespace}/pods/{name}")]
+    [KubeApi(KubeAction.Patch, "api/v1/namespaces/{namespace}/pods/{name}/status")]
+    [KubeApi(KubeAction.Update, "api/v1/namespaces/{namespace}/pods/{name}/status")]
+    [KubeApi(KubeAction.Get, "api/v1/namespaces/{namespace}/pods/{name}/ephemeralcontainers")]
+    [KubeApi(KubeAction.Patch, "api/v1/namespaces/{namespace}/pods/{name}/ephemeralcontainers")]
+    [KubeApi(KubeAction.Update, "api/v1/namespaces/{namespace}/pods/{name}/ephemeralcontainers")]
+    public partial class PodV1 : KubeResourceV1, IKubeModelEquatable<PodV1>
+    {
+        /// <summary>
+        ///     Specification of the desired behavior of the pod. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+        /// </summary>
+        [YamlMember(Alias = "spec")]
+        [JsonProperty("spec", NullValueHandling = NullValueHandling.Ignore)]
+        public PodSpecV1 Spec { get; set; }
+
+        /// <summary>
+        ///     Most recently observed status of the pod. This data may not be up to date. Populated by the system. Read-only. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+        /// </summary>
+        [YamlMember(Alias = "status")]
+        [JsonProperty("status", NullValueHandling = NullValueHandling.Ignore)]
+        public PodStatusV1 Status { get; set; }
+
+        /// <summary>
+        ///     Create a deep clone of the <see cref="PodV1"/>.
+        /// </summary>
+        /// <returns>
+        ///     The new <see cref="PodV1"/>.
+        /// </returns>
+        public PodV1 DeepClone()
+        {
+            var clone = new PodV1
+            {
+                Kind = Kind,
+                ApiVersion = ApiVersion,
+                Metadata = Metadata?.DeepClone(),
+                Spec = Spec?.DeepClone(),
+                Status = Status?.DeepClone()
+            };
+
+            return clone;
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="PodV1"/> is equal to another <see cref="PodV1"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="PodV1"/>.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="PodV1"/>s are equal; otherwise, <c>false</c>.
+        /// </returns>
+        public bool Equals(PodV1 other)
+        {
+            if (ReferenceEquals(other, null))
+                return false;
+
+            if (ReferenceEquals(other, this))
+                return true;
+
+            return Kind == other.Kind
+                && ApiVersion == other.ApiVersion
+                && KubeModelEquality.AreEqual(Metadata, other.Metadata)
+                && KubeModelEquality.AreEqual(Spec, other.Spec)
+                && KubeModelEquality.AreEqual(Status, other.Status);
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="PodV1"/> is semantically equal to another <see cref="PodV1"/>.
+        /// </summary>
+        /// <param name="other">
+        ///     The other <see cref="PodV1"/>.
+        /// </param>
+        /// <param name="ignoreStatus">
+        ///     Ignore differences in the status of resources?
+        /// </param>
+        /// <param name="ignoreManagedFields">
+        ///     Ignore differences in the managed-fields metadata of resources?
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the <see cref="PodV1"/>s are semantically equal; otherwise, <c>false</c>.
+        /// </returns>
+        public bool IsSemanticallyEqual(PodV1 other, bool ignoreStatus = false, bool ignoreManagedFields = false)
+        {
+            if (ReferenceEquals(other, null))
+                return false;
+
+            if (ReferenceEquals(other, this))
+                return true;
+
+            return KubeModelEquality.AreSemanticallyEqual(Metadata, other.Metadata, ignoreStatus, ignoreManagedFields)
+                && KubeModelEquality.AreSemanticallyEqual(Spec, other.Spec, ignoreStatus, ignoreManagedFields)
+                && (ignoreStatus || KubeModelEquality.AreSemanticallyEqual(Status, other.Status, ignoreStatus, ignoreManagedFields));
+        }
+
+        /// <summary>
+        ///     Determine whether the <see cref="PodV1"/> is equal to another object.
+        /// </summary>
+        /// <param name="obj">
+        ///     The other object.
+        /// </param>
+        /// <returns>
+        ///     <c>true</c>, if the other object is an equal <see cref="PodV1"/>; otherwise, <c>false</c>.
+        /// </returns>
+        public override bool Equals(object obj) => Equals(obj as PodV1);
+
+        /// <summary>
+        ///     Get a hash code for the <see cref="PodV1"/>.
+        /// </summary>
+        /// <returns>
+        ///     The hash code.
+        /// </returns>
+        public override int GetHashCode()
+        {
+            var hashCode = new HashCode();
+            hashCode.Add(Kind);
+            hashCode.Add(ApiVersion);
+            hashCode.Add(Metadata);
+            hashCode.Add(Spec);
+            hashCode.Add(Status);
+
+            return hashCode.ToHashCode();
+        }
+    }
+}
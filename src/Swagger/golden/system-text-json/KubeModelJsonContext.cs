@@ -0,0 +1,27 @@
+#if NET8_0_OR_GREATER
+
+using System.Text.Json.Serialization;
+
+namespace KubeClient.Models
+{
+    using Converters;
+
+    /// <summary>
+    ///     Source-generated System.Text.Json serialisation metadata for generated model types.
+    /// </summary>
+    [JsonSourceGenerationOptions(
+        PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase,
+        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+        PreferredObjectCreationHandling = JsonObjectCreationHandling.Populate,
+        Converters = new[] { typeof(Int32OrStringV1JsonConverter), typeof(MicroTimeV1JsonConverter), typeof(QuantityResourceJsonConverter) }
+    )]
+    [JsonSerializable(typeof(ContainerPortV1))]
+    [JsonSerializable(typeof(PodListV1))]
+    [JsonSerializable(typeof(PodV1))]
+    public partial class KubeModelJsonContext
+        : JsonSerializerContext
+    {
+    }
+}
+
+#endif // NET8_0_OR_GREATER
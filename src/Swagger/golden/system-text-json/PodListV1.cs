@@ -0,0 +1,27 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using YamlDotNet.Serialization;
+
+namespace KubeClient.Models
+{
+    /// <summary>
+    ///     PodList is a list of Pods.
+    /// </summary>
+    [KubeListItem("Pod", "v1")]
+    [KubeObject("PodList", "v1")]
+#if NET8_0_OR_GREATER
+    [global::System.Text.Json.Serialization.JsonConverter(typeof(Converters.KubeResourceListV1JsonConverter<PodListV1, PodV1>))]
+#endif
+    public partial class PodListV1 : KubeResourceListV1<PodV1>
+    {
+        /// <summary>
+        ///     List of pods. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md
+        /// </summary>
+        [JsonProperty("items", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+#if NET8_0_OR_GREATER
+        [global::System.Text.Json.Serialization.JsonPropertyName("items")]
+#endif
+        public override List<PodV1> Items { get; } = new List<PodV1>();
+    }
+}
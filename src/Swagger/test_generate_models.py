@@ -0,0 +1,267 @@
+"""
+Tests for the model generator.
+
+Run from this directory:
+
+    python -m unittest test_generate_models
+
+Generated code for selected models is compared with the golden files under "golden" (one directory per combination of generator options).
+After an intentional change to the generated code, rewrite the golden files (and review the differences) using:
+
+    python test_generate_models.py --update-golden
+"""
+
+import os.path
+import re
+import sys
+import unittest
+
+import generate_models
+
+SCRIPT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIRECTORY = os.path.join(SCRIPT_DIRECTORY, 'golden')
+LINE_ENDING = generate_models.LINE_ENDING
+# Models whose --clone-and-equality output is compared with golden files (ObjectMetaV1 has ignored and optionally-ignored members, and PodV1 inherits metadata and has a status).
+CLONE_AND_EQUALITY_MODELS = ['ObjectMetaV1', 'PodV1']
+# Models whose --system-text-json output is compared with golden files (ContainerPortV1 has a required property, and PodListV1 is a resource list).
+SYSTEM_TEXT_JSON_MODELS = ['ContainerPortV1', 'PodListV1', 'PodV1']
+
+# Rewrite golden files (rather than comparing with them)?
+update_golden = False
+# The render plan for the swagger document (loaded on first use).
+render_plan = None
+
+def get_render_plan():
+    """
+    Load the swagger document, and determine which model is rendered to each class file.
+
+    :return: A tuple of (definition name, KubeModel, resource API) for each class file, keyed by class file name.
+    """
+
+    global render_plan
+
+    if render_plan is None:
+        (definitions, paths) = generate_models.load_swagger(
+            os.path.join(SCRIPT_DIRECTORY, generate_models.SWAGGER_FILE_NAME),
+            cache_directory=os.path.join(SCRIPT_DIRECTORY, generate_models.SWAGGER_CACHE_DIRECTORY)
+        )
+
+        apis = generate_models.parse_apis(paths)
+        models = generate_models.parse_models(definitions)
+        data_types = generate_models.get_data_types(models)
+        generate_models.parse_properties(models, data_types, definitions)
+
+        render_plan = generate_models.get_render_plan(definitions, models, apis)
+
+    return render_plan
+
+def render_model(clr_name, **options):
+    """
+    Render the class file for a model.
+
+    :param clr_name: The model's CLR name.
+    :param options: Generator options (keyword arguments for generate_models.render_model).
+    :return: The generated source code.
+    """
+
+    (_, model, resource_api) = get_render_plan()[clr_name + '.cs']
+
+    return generate_models.render_model(
+        generate_models.KubeModelRenderPlan.from_model(model, resource_api),
+        **options
+    )
+
+def get_member_body(source, signature):
+    """
+    Get the body of a generated member.
+
+    :param source: The generated source code.
+    :param signature: The member's signature (as it appears in the source code).
+    :return: The member body (up to, but not including, the closing brace).
+    """
+
+    member_start = source.index(signature)
+    body_start = source.index('{', member_start)
+    body_end = source.index(LINE_ENDING + '        }', body_start)
+
+    return source[body_start:body_end]
+
+class GeneratorTestCase(unittest.TestCase):
+    """
+    Base class for tests that compare generated code with golden files.
+    """
+
+    def assertMatchesGolden(self, golden_directory_name, golden_file_base_name, source):
+        """
+        Assert that generated code matches a golden file (or, if golden files are being updated, rewrite the golden file).
+
+        :param golden_directory_name: The name of the directory (under GOLDEN_DIRECTORY) that contains the golden file.
+        :param golden_file_base_name: The golden file's base name.
+        :param source: The generated source code.
+        """
+
+        golden_directory = os.path.join(GOLDEN_DIRECTORY, golden_directory_name)
+        golden_file_name = os.path.join(golden_directory, golden_file_base_name)
+        if update_golden:
+            os.makedirs(golden_directory, exist_ok=True)
+            with open(golden_file_name, 'w', encoding='utf8', newline='') as golden_file:
+                golden_file.write(source)
+
+        with open(golden_file_name, encoding='utf8', newline='') as golden_file:
+            self.assertEqual(golden_file.read(), source,
+                'Generated code does not match {0} (if the change is intended, run "python test_generate_models.py --update-golden").'.format(golden_file_name)
+            )
+
+class CloneAndEqualityTests(GeneratorTestCase):
+    """
+    Tests for models generated with --clone-and-equality.
+    """
+
+    def test_golden_output(self):
+        """
+        Generated models match their golden files.
+        """
+
+        for clr_name in CLONE_AND_EQUALITY_MODELS:
+            with self.subTest(model=clr_name):
+                self.assertMatchesGolden('clone-and-equality', clr_name + '.cs',
+                    render_model(clr_name, clone_and_equality=True)
+                )
+
+    def test_all_members(self):
+        """
+        Every property (including inherited ones) is cloned, compared, and hashed.
+        """
+
+        source = render_model('ObjectMetaV1', clone_and_equality=True)
+
+        clone_body = get_member_body(source, 'public ObjectMetaV1 DeepClone()')
+        equals_body = get_member_body(source, 'public bool Equals(ObjectMetaV1 other)')
+        hash_code_body = get_member_body(source, 'public override int GetHashCode()')
+        for property_name in re.findall(r'public \S+ (\w+) \{ get;', source):
+            with self.subTest(property=property_name):
+                self.assertIn(property_name, clone_body)
+                self.assertIn('other.' + property_name, equals_body)
+                self.assertIn(property_name, hash_code_body)
+
+        source = render_model('PodV1', clone_and_equality=True)
+
+        self.assertIn('Metadata = Metadata?.DeepClone()', get_member_body(source, 'public PodV1 DeepClone()'))
+        self.assertIn('KubeModelEquality.AreEqual(Metadata, other.Metadata)', get_member_body(source, 'public bool Equals(PodV1 other)'))
+        self.assertIn('hashCode.Add(Metadata)', get_member_body(source, 'public override int GetHashCode()'))
+
+    def test_semantic_equality_ignored_members(self):
+        """
+        Semantic equality always ignores type metadata and resource versions, and only ignores managed fields and status when asked to.
+        """
+
+        source = render_model('ObjectMetaV1', clone_and_equality=True)
+        semantic_equals_body = get_member_body(source, 'public bool IsSemanticallyEqual(ObjectMetaV1 other, bool ignoreStatus = false, bool ignoreManagedFields = false)')
+
+        self.assertIn('ResourceVersion == other.ResourceVersion', get_member_body(source, 'public bool Equals(ObjectMetaV1 other)'))
+        self.assertNotIn('ResourceVersion', semantic_equals_body)
+        self.assertIn('(ignoreManagedFields || KubeModelEquality.ListsSemanticallyEqual(ManagedFields, other.ManagedFields, ignoreStatus, ignoreManagedFields))', semantic_equals_body)
+        self.assertIn('KubeModelEquality.ListsSemanticallyEqual(OwnerReferences, other.OwnerReferences, ignoreStatus, ignoreManagedFields)', semantic_equals_body)
+
+        source = render_model('PodV1', clone_and_equality=True)
+        semantic_equals_body = get_member_body(source, 'public bool IsSemanticallyEqual(PodV1 other, bool ignoreStatus = false, bool ignoreManagedFields = false)')
+
+        self.assertIn('Kind == other.Kind', get_member_body(source, 'public bool Equals(PodV1 other)'))
+        self.assertNotIn('Kind', semantic_equals_body)
+        self.assertNotIn('ApiVersion', semantic_equals_body)
+        self.assertIn('KubeModelEquality.AreSemanticallyEqual(Metadata, other.Metadata, ignoreStatus, ignoreManagedFields)', semantic_equals_body)
+        self.assertIn('(ignoreStatus || KubeModelEquality.AreSemanticallyEqual(Status, other.Status, ignoreStatus, ignoreManagedFields))', semantic_equals_body)
+
+    def test_disabled(self):
+        """
+        Models do not implement IKubeModelEquatable unless --clone-and-equality is specified.
+        """
+
+        for clr_name in CLONE_AND_EQUALITY_MODELS:
+            with self.subTest(model=clr_name):
+                source = render_model(clr_name)
+
+                self.assertNotIn('IKubeModelEquatable', source)
+                self.assertNotIn('DeepClone', source)
+
+class SystemTextJsonTests(GeneratorTestCase):
+    """
+    Tests for models generated with --system-text-json.
+    """
+
+    def test_golden_output(self):
+        """
+        Generated models (and the serialiser context) match their golden files.
+        """
+
+        for clr_name in SYSTEM_TEXT_JSON_MODELS:
+            with self.subTest(model=clr_name):
+                self.assertMatchesGolden('system-text-json', clr_name + '.cs',
+                    render_model(clr_name, system_text_json=True)
+                )
+
+        self.assertMatchesGolden('system-text-json', generate_models.JSON_CONTEXT_FILE_NAME,
+            generate_models.render_json_context(SYSTEM_TEXT_JSON_MODELS)
+        )
+
+    def test_property_names(self):
+        """
+        Every property has the same name for System.Text.Json as it does for Newtonsoft.Json.
+        """
+
+        for clr_name in ['ObjectMetaV1', 'PodSpecV1', 'ContainerV1']:
+            with self.subTest(model=clr_name):
+                source = render_model(clr_name, system_text_json=True)
+
+                newtonsoft_names = re.findall(r'\[JsonProperty\("([^"]+)"', source)
+                self.assertTrue(newtonsoft_names)
+                self.assertEqual(newtonsoft_names, re.findall(r'JsonPropertyName\("([^"]+)"\)', source))
+
+    def test_required_properties(self):
+        """
+        Required properties are always serialised.
+        """
+
+        source = render_model('ContainerPortV1', system_text_json=True)
+        container_port_attributes = source[source.index('[JsonProperty("containerPort"'):source.index('public int ContainerPort')]
+
+        self.assertIn('JsonIgnore(Condition = global::System.Text.Json.Serialization.JsonIgnoreCondition.Never)', container_port_attributes)
+
+    def test_resource_list_converter(self):
+        """
+        Resource lists are (de)serialised as objects, rather than arrays.
+        """
+
+        source = render_model('PodListV1', system_text_json=True)
+
+        self.assertIn('[global::System.Text.Json.Serialization.JsonConverter(typeof(Converters.KubeResourceListV1JsonConverter<PodListV1, PodV1>))]', source)
+        self.assertNotIn('KubeResourceListV1JsonConverter', render_model('PodV1', system_text_json=True))
+
+    def test_json_context(self):
+        """
+        The serialiser context covers every specified model, and is only compiled where the System.Text.Json converters are available.
+        """
+
+        source = generate_models.render_json_context(SYSTEM_TEXT_JSON_MODELS)
+
+        self.assertTrue(source.startswith('#if ' + generate_models.SYSTEM_TEXT_JSON_CONDITION + LINE_ENDING))
+        for clr_name in SYSTEM_TEXT_JSON_MODELS:
+            self.assertIn('[JsonSerializable(typeof({0}))]'.format(clr_name), source)
+        for converter in generate_models.JSON_CONTEXT_CONVERTERS:
+            self.assertIn('typeof({0})'.format(converter), source)
+
+    def test_disabled(self):
+        """
+        Models are not decorated for System.Text.Json unless --system-text-json is specified.
+        """
+
+        for clr_name in SYSTEM_TEXT_JSON_MODELS:
+            with self.subTest(model=clr_name):
+                self.assertNotIn('System.Text.Json', render_model(clr_name))
+
+if __name__ == '__main__':
+    if '--update-golden' in sys.argv:
+        sys.argv.remove('--update-golden')
+        update_golden = True
+
+    unittest.main()
@@ -0,0 +1,267 @@
+using BenchmarkDotNet.Attributes;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Hosting;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Server.Kestrel.Core;
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+using System;
+using System.IO;
+using System.Linq;
+using System.Net;
+using System.Text;
+using System.Threading.Tasks;
+
+namespace KubeClient.Benchmarks
+{
+    using Http.Clients;
+    using Models;
+    using ResourceClients;
+
+    /// <summary>
+    ///     Benchmarks for creating many resources, one awaited call at a time vs. via bulk operations (over pooled HTTP/1.1 connections and over multiplexed HTTP/2 streams).
+    /// </summary>
+    /// <remarks>
+    ///     Requests are sent to a stub API server (hosted in-process by Kestrel, on the loopback interface) which echoes each resource back after a simulated processing delay.
+    /// </remarks>
+    [MemoryDiagnoser]
+    public class BulkOperationBenchmarks
+    {
+        /// <summary>
+        ///     The response body returned by the stub API server for deletions.
+        /// </summary>
+        static readonly byte[] DeleteResponseBody = Encoding.UTF8.GetBytes(
+            JsonConvert.SerializeObject(StatusV1.Success("Deleted."))
+        );
+
+        /// <summary>
+        ///     The stub API server that only speaks HTTP/1.1.
+        /// </summary>
+        WebApplication _http11Server;
+
+        /// <summary>
+        ///     The stub API server that only speaks HTTP/2 (without TLS).
+        /// </summary>
+        WebApplication _http2Server;
+
+        /// <summary>
+        ///     A client that uses the default message pipeline terminus (as for one-at-a-time calls through the resource clients).
+        /// </summary>
+        KubeApiClient _defaultClient;
+
+        /// <summary>
+        ///     A client that uses pooled HTTP/1.1 connections.
+        /// </summary>
+        KubeApiClient _pooledHttp11Client;
+
+        /// <summary>
+        ///     A client that multiplexes requests over HTTP/2.
+        /// </summary>
+        KubeApiClient _http2Client;
+
+        /// <summary>
+        ///     The resources to create.
+        /// </summary>
+        ConfigMapV1[] _configMaps;
+
+        /// <summary>
+        ///     Bulk operations that create the resources.
+        /// </summary>
+        KubeBulkOperation[] _createOperations;
+
+        /// <summary>
+        ///     The number of resources to create.
+        /// </summary>
+        [Params(500)]
+        public int ResourceCount { get; set; }
+
+        /// <summary>
+        ///     The time taken by the stub API server to process each request, in milliseconds.
+        /// </summary>
+        [Params(0, 5)]
+        public int ServerLatencyMilliseconds { get; set; }
+
+        /// <summary>
+        ///     The maximum number of concurrent requests for bulk operations.
+        /// </summary>
+        [Params(KubeBulkOptions.DefaultMaxConcurrency)]
+        public int MaxConcurrency { get; set; }
+
+        /// <summary>
+        ///     Start the stub API servers, and create the clients and resources.
+        /// </summary>
+        [GlobalSetup]
+        public void Setup()
+        {
+            Uri http11EndPoint;
+            (_http11Server, http11EndPoint) = StartStubServer(HttpProtocols.Http1, ServerLatencyMilliseconds);
+
+            Uri http2EndPoint;
+            (_http2Server, http2EndPoint) = StartStubServer(HttpProtocols.Http2, ServerLatencyMilliseconds);
+
+            _defaultClient = KubeApiClient.Create(new KubeClientOptions
+            {
+                ApiEndPoint = http11EndPoint,
+                AllowInsecure = true
+            });
+
+            _pooledHttp11Client = KubeApiClient.Create(new KubeClientOptions
+            {
+                ApiEndPoint = http11EndPoint,
+                AllowInsecure = true,
+                MaxConnectionsPerServer = MaxConcurrency
+            });
+
+            // Without TLS, there is no protocol negotiation so the client must know in advance that the server speaks HTTP/2 (i.e. "h2c" with prior knowledge).
+            KubeClientOptions http2Options = new KubeClientOptions
+            {
+                ApiEndPoint = http2EndPoint,
+                AllowInsecure = true
+            };
+            ClientBuilder http2ClientBuilder = new ClientBuilder()
+                .WithSocketsHttpHandler()
+                .WithRequestVersion(HttpVersion.Version20, exactVersion: true);
+            _http2Client = KubeApiClient.CreateTestClient(
+                http2Options.Configure(http2ClientBuilder).CreateClient(http2EndPoint),
+                http2Options
+            );
+
+            _configMaps = Enumerable.Range(0, ResourceCount)
+                .Select(configMapIndex => new ConfigMapV1
+                {
+                    Metadata = new ObjectMetaV1
+                    {
+                        Name = $"config-{configMapIndex:x5}",
+                        Namespace = $"namespace-{configMapIndex % 10}",
+                        Labels =
+                        {
+                            ["app.kubernetes.io/part-of"] = "benchmarks"
+                        }
+                    },
+                    Data =
+                    {
+                        ["index"] = configMapIndex.ToString(),
+                        ["settings.json"] = "{\"enabled\": true, \"replicas\": 3}"
+                    }
+                })
+                .ToArray();
+            _createOperations = _configMaps.Select(KubeBulkOperation.Create).ToArray();
+        }
+
+        /// <summary>
+        ///     Dispose of the clients and stop the stub API servers.
+        /// </summary>
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            _defaultClient?.Dispose();
+            _pooledHttp11Client?.Dispose();
+            _http2Client?.Dispose();
+
+            _http11Server?.StopAsync().GetAwaiter().GetResult();
+            _http2Server?.StopAsync().GetAwaiter().GetResult();
+        }
+
+        /// <summary>
+        ///     Create resources one awaited call at a time, through the typed resource client.
+        /// </summary>
+        [Benchmark(Baseline = true)]
+        public async Task Sequential()
+        {
+            IConfigMapClientV1 configMaps = _defaultClient.ConfigMapsV1();
+
+            foreach (ConfigMapV1 configMap in _configMaps)
+                await configMaps.Create(configMap);
+        }
+
+        /// <summary>
+        ///     Create resources via bulk operations over pooled HTTP/1.1 connections.
+        /// </summary>
+        [Benchmark]
+        public Task BulkHttp11() => ExecuteBulk(_pooledHttp11Client);
+
+        /// <summary>
+        ///     Create resources via bulk operations multiplexed over HTTP/2.
+        /// </summary>
+        [Benchmark]
+        public Task BulkHttp2() => ExecuteBulk(_http2Client);
+
+        /// <summary>
+        ///     Create resources via bulk operations.
+        /// </summary>
+        /// <param name="client">
+        ///     The Kubernetes API client to use.
+        /// </param>
+        /// <returns>
+        ///     A <see cref="Task"/> representing the asynchronous operation.
+        /// </returns>
+        async Task ExecuteBulk(KubeApiClient client)
+        {
+            var results = await client.Bulk().Execute(_createOperations, new KubeBulkOptions
+            {
+                MaxConcurrency = MaxConcurrency
+            });
+
+            KubeBulkResult failedResult = results.FirstOrDefault(result => !result.IsSuccess);
+            if (failedResult != null)
+                throw new InvalidOperationException($"Bulk operation failed: {failedResult.Error?.Message}", failedResult.Error);
+        }
+
+        /// <summary>
+        ///     Start a stub API server on the loopback interface.
+        /// </summary>
+        /// <param name="protocols">
+        ///     The HTTP protocol(s) supported by the server.
+        /// </param>
+        /// <param name="latencyMilliseconds">
+        ///     The time taken by the server to process each request, in milliseconds.
+        /// </param>
+        /// <returns>
+        ///     The server, and its base address.
+        /// </returns>
+        static (WebApplication server, Uri endPoint) StartStubServer(HttpProtocols protocols, int latencyMilliseconds)
+        {
+            WebApplicationBuilder serverBuilder = WebApplication.CreateSlimBuilder();
+            serverBuilder.Logging.ClearProviders();
+            serverBuilder.WebHost.ConfigureKestrel(kestrel =>
+            {
+                // Let the OS pick a free port.
+                kestrel.Listen(IPAddress.Loopback, port: 0, listener => listener.Protocols = protocols);
+
+                // Don't let the server limit concurrent streams to fewer than the client will send.
+                kestrel.Limits.Http2.MaxStreamsPerConnection = 256;
+            });
+
+            WebApplication server = serverBuilder.Build();
+            server.Run(async context =>
+            {
+                HttpRequest request = context.Request;
+
+                string requestBody;
+                using (StreamReader requestReader = new StreamReader(request.Body))
+                {
+                    requestBody = await requestReader.ReadToEndAsync();
+                }
+
+                if (latencyMilliseconds > 0)
+                    await Task.Delay(latencyMilliseconds);
+
+                context.Response.ContentType = "application/json";
+                if (HttpMethods.IsDelete(request.Method))
+                {
+                    context.Response.StatusCode = StatusCodes.Status200OK;
+                    await context.Response.Body.WriteAsync(DeleteResponseBody);
+
+                    return;
+                }
+
+                context.Response.StatusCode = HttpMethods.IsPost(request.Method) ? StatusCodes.Status201Created : StatusCodes.Status200OK;
+                await context.Response.WriteAsync(requestBody);
+            });
+            server.StartAsync().GetAwaiter().GetResult();
+
+            // Once the server has started, its addresses include the ports that were actually bound.
+            return (server, new Uri(server.Urls.Single()));
+        }
+    }
+}
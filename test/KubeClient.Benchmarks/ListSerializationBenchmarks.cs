@@ -0,0 +1,112 @@
+using BenchmarkDotNet.Attributes;
+using Newtonsoft.Json;
+using System;
+using System.IO;
+
+namespace KubeClient.Benchmarks
+{
+    using Models;
+    using ResourceClients;
+
+    /// <summary>
+    ///     Benchmarks for serialising and deserialising large resource lists (using the default KubeClient serialiser settings).
+    /// </summary>
+    [MemoryDiagnoser]
+    public class ListSerializationBenchmarks
+    {
+        /// <summary>
+        ///     The resource list type.
+        /// </summary>
+        Type _listType;
+
+        /// <summary>
+        ///     The resource list.
+        /// </summary>
+        KubeResourceListV1 _list;
+
+        /// <summary>
+        ///     The JSON for the resource list.
+        /// </summary>
+        string _listJson;
+
+        /// <summary>
+        ///     The serialiser.
+        /// </summary>
+        JsonSerializer _serializer;
+
+        /// <summary>
+        ///     The name of the resource list model type.
+        /// </summary>
+        [Params(nameof(PodListV1), nameof(EventListV1))]
+        public string ListType { get; set; }
+
+        /// <summary>
+        ///     The number of items in the list.
+        /// </summary>
+        [Params(1000, 10000)]
+        public int ItemCount { get; set; }
+
+        /// <summary>
+        ///     Generate the resource list (and its JSON) and create the serialiser.
+        /// </summary>
+        [GlobalSetup]
+        public void Setup()
+        {
+            switch (ListType)
+            {
+                case nameof(PodListV1):
+                {
+                    _list = Payloads.CreatePodList(ItemCount);
+
+                    break;
+                }
+                case nameof(EventListV1):
+                {
+                    _list = Payloads.CreateEventList(ItemCount);
+
+                    break;
+                }
+                default:
+                {
+                    throw new InvalidOperationException($"Unsupported resource list type '{ListType}'.");
+                }
+            }
+            _listType = _list.GetType();
+
+            _serializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+            _listJson = Serialize();
+        }
+
+        /// <summary>
+        ///     Deserialise the resource list.
+        /// </summary>
+        /// <returns>
+        ///     The deserialised resource list.
+        /// </returns>
+        [Benchmark]
+        public KubeResourceListV1 Deserialize()
+        {
+            using (var reader = new JsonTextReader(new StringReader(_listJson)))
+            {
+                return (KubeResourceListV1)_serializer.Deserialize(reader, _listType);
+            }
+        }
+
+        /// <summary>
+        ///     Serialise the resource list.
+        /// </summary>
+        /// <returns>
+        ///     The JSON.
+        /// </returns>
+        [Benchmark]
+        public string Serialize()
+        {
+            using (var writer = new StringWriter())
+            {
+                _serializer.Serialize(writer, _list);
+
+                return writer.ToString();
+            }
+        }
+    }
+}
@@ -0,0 +1,99 @@
+using BenchmarkDotNet.Attributes;
+using Newtonsoft.Json;
+using System.IO;
+
+namespace KubeClient.Benchmarks
+{
+    using Models;
+    using ResourceClients;
+
+    /// <summary>
+    ///     Benchmarks for memory allocated by generated models.
+    /// </summary>
+    /// <remarks>
+    ///     To compare collection-allocation modes, run these benchmarks against models generated with, and without, "generate_models.py --lazy-collections" (and compare the "Allocated" column).
+    ///
+    ///     String interning (see <see cref="KubeStringPool"/>) does not reduce the memory allocated during deserialisation, only the memory retained by deserialised models; <see cref="InternStrings"/> measures its cost.
+    /// </remarks>
+    [MemoryDiagnoser]
+    public class ModelMemoryBenchmarks
+    {
+        /// <summary>
+        ///     The JSON for the pod list.
+        /// </summary>
+        string _podListJson;
+
+        /// <summary>
+        ///     The serialiser used to deserialise the pod list.
+        /// </summary>
+        JsonSerializer _serializer;
+
+        /// <summary>
+        ///     The number of pods.
+        /// </summary>
+        [Params(5000)]
+        public int PodCount { get; set; }
+
+        /// <summary>
+        ///     Intern low-cardinality property values during deserialisation?
+        /// </summary>
+        [Params(true, false)]
+        public bool InternStrings { get; set; }
+
+        /// <summary>
+        ///     Generate the pod list and create the serialiser.
+        /// </summary>
+        [GlobalSetup]
+        public void Setup()
+        {
+            KubeStringPool.Shared = InternStrings ? new KubeStringPool() : null;
+
+            _podListJson = Payloads.PodList(PodCount);
+            _serializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+        }
+
+        /// <summary>
+        ///     Deserialise the pod list (most collection properties of a typical pod are empty).
+        /// </summary>
+        /// <returns>
+        ///     The deserialised <see cref="PodListV1"/>.
+        /// </returns>
+        [Benchmark]
+        public PodListV1 DeserializePodList()
+        {
+            using (var reader = new JsonTextReader(new StringReader(_podListJson)))
+            {
+                return _serializer.Deserialize<PodListV1>(reader);
+            }
+        }
+
+        /// <summary>
+        ///     Create empty pods (with empty metadata, spec, status, and a single container).
+        /// </summary>
+        /// <returns>
+        ///     The pods.
+        /// </returns>
+        [Benchmark]
+        public PodV1[] CreateEmptyPods()
+        {
+            var pods = new PodV1[PodCount];
+            for (int podIndex = 0; podIndex < pods.Length; podIndex++)
+            {
+                pods[podIndex] = new PodV1
+                {
+                    Metadata = new ObjectMetaV1(),
+                    Spec = new PodSpecV1
+                    {
+                        Containers =
+                        {
+                            new ContainerV1()
+                        }
+                    },
+                    Status = new PodStatusV1()
+                };
+            }
+
+            return pods;
+        }
+    }
+}
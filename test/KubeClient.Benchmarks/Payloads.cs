@@ -0,0 +1,324 @@
+using Newtonsoft.Json;
+using System;
+
+namespace KubeClient.Benchmarks
+{
+    using Models;
+    using ResourceClients;
+
+    /// <summary>
+    ///     Synthetic (but realistically-shaped) JSON payloads for benchmarks.
+    /// </summary>
+    public static class Payloads
+    {
+        /// <summary>
+        ///     The base timestamp for generated resources.
+        /// </summary>
+        static readonly DateTime BaseTimestamp = new DateTime(2024, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+
+        /// <summary>
+        ///     Generate the JSON for a <see cref="PodListV1"/>.
+        /// </summary>
+        /// <param name="podCount">
+        ///     The number of pods in the list.
+        /// </param>
+        /// <returns>
+        ///     The JSON.
+        /// </returns>
+        public static string PodList(int podCount) => JsonConvert.SerializeObject(CreatePodList(podCount), KubeResourceClient.SerializerSettings);
+
+        /// <summary>
+        ///     Create a <see cref="PodListV1"/>.
+        /// </summary>
+        /// <param name="podCount">
+        ///     The number of pods in the list.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="PodListV1"/>.
+        /// </returns>
+        public static PodListV1 CreatePodList(int podCount)
+        {
+            var podList = new PodListV1
+            {
+                Kind = "PodList",
+                ApiVersion = "v1",
+                Metadata = new ListMetaV1
+                {
+                    ResourceVersion = "123456789"
+                }
+            };
+
+            for (int podIndex = 0; podIndex < podCount; podIndex++)
+                podList.Items.Add(CreatePod(podIndex));
+
+            return podList;
+        }
+
+        /// <summary>
+        ///     Generate the JSON for an <see cref="EventListV1"/>.
+        /// </summary>
+        /// <param name="eventCount">
+        ///     The number of events in the list.
+        /// </param>
+        /// <returns>
+        ///     The JSON.
+        /// </returns>
+        public static string EventList(int eventCount) => JsonConvert.SerializeObject(CreateEventList(eventCount), KubeResourceClient.SerializerSettings);
+
+        /// <summary>
+        ///     Create an <see cref="EventListV1"/>.
+        /// </summary>
+        /// <param name="eventCount">
+        ///     The number of events in the list.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="EventListV1"/>.
+        /// </returns>
+        public static EventListV1 CreateEventList(int eventCount)
+        {
+            var eventList = new EventListV1
+            {
+                Kind = "EventList",
+                ApiVersion = "v1",
+                Metadata = new ListMetaV1
+                {
+                    ResourceVersion = "123456789"
+                }
+            };
+
+            for (int eventIndex = 0; eventIndex < eventCount; eventIndex++)
+                eventList.Items.Add(CreateEvent(eventIndex));
+
+            return eventList;
+        }
+
+        /// <summary>
+        ///     Create a pod (similar to one created by a Deployment).
+        /// </summary>
+        /// <param name="podIndex">
+        ///     The pod's index (used to vary its names and values).
+        /// </param>
+        /// <returns>
+        ///     The <see cref="PodV1"/>.
+        /// </returns>
+        public static PodV1 CreatePod(int podIndex)
+        {
+            string appName = $"app-{podIndex % 50}";
+            string podName = $"{appName}-5d8f7c9b4-{podIndex:x5}";
+            DateTime createdAt = BaseTimestamp.AddSeconds(podIndex);
+
+            return new PodV1
+            {
+                Metadata = new ObjectMetaV1
+                {
+                    Name = podName,
+                    GenerateName = $"{appName}-5d8f7c9b4-",
+                    Namespace = $"namespace-{podIndex % 10}",
+                    Uid = Guid.NewGuid().ToString(),
+                    ResourceVersion = (1000000 + podIndex).ToString(),
+                    CreationTimestamp = createdAt,
+                    Labels =
+                    {
+                        ["app.kubernetes.io/name"] = appName,
+                        ["app.kubernetes.io/part-of"] = "benchmarks",
+                        ["pod-template-hash"] = "5d8f7c9b4"
+                    },
+                    Annotations =
+                    {
+                        ["kubectl.kubernetes.io/restartedAt"] = createdAt.ToString("o"),
+                        ["prometheus.io/scrape"] = "true"
+                    },
+                    OwnerReferences =
+                    {
+                        new OwnerReferenceV1
+                        {
+                            ApiVersion = "apps/v1",
+                            Kind = "ReplicaSet",
+                            Name = $"{appName}-5d8f7c9b4",
+                            Uid = Guid.NewGuid().ToString(),
+                            Controller = true,
+                            BlockOwnerDeletion = true
+                        }
+                    }
+                },
+                Spec = new PodSpecV1
+                {
+                    NodeName = $"node-{podIndex % 100}",
+                    ServiceAccountName = "default",
+                    RestartPolicy = "Always",
+                    DnsPolicy = "ClusterFirst",
+                    SchedulerName = "default-scheduler",
+                    TerminationGracePeriodSeconds = 30,
+                    Containers =
+                    {
+                        new ContainerV1
+                        {
+                            Name = appName,
+                            Image = $"registry.example.com/{appName}:1.2.{podIndex % 5}",
+                            ImagePullPolicy = "IfNotPresent",
+                            Args = { "--port=8080", "--verbose" },
+                            Ports =
+                            {
+                                new ContainerPortV1
+                                {
+                                    Name = "http",
+                                    ContainerPort = 8080,
+                                    Protocol = "TCP"
+                                }
+                            },
+                            Env =
+                            {
+                                new EnvVarV1 { Name = "APP_NAME", Value = appName },
+                                new EnvVarV1 { Name = "LOG_LEVEL", Value = "info" }
+                            },
+                            Resources = new ResourceRequirementsV1
+                            {
+                                Requests = { ["cpu"] = "100m", ["memory"] = "128Mi" },
+                                Limits = { ["cpu"] = "500m", ["memory"] = "256Mi" }
+                            },
+                            ReadinessProbe = new ProbeV1
+                            {
+                                HttpGet = new HTTPGetActionV1
+                                {
+                                    Path = "/healthz",
+                                    Port = "http",
+                                    Scheme = "HTTP"
+                                },
+                                InitialDelaySeconds = 5,
+                                PeriodSeconds = 10
+                            },
+                            VolumeMounts =
+                            {
+                                new VolumeMountV1
+                                {
+                                    Name = "config",
+                                    MountPath = "/etc/app",
+                                    ReadOnly = true
+                                }
+                            },
+                            TerminationMessagePath = "/dev/termination-log",
+                            TerminationMessagePolicy = "File"
+                        }
+                    },
+                    Volumes =
+                    {
+                        new VolumeV1
+                        {
+                            Name = "config",
+                            ConfigMap = new ConfigMapVolumeSourceV1
+                            {
+                                Name = $"{appName}-config",
+                                DefaultMode = 420
+                            }
+                        }
+                    },
+                    Tolerations =
+                    {
+                        new TolerationV1
+                        {
+                            Key = "node.kubernetes.io/not-ready",
+                            Operator = "Exists",
+                            Effect = "NoExecute",
+                            TolerationSeconds = 300
+                        }
+                    }
+                },
+                Status = new PodStatusV1
+                {
+                    Phase = "Running",
+                    QosClass = "Burstable",
+                    HostIP = $"10.0.{podIndex % 100}.1",
+                    PodIP = $"10.1.{podIndex / 256 % 256}.{podIndex % 256}",
+                    StartTime = createdAt.AddSeconds(1),
+                    Conditions =
+                    {
+                        new PodConditionV1 { Type = "Initialized", Status = "True", LastTransitionTime = createdAt.AddSeconds(1) },
+                        new PodConditionV1 { Type = "Ready", Status = "True", LastTransitionTime = createdAt.AddSeconds(10) },
+                        new PodConditionV1 { Type = "ContainersReady", Status = "True", LastTransitionTime = createdAt.AddSeconds(10) },
+                        new PodConditionV1 { Type = "PodScheduled", Status = "True", LastTransitionTime = createdAt }
+                    },
+                    ContainerStatuses =
+                    {
+                        new ContainerStatusV1
+                        {
+                            Name = appName,
+                            Image = $"registry.example.com/{appName}:1.2.{podIndex % 5}",
+                            ImageID = $"registry.example.com/{appName}@sha256:{podIndex:x64}",
+                            ContainerID = $"containerd://{podIndex:x64}",
+                            Ready = true,
+                            Started = true,
+                            RestartCount = podIndex % 3,
+                            State = new ContainerStateV1
+                            {
+                                Running = new ContainerStateRunningV1
+                                {
+                                    StartedAt = createdAt.AddSeconds(5)
+                                }
+                            }
+                        }
+                    }
+                }
+            };
+        }
+
+        /// <summary>
+        ///     Create an event (similar to one recorded by the kubelet for a pod).
+        /// </summary>
+        /// <param name="eventIndex">
+        ///     The event's index (used to vary its names and values).
+        /// </param>
+        /// <returns>
+        ///     The <see cref="EventV1"/>.
+        /// </returns>
+        public static EventV1 CreateEvent(int eventIndex)
+        {
+            int podIndex = eventIndex / 4;
+            string appName = $"app-{podIndex % 50}";
+            string podName = $"{appName}-5d8f7c9b4-{podIndex:x5}";
+            DateTime recordedAt = BaseTimestamp.AddSeconds(eventIndex);
+
+            (string reason, string message) = (eventIndex % 4) switch
+            {
+                0 => ("Scheduled", $"Successfully assigned namespace-{podIndex % 10}/{podName} to node-{podIndex % 100}"),
+                1 => ("Pulled", $"Container image \"registry.example.com/{appName}:1.2.{podIndex % 5}\" already present on machine"),
+                2 => ("Created", $"Created container {appName}"),
+                _ => ("Started", $"Started container {appName}")
+            };
+
+            return new EventV1
+            {
+                Metadata = new ObjectMetaV1
+                {
+                    Name = $"{podName}.{eventIndex:x16}",
+                    Namespace = $"namespace-{podIndex % 10}",
+                    Uid = Guid.NewGuid().ToString(),
+                    ResourceVersion = (2000000 + eventIndex).ToString(),
+                    CreationTimestamp = recordedAt
+                },
+                InvolvedObject = new ObjectReferenceV1
+                {
+                    Kind = "Pod",
+                    ApiVersion = "v1",
+                    Namespace = $"namespace-{podIndex % 10}",
+                    Name = podName,
+                    Uid = Guid.NewGuid().ToString(),
+                    ResourceVersion = (1000000 + podIndex).ToString(),
+                    FieldPath = eventIndex % 4 == 0 ? null : $"spec.containers{{{appName}}}"
+                },
+                Reason = reason,
+                Message = message,
+                Type = "Normal",
+                Source = new EventSourceV1
+                {
+                    Component = eventIndex % 4 == 0 ? "default-scheduler" : "kubelet",
+                    Host = eventIndex % 4 == 0 ? null : $"node-{podIndex % 100}"
+                },
+                ReportingComponent = eventIndex % 4 == 0 ? "default-scheduler" : "kubelet",
+                ReportingInstance = eventIndex % 4 == 0 ? null : $"node-{podIndex % 100}",
+                FirstTimestamp = recordedAt,
+                LastTimestamp = recordedAt,
+                Count = 1
+            };
+        }
+    }
+}
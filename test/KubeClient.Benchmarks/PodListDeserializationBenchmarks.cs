@@ -0,0 +1,110 @@
+using BenchmarkDotNet.Attributes;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Converters;
+using Newtonsoft.Json.Serialization;
+using System.IO;
+
+namespace KubeClient.Benchmarks
+{
+    using Models;
+    using Models.Converters;
+    using ResourceClients;
+
+    /// <summary>
+    ///     Benchmarks for deserialising a large <see cref="PodListV1"/> using generated converters vs the contract-based path.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class PodListDeserializationBenchmarks
+    {
+        /// <summary>
+        ///     The JSON for the pod list.
+        /// </summary>
+        string _podListJson;
+
+        /// <summary>
+        ///     A serialiser that uses generated converters (i.e. the default KubeClient serialiser settings).
+        /// </summary>
+        JsonSerializer _generatedConverterSerializer;
+
+        /// <summary>
+        ///     A serialiser that uses the contract-based path for all model types.
+        /// </summary>
+        JsonSerializer _contractSerializer;
+
+        /// <summary>
+        ///     The number of pods in the list.
+        /// </summary>
+        [Params(5000)]
+        public int PodCount { get; set; }
+
+        /// <summary>
+        ///     Generate the pod list and create serialisers.
+        /// </summary>
+        [GlobalSetup]
+        public void Setup()
+        {
+            _podListJson = Payloads.PodList(PodCount);
+
+            _generatedConverterSerializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+            _contractSerializer = JsonSerializer.Create(new JsonSerializerSettings
+            {
+                NullValueHandling = NullValueHandling.Ignore,
+                ContractResolver = new ContractOnlyResolver(),
+                Converters =
+                {
+                    new StringEnumConverter(),
+                    new Int32OrStringV1Converter()
+                }
+            });
+        }
+
+        /// <summary>
+        ///     Deserialise the pod list using the contract-based path.
+        /// </summary>
+        /// <returns>
+        ///     The deserialised <see cref="PodListV1"/>.
+        /// </returns>
+        [Benchmark(Baseline = true)]
+        public PodListV1 ContractPath() => Deserialize(_contractSerializer);
+
+        /// <summary>
+        ///     Deserialise the pod list using generated converters.
+        /// </summary>
+        /// <returns>
+        ///     The deserialised <see cref="PodListV1"/>.
+        /// </returns>
+        [Benchmark]
+        public PodListV1 GeneratedConverters() => Deserialize(_generatedConverterSerializer);
+
+        /// <summary>
+        ///     Deserialise the pod list.
+        /// </summary>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> to use.
+        /// </param>
+        /// <returns>
+        ///     The deserialised <see cref="PodListV1"/>.
+        /// </returns>
+        PodListV1 Deserialize(JsonSerializer serializer)
+        {
+            using (var reader = new JsonTextReader(new StringReader(_podListJson)))
+            {
+                return serializer.Deserialize<PodListV1>(reader);
+            }
+        }
+
+        /// <summary>
+        ///     A contract resolver equivalent to <see cref="Models.ContractResolvers.KubeContractResolver"/>, but without generated converters.
+        /// </summary>
+        class ContractOnlyResolver
+            : CamelCasePropertyNamesContractResolver
+        {
+            /// <summary>
+            /// Get the JSON property name used to represent a dictionary key.
+            /// </summary>
+            /// <param name="dictionaryKey">The dictionary key.</param>
+            /// <returns>The JSON property name.</returns>
+            protected override string ResolveDictionaryKey(string dictionaryKey) => dictionaryKey;
+        }
+    }
+}
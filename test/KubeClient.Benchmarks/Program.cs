@@ -0,0 +1,30 @@
+using BenchmarkDotNet.Configs;
+using BenchmarkDotNet.Exporters.Json;
+using BenchmarkDotNet.Running;
+
+namespace KubeClient.Benchmarks
+{
+    /// <summary>
+    ///     Benchmarks for KubeClient.
+    /// </summary>
+    /// <remarks>
+    ///     Run with "dotnet run -c Release -- --filter *" (or "--list flat" to see available benchmarks).
+    ///
+    ///     In addition to BenchmarkDotNet's default exporters, results are exported as JSON (to "BenchmarkDotNet.Artifacts/results/*-report-full.json") so that they can be compared between commits.
+    /// </remarks>
+    static class Program
+    {
+        /// <summary>
+        ///     The main program entry-point.
+        /// </summary>
+        /// <param name="commandLineArguments">
+        ///     The program's command-line arguments (passed to BenchmarkDotNet).
+        /// </param>
+        static void Main(string[] commandLineArguments)
+        {
+            BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(commandLineArguments,
+                DefaultConfig.Instance.AddExporter(JsonExporter.Full)
+            );
+        }
+    }
+}
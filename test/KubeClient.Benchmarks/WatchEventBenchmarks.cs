@@ -0,0 +1,123 @@
+using BenchmarkDotNet.Attributes;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using System.IO;
+
+namespace KubeClient.Benchmarks
+{
+    using Models;
+    using Models.Converters;
+    using ResourceClients;
+
+    /// <summary>
+    ///     Benchmarks for deserialising dynamically-typed watch events (one event per line, as streamed by the Kubernetes API).
+    /// </summary>
+    [MemoryDiagnoser]
+    public class WatchEventBenchmarks
+    {
+        /// <summary>
+        ///     The event lines (alternating between pod and event resources).
+        /// </summary>
+        string[] _eventLines;
+
+        /// <summary>
+        ///     The serialiser used to deserialise resources.
+        /// </summary>
+        JsonSerializer _serializer;
+
+        /// <summary>
+        ///     The serialiser used to deserialise events (using <see cref="ResourceEventV1Converter"/>).
+        /// </summary>
+        JsonSerializer _eventSerializer;
+
+        /// <summary>
+        ///     The number of events.
+        /// </summary>
+        [Params(1000)]
+        public int EventCount { get; set; }
+
+        /// <summary>
+        ///     Generate the event lines and create the serialisers.
+        /// </summary>
+        [GlobalSetup]
+        public void Setup()
+        {
+            _serializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+
+            _eventSerializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+            _eventSerializer.Converters.Add(
+                new ResourceEventV1Converter(KnownModels.ModelAssembly)
+            );
+
+            _eventLines = new string[EventCount];
+            for (int eventIndex = 0; eventIndex < _eventLines.Length; eventIndex++)
+            {
+                KubeResourceV1 resource = eventIndex % 2 == 0 ? (KubeResourceV1)Payloads.CreatePod(eventIndex) : Payloads.CreateEvent(eventIndex);
+
+                _eventLines[eventIndex] = JsonConvert.SerializeObject(
+                    new ResourceEventV1<KubeResourceV1>
+                    {
+                        EventType = ResourceEventType.Modified,
+                        Resource = resource
+                    },
+                    KubeResourceClient.SerializerSettings
+                );
+            }
+        }
+
+        /// <summary>
+        ///     Deserialise the events by parsing each line into a <see cref="JObject"/> (to check for errors and determine the resource type), and then deserialising the resource from it.
+        /// </summary>
+        /// <returns>
+        ///     The number of events deserialised.
+        /// </returns>
+        [Benchmark(Baseline = true)]
+        public int DeserializeBuffered()
+        {
+            int eventCount = 0;
+            foreach (string eventLine in _eventLines)
+            {
+                JObject eventJson = JObject.Parse(eventLine);
+                if (eventJson.Value<string>("type").Equals("error", StringComparison.OrdinalIgnoreCase))
+                    throw new InvalidOperationException("Unexpected error event.");
+
+                JObject resourceJson = eventJson.Value<JObject>("object");
+                Type resourceType = KnownModels.KindToResourceType[(resourceJson.Value<string>("kind"), resourceJson.Value<string>("apiVersion"))];
+
+                var resourceEvent = new ResourceEventV1<KubeResourceV1>
+                {
+                    EventType = (ResourceEventType)Enum.Parse(typeof(ResourceEventType), eventJson.Value<string>("type"), ignoreCase: true),
+                    Resource = (KubeResourceV1)_serializer.Deserialize(resourceJson.CreateReader(), resourceType)
+                };
+                if (resourceEvent.Resource != null)
+                    eventCount++;
+            }
+
+            return eventCount;
+        }
+
+        /// <summary>
+        ///     Deserialise the events in a single (forward-only) pass, using <see cref="ResourceEventV1Converter"/>.
+        /// </summary>
+        /// <returns>
+        ///     The number of events deserialised.
+        /// </returns>
+        [Benchmark]
+        public int DeserializeSinglePass()
+        {
+            int eventCount = 0;
+            foreach (string eventLine in _eventLines)
+            {
+                using (var reader = new JsonTextReader(new StringReader(eventLine)))
+                {
+                    ResourceEventV1<KubeResourceV1> resourceEvent = _eventSerializer.Deserialize<ResourceEventV1<KubeResourceV1>>(reader);
+                    if (resourceEvent.Resource != null)
+                        eventCount++;
+                }
+            }
+
+            return eventCount;
+        }
+    }
+}
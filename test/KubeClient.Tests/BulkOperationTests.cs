@@ -0,0 +1,203 @@
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Threading.Tasks;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using ErrorHandling;
+    using KubeClient.Http.Testability;
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for bulk operations (via <see cref="IBulkResourceClient"/>).
+    /// </summary>
+    public class BulkOperationTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new bulk-operation test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public BulkOperationTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that namespaces are created before the resources they contain, and that deletions happen last (in reverse order).
+        /// </summary>
+        [Fact(DisplayName = "Bulk operations are executed in phases by kind")]
+        public async Task PhasesByKind()
+        {
+            List<string> requests = new List<string>();
+
+            MockMessageHandler handler = new MockMessageHandler(async (HttpRequestMessage request) =>
+            {
+                lock (requests)
+                {
+                    requests.Add($"{request.Method.Method} {request.RequestUri.AbsolutePath}");
+                }
+
+                if (request.Method == HttpMethod.Delete)
+                {
+                    return request.CreateResponse(HttpStatusCode.OK,
+                        responseBody: JsonConvert.SerializeObject(StatusV1.Success("Deleted.")),
+                        mediaType: "application/json"
+                    );
+                }
+
+                // Echo the resource back.
+                return request.CreateResponse(HttpStatusCode.Created,
+                    responseBody: await request.Content.ReadAsStringAsync(),
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                IReadOnlyList<KubeBulkResult> results = await client.Bulk().Execute(new[]
+                {
+                    KubeBulkOperation.Create(new PodV1
+                    {
+                        Metadata = new ObjectMetaV1 { Name = "my-pod", Namespace = "my-namespace" }
+                    }),
+                    KubeBulkOperation.Delete(new ConfigMapV1
+                    {
+                        Metadata = new ObjectMetaV1 { Name = "old-config", Namespace = "old-namespace" }
+                    }),
+                    KubeBulkOperation.Create(new NamespaceV1
+                    {
+                        Metadata = new ObjectMetaV1 { Name = "my-namespace" }
+                    }),
+                    KubeBulkOperation.Delete(new NamespaceV1
+                    {
+                        Metadata = new ObjectMetaV1 { Name = "old-namespace" }
+                    })
+                }, new KubeBulkOptions
+                {
+                    MaxConcurrency = 1
+                });
+
+                Assert.Equal(4, results.Count);
+                Assert.All(results, result => Assert.True(result.IsSuccess, result.Error?.Message));
+
+                // Results are in the same order as the operations.
+                PodV1 createdPod = Assert.IsType<PodV1>(results[0].Resource);
+                Assert.Equal("my-pod", createdPod.Metadata.Name);
+                Assert.Equal("Success", results[1].Status?.Status);
+            }
+
+            Assert.Equal(new[]
+            {
+                "POST /api/v1/namespaces",
+                "POST /api/v1/namespaces/my-namespace/pods",
+                "DELETE /api/v1/namespaces/old-namespace/configmaps/old-config",
+                "DELETE /api/v1/namespaces/old-namespace"
+            }, requests);
+        }
+
+        /// <summary>
+        ///     Verify that a request rejected with "429 Too Many Requests" is retried.
+        /// </summary>
+        [Fact(DisplayName = "Bulk operations are retried after 429 Too Many Requests")]
+        public async Task RetryTooManyRequests()
+        {
+            int requestCount = 0;
+
+            MockMessageHandler handler = new MockMessageHandler(async (HttpRequestMessage request) =>
+            {
+                Assert.Equal("PATCH", request.Method.Method);
+                Assert.Equal("application/apply-patch+yaml", request.Content.Headers.ContentType.MediaType);
+                Assert.Contains("fieldManager=my-field-manager", request.RequestUri.Query);
+
+                if (++requestCount == 1)
+                {
+                    HttpResponseMessage tooManyRequests = request.CreateResponse((HttpStatusCode)429,
+                        responseBody: JsonConvert.SerializeObject(StatusV1.Failure("Too many requests.", reason: "TooManyRequests", code: 429)),
+                        mediaType: "application/json"
+                    );
+                    tooManyRequests.Headers.TryAddWithoutValidation("Retry-After", "0");
+
+                    return tooManyRequests;
+                }
+
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: await request.Content.ReadAsStringAsync(),
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                IReadOnlyList<KubeBulkResult> results = await client.Bulk().Apply(new[]
+                {
+                    new ConfigMapV1
+                    {
+                        Metadata = new ObjectMetaV1 { Name = "my-config", Namespace = "my-namespace" }
+                    }
+                }, fieldManager: "my-field-manager", options: new KubeBulkOptions
+                {
+                    InitialRetryDelay = TimeSpan.FromMilliseconds(1),
+                    MaxRetryDelay = TimeSpan.FromMilliseconds(10)
+                });
+
+                KubeBulkResult result = Assert.Single(results);
+                Assert.True(result.IsSuccess, result.Error?.Message);
+                Assert.Equal(2, result.Attempts);
+            }
+
+            Assert.Equal(2, requestCount);
+        }
+
+        /// <summary>
+        ///     Verify that a failed operation causes operations in later phases to be skipped.
+        /// </summary>
+        [Fact(DisplayName = "Bulk operations in later phases are skipped after a failure")]
+        public async Task SkipLaterPhasesAfterFailure()
+        {
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                Assert.Equal("/api/v1/namespaces", request.RequestUri.AbsolutePath);
+
+                return request.CreateResponse(HttpStatusCode.Forbidden,
+                    responseBody: JsonConvert.SerializeObject(StatusV1.Failure("Forbidden.", reason: "Forbidden", code: 403)),
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                IReadOnlyList<KubeBulkResult> results = await client.Bulk().Execute(new[]
+                {
+                    KubeBulkOperation.Create(new NamespaceV1
+                    {
+                        Metadata = new ObjectMetaV1 { Name = "my-namespace" }
+                    }),
+                    KubeBulkOperation.Create(new PodV1
+                    {
+                        Metadata = new ObjectMetaV1 { Name = "my-pod", Namespace = "my-namespace" }
+                    })
+                });
+
+                Assert.False(results[0].IsSuccess);
+                KubeApiException error = Assert.IsType<KubeApiException>(results[0].Error);
+                Log.LogInformation("Error: {ErrorMessage}", error.Message);
+                Assert.Equal("Forbidden", results[0].Status?.Reason);
+
+                Assert.True(results[1].IsSkipped);
+                Assert.Equal(0, results.Count(result => result.IsSuccess));
+            }
+        }
+    }
+}
@@ -193,6 +193,22 @@ namespace KubeClient.Tests.Http.BuildMessage
 			);
 		}
 
+		/// <summary>
+		///		An <see cref="HttpRequest"/> with an absolute URI whose (escaped) template query is merged with additional query parameters.
+		/// </summary>
+		[Fact]
+		public void AbsoluteUri_TemplateQuery_AddQuery_EscapesOnce()
+		{
+			HttpRequest request =
+				HttpRequest.Factory.Create("http://localhost:1234/foo/bar?labelSelector={LabelSelector}")
+					.WithTemplateParameter("LabelSelector", "app=foo,tier in (web)")
+					.WithQueryParameter("continue", "ab+c/d==");
+
+			Uri requestUri = request.BuildRequestUri();
+
+			Assert.Equal("?labelSelector=app%3Dfoo%2Ctier%20in%20%28web%29&continue=ab%2Bc%2Fd%3D%3D", requestUri.Query);
+		}
+
 		/// <summary>
 		///		An <see cref="HttpRequest"/> with an absolute URI that adds a query component, using dynamically-bound template parameters.
 		/// </summary>
@@ -0,0 +1,262 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Converters;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using ApiMetadata;
+    using Models;
+    using Models.Converters;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for the generated <see cref="KnownModels"/> registry.
+    /// </summary>
+    public class KnownModelsTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new <see cref="KnownModels"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public KnownModelsTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KnownModels"/> contains exactly the resource model types that would be discovered by scanning the model assembly.
+        /// </summary>
+        [Fact(DisplayName = "KnownModels resource types match model assembly")]
+        public void ResourceTypes_Match_ModelAssembly()
+        {
+            Dictionary<Type, (string kind, string apiVersion)> expected = ScanModelTypes(typeof(KubeResourceV1))
+                .ToDictionary(
+                    modelType => modelType,
+                    modelType => GetKubeObjectKind(modelType)
+                );
+
+            Assert.Equal(expected.Count, KnownModels.ResourceTypeToKind.Count);
+            foreach (Type modelType in expected.Keys)
+            {
+                Assert.True(KnownModels.ResourceTypeToKind.TryGetValue(modelType, out var kubeKind), $"Missing resource model type {modelType.Name}.");
+                Assert.Equal(expected[modelType], kubeKind);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KnownModels"/> contains exactly the resource-list model types that would be discovered by scanning the model assembly.
+        /// </summary>
+        [Fact(DisplayName = "KnownModels resource-list types match model assembly")]
+        public void ResourceListTypes_Match_ModelAssembly()
+        {
+            Type[] expected = ScanModelTypes(typeof(KubeResourceListV1)).ToArray();
+
+            Assert.Equal(expected.Length, KnownModels.ResourceListTypeToKind.Count);
+            foreach (Type modelType in expected)
+            {
+                Assert.True(KnownModels.ResourceListTypeToKind.TryGetValue(modelType, out var kubeKind), $"Missing resource-list model type {modelType.Name}.");
+                Assert.Equal(GetKubeObjectKind(modelType), kubeKind);
+
+                KubeListItemAttribute listItemAttribute = modelType.GetTypeInfo().GetCustomAttribute<KubeListItemAttribute>();
+                if (listItemAttribute == null)
+                    continue;
+
+                Assert.True(KnownModels.ItemKindToResourceListType.TryGetValue((listItemAttribute.Kind, listItemAttribute.ApiVersion), out Type listType));
+                Assert.Equal(modelType, listType);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="ModelMetadata.KubeObject.BuildKindToTypeLookup(Assembly[])"/> resolves built-in model types via <see cref="KnownModels"/>.
+        /// </summary>
+        [Fact(DisplayName = "BuildKindToTypeLookup resolves built-in model types")]
+        public void BuildKindToTypeLookup_ModelAssembly()
+        {
+            Dictionary<(string kind, string apiVersion), Type> lookup = ModelMetadata.KubeObject.BuildKindToTypeLookup(KnownModels.ModelAssembly);
+
+            Assert.Equal(typeof(PodV1), lookup[("Pod", "v1")]);
+            Assert.Equal(typeof(DeploymentV1), lookup[("Deployment", "apps/v1")]);
+            Assert.Equal(typeof(ThirdPartyResourceV1Beta1), lookup[("ThirdPartyResource", "extensions/v1beta1")]);
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KnownModels.TryGetResourceType(string, string, out Type)"/> (which uses a generated switch statement) resolves the same resource model types as <see cref="KnownModels.KindToResourceType"/>.
+        /// </summary>
+        [Fact(DisplayName = "KnownModels.TryGetResourceType matches KindToResourceType")]
+        public void TryGetResourceType_Matches_KindToResourceType()
+        {
+            foreach (var knownModel in KnownModels.KindToResourceType)
+            {
+                Assert.True(KnownModels.TryGetResourceType(knownModel.Key.kind, knownModel.Key.apiVersion, out Type resourceType), $"Missing resource model type for {knownModel.Key.apiVersion}/{knownModel.Key.kind}.");
+                Assert.Equal(knownModel.Value, resourceType);
+            }
+
+            Assert.False(KnownModels.TryGetResourceType("Pod", "v2", out _));
+            Assert.False(KnownModels.TryGetResourceType("PodList", "v1", out _));
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KnownModels.TryGetApiPaths(Type, out ValueTuple{KubeAction, string}[])"/> returns the same API paths as those declared by each resource model type's <see cref="KubeApiAttribute"/>s.
+        /// </summary>
+        [Fact(DisplayName = "KnownModels API paths match model attributes")]
+        public void ApiPaths_Match_ModelAttributes()
+        {
+            foreach (Type modelType in ScanModelTypes(typeof(KubeResourceV1)))
+            {
+                (KubeAction action, string path)[] expected = modelType.GetTypeInfo().GetCustomAttributes<KubeApiAttribute>()
+                    .SelectMany(
+                        apiAttribute => apiAttribute.Paths.Select(
+                            path => (apiAttribute.Action, path)
+                        )
+                    )
+                    .ToArray();
+
+                if (expected.Length == 0)
+                {
+                    Assert.False(KnownModels.TryGetApiPaths(modelType, out _), $"Unexpected API paths for model type {modelType.Name}.");
+
+                    continue;
+                }
+
+                Assert.True(KnownModels.TryGetApiPaths(modelType, out var apiPaths), $"Missing API paths for model type {modelType.Name}.");
+
+                // The order in which custom attributes are returned is not guaranteed.
+                Assert.Equal(
+                    expected.OrderBy(apiPath => apiPath.action).ThenBy(apiPath => apiPath.path, StringComparer.Ordinal),
+                    apiPaths.OrderBy(apiPath => apiPath.action).ThenBy(apiPath => apiPath.path, StringComparer.Ordinal)
+                );
+            }
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KubeApiMetadataCache"/> resolves primary paths for built-in model types after loading metadata from the model assembly.
+        /// </summary>
+        [Fact(DisplayName = "KubeApiMetadataCache resolves primary paths for built-in model types")]
+        public void ApiMetadataCache_PrimaryPath_ModelAssembly()
+        {
+            var apiMetadataCache = new KubeApiMetadataCache();
+            apiMetadataCache.LoadFromMetadata(KnownModels.ModelAssembly);
+
+            Assert.Equal("api/v1/pods", apiMetadataCache.GetPrimaryPath<PodV1>());
+            Assert.Equal("apis/apps/v1/deployments", apiMetadataCache.GetPrimaryPath<DeploymentV1>());
+            Assert.Equal("api/v1/namespaces/{namespace}/pods", apiMetadataCache.Get<PodV1>().PrimaryNamespacedPath);
+        }
+
+        /// <summary>
+        ///     Verify that registering a <see cref="KubeModelPartition"/> adds its metadata to the model registries (and that each partition is only registered once).
+        /// </summary>
+        [Fact(DisplayName = "KnownModels registers model partition")]
+        public void Register_Partition()
+        {
+            // Re-use the existing metadata for ConfigMapV1 (so the resource-type registry is unchanged for other tests).
+            Assert.True(KnownModels.TryGetApiPaths(typeof(ConfigMapV1), out var expectedApiPaths));
+
+            var partition = new KubeModelPartition("RegisterPartitionTest",
+                resourceTypes: new[]
+                {
+                    (typeof(ConfigMapV1), "ConfigMap", "v1", 0, expectedApiPaths.Length)
+                },
+                apiActions: expectedApiPaths.Select((apiPath, index) => (apiPath.action, index)).ToArray(),
+                apiPathTemplates: expectedApiPaths.Select(apiPath => apiPath.path).ToArray(),
+                resourceListTypes: new[]
+                {
+                    (typeof(ConfigMapListV1), "ConfigMapList", "v1", "ConfigMap", "v1")
+                },
+                internedStringProperties: new[]
+                {
+                    (typeof(PartitionTestModel), nameof(PartitionTestModel.Name), InternedStrings.Values)
+                },
+                patchProperties: new[]
+                {
+                    (typeof(PartitionTestModel), "items", PatchStrategies.Merge, "name", typeof(PartitionTestModel))
+                },
+                indexedFields: new (Type, string, Func<KubeResourceV1, string>)[0],
+                converters: new (Type, JsonConverter)[]
+                {
+                    (typeof(PartitionTestModel), new StringEnumConverter())
+                },
+                binarySerializers: new (Type, KubeModelBinarySerializer)[0]
+            );
+
+            Assert.True(KnownModels.Register(partition));
+            Assert.True(KnownModels.IsRegistered("RegisterPartitionTest"));
+            Assert.False(KnownModels.Register(partition));
+
+            Assert.True(KnownModels.TryGetApiPaths(typeof(ConfigMapV1), out var apiPaths));
+            Assert.Equal(expectedApiPaths, apiPaths);
+
+            Assert.True(KnownModels.TryGetResourceType("ConfigMap", "v1", out Type resourceType));
+            Assert.Equal(typeof(ConfigMapV1), resourceType);
+
+            Assert.Equal(InternedStrings.Values,
+                InternedStringProperties.GetInternedStrings(typeof(PartitionTestModel), nameof(PartitionTestModel.Name))
+            );
+
+            Assert.True(StrategicMergePatch.TryGetPatchProperty(typeof(PartitionTestModel), "items", out var patchProperty));
+            Assert.Equal(PatchStrategies.Merge, patchProperty.patchStrategies);
+            Assert.Equal("name", patchProperty.mergeKey);
+
+            Assert.True(KubeModelConverters.TryGetConverter(typeof(PartitionTestModel), out JsonConverter converter));
+            Assert.IsType<StringEnumConverter>(converter);
+        }
+
+        /// <summary>
+        ///     Find all model types in the model assembly that derive from the specified base type and are decorated with <see cref="KubeObjectAttribute"/>.
+        /// </summary>
+        /// <param name="baseType">
+        ///     The model base type.
+        /// </param>
+        /// <returns>
+        ///     The model types.
+        /// </returns>
+        static IEnumerable<Type> ScanModelTypes(Type baseType)
+        {
+            return KnownModels.ModelAssembly.GetTypes().Where(modelType =>
+                modelType.IsPublic
+                &&
+                modelType.IsClass
+                &&
+                !modelType.IsAbstract
+                &&
+                baseType.IsAssignableFrom(modelType)
+                &&
+                modelType.GetTypeInfo().GetCustomAttribute<KubeObjectAttribute>() != null
+            );
+        }
+
+        /// <summary>
+        ///     Get the kind and apiVersion declared by a model type's <see cref="KubeObjectAttribute"/>.
+        /// </summary>
+        /// <param name="modelType">
+        ///     The model type.
+        /// </param>
+        /// <returns>
+        ///     The kind and apiVersion.
+        /// </returns>
+        static (string kind, string apiVersion) GetKubeObjectKind(Type modelType)
+        {
+            KubeObjectAttribute kubeObjectAttribute = modelType.GetTypeInfo().GetCustomAttribute<KubeObjectAttribute>();
+
+            return (kubeObjectAttribute.Kind, kubeObjectAttribute.ApiVersion);
+        }
+
+        /// <summary>
+        ///     A model type (not known to the model registries) used to test partition registration.
+        /// </summary>
+        class PartitionTestModel
+        {
+            /// <summary>
+            ///     The model name.
+            /// </summary>
+            public string Name { get; set; }
+        }
+    }
+}
@@ -0,0 +1,203 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for <see cref="KubeKeyedList{TKey, TItem}"/> (used for lists with "x-kubernetes-list-type: map").
+    /// </summary>
+    public class KubeKeyedListTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new <see cref="KubeKeyedList{TKey, TItem}"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public KubeKeyedListTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that items in a list keyed by a single property can be found by key.
+        /// </summary>
+        [Fact(DisplayName = "KubeKeyedList finds items by single key")]
+        public void FindItem_SingleKey()
+        {
+            var podSpec = new PodSpecV1
+            {
+                Containers =
+                {
+                    new ContainerV1 { Name = "container1", Image = "image1" },
+                    new ContainerV1 { Name = "container2", Image = "image2" }
+                }
+            };
+
+            Assert.Equal("image2", podSpec.Containers.FindItem("container2").Image);
+            Assert.Equal(0, podSpec.Containers.IndexOfKey("container1"));
+            Assert.True(podSpec.Containers.ContainsKey("container1"));
+
+            Assert.False(podSpec.Containers.TryGetItem("container3", out ContainerV1 container));
+            Assert.Null(container);
+            Assert.Null(podSpec.Containers.FindItem("container3"));
+            Assert.Equal(-1, podSpec.Containers.IndexOfKey("container3"));
+
+            Assert.Throws<ArgumentNullException>(
+                () => podSpec.Containers.FindItem(null)
+            );
+        }
+
+        /// <summary>
+        ///     Verify that items in a list keyed by more than one property can be found by key.
+        /// </summary>
+        [Fact(DisplayName = "KubeKeyedList finds items by composite key")]
+        public void FindItem_CompositeKey()
+        {
+            var container = new ContainerV1
+            {
+                Name = "container1",
+                Ports =
+                {
+                    new ContainerPortV1 { ContainerPort = 53, Protocol = "TCP", Name = "dns-tcp" },
+                    new ContainerPortV1 { ContainerPort = 53, Protocol = "UDP", Name = "dns-udp" },
+                    new ContainerPortV1 { ContainerPort = 8080, Name = "http" }
+                }
+            };
+
+            Assert.Equal("dns-udp", container.Ports.FindItem((53, "UDP")).Name);
+            Assert.Equal("dns-tcp", container.Ports.FindItem((53, "TCP")).Name);
+            Assert.Equal("http", container.Ports.FindItem((8080, null)).Name);
+            Assert.False(container.Ports.ContainsKey((8080, "TCP")));
+        }
+
+        /// <summary>
+        ///     Verify that lookups return the correct item after the list (or an item's key) has been modified.
+        /// </summary>
+        [Fact(DisplayName = "KubeKeyedList lookups reflect modifications")]
+        public void FindItem_AfterModification()
+        {
+            var containers = new KubeKeyedList<string, ContainerV1>
+            {
+                new ContainerV1 { Name = "container1" },
+                new ContainerV1 { Name = "container2" }
+            };
+            Assert.Equal(1, containers.IndexOfKey("container2"));
+
+            containers.RemoveAt(0);
+            Assert.Equal(0, containers.IndexOfKey("container2"));
+            Assert.Equal(-1, containers.IndexOfKey("container1"));
+
+            containers.Insert(0, new ContainerV1 { Name = "container3" });
+            Assert.Equal(0, containers.IndexOfKey("container3"));
+            Assert.Equal(1, containers.IndexOfKey("container2"));
+
+            containers[1].Name = "container4";
+            Assert.Equal(-1, containers.IndexOfKey("container2"));
+            Assert.Equal(1, containers.IndexOfKey("container4"));
+
+            containers.Clear();
+            Assert.Null(containers.FindItem("container3"));
+        }
+
+        /// <summary>
+        ///     Verify that lookups for keys that are not present only rebuild the index (rather than scanning the list) if the list has been modified.
+        /// </summary>
+        [Fact(DisplayName = "KubeKeyedList lookup misses do not scan unmodified list")]
+        public void IndexOfKey_MissDoesNotScan()
+        {
+            var items = new KubeKeyedList<string, CountingItem>
+            {
+                new CountingItem("item1"),
+                new CountingItem("item2")
+            };
+            Assert.Equal(-1, items.IndexOfKey("item3"));
+
+            int keyReads = CountingItem.KeyReads;
+            Assert.Equal(-1, items.IndexOfKey("item3"));
+            Assert.False(items.ContainsKey("item4"));
+            Assert.Equal(keyReads, CountingItem.KeyReads);
+
+            // Replacing an item does not change the item count.
+            items[1] = new CountingItem("item3");
+            Assert.Equal(1, items.IndexOfKey("item3"));
+            Assert.Equal(-1, items.IndexOfKey("item2"));
+        }
+
+        /// <summary>
+        ///     Verify that keyed lists are serialised (and deserialised) as JSON arrays.
+        /// </summary>
+        [Fact(DisplayName = "KubeKeyedList round-trips as JSON array")]
+        public void Json_RoundTrip()
+        {
+            var podSpec = new PodSpecV1
+            {
+                Containers =
+                {
+                    new ContainerV1 { Name = "container1", Image = "image1" },
+                    new ContainerV1 { Name = "container2", Image = "image2" }
+                }
+            };
+
+            string json = JsonConvert.SerializeObject(podSpec, KubeResourceClient.SerializerSettings);
+
+            JArray containersJson = Assert.IsType<JArray>(JObject.Parse(json)["containers"]);
+            Assert.Equal(2, containersJson.Count);
+            Assert.Equal("container1", containersJson[0].Value<string>("name"));
+            Assert.Null(containersJson[0]["listKey"]);
+
+            PodSpecV1 deserializedPodSpec = JsonConvert.DeserializeObject<PodSpecV1>(json, KubeResourceClient.SerializerSettings);
+            Assert.Equal(2, deserializedPodSpec.Containers.Count);
+            Assert.Equal("image2", deserializedPodSpec.Containers.FindItem("container2").Image);
+        }
+
+        /// <summary>
+        ///     A keyed-list item that counts how many times its key is read.
+        /// </summary>
+        class CountingItem
+            : IKubeKeyedListItem<string>
+        {
+            /// <summary>
+            ///     The number of times any item's key has been read.
+            /// </summary>
+            public static int KeyReads;
+
+            /// <summary>
+            ///     The item's name.
+            /// </summary>
+            readonly string _name;
+
+            /// <summary>
+            ///     Create a new <see cref="CountingItem"/>.
+            /// </summary>
+            /// <param name="name">
+            ///     The item's name (used as its key).
+            /// </param>
+            public CountingItem(string name)
+            {
+                _name = name;
+            }
+
+            /// <summary>
+            ///     The key that identifies the item within its list.
+            /// </summary>
+            public string ListKey
+            {
+                get
+                {
+                    KeyReads++;
+
+                    return _name;
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,156 @@
+using System;
+using System.Collections.Generic;
+using System.Runtime.CompilerServices;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for <see cref="KubeModelEquality"/> (used by models that implement <see cref="IKubeModelEquatable{TModel}"/>).
+    /// </summary>
+    public class KubeModelEqualityTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new <see cref="KubeModelEquality"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public KubeModelEqualityTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that <c>null</c> collections are considered equal to empty collections (but not to non-empty ones).
+        /// </summary>
+        [Fact(DisplayName = "KubeModelEquality treats null collections as empty")]
+        public void NullCollections_Empty()
+        {
+            Assert.True(KubeModelEquality.ListsEqual(null, new List<string>()));
+            Assert.False(KubeModelEquality.ListsEqual(null, new List<string> { "item1" }));
+
+            Assert.True(KubeModelEquality.DictionariesEqual(new Dictionary<string, string>(), null));
+            Assert.False(KubeModelEquality.DictionariesEqual(new Dictionary<string, string> { ["key1"] = "value1" }, null));
+
+            Assert.Equal(0, KubeModelEquality.GetCount(null));
+        }
+
+        /// <summary>
+        ///     Verify that lists are compared item-by-item, in order.
+        /// </summary>
+        [Fact(DisplayName = "KubeModelEquality compares lists by item")]
+        public void Lists_Equal()
+        {
+            var left = new List<string> { "item1", "item2" };
+
+            Assert.True(KubeModelEquality.ListsEqual(left, new List<string> { "item1", "item2" }));
+            Assert.False(KubeModelEquality.ListsEqual(left, new List<string> { "item2", "item1" }));
+            Assert.False(KubeModelEquality.ListsEqual(left, new List<string> { "item1" }));
+        }
+
+        /// <summary>
+        ///     Verify that dictionaries of lists are compared key-by-key, then item-by-item.
+        /// </summary>
+        [Fact(DisplayName = "KubeModelEquality compares dictionaries of lists")]
+        public void DictionariesOfLists_Equal()
+        {
+            var left = new Dictionary<string, List<string>>
+            {
+                ["key1"] = new List<string> { "value1", "value2" }
+            };
+            var right = new Dictionary<string, List<string>>();
+            KubeModelEquality.CopyLists(left, right);
+
+            Assert.True(KubeModelEquality.DictionariesOfListsEqual(left, right));
+            Assert.NotSame(left["key1"], right["key1"]);
+
+            right["key1"].Add("value3");
+            Assert.False(KubeModelEquality.DictionariesOfListsEqual(left, right));
+            Assert.Equal(2, left["key1"].Count);
+        }
+
+        /// <summary>
+        ///     Verify that copying models between lists clones each model.
+        /// </summary>
+        [Fact(DisplayName = "KubeModelEquality clones models when copying")]
+        public void CopyModels_Clones()
+        {
+            var source = new List<DeleteOptionsV1>
+            {
+                new DeleteOptionsV1
+                {
+                    GracePeriodSeconds = 30,
+                    Preconditions = new PreconditionsV1
+                    {
+                        Uid = "uid1"
+                    }
+                },
+                null
+            };
+            var target = new List<DeleteOptionsV1>();
+            KubeModelEquality.CopyModels(source, target);
+
+            Assert.Equal(2, target.Count);
+            Assert.NotSame(source[0], target[0]);
+            Assert.NotSame(source[0].Preconditions, target[0].Preconditions);
+            Assert.Null(target[1]);
+            Assert.True(KubeModelEquality.ListsEqual(source, target));
+
+            target[0].Preconditions.Uid = "uid2";
+            Assert.Equal("uid1", source[0].Preconditions.Uid);
+            Assert.False(KubeModelEquality.ListsEqual(source, target));
+        }
+
+        /// <summary>
+        ///     Verify that semantic equality ignores type metadata (which the API server omits from items in resource lists), but strict equality does not.
+        /// </summary>
+        [Fact(DisplayName = "KubeModelEquality semantic equality ignores type metadata")]
+        public void SemanticEquality_IgnoresTypeMetadata()
+        {
+            var left = new DeleteOptionsV1
+            {
+                Kind = "DeleteOptions",
+                ApiVersion = "v1",
+                PropagationPolicy = DeletePropagationPolicy.Foreground
+            };
+            DeleteOptionsV1 right = left.DeepClone().NoTypeMeta();
+
+            Assert.False(KubeModelEquality.AreEqual(left, right));
+            Assert.True(KubeModelEquality.AreSemanticallyEqual(left, right, ignoreStatus: false, ignoreManagedFields: false));
+            Assert.True(KubeModelEquality.ListsSemanticallyEqual(
+                new List<DeleteOptionsV1> { left },
+                new List<DeleteOptionsV1> { right },
+                ignoreStatus: false,
+                ignoreManagedFields: false
+            ));
+
+            right.PropagationPolicy = DeletePropagationPolicy.Background;
+            Assert.False(KubeModelEquality.AreSemanticallyEqual(left, right, ignoreStatus: false, ignoreManagedFields: false));
+        }
+
+        /// <summary>
+        ///     Verify that the hand-crafted <see cref="DeleteOptionsV1"/> model provides structural equality without changing the behaviour of <see cref="object.Equals(object)"/>.
+        /// </summary>
+        [Fact(DisplayName = "DeleteOptionsV1 structural equality does not override object equality")]
+        public void DeleteOptions_ObjectEqualityUnchanged()
+        {
+            var left = new DeleteOptionsV1
+            {
+                GracePeriodSeconds = 30
+            };
+            DeleteOptionsV1 right = left.DeepClone();
+
+            Assert.True(((IEquatable<DeleteOptionsV1>)left).Equals(right));
+            Assert.True(KubeModelEquality.AreEqual(left, right));
+
+            Assert.False(left.Equals((object)right));
+            Assert.Equal(RuntimeHelpers.GetHashCode(left), left.GetHashCode());
+        }
+    }
+}
@@ -0,0 +1,141 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.Net;
+using System.Threading.Tasks;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using ErrorHandling;
+    using KubeClient.Http.Testability;
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for precompiled resource request paths, and the generated resource clients that use them.
+    /// </summary>
+    public class KubeResourcePathsTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new resource-path test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public KubeResourcePathsTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that precompiled paths are built from escaped segments, and only include the query parameters that have values.
+        /// </summary>
+        [Fact(DisplayName = "Build precompiled resource paths")]
+        public void BuildPaths()
+        {
+            Assert.Equal("api/v1/namespaces/default/pods/pod1",
+                KubeResourcePaths.PodsV1.ByName("pod1", "default")
+            );
+            Assert.Equal("api/v1/namespaces/default/pods",
+                KubeResourcePaths.PodsV1.Collection("default")
+            );
+            Assert.Equal("api/v1/namespaces/default/pods?fieldSelector=status.phase%3DRunning&watch=true",
+                KubeResourcePaths.PodsV1.Collection("default", fieldSelector: "status.phase=Running", watch: true)
+            );
+            Assert.Equal("apis/rbac.authorization.k8s.io/v1/clusterroles?labelSelector=tier%20in%20%28web%2Capi%29",
+                KubeResourcePaths.ClusterRolesV1.Collection(labelSelector: "tier in (web,api)")
+            );
+            Assert.Equal("apis/rbac.authorization.k8s.io/v1/clusterroles/system%3Aadmin",
+                KubeResourcePaths.ClusterRolesV1.ByName("system:admin")
+            );
+
+            ArgumentException missingName = Assert.Throws<ArgumentException>(
+                () => KubeResourcePaths.PodsV1.ByName(" ", "default")
+            );
+            Assert.Equal("name", missingName.ParamName);
+        }
+
+        /// <summary>
+        ///     Verify that generated (and hand-written) resource clients request the expected paths.
+        /// </summary>
+        [Fact(DisplayName = "Resource clients request precompiled paths")]
+        public async Task ClientsRequestPaths()
+        {
+            List<string> requests = new List<string>();
+
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                requests.Add($"{request.Method.Method} {request.RequestUri.PathAndQuery}");
+
+                object responseBody;
+                switch (request.RequestUri.AbsolutePath)
+                {
+                    case "/apis/coordination.k8s.io/v1/namespaces/kube-system/leases":
+                    {
+                        responseBody = new LeaseListV1
+                        {
+                            Items =
+                            {
+                                new LeaseV1 { Metadata = new ObjectMetaV1 { Name = "lease1", Namespace = "kube-system" } }
+                            }
+                        };
+
+                        break;
+                    }
+                    case "/apis/coordination.k8s.io/v1/namespaces/kube-system/leases/lease1":
+                    {
+                        responseBody = new LeaseV1 { Metadata = new ObjectMetaV1 { Name = "lease1", Namespace = "kube-system" } };
+
+                        break;
+                    }
+                    case "/api/v1/namespaces/default/pods/pod1":
+                    {
+                        responseBody = new PodV1 { Metadata = new ObjectMetaV1 { Name = "pod1", Namespace = "default" } };
+
+                        break;
+                    }
+                    default:
+                    {
+                        responseBody = new StatusV1 { Status = "Success", Code = 200 };
+
+                        break;
+                    }
+                }
+
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: JsonConvert.SerializeObject(responseBody, KubeResourceClient.SerializerSettings),
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                LeaseListV1 leases = await client.LeasesV1().List(labelSelector: "app=controller", kubeNamespace: "kube-system");
+                LeaseV1 lease = Assert.Single(leases.Items);
+                Assert.Equal("lease1", lease.Metadata.Name);
+
+                lease = await client.LeasesV1().Get("lease1", kubeNamespace: "kube-system");
+                Assert.Equal("lease1", lease.Metadata.Name);
+
+                KubeResourceResultV1<ClusterRoleV1> deleteResult = await client.ClusterRolesV1().Delete("role1");
+                Assert.Null(deleteResult.Resource);
+                Assert.True(deleteResult.IsSuccess);
+
+                PodV1 pod = await client.PodsV1().Get("pod1", kubeNamespace: "default");
+                Assert.Equal("pod1", pod.Metadata.Name);
+            }
+
+            Assert.Equal(new[]
+            {
+                "GET /apis/coordination.k8s.io/v1/namespaces/kube-system/leases?labelSelector=app%3Dcontroller",
+                "GET /apis/coordination.k8s.io/v1/namespaces/kube-system/leases/lease1",
+                "DELETE /apis/rbac.authorization.k8s.io/v1/clusterroles/role1",
+                "GET /api/v1/namespaces/default/pods/pod1"
+            }, requests);
+        }
+    }
+}
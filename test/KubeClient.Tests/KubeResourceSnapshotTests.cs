@@ -0,0 +1,382 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Reactive.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Informers;
+    using Models;
+    using Models.Converters;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for <see cref="KubeResourceSnapshot"/>, <see cref="KubeResourceInformer{TResource}"/>, and generated binary serialisers.
+    /// </summary>
+    public class KubeResourceSnapshotTests
+        : TestBase
+    {
+        /// <summary>
+        ///     A temporary directory for snapshot files.
+        /// </summary>
+        readonly string _snapshotDirectory = Path.Combine(Path.GetTempPath(), "KubeClient.Tests", Guid.NewGuid().ToString("N"));
+
+        /// <summary>
+        ///     Create a new <see cref="KubeResourceSnapshot"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public KubeResourceSnapshotTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+            Directory.CreateDirectory(_snapshotDirectory);
+        }
+
+        /// <summary>
+        ///     Dispose of resources being used by the test suite.
+        /// </summary>
+        /// <param name="disposing">
+        ///     Explicit disposal?
+        /// </param>
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing && Directory.Exists(_snapshotDirectory))
+                Directory.Delete(_snapshotDirectory, recursive: true);
+
+            base.Dispose(disposing);
+        }
+
+        /// <summary>
+        ///     Verify that a model's generated binary serialiser can write and read a model without losing any data.
+        /// </summary>
+        [Fact(DisplayName = "Generated binary serialiser round-trips model")]
+        public void BinarySerializer_RoundTrip()
+        {
+            Assert.True(KubeModelBinarySerializers.TryGetSerializer(typeof(PodV1), out KubeModelBinarySerializer serializer));
+            Assert.Equal(typeof(PodV1), serializer.ModelType);
+            Assert.False(KubeModelBinarySerializers.TryGetSerializer(typeof(RoleV1), out _));
+
+            PodV1 pod = CreatePod("pod1", "ns1", resourceVersion: "7");
+
+            PodV1 roundTripped;
+            using (MemoryStream buffer = new MemoryStream())
+            {
+                using (BinaryWriter writer = new BinaryWriter(buffer, System.Text.Encoding.UTF8, leaveOpen: true))
+                {
+                    PodV1BinarySerializer.Instance.Write(writer, pod);
+                    PodV1BinarySerializer.Instance.Write(writer, null);
+                }
+
+                buffer.Position = 0;
+                using (BinaryReader reader = new BinaryReader(buffer))
+                {
+                    roundTripped = (PodV1)serializer.ReadObject(reader);
+                    Assert.Null(serializer.ReadObject(reader));
+                }
+            }
+
+            Assert.Equal(ToJson(pod), ToJson(roundTripped));
+            Assert.Equal(DateTimeKind.Utc, roundTripped.Metadata.CreationTimestamp.Value.Kind);
+            Assert.Equal(8080, roundTripped.Spec.Containers[0].ReadinessProbe.HttpGet.Port.Int32Value);
+            Assert.Equal("metrics", roundTripped.Spec.Containers[0].LivenessProbe.HttpGet.Port.StringValue);
+        }
+
+        /// <summary>
+        ///     Verify that a store's contents (and resource version) can be saved to, and loaded from, a snapshot.
+        /// </summary>
+        [Fact(DisplayName = "Snapshot round-trips store contents")]
+        public void Snapshot_RoundTrip()
+        {
+            string snapshotFileName = Path.Combine(_snapshotDirectory, "pods.snapshot");
+
+            var store = new KubeResourceStore<PodV1>();
+            store.Replace(new[]
+            {
+                CreatePod("pod1", "ns1", resourceVersion: "10"),
+                CreatePod("pod2", "ns2", resourceVersion: "11")
+            }, resourceVersion: "12");
+
+            Assert.Equal(2, KubeResourceSnapshot.Save(store, snapshotFileName));
+
+            // Overwrite the existing snapshot.
+            store.AddOrUpdate(CreatePod("pod3", "ns1", resourceVersion: "13"));
+            Assert.Equal(3, KubeResourceSnapshot.Save(store, snapshotFileName));
+            Assert.False(File.Exists(snapshotFileName + ".tmp"));
+
+            var loadedStore = new KubeResourceStore<PodV1>();
+            Assert.True(KubeResourceSnapshot.TryLoad(loadedStore, snapshotFileName));
+
+            Assert.Equal("12", loadedStore.ResourceVersion);
+            Assert.Equal(
+                store.List().OrderBy(pod => pod.Metadata.Name).Select(ToJson),
+                loadedStore.List().OrderBy(pod => pod.Metadata.Name).Select(ToJson)
+            );
+            Assert.Equal(new[] { "pod1", "pod3" }, loadedStore.GetByNamespace("ns1").Select(pod => pod.Metadata.Name).OrderBy(name => name));
+        }
+
+        /// <summary>
+        ///     Verify that missing, invalid, or incompatible snapshots are rejected (without modifying the store).
+        /// </summary>
+        [Fact(DisplayName = "Snapshot rejects invalid snapshots")]
+        public void Snapshot_RejectInvalid()
+        {
+            string podSnapshotFileName = Path.Combine(_snapshotDirectory, "pods.snapshot");
+            string configMapSnapshotFileName = Path.Combine(_snapshotDirectory, "configmaps.snapshot");
+
+            var store = new KubeResourceStore<PodV1>();
+            store.Replace(new[]
+            {
+                CreatePod("pod1", "ns1", resourceVersion: "10")
+            }, resourceVersion: "10");
+
+            Assert.False(KubeResourceSnapshot.TryLoad(store, podSnapshotFileName));
+
+            var configMapStore = new KubeResourceStore<ConfigMapV1>();
+            configMapStore.AddOrUpdate(new ConfigMapV1
+            {
+                Metadata = new ObjectMetaV1 { Name = "config1", Namespace = "ns1" }
+            });
+            KubeResourceSnapshot.Save(configMapStore, configMapSnapshotFileName);
+
+            Assert.False(KubeResourceSnapshot.TryLoad(store, configMapSnapshotFileName));
+
+            KubeResourceSnapshot.Save(new KubeResourceStore<PodV1>(), podSnapshotFileName);
+            byte[] snapshot = File.ReadAllBytes(podSnapshotFileName);
+
+            // Different schema hash (i.e. written for a different version of the model); in an empty snapshot, the schema hash is followed only by the (empty) resource version and the resource count.
+            byte[] staleSnapshot = (byte[])snapshot.Clone();
+            staleSnapshot[staleSnapshot.Length - sizeof(int) - 1 - sizeof(ulong)] ^= 0xFF;
+            File.WriteAllBytes(podSnapshotFileName, staleSnapshot);
+            Assert.False(KubeResourceSnapshot.TryLoad(store, podSnapshotFileName));
+
+            // Truncated.
+            File.WriteAllBytes(podSnapshotFileName, snapshot.Take(snapshot.Length - 2).ToArray());
+            Assert.False(KubeResourceSnapshot.TryLoad(store, podSnapshotFileName));
+
+            // Not a snapshot.
+            File.WriteAllText(podSnapshotFileName, "{\"kind\": \"PodList\"}");
+            Assert.False(KubeResourceSnapshot.TryLoad(store, podSnapshotFileName));
+
+            // Resource count larger than the remaining data (must be rejected before allocating storage for the resources).
+            byte[] oversizedSnapshot = (byte[])snapshot.Clone();
+            BitConverter.GetBytes(Int32.MaxValue).CopyTo(oversizedSnapshot, oversizedSnapshot.Length - sizeof(int));
+            File.WriteAllBytes(podSnapshotFileName, oversizedSnapshot);
+            Assert.False(KubeResourceSnapshot.TryLoad(store, podSnapshotFileName));
+
+            // Corrupt JSON (in a property stored as JSON).
+            var podStore = new KubeResourceStore<PodV1>();
+            podStore.AddOrUpdate(CreatePod("pod2", "ns1", resourceVersion: "11"));
+            KubeResourceSnapshot.Save(podStore, podSnapshotFileName);
+
+            byte[] corruptJsonSnapshot = File.ReadAllBytes(podSnapshotFileName);
+            byte[] extensionDataJson = System.Text.Encoding.UTF8.GetBytes("\"extension\"}");
+            int extensionDataIndex = Enumerable.Range(0, corruptJsonSnapshot.Length - extensionDataJson.Length)
+                .First(index => corruptJsonSnapshot.Skip(index).Take(extensionDataJson.Length).SequenceEqual(extensionDataJson));
+            corruptJsonSnapshot[extensionDataIndex + extensionDataJson.Length - 1] = (byte)']';
+            File.WriteAllBytes(podSnapshotFileName, corruptJsonSnapshot);
+            Assert.False(KubeResourceSnapshot.TryLoad(store, podSnapshotFileName));
+
+            Assert.Equal(1, store.Count);
+            Assert.Equal("10", store.ResourceVersion);
+
+            Assert.Throws<NotSupportedException>(() => KubeResourceSnapshot.Save(new KubeResourceStore<RoleV1>(), podSnapshotFileName));
+        }
+
+        /// <summary>
+        ///     Verify that an informer resumes watching from a snapshot, lists resources again when the resource version is too old, and resumes watching when a watch ends.
+        /// </summary>
+        [Fact(DisplayName = "Informer resumes from snapshot and re-lists on 410 Gone")]
+        public async Task Informer_ResumeAndRelist()
+        {
+            string snapshotFileName = Path.Combine(_snapshotDirectory, "pods.snapshot");
+
+            var snapshotStore = new KubeResourceStore<PodV1>();
+            snapshotStore.Replace(new[]
+            {
+                CreatePod("pod1", "ns1", resourceVersion: "5")
+            }, resourceVersion: "5");
+            KubeResourceSnapshot.Save(snapshotStore, snapshotFileName);
+
+            List<string> watchedResourceVersions = new List<string>();
+            int listCount = 0;
+
+            using (CancellationTokenSource cancellation = new CancellationTokenSource())
+            {
+                var informer = new KubeResourceInformer<PodV1>(new KubeResourceStore<PodV1>(),
+                    listResources: cancellationToken =>
+                    {
+                        listCount++;
+
+                        var pods = new PodListV1
+                        {
+                            Metadata = new ListMetaV1 { ResourceVersion = "20" }
+                        };
+                        pods.Items.Add(CreatePod("pod2", "ns1", resourceVersion: "19"));
+
+                        return Task.FromResult<KubeResourceListV1<PodV1>>(pods);
+                    },
+                    watchResources: resourceVersion =>
+                    {
+                        watchedResourceVersions.Add(resourceVersion);
+
+                        switch (watchedResourceVersions.Count)
+                        {
+                            case 1:
+                            {
+                                return Observable.Return(CreateEvent(ResourceEventType.Modified, CreatePod("pod1", "ns1", resourceVersion: "6"))).Concat(
+                                    Observable.Throw<IResourceEventV1<PodV1>>(new KubeApiException(new StatusV1
+                                    {
+                                        Status = "Failure",
+                                        Reason = "Expired",
+                                        Message = "too old resource version: 6 (20)",
+                                        Code = 410
+                                    }))
+                                );
+                            }
+                            case 2:
+                            {
+                                return Observable.Return(CreateEvent(ResourceEventType.Added, CreatePod("pod3", "ns1", resourceVersion: "21")));
+                            }
+                            default:
+                            {
+                                cancellation.Cancel();
+
+                                return Observable.Never<IResourceEventV1<PodV1>>();
+                            }
+                        }
+                    },
+                    snapshotFileName: snapshotFileName
+                );
+
+                await Assert.ThrowsAnyAsync<OperationCanceledException>(
+                    () => informer.RunAsync(cancellation.Token)
+                );
+
+                Assert.Equal(new[] { "5", "20", "21" }, watchedResourceVersions);
+                Assert.Equal(1, listCount);
+
+                Assert.Equal("21", informer.Store.ResourceVersion);
+                Assert.Equal(new[] { "pod2", "pod3" }, informer.Store.List().Select(pod => pod.Metadata.Name).OrderBy(name => name));
+
+                informer.SaveSnapshot();
+            }
+
+            var loadedStore = new KubeResourceStore<PodV1>();
+            Assert.True(KubeResourceSnapshot.TryLoad(loadedStore, snapshotFileName));
+            Assert.Equal("21", loadedStore.ResourceVersion);
+        }
+
+        /// <summary>
+        ///     Serialise a model to JSON (for comparison).
+        /// </summary>
+        /// <param name="model">
+        ///     The model.
+        /// </param>
+        /// <returns>
+        ///     The JSON.
+        /// </returns>
+        static string ToJson(object model) => JsonConvert.SerializeObject(model, KubeResourceClient.SerializerSettings);
+
+        /// <summary>
+        ///     Create a resource event for use in tests.
+        /// </summary>
+        /// <param name="eventType">
+        ///     The event type.
+        /// </param>
+        /// <param name="pod">
+        ///     The event's resource.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="IResourceEventV1{TResource}"/>.
+        /// </returns>
+        static IResourceEventV1<PodV1> CreateEvent(ResourceEventType eventType, PodV1 pod)
+        {
+            return new ResourceEventV1<PodV1>
+            {
+                EventType = eventType,
+                Resource = pod
+            };
+        }
+
+        /// <summary>
+        ///     Create a <see cref="PodV1"/> (with a representative selection of property types) for use in tests.
+        /// </summary>
+        /// <param name="name">
+        ///     The pod name.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The pod namespace.
+        /// </param>
+        /// <param name="resourceVersion">
+        ///     The pod's resource version.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="PodV1"/>.
+        /// </returns>
+        static PodV1 CreatePod(string name, string kubeNamespace, string resourceVersion)
+        {
+            var pod = new PodV1
+            {
+                Kind = "Pod",
+                ApiVersion = "v1",
+                Metadata = new ObjectMetaV1
+                {
+                    Name = name,
+                    Namespace = kubeNamespace,
+                    ResourceVersion = resourceVersion,
+                    CreationTimestamp = new DateTime(2024, 5, 1, 12, 30, 0, DateTimeKind.Utc)
+                },
+                Spec = new PodSpecV1
+                {
+                    NodeName = "node1",
+                    TerminationGracePeriodSeconds = 30,
+                    HostNetwork = false
+                },
+                Status = new PodStatusV1
+                {
+                    Phase = "Running",
+                    StartTime = new DateTime(2024, 5, 1, 12, 31, 0, DateTimeKind.Utc)
+                }
+            };
+            pod.Metadata.Labels["app"] = "web";
+            pod.Metadata.Annotations["example.com/note"] = "ünïcödé";
+            pod.Metadata.Finalizers.Add("example.com/finalizer");
+            pod.Metadata.ExtensionData["example"] = "extension";
+
+            var container = new ContainerV1
+            {
+                Name = "app",
+                Image = "app:1.0",
+                ReadinessProbe = new ProbeV1
+                {
+                    HttpGet = new HTTPGetActionV1 { Path = "/ready", Port = 8080 }
+                },
+                LivenessProbe = new ProbeV1
+                {
+                    HttpGet = new HTTPGetActionV1 { Path = "/healthz", Port = "metrics" }
+                }
+            };
+            container.Ports.Add(new ContainerPortV1 { Name = "http", ContainerPort = 8080 });
+            container.Resources = new ResourceRequirementsV1();
+            container.Resources.Limits["memory"] = "128Mi";
+            pod.Spec.Containers.Add(container);
+
+            pod.Status.Conditions.Add(new PodConditionV1
+            {
+                Type = "Ready",
+                Status = "True",
+                LastTransitionTime = new DateTime(2024, 5, 1, 12, 32, 0, DateTimeKind.Utc)
+            });
+
+            return pod;
+        }
+    }
+}
@@ -0,0 +1,228 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reactive.Subjects;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Informers;
+    using Models;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for <see cref="KubeResourceStore{TResource}"/>.
+    /// </summary>
+    public class KubeResourceStoreTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new <see cref="KubeResourceStore{TResource}"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public KubeResourceStoreTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that resources are indexed by namespace, label, and owner UID, and that indexes are updated when resources are modified.
+        /// </summary>
+        [Fact(DisplayName = "Store indexes resources by namespace, label, and owner")]
+        public void Index_Standard()
+        {
+            var store = new KubeResourceStore<PodV1>();
+            store.AddOrUpdate(CreatePod("pod1", "ns1", nodeName: "node1", app: "web", ownerUid: "rs1"));
+            store.AddOrUpdate(CreatePod("pod2", "ns1", nodeName: "node2", app: "web", ownerUid: "rs1"));
+            store.AddOrUpdate(CreatePod("pod3", "ns2", nodeName: "node1", app: "db", ownerUid: "rs2"));
+
+            Assert.Equal(3, store.Count);
+            Assert.Equal("pod3", store.Get("pod3", "ns2").Metadata.Name);
+            Assert.Null(store.Get("pod3", "ns1"));
+
+            Assert.Equal(new[] { "pod1", "pod2" }, GetNames(store.GetByNamespace("ns1")));
+            Assert.Equal(new[] { "pod1", "pod2" }, GetNames(store.GetByLabel("app", "web")));
+            Assert.Equal(new[] { "pod3" }, GetNames(store.GetByOwnerUid("rs2")));
+            Assert.Empty(store.GetByLabel("app", "cache"));
+
+            store.AddOrUpdate(CreatePod("pod2", "ns1", nodeName: "node2", app: "db", ownerUid: "rs2"));
+
+            Assert.Equal(3, store.Count);
+            Assert.Equal(new[] { "pod1" }, GetNames(store.GetByLabel("app", "web")));
+            Assert.Equal(new[] { "pod2", "pod3" }, GetNames(store.GetByLabel("app", "db")));
+            Assert.Equal(new[] { "pod1" }, GetNames(store.GetByOwnerUid("rs1")));
+
+            Assert.True(store.Remove(store.Get("pod1", "ns1")));
+            Assert.False(store.Remove(CreatePod("pod1", "ns1", nodeName: "node1", app: "web", ownerUid: "rs1")));
+
+            Assert.Equal(2, store.Count);
+            Assert.Empty(store.GetByOwnerUid("rs1"));
+            Assert.DoesNotContain("rs1", store.GetIndexKeys(KubeResourceIndexes.OwnerUid));
+            Assert.DoesNotContain(KubeResourceIndexes.GetLabelKey("app", "web"), store.GetIndexKeys(KubeResourceIndexes.Label));
+        }
+
+        /// <summary>
+        ///     Verify that resources can be indexed by the value of a generated indexed field, and by a user-defined index.
+        /// </summary>
+        [Fact(DisplayName = "Store indexes resources by field and user-defined index")]
+        public void Index_FieldAndUserDefined()
+        {
+            var store = new KubeResourceStore<PodV1>();
+            store.AddOrUpdate(CreatePod("pod1", "ns1", nodeName: "node1", app: "web", ownerUid: "rs1"));
+            store.AddOrUpdate(CreatePod("pod2", "ns1", nodeName: null, app: "web", ownerUid: "rs1"));
+
+            store.AddFieldIndex("spec.nodeName");
+            store.AddIndex("container", pod => pod.Spec.Containers.Select(container => container.Name));
+
+            store.AddOrUpdate(CreatePod("pod3", "ns2", nodeName: "node1", app: "db", ownerUid: "rs2"));
+
+            Assert.Equal(new[] { "pod1", "pod3" }, GetNames(store.GetByIndex("spec.nodeName", "node1")));
+            Assert.Equal(new[] { "node1" }, store.GetIndexKeys("spec.nodeName"));
+            Assert.Equal(new[] { "pod1", "pod2", "pod3" }, GetNames(store.GetByIndex("container", "app")));
+
+            Assert.Throws<ArgumentException>(() => store.AddFieldIndex("spec.noSuchField"));
+            Assert.Throws<ArgumentException>(() => store.AddIndex(KubeResourceIndexes.Label, pod => Enumerable.Empty<string>()));
+            Assert.Throws<ArgumentException>(() => store.GetByIndex("noSuchIndex", "key"));
+        }
+
+        /// <summary>
+        ///     Verify that the store applies the events from a resource-event stream (and that replacing its contents also replaces its index entries).
+        /// </summary>
+        [Fact(DisplayName = "Store applies resource events")]
+        public void Observe_Events()
+        {
+            var store = new KubeResourceStore<PodV1>();
+            store.Replace(new[]
+            {
+                CreatePod("pod1", "ns1", nodeName: "node1", app: "web", ownerUid: "rs1"),
+                CreatePod("pod2", "ns1", nodeName: "node1", app: "web", ownerUid: "rs1")
+            });
+
+            using (var events = new Subject<IResourceEventV1<PodV1>>())
+            using (events.Subscribe(store))
+            {
+                events.OnNext(new ResourceEventV1<PodV1>
+                {
+                    EventType = ResourceEventType.Added,
+                    Resource = CreatePod("pod3", "ns1", nodeName: "node2", app: "db", ownerUid: "rs2")
+                });
+                events.OnNext(new ResourceEventV1<PodV1>
+                {
+                    EventType = ResourceEventType.Deleted,
+                    Resource = CreatePod("pod1", "ns1", nodeName: "node1", app: "web", ownerUid: "rs1")
+                });
+                events.OnNext(new ResourceEventV1<PodV1>
+                {
+                    EventType = ResourceEventType.Bookmark,
+                    Resource = new PodV1 { Metadata = new ObjectMetaV1 { ResourceVersion = "42" } }
+                });
+            }
+
+            Assert.Equal(new[] { "pod2", "pod3" }, GetNames(store.List()));
+            Assert.Equal(new[] { "pod2" }, GetNames(store.GetByLabel("app", "web")));
+            Assert.Equal("42", store.ResourceVersion);
+
+            store.Replace(new[]
+            {
+                CreatePod("pod4", "ns2", nodeName: "node1", app: "web", ownerUid: "rs1")
+            });
+
+            Assert.Equal(1, store.Count);
+            Assert.Null(store.ResourceVersion);
+            Assert.Empty(store.GetByNamespace("ns1"));
+            Assert.Equal(new[] { "pod4" }, GetNames(store.GetByLabel("app", "web")));
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="IndexedFields"/> provides functions to get the values of generated (and hand-coded) indexed fields.
+        /// </summary>
+        [Fact(DisplayName = "IndexedFields gets field values")]
+        public void IndexedFields_GetValue()
+        {
+            PodV1 pod = CreatePod("pod1", "ns1", nodeName: "node1", app: "web", ownerUid: "rs1");
+
+            Assert.True(IndexedFields.TryGetField(typeof(PodV1), "spec.nodeName", out var getNodeName));
+            Assert.Equal("node1", getNodeName(pod));
+            Assert.Null(getNodeName(new PodV1()));
+
+            Assert.True(IndexedFields.TryGetField(typeof(PodV1), "metadata.namespace", out var getNamespace));
+            Assert.Equal("ns1", getNamespace(pod));
+
+            Assert.False(IndexedFields.TryGetField(typeof(ConfigMapV1), "spec.nodeName", out _));
+
+            Assert.Contains("status.phase", IndexedFields.GetFieldPaths(typeof(PodV1)));
+            Assert.Contains("metadata.name", IndexedFields.GetFieldPaths(typeof(PodV1)));
+        }
+
+        /// <summary>
+        ///     Get the names of resources, in ordinal order.
+        /// </summary>
+        /// <param name="resources">
+        ///     The resources.
+        /// </param>
+        /// <returns>
+        ///     The resource names.
+        /// </returns>
+        static string[] GetNames(IEnumerable<KubeResourceV1> resources)
+        {
+            return resources.Select(resource => resource.Metadata.Name)
+                .OrderBy(name => name, StringComparer.Ordinal)
+                .ToArray();
+        }
+
+        /// <summary>
+        ///     Create a <see cref="PodV1"/> for use in tests.
+        /// </summary>
+        /// <param name="name">
+        ///     The pod name.
+        /// </param>
+        /// <param name="kubeNamespace">
+        ///     The pod namespace.
+        /// </param>
+        /// <param name="nodeName">
+        ///     The name of the node that the pod is scheduled on.
+        /// </param>
+        /// <param name="app">
+        ///     The value of the pod's "app" label.
+        /// </param>
+        /// <param name="ownerUid">
+        ///     The UID of the pod's owner.
+        /// </param>
+        /// <returns>
+        ///     The <see cref="PodV1"/>.
+        /// </returns>
+        static PodV1 CreatePod(string name, string kubeNamespace, string nodeName, string app, string ownerUid)
+        {
+            var pod = new PodV1
+            {
+                Metadata = new ObjectMetaV1
+                {
+                    Name = name,
+                    Namespace = kubeNamespace
+                },
+                Spec = new PodSpecV1
+                {
+                    NodeName = nodeName
+                }
+            };
+            pod.Metadata.Labels["app"] = app;
+            pod.Metadata.OwnerReferences.Add(new OwnerReferenceV1
+            {
+                ApiVersion = "apps/v1",
+                Kind = "ReplicaSet",
+                Name = ownerUid,
+                Uid = ownerUid
+            });
+            pod.Spec.Containers.Add(new ContainerV1
+            {
+                Name = "app",
+                Image = "app:1.0"
+            });
+
+            return pod;
+        }
+    }
+}
@@ -0,0 +1,195 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Converters;
+using Newtonsoft.Json.Serialization;
+using System.IO;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using Models.ContractResolvers;
+    using Models.Converters;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for generated (streaming) JSON converters for model types.
+    /// </summary>
+    public class ModelConverterTests
+        : TestBase
+    {
+        /// <summary>
+        ///     A pod list that exercises most of the generated converters' code paths (case-insensitive property names, unknown properties, extension data, null values, and date-like strings).
+        /// </summary>
+        const string PodListJson = @"{
+            ""kind"": ""PodList"",
+            ""apiVersion"": ""v1"",
+            ""metadata"": { ""resourceVersion"": ""42"", ""continue"": null },
+            ""unknownListField"": [ 1, { ""a"": 2 } ],
+            ""items"": [
+                {
+                    ""metadata"": {
+                        ""name"": ""pod1"",
+                        ""namespace"": ""default"",
+                        ""creationTimestamp"": ""2024-01-01T00:00:00Z"",
+                        ""generation"": 3,
+                        ""labels"": { ""app"": ""test"" },
+                        ""annotations"": { ""restartedAt"": ""2024-01-01T00:00:00Z"", ""empty"": null },
+                        ""unknownMetadataField"": { ""x"": [ 1, 2 ] }
+                    },
+                    ""Spec"": {
+                        ""nodeName"": null,
+                        ""containers"": [
+                            {
+                                ""name"": ""container1"",
+                                ""image"": ""image1"",
+                                ""args"": [ ""--a"", ""2024-01-01T00:00:00Z"" ],
+                                ""ports"": [ { ""containerPort"": 80, ""name"": ""http"" } ],
+                                ""readinessProbe"": { ""httpGet"": { ""port"": ""http"", ""path"": ""/"" }, ""periodSeconds"": 5 },
+                                ""livenessProbe"": { ""tcpSocket"": { ""port"": 8080 } },
+                                ""resources"": { ""limits"": { ""cpu"": ""1"" } }
+                            }
+                        ],
+                        ""tolerations"": [ { ""key"": ""key1"", ""tolerationSeconds"": 300 } ],
+                        ""volumes"": null
+                    },
+                    ""status"": {
+                        ""phase"": ""Running"",
+                        ""startTime"": ""2024-01-01T00:00:05Z"",
+                        ""containerStatuses"": [
+                            {
+                                ""name"": ""container1"",
+                                ""ready"": true,
+                                ""restartCount"": 2,
+                                ""state"": { ""running"": { ""startedAt"": ""2024-01-01T00:00:06Z"" } }
+                            }
+                        ]
+                    },
+                    ""unknownPodField"": ""value""
+                }
+            ]
+        }";
+
+        /// <summary>
+        ///     Create a new generated model converter test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public ModelConverterTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KubeContractResolver"/> uses generated converters for allow-listed models (and the models they reference).
+        /// </summary>
+        [Fact(DisplayName = "KubeContractResolver uses generated converters")]
+        public void ContractResolver_UsesGeneratedConverters()
+        {
+            var contractResolver = new KubeContractResolver();
+
+            Assert.IsType<PodListV1Converter>(contractResolver.ResolveContract(typeof(PodListV1)).Converter);
+            Assert.IsType<PodV1Converter>(contractResolver.ResolveContract(typeof(PodV1)).Converter);
+            Assert.IsType<ObjectMetaV1Converter>(contractResolver.ResolveContract(typeof(ObjectMetaV1)).Converter);
+            Assert.IsType<ConfigMapV1Converter>(contractResolver.ResolveContract(typeof(ConfigMapV1)).Converter);
+
+            Assert.Null(contractResolver.ResolveContract(typeof(DeploymentV1)).Converter);
+        }
+
+        /// <summary>
+        ///     Verify that generated converters deserialise a <see cref="PodListV1"/> identically to the contract-based path.
+        /// </summary>
+        [Fact(DisplayName = "Generated converters deserialise PodListV1 identically to contract-based path")]
+        public void PodList_Deserialize_MatchesContractPath()
+        {
+            JsonSerializer contractSerializer = JsonSerializer.Create(new JsonSerializerSettings
+            {
+                NullValueHandling = NullValueHandling.Ignore,
+                ContractResolver = new ContractOnlyResolver(),
+                Converters =
+                {
+                    new StringEnumConverter(),
+                    new Int32OrStringV1Converter()
+                }
+            });
+            JsonSerializer generatedConverterSerializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+
+            PodListV1 expected = Deserialize<PodListV1>(contractSerializer, PodListJson);
+            PodListV1 actual = Deserialize<PodListV1>(generatedConverterSerializer, PodListJson);
+
+            PodV1 pod = Assert.Single(actual.Items);
+            Assert.Equal("pod1", pod.Metadata.Name);
+            Assert.Equal("2024-01-01T00:00:00Z", pod.Metadata.Annotations["restartedAt"]);
+            Assert.True(pod.Metadata.ExtensionData.ContainsKey("unknownMetadataField"));
+            Assert.Equal("2024-01-01T00:00:00Z", pod.Spec.Containers[0].Args[1]);
+            Assert.Equal(300, pod.Spec.Tolerations[0].TolerationSeconds);
+
+            // Compare everything else by serialising both (via the contract-based path, which generated converters do not affect).
+            Assert.Equal(
+                Serialize(contractSerializer, expected),
+                Serialize(contractSerializer, actual)
+            );
+        }
+
+        /// <summary>
+        ///     Deserialise a model from JSON.
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> to use.
+        /// </param>
+        /// <param name="json">
+        ///     The JSON.
+        /// </param>
+        /// <returns>
+        ///     The deserialised model.
+        /// </returns>
+        static TModel Deserialize<TModel>(JsonSerializer serializer, string json)
+        {
+            using (var reader = new JsonTextReader(new StringReader(json)))
+            {
+                return serializer.Deserialize<TModel>(reader);
+            }
+        }
+
+        /// <summary>
+        ///     Serialise a model to JSON.
+        /// </summary>
+        /// <param name="serializer">
+        ///     The <see cref="JsonSerializer"/> to use.
+        /// </param>
+        /// <param name="model">
+        ///     The model.
+        /// </param>
+        /// <returns>
+        ///     The JSON.
+        /// </returns>
+        static string Serialize(JsonSerializer serializer, object model)
+        {
+            using (var writer = new StringWriter())
+            {
+                serializer.Serialize(writer, model);
+
+                return writer.ToString();
+            }
+        }
+
+        /// <summary>
+        ///     A contract resolver equivalent to <see cref="KubeContractResolver"/>, but without generated converters.
+        /// </summary>
+        class ContractOnlyResolver
+            : CamelCasePropertyNamesContractResolver
+        {
+            /// <summary>
+            /// Get the JSON property name used to represent a dictionary key.
+            /// </summary>
+            /// <param name="dictionaryKey">The dictionary key.</param>
+            /// <returns>The JSON property name.</returns>
+            protected override string ResolveDictionaryKey(string dictionaryKey) => dictionaryKey;
+        }
+    }
+}
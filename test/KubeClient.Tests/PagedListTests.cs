@@ -0,0 +1,218 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Threading.Tasks;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using ErrorHandling;
+    using KubeClient.Http.Testability;
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for listing resources in pages (chunks) using "limit" and "continue".
+    /// </summary>
+    public class PagedListTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new paged-list test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public PagedListTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that all resources are enumerated, in order, across pages (with or without prefetching the next page).
+        /// </summary>
+        /// <param name="prefetchNextPage">
+        ///     Prefetch the next page?
+        /// </param>
+        [Theory(DisplayName = "Paged list enumerates resources across pages")]
+        [InlineData(false)]
+        [InlineData(true)]
+        public async Task ListPaged_AllPages(bool prefetchNextPage)
+        {
+            var requestedContinuationTokens = new List<string>();
+            MockMessageHandler handler = CreatePagedHandler(
+                totalPodCount: 5,
+                pageSize: 2,
+                requestedContinuationTokens: requestedContinuationTokens
+            );
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                var podNames = new List<string>();
+                await foreach (PodV1 pod in client.PodsV1().ListPaged(kubeNamespace: "default", pageSize: 2, prefetchNextPage: prefetchNextPage))
+                    podNames.Add(pod.Metadata.Name);
+
+                Assert.Equal(new[] { "pod0", "pod1", "pod2", "pod3", "pod4" }, podNames);
+            }
+
+            Assert.Equal(new[] { "", "2", "4" }, requestedContinuationTokens);
+        }
+
+        /// <summary>
+        ///     Verify that the label and field selectors are sent (escaped once) with the request for every page.
+        /// </summary>
+        [Fact(DisplayName = "Paged list sends selectors with every page")]
+        public async Task ListPaged_Selectors()
+        {
+            var requestQueries = new List<string>();
+            MockMessageHandler handler = CreatePagedHandler(
+                totalPodCount: 3,
+                pageSize: 2,
+                requestedContinuationTokens: new List<string>(),
+                requestQueries: requestQueries
+            );
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                var podNames = new List<string>();
+                await foreach (PodV1 pod in client.PodsV1().ListPaged(labelSelector: "app=foo,tier in (web)", fieldSelector: "status.phase=Running", kubeNamespace: "default", pageSize: 2))
+                    podNames.Add(pod.Metadata.Name);
+
+                Assert.Equal(new[] { "pod0", "pod1", "pod2" }, podNames);
+            }
+
+            Assert.Equal(2, requestQueries.Count);
+            Assert.All(requestQueries, requestQuery =>
+            {
+                Assert.Contains("labelSelector=app%3Dfoo%2Ctier%20in%20%28web%29", requestQuery);
+                Assert.Contains("fieldSelector=status.phase%3DRunning", requestQuery);
+            });
+        }
+
+        /// <summary>
+        ///     Verify that the dynamic client can enumerate resources in pages, using the model type to determine the resource kind.
+        /// </summary>
+        [Fact(DisplayName = "Dynamic paged list enumerates resources by model type")]
+        public async Task ListPaged_Dynamic()
+        {
+            MockMessageHandler handler = CreatePagedHandler(
+                totalPodCount: 3,
+                pageSize: 2,
+                requestedContinuationTokens: new List<string>()
+            );
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                var podNames = new List<string>();
+                await foreach (PodV1 pod in client.Dynamic().ListPaged<PodV1>(kubeNamespace: "default", pageSize: 2))
+                    podNames.Add(pod.Metadata.Name);
+
+                Assert.Equal(new[] { "pod0", "pod1", "pod2" }, podNames);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that an error response for a page results in a <see cref="KubeApiException"/>.
+        /// </summary>
+        [Fact(DisplayName = "Paged list fails when page cannot be retrieved")]
+        public async Task ListPaged_Error()
+        {
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                return request.CreateResponse(HttpStatusCode.Gone,
+                    responseBody: JsonConvert.SerializeObject(new StatusV1
+                    {
+                        Status = "Failure",
+                        Reason = "Expired",
+                        Message = "The provided continue parameter is too old.",
+                        Code = 410
+                    }),
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                KubeApiException error = await Assert.ThrowsAsync<KubeApiException>(async () =>
+                {
+                    await foreach (PodV1 pod in client.PodsV1().ListPaged(kubeNamespace: "default"))
+                        throw new InvalidOperationException("No pods should have been returned.");
+                });
+
+                Assert.Equal("Expired", error.Status.Reason);
+            }
+        }
+
+        /// <summary>
+        ///     Create a <see cref="MockMessageHandler"/> that returns pages of Pods.
+        /// </summary>
+        /// <param name="totalPodCount">
+        ///     The total number of Pods.
+        /// </param>
+        /// <param name="pageSize">
+        ///     The expected page size.
+        /// </param>
+        /// <param name="requestedContinuationTokens">
+        ///     A list that receives the continuation token for each request (an empty string for the first request).
+        /// </param>
+        /// <param name="requestQueries">
+        ///     An optional list that receives the query string of each request.
+        /// </param>
+        /// <returns>
+        ///     The configured <see cref="MockMessageHandler"/>.
+        /// </returns>
+        static MockMessageHandler CreatePagedHandler(int totalPodCount, int pageSize, List<string> requestedContinuationTokens, List<string> requestQueries = null)
+        {
+            return new MockMessageHandler(request =>
+            {
+                Assert.Equal("GET", request.Method.Method);
+                Assert.Contains($"limit={pageSize}", request.RequestUri.Query);
+
+                string continuationToken = request.RequestUri.Query
+                    .TrimStart('?')
+                    .Split('&')
+                    .Where(parameter => parameter.StartsWith("continue="))
+                    .Select(parameter => parameter.Substring("continue=".Length))
+                    .FirstOrDefault() ?? "";
+
+                lock (requestedContinuationTokens)
+                {
+                    requestedContinuationTokens.Add(continuationToken);
+                    requestQueries?.Add(request.RequestUri.Query);
+                }
+
+                int firstPodIndex = continuationToken != "" ? Int32.Parse(continuationToken) : 0;
+                int nextPodIndex = Math.Min(firstPodIndex + pageSize, totalPodCount);
+
+                var page = new PodListV1
+                {
+                    Metadata = new ListMetaV1
+                    {
+                        Continue = nextPodIndex < totalPodCount ? nextPodIndex.ToString() : null
+                    }
+                };
+                for (int podIndex = firstPodIndex; podIndex < nextPodIndex; podIndex++)
+                {
+                    page.Items.Add(new PodV1
+                    {
+                        Metadata = new ObjectMetaV1
+                        {
+                            Name = $"pod{podIndex}",
+                            Namespace = "default"
+                        }
+                    });
+                }
+
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: JsonConvert.SerializeObject(page, KubeResourceClient.SerializerSettings),
+                    mediaType: "application/json"
+                );
+            });
+        }
+    }
+}
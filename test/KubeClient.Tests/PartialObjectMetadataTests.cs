@@ -0,0 +1,135 @@
+using Newtonsoft.Json;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Threading.Tasks;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using ErrorHandling;
+    using KubeClient.Http.Testability;
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for metadata-only (<see cref="PartialObjectMetadataV1"/>) resource operations.
+    /// </summary>
+    public class PartialObjectMetadataTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new metadata-only operations test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public PartialObjectMetadataTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that listing resource metadata requests a <see cref="PartialObjectMetadataListV1"/> from the API server.
+        /// </summary>
+        [Fact(DisplayName = "Dynamic client lists resource metadata")]
+        public async Task ListMetadata()
+        {
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                Assert.Equal("/api/v1/namespaces/default/pods", request.RequestUri.AbsolutePath);
+                Assert.Contains("application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1",
+                    request.Headers.Accept.Select(mediaType => mediaType.ToString().Replace("; ", ";"))
+                );
+
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: JsonConvert.SerializeObject(CreateMetadataList("pod1", "pod2"), KubeResourceClient.SerializerSettings),
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                PartialObjectMetadataListV1 metadataList = await client.Dynamic().ListMetadata("Pod", "v1", kubeNamespace: "default");
+
+                Assert.Equal("PartialObjectMetadataList", metadataList.Kind);
+                Assert.Equal(new[] { "pod1", "pod2" }, metadataList.Items.Select(item => item.Metadata.Name));
+                Assert.Equal("owner1", metadataList.Items[0].Metadata.OwnerReferences[0].Name);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that enumerating resource metadata in pages requests <see cref="PartialObjectMetadataV1"/>s from the API server.
+        /// </summary>
+        [Fact(DisplayName = "Dynamic client enumerates resource metadata in pages")]
+        public async Task ListMetadataPaged()
+        {
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                Assert.Contains("limit=10", request.RequestUri.Query);
+                Assert.Contains("application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1",
+                    request.Headers.Accept.Select(mediaType => mediaType.ToString().Replace("; ", ";"))
+                );
+
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: JsonConvert.SerializeObject(CreateMetadataList("secret1"), KubeResourceClient.SerializerSettings),
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                var names = new List<string>();
+                await foreach (PartialObjectMetadataV1 metadata in client.Dynamic().ListMetadataPaged("Secret", "v1", kubeNamespace: "default", pageSize: 10))
+                    names.Add(metadata.Metadata.Name);
+
+                Assert.Equal(new[] { "secret1" }, names);
+            }
+        }
+
+        /// <summary>
+        ///     Create a <see cref="PartialObjectMetadataListV1"/> for testing.
+        /// </summary>
+        /// <param name="names">
+        ///     The names of the resources in the list.
+        /// </param>
+        /// <returns>
+        ///     The configured <see cref="PartialObjectMetadataListV1"/>.
+        /// </returns>
+        static PartialObjectMetadataListV1 CreateMetadataList(params string[] names)
+        {
+            var metadataList = new PartialObjectMetadataListV1
+            {
+                Kind = "PartialObjectMetadataList",
+                ApiVersion = "meta.k8s.io/v1",
+                Metadata = new ListMetaV1()
+            };
+            foreach (string name in names)
+            {
+                metadataList.Items.Add(new PartialObjectMetadataV1
+                {
+                    Metadata = new ObjectMetaV1
+                    {
+                        Name = name,
+                        Namespace = "default",
+                        OwnerReferences =
+                        {
+                            new OwnerReferenceV1
+                            {
+                                ApiVersion = "apps/v1",
+                                Kind = "ReplicaSet",
+                                Name = "owner1",
+                                Uid = "uid1"
+                            }
+                        }
+                    }
+                });
+            }
+
+            return metadataList;
+        }
+    }
+}
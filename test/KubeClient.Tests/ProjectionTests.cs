@@ -0,0 +1,123 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using Models.Projections;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for generated projection models (see the sample projections in the "Projections" directory).
+    /// </summary>
+    public class ProjectionTests
+        : TestBase
+    {
+        /// <summary>
+        ///     JSON for a pod that has fields that are not selected by the <see cref="PodPlacement"/> projection.
+        /// </summary>
+        const string PodJson = @"{
+            ""kind"": ""Pod"",
+            ""apiVersion"": ""v1"",
+            ""metadata"": { ""name"": ""pod1"", ""namespace"": ""default"", ""resourceVersion"": ""7"" },
+            ""spec"": {
+                ""nodeName"": ""node1"",
+                ""restartPolicy"": ""Always"",
+                ""containers"": [
+                    { ""name"": ""container1"", ""image"": ""image1"", ""args"": [ ""--verbose"" ], ""ports"": [ { ""containerPort"": 8080 } ] },
+                    { ""name"": ""container2"", ""image"": ""image2"" }
+                ]
+            },
+            ""status"": { ""phase"": ""Running"", ""podIP"": ""10.0.0.1"", ""conditions"": [ { ""type"": ""Ready"", ""status"": ""True"" } ] }
+        }";
+
+        /// <summary>
+        ///     Create a new projection test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public ProjectionTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that a projection reads only its selected fields, and round-trips them through JSON.
+        /// </summary>
+        [Fact(DisplayName = "Projection round-trips selected fields")]
+        public void Projection_RoundTrip()
+        {
+            PodPlacement pod = Deserialize<PodPlacement>(PodJson);
+
+            Assert.Equal("Pod", pod.Kind);
+            Assert.Equal("v1", pod.ApiVersion);
+            Assert.Equal("pod1", pod.Metadata.Name);
+            Assert.Equal("7", pod.Metadata.ResourceVersion);
+            Assert.Equal("node1", pod.Spec.NodeName);
+            Assert.Equal(new[] { "image1", "image2" }, new[] { pod.Spec.Containers[0].Image, pod.Spec.Containers[1].Image });
+            Assert.Equal("Running", pod.Status.Phase);
+
+            JObject podJson = JObject.Parse(Serialize(pod));
+            Assert.Equal(new[] { "apiVersion", "kind", "metadata", "spec", "status" },
+                podJson.Properties().Select(property => property.Name).OrderBy(name => name, StringComparer.Ordinal)
+            );
+            Assert.Null(podJson.SelectToken("spec.restartPolicy"));
+            Assert.Null(podJson.SelectToken("spec.containers[0].name"));
+            Assert.Null(podJson.SelectToken("status.podIP"));
+            Assert.Equal("image2", (string)podJson.SelectToken("spec.containers[1].image"));
+
+            PodPlacement roundTripped = Deserialize<PodPlacement>(podJson.ToString(Formatting.None));
+            Assert.Equal(podJson.ToString(Formatting.None), Serialize(roundTripped));
+        }
+
+        /// <summary>
+        ///     Verify that a projection takes its kind and apiVersion from the model it projects, without being found by kind / apiVersion lookups (which would otherwise have 2 model types for the same kind).
+        /// </summary>
+        [Fact(DisplayName = "Projection does not collide with projected model in kind lookups")]
+        public void Projection_KindLookup()
+        {
+            Assert.Equal(("Pod", "v1"), KubeObjectV1.GetKubeKind<PodPlacement>());
+
+            Dictionary<(string kind, string apiVersion), Type> modelTypesByKind = ModelMetadata.KubeObject.BuildKindToTypeLookup(
+                typeof(PodV1).Assembly,
+                typeof(PodPlacement).Assembly
+            );
+            Assert.Equal(typeof(PodV1), modelTypesByKind[("Pod", "v1")]);
+            Assert.DoesNotContain(typeof(PodPlacement), modelTypesByKind.Values);
+
+            Assert.False(ModelMetadata.KubeObject.BuildTypeToKindLookup(typeof(PodPlacement).Assembly).ContainsKey(typeof(PodPlacement)));
+        }
+
+        /// <summary>
+        ///     Serialise a model to JSON (using the default KubeClient serialiser settings).
+        /// </summary>
+        /// <param name="model">
+        ///     The model.
+        /// </param>
+        /// <returns>
+        ///     The JSON.
+        /// </returns>
+        static string Serialize(object model) => JsonConvert.SerializeObject(model, Formatting.None, KubeResourceClient.SerializerSettings);
+
+        /// <summary>
+        ///     Deserialise a model from JSON (using the default KubeClient serialiser settings).
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="json">
+        ///     The JSON.
+        /// </param>
+        /// <returns>
+        ///     The deserialised model.
+        /// </returns>
+        static TModel Deserialize<TModel>(string json) => JsonConvert.DeserializeObject<TModel>(json, KubeResourceClient.SerializerSettings);
+    }
+}
@@ -0,0 +1,28 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using YamlDotNet.Serialization;
+
+namespace KubeClient.Models.Projections
+{
+    /// <summary>
+    ///     Projection of <see cref="PodV1"/> ("spec.nodeName", "spec.containers.image", "status.phase").
+    /// </summary>
+    [KubeProjection(typeof(PodV1))]
+    public partial class PodPlacement : KubeResourceV1
+    {
+        /// <summary>
+        ///     Specification of the desired behavior of the pod. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+        /// </summary>
+        [YamlMember(Alias = "spec")]
+        [JsonProperty("spec", NullValueHandling = NullValueHandling.Ignore)]
+        public PodPlacementSpec Spec { get; set; }
+
+        /// <summary>
+        ///     Most recently observed status of the pod. This data may not be up to date. Populated by the system. Read-only. More info: https://git.k8s.io/community/contributors/devel/sig-architecture/api-conventions.md#spec-and-status
+        /// </summary>
+        [YamlMember(Alias = "status")]
+        [JsonProperty("status", NullValueHandling = NullValueHandling.Ignore)]
+        public PodPlacementStatus Status { get; set; }
+    }
+}
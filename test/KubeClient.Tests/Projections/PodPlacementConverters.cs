@@ -0,0 +1,217 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using KubeClient.Models.Converters;
+
+namespace KubeClient.Models.Projections
+{
+    [JsonConverter(typeof(PodPlacementConverter))]
+    public partial class PodPlacement
+    {
+    }
+
+    [JsonConverter(typeof(PodPlacementSpecConverter))]
+    public partial class PodPlacementSpec
+    {
+    }
+
+    [JsonConverter(typeof(PodPlacementSpecContainersConverter))]
+    public partial class PodPlacementSpecContainers
+    {
+    }
+
+    [JsonConverter(typeof(PodPlacementStatusConverter))]
+    public partial class PodPlacementStatus
+    {
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodPlacement"/>.
+    /// </summary>
+    public sealed class PodPlacementConverter
+        : KubeModelConverter<PodPlacement>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodPlacementConverter"/>.
+        /// </summary>
+        public static PodPlacementConverter Instance { get; } = new PodPlacementConverter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodPlacementConverter"/>.
+        /// </summary>
+        public PodPlacementConverter()
+            : base("metadata", "spec", "kind", "apiVersion", "status")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodPlacement"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodPlacement model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "metadata":
+                {
+                    model.Metadata = InheritedValue(ReadValue<ObjectMetaV1>(reader, serializer), model.Metadata, serializer);
+
+                    return true;
+                }
+                case "spec":
+                {
+                    model.Spec = ReadModel(reader, PodPlacementSpecConverter.Instance, model.Spec, serializer) ?? model.Spec;
+
+                    return true;
+                }
+                case "kind":
+                {
+                    model.Kind = InheritedValue(ReadAsInternedString(reader), model.Kind, serializer);
+
+                    return true;
+                }
+                case "apiVersion":
+                {
+                    model.ApiVersion = InheritedValue(ReadAsInternedString(reader), model.ApiVersion, serializer);
+
+                    return true;
+                }
+                case "status":
+                {
+                    model.Status = ReadModel(reader, PodPlacementStatusConverter.Instance, model.Status, serializer) ?? model.Status;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodPlacementSpec"/>.
+    /// </summary>
+    public sealed class PodPlacementSpecConverter
+        : KubeModelConverter<PodPlacementSpec>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodPlacementSpecConverter"/>.
+        /// </summary>
+        public static PodPlacementSpecConverter Instance { get; } = new PodPlacementSpecConverter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodPlacementSpecConverter"/>.
+        /// </summary>
+        public PodPlacementSpecConverter()
+            : base("nodeName", "containers")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodPlacementSpec"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodPlacementSpec model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "nodeName":
+                {
+                    model.NodeName = ReadAsInternedString(reader) ?? model.NodeName;
+
+                    return true;
+                }
+                case "containers":
+                {
+                    ReadModelList(reader, PodPlacementSpecContainersConverter.Instance, model.Containers, serializer);
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodPlacementSpecContainers"/>.
+    /// </summary>
+    public sealed class PodPlacementSpecContainersConverter
+        : KubeModelConverter<PodPlacementSpecContainers>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodPlacementSpecContainersConverter"/>.
+        /// </summary>
+        public static PodPlacementSpecContainersConverter Instance { get; } = new PodPlacementSpecContainersConverter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodPlacementSpecContainersConverter"/>.
+        /// </summary>
+        public PodPlacementSpecContainersConverter()
+            : base("image")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodPlacementSpecContainers"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodPlacementSpecContainers model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "image":
+                {
+                    model.Image = ReadAsInternedString(reader) ?? model.Image;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+
+    /// <summary>
+    ///     Generated JSON converter for <see cref="PodPlacementStatus"/>.
+    /// </summary>
+    public sealed class PodPlacementStatusConverter
+        : KubeModelConverter<PodPlacementStatus>
+    {
+        /// <summary>
+        ///     The shared instance of <see cref="PodPlacementStatusConverter"/>.
+        /// </summary>
+        public static PodPlacementStatusConverter Instance { get; } = new PodPlacementStatusConverter();
+
+        /// <summary>
+        ///     Create a new <see cref="PodPlacementStatusConverter"/>.
+        /// </summary>
+        public PodPlacementStatusConverter()
+            : base("phase")
+        {
+        }
+
+        /// <summary>
+        ///     Read the value of a <see cref="PodPlacementStatus"/> property.
+        /// </summary>
+        protected override bool ReadProperty(PodPlacementStatus model, string propertyName, JsonReader reader, JsonSerializer serializer)
+        {
+            switch (propertyName)
+            {
+                case "phase":
+                {
+                    model.Phase = ReadAsInternedString(reader) ?? model.Phase;
+
+                    return true;
+                }
+                default:
+                {
+                    return false;
+                }
+            }
+        }
+    }
+}
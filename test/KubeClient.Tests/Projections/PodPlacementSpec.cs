@@ -0,0 +1,28 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using YamlDotNet.Serialization;
+
+namespace KubeClient.Models.Projections
+{
+    /// <summary>
+    ///     Projection of <see cref="PodSpecV1"/> (field "spec") for <see cref="PodPlacement"/>.
+    /// </summary>
+    public partial class PodPlacementSpec
+    {
+        /// <summary>
+        ///     NodeName indicates in which node this pod is scheduled. If empty, this pod is a candidate for scheduling by the scheduler defined in schedulerName. Once this field is set, the kubelet for this node becomes responsible for the lifecycle of this pod. This field should not be used to express a desire for the pod to be scheduled on a specific node. https://kubernetes.io/docs/concepts/scheduling-eviction/assign-pod-node/#nodename
+        /// </summary>
+        [YamlMember(Alias = "nodeName")]
+        [JsonProperty("nodeName", NullValueHandling = NullValueHandling.Ignore)]
+        public string NodeName { get; set; }
+
+        /// <summary>
+        ///     List of containers belonging to the pod. Containers cannot currently be added or removed. There must be at least one container in a Pod. Cannot be updated.
+        /// </summary>
+        [MergeStrategy(Key = "name")]
+        [YamlMember(Alias = "containers")]
+        [JsonProperty("containers", ObjectCreationHandling = ObjectCreationHandling.Reuse)]
+        public List<PodPlacementSpecContainers> Containers { get; } = new List<PodPlacementSpecContainers>();
+    }
+}
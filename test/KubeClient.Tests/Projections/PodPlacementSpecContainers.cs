@@ -0,0 +1,20 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using YamlDotNet.Serialization;
+
+namespace KubeClient.Models.Projections
+{
+    /// <summary>
+    ///     Projection of <see cref="ContainerV1"/> (field "spec.containers") for <see cref="PodPlacement"/>.
+    /// </summary>
+    public partial class PodPlacementSpecContainers
+    {
+        /// <summary>
+        ///     Container image name. More info: https://kubernetes.io/docs/concepts/containers/images This field is optional to allow higher level config management to default or override container images in workload controllers like Deployments and StatefulSets.
+        /// </summary>
+        [YamlMember(Alias = "image")]
+        [JsonProperty("image", NullValueHandling = NullValueHandling.Ignore)]
+        public string Image { get; set; }
+    }
+}
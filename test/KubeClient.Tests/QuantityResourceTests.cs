@@ -0,0 +1,142 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for <see cref="QuantityResource"/>.
+    /// </summary>
+    public class QuantityResourceTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new <see cref="QuantityResource"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public QuantityResourceTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that quantities are parsed and formatted in canonical form.
+        /// </summary>
+        /// <param name="value">
+        ///     The quantity to parse.
+        /// </param>
+        /// <param name="expectedCanonicalValue">
+        ///     The expected canonical representation of the quantity.
+        /// </param>
+        /// <param name="expectedMilliValue">
+        ///     The expected value of the quantity, in milli-units.
+        /// </param>
+        [Theory(DisplayName = "Parse quantity and format in canonical form")]
+        [InlineData("0", "0", 0)]
+        [InlineData("1500m", "1500m", 1500)]
+        [InlineData("1.5", "1500m", 1500)]
+        [InlineData("-0.25", "-250m", -250)]
+        [InlineData("1000", "1k", 1000000)]
+        [InlineData("2Gi", "2Gi", 2147483648000)]
+        [InlineData("1.5Gi", "1536Mi", 1610612736000)]
+        [InlineData("0.5Ki", "512", 512000)]
+        [InlineData("12e6", "12e6", 12000000000)]
+        [InlineData("1E3", "1e3", 1000000)]
+        [InlineData("0.1n", "1n", 1)]
+        public void Parse_Canonical(string value, string expectedCanonicalValue, long expectedMilliValue)
+        {
+            QuantityResource quantity = QuantityResource.Parse(value);
+
+            Assert.Equal(expectedCanonicalValue, quantity.ToString());
+            Assert.Equal(expectedMilliValue, quantity.MilliValue);
+        }
+
+        /// <summary>
+        ///     Verify that invalid (or unrepresentable) quantities are rejected.
+        /// </summary>
+        /// <param name="value">
+        ///     The quantity to parse.
+        /// </param>
+        [Theory(DisplayName = "Parse invalid quantity")]
+        [InlineData("")]
+        [InlineData("m")]
+        [InlineData("1.5.5")]
+        [InlineData("1Xi")]
+        [InlineData("1e")]
+        [InlineData("8Ei")]
+        public void Parse_Invalid(string value)
+        {
+            Assert.False(QuantityResource.TryParse(value, out _));
+            Assert.Throws<FormatException>(() => QuantityResource.Parse(value));
+        }
+
+        /// <summary>
+        ///     Verify that quantities can be added and subtracted, regardless of their scales.
+        /// </summary>
+        [Fact(DisplayName = "Add and subtract quantities")]
+        public void Add_Subtract()
+        {
+            QuantityResource sum = QuantityResource.Sum(new[]
+            {
+                QuantityResource.Parse("1500m"),
+                QuantityResource.Parse("2"),
+                QuantityResource.Parse("250m")
+            });
+            Assert.Equal("3750m", sum.ToString());
+            Assert.Equal(4, sum.Value);
+
+            QuantityResource memory = QuantityResource.Parse("1Gi") + QuantityResource.Parse("512Mi");
+            Assert.Equal("1536Mi", memory.ToString());
+            Assert.Equal(QuantityFormat.BinarySI, memory.Format);
+
+            QuantityResource difference = memory - QuantityResource.Parse("1536Mi");
+            Assert.True(difference.IsZero);
+            Assert.Equal("0", difference.ToString());
+
+            Assert.Equal("3Gi", (QuantityResource.Parse("1Gi") * 3).ToString());
+        }
+
+        /// <summary>
+        ///     Verify that quantities are compared by value, regardless of their formats.
+        /// </summary>
+        [Fact(DisplayName = "Compare quantities")]
+        public void Compare()
+        {
+            Assert.Equal(QuantityResource.Parse("1k"), QuantityResource.Parse("1000"));
+            Assert.Equal(QuantityResource.Parse("1k").GetHashCode(), QuantityResource.Parse("1e3").GetHashCode());
+            Assert.True(QuantityResource.Parse("1Ki") > QuantityResource.Parse("1k"));
+            Assert.True(QuantityResource.Parse("999m") < 1);
+            Assert.True(QuantityResource.Parse("-1") < QuantityResource.Parse("1n"));
+            Assert.True(QuantityResource.Parse("1E") > QuantityResource.Parse("1n"));
+        }
+
+        /// <summary>
+        ///     Verify that quantities are serialised to (and deserialised from) JSON in canonical form.
+        /// </summary>
+        [Fact(DisplayName = "Serialise and deserialise quantities")]
+        public void Serialize_Deserialize()
+        {
+            var requests = JsonConvert.DeserializeObject<Dictionary<string, QuantityResource>>(
+                @"{ ""cpu"": ""0.5"", ""memory"": ""128Mi"", ""pods"": 110 }",
+                KubeResourceClient.SerializerSettings
+            );
+
+            Assert.Equal(500, requests["cpu"].MilliValue);
+            Assert.Equal(128 * 1024 * 1024, requests["memory"].Value);
+            Assert.Equal(110, requests["pods"].Value);
+
+            Assert.Equal(
+                @"{""cpu"":""500m"",""memory"":""128Mi"",""pods"":""110""}",
+                JsonConvert.SerializeObject(requests, KubeResourceClient.SerializerSettings)
+            );
+        }
+    }
+}
@@ -0,0 +1,131 @@
+using Newtonsoft.Json;
+using System.IO;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using Models.Converters;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for (forward-only) deserialisation of dynamically-typed watch events by <see cref="ResourceEventV1Converter"/>.
+    /// </summary>
+    public class ResourceEventV1ConverterTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new <see cref="ResourceEventV1Converter"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public ResourceEventV1ConverterTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that events are deserialised as the model type for their resource's kind / apiVersion, regardless of where those properties appear in the resource.
+        /// </summary>
+        /// <param name="eventJson">
+        ///     The event JSON.
+        /// </param>
+        [InlineData(@"{ ""type"": ""ADDED"", ""object"": { ""kind"": ""Deployment"", ""apiVersion"": ""apps/v1"", ""metadata"": { ""name"": ""deployment1"", ""annotations"": { ""restartedAt"": ""2024-01-01T00:00:00Z"" } }, ""spec"": { ""replicas"": 3 } } }")]
+        [InlineData(@"{ ""type"": ""ADDED"", ""object"": { ""apiVersion"": ""apps/v1"", ""kind"": ""Deployment"", ""metadata"": { ""name"": ""deployment1"", ""annotations"": { ""restartedAt"": ""2024-01-01T00:00:00Z"" } }, ""spec"": { ""replicas"": 3 } } }")]
+        [InlineData(@"{ ""object"": { ""metadata"": { ""name"": ""deployment1"", ""annotations"": { ""restartedAt"": ""2024-01-01T00:00:00Z"" } }, ""spec"": { ""replicas"": 3 }, ""kind"": ""Deployment"", ""apiVersion"": ""apps/v1"" }, ""type"": ""ADDED"" }")]
+        [Theory(DisplayName = "ResourceEventV1Converter deserialises resource by kind and apiVersion")]
+        public void Deserialize_ResourceByKind(string eventJson)
+        {
+            ResourceEventV1<KubeResourceV1> resourceEvent = DeserializeEvent(eventJson);
+
+            Assert.Equal(ResourceEventType.Added, resourceEvent.EventType);
+
+            DeploymentV1 deployment = Assert.IsType<DeploymentV1>(resourceEvent.Resource);
+            Assert.Equal("Deployment", deployment.Kind);
+            Assert.Equal("apps/v1", deployment.ApiVersion);
+            Assert.Equal("deployment1", deployment.Metadata.Name);
+            Assert.Equal("2024-01-01T00:00:00Z", deployment.Metadata.Annotations["restartedAt"]);
+            Assert.Equal(3, deployment.Spec.Replicas);
+        }
+
+        /// <summary>
+        ///     Verify that events whose resource has a generated converter are deserialised using it.
+        /// </summary>
+        [Fact(DisplayName = "ResourceEventV1Converter deserialises resource with generated converter")]
+        public void Deserialize_ResourceWithGeneratedConverter()
+        {
+            ResourceEventV1<KubeResourceV1> resourceEvent = DeserializeEvent(@"{
+                ""type"": ""MODIFIED"",
+                ""object"": {
+                    ""kind"": ""Pod"",
+                    ""apiVersion"": ""v1"",
+                    ""metadata"": { ""name"": ""pod1"", ""namespace"": ""default"", ""resourceVersion"": ""42"" },
+                    ""spec"": { ""containers"": [ { ""name"": ""container1"", ""image"": ""image1"" } ] },
+                    ""status"": { ""phase"": ""Running"" }
+                }
+            }");
+
+            Assert.Equal(ResourceEventType.Modified, resourceEvent.EventType);
+
+            PodV1 pod = Assert.IsType<PodV1>(resourceEvent.Resource);
+            Assert.Equal("pod1", pod.Metadata.Name);
+            Assert.Equal("42", pod.Metadata.ResourceVersion);
+            Assert.Equal("image1", Assert.Single(pod.Spec.Containers).Image);
+            Assert.Equal("Running", pod.Status.Phase);
+        }
+
+        /// <summary>
+        ///     Verify that error events (whose resource is a <see cref="StatusV1"/>) are reported as <see cref="KubeApiException"/>s.
+        /// </summary>
+        [Fact(DisplayName = "ResourceEventV1Converter reports error event as KubeApiException")]
+        public void Deserialize_ErrorEvent()
+        {
+            const string eventJson = @"{ ""type"": ""ERROR"", ""object"": { ""kind"": ""Status"", ""apiVersion"": ""v1"", ""status"": ""Failure"", ""message"": ""too old resource version"", ""reason"": ""Expired"", ""code"": 410 } }";
+
+            KubeApiException exception = Assert.Throws<KubeApiException>(
+                () => DeserializeEvent(eventJson)
+            );
+            Assert.NotNull(exception.Status);
+            Assert.Equal(410, exception.Status.Code);
+            Assert.Equal("Expired", exception.Status.Reason);
+        }
+
+        /// <summary>
+        ///     Verify that events whose resource has an unknown kind / apiVersion are rejected.
+        /// </summary>
+        [Fact(DisplayName = "ResourceEventV1Converter rejects resource with unknown kind")]
+        public void Deserialize_UnknownKind()
+        {
+            const string eventJson = @"{ ""type"": ""ADDED"", ""object"": { ""kind"": ""Widget"", ""apiVersion"": ""example.com/v1"" } }";
+
+            Assert.Throws<KubeClientException>(
+                () => DeserializeEvent(eventJson)
+            );
+        }
+
+        /// <summary>
+        ///     Deserialise a dynamically-typed event from JSON.
+        /// </summary>
+        /// <param name="eventJson">
+        ///     The event JSON.
+        /// </param>
+        /// <returns>
+        ///     The deserialised event.
+        /// </returns>
+        static ResourceEventV1<KubeResourceV1> DeserializeEvent(string eventJson)
+        {
+            JsonSerializer serializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+            serializer.Converters.Add(
+                new ResourceEventV1Converter(typeof(KubeResourceV1).Assembly)
+            );
+
+            using (var reader = new JsonTextReader(new StringReader(eventJson)))
+            {
+                return serializer.Deserialize<ResourceEventV1<KubeResourceV1>>(reader);
+            }
+        }
+    }
+}
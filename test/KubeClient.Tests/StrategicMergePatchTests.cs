@@ -0,0 +1,298 @@
+using Newtonsoft.Json.Linq;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for computing strategic-merge patches using <see cref="StrategicMergePatch"/>.
+    /// </summary>
+    public class StrategicMergePatchTests
+        : TestBase
+    {
+        /// <summary>
+        ///     Create a new <see cref="StrategicMergePatch"/> test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public StrategicMergePatchTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that the patch between identical models is empty.
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch creates empty patch for identical models")]
+        public void CreatePatch_Identical()
+        {
+            JObject patch = StrategicMergePatch.CreatePatch(CreateDeployment(), CreateDeployment());
+
+            Assert.Empty(patch);
+        }
+
+        /// <summary>
+        ///     Verify that changes to an item in a list that is merged by key only include the item's key and changed properties.
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch patches changed list item by merge key")]
+        public void CreatePatch_ChangedListItem()
+        {
+            DeploymentV1 original = CreateDeployment();
+            DeploymentV1 modified = CreateDeployment();
+            modified.Spec.Template.Spec.Containers[1].Image = "sidecar:2.0";
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            AssertPatch(patch, @"{
+                ""spec"": {
+                    ""template"": {
+                        ""spec"": {
+                            ""containers"": [
+                                { ""name"": ""sidecar"", ""image"": ""sidecar:2.0"" }
+                            ],
+                            ""$setElementOrder/containers"": [
+                                { ""name"": ""app"" },
+                                { ""name"": ""sidecar"" }
+                            ]
+                        }
+                    }
+                }
+            }");
+        }
+
+        /// <summary>
+        ///     Verify that properties listed only because their values contain properties with patch metadata have no patch strategy flags, and are merged (rather than replaced).
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch merges properties without patch strategy")]
+        public void CreatePatch_NoPatchStrategy()
+        {
+            Assert.True(StrategicMergePatch.TryGetPatchProperty(typeof(DeploymentV1), "spec", out var patchProperty));
+            Assert.Equal(default(PatchStrategies), patchProperty.patchStrategies);
+            Assert.Equal(typeof(DeploymentSpecV1), patchProperty.propertyModelType);
+
+            DeploymentV1 original = CreateDeployment();
+            DeploymentV1 modified = CreateDeployment();
+            modified.Spec.Replicas = 5;
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            AssertPatch(patch, @"{
+                ""spec"": {
+                    ""replicas"": 5
+                }
+            }");
+        }
+
+        /// <summary>
+        ///     Verify that list items that are added or removed (from a list that is merged by key) are added to the patch or marked for deletion.
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch adds and deletes list items by merge key")]
+        public void CreatePatch_AddedAndRemovedListItems()
+        {
+            DeploymentV1 original = CreateDeployment();
+            DeploymentV1 modified = CreateDeployment();
+            modified.Spec.Template.Spec.Containers.RemoveAt(1);
+            modified.Spec.Template.Spec.Containers.Add(new ContainerV1
+            {
+                Name = "proxy",
+                Image = "proxy:1.0"
+            });
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            AssertPatch(patch, @"{
+                ""spec"": {
+                    ""template"": {
+                        ""spec"": {
+                            ""containers"": [
+                                { ""name"": ""proxy"", ""image"": ""proxy:1.0"" },
+                                { ""name"": ""sidecar"", ""$patch"": ""delete"" }
+                            ],
+                            ""$setElementOrder/containers"": [
+                                { ""name"": ""app"" },
+                                { ""name"": ""proxy"" }
+                            ]
+                        }
+                    }
+                }
+            }");
+        }
+
+        /// <summary>
+        ///     Verify that removed object properties (e.g. labels) are deleted by the patch, and other changes to objects only include changed properties.
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch deletes removed properties")]
+        public void CreatePatch_RemovedProperties()
+        {
+            DeploymentV1 original = CreateDeployment();
+            DeploymentV1 modified = CreateDeployment();
+            modified.Metadata.Labels.Remove("tier");
+            modified.Metadata.Labels["version"] = "2";
+            modified.Spec.Replicas = 5;
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            AssertPatch(patch, @"{
+                ""metadata"": {
+                    ""labels"": {
+                        ""tier"": null,
+                        ""version"": ""2""
+                    }
+                },
+                ""spec"": {
+                    ""replicas"": 5
+                }
+            }");
+        }
+
+        /// <summary>
+        ///     Verify that changes to a list of primitive values that is merged are expressed as additions and deletions.
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch merges primitive list")]
+        public void CreatePatch_PrimitiveList()
+        {
+            DeploymentV1 original = CreateDeployment();
+            original.Metadata.Finalizers.Add("finalizer1");
+            original.Metadata.Finalizers.Add("finalizer2");
+
+            DeploymentV1 modified = CreateDeployment();
+            modified.Metadata.Finalizers.Add("finalizer2");
+            modified.Metadata.Finalizers.Add("finalizer3");
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            AssertPatch(patch, @"{
+                ""metadata"": {
+                    ""finalizers"": [ ""finalizer3"" ],
+                    ""$deleteFromPrimitiveList/finalizers"": [ ""finalizer1"" ],
+                    ""$setElementOrder/finalizers"": [ ""finalizer2"", ""finalizer3"" ]
+                }
+            }");
+        }
+
+        /// <summary>
+        ///     Verify that changes to a property with the "retainKeys" strategy include the "$retainKeys" directive.
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch adds retainKeys directive")]
+        public void CreatePatch_RetainKeys()
+        {
+            DeploymentV1 original = CreateDeployment();
+            original.Spec.Strategy = new DeploymentStrategyV1
+            {
+                Type = "RollingUpdate",
+                RollingUpdate = new RollingUpdateDeploymentV1
+                {
+                    MaxSurge = 1
+                }
+            };
+
+            DeploymentV1 modified = CreateDeployment();
+            modified.Spec.Strategy = new DeploymentStrategyV1
+            {
+                Type = "Recreate"
+            };
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            AssertPatch(patch, @"{
+                ""spec"": {
+                    ""strategy"": {
+                        ""rollingUpdate"": null,
+                        ""type"": ""Recreate"",
+                        ""$retainKeys"": [ ""type"" ]
+                    }
+                }
+            }");
+        }
+
+        /// <summary>
+        ///     Verify that a list whose items cannot be matched by merge key is replaced.
+        /// </summary>
+        [Fact(DisplayName = "StrategicMergePatch replaces list with duplicate merge keys")]
+        public void CreatePatch_DuplicateMergeKeys()
+        {
+            DeploymentV1 original = CreateDeployment();
+            DeploymentV1 modified = CreateDeployment();
+            modified.Spec.Template.Spec.Containers[1].Name = "app";
+
+            JObject patch = StrategicMergePatch.CreatePatch(original, modified);
+
+            JArray containers = Assert.IsType<JArray>(patch.SelectToken("spec.template.spec.containers"));
+            Assert.Equal(3, containers.Count);
+            Assert.Equal("replace", containers[2].Value<string>("$patch"));
+        }
+
+        /// <summary>
+        ///     Verify that the patch matches the expected JSON.
+        /// </summary>
+        /// <param name="patch">
+        ///     The patch.
+        /// </param>
+        /// <param name="expectedJson">
+        ///     The expected patch JSON.
+        /// </param>
+        static void AssertPatch(JObject patch, string expectedJson)
+        {
+            JObject expected = JObject.Parse(expectedJson);
+
+            Assert.True(JToken.DeepEquals(expected, patch), $"Expected patch:\n{expected}\nActual patch:\n{patch}");
+        }
+
+        /// <summary>
+        ///     Create a test deployment.
+        /// </summary>
+        /// <returns>
+        ///     The deployment.
+        /// </returns>
+        static DeploymentV1 CreateDeployment()
+        {
+            return new DeploymentV1
+            {
+                Metadata = new ObjectMetaV1
+                {
+                    Name = "deployment1",
+                    Namespace = "default",
+                    Labels =
+                    {
+                        ["app"] = "app1",
+                        ["tier"] = "web"
+                    }
+                },
+                Spec = new DeploymentSpecV1
+                {
+                    Replicas = 3,
+                    Selector = new LabelSelectorV1
+                    {
+                        MatchLabels =
+                        {
+                            ["app"] = "app1"
+                        }
+                    },
+                    Template = new PodTemplateSpecV1
+                    {
+                        Spec = new PodSpecV1
+                        {
+                            Containers =
+                            {
+                                new ContainerV1
+                                {
+                                    Name = "app",
+                                    Image = "app:1.0"
+                                },
+                                new ContainerV1
+                                {
+                                    Name = "sidecar",
+                                    Image = "sidecar:1.0"
+                                }
+                            }
+                        }
+                    }
+                }
+            };
+        }
+    }
+}
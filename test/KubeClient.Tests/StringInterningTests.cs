@@ -0,0 +1,239 @@
+using Newtonsoft.Json;
+using System.Collections.Generic;
+using System.IO;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for interning of (low-cardinality) model property values during deserialisation.
+    /// </summary>
+    public class StringInterningTests
+        : TestBase
+    {
+        /// <summary>
+        ///     A pod list (deserialised using generated converters) whose pods share the same namespace, labels, image, and annotation values.
+        /// </summary>
+        const string PodListJson = @"{
+            ""kind"": ""PodList"",
+            ""apiVersion"": ""v1"",
+            ""items"": [
+                {
+                    ""kind"": ""Pod"",
+                    ""apiVersion"": ""v1"",
+                    ""metadata"": { ""name"": ""pod1"", ""namespace"": ""default"", ""labels"": { ""app"": ""test"" }, ""annotations"": { ""note"": ""value"" } },
+                    ""spec"": { ""nodeName"": ""node1"", ""containers"": [ { ""name"": ""container1"", ""image"": ""image1"", ""args"": [ ""--verbose"" ] } ] },
+                    ""status"": { ""phase"": ""Running"" }
+                },
+                {
+                    ""kind"": ""Pod"",
+                    ""apiVersion"": ""v1"",
+                    ""metadata"": { ""name"": ""pod2"", ""namespace"": ""default"", ""labels"": { ""app"": ""test"" }, ""annotations"": { ""note"": ""value"" } },
+                    ""spec"": { ""nodeName"": ""node1"", ""containers"": [ { ""name"": ""container1"", ""image"": ""image1"", ""args"": [ ""--verbose"" ] } ] },
+                    ""status"": { ""phase"": ""Running"" }
+                }
+            ]
+        }";
+
+        /// <summary>
+        ///     A service list (whose specs, which have no generated converter, are deserialised using the contract-based path) whose services share the same type, selector, and port protocol.
+        /// </summary>
+        const string ServiceListJson = @"{
+            ""kind"": ""ServiceList"",
+            ""apiVersion"": ""v1"",
+            ""items"": [
+                {
+                    ""kind"": ""Service"",
+                    ""apiVersion"": ""v1"",
+                    ""metadata"": { ""name"": ""service1"", ""namespace"": ""default"" },
+                    ""spec"": { ""type"": ""ClusterIP"", ""selector"": { ""app"": ""test"" }, ""ports"": [ { ""name"": ""http"", ""port"": 80, ""protocol"": ""TCP"" } ] }
+                },
+                {
+                    ""kind"": ""Service"",
+                    ""apiVersion"": ""v1"",
+                    ""metadata"": { ""name"": ""service2"", ""namespace"": ""default"" },
+                    ""spec"": { ""type"": ""ClusterIP"", ""selector"": { ""app"": ""test"" }, ""ports"": [ { ""name"": ""http"", ""port"": 80, ""protocol"": ""TCP"" } ] }
+                }
+            ]
+        }";
+
+        /// <summary>
+        ///     Create a new string-interning test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public StringInterningTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+            KubeStringPool.Shared = new KubeStringPool();
+        }
+
+        /// <summary>
+        ///     Dispose of resources being used by the test suite.
+        /// </summary>
+        /// <param name="disposing">
+        ///     Explicit disposal?
+        /// </param>
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing)
+                KubeStringPool.Shared = null; // String interning is opt-in.
+
+            base.Dispose(disposing);
+        }
+
+        /// <summary>
+        ///     Verify that generated converters intern the values of properties listed in <see cref="InternedStringProperties"/> (and only those properties).
+        /// </summary>
+        [Fact(DisplayName = "Generated converters intern low-cardinality property values")]
+        public void GeneratedConverters_InternStrings()
+        {
+            PodListV1 podList = Deserialize<PodListV1>(PodListJson);
+            Assert.Equal(2, podList.Items.Count);
+
+            PodV1 pod1 = podList.Items[0];
+            PodV1 pod2 = podList.Items[1];
+
+            Assert.Same(pod1.Kind, pod2.Kind);
+            Assert.Same(pod1.ApiVersion, pod2.ApiVersion);
+            Assert.Same(pod1.Metadata.Namespace, pod2.Metadata.Namespace);
+            Assert.Same(pod1.Spec.NodeName, pod2.Spec.NodeName);
+            Assert.Same(pod1.Spec.Containers[0].Image, pod2.Spec.Containers[0].Image);
+            Assert.Same(pod1.Spec.Containers[0].Args[0], pod2.Spec.Containers[0].Args[0]);
+            Assert.Same(pod1.Status.Phase, pod2.Status.Phase);
+            AssertSameDictionaryEntry(pod1.Metadata.Labels, pod2.Metadata.Labels, "app", expectSameValue: true);
+
+            // Only annotation keys are interned.
+            AssertSameDictionaryEntry(pod1.Metadata.Annotations, pod2.Metadata.Annotations, "note", expectSameValue: false);
+
+            // Names are not interned.
+            Assert.Equal(pod1.Spec.Containers[0].Name, pod2.Spec.Containers[0].Name);
+            Assert.NotSame(pod1.Spec.Containers[0].Name, pod2.Spec.Containers[0].Name);
+        }
+
+        /// <summary>
+        ///     Verify that the contract-based path (used for models without a generated converter) interns the values of properties listed in <see cref="InternedStringProperties"/>.
+        /// </summary>
+        [Fact(DisplayName = "KubeContractResolver interns low-cardinality property values")]
+        public void ContractResolver_InternsStrings()
+        {
+            ServiceListV1 serviceList = Deserialize<ServiceListV1>(ServiceListJson);
+            Assert.Equal(2, serviceList.Items.Count);
+
+            ServiceV1 service1 = serviceList.Items[0];
+            ServiceV1 service2 = serviceList.Items[1];
+
+            Assert.Same(service1.Kind, service2.Kind);
+            Assert.Same(service1.ApiVersion, service2.ApiVersion);
+            Assert.Same(service1.Spec.Type, service2.Spec.Type);
+            Assert.Same(service1.Spec.Ports[0].Protocol, service2.Spec.Ports[0].Protocol);
+            AssertSameDictionaryEntry(service1.Spec.Selector, service2.Spec.Selector, "app", expectSameValue: true);
+
+            // Names are not interned.
+            Assert.Equal(service1.Spec.Ports[0].Name, service2.Spec.Ports[0].Name);
+            Assert.NotSame(service1.Spec.Ports[0].Name, service2.Spec.Ports[0].Name);
+        }
+
+        /// <summary>
+        ///     Verify that strings are not interned unless a shared pool has been configured.
+        /// </summary>
+        [Fact(DisplayName = "Strings are not interned without a shared pool")]
+        public void NoSharedPool_DoesNotInternStrings()
+        {
+            KubeStringPool.Shared = null;
+
+            ServiceListV1 serviceList = Deserialize<ServiceListV1>(ServiceListJson);
+            ServiceV1 service1 = serviceList.Items[0];
+            ServiceV1 service2 = serviceList.Items[1];
+
+            Assert.Equal(service1.Spec.Type, service2.Spec.Type);
+            Assert.NotSame(service1.Spec.Type, service2.Spec.Type);
+            Assert.Equal("test", service2.Spec.Selector["app"]);
+            Assert.NotSame(service1.Spec.Selector["app"], service2.Spec.Selector["app"]);
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KubeStringPool"/> does not pool strings once it is full (or strings that are too long).
+        /// </summary>
+        [Fact(DisplayName = "KubeStringPool respects capacity and maximum length")]
+        public void StringPool_RespectsLimits()
+        {
+            var pool = new KubeStringPool(capacity: 1, maxLength: 5);
+
+            string value1 = pool.Intern(new string('a', 5));
+            Assert.Same(value1, pool.Intern(new string('a', 5)));
+            Assert.Equal(1, pool.Count);
+
+            // Pool is full.
+            string value2 = new string('b', 5);
+            Assert.Same(value2, pool.Intern(value2));
+            Assert.NotSame(value2, pool.Intern(new string('b', 5)));
+
+            // Too long.
+            pool.Clear();
+            string value3 = new string('c', 6);
+            Assert.Same(value3, pool.Intern(value3));
+            Assert.NotSame(value3, pool.Intern(new string('c', 6)));
+            Assert.Equal(0, pool.Count);
+
+            Assert.Null(pool.Intern(null));
+        }
+
+        /// <summary>
+        ///     Assert that 2 dictionaries share the same (interned) key (and, optionally, value) for an entry.
+        /// </summary>
+        /// <param name="dictionary1">
+        ///     The first dictionary.
+        /// </param>
+        /// <param name="dictionary2">
+        ///     The second dictionary.
+        /// </param>
+        /// <param name="key">
+        ///     The entry key.
+        /// </param>
+        /// <param name="expectSameValue">
+        ///     Expect the entry values to be the same (interned) string? If <c>false</c>, expect them to be equal, but different, strings.
+        /// </param>
+        static void AssertSameDictionaryEntry(Dictionary<string, string> dictionary1, Dictionary<string, string> dictionary2, string key, bool expectSameValue)
+        {
+            string key1 = Assert.Single(dictionary1.Keys);
+            string key2 = Assert.Single(dictionary2.Keys);
+            Assert.Equal(key, key1);
+            Assert.Same(key1, key2);
+
+            Assert.Equal(dictionary1[key], dictionary2[key]);
+            if (expectSameValue)
+                Assert.Same(dictionary1[key], dictionary2[key]);
+            else
+                Assert.NotSame(dictionary1[key], dictionary2[key]);
+        }
+
+        /// <summary>
+        ///     Deserialise a model from JSON (using the default KubeClient serialiser settings).
+        /// </summary>
+        /// <typeparam name="TModel">
+        ///     The model type.
+        /// </typeparam>
+        /// <param name="json">
+        ///     The JSON.
+        /// </param>
+        /// <returns>
+        ///     The deserialised model.
+        /// </returns>
+        static TModel Deserialize<TModel>(string json)
+        {
+            JsonSerializer serializer = JsonSerializer.Create(KubeResourceClient.SerializerSettings);
+
+            using (var reader = new JsonTextReader(new StringReader(json)))
+            {
+                return serializer.Deserialize<TModel>(reader);
+            }
+        }
+    }
+}
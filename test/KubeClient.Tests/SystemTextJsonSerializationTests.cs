@@ -0,0 +1,157 @@
+#if NET8_0_OR_GREATER
+
+using JsonConvert = Newtonsoft.Json.JsonConvert;
+using System.IO;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using Models;
+    using Models.Converters;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for System.Text.Json serialisation of Kubernetes models.
+    /// </summary>
+    public partial class SystemTextJsonSerializationTests
+        : TestBase
+    {
+        /// <summary>
+        ///     The name of the file containing the pod list used by round-trip tests.
+        /// </summary>
+        static readonly string PodListFileName = Path.Combine("Fixtures", "PodList.json");
+
+        /// <summary>
+        ///     Create a new System.Text.Json model serialisation test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public SystemTextJsonSerializationTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="Int32OrStringV1JsonConverter"/> round-trips both integer and string values.
+        /// </summary>
+        [Fact(DisplayName = "Int32OrStringV1JsonConverter round-trips integer and string values")]
+        public void Int32OrStringV1_RoundTrip()
+        {
+            JsonSerializerOptions options = CreateSerializerOptions();
+
+            Int32OrStringV1 intValue = JsonSerializer.Deserialize<Int32OrStringV1>("8080", options);
+            Assert.True(intValue.IsInt32);
+            Assert.Equal(8080, intValue.Int32Value);
+            Assert.Equal("8080", JsonSerializer.Serialize(intValue, options));
+
+            Int32OrStringV1 stringValue = JsonSerializer.Deserialize<Int32OrStringV1>("\"http\"", options);
+            Assert.False(stringValue.IsInt32);
+            Assert.Equal("http", stringValue.StringValue);
+            Assert.Equal("\"http\"", JsonSerializer.Serialize(stringValue, options));
+        }
+
+        /// <summary>
+        ///     Verify that <see cref="KubeResourceListV1JsonConverter{TResourceList, TResource}"/> deserialises a resource list as an object (rather than an array).
+        /// </summary>
+        [Fact(DisplayName = "KubeResourceListV1JsonConverter deserialises resource list")]
+        public void ResourceList_Deserialize()
+        {
+            const string json = @"{
+                ""kind"": ""PodList"",
+                ""apiVersion"": ""v1"",
+                ""metadata"": { ""resourceVersion"": ""42"" },
+                ""unknownField"": [ 1, { ""a"": 2 } ],
+                ""items"": [
+                    { ""metadata"": { ""name"": ""pod1"" } },
+                    { ""metadata"": { ""name"": ""pod2"" } }
+                ]
+            }";
+
+            PodListV1 podList = JsonSerializer.Deserialize<PodListV1>(json, CreateSerializerOptions());
+
+            Assert.NotNull(podList);
+            Assert.Equal("PodList", podList.Kind);
+            Assert.Equal("v1", podList.ApiVersion);
+            Assert.Equal("42", podList.Metadata.ResourceVersion);
+            Assert.Collection(podList.Items,
+                pod => Assert.Equal("pod1", pod.Metadata.Name),
+                pod => Assert.Equal("pod2", pod.Metadata.Name)
+            );
+        }
+
+        /// <summary>
+        ///     Verify that a pod list round-trips through a source-generated serialiser context, with the same result as Newtonsoft.Json.
+        /// </summary>
+        [Fact(DisplayName = "Source-generated context round-trips pod list")]
+        public void PodList_RoundTrip()
+        {
+            string json = File.ReadAllText(PodListFileName);
+
+            PodListV1 expected = JsonConvert.DeserializeObject<PodListV1>(json, KubeResourceClient.SerializerSettings);
+            string expectedJson = JsonConvert.SerializeObject(expected, KubeResourceClient.SerializerSettings);
+
+            PodListV1 podList = JsonSerializer.Deserialize(json, PodListJsonContext.Default.PodListV1);
+            Assert.Equal(2, podList.Items.Count);
+            Assert.Equal("http", podList.Items[0].Spec.Containers[0].LivenessProbe.HttpGet.Port.StringValue);
+            Assert.Equal(8080, podList.Items[0].Spec.Containers[0].ReadinessProbe.TcpSocket.Port.Int32Value);
+            Assert.Equal(expectedJson, JsonConvert.SerializeObject(podList, KubeResourceClient.SerializerSettings));
+
+            PodListV1 roundTripped = JsonSerializer.Deserialize(
+                JsonSerializer.Serialize(podList, PodListJsonContext.Default.PodListV1),
+                PodListJsonContext.Default.PodListV1
+            );
+            Assert.Equal(expectedJson, JsonConvert.SerializeObject(roundTripped, KubeResourceClient.SerializerSettings));
+        }
+
+        /// <summary>
+        ///     Create <see cref="JsonSerializerOptions"/> equivalent to those used by the generated serialiser context (but reflection-based).
+        /// </summary>
+        /// <returns>
+        ///     The configured <see cref="JsonSerializerOptions"/>.
+        /// </returns>
+        static JsonSerializerOptions CreateSerializerOptions()
+        {
+            return new JsonSerializerOptions
+            {
+                PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+                DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+                PreferredObjectCreationHandling = JsonObjectCreationHandling.Populate,
+                Converters =
+                {
+                    new Int32OrStringV1JsonConverter(),
+                    new MicroTimeV1JsonConverter(),
+                    new KubeResourceListV1JsonConverter<PodListV1, PodV1>()
+                }
+            };
+        }
+
+        /// <summary>
+        ///     Source-generated serialisation metadata for <see cref="PodListV1"/> (with the same options as the KubeModelJsonContext emitted by "generate_models.py --system-text-json").
+        /// </summary>
+        /// <remarks>
+        ///     The checked-in models are not generated with --system-text-json, so the resource-list converter (which the generator attaches to resource-list models) is registered here instead.
+        ///
+        ///     The converter reads list metadata and items using this context, so (like the generated context, which covers every model) it must also include <see cref="ListMetaV1"/> and <see cref="PodV1"/>.
+        /// </remarks>
+        [JsonSourceGenerationOptions(
+            PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase,
+            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+            PreferredObjectCreationHandling = JsonObjectCreationHandling.Populate,
+            Converters = new[] { typeof(Int32OrStringV1JsonConverter), typeof(MicroTimeV1JsonConverter), typeof(QuantityResourceJsonConverter), typeof(KubeResourceListV1JsonConverter<PodListV1, PodV1>) }
+        )]
+        [JsonSerializable(typeof(ListMetaV1))]
+        [JsonSerializable(typeof(PodListV1))]
+        [JsonSerializable(typeof(PodV1))]
+        partial class PodListJsonContext
+            : JsonSerializerContext
+        {
+        }
+    }
+}
+
+#endif // NET8_0_OR_GREATER
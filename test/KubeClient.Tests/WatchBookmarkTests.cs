@@ -0,0 +1,466 @@
+using Newtonsoft.Json;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Reactive.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using Xunit;
+using Xunit.Abstractions;
+
+namespace KubeClient.Tests
+{
+    using ErrorHandling;
+    using Http;
+    using KubeClient.Http.Testability;
+    using Informers;
+    using Models;
+    using ResourceClients;
+    using TestCommon;
+
+    /// <summary>
+    ///     Tests for watch bookmarks, expired resource versions, and watch statistics.
+    /// </summary>
+    public class WatchBookmarkTests
+        : TestBase
+    {
+        /// <summary>
+        ///     A bookmark event (as written by the API server).
+        /// </summary>
+        const string BookmarkEventJson = @"{""type"":""BOOKMARK"",""object"":{""kind"":""Pod"",""apiVersion"":""v1"",""metadata"":{""resourceVersion"":""12"",""creationTimestamp"":null,""annotations"":{""k8s.io/initial-events-end"":""true""}},""spec"":{""containers"":null},""status"":{}}}";
+
+        /// <summary>
+        ///     An error event indicating that the watch's resource version has expired (as written by the API server).
+        /// </summary>
+        const string ExpiredEventJson = @"{""type"":""ERROR"",""object"":{""kind"":""Status"",""apiVersion"":""v1"",""metadata"":{},""status"":""Failure"",""message"":""too old resource version: 5 (12)"",""reason"":""Expired"",""code"":410}}";
+
+        /// <summary>
+        ///     Create a new watch bookmark test suite.
+        /// </summary>
+        /// <param name="testOutput">
+        ///     Output for the current test.
+        /// </param>
+        public WatchBookmarkTests(ITestOutputHelper testOutput)
+            : base(testOutput)
+        {
+        }
+
+        /// <summary>
+        ///     Verify that the type, bookmark, and error status of a watch event can be read directly from its line buffer.
+        /// </summary>
+        [Fact(DisplayName = "Read watch event type, bookmark, and error status")]
+        public void ReadWatchEvent()
+        {
+            char[] bookmarkLine = BookmarkEventJson.ToCharArray();
+            string eventType = WatchEventReader.ReadEventType(bookmarkLine, bookmarkLine.Length);
+            Assert.True(WatchEventReader.IsBookmark(eventType));
+            Assert.False(WatchEventReader.IsError(eventType));
+
+            (string kind, string apiVersion, string resourceVersion) = WatchEventReader.ReadBookmark(bookmarkLine, bookmarkLine.Length);
+            Assert.Equal("Pod", kind);
+            Assert.Equal("v1", apiVersion);
+            Assert.Equal("12", resourceVersion);
+
+            // Only the first lineLength characters of a (pooled) line buffer are part of the line.
+            char[] errorLine = new char[ExpiredEventJson.Length + 16];
+            ExpiredEventJson.CopyTo(0, errorLine, 0, ExpiredEventJson.Length);
+            errorLine[ExpiredEventJson.Length] = '{';
+
+            eventType = WatchEventReader.ReadEventType(errorLine, ExpiredEventJson.Length);
+            Assert.True(WatchEventReader.IsError(eventType));
+
+            StatusV1 status = WatchEventReader.ReadErrorStatus(errorLine, ExpiredEventJson.Length, JsonSerializer.Create(KubeResourceClient.SerializerSettings));
+            Assert.Equal(410, status.Code);
+            Assert.Equal("Expired", status.Reason);
+
+            Assert.True(WatchEventReader.IsResourceVersionExpired(new KubeApiException(status)));
+            Assert.True(WatchEventReader.IsResourceVersionExpired(
+                new KubeClientException("Watch failed.", HttpRequestException<StatusV1>.Create(HttpStatusCode.Gone, new StatusV1()))
+            ));
+            Assert.False(WatchEventReader.IsResourceVersionExpired(
+                new KubeClientException("Watch failed.", HttpRequestException<StatusV1>.Create(HttpStatusCode.InternalServerError, new StatusV1()))
+            ));
+        }
+
+        /// <summary>
+        ///     Verify that a watch requests bookmarks, and records them (without publishing them to subscribers).
+        /// </summary>
+        [Fact(DisplayName = "Watch requests and records bookmarks")]
+        public async Task WatchBookmarks()
+        {
+            PodV1 pod = new PodV1
+            {
+                Kind = "Pod",
+                ApiVersion = "v1",
+                Metadata = new ObjectMetaV1
+                {
+                    Name = "pod1",
+                    Namespace = "default",
+                    ResourceVersion = "11"
+                }
+            };
+
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                Assert.Contains("allowWatchBookmarks=true", request.RequestUri.Query, StringComparison.OrdinalIgnoreCase);
+
+                string addedEventJson = JsonConvert.SerializeObject(new ResourceEventV1<PodV1>
+                {
+                    EventType = ResourceEventType.Added,
+                    Resource = pod
+                }, KubeResourceClient.SerializerSettings);
+
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: addedEventJson + "\n" + BookmarkEventJson + "\n",
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                IList<IResourceEventV1<PodV1>> resourceEvents = await client.PodsV1().WatchAll(kubeNamespace: "default").ToList();
+
+                // Subscribers only see events for actual resources.
+                IResourceEventV1<PodV1> resourceEvent = Assert.Single(resourceEvents);
+                Assert.Equal(ResourceEventType.Added, resourceEvent.EventType);
+                Assert.Equal("pod1", resourceEvent.Resource.Metadata.Name);
+
+                KubeWatchStatistics statistics = client.PodsV1().GetWatchStatistics();
+                Assert.Equal(1, statistics.Bookmarks);
+                Assert.Equal("12", statistics.LastResourceVersion);
+                Assert.NotNull(statistics.BookmarkAge);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that adding query parameters to a watch (e.g. to request bookmarks) does not escape its selector a second time.
+        /// </summary>
+        [Fact(DisplayName = "Watch with selector escapes selector once")]
+        public async Task WatchSelectorEscaping()
+        {
+            List<string> requestQueries = new List<string>();
+
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                requestQueries.Add(request.RequestUri.Query);
+
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: String.Empty,
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                await client.PodsV1().WatchAll(labelSelector: "app=foo,tier in (web, api)", kubeNamespace: "default").ToList();
+            }
+
+            string requestQuery = Assert.Single(requestQueries);
+            Assert.Contains("labelSelector=app%3Dfoo%2Ctier%20in%20%28web%2C%20api%29", requestQuery);
+            Assert.Contains("watch=true", requestQuery);
+            Assert.Contains("allowWatchBookmarks=True", requestQuery);
+            Assert.DoesNotContain("%25", requestQuery);
+        }
+
+        /// <summary>
+        ///     Verify that a watch reports an expired resource version as a <see cref="KubeApiException"/>, and counts it.
+        /// </summary>
+        [Fact(DisplayName = "Watch reports expired resource version")]
+        public async Task WatchExpired()
+        {
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: ExpiredEventJson + "\n",
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                KubeApiException watchFailed = await Assert.ThrowsAsync<KubeApiException>(
+                    async () => await client.PodsV1().WatchAll(kubeNamespace: "default").ToList()
+                );
+                Assert.Equal(410, watchFailed.Status.Code);
+
+                Assert.Equal(1, client.PodsV1().GetWatchStatistics().Expirations);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that a watch only publishes bookmarks if asked to.
+        /// </summary>
+        [Fact(DisplayName = "Watch publishes bookmarks on request")]
+        public async Task WatchIncludeBookmarks()
+        {
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: BookmarkEventJson + "\n",
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                Assert.Empty(
+                    await client.PodsV1().WatchAll(kubeNamespace: "default").ToList()
+                );
+
+                IResourceEventV1<PodV1> bookmarkEvent = Assert.Single(
+                    await client.PodsV1().WatchAll(kubeNamespace: "default", includeBookmarks: true).ToList()
+                );
+                Assert.Equal(ResourceEventType.Bookmark, bookmarkEvent.EventType);
+                Assert.Equal("12", bookmarkEvent.Resource.Metadata.ResourceVersion);
+
+                Assert.Equal(2, client.PodsV1().GetWatchStatistics().Bookmarks);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that a watch for an abstract resource type records bookmarks (and only publishes them if a model type can be found for them).
+        /// </summary>
+        [Fact(DisplayName = "Watch for abstract resource type records bookmarks")]
+        public async Task WatchAbstractResourceBookmarks()
+        {
+            MockMessageHandler handler = new MockMessageHandler(request =>
+            {
+                return request.CreateResponse(HttpStatusCode.OK,
+                    responseBody: BookmarkEventJson + "\n",
+                    mediaType: "application/json"
+                );
+            });
+
+            using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+            {
+                AbstractResourceClient resourceClient = new AbstractResourceClient(client);
+
+                Assert.Empty(
+                    await resourceClient.WatchAll(includeBookmarks: false).ToList()
+                );
+
+                KubeWatchStatistics statistics = resourceClient.GetWatchStatistics();
+                Assert.Equal(1, statistics.Bookmarks);
+                Assert.Equal("12", statistics.LastResourceVersion);
+
+                // The bookmark's kind / apiVersion identify the model type to use.
+                IResourceEventV1<KubeResourceV1> bookmarkEvent = Assert.Single(
+                    await resourceClient.WatchAll(includeBookmarks: true).ToList()
+                );
+                Assert.Equal(ResourceEventType.Bookmark, bookmarkEvent.EventType);
+                Assert.IsType<PodV1>(bookmarkEvent.Resource);
+                Assert.Equal("12", bookmarkEvent.Resource.Metadata.ResourceVersion);
+            }
+        }
+
+        /// <summary>
+        ///     Verify that an informer keeps its store's (and snapshot's) resource version up-to-date from bookmarks, relists when the resource version expires, and counts reconnects, relists, bookmarks, and expirations.
+        /// </summary>
+        [Fact(DisplayName = "Informer resumes from bookmark and relists after expiry")]
+        public async Task InformerBookmarksAndRelists()
+        {
+            List<string> watchQueries = new List<string>();
+            string snapshotFileName = Path.Combine(Path.GetTempPath(), $"KubeClient.Tests.{Guid.NewGuid():N}.snapshot");
+            string snapshotResourceVersion = null;
+            int listCount = 0;
+
+            KubeResourceInformer<PodV1> informer = null;
+
+            using (CancellationTokenSource cancellation = new CancellationTokenSource())
+            {
+                MockMessageHandler handler = new MockMessageHandler(async (request, cancellationToken) =>
+                {
+                    lock (watchQueries)
+                    {
+                        watchQueries.Add(request.RequestUri.Query);
+                    }
+
+                    switch (watchQueries.Count)
+                    {
+                        case 1:
+                        {
+                            // Ends normally (the informer resumes from the bookmark).
+                            return request.CreateResponse(HttpStatusCode.OK,
+                                responseBody: BookmarkEventJson + "\n",
+                                mediaType: "application/json"
+                            );
+                        }
+                        case 2:
+                        {
+                            // The snapshot is saved while the informer is watching.
+                            informer.SaveSnapshot();
+
+                            KubeResourceStore<PodV1> snapshotStore = new KubeResourceStore<PodV1>();
+                            Assert.True(KubeResourceSnapshot.TryLoad(snapshotStore, snapshotFileName));
+                            snapshotResourceVersion = snapshotStore.ResourceVersion;
+
+                            return request.CreateResponse(HttpStatusCode.OK,
+                                responseBody: ExpiredEventJson + "\n",
+                                mediaType: "application/json"
+                            );
+                        }
+                        default:
+                        {
+                            // Hold the last watch open until the informer is stopped.
+                            cancellation.Cancel();
+                            await Task.Delay(Timeout.Infinite, cancellationToken);
+
+                            return request.CreateResponse(HttpStatusCode.OK);
+                        }
+                    }
+                });
+
+                using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+                {
+                    IPodClientV1 podClient = client.PodsV1();
+
+                    informer = new KubeResourceInformer<PodV1>(new KubeResourceStore<PodV1>(),
+                        listResources: cancellationToken => Task.FromResult<KubeResourceListV1<PodV1>>(new PodListV1
+                        {
+                            Metadata = new ListMetaV1 { ResourceVersion = $"list{++listCount}" }
+                        }),
+                        watchResources: resourceVersion => podClient.WatchAll(kubeNamespace: "default", resourceVersion: resourceVersion, includeBookmarks: true),
+                        snapshotFileName: snapshotFileName
+                    )
+                    {
+                        RelistBackoff = TimeSpan.FromMilliseconds(1)
+                    };
+
+                    try
+                    {
+                        await Assert.ThrowsAnyAsync<OperationCanceledException>(
+                            () => informer.RunAsync(cancellation.Token)
+                        );
+                    }
+                    finally
+                    {
+                        File.Delete(snapshotFileName);
+                    }
+
+                    Assert.Collection(watchQueries,
+                        watchQuery => Assert.Contains("resourceVersion=list1", watchQuery),
+                        watchQuery => Assert.Contains("resourceVersion=12", watchQuery),
+                        watchQuery => Assert.Contains("resourceVersion=list2", watchQuery)
+                    );
+                    Assert.Equal("12", snapshotResourceVersion);
+                    Assert.Equal(2, listCount);
+
+                    KubeWatchStatistics statistics = informer.Statistics;
+                    Assert.Equal(1, statistics.Bookmarks);
+                    Assert.Equal(1, statistics.Reconnects);
+                    Assert.Equal(1, statistics.Expirations);
+                    Assert.Equal(1, statistics.Relists);
+                    Assert.Equal("12", statistics.LastResourceVersion);
+                    Assert.NotNull(statistics.LastBookmarkTime);
+                }
+            }
+        }
+
+        /// <summary>
+        ///     Verify that an informer which shares its resource client's watch statistics does not count the client's expirations twice, and that its watches start from the listed resource version.
+        /// </summary>
+        [Fact(DisplayName = "Informer shares watch statistics with resource client")]
+        public async Task InformerSharesClientStatistics()
+        {
+            List<string> watchQueries = new List<string>();
+            int watchCount = 0;
+            int listCount = 0;
+
+            using (CancellationTokenSource cancellation = new CancellationTokenSource())
+            {
+                MockMessageHandler handler = new MockMessageHandler(async (request, cancellationToken) =>
+                {
+                    lock (watchQueries)
+                    {
+                        watchQueries.Add(request.RequestUri.Query);
+                    }
+
+                    if (Interlocked.Increment(ref watchCount) == 1)
+                    {
+                        return request.CreateResponse(HttpStatusCode.OK,
+                            responseBody: ExpiredEventJson + "\n",
+                            mediaType: "application/json"
+                        );
+                    }
+
+                    // Hold the second watch open until the informer is stopped.
+                    cancellation.Cancel();
+                    await Task.Delay(Timeout.Infinite, cancellationToken);
+
+                    return request.CreateResponse(HttpStatusCode.OK);
+                });
+
+                using (KubeApiClient client = handler.CreateClient(loggerFactory: LoggerFactory))
+                {
+                    IPodClientV1 podClient = client.PodsV1();
+
+                    var informer = new KubeResourceInformer<PodV1>(new KubeResourceStore<PodV1>(),
+                        listResources: cancellationToken => Task.FromResult<KubeResourceListV1<PodV1>>(new PodListV1
+                        {
+                            Metadata = new ListMetaV1 { ResourceVersion = $"{5 + listCount++}" }
+                        }),
+                        watchResources: resourceVersion => podClient.WatchAll(kubeNamespace: "default", resourceVersion: resourceVersion),
+                        watchStatistics: podClient.GetWatchStatistics()
+                    )
+                    {
+                        RelistBackoff = TimeSpan.FromMilliseconds(1)
+                    };
+
+                    await Assert.ThrowsAnyAsync<OperationCanceledException>(
+                        () => informer.RunAsync(cancellation.Token)
+                    );
+
+                    KubeWatchStatistics statistics = informer.Statistics;
+                    Assert.Same(podClient.GetWatchStatistics(), statistics);
+                    Assert.Equal(1, statistics.Expirations);
+                    Assert.Equal(1, statistics.Relists);
+
+                    // Each watch starts from the resource version of the preceding list.
+                    Assert.Collection(watchQueries,
+                        watchQuery => Assert.Contains("resourceVersion=5", watchQuery),
+                        watchQuery => Assert.Contains("resourceVersion=6", watchQuery)
+                    );
+                }
+            }
+        }
+
+        /// <summary>
+        ///     A resource client that watches Pods as <see cref="KubeResourceV1"/> (an abstract type).
+        /// </summary>
+        class AbstractResourceClient
+            : KubeResourceClient
+        {
+            /// <summary>
+            ///     Create a new <see cref="AbstractResourceClient"/>.
+            /// </summary>
+            /// <param name="client">
+            ///     The <see cref="IKubeApiClient"/> used to communicate with the Kubernetes API.
+            /// </param>
+            public AbstractResourceClient(IKubeApiClient client)
+                : base(client)
+            {
+            }
+
+            /// <summary>
+            ///     Watch for events relating to Pods in the default namespace.
+            /// </summary>
+            /// <param name="includeBookmarks">
+            ///     Publish bookmark events to subscribers?
+            /// </param>
+            /// <returns>
+            ///     An <see cref="IObservable{T}"/> representing the event stream.
+            /// </returns>
+            public IObservable<IResourceEventV1<KubeResourceV1>> WatchAll(bool includeBookmarks)
+            {
+                return ObserveEvents<KubeResourceV1>(
+                    KubeRequest.Create("api/v1/namespaces/default/pods?watch=true"),
+                    operationDescription: "watch all v1/Pods in namespace default",
+                    includeBookmarks: includeBookmarks
+                );
+            }
+        }
+    }
+}
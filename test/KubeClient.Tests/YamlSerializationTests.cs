@@ -126,6 +126,127 @@ namespace KubeClient.Tests
             Assert.Equal(expectedMixed, model.Mixed);
         }
 
+        /// <summary>
+        ///     Verify that a model can be deserialised from YAML (via its JSON contract), including values that are represented as strings in YAML.
+        /// </summary>
+        [Fact(DisplayName = "Can deserialise model from YAML")]
+        public void Can_Deserialize_Model()
+        {
+            const string yaml = @"
+apiVersion: v1
+kind: Pod
+metadata:
+  name: my-pod
+  labels: &labels
+    app: my-app
+  annotations:
+    enabled: 'true'
+spec:
+  hostNetwork: true
+  terminationGracePeriodSeconds: 30
+  nodeSelector: *labels
+  containers:
+  - name: my-container
+    image: nginx
+    ports:
+    - containerPort: 8080
+      name: http
+";
+
+            PodV1 pod;
+            using (TextReader yamlReader = new StringReader(NormalizeLineEndings(yaml)))
+            {
+                pod = Yaml.Deserialize<PodV1>(yamlReader);
+            }
+
+            Assert.NotNull(pod);
+            Assert.Equal("Pod", pod.Kind);
+            Assert.Equal("my-pod", pod.Metadata.Name);
+            Assert.Equal("my-app", pod.Metadata.Labels["app"]);
+            Assert.Equal("true", pod.Metadata.Annotations["enabled"]);
+            Assert.True(pod.Spec.HostNetwork);
+            Assert.Equal(30L, pod.Spec.TerminationGracePeriodSeconds);
+            Assert.Equal("my-app", pod.Spec.NodeSelector["app"]);
+
+            ContainerV1 container = Assert.Single(pod.Spec.Containers);
+            Assert.Equal("nginx", container.Image);
+
+            ContainerPortV1 port = Assert.Single(container.Ports);
+            Assert.Equal(8080, port.ContainerPort);
+            Assert.Equal("http", port.Name);
+        }
+
+        /// <summary>
+        ///     Verify that a model can be serialised to YAML and deserialised again, and that strings that look like other types of value are quoted.
+        /// </summary>
+        [Fact(DisplayName = "Can round-trip model via YAML")]
+        public void Can_RoundTrip_Model()
+        {
+            var pod = new PodV1
+            {
+                Metadata = new ObjectMetaV1
+                {
+                    Name = "my-pod",
+                    Labels =
+                    {
+                        ["enabled"] = "true",
+                        ["port"] = "8080"
+                    }
+                },
+                Spec = new PodSpecV1
+                {
+                    HostNetwork = true,
+                    Containers =
+                    {
+                        new ContainerV1
+                        {
+                            Name = "my-container",
+                            Image = "nginx"
+                        }
+                    }
+                }
+            };
+
+            string yaml;
+            using (StringWriter yamlWriter = new StringWriter())
+            {
+                Yaml.Serialize(pod, yamlWriter);
+
+                yaml = yamlWriter.ToString();
+            }
+
+            Assert.Contains("enabled: \"true\"", yaml);
+            Assert.Contains("port: \"8080\"", yaml);
+            Assert.Contains("hostNetwork: true", yaml);
+
+            PodV1 roundTripped;
+            using (TextReader yamlReader = new StringReader(yaml))
+            {
+                roundTripped = Yaml.Deserialize<PodV1>(yamlReader);
+            }
+
+            Assert.Equal("Pod", roundTripped.Kind);
+            Assert.Equal("v1", roundTripped.ApiVersion);
+            Assert.Equal("my-pod", roundTripped.Metadata.Name);
+            Assert.Equal("true", roundTripped.Metadata.Labels["enabled"]);
+            Assert.Equal("8080", roundTripped.Metadata.Labels["port"]);
+            Assert.True(roundTripped.Spec.HostNetwork);
+            Assert.Equal("nginx", Assert.Single(roundTripped.Spec.Containers).Image);
+        }
+
+        /// <summary>
+        ///     Verify that YAML can be converted to JSON (with null scalars converted to null, and all other scalars converted to strings).
+        /// </summary>
+        [Fact(DisplayName = "Can convert YAML to JSON")]
+        public void Can_Convert_To_Json()
+        {
+            const string yaml = "number: 1\nnothing: ~\nquoted: \"null\"\nitems:\n- first\n- second\nempty: {}\n";
+
+            string json = Yaml.ToJson(NormalizeLineEndings(yaml));
+
+            Assert.Equal(@"{""number"":""1"",""nothing"":null,""quoted"":""null"",""items"":[""first"",""second""],""empty"":{}}", json);
+        }
+
         /// <summary>
         ///     Normalise line-endings to match the local environment.
         /// </summary>